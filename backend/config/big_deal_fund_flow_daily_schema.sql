@@ -0,0 +1,15 @@
+CREATE TABLE IF NOT EXISTS {schema}.{table} (
+    trade_date DATE NOT NULL,
+    stock_code TEXT NOT NULL,
+    stock_name TEXT,
+    buy_amount NUMERIC NOT NULL DEFAULT 0,
+    sell_amount NUMERIC NOT NULL DEFAULT 0,
+    net_amount NUMERIC NOT NULL DEFAULT 0,
+    trade_count INTEGER NOT NULL DEFAULT 0,
+    last_trade_time TIMESTAMP WITHOUT TIME ZONE,
+    updated_at TIMESTAMP WITHOUT TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (trade_date, stock_code)
+);
+
+CREATE INDEX IF NOT EXISTS {net_amount_idx}
+    ON {schema}.{table} (trade_date, net_amount DESC);
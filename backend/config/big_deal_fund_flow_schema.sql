@@ -11,4 +11,4 @@ CREATE TABLE IF NOT EXISTS {schema}.{table} (
     fetched_at TIMESTAMP WITHOUT TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITHOUT TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     PRIMARY KEY (trade_time, stock_code, trade_side, trade_volume, trade_amount)
-);
+) PARTITION BY RANGE (trade_time);
@@ -1,16 +1,27 @@
 CREATE TABLE IF NOT EXISTS {schema}.{table} (
     ts_code TEXT NOT NULL,
     trade_date DATE NOT NULL,
-    open NUMERIC,
-    high NUMERIC,
-    low NUMERIC,
-    close NUMERIC,
-    pre_close NUMERIC,
-    change NUMERIC,
-    pct_chg NUMERIC,
-    vol NUMERIC,
-    amount NUMERIC,
+    open DOUBLE PRECISION,
+    high DOUBLE PRECISION,
+    low DOUBLE PRECISION,
+    close DOUBLE PRECISION,
+    pre_close DOUBLE PRECISION,
+    change DOUBLE PRECISION,
+    pct_chg DOUBLE PRECISION,
+    vol DOUBLE PRECISION,
+    amount DOUBLE PRECISION,
     is_intraday BOOLEAN NOT NULL DEFAULT FALSE,
     updated_at TIMESTAMP WITHOUT TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     PRIMARY KEY (ts_code, trade_date)
 );
+
+ALTER TABLE {schema}.{table}
+    ADD COLUMN IF NOT EXISTS is_intraday BOOLEAN NOT NULL DEFAULT FALSE;
+
+CREATE INDEX IF NOT EXISTS {trade_date_idx}
+    ON {schema}.{table} (trade_date DESC);
+
+CREATE INDEX IF NOT EXISTS {final_trade_date_idx}
+    ON {schema}.{table} (trade_date DESC, ts_code)
+    INCLUDE (close, vol)
+    WHERE is_intraday = FALSE;
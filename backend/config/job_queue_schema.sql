@@ -0,0 +1,17 @@
+CREATE TABLE IF NOT EXISTS {schema}.{table} (
+    id BIGSERIAL PRIMARY KEY,
+    job TEXT NOT NULL,
+    payload JSONB NOT NULL DEFAULT '{{}}'::jsonb,
+    status TEXT NOT NULL DEFAULT 'queued',
+    detail TEXT,
+    enqueued_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    claimed_at TIMESTAMPTZ,
+    finished_at TIMESTAMPTZ
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS {index_pending}
+    ON {schema}.{table} (job)
+    WHERE status = 'queued';
+
+CREATE INDEX IF NOT EXISTS {index_status}
+    ON {schema}.{table} (status, id);
@@ -25,3 +25,9 @@ CREATE UNIQUE INDEX IF NOT EXISTS {table_source_item_idx}
 
 CREATE INDEX IF NOT EXISTS {table_status_idx}
     ON {schema}.{table} (processing_status, published_at DESC);
+
+CREATE INDEX IF NOT EXISTS {table_published_idx}
+    ON {schema}.{table} (published_at DESC, article_id DESC);
+
+CREATE INDEX IF NOT EXISTS {table_source_published_idx}
+    ON {schema}.{table} (source, published_at DESC, article_id DESC);
@@ -4,12 +4,12 @@ CREATE TABLE IF NOT EXISTS {schema}.{table} (
     relevance_confidence DOUBLE PRECISION,
     relevance_reason TEXT,
     relevance_checked_at TIMESTAMP WITHOUT TIME ZONE,
-    impact_levels TEXT,
-    impact_markets TEXT,
-    impact_industries TEXT,
-    impact_sectors TEXT,
-    impact_themes TEXT,
-    impact_stocks TEXT,
+    impact_levels JSONB,
+    impact_markets JSONB,
+    impact_industries JSONB,
+    impact_sectors JSONB,
+    impact_themes JSONB,
+    impact_stocks JSONB,
     impact_summary TEXT,
     impact_analysis TEXT,
     impact_confidence DOUBLE PRECISION,
@@ -0,0 +1,115 @@
+"""Compare the sync and async read paths of the hot list endpoints under concurrent load.
+
+The sync path runs each service call on a bounded thread pool (as FastAPI does for
+``def`` handlers); the async path awaits the ``*_async`` services on one event loop.
+Requires a configured database.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict, List, Tuple
+
+from backend.src.dao.async_pool import async_driver_available, close_async_pools
+from backend.src.services import (
+    get_stock_overview,
+    get_stock_overview_async,
+    list_favorite_entries,
+    list_favorite_entries_async,
+    list_indicator_screenings,
+    list_indicator_screenings_async,
+)
+
+SYNC_THREADPOOL_SIZE = 40  # AnyIO's default limit for sync FastAPI handlers.
+
+SCENARIOS: Dict[str, Tuple[Callable[[], object], Callable[[], Awaitable[object]]]] = {
+    "/stocks": (
+        lambda: get_stock_overview(limit=50),
+        lambda: get_stock_overview_async(limit=50),
+    ),
+    # The /stocks handler reads the unpaged universe, then filters, sorts and pages it.
+    "/stocks (unpaged)": (
+        lambda: get_stock_overview(limit=None),
+        lambda: get_stock_overview_async(limit=None),
+    ),
+    "/stocks?industry=银行 (unpaged)": (
+        lambda: get_stock_overview(industry="银行", limit=None),
+        lambda: get_stock_overview_async(industry="银行", limit=None),
+    ),
+    "/favorites": (list_favorite_entries, list_favorite_entries_async),
+    "/indicator-screenings": (
+        lambda: list_indicator_screenings(limit=50),
+        lambda: list_indicator_screenings_async(limit=50),
+    ),
+}
+
+
+def _summary(label: str, latencies: List[float], elapsed: float) -> str:
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return (
+        f"{label:<6} {len(ordered) / elapsed:8.1f} req/s  "
+        f"p50 {statistics.median(ordered) * 1000:8.1f} ms  p95 {p95 * 1000:8.1f} ms"
+    )
+
+
+async def _run_sync(fn: Callable[[], object], requests: int, concurrency: int) -> Tuple[List[float], float]:
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+
+    with ThreadPoolExecutor(max_workers=SYNC_THREADPOOL_SIZE) as executor:
+
+        async def _one() -> None:
+            async with semaphore:
+                started = time.perf_counter()
+                await loop.run_in_executor(executor, fn)
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(_one() for _ in range(requests)))
+        return latencies, time.perf_counter() - started
+
+
+async def _run_async(fn: Callable[[], Awaitable[object]], requests: int, concurrency: int) -> Tuple[List[float], float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+
+    async def _one() -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await fn()
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(_one() for _ in range(requests)))
+    return latencies, time.perf_counter() - started
+
+
+async def _main(args: argparse.Namespace) -> None:
+    print(f"asyncpg available: {async_driver_available()}  concurrency: {args.concurrency}")
+    try:
+        for name, (sync_fn, async_fn) in SCENARIOS.items():
+            await _run_async(async_fn, args.concurrency, args.concurrency)  # warm the pool
+            sync_latencies, sync_elapsed = await _run_sync(sync_fn, args.requests, args.concurrency)
+            async_latencies, async_elapsed = await _run_async(async_fn, args.requests, args.concurrency)
+            print(name)
+            print("  " + _summary("sync", sync_latencies, sync_elapsed))
+            print("  " + _summary("async", async_latencies, async_elapsed))
+    finally:
+        await close_async_pools()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=400, help="Requests per scenario and path.")
+    parser.add_argument("--concurrency", type=int, default=100)
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Compare the default FastAPI response path with the orjson fast path on a synthetic payload."""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import time
+from datetime import datetime, timedelta
+from typing import Tuple
+
+from fastapi.encoders import jsonable_encoder
+
+from backend.src.api.schemas import BigDealFundFlowListResponse, BigDealFundFlowRecord
+from backend.src.app import GZIP_COMPRESS_LEVEL
+from backend.src.fast_json import dumps
+
+
+def _build_payload(size: int) -> BigDealFundFlowListResponse:
+    start = datetime(2025, 4, 28, 9, 30)
+    items = [
+        BigDealFundFlowRecord(
+            trade_time=start + timedelta(seconds=idx),
+            stock_code=f"{600000 + idx % 3000:06d}.SH",
+            stock_name="浦发银行",
+            trade_price=10.0 + idx % 100 / 100,
+            trade_volume=1000 * (idx % 50 + 1),
+            trade_amount=12345.67 * (idx % 50 + 1),
+            trade_side="买盘" if idx % 2 else "卖盘",
+            price_change_percent=1.23,
+            price_change=0.12,
+            updated_at=start,
+        )
+        for idx in range(size)
+    ]
+    return BigDealFundFlowListResponse(total=size, items=items)
+
+
+def _time(fn, repeat: int) -> Tuple[float, bytes]:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        body = fn()
+    elapsed = (time.perf_counter() - started) / repeat
+    return elapsed * 1000, body
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=5000, help="Number of records in the payload.")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    payload = _build_payload(args.size)
+
+    def default_path() -> bytes:
+        # FastAPI re-validates the returned model before encoding it.
+        validated = BigDealFundFlowListResponse.validate(payload)
+        return json.dumps(jsonable_encoder(validated, by_alias=True), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    default_ms, default_body = _time(default_path, args.repeat)
+    fast_ms, fast_body = _time(lambda: dumps(payload), args.repeat)
+    gzipped = gzip.compress(fast_body, compresslevel=GZIP_COMPRESS_LEVEL)
+
+    print(f"records: {args.size}")
+    print(f"default: {default_ms:8.2f} ms  {len(default_body):>10} bytes")
+    print(f"orjson:  {fast_ms:8.2f} ms  {len(fast_body):>10} bytes")
+    print(f"gzip:    {len(gzipped):>21} bytes on the wire")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+"""Utility script to convert the big deal fund flow table to daily range partitions."""
+
+from __future__ import annotations
+
+from backend.src.config.settings import load_settings
+from backend.src.dao import BigDealFundFlowDAO
+
+
+def main() -> None:
+    dao = BigDealFundFlowDAO(load_settings().postgres)
+    copied = dao.partition_by_day()
+    print(f"Big deal fund flow table is partitioned by trade date ({copied} rows copied).")
+    rolled_up = dao.rebuild_rollup()
+    print(f"Big deal daily rollup rebuilt ({rolled_up} stock-day rows).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+"""Utility script to convert the daily trade table to yearly range partitions."""
+
+from __future__ import annotations
+
+from backend.src.config.settings import load_settings
+from backend.src.dao import DailyTradeDAO
+
+
+def main() -> None:
+    settings = load_settings()
+    copied = DailyTradeDAO(settings.postgres).partition_by_year()
+    print(f"Daily trade table is partitioned by year ({copied} rows copied).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Shared helpers for the API routers and the job runtime.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional, Tuple
+
+from fastapi import HTTPException
+from zoneinfo import ZoneInfo
+
+from ..services import list_big_deal_fund_flow
+from .schemas import BigDealFundFlowRecord, BigDealFundFlowListResponse
+
+LOCAL_TZ = ZoneInfo("Asia/Shanghai")
+
+
+def _parse_time_string(value: str) -> Tuple[int, int]:
+    if not isinstance(value, str) or ":" not in value:
+        raise HTTPException(status_code=400, detail="Invalid time format. Expected HH:MM.")
+    hour_part, minute_part = value.split(":", 1)
+    try:
+        hour = int(hour_part)
+        minute = int(minute_part)
+    except ValueError as exc:  # pragma: no cover - defensive
+        raise HTTPException(status_code=400, detail="Invalid time format. Expected HH:MM.") from exc
+    if not (0 <= hour <= 23 and 0 <= minute <= 59):
+        raise HTTPException(status_code=400, detail="Time must be between 00:00 and 23:59.")
+    return hour, minute
+
+
+def _local_now() -> datetime:
+    return datetime.now(LOCAL_TZ)
+
+
+def _localize_datetime(value: Optional[datetime]) -> Optional[datetime]:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            return value.replace(tzinfo=LOCAL_TZ)
+        return value.astimezone(LOCAL_TZ)
+    return None
+
+
+def _build_big_deal_fund_flow_response(
+    *,
+    limit: int,
+    offset: int,
+    side: Optional[str],
+    code: Optional[str],
+) -> BigDealFundFlowListResponse:
+    result = list_big_deal_fund_flow(limit=limit, offset=offset, side=side, stock_code=code)
+    items = [
+        BigDealFundFlowRecord(
+            trade_time=entry.get("trade_time"),
+            stock_code=entry.get("stock_code"),
+            stock_name=entry.get("stock_name"),
+            trade_price=entry.get("trade_price"),
+            trade_volume=entry.get("trade_volume"),
+            trade_amount=entry.get("trade_amount"),
+            trade_side=entry.get("trade_side"),
+            price_change_percent=entry.get("price_change_percent"),
+            price_change=entry.get("price_change"),
+            updated_at=entry.get("updated_at"),
+        )
+        for entry in result.get("items", [])
+    ]
+    return BigDealFundFlowListResponse(total=int(result.get("total", 0)), items=items)
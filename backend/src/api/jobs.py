@@ -0,0 +1,4485 @@
+"""
+Background job runtime: sync/insight job runners, job tokens and the APScheduler
+instance with its cron registrations.
+
+Every ``start_*_job`` coroutine is registered with ``queueable``. In the default
+in-process mode they start the job on this event loop; once ``enable_job_queue`` has
+been called (API process with a separate scheduler worker) they only write a row to the
+job queue, and the worker (``backend.src.worker``) starts the job via ``run_queued_job``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import json
+import logging
+import time
+import secrets
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, get_type_hints
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.cron import CronTrigger
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+from ..config.runtime_config import RuntimeConfig, load_runtime_config
+from ..config.settings import load_settings
+from ..dao import (
+    DailyIndicatorDAO,
+    DailyTradeDAO,
+    DailyTradeMetricsDAO,
+    FinancialIndicatorDAO,
+    NewsArticleDAO,
+    IndexHistoryDAO,
+    TradeCalendarDAO,
+    IncomeStatementDAO,
+    FundamentalMetricsDAO,
+    PerformanceExpressDAO,
+    PerformanceForecastDAO,
+    ProfitForecastDAO,
+    GlobalIndexHistoryDAO,
+    RealtimeIndexDAO,
+    DollarIndexDAO,
+    RmbMidpointDAO,
+    FuturesRealtimeDAO,
+    FedStatementDAO,
+    PeripheralInsightDAO,
+    MacroLeverageDAO,
+    MacroSocialFinancingDAO,
+    MacroCpiDAO,
+    MacroPmiDAO,
+    MacroM2DAO,
+    MacroPpiDAO,
+    MacroLprDAO,
+    MacroShiborDAO,
+    MacroInsightDAO,
+    IndustryFundFlowDAO,
+    ConceptFundFlowDAO,
+    ConceptIndexHistoryDAO,
+    ConceptDirectoryDAO,
+    ConceptInsightDAO,
+    IndustryInsightDAO,
+    IndividualFundFlowDAO,
+    BigDealFundFlowDAO,
+    MarginAccountDAO,
+    MarketActivityDAO,
+    MarketFundFlowDAO,
+    StockBasicDAO,
+    StockMainBusinessDAO,
+    StockMainCompositionDAO,
+    CashflowStatementDAO,
+    BalanceSheetDAO,
+    JobQueueDAO,
+)
+from ..services import (
+    rebuild_price_panel,
+    RealtimeQuotePoller,
+    sync_macro_leverage_ratios,
+    sync_social_financing_ratios,
+    sync_macro_cpi,
+    sync_macro_pmi,
+    sync_macro_m2,
+    sync_macro_ppi,
+    sync_macro_lpr,
+    sync_macro_shibor,
+    generate_industry_insight_summary,
+    sync_daily_indicator,
+    sync_financial_indicators,
+    sync_finance_breakfast,
+    sync_global_flash,
+    classify_relevance_batch,
+    classify_impact_batch,
+    sync_trade_calendar,
+    sync_income_statements,
+    sync_cashflow_statements,
+    sync_balance_sheets,
+    sync_daily_trade,
+    sync_daily_trade_metrics,
+    sync_fundamental_metrics,
+    sync_performance_express,
+    sync_performance_forecast,
+    sync_profit_forecast,
+    sync_global_indices,
+    sync_realtime_indices,
+    sync_dollar_index,
+    sync_rmb_midpoint_rates,
+    sync_futures_realtime,
+    sync_fed_statements,
+    generate_peripheral_insight,
+    generate_market_insight_summary,
+    generate_sector_insight_summary,
+    sync_index_history,
+    sync_industry_fund_flow,
+    sync_concept_fund_flow,
+    sync_concept_index_history,
+    sync_sector_indices,
+    generate_concept_insight_summary,
+    sync_indicator_screening,
+    run_indicator_realtime_refresh,
+    sync_concept_directory,
+    sync_concept_constituents,
+    generate_sector_volume_price_batch,
+    generate_stock_analysis_batch,
+    sync_individual_fund_flow,
+    sync_big_deal_fund_flow,
+    sync_margin_account_info,
+    sync_market_activity,
+    sync_market_fund_flow,
+    generate_macro_insight,
+    invalidate_market_overview_on_job,
+    invalidate_stock_context_piece,
+    refresh_concept_membership_index,
+    refresh_stock_search_index,
+    sync_stock_basic,
+    sync_stock_main_business,
+    sync_stock_main_composition,
+    is_trading_day,
+)
+from ..services.stock_context_service import VOLUME_REASONING_PIECE
+from ..services.indicator_screening_service import (
+    BIG_DEAL_INDICATOR_CODE,
+    VOLUME_SURGE_BREAKOUT_CODE,
+)
+from ..services.stock_analysis_batch_service import STOCK_ANALYSIS_KINDS
+from ..state import monitor
+from .common import LOCAL_TZ, _parse_time_string
+from .schemas import (
+    SyncDailyTradeRequest,
+    SyncDailyTradeMetricsRequest,
+    SyncFundamentalMetricsRequest,
+    SyncStockBasicRequest,
+    SyncDailyIndicatorRequest,
+    SyncIncomeStatementRequest,
+    SyncFinancialIndicatorRequest,
+    SyncCashflowRequest,
+    SyncBalanceSheetRequest,
+    SyncFinanceBreakfastRequest,
+    SyncGlobalFlashRequest,
+    SyncTradeCalendarRequest,
+    SyncPricePanelRequest,
+    SyncGlobalFlashClassifyRequest,
+    SyncPerformanceExpressRequest,
+    SyncMarketInsightRequest,
+    SyncSectorInsightRequest,
+    SyncIndexHistoryRequest,
+    SyncPerformanceForecastRequest,
+    SyncProfitForecastRequest,
+    SyncGlobalIndexRequest,
+    SyncRealtimeIndexRequest,
+    SyncDollarIndexRequest,
+    SyncRmbMidpointRequest,
+    SyncMacroLeverageRequest,
+    SyncSocialFinancingRequest,
+    SyncMacroCpiRequest,
+    SyncMacroPmiRequest,
+    SyncMacroM2Request,
+    SyncMacroPpiRequest,
+    SyncMacroLprRequest,
+    SyncMacroShiborRequest,
+    SyncFuturesRealtimeRequest,
+    SyncFedStatementRequest,
+    SyncPeripheralInsightRequest,
+    SyncPeripheralAggregateRequest,
+    SyncMacroAggregateRequest,
+    SyncFundFlowAggregateRequest,
+    SyncIndustryFundFlowRequest,
+    SyncConceptFundFlowRequest,
+    SyncConceptIndexHistoryRequest,
+    SyncConceptConstituentsRequest,
+    SyncSectorVolumePriceRequest,
+    SyncStockAnalysisRequest,
+    SyncConceptInsightRequest,
+    SyncIndustryInsightRequest,
+    SyncIndividualFundFlowRequest,
+    SyncBigDealFundFlowRequest,
+    SyncMarginAccountRequest,
+    SyncMarketActivityRequest,
+    SyncMarketFundFlowRequest,
+    SyncMacroInsightRequest,
+    SyncStockMainBusinessRequest,
+    SyncStockMainCompositionRequest,
+    IndicatorRealtimeRequest,
+)
+
+logger = logging.getLogger(__name__)
+
+scheduler = AsyncIOScheduler(timezone=LOCAL_TZ)
+monitor.add_finish_listener(invalidate_market_overview_on_job)
+scheduler_loop: Optional[asyncio.AbstractEventLoop] = None
+realtime_quote_poller: Optional[RealtimeQuotePoller] = None
+
+_active_job_tokens: Dict[str, str] = {}
+_job_token_lock = threading.Lock()
+
+
+def _assign_job_token(job: str) -> str:
+    token = secrets.token_hex(16)
+    with _job_token_lock:
+        _active_job_tokens[job] = token
+    return token
+
+
+def _clear_job_token(job: str) -> None:
+    with _job_token_lock:
+        _active_job_tokens.pop(job, None)
+
+
+def _job_token_matches(job: str, token: str) -> bool:
+    with _job_token_lock:
+        return _active_job_tokens.get(job) == token
+
+
+def _force_reset_job(job: str) -> None:
+    snapshot = monitor.snapshot()
+    if job not in snapshot:
+        raise HTTPException(status_code=400, detail="Unsupported job reset target.")
+    _clear_job_token(job)
+    monitor.finish(
+        job,
+        success=False,
+        message="Job reset by user",
+        error="job reset by user",
+        last_duration=0.0,
+    )
+    logger.warning("Job %s manually reset by user request", job)
+
+
+def _submit_scheduler_task(coro: Awaitable[object]) -> bool:
+    global scheduler_loop
+    loop = scheduler_loop
+    if loop is None or loop.is_closed():
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.error("Scheduler job triggered without available asyncio loop.")
+            return False
+        else:
+            scheduler_loop = loop
+    loop.call_soon_threadsafe(asyncio.create_task, coro)
+    return True
+
+
+# Job name -> undecorated ``start_*_job`` coroutine, used by the worker to run queued jobs.
+QUEUEABLE_JOBS: Dict[str, Callable[..., Awaitable[None]]] = {}
+RESET_JOB_PREFIX = "reset:"
+_job_queue: Optional[JobQueueDAO] = None
+
+
+# In-memory state of the API process rebuilt after a job finishes in the worker. The
+# jobs refresh it inline when they run in-process, but the worker cannot reach it.
+WORKER_JOB_REFRESHERS: Dict[str, Callable[[], object]] = {
+    "stock_basic": refresh_stock_search_index,
+    "concept_constituents": refresh_concept_membership_index,
+    "stock_analysis": lambda: invalidate_stock_context_piece(VOLUME_REASONING_PIECE),
+}
+WORKER_STATE_POLL_SECONDS = 2.0
+
+
+def _run_worker_job_refresher(job: str, refresher: Callable[[], object]) -> None:
+    try:
+        refresher()
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Failed to refresh in-memory state after worker job %s: %s", job, exc)
+
+
+def refresh_after_worker_job(job: str, success: bool) -> None:
+    """``SyncMonitor`` finish listener (queue mode): rebuild state a worker job made stale."""
+    refresher = WORKER_JOB_REFRESHERS.get(job)
+    if not success or refresher is None:
+        return
+    # Listeners fire from ``monitor.snapshot`` callers; keep index rebuilds off their thread.
+    threading.Thread(
+        target=_run_worker_job_refresher,
+        args=(job, refresher),
+        name=f"worker-job-refresh-{job}",
+        daemon=True,
+    ).start()
+
+
+async def watch_worker_jobs(interval: float = WORKER_STATE_POLL_SECONDS) -> None:
+    """Poll the job state published by the worker so finish listeners fire in this process."""
+    while True:
+        try:
+            await asyncio.to_thread(monitor.snapshot)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Failed to read worker job state: %s", exc)
+        await asyncio.sleep(interval)
+
+
+def enable_job_queue(dao: Optional[JobQueueDAO] = None) -> None:
+    """Hand ``start_*_job`` calls to the job queue instead of running them in this process."""
+    global _job_queue
+    if _job_queue is None:
+        monitor.add_finish_listener(refresh_after_worker_job)
+    _job_queue = dao or JobQueueDAO(load_settings().postgres)
+
+
+def job_queue_enabled() -> bool:
+    return _job_queue is not None
+
+
+async def _enqueue_job(job: str, payload: Optional[BaseModel] = None) -> None:
+    queue = _job_queue
+    if queue is None:
+        raise RuntimeError("Job queue is not enabled")
+    data = json.loads(payload.json(by_alias=True)) if payload is not None else {}
+    try:
+        job_id = await asyncio.to_thread(queue.enqueue, job, data)
+    except Exception as exc:
+        logger.error("Failed to enqueue job %s: %s", job, exc)
+        raise HTTPException(status_code=503, detail="Job queue unavailable") from exc
+    if job_id is None:
+        logger.info("Job %s is already queued; request merged", job)
+    else:
+        logger.info("Queued job %s (#%s)", job, job_id)
+
+
+def queueable(job: str) -> Callable[[Callable[..., Awaitable[None]]], Callable[..., Awaitable[None]]]:
+    """Register a ``start_*_job`` coroutine and route it through the job queue when enabled."""
+
+    def decorator(func: Callable[..., Awaitable[None]]) -> Callable[..., Awaitable[None]]:
+        QUEUEABLE_JOBS[job] = func
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> None:
+            if _job_queue is None:
+                await func(*args, **kwargs)
+                return
+            if _job_running(job):
+                raise HTTPException(status_code=409, detail=f"Job {job} already running")
+            payload = args[0] if args else next(iter(kwargs.values()), None)
+            await _enqueue_job(job, payload)
+
+        return wrapper
+
+    return decorator
+
+
+async def reset_job(job: str) -> None:
+    """Reset a job's state here, or in the worker that owns it when the queue is enabled."""
+    if _job_queue is None:
+        _force_reset_job(job)
+        return
+    if job not in monitor.snapshot():
+        raise HTTPException(status_code=400, detail="Unsupported job reset target.")
+    await _enqueue_job(f"{RESET_JOB_PREFIX}{job}")
+
+
+async def run_queued_job(job: str, payload: Optional[Dict[str, Any]] = None) -> None:
+    """Start a job claimed from the queue in this process.
+
+    Raises ``HTTPException`` when the job is rejected (already running, bad target) and
+    ``KeyError`` for job names this build does not know.
+    """
+    if job.startswith(RESET_JOB_PREFIX):
+        _force_reset_job(job[len(RESET_JOB_PREFIX):])
+        return
+    func = QUEUEABLE_JOBS[job]
+    parameters = list(inspect.signature(func).parameters)
+    if not parameters:
+        await func()
+        return
+    model = get_type_hints(func)[parameters[0]]
+    await func(model.parse_obj(payload or {}))
+
+
+async def _run_stock_basic_job(list_statuses: Optional[List[str]], market: Optional[str]) -> None:
+    loop = asyncio.get_running_loop()
+
+    def job() -> None:
+        started = time.perf_counter()
+        context_parts: List[str] = []
+        if market:
+            context_parts.append(f"MARKET:{market}")
+        if list_statuses:
+            context_parts.append(f"STATUS:{','.join(list_statuses)}")
+        if context_parts:
+            monitor.update("stock_basic", last_market=" ".join(context_parts))
+        else:
+            monitor.update("stock_basic", last_market="AUTO")
+        try:
+            rows = sync_stock_basic(
+                list_statuses=tuple(list_statuses or ["L", "D", "P"]),
+                market=market,
+            )
+            stats: Dict[str, object] = {}
+            try:
+                stats = StockBasicDAO(load_settings().postgres).stats()
+            except Exception as stats_exc:  # pragma: no cover - defensive
+                logger.warning("Failed to refresh stock_basic stats: %s", stats_exc)
+            elapsed = time.perf_counter() - started
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = rows
+            finished_at = stats.get("updated_at") if isinstance(stats, dict) else None
+            monitor.finish(
+                "stock_basic",
+                success=True,
+                total_rows=total_rows,
+                message="Stock basic sync completed",
+                finished_at=finished_at,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "stock_basic",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_concept_directory_job() -> None:
+    loop = asyncio.get_running_loop()
+
+    def job() -> None:
+        started = time.perf_counter()
+        try:
+            result = sync_concept_directory(settings_path=None)
+            stats: Dict[str, object] = {}
+            try:
+                stats = ConceptDirectoryDAO(load_settings().postgres).stats()
+            except Exception as stats_exc:  # pragma: no cover - defensive
+                logger.warning("Failed to refresh concept_directory stats: %s", stats_exc)
+            elapsed = time.perf_counter() - started
+            total_rows = None
+            finished_at = None
+            if isinstance(stats, dict):
+                total_rows = stats.get("count")
+                finished_at = stats.get("updated_at")
+            if total_rows is None:
+                total_rows = result.get("rows")
+            monitor.finish(
+                "concept_directory",
+                success=True,
+                total_rows=total_rows,
+                message="Concept directory synced",
+                finished_at=finished_at,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "concept_directory",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_daily_trade_job(request: SyncDailyTradeRequest) -> None:
+    loop = asyncio.get_running_loop()
+
+    runtime_config = load_runtime_config()
+    window_days = request.window_days or runtime_config.daily_trade_window_days
+
+    def progress_callback(progress: float, message: Optional[str], total_rows: Optional[int]) -> None:
+        monitor.update(
+            "daily_trade",
+            progress=progress,
+            message=message,
+            total_rows=total_rows,
+        )
+
+    def job() -> None:
+        started = time.perf_counter()
+        try:
+            result = sync_daily_trade(
+                batch_size=request.batch_size or 20,
+                window_days=window_days,
+                start_date=request.start_date,
+                end_date=request.end_date,
+                codes=request.codes,
+                batch_pause_seconds=request.batch_pause_seconds or 0.6,
+                progress_callback=progress_callback,
+            )
+            indicator_rows: Optional[int] = None
+            try:
+                indicator_result = sync_indicator_screening(indicator_code=VOLUME_SURGE_BREAKOUT_CODE)
+                if isinstance(indicator_result, dict):
+                    indicator_rows = indicator_result.get("rows")
+                logger.info(
+                    "Indicator %s snapshot refreshed after daily_trade sync (rows=%s)",
+                    VOLUME_SURGE_BREAKOUT_CODE,
+                    indicator_rows,
+                )
+            except Exception as indicator_exc:  # pragma: no cover - defensive
+                logger.warning(
+                    "Failed to refresh %s indicator snapshot: %s",
+                    VOLUME_SURGE_BREAKOUT_CODE,
+                    indicator_exc,
+                )
+            if runtime_config.sector_index_source != "remote":
+                monitor.update("daily_trade", message="Computing local concept and industry indices")
+                try:
+                    sync_sector_indices(method=runtime_config.sector_index_source)
+                except Exception as sector_exc:  # pragma: no cover - defensive
+                    logger.warning("Failed to compute local sector indices: %s", sector_exc)
+            stats: Dict[str, object] = {}
+            try:
+                stats = DailyTradeDAO(load_settings().postgres).stats()
+            except Exception as stats_exc:  # pragma: no cover - defensive
+                logger.warning("Failed to refresh daily_trade stats: %s", stats_exc)
+            elapsed = time.perf_counter() - started
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = result["rows"]
+            finished_at = stats.get("updated_at") if isinstance(stats, dict) else None
+            monitor.finish(
+                "daily_trade",
+                success=True,
+                total_rows=total_rows,
+                message="Daily trade sync completed",
+                finished_at=finished_at,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "daily_trade",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    monitor.update("daily_trade", last_market=f"WINDOW:{window_days}")
+    await loop.run_in_executor(None, job)
+
+
+async def _run_daily_trade_metrics_job(request: SyncDailyTradeMetricsRequest) -> None:
+    loop = asyncio.get_running_loop()
+    history_window_days = request.history_window_days
+
+    def progress_callback(progress: float, message: Optional[str], total_rows: Optional[int]) -> None:
+        monitor.update(
+            "daily_trade_metrics",
+            progress=progress,
+            message=message,
+            total_rows=total_rows,
+        )
+
+    def job() -> None:
+        started = time.perf_counter()
+        try:
+            kwargs: Dict[str, object] = {"progress_callback": progress_callback}
+            if history_window_days is not None:
+                kwargs["history_window_days"] = history_window_days
+            result = sync_daily_trade_metrics(**kwargs)
+            stats: Dict[str, object] = {}
+            try:
+                stats = DailyTradeMetricsDAO(load_settings().postgres).stats()
+            except Exception as stats_exc:  # pragma: no cover - defensive
+                logger.warning("Failed to refresh daily_trade_metrics stats: %s", stats_exc)
+            elapsed = float(result.get("elapsedSeconds", result.get("elapsed_seconds", time.perf_counter() - started)))
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = result.get("rows")
+            finished_at = stats.get("updated_at") if isinstance(stats, dict) else None
+            trade_date_value = stats.get("latest_trade_date") if isinstance(stats, dict) else None
+            if not trade_date_value:
+                trade_date_value = result.get("trade_date")
+                if isinstance(trade_date_value, str):
+                    try:
+                        trade_date_value = datetime.strptime(trade_date_value, "%Y%m%d").date()
+                    except (ValueError, TypeError):
+                        pass
+            trade_date_str: Optional[str] = None
+            if trade_date_value:
+                if hasattr(trade_date_value, "strftime"):
+                    trade_date_str = trade_date_value.strftime("%Y-%m-%d")
+                else:
+                    trade_date_str = str(trade_date_value)
+            if trade_date_str:
+                monitor.update("daily_trade_metrics", last_market=trade_date_str)
+
+            message = "Daily trade metrics sync completed"
+            if trade_date_str:
+                message = f"Metrics ready for {trade_date_str}"
+            if history_window_days:
+                message = f"{message} (history {history_window_days}d)"
+            monitor.finish(
+                "daily_trade_metrics",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message=message,
+                finished_at=finished_at,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "daily_trade_metrics",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    label = history_window_days if history_window_days is not None else "AUTO"
+    monitor.update("daily_trade_metrics", last_market=f"HISTORY:{label}")
+    await loop.run_in_executor(None, job)
+
+
+
+async def _run_fundamental_metrics_job(request: SyncFundamentalMetricsRequest) -> None:
+    loop = asyncio.get_running_loop()
+
+    def progress_callback(progress: float, message: Optional[str], total_rows: Optional[int]) -> None:
+        monitor.update(
+            "fundamental_metrics",
+            progress=progress,
+            message=message,
+            total_rows=total_rows,
+        )
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update(
+            "fundamental_metrics",
+            last_market=f"PER:{request.per_code}" if request.per_code is not None else "PER:AUTO",
+        )
+        try:
+            kwargs: dict[str, object] = {"progress_callback": progress_callback}
+            if request.per_code is not None:
+                kwargs["per_code"] = request.per_code
+            if request.full_refresh:
+                kwargs["full_refresh"] = True
+            result = sync_fundamental_metrics(**kwargs)
+            stats: Dict[str, object] = {}
+            try:
+                stats = FundamentalMetricsDAO(load_settings().postgres).stats()
+            except Exception as stats_exc:  # pragma: no cover - defensive
+                logger.warning("Failed to refresh fundamental_metrics stats: %s", stats_exc)
+            elapsed = float(result.get("elapsedSeconds", result.get("elapsed_seconds", time.perf_counter() - started)))
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = result.get("rows")
+            finished_at = stats.get("updated_at") if isinstance(stats, dict) else None
+            monitor.finish(
+                "fundamental_metrics",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message="Fundamental metrics sync completed",
+                finished_at=finished_at,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "fundamental_metrics",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+async def _run_daily_indicator_job(request: SyncDailyIndicatorRequest) -> None:
+    loop = asyncio.get_running_loop()
+
+    def progress_callback(progress: float, message: Optional[str], total_rows: Optional[int]) -> None:
+        monitor.update(
+            "daily_indicator",
+            progress=progress,
+            message=message,
+            total_rows=total_rows,
+        )
+
+    def job() -> None:
+        started = time.perf_counter()
+        try:
+            result = sync_daily_indicator(
+                trade_date=request.trade_date,
+                progress_callback=progress_callback,
+            )
+            stats: Dict[str, object] = {}
+            try:
+                stats = DailyIndicatorDAO(load_settings().postgres).stats()
+            except Exception as stats_exc:  # pragma: no cover - defensive
+                logger.warning("Failed to refresh daily_indicator stats: %s", stats_exc)
+            elapsed = float(result.get("elapsedSeconds", result.get("elapsed_seconds", time.perf_counter() - started)))
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = result.get("rows")
+            finished_at = stats.get("updated_at") if isinstance(stats, dict) else None
+            monitor.finish(
+                "daily_indicator",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message="Daily indicator sync completed",
+                finished_at=finished_at,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "daily_indicator",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_income_statement_job(request: SyncIncomeStatementRequest) -> None:
+    loop = asyncio.get_running_loop()
+
+    def progress_callback(progress: float, message: Optional[str], total_rows: Optional[int]) -> None:
+        monitor.update(
+            "income_statement",
+            progress=progress,
+            message=message,
+            total_rows=total_rows,
+        )
+
+    def job() -> None:
+        started = time.perf_counter()
+        try:
+            result = sync_income_statements(
+                codes=request.codes,
+                initial_periods=request.initial_periods,
+                progress_callback=progress_callback,
+                mode=request.mode,
+                announced_since=request.announced_since,
+            )
+            stats: Dict[str, object] = {}
+            try:
+                stats = IncomeStatementDAO(load_settings().postgres).stats()
+            except Exception as stats_exc:  # pragma: no cover - defensive
+                logger.warning("Failed to refresh income_statement stats: %s", stats_exc)
+            elapsed = float(result.get("elapsedSeconds", result.get("elapsed_seconds", time.perf_counter() - started)))
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = result.get("rows")
+            finished_at = stats.get("updated_at") if isinstance(stats, dict) else None
+            codes = result.get("codes") or []
+            code_count = int(result.get("code_count", len(codes)))
+            total_codes = int(result.get("total_codes", code_count))
+            base_message = f"{code_count}/{total_codes} codes"
+            if codes:
+                preview = ", ".join(codes[:3])
+                suffix = "" if code_count <= 3 else " ??"
+                monitor.update(
+                    "income_statement",
+                    last_market=f"{base_message} ({preview}{suffix})",
+                )
+            else:
+                monitor.update(
+                    "income_statement",
+                    last_market=base_message,
+                )
+            monitor.finish(
+                "income_statement",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message="Income statement sync completed",
+                finished_at=finished_at,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            error_message = str(exc)
+            monitor.finish(
+                "income_statement",
+                success=False,
+                message=error_message,
+                error=error_message,
+                last_duration=elapsed,
+            )
+            logger.error("Income statement sync failed: %s", error_message)
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_cashflow_statement_job(request: SyncCashflowRequest) -> None:
+    loop = asyncio.get_running_loop()
+
+    def job() -> None:
+        started = time.perf_counter()
+        try:
+            result = sync_cashflow_statements(
+                codes=request.codes,
+                limit=request.limit,
+                mode=request.mode,
+                announced_since=request.announced_since,
+            )
+            stats: Dict[str, object] = {}
+            try:
+                stats = CashflowStatementDAO(load_settings().postgres).stats()
+            except Exception as stats_exc:  # pragma: no cover - defensive
+                logger.warning("Failed to refresh cashflow stats: %s", stats_exc)
+            elapsed = time.perf_counter() - started
+            total_rows = None
+            finished_at = None
+            if isinstance(stats, dict):
+                total_rows = stats.get("count")
+                finished_at = stats.get("updated_at")
+            if total_rows is None:
+                total_rows = result.get("rows")
+            monitor.finish(
+                "cashflow_statements",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message=f"Synced {result.get('rows', 0)} cashflow rows",
+                finished_at=finished_at,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "cashflow_statements",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_balance_sheet_job(request: SyncBalanceSheetRequest) -> None:
+    loop = asyncio.get_running_loop()
+
+    def job() -> None:
+        started = time.perf_counter()
+        try:
+            result = sync_balance_sheets(
+                codes=request.codes,
+                limit=request.limit,
+                mode=request.mode,
+                announced_since=request.announced_since,
+            )
+            stats: Dict[str, object] = {}
+            try:
+                stats = BalanceSheetDAO(load_settings().postgres).stats()
+            except Exception as stats_exc:  # pragma: no cover - defensive
+                logger.warning("Failed to refresh balance sheet stats: %s", stats_exc)
+            elapsed = time.perf_counter() - started
+            total_rows = None
+            finished_at = None
+            if isinstance(stats, dict):
+                total_rows = stats.get("count")
+                finished_at = stats.get("updated_at")
+            if total_rows is None:
+                total_rows = result.get("rows")
+            monitor.finish(
+                "balance_sheet_statements",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message=f"Synced {result.get('rows', 0)} balance rows",
+                finished_at=finished_at,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "balance_sheet_statements",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_financial_indicator_job(request: SyncFinancialIndicatorRequest) -> None:
+    loop = asyncio.get_running_loop()
+
+    def progress_callback(progress: float, message: Optional[str], total_rows: Optional[int]) -> None:
+        monitor.update(
+            "financial_indicator",
+            progress=progress,
+            message=message,
+            total_rows=total_rows,
+        )
+
+    def job() -> None:
+        started = time.perf_counter()
+        try:
+            result = sync_financial_indicators(
+                codes=request.codes,
+                limit=request.limit,
+                progress_callback=progress_callback,
+                mode=request.mode,
+                announced_since=request.announced_since,
+            )
+            stats: Dict[str, object] = {}
+            try:
+                stats = FinancialIndicatorDAO(load_settings().postgres).stats()
+            except Exception as stats_exc:  # pragma: no cover - defensive
+                logger.warning("Failed to refresh financial_indicator stats: %s", stats_exc)
+            elapsed = float(result.get("elapsedSeconds", result.get("elapsed_seconds", time.perf_counter() - started)))
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = result.get("rows")
+            finished_at = stats.get("updated_at") if isinstance(stats, dict) else None
+            codes = result.get("codes") or []
+            code_count = int(result.get("code_count", len(codes)))
+            total_codes = int(result.get("total_codes", code_count))
+            base_message = f"{code_count}/{total_codes} codes"
+            if codes:
+                preview = ", ".join(codes[:3])
+                suffix = "" if code_count <= 3 else " ??"
+                monitor.update(
+                    "financial_indicator",
+                    last_market=f"{base_message} ({preview}{suffix})",
+                )
+            else:
+                monitor.update(
+                    "financial_indicator",
+                    last_market=base_message,
+                )
+            monitor.finish(
+                "financial_indicator",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message="Financial indicator sync completed",
+                finished_at=finished_at,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            error_message = str(exc)
+            monitor.finish(
+                "financial_indicator",
+                success=False,
+                message=error_message,
+                error=error_message,
+                last_duration=elapsed,
+            )
+            logger.error("Financial indicator sync failed: %s", error_message)
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_finance_breakfast_job(request: SyncFinanceBreakfastRequest) -> None:
+    loop = asyncio.get_running_loop()
+
+    def job() -> None:
+        monitor.update("finance_breakfast", progress=0.0, message="Fetching finance breakfast feed")
+        started = time.perf_counter()
+        try:
+            result = sync_finance_breakfast()
+            stats: Dict[str, object] = {}
+            try:
+                stats = NewsArticleDAO(load_settings().postgres).stats(source="finance_breakfast")
+            except Exception as stats_exc:  # pragma: no cover - defensive
+                logger.warning("Failed to refresh finance_breakfast stats: %s", stats_exc)
+            elapsed = float(result.get("elapsedSeconds", result.get("elapsed_seconds", time.perf_counter() - started)))
+            total_rows = stats.get("total") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = result.get("rows")
+            finished_at = stats.get("updated_at") if isinstance(stats, dict) else None
+            monitor.update("finance_breakfast", progress=1.0, message="Finance breakfast sync completed")
+            monitor.finish(
+                "finance_breakfast",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message="Finance breakfast sync completed",
+                finished_at=finished_at,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            error_message = str(exc)
+            monitor.finish(
+                "finance_breakfast",
+                success=False,
+                message=error_message,
+                error=error_message,
+                last_duration=elapsed,
+            )
+            logger.error("Finance breakfast sync failed: %s", error_message)
+
+    await loop.run_in_executor(None, job)
+class JobCancelledError(RuntimeError):
+    """Raised when a long-running job is cancelled by the user."""
+
+
+async def _run_market_insight_job(request: SyncMarketInsightRequest, run_token: str) -> None:
+    loop = asyncio.get_running_loop()
+
+    def job() -> None:
+        started = time.perf_counter()
+        logger.info(
+            "Market insight job started (lookback=%sh, article_limit=%s)",
+            request.lookback_hours,
+            request.article_limit,
+        )
+        monitor.update(
+            "market_insight",
+            progress=0.1,
+            message="Collecting market-impact headlines",
+        )
+
+        def _ensure_active() -> None:
+            if not _job_token_matches("market_insight", run_token):
+                raise JobCancelledError("Market insight job cancelled")
+
+        def _progress_callback(progress: float, message: str) -> None:
+            _ensure_active()
+            monitor.update("market_insight", progress=progress, message=message)
+
+        try:
+            _ensure_active()
+            result = generate_market_insight_summary(
+                lookback_hours=request.lookback_hours,
+                limit=request.article_limit,
+                progress_callback=_progress_callback,
+            )
+            elapsed = time.perf_counter() - started
+            headline_count = int(result.get("headline_count", 0) or 0)
+            generated_at = result.get("generated_at")
+            if _job_token_matches("market_insight", run_token):
+                monitor.update(
+                    "market_insight",
+                    progress=1.0,
+                    message=f"Generated summary from {headline_count} headlines",
+                )
+                monitor.finish(
+                    "market_insight",
+                    success=True,
+                    total_rows=headline_count,
+                    message=f"Generated summary from {headline_count} headlines",
+                    finished_at=generated_at,
+                    last_duration=elapsed,
+                )
+                logger.info(
+                    "Market insight job finished in %.2fs (summary_id=%s, headlines=%s)",
+                    elapsed,
+                    result.get("summary_id"),
+                    headline_count,
+                )
+            else:
+                logger.info("Market insight job result discarded because it was cancelled")
+        except JobCancelledError:
+            elapsed = time.perf_counter() - started
+            logger.warning("Market insight job cancelled after %.2fs", elapsed)
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            error_message = str(exc)
+            if _job_token_matches("market_insight", run_token):
+                monitor.finish(
+                    "market_insight",
+                    success=False,
+                    message=error_message,
+                    error=error_message,
+                    last_duration=elapsed,
+                )
+            logger.error("Market insight generation failed: %s", error_message)
+        finally:
+            _clear_job_token("market_insight")
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_sector_insight_job(request: SyncSectorInsightRequest) -> None:
+    loop = asyncio.get_running_loop()
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update(
+            "sector_insight",
+            progress=0.1,
+            message="Collecting sector-impact headlines",
+        )
+        try:
+            result = generate_sector_insight_summary(
+                lookback_hours=request.lookback_hours,
+                limit=request.article_limit,
+            )
+            elapsed = time.perf_counter() - started
+            headline_count = int(result.get("headline_count", 0) or 0)
+            snapshot = result.get("group_snapshot") if isinstance(result, dict) else None
+            group_count = int(result.get("group_count") or 0)
+            if isinstance(snapshot, dict):
+                try:
+                    group_count = int(snapshot.get("groupCount", group_count) or group_count)
+                except (TypeError, ValueError):
+                    group_count = int(result.get("group_count") or 0)
+            generated_at = result.get("generated_at")
+            message = f"Generated sector insight from {headline_count} headlines across {group_count} groups"
+            monitor.update("sector_insight", progress=1.0, message=message)
+            monitor.finish(
+                "sector_insight",
+                success=True,
+                total_rows=headline_count,
+                message=message,
+                finished_at=generated_at,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            error_message = str(exc)
+            monitor.finish(
+                "sector_insight",
+                success=False,
+                message=error_message,
+                error=error_message,
+                last_duration=elapsed,
+            )
+            logger.error("Sector insight generation failed: %s", error_message)
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_global_flash_job(request: SyncGlobalFlashRequest) -> None:
+    loop = asyncio.get_running_loop()
+
+    def job() -> None:
+        started = time.perf_counter()
+        try:
+            result = sync_global_flash()
+            stats: Dict[str, object] = {}
+            try:
+                stats = NewsArticleDAO(load_settings().postgres).stats(source="global_flash")
+            except Exception as stats_exc:  # pragma: no cover - defensive
+                logger.warning("Failed to refresh global_flash stats: %s", stats_exc)
+            elapsed = float(result.get("elapsedSeconds", result.get("elapsed_seconds", time.perf_counter() - started)))
+            total_rows = None
+            if isinstance(stats, dict):
+                total_rows = stats.get("count")
+                finished_at = stats.get("updated_at")
+            else:
+                finished_at = None
+            if total_rows is None:
+                total_rows = result.get("rows")
+            monitor.finish(
+                "global_flash",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message="Global flash sync completed",
+                finished_at=finished_at,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            error_message = str(exc)
+            monitor.finish(
+                "global_flash",
+                success=False,
+                message=error_message,
+                error=error_message,
+                last_duration=elapsed,
+            )
+            logger.error("Global flash sync failed: %s", error_message)
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_price_panel_job(request: SyncPricePanelRequest) -> None:
+    loop = asyncio.get_running_loop()
+
+    def progress_callback(progress: float, message: Optional[str], total_rows: Optional[int]) -> None:
+        monitor.update(
+            "price_panel",
+            progress=progress,
+            message=message,
+            total_rows=total_rows,
+        )
+
+    def job() -> None:
+        started = time.perf_counter()
+        try:
+            result = rebuild_price_panel(start_date=request.start_date, progress_callback=progress_callback)
+            elapsed = float(result.get("elapsed_seconds", time.perf_counter() - started))
+            monitor.update("price_panel", last_market=result.get("end_date"))
+            monitor.finish(
+                "price_panel",
+                success=True,
+                total_rows=int(result.get("rows", 0)),
+                message=f"Price panel cached {result.get('start_date')} → {result.get('end_date')}",
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            error_message = str(exc)
+            monitor.finish(
+                "price_panel",
+                success=False,
+                message=error_message,
+                error=error_message,
+                last_duration=elapsed,
+            )
+            logger.error("Price panel rebuild failed: %s", error_message)
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_trade_calendar_job(request: SyncTradeCalendarRequest) -> None:
+    loop = asyncio.get_running_loop()
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update("trade_calendar", message="Syncing A-share trading calendar", progress=0.0)
+        try:
+            result = sync_trade_calendar(
+                start_date=request.start_date,
+                end_date=request.end_date,
+                exchange=request.exchange or "SSE",
+            )
+            stats: Dict[str, object] = {}
+            try:
+                stats = TradeCalendarDAO(load_settings().postgres).stats()
+            except Exception as stats_exc:  # pragma: no cover - defensive
+                logger.warning("Failed to refresh trade_calendar stats: %s", stats_exc)
+            elapsed = float(result.get("elapsedSeconds", time.perf_counter() - started))
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            finished_at = stats.get("updated_at") if isinstance(stats, dict) else None
+            monitor.finish(
+                "trade_calendar",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message=f"Trade calendar synced ({result.get('rows', 0)} rows)",
+                finished_at=finished_at,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            error_message = str(exc)
+            monitor.finish(
+                "trade_calendar",
+                success=False,
+                message=error_message,
+                error=error_message,
+                last_duration=elapsed,
+            )
+            logger.error("Trade calendar sync failed: %s", error_message)
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_global_flash_classification_job(request: SyncGlobalFlashClassifyRequest) -> None:
+    loop = asyncio.get_running_loop()
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update("global_flash_classification", message="Classifying global flash entries", progress=0.0)
+        try:
+            relevance_result = classify_relevance_batch(batch_size=request.batch_size)
+            impact_result = classify_impact_batch(batch_size=request.batch_size)
+
+            relevance_rows = int(relevance_result.get("rows", 0) or 0)
+            impact_rows = int(impact_result.get("rows", 0) or 0)
+            relevance_requested = int(relevance_result.get("requested", relevance_rows) or relevance_rows)
+            impact_requested = int(impact_result.get("requested", impact_rows) or impact_rows)
+            skipped = bool(relevance_result.get("skipped")) and bool(impact_result.get("skipped"))
+
+            elapsed_relevance = float(relevance_result.get("elapsedSeconds", 0.0) or 0.0)
+            elapsed_impact = float(impact_result.get("elapsedSeconds", 0.0) or 0.0)
+            elapsed = elapsed_relevance + elapsed_impact
+            if elapsed <= 0:
+                elapsed = time.perf_counter() - started
+
+            rows = relevance_rows + impact_rows
+            message = (
+                "DeepSeek configuration missing; classification skipped"
+                if skipped
+                else (
+                    f"Relevance {relevance_rows}/{relevance_requested}; "
+                    f"Impact {impact_rows}/{impact_requested}"
+                )
+            )
+            monitor.finish(
+                "global_flash_classification",
+                success=True,
+                total_rows=rows,
+                message=message,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            error_message = str(exc)
+            monitor.finish(
+                "global_flash_classification",
+                success=False,
+                message=error_message,
+                error=error_message,
+                last_duration=elapsed,
+            )
+            logger.error("Global flash classification failed: %s", error_message)
+
+    await loop.run_in_executor(None, job)
+
+
+
+async def _run_performance_express_job(request: SyncPerformanceExpressRequest) -> None:
+    loop = asyncio.get_running_loop()
+
+    def progress_callback(progress: float, message: Optional[str], total_rows: Optional[int]) -> None:
+        monitor.update(
+            "performance_express",
+            progress=progress,
+            message=message,
+            total_rows=total_rows,
+        )
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update("performance_express", message="Collecting performance express data")
+        try:
+            result = sync_performance_express(
+                codes=request.codes,
+                lookback_days=request.lookback_days,
+                report_period=request.report_period,
+                progress_callback=progress_callback,
+            )
+            stats = PerformanceExpressDAO(load_settings().postgres).stats()
+            elapsed = time.perf_counter() - started
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = result.get("rows")
+            message_text = f"Synced {result.get('rows', 0)} performance express rows"
+            monitor.finish(
+                "performance_express",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message=message_text,
+                finished_at=stats.get("updated_at") if isinstance(stats, dict) else None,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "performance_express",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_performance_forecast_job(request: SyncPerformanceForecastRequest) -> None:
+    loop = asyncio.get_running_loop()
+
+    def progress_callback(progress: float, message: Optional[str], total_rows: Optional[int]) -> None:
+        monitor.update(
+            "performance_forecast",
+            progress=progress,
+            message=message,
+            total_rows=total_rows,
+        )
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update("performance_forecast", message="Collecting performance forecast data")
+        try:
+            result = sync_performance_forecast(
+                codes=request.codes,
+                lookback_days=request.lookback_days,
+                report_period=request.report_period,
+                progress_callback=progress_callback,
+            )
+            stats = PerformanceForecastDAO(load_settings().postgres).stats()
+            elapsed = time.perf_counter() - started
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = result.get("rows")
+            message_text = f"Synced {result.get('rows', 0)} performance forecast rows"
+            monitor.finish(
+                "performance_forecast",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message=message_text,
+                finished_at=stats.get("updated_at") if isinstance(stats, dict) else None,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "performance_forecast",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_profit_forecast_job(request: SyncProfitForecastRequest) -> None:
+    loop = asyncio.get_running_loop()
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update("profit_forecast", message="Collecting profit forecast data", progress=0.0)
+        try:
+            result = sync_profit_forecast(symbol=request.symbol)
+            stats = ProfitForecastDAO(load_settings().postgres).stats()
+            elapsed = time.perf_counter() - started
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = result.get("rows")
+            monitor.finish(
+                "profit_forecast",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message=f"Synced {result.get('rows', 0)} profit forecast rows",
+                finished_at=stats.get("updated_at") if isinstance(stats, dict) else None,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "profit_forecast",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_global_index_job(request: SyncGlobalIndexRequest) -> None:  # noqa: ARG001
+    loop = asyncio.get_running_loop()
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update("global_index", message="Syncing global index snapshot", progress=0.0)
+        try:
+            result = sync_global_indices()
+            stats = GlobalIndexHistoryDAO(load_settings().postgres).stats()
+            elapsed = time.perf_counter() - started
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = result.get("rows")
+            monitor.finish(
+                "global_index",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message=f"Synced {result.get('rows', 0)} global index rows",
+                finished_at=stats.get("updated_at") if isinstance(stats, dict) else None,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "global_index",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_realtime_index_job(request: SyncRealtimeIndexRequest) -> None:  # noqa: ARG001
+    loop = asyncio.get_running_loop()
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update("realtime_index", message="Syncing realtime China indices", progress=0.0)
+        try:
+            result = sync_realtime_indices()
+            stats = RealtimeIndexDAO(load_settings().postgres).stats()
+            elapsed = time.perf_counter() - started
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = result.get("rows")
+            monitor.finish(
+                "realtime_index",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message=f"Synced {result.get('rows', 0)} realtime index rows",
+                finished_at=stats.get("updated_at") if isinstance(stats, dict) else None,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "realtime_index",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_realtime_trade_job(request: IndicatorRealtimeRequest) -> None:
+    loop = asyncio.get_running_loop()
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update("realtime_trade", message="Syncing realtime trade data", progress=0.0)
+        try:
+            result = run_indicator_realtime_refresh(request.codes, sync_all=request.syncAll)
+            elapsed = time.perf_counter() - started
+            updated_at = result.get("updatedAt")
+            processed_rows = result.get("processed")
+            processed_total = int(processed_rows) if isinstance(processed_rows, (int, float)) else 0
+            monitor.finish(
+                "realtime_trade",
+                success=True,
+                total_rows=processed_total,
+                message=f"Processed {processed_total} realtime trade rows",
+                finished_at=updated_at if isinstance(updated_at, datetime) else None,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "realtime_trade",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_index_history_job(request: SyncIndexHistoryRequest) -> None:
+    loop = asyncio.get_running_loop()
+
+    def job() -> None:
+        normalized_codes: Optional[List[str]] = None
+        if request.index_codes:
+            filtered = []
+            for code in request.index_codes:
+                if not code:
+                    continue
+                normalized = str(code).strip().upper()
+                if normalized:
+                    filtered.append(normalized)
+            if filtered:
+                normalized_codes = filtered
+
+        display_codes = ", ".join(normalized_codes) if normalized_codes else "core indices"
+        monitor.update(
+            "index_history",
+            message=f"Syncing index history ({display_codes})",
+            progress=0.0,
+        )
+
+        started = time.perf_counter()
+        try:
+            result = sync_index_history(index_codes=normalized_codes)
+            stats: Dict[str, object] = {}
+            try:
+                stats = IndexHistoryDAO(load_settings().postgres).stats()
+            except Exception as stats_exc:  # pragma: no cover - defensive
+                logger.warning("Failed to collect index_history stats: %s", stats_exc)
+            elapsed = time.perf_counter() - started
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = result.get("rows")
+            finished_at = None
+            latest_date = stats.get("latest") if isinstance(stats, dict) else None
+            if isinstance(latest_date, date):
+                finished_at = datetime.combine(latest_date, datetime.min.time())
+            rows_synced = int(result.get("rows", 0) or 0)
+            monitor.finish(
+                "index_history",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message=f"Synced {rows_synced} index history rows",
+                finished_at=finished_at,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "index_history",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            logger.error("Index history sync failed: %s", exc)
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_dollar_index_job(request: SyncDollarIndexRequest) -> None:
+    loop = asyncio.get_running_loop()
+    symbol = request.symbol or "美元指数"
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update("dollar_index", message=f"Syncing {symbol} history", progress=0.0)
+        try:
+            result = sync_dollar_index(symbol=symbol)
+            stats = DollarIndexDAO(load_settings().postgres).stats()
+            elapsed = time.perf_counter() - started
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = result.get("rows")
+            monitor.finish(
+                "dollar_index",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message=f"Synced {result.get('rows', 0)} dollar index rows",
+                finished_at=stats.get("updated_at") if isinstance(stats, dict) else None,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "dollar_index",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_rmb_midpoint_job(request: SyncRmbMidpointRequest) -> None:  # noqa: ARG001
+    loop = asyncio.get_running_loop()
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update("rmb_midpoint", message="Syncing RMB midpoint rates", progress=0.0)
+        try:
+            result = sync_rmb_midpoint_rates()
+            stats = RmbMidpointDAO(load_settings().postgres).stats()
+            elapsed = time.perf_counter() - started
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = result.get("rows")
+            monitor.finish(
+                "rmb_midpoint",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message=f"Synced {result.get('rows', 0)} midpoint rows",
+                finished_at=stats.get("updated_at") if isinstance(stats, dict) else None,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "rmb_midpoint",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_macro_leverage_job(request: SyncMacroLeverageRequest) -> None:  # noqa: ARG001
+    loop = asyncio.get_running_loop()
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update("leverage_ratio", message="Syncing macro leverage ratios", progress=0.0)
+        try:
+            result = sync_macro_leverage_ratios()
+            stats = MacroLeverageDAO(load_settings().postgres).stats()
+            elapsed = time.perf_counter() - started
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = result.get("rows")
+            monitor.finish(
+                "leverage_ratio",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message=f"Synced {result.get('rows', 0)} macro leverage rows",
+                finished_at=stats.get("updated_at") if isinstance(stats, dict) else None,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "leverage_ratio",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_social_financing_job(request: SyncSocialFinancingRequest) -> None:  # noqa: ARG001
+    loop = asyncio.get_running_loop()
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update("social_financing", message="Syncing social financing data", progress=0.0)
+        try:
+            result = sync_social_financing_ratios()
+            stats = MacroSocialFinancingDAO(load_settings().postgres).stats()
+            elapsed = time.perf_counter() - started
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = result.get("rows")
+            monitor.finish(
+                "social_financing",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message=f"Synced {result.get('rows', 0)} social financing rows",
+                finished_at=stats.get("updated_at") if isinstance(stats, dict) else None,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "social_financing",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_macro_cpi_job(request: SyncMacroCpiRequest) -> None:  # noqa: ARG001
+    loop = asyncio.get_running_loop()
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update("cpi_monthly", message="Syncing CPI data", progress=0.0)
+        try:
+            result = sync_macro_cpi()
+            stats = MacroCpiDAO(load_settings().postgres).stats()
+            elapsed = time.perf_counter() - started
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = result.get("rows")
+            monitor.finish(
+                "cpi_monthly",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message=f"Synced {result.get('rows', 0)} CPI rows",
+                finished_at=stats.get("updated_at") if isinstance(stats, dict) else None,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "cpi_monthly",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_macro_pmi_job(request: SyncMacroPmiRequest) -> None:  # noqa: ARG001
+    loop = asyncio.get_running_loop()
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update("pmi_monthly", message="Syncing PMI data", progress=0.0)
+        try:
+            result = sync_macro_pmi()
+            stats = MacroPmiDAO(load_settings().postgres).stats()
+            elapsed = time.perf_counter() - started
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = result.get("rows")
+            monitor.finish(
+                "pmi_monthly",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message=f"Synced {result.get('rows', 0)} PMI rows",
+                finished_at=stats.get("updated_at") if isinstance(stats, dict) else None,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "pmi_monthly",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_macro_m2_job(request: SyncMacroM2Request) -> None:  # noqa: ARG001
+    loop = asyncio.get_running_loop()
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update("m2_monthly", message="Syncing M2 money supply", progress=0.0)
+        try:
+            result = sync_macro_m2()
+            stats = MacroM2DAO(load_settings().postgres).stats()
+            elapsed = time.perf_counter() - started
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = result.get("rows")
+            monitor.finish(
+                "m2_monthly",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message=f"Synced {result.get('rows', 0)} M2 rows",
+                finished_at=stats.get("updated_at") if isinstance(stats, dict) else None,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "m2_monthly",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_macro_ppi_job(request: SyncMacroPpiRequest) -> None:  # noqa: ARG001
+    loop = asyncio.get_running_loop()
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update("ppi_monthly", message="Syncing PPI data", progress=0.0)
+        try:
+            result = sync_macro_ppi()
+            stats = MacroPpiDAO(load_settings().postgres).stats()
+            elapsed = time.perf_counter() - started
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = result.get("rows")
+            monitor.finish(
+                "ppi_monthly",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message=f"Synced {result.get('rows', 0)} PPI rows",
+                finished_at=stats.get("updated_at") if isinstance(stats, dict) else None,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "ppi_monthly",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_macro_lpr_job(request: SyncMacroLprRequest) -> None:  # noqa: ARG001
+    loop = asyncio.get_running_loop()
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update("lpr_rate", message="Syncing LPR data", progress=0.0)
+        try:
+            result = sync_macro_lpr()
+            stats = MacroLprDAO(load_settings().postgres).stats()
+            elapsed = time.perf_counter() - started
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = result.get("rows")
+            monitor.finish(
+                "lpr_rate",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message=f"Synced {result.get('rows', 0)} LPR rows",
+                finished_at=stats.get("updated_at") if isinstance(stats, dict) else None,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "lpr_rate",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_macro_shibor_job(request: SyncMacroShiborRequest) -> None:  # noqa: ARG001
+    loop = asyncio.get_running_loop()
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update("shibor_rate", message="Syncing SHIBOR data", progress=0.0)
+        try:
+            result = sync_macro_shibor()
+            stats = MacroShiborDAO(load_settings().postgres).stats()
+            elapsed = time.perf_counter() - started
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = result.get("rows")
+            monitor.finish(
+                "shibor_rate",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message=f"Synced {result.get('rows', 0)} SHIBOR rows",
+                finished_at=stats.get("updated_at") if isinstance(stats, dict) else None,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "shibor_rate",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_futures_realtime_job(request: SyncFuturesRealtimeRequest) -> None:  # noqa: ARG001
+    loop = asyncio.get_running_loop()
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update("futures_realtime", message="Syncing futures realtime data", progress=0.0)
+        try:
+            result = sync_futures_realtime()
+            stats = FuturesRealtimeDAO(load_settings().postgres).stats()
+            elapsed = time.perf_counter() - started
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = result.get("rows")
+            monitor.finish(
+                "futures_realtime",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message=f"Synced {result.get('rows', 0)} futures rows",
+                finished_at=stats.get("updated_at") if isinstance(stats, dict) else None,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "futures_realtime",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_fed_statement_job(request: SyncFedStatementRequest) -> None:
+    loop = asyncio.get_running_loop()
+    limit = request.limit or 5
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update("fed_statements", message="Syncing Federal Reserve statements", progress=0.0)
+        try:
+            result = sync_fed_statements(limit=limit)
+            stats = FedStatementDAO(load_settings().postgres).stats()
+            elapsed = time.perf_counter() - started
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = result.get("rows")
+            monitor.finish(
+                "fed_statements",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message=f"Synced {result.get('rows', 0)} Fed statements",
+                finished_at=stats.get("updated_at") if isinstance(stats, dict) else None,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "fed_statements",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_peripheral_insight_job(request: SyncPeripheralInsightRequest) -> None:
+    loop = asyncio.get_running_loop()
+    run_llm = True if request.run_llm is None else bool(request.run_llm)
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update("peripheral_insight", message="Generating peripheral market insight", progress=0.0)
+        try:
+            result = generate_peripheral_insight(run_llm=run_llm)
+            stats = PeripheralInsightDAO(load_settings().postgres).stats()
+            elapsed = time.perf_counter() - started
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = 1
+            monitor.finish(
+                "peripheral_insight",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message="Peripheral insight snapshot generated",
+                finished_at=stats.get("updated_at") if isinstance(stats, dict) else None,
+                last_duration=elapsed,
+            )
+            logger.info(
+                "Peripheral insight reasoning completed in %.2fs (run_llm=%s)",
+                elapsed,
+                run_llm,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "peripheral_insight",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+@dataclass(frozen=True)
+class AggregateStep:
+    """One node of an aggregate job: a sub-job runner plus the steps it must wait for."""
+
+    job: str
+    message: str
+    runner: Callable[[Any], Awaitable[None]]
+    request: BaseModel
+    source: str = "akshare"
+    after: Tuple[str, ...] = ()
+
+
+# Upstream source -> maximum number of aggregate steps hitting it at once.
+AGGREGATE_SOURCE_LIMITS: Dict[str, int] = {
+    "akshare": 4,
+    "tushare": 2,
+    "yahoo": 1,
+    "fed": 1,
+    "llm": 1,
+}
+DEFAULT_AGGREGATE_SOURCE_LIMIT = 2
+
+
+async def _run_aggregate_steps(aggregate: str, steps: Sequence[AggregateStep]) -> Dict[str, Optional[str]]:
+    """Run ``steps`` as a dependency graph and return ``job -> error`` (``None`` on success).
+
+    A step starts as soon as every step in ``after`` succeeded and a slot for its source
+    is free; a step whose dependency failed is skipped. Failures stay local to their step
+    and each step's duration is reported on the aggregate's monitor entry.
+    """
+    known = set()
+    for step in steps:
+        missing = [dependency for dependency in step.after if dependency not in known]
+        if missing:
+            raise ValueError(f"Aggregate step {step.job} depends on undeclared steps {missing}")
+        known.add(step.job)
+
+    limits = {
+        source: asyncio.Semaphore(AGGREGATE_SOURCE_LIMITS.get(source, DEFAULT_AGGREGATE_SOURCE_LIMIT))
+        for source in {step.source for step in steps}
+    }
+    total_steps = len(steps)
+    tasks: Dict[str, asyncio.Task] = {}
+    errors: Dict[str, Optional[str]] = {}
+    completed: List[str] = []
+
+    def record(step: AggregateStep, error: Optional[str], duration: Optional[float]) -> None:
+        errors[step.job] = error
+        completed.append(step.job)
+        if error is None:
+            outcome = f"{step.job} finished in {duration or 0.0:.1f}s"
+        else:
+            outcome = f"{step.job} failed: {error}"
+        monitor.update(aggregate, progress=len(completed) / total_steps, message=outcome)
+
+    async def run_step(step: AggregateStep) -> None:
+        for dependency in step.after:
+            await tasks[dependency]
+        failed = [dependency for dependency in step.after if errors.get(dependency) is not None]
+        if failed:
+            reason = f"skipped: {', '.join(failed)} failed"
+            monitor.finish(
+                step.job,
+                success=False,
+                message="Skipped by aggregate",
+                error=reason,
+                last_duration=0.0,
+            )
+            record(step, reason, None)
+            return
+        async with limits[step.source]:
+            monitor.start(step.job, message=step.message)
+            monitor.update(step.job, progress=0.0)
+            started = time.perf_counter()
+            try:
+                await step.runner(step.request)
+            except Exception as exc:  # noqa: BLE001 - isolated per step; the runner recorded it
+                logger.warning("%s step %s failed: %s", aggregate, step.job, exc)
+                record(step, str(exc) or type(exc).__name__, time.perf_counter() - started)
+            else:
+                record(step, None, time.perf_counter() - started)
+
+    for step in steps:
+        tasks[step.job] = asyncio.create_task(run_step(step))
+    await asyncio.gather(*tasks.values())
+    return errors
+
+
+async def _run_aggregate_job(
+    aggregate: str,
+    label: str,
+    steps: Sequence[AggregateStep],
+) -> None:
+    started = time.perf_counter()
+    monitor.update(aggregate, progress=0.0, message=f"Running {len(steps)} {label} steps")
+    try:
+        errors = await _run_aggregate_steps(aggregate, steps)
+    except Exception as exc:  # pragma: no cover - defensive
+        monitor.finish(aggregate, success=False, error=str(exc), last_duration=time.perf_counter() - started)
+        raise
+
+    elapsed = time.perf_counter() - started
+    failures = {job: error for job, error in errors.items() if error is not None}
+    succeeded = len(errors) - len(failures)
+    if not failures:
+        monitor.finish(
+            aggregate,
+            success=True,
+            total_rows=succeeded,
+            message=f"{label.capitalize()} aggregate sync completed in {elapsed:.1f}s",
+            last_duration=elapsed,
+        )
+        return
+    monitor.finish(
+        aggregate,
+        success=False,
+        total_rows=succeeded or None,
+        message=f"{len(failures)} of {len(errors)} {label} steps failed",
+        error="; ".join(f"{job}: {error}" for job, error in failures.items()),
+        last_duration=elapsed,
+    )
+
+
+async def _run_macro_aggregate_job(request: SyncMacroAggregateRequest) -> None:  # noqa: ARG001
+    sync_steps = [
+        AggregateStep(
+            "leverage_ratio",
+            "Syncing macro leverage ratios",
+            _run_macro_leverage_job,
+            SyncMacroLeverageRequest(),
+        ),
+        AggregateStep(
+            "social_financing",
+            "Syncing social financing data",
+            _run_social_financing_job,
+            SyncSocialFinancingRequest(),
+        ),
+        AggregateStep(
+            "cpi_monthly",
+            "Syncing CPI data",
+            _run_macro_cpi_job,
+            SyncMacroCpiRequest(),
+            source="tushare",
+        ),
+        AggregateStep("ppi_monthly", "Syncing PPI data", _run_macro_ppi_job, SyncMacroPpiRequest()),
+        AggregateStep(
+            "pmi_monthly",
+            "Syncing PMI data",
+            _run_macro_pmi_job,
+            SyncMacroPmiRequest(),
+            source="tushare",
+        ),
+        AggregateStep(
+            "m2_monthly",
+            "Syncing M2 money supply",
+            _run_macro_m2_job,
+            SyncMacroM2Request(),
+            source="tushare",
+        ),
+        AggregateStep(
+            "lpr_rate",
+            "Syncing LPR data",
+            _run_macro_lpr_job,
+            SyncMacroLprRequest(),
+            source="tushare",
+        ),
+        AggregateStep(
+            "shibor_rate",
+            "Syncing SHIBOR data",
+            _run_macro_shibor_job,
+            SyncMacroShiborRequest(),
+            source="tushare",
+        ),
+    ]
+    insight_step = AggregateStep(
+        "macro_insight",
+        "Generating macro insight summary",
+        _run_macro_insight_job,
+        SyncMacroInsightRequest(),
+        source="llm",
+        after=tuple(step.job for step in sync_steps),
+    )
+    await _run_aggregate_job("macro_aggregate", "macro", [*sync_steps, insight_step])
+
+
+async def _run_peripheral_aggregate_job(request: SyncPeripheralAggregateRequest) -> None:
+    sync_steps = [
+        AggregateStep(
+            "global_index",
+            "Syncing global index snapshot",
+            _run_global_index_job,
+            SyncGlobalIndexRequest(),
+            source="yahoo",
+        ),
+        AggregateStep(
+            "dollar_index",
+            "Syncing dollar index history",
+            _run_dollar_index_job,
+            SyncDollarIndexRequest(),
+        ),
+        AggregateStep(
+            "rmb_midpoint",
+            "Syncing RMB midpoint rates",
+            _run_rmb_midpoint_job,
+            SyncRmbMidpointRequest(),
+        ),
+        AggregateStep(
+            "futures_realtime",
+            "Syncing futures realtime data",
+            _run_futures_realtime_job,
+            SyncFuturesRealtimeRequest(),
+        ),
+        AggregateStep(
+            "fed_statements",
+            "Syncing Federal Reserve statements",
+            _run_fed_statement_job,
+            SyncFedStatementRequest(limit=request.fed_limit),
+            source="fed",
+        ),
+    ]
+    insight_step = AggregateStep(
+        "peripheral_insight",
+        "Generating peripheral market insight",
+        _run_peripheral_insight_job,
+        SyncPeripheralInsightRequest(run_llm=request.run_llm),
+        source="llm",
+        after=tuple(step.job for step in sync_steps),
+    )
+    await _run_aggregate_job("peripheral_aggregate", "peripheral", [*sync_steps, insight_step])
+
+
+async def _run_fund_flow_aggregate_job(request: SyncFundFlowAggregateRequest) -> None:  # noqa: ARG001
+    steps = [
+        AggregateStep(
+            "industry_fund_flow",
+            "Syncing industry fund flow data",
+            _run_industry_fund_flow_job,
+            SyncIndustryFundFlowRequest(),
+        ),
+        AggregateStep(
+            "concept_fund_flow",
+            "Syncing concept fund flow data",
+            _run_concept_fund_flow_job,
+            SyncConceptFundFlowRequest(),
+        ),
+        AggregateStep(
+            "individual_fund_flow",
+            "Syncing individual fund flow data",
+            _run_individual_fund_flow_job,
+            SyncIndividualFundFlowRequest(),
+        ),
+        AggregateStep(
+            "margin_account",
+            "Syncing margin account statistics",
+            _run_margin_account_job,
+            SyncMarginAccountRequest(),
+        ),
+        AggregateStep(
+            "market_fund_flow",
+            "Syncing market fund flow history",
+            _run_market_fund_flow_job,
+            SyncMarketFundFlowRequest(),
+        ),
+        AggregateStep(
+            "big_deal_fund_flow",
+            "Syncing big deal fund flow data",
+            _run_big_deal_fund_flow_job,
+            SyncBigDealFundFlowRequest(),
+        ),
+    ]
+    await _run_aggregate_job("fund_flow_aggregate", "fund flow", steps)
+
+
+async def _run_industry_fund_flow_job(request: SyncIndustryFundFlowRequest) -> None:
+    loop = asyncio.get_running_loop()
+
+    def progress_callback(progress: float, message: Optional[str], total_rows: Optional[int]) -> None:
+        monitor.update(
+            "industry_fund_flow",
+            progress=progress,
+            message=message,
+            total_rows=total_rows,
+        )
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update("industry_fund_flow", message="Collecting industry fund flow data")
+        try:
+            result = sync_industry_fund_flow(
+                symbols=request.symbols,
+                progress_callback=progress_callback,
+            )
+            stats = IndustryFundFlowDAO(load_settings().postgres).stats()
+            elapsed = time.perf_counter() - started
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = result.get("rows")
+            message_text = f"Synced {result.get('rows', 0)} industry fund flow rows"
+            monitor.finish(
+                "industry_fund_flow",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message=message_text,
+                finished_at=stats.get("updated_at") if isinstance(stats, dict) else None,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "industry_fund_flow",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_concept_fund_flow_job(request: SyncConceptFundFlowRequest) -> None:
+    loop = asyncio.get_running_loop()
+
+    def progress_callback(progress: float, message: Optional[str], total_rows: Optional[int]) -> None:
+        monitor.update(
+            "concept_fund_flow",
+            progress=progress,
+            message=message,
+            total_rows=total_rows,
+        )
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update("concept_fund_flow", message="Collecting concept fund flow data")
+        try:
+            result = sync_concept_fund_flow(
+                symbols=request.symbols,
+                progress_callback=progress_callback,
+            )
+            stats = ConceptFundFlowDAO(load_settings().postgres).stats()
+            elapsed = time.perf_counter() - started
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = result.get("rows")
+            message_text = f"Synced {result.get('rows', 0)} concept fund flow rows"
+            monitor.finish(
+                "concept_fund_flow",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message=message_text,
+                finished_at=stats.get("updated_at") if isinstance(stats, dict) else None,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "concept_fund_flow",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_concept_index_history_job(request: SyncConceptIndexHistoryRequest) -> None:
+    loop = asyncio.get_running_loop()
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update(
+            "concept_index_history",
+            message="Syncing concept index history",
+            progress=0.0,
+        )
+        try:
+            result = sync_concept_index_history(
+                request.concepts,
+                start_date=request.start_date,
+                end_date=request.end_date,
+            )
+            stats = ConceptIndexHistoryDAO(load_settings().postgres).stats()
+            elapsed = time.perf_counter() - started
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = result.get("totalRows")
+            message_text = (
+                f"Synced {result.get('totalRows', 0)} concept index rows across {len(result.get('concepts', []))} concepts"
+            )
+            monitor.finish(
+                "concept_index_history",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message=message_text,
+                finished_at=stats.get("updated_at") if isinstance(stats, dict) else None,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "concept_index_history",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_concept_constituents_job(request: SyncConceptConstituentsRequest) -> None:
+    loop = asyncio.get_running_loop()
+
+    def progress_callback(progress: float, message: Optional[str], total_rows: Optional[int]) -> None:
+        monitor.update(
+            "concept_constituents",
+            progress=progress,
+            message=message,
+            total_rows=total_rows,
+        )
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update("concept_constituents", message="Refreshing concept constituents", progress=0.0)
+        try:
+            result = sync_concept_constituents(
+                request.concepts,
+                force=request.force,
+                max_pages=request.max_pages,
+                progress_callback=progress_callback,
+            )
+            elapsed = time.perf_counter() - started
+            message_text = (
+                f"Refreshed {result['refreshed']} of {result['concepts']} concepts "
+                f"({result['skipped']} still fresh, {len(result['errors'])} failed)"
+            )
+            monitor.finish(
+                "concept_constituents",
+                success=True,
+                total_rows=result["rows"],
+                message=message_text,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "concept_constituents",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_sector_volume_price_job(request: SyncSectorVolumePriceRequest) -> None:
+    loop = asyncio.get_running_loop()
+    kinds = ["concept", "industry"] if request.kind == "all" else [request.kind]
+
+    def job() -> None:
+        started = time.perf_counter()
+        generated = 0
+        errors: List[str] = []
+        try:
+            for position, kind in enumerate(kinds):
+
+                def progress_callback(
+                    progress: float,
+                    message: Optional[str],
+                    total_rows: Optional[int],
+                    *,
+                    offset: int = position,
+                ) -> None:
+                    monitor.update(
+                        "sector_volume_price",
+                        progress=(offset + progress) / len(kinds),
+                        message=message,
+                        total_rows=generated + (total_rows or 0),
+                    )
+
+                result = generate_sector_volume_price_batch(
+                    kind,
+                    request.sectors,
+                    lookback_days=request.lookback_days,
+                    run_llm=request.run_llm,
+                    progress_callback=progress_callback,
+                )
+                generated += len(result["generated"])
+                errors.extend(f"{kind} {item['sector']}: {item['error']}" for item in result["errors"])
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "sector_volume_price",
+                success=True,
+                total_rows=generated,
+                message=f"Generated {generated} sector volume/price analyses ({len(errors)} failed)",
+                error="; ".join(errors[:5]) or None,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "sector_volume_price",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_stock_analysis_job(request: SyncStockAnalysisRequest) -> None:
+    loop = asyncio.get_running_loop()
+
+    def progress_callback(progress: float, message: Optional[str], total_rows: Optional[int]) -> None:
+        monitor.update(
+            "stock_analysis",
+            progress=progress,
+            message=message,
+            total_rows=total_rows,
+        )
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update("stock_analysis", message="Generating stock analyses", progress=0.0)
+        try:
+            result = generate_stock_analysis_batch(
+                request.codes,
+                analyses=request.analyses,
+                force=request.force,
+                run_llm=request.run_llm,
+                progress_callback=progress_callback,
+            )
+            elapsed = time.perf_counter() - started
+            errors = [f"{item['code']} {item['analysis']}: {item['error']}" for item in result["errors"]]
+            monitor.finish(
+                "stock_analysis",
+                success=True,
+                total_rows=len(result["generated"]),
+                message=(
+                    f"Generated {len(result['generated'])} analyses for {result['stocks']} stocks "
+                    f"({result['skipped']} unchanged, {len(errors)} failed)"
+                ),
+                error="; ".join(errors[:5]) or None,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "stock_analysis",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_individual_fund_flow_job(request: SyncIndividualFundFlowRequest) -> None:
+    loop = asyncio.get_running_loop()
+
+    def progress_callback(progress: float, message: Optional[str], total_rows: Optional[int]) -> None:
+        monitor.update(
+            "individual_fund_flow",
+            progress=progress,
+            message=message,
+            total_rows=total_rows,
+        )
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update("individual_fund_flow", message="Collecting individual fund flow data")
+        try:
+            result = sync_individual_fund_flow(
+                symbols=request.symbols,
+                progress_callback=progress_callback,
+            )
+            stats = IndividualFundFlowDAO(load_settings().postgres).stats()
+            elapsed = time.perf_counter() - started
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = result.get("rows")
+            message_text = f"Synced {result.get('rows', 0)} individual fund flow rows"
+            monitor.finish(
+                "individual_fund_flow",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message=message_text,
+                finished_at=stats.get("updated_at") if isinstance(stats, dict) else None,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "individual_fund_flow",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_big_deal_fund_flow_job(request: SyncBigDealFundFlowRequest) -> None:
+    loop = asyncio.get_running_loop()
+
+    def progress_callback(progress: float, message: Optional[str], total_rows: Optional[int]) -> None:
+        monitor.update(
+            "big_deal_fund_flow",
+            progress=progress,
+            message=message,
+            total_rows=total_rows,
+        )
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update("big_deal_fund_flow", message="Collecting big deal fund flow data")
+        try:
+            result = sync_big_deal_fund_flow(
+                retention_days=load_runtime_config().big_deal_retention_days,
+                progress_callback=progress_callback,
+            )
+            indicator_rows: Optional[int] = None
+            try:
+                indicator_result = sync_indicator_screening(indicator_code=BIG_DEAL_INDICATOR_CODE)
+                if isinstance(indicator_result, dict):
+                    indicator_rows = indicator_result.get("rows")
+                logger.info(
+                    "Indicator %s snapshot refreshed after big_deal_fund_flow sync (rows=%s)",
+                    BIG_DEAL_INDICATOR_CODE,
+                    indicator_rows,
+                )
+            except Exception as indicator_exc:  # pragma: no cover - defensive
+                logger.warning(
+                    "Failed to refresh %s indicator snapshot: %s",
+                    BIG_DEAL_INDICATOR_CODE,
+                    indicator_exc,
+                )
+            stats = BigDealFundFlowDAO(load_settings().postgres).stats()
+            elapsed = time.perf_counter() - started
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = result.get("rows")
+            message_text = f"Synced {result.get('rows', 0)} big deal rows"
+            monitor.finish(
+                "big_deal_fund_flow",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message=message_text,
+                finished_at=stats.get("updated_at") if isinstance(stats, dict) else None,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "big_deal_fund_flow",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_margin_account_job(request: SyncMarginAccountRequest) -> None:
+    loop = asyncio.get_running_loop()
+
+    def progress_callback(progress: float, message: Optional[str], total_rows: Optional[int]) -> None:
+        monitor.update(
+            "margin_account",
+            progress=progress,
+            message=message,
+            total_rows=total_rows,
+        )
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update("margin_account", message="Collecting margin account statistics")
+        try:
+            result = sync_margin_account_info(progress_callback=progress_callback)
+            stats = MarginAccountDAO(load_settings().postgres).stats()
+            elapsed = time.perf_counter() - started
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = result.get("rows")
+            message_text = f"Synced {result.get('rows', 0)} margin account rows"
+            monitor.finish(
+                "margin_account",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message=message_text,
+                finished_at=stats.get("updated_at") if isinstance(stats, dict) else None,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "margin_account",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_market_activity_job(request: SyncMarketActivityRequest) -> None:
+    loop = asyncio.get_running_loop()
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update("market_activity", message="Collecting market activity snapshot")
+        try:
+            result = sync_market_activity()
+            dao_result = MarketActivityDAO(load_settings().postgres).list_entries()
+            elapsed = time.perf_counter() - started
+            items = dao_result.get("items", [])
+            message_text = f"Synced {result.get('rows', 0)} market activity rows"
+            monitor.finish(
+                "market_activity",
+                success=True,
+                total_rows=len(items),
+                message=message_text,
+                finished_at=dao_result.get("dataset_timestamp"),
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "market_activity",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_market_fund_flow_job(request: SyncMarketFundFlowRequest) -> None:
+    loop = asyncio.get_running_loop()
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update("market_fund_flow", message="Collecting market fund flow history")
+        try:
+            result = sync_market_fund_flow()
+            dao = MarketFundFlowDAO(load_settings().postgres)
+            stats = dao.stats()
+            elapsed = time.perf_counter() - started
+            total_rows = None
+            finished_at = None
+            if isinstance(stats, dict):
+                total_rows = stats.get("count")
+                finished_at = stats.get("updated_at")
+            if total_rows is None:
+                total_rows = result.get("rows")
+            monitor.finish(
+                "market_fund_flow",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message=f"Synced {result.get('rows', 0)} market fund flow rows",
+                finished_at=finished_at,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "market_fund_flow",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_macro_insight_job(request: SyncMacroInsightRequest) -> None:
+    loop = asyncio.get_running_loop()
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update("macro_insight", message="Generating macro insight summary")
+        try:
+            result = generate_macro_insight(run_llm=request.run_llm)
+            stats = MacroInsightDAO(load_settings().postgres).stats()
+            elapsed = time.perf_counter() - started
+            finished_at = result.get("generated_at")
+            message_text = "Macro insight generated"
+            monitor.finish(
+                "macro_insight",
+                success=True,
+                total_rows=1,
+                message=message_text,
+                finished_at=finished_at,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "macro_insight",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_concept_insight_job(request: SyncConceptInsightRequest) -> None:
+    loop = asyncio.get_running_loop()
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update(
+            "concept_insight",
+            message="Generating concept insight summary",
+            progress=0.0,
+        )
+        try:
+            result = generate_concept_insight_summary(
+                lookback_hours=request.lookback_hours,
+                concept_limit=request.concept_limit,
+                run_llm=request.run_llm,
+                refresh_index_history=request.refresh_index_history,
+            )
+            stats = ConceptInsightDAO(load_settings().postgres).stats()
+            elapsed = time.perf_counter() - started
+            message_text = "Concept insight generated"
+            monitor.finish(
+                "concept_insight",
+                success=True,
+                total_rows=1,
+                message=message_text,
+                finished_at=result.get("generated_at"),
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "concept_insight",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_industry_insight_job(request: SyncIndustryInsightRequest) -> None:
+    loop = asyncio.get_running_loop()
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update(
+            "industry_insight",
+            message="Generating industry insight summary",
+            progress=0.0,
+        )
+        try:
+            result = generate_industry_insight_summary(
+                lookback_hours=request.lookback_hours,
+                industry_limit=request.industry_limit,
+                run_llm=request.run_llm,
+            )
+            stats = IndustryInsightDAO(load_settings().postgres).stats()
+            elapsed = time.perf_counter() - started
+            message_text = "Industry insight generated"
+            monitor.finish(
+                "industry_insight",
+                success=True,
+                total_rows=1,
+                message=message_text,
+                finished_at=result.get("generated_at"),
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "industry_insight",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_stock_main_business_job(request: SyncStockMainBusinessRequest) -> None:
+    loop = asyncio.get_running_loop()
+
+    def progress_callback(progress: float, message: Optional[str], total_rows: Optional[int]) -> None:
+        monitor.update(
+            "stock_main_business",
+            progress=progress,
+            message=message,
+            total_rows=total_rows,
+        )
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update("stock_main_business", message="Collecting stock main business data")
+        try:
+            result = sync_stock_main_business(
+                codes=request.codes,
+                include_list_statuses=request.include_list_statuses,
+                progress_callback=progress_callback,
+            )
+            stats = StockMainBusinessDAO(load_settings().postgres).stats()
+            elapsed = time.perf_counter() - started
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = result.get("rows")
+            rows_synced = int(result.get("rows", 0) or 0)
+            new_codes = int(result.get("codeCount", 0) or 0)
+            skipped_codes = int(result.get("skippedCount", 0) or 0)
+            message_text = (
+                f"Synced {rows_synced} main business rows "
+                f"(new {new_codes}, skipped {skipped_codes})"
+            )
+            monitor.finish(
+                "stock_main_business",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message=message_text,
+                finished_at=stats.get("updated_at") if isinstance(stats, dict) else None,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "stock_main_business",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+async def _run_stock_main_composition_job(request: SyncStockMainCompositionRequest) -> None:
+    loop = asyncio.get_running_loop()
+
+    def progress_callback(progress: float, message: Optional[str], total_rows: Optional[int]) -> None:
+        monitor.update(
+            "stock_main_composition",
+            progress=progress,
+            message=message,
+            total_rows=total_rows,
+        )
+
+    def job() -> None:
+        started = time.perf_counter()
+        monitor.update("stock_main_composition", message="Collecting stock main composition data")
+        try:
+            result = sync_stock_main_composition(
+                codes=request.codes,
+                include_list_statuses=request.include_list_statuses,
+                progress_callback=progress_callback,
+            )
+            stats = StockMainCompositionDAO(load_settings().postgres).stats()
+            elapsed = time.perf_counter() - started
+            total_rows = stats.get("count") if isinstance(stats, dict) else None
+            if total_rows is None:
+                total_rows = result.get("rows")
+            rows_synced = int(result.get("rows", 0) or 0)
+            new_codes = int(result.get("codeCount", 0) or 0)
+            skipped_symbols = int(result.get("skippedSymbols", 0) or 0)
+            message_text = (
+                f"Synced {rows_synced} main composition rows "
+                f"(new {new_codes}, skipped {skipped_symbols})"
+            )
+            monitor.finish(
+                "stock_main_composition",
+                success=True,
+                total_rows=int(total_rows) if total_rows is not None else None,
+                message=message_text,
+                finished_at=stats.get("updated_at") if isinstance(stats, dict) else None,
+                last_duration=elapsed,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            elapsed = time.perf_counter() - started
+            monitor.finish(
+                "stock_main_composition",
+                success=False,
+                error=str(exc),
+                last_duration=elapsed,
+            )
+            raise
+
+    await loop.run_in_executor(None, job)
+
+
+
+def _job_running(job: str) -> bool:
+    snapshot = monitor.snapshot()
+    job_state = snapshot.get(job)
+    if not job_state:
+        return False
+    if job_state.get("status") != "running":
+        return False
+
+    started_at_raw = job_state.get("startedAt")
+    started_at: Optional[datetime]
+    if started_at_raw:
+        try:
+            started_at = datetime.fromisoformat(str(started_at_raw))
+        except ValueError:
+            started_at = None
+    else:
+        started_at = None
+
+    if started_at:
+        elapsed = (datetime.now(LOCAL_TZ).replace(tzinfo=None) - started_at).total_seconds()
+        if elapsed > 300:  # auto-reset after 5 minutes
+            logger.warning("Job %s marked stale after %.0f seconds; resetting status", job, elapsed)
+            _clear_job_token(job)
+            monitor.finish(
+                job,
+                success=False,
+                message="Job reset due to inactivity",
+                error="stale job auto-reset",
+                last_duration=elapsed,
+            )
+            return False
+    else:
+        logger.warning("Job %s marked stale (missing start timestamp); resetting status", job)
+        _clear_job_token(job)
+        monitor.finish(
+            job,
+            success=False,
+            message="Job reset due to invalid state",
+            error="stale job auto-reset",
+            last_duration=0.0,
+        )
+        return False
+
+    return True
+
+
+@queueable("concept_directory")
+async def start_concept_directory_job() -> None:
+    if _job_running("concept_directory"):
+        raise HTTPException(status_code=409, detail="Concept directory sync already running")
+    monitor.start("concept_directory", message="Syncing concept directory")
+    monitor.update("concept_directory", progress=0.0)
+    asyncio.create_task(_run_concept_directory_job())
+
+
+@queueable("stock_basic")
+async def start_stock_basic_job(payload: SyncStockBasicRequest) -> None:
+    if _job_running("stock_basic"):
+        raise HTTPException(status_code=409, detail="Stock basic sync already running")
+    monitor.start("stock_basic", message="Syncing stock basics")
+    monitor.update("stock_basic", progress=0.0)
+    asyncio.create_task(_run_stock_basic_job(payload.list_statuses, payload.market))
+
+
+@queueable("daily_trade")
+async def start_daily_trade_job(payload: SyncDailyTradeRequest) -> None:
+    if _job_running("daily_trade"):
+        raise HTTPException(status_code=409, detail="Daily trade sync already running")
+    monitor.start("daily_trade", message="Syncing daily trade data")
+    monitor.update("daily_trade", progress=0.0)
+    asyncio.create_task(_run_daily_trade_job(payload))
+
+
+@queueable("daily_trade_metrics")
+async def start_daily_trade_metrics_job(payload: SyncDailyTradeMetricsRequest) -> None:
+    if _job_running("daily_trade_metrics"):
+        raise HTTPException(status_code=409, detail="Daily trade metrics sync already running")
+    monitor.start("daily_trade_metrics", message="Generating daily trade derived metrics")
+    monitor.update("daily_trade_metrics", progress=0.0)
+    asyncio.create_task(_run_daily_trade_metrics_job(payload))
+
+
+@queueable("daily_indicator")
+async def start_daily_indicator_job(payload: SyncDailyIndicatorRequest) -> None:
+    if _job_running("daily_indicator"):
+        raise HTTPException(status_code=409, detail="Daily indicator sync already running")
+    monitor.start("daily_indicator", message="Syncing daily indicator data")
+    monitor.update("daily_indicator", progress=0.0)
+    asyncio.create_task(_run_daily_indicator_job(payload))
+
+
+@queueable("income_statement")
+async def start_income_statement_job(payload: SyncIncomeStatementRequest) -> None:
+    if _job_running("income_statement"):
+        raise HTTPException(status_code=409, detail="Income statement sync already running")
+    monitor.start("income_statement", message="Syncing income statements")
+    monitor.update("income_statement", progress=0.0)
+    asyncio.create_task(_run_income_statement_job(payload))
+
+
+@queueable("cashflow_statements")
+async def start_cashflow_statement_job(payload: SyncCashflowRequest) -> None:
+    if _job_running("cashflow_statements"):
+        return
+    monitor.start("cashflow_statements", message="Syncing cash flow statements")
+    monitor.update("cashflow_statements", progress=0.0)
+    asyncio.create_task(_run_cashflow_statement_job(payload))
+
+
+@queueable("balance_sheet_statements")
+async def start_balance_sheet_job(payload: SyncBalanceSheetRequest) -> None:
+    if _job_running("balance_sheet_statements"):
+        return
+    monitor.start("balance_sheet_statements", message="Syncing balance sheets")
+    monitor.update("balance_sheet_statements", progress=0.0)
+    asyncio.create_task(_run_balance_sheet_job(payload))
+
+
+@queueable("financial_indicator")
+async def start_financial_indicator_job(payload: SyncFinancialIndicatorRequest) -> None:
+    if _job_running("financial_indicator"):
+        raise HTTPException(status_code=409, detail="Financial indicator sync already running")
+    monitor.start("financial_indicator", message="Syncing financial indicators")
+    monitor.update("financial_indicator", progress=0.0)
+    asyncio.create_task(_run_financial_indicator_job(payload))
+
+
+@queueable("fundamental_metrics")
+async def start_fundamental_metrics_job(payload: SyncFundamentalMetricsRequest) -> None:
+    if _job_running("fundamental_metrics"):
+        raise HTTPException(status_code=409, detail="Fundamental metrics sync already running")
+    monitor.start("fundamental_metrics", message="Syncing fundamental metrics")
+    monitor.update("fundamental_metrics", progress=0.0)
+    asyncio.create_task(_run_fundamental_metrics_job(payload))
+
+
+
+
+@queueable("performance_express")
+async def start_performance_express_job(payload: SyncPerformanceExpressRequest) -> None:
+    if _job_running("performance_express"):
+        raise HTTPException(status_code=409, detail="Performance express sync already running")
+    monitor.start("performance_express", message="Syncing performance express data")
+    monitor.update("performance_express", progress=0.0)
+    asyncio.create_task(_run_performance_express_job(payload))
+
+
+@queueable("performance_forecast")
+async def start_performance_forecast_job(payload: SyncPerformanceForecastRequest) -> None:
+    if _job_running("performance_forecast"):
+        raise HTTPException(status_code=409, detail="Performance forecast sync already running")
+    monitor.start("performance_forecast", message="Syncing performance forecast data")
+    monitor.update("performance_forecast", progress=0.0)
+    asyncio.create_task(_run_performance_forecast_job(payload))
+
+
+@queueable("profit_forecast")
+async def start_profit_forecast_job(payload: SyncProfitForecastRequest) -> None:
+    if _job_running("profit_forecast"):
+        raise HTTPException(status_code=409, detail="Profit forecast sync already running")
+    monitor.start("profit_forecast", message="Syncing profit forecast data")
+    monitor.update("profit_forecast", progress=0.0)
+    asyncio.create_task(_run_profit_forecast_job(payload))
+
+
+@queueable("market_insight")
+async def start_market_insight_job(payload: SyncMarketInsightRequest) -> None:
+    if _job_running("market_insight"):
+        raise HTTPException(status_code=409, detail="Market insight job already running")
+    monitor.start("market_insight", message="Generating market insight summary")
+    monitor.update("market_insight", progress=0.0)
+    run_token = _assign_job_token("market_insight")
+    asyncio.create_task(_run_market_insight_job(payload, run_token))
+
+
+@queueable("sector_insight")
+async def start_sector_insight_job(payload: SyncSectorInsightRequest) -> None:
+    if _job_running("sector_insight"):
+        raise HTTPException(status_code=409, detail="Sector insight job already running")
+    monitor.start("sector_insight", message="Generating sector insight summary")
+    monitor.update("sector_insight", progress=0.0)
+    asyncio.create_task(_run_sector_insight_job(payload))
+
+
+@queueable("global_index")
+async def start_global_index_job(payload: SyncGlobalIndexRequest) -> None:  # noqa: ARG001
+    if _job_running("global_index"):
+        raise HTTPException(status_code=409, detail="Global index sync already running")
+    monitor.start("global_index", message="Syncing global index snapshot")
+    monitor.update("global_index", progress=0.0)
+    asyncio.create_task(_run_global_index_job(payload))
+
+
+@queueable("realtime_index")
+async def start_realtime_index_job(payload: SyncRealtimeIndexRequest) -> None:  # noqa: ARG001
+    if _job_running("realtime_index"):
+        raise HTTPException(status_code=409, detail="Realtime index sync already running")
+    monitor.start("realtime_index", message="Syncing realtime China indices")
+    monitor.update("realtime_index", progress=0.0)
+    asyncio.create_task(_run_realtime_index_job(payload))
+
+
+@queueable("realtime_trade")
+async def start_realtime_trade_job(payload: IndicatorRealtimeRequest) -> None:
+    if _job_running("realtime_trade"):
+        raise HTTPException(status_code=409, detail="Realtime trade sync already running")
+    monitor.start("realtime_trade", message="Syncing realtime trade data")
+    monitor.update("realtime_trade", progress=0.0)
+    asyncio.create_task(_run_realtime_trade_job(payload))
+
+
+@queueable("index_history")
+async def start_index_history_job(payload: SyncIndexHistoryRequest) -> None:
+    if _job_running("index_history"):
+        raise HTTPException(status_code=409, detail="Index history sync already running")
+
+    normalized_codes: Optional[List[str]] = None
+    if payload.index_codes:
+        filtered = []
+        for code in payload.index_codes:
+            if not code:
+                continue
+            normalized = str(code).strip().upper()
+            if normalized:
+                filtered.append(normalized)
+        if filtered:
+            normalized_codes = filtered
+
+    request = payload
+    if normalized_codes is not None:
+        request = payload.copy(update={"index_codes": normalized_codes})
+
+    if normalized_codes:
+        monitor.start(
+            "index_history",
+            message=f"Syncing index history ({', '.join(normalized_codes)})",
+        )
+    else:
+        monitor.start("index_history", message="Syncing index history (core indices)")
+    monitor.update("index_history", progress=0.0)
+    asyncio.create_task(_run_index_history_job(request))
+
+
+@queueable("dollar_index")
+async def start_dollar_index_job(payload: SyncDollarIndexRequest) -> None:
+    if _job_running("dollar_index"):
+        raise HTTPException(status_code=409, detail="Dollar index sync already running")
+    monitor.start("dollar_index", message="Syncing dollar index history")
+    monitor.update("dollar_index", progress=0.0)
+    asyncio.create_task(_run_dollar_index_job(payload))
+
+
+@queueable("rmb_midpoint")
+async def start_rmb_midpoint_job(payload: SyncRmbMidpointRequest) -> None:
+    if _job_running("rmb_midpoint"):
+        raise HTTPException(status_code=409, detail="RMB midpoint sync already running")
+    monitor.start("rmb_midpoint", message="Syncing RMB midpoint rates")
+    monitor.update("rmb_midpoint", progress=0.0)
+    asyncio.create_task(_run_rmb_midpoint_job(payload))
+
+
+@queueable("leverage_ratio")
+async def start_macro_leverage_job(payload: SyncMacroLeverageRequest) -> None:
+    if _job_running("leverage_ratio"):
+        raise HTTPException(status_code=409, detail="Macro leverage sync already running")
+    monitor.start("leverage_ratio", message="Syncing macro leverage ratios")
+    monitor.update("leverage_ratio", progress=0.0)
+    asyncio.create_task(_run_macro_leverage_job(payload))
+
+
+@queueable("social_financing")
+async def start_social_financing_job(payload: SyncSocialFinancingRequest) -> None:
+    if _job_running("social_financing"):
+        raise HTTPException(status_code=409, detail="Social financing sync already running")
+    monitor.start("social_financing", message="Syncing social financing data")
+    monitor.update("social_financing", progress=0.0)
+    asyncio.create_task(_run_social_financing_job(payload))
+
+
+@queueable("cpi_monthly")
+async def start_macro_cpi_job(payload: SyncMacroCpiRequest) -> None:
+    if _job_running("cpi_monthly"):
+        raise HTTPException(status_code=409, detail="CPI sync already running")
+    monitor.start("cpi_monthly", message="Syncing CPI data")
+    monitor.update("cpi_monthly", progress=0.0)
+    asyncio.create_task(_run_macro_cpi_job(payload))
+
+
+@queueable("pmi_monthly")
+async def start_macro_pmi_job(payload: SyncMacroPmiRequest) -> None:
+    if _job_running("pmi_monthly"):
+        raise HTTPException(status_code=409, detail="PMI sync already running")
+    monitor.start("pmi_monthly", message="Syncing PMI data")
+    monitor.update("pmi_monthly", progress=0.0)
+    asyncio.create_task(_run_macro_pmi_job(payload))
+
+
+@queueable("m2_monthly")
+async def start_macro_m2_job(payload: SyncMacroM2Request) -> None:
+    if _job_running("m2_monthly"):
+        raise HTTPException(status_code=409, detail="M2 sync already running")
+    monitor.start("m2_monthly", message="Syncing M2 money supply")
+    monitor.update("m2_monthly", progress=0.0)
+    asyncio.create_task(_run_macro_m2_job(payload))
+
+
+@queueable("ppi_monthly")
+async def start_macro_ppi_job(payload: SyncMacroPpiRequest) -> None:
+    if _job_running("ppi_monthly"):
+        raise HTTPException(status_code=409, detail="PPI sync already running")
+    monitor.start("ppi_monthly", message="Syncing PPI data")
+    monitor.update("ppi_monthly", progress=0.0)
+    asyncio.create_task(_run_macro_ppi_job(payload))
+
+
+@queueable("lpr_rate")
+async def start_macro_lpr_job(payload: SyncMacroLprRequest) -> None:
+    if _job_running("lpr_rate"):
+        raise HTTPException(status_code=409, detail="LPR sync already running")
+    monitor.start("lpr_rate", message="Syncing LPR data")
+    monitor.update("lpr_rate", progress=0.0)
+    asyncio.create_task(_run_macro_lpr_job(payload))
+
+
+@queueable("shibor_rate")
+async def start_macro_shibor_job(payload: SyncMacroShiborRequest) -> None:
+    if _job_running("shibor_rate"):
+        raise HTTPException(status_code=409, detail="SHIBOR sync already running")
+    monitor.start("shibor_rate", message="Syncing SHIBOR data")
+    monitor.update("shibor_rate", progress=0.0)
+    asyncio.create_task(_run_macro_shibor_job(payload))
+
+
+@queueable("futures_realtime")
+async def start_futures_realtime_job(payload: SyncFuturesRealtimeRequest) -> None:
+    if _job_running("futures_realtime"):
+        raise HTTPException(status_code=409, detail="Futures realtime sync already running")
+    monitor.start("futures_realtime", message="Syncing futures realtime data")
+    monitor.update("futures_realtime", progress=0.0)
+    asyncio.create_task(_run_futures_realtime_job(payload))
+
+
+@queueable("fed_statements")
+async def start_fed_statement_job(payload: SyncFedStatementRequest) -> None:
+    if _job_running("fed_statements"):
+        raise HTTPException(status_code=409, detail="Fed statements sync already running")
+    monitor.start("fed_statements", message="Syncing Federal Reserve statements")
+    monitor.update("fed_statements", progress=0.0)
+    asyncio.create_task(_run_fed_statement_job(payload))
+
+
+@queueable("peripheral_insight")
+async def start_peripheral_insight_job(payload: SyncPeripheralInsightRequest) -> None:
+    if _job_running("peripheral_insight"):
+        raise HTTPException(status_code=409, detail="Peripheral insight job already running")
+    monitor.start("peripheral_insight", message="Generating peripheral market insight")
+    monitor.update("peripheral_insight", progress=0.0)
+    asyncio.create_task(_run_peripheral_insight_job(payload))
+
+
+@queueable("macro_aggregate")
+async def start_macro_aggregate_job(payload: SyncMacroAggregateRequest) -> None:
+    if _job_running("macro_aggregate"):
+        raise HTTPException(status_code=409, detail="Macro aggregate sync already running")
+
+    dependent_jobs = [
+        ("leverage_ratio", "Macro leverage sync already running"),
+        ("social_financing", "Social financing sync already running"),
+        ("cpi_monthly", "CPI sync already running"),
+        ("ppi_monthly", "PPI sync already running"),
+        ("pmi_monthly", "PMI sync already running"),
+        ("m2_monthly", "M2 sync already running"),
+        ("lpr_rate", "LPR sync already running"),
+        ("shibor_rate", "SHIBOR sync already running"),
+    ]
+
+    for job_key, detail in dependent_jobs:
+        if _job_running(job_key):
+            raise HTTPException(status_code=409, detail=detail)
+
+    monitor.start("macro_aggregate", message="Syncing macro data bundle")
+    monitor.update("macro_aggregate", progress=0.0)
+    asyncio.create_task(_run_macro_aggregate_job(payload))
+
+
+@queueable("peripheral_aggregate")
+async def start_peripheral_aggregate_job(payload: SyncPeripheralAggregateRequest) -> None:
+    if _job_running("peripheral_aggregate"):
+        raise HTTPException(status_code=409, detail="Peripheral aggregate sync already running")
+
+    dependent_jobs = [
+        ("global_index", "Global indices sync already running"),
+        ("dollar_index", "Dollar index sync already running"),
+        ("rmb_midpoint", "RMB midpoint sync already running"),
+        ("futures_realtime", "Futures realtime sync already running"),
+        ("fed_statements", "Fed statements sync already running"),
+        ("peripheral_insight", "Peripheral insight sync already running"),
+    ]
+
+    for job_key, error_message in dependent_jobs:
+        if _job_running(job_key):
+            raise HTTPException(status_code=409, detail=error_message)
+
+    monitor.start("peripheral_aggregate", message="Syncing peripheral data bundle")
+    monitor.update("peripheral_aggregate", progress=0.0)
+    asyncio.create_task(_run_peripheral_aggregate_job(payload))
+
+
+@queueable("fund_flow_aggregate")
+async def start_fund_flow_aggregate_job(payload: SyncFundFlowAggregateRequest) -> None:
+    if _job_running("fund_flow_aggregate"):
+        raise HTTPException(status_code=409, detail="Fund flow aggregate sync already running")
+
+    dependent_jobs = [
+        ("industry_fund_flow", "Industry fund flow sync already running"),
+        ("concept_fund_flow", "Concept fund flow sync already running"),
+        ("individual_fund_flow", "Individual fund flow sync already running"),
+        ("margin_account", "Margin account sync already running"),
+        ("big_deal_fund_flow", "Big deal fund flow sync already running"),
+    ]
+
+    for job_key, error_message in dependent_jobs:
+        if _job_running(job_key):
+            raise HTTPException(status_code=409, detail=error_message)
+
+    monitor.start("fund_flow_aggregate", message="Syncing fund flow bundle")
+    monitor.update("fund_flow_aggregate", progress=0.0)
+    asyncio.create_task(_run_fund_flow_aggregate_job(payload))
+
+
+@queueable("industry_fund_flow")
+async def start_industry_fund_flow_job(payload: SyncIndustryFundFlowRequest) -> None:
+    if _job_running("industry_fund_flow"):
+        raise HTTPException(status_code=409, detail="Industry fund flow sync already running")
+    monitor.start("industry_fund_flow", message="Syncing industry fund flow data")
+    monitor.update("industry_fund_flow", progress=0.0)
+    asyncio.create_task(_run_industry_fund_flow_job(payload))
+
+
+@queueable("concept_fund_flow")
+async def start_concept_fund_flow_job(payload: SyncConceptFundFlowRequest) -> None:
+    if _job_running("concept_fund_flow"):
+        raise HTTPException(status_code=409, detail="Concept fund flow sync already running")
+    monitor.start("concept_fund_flow", message="Syncing concept fund flow data")
+    monitor.update("concept_fund_flow", progress=0.0)
+    asyncio.create_task(_run_concept_fund_flow_job(payload))
+
+
+@queueable("concept_index_history")
+async def start_concept_index_history_job(payload: SyncConceptIndexHistoryRequest) -> None:
+    if _job_running("concept_index_history"):
+        raise HTTPException(status_code=409, detail="Concept index history sync already running")
+    monitor.start("concept_index_history", message="Syncing concept index history")
+    monitor.update("concept_index_history", progress=0.0)
+    asyncio.create_task(_run_concept_index_history_job(payload))
+
+
+@queueable("individual_fund_flow")
+async def start_individual_fund_flow_job(payload: SyncIndividualFundFlowRequest) -> None:
+    if _job_running("individual_fund_flow"):
+        raise HTTPException(status_code=409, detail="Individual fund flow sync already running")
+    monitor.start("individual_fund_flow", message="Syncing individual fund flow data")
+    monitor.update("individual_fund_flow", progress=0.0)
+    asyncio.create_task(_run_individual_fund_flow_job(payload))
+
+
+@queueable("concept_constituents")
+async def start_concept_constituents_job(payload: SyncConceptConstituentsRequest) -> None:
+    if _job_running("concept_constituents"):
+        raise HTTPException(status_code=409, detail="Concept constituent refresh already running")
+    monitor.start("concept_constituents", message="Refreshing concept constituents")
+    monitor.update("concept_constituents", progress=0.0)
+    asyncio.create_task(_run_concept_constituents_job(payload))
+
+
+@queueable("sector_volume_price")
+async def start_sector_volume_price_job(payload: SyncSectorVolumePriceRequest) -> None:
+    if _job_running("sector_volume_price"):
+        raise HTTPException(status_code=409, detail="Sector volume/price analysis already running")
+    if payload.sectors and payload.kind == "all":
+        # Concept and industry names differ; "all" only applies to the watched sectors.
+        raise HTTPException(status_code=400, detail="Explicit sectors require kind 'concept' or 'industry'")
+    monitor.start("sector_volume_price", message="Analysing sector volume/price")
+    monitor.update("sector_volume_price", progress=0.0)
+    asyncio.create_task(_run_sector_volume_price_job(payload))
+
+
+@queueable("stock_analysis")
+async def start_stock_analysis_job(payload: SyncStockAnalysisRequest) -> None:
+    if _job_running("stock_analysis"):
+        raise HTTPException(status_code=409, detail="Stock analysis batch already running")
+    unknown = sorted(set(payload.analyses or ()) - set(STOCK_ANALYSIS_KINDS))
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unsupported stock analyses: {', '.join(unknown)}")
+    monitor.start("stock_analysis", message="Generating stock analyses")
+    monitor.update("stock_analysis", progress=0.0)
+    asyncio.create_task(_run_stock_analysis_job(payload))
+
+
+@queueable("big_deal_fund_flow")
+async def start_big_deal_fund_flow_job(payload: SyncBigDealFundFlowRequest) -> None:
+    if _job_running("big_deal_fund_flow"):
+        raise HTTPException(status_code=409, detail="Big deal fund flow sync already running")
+    monitor.start("big_deal_fund_flow", message="Syncing big deal fund flow data")
+    monitor.update("big_deal_fund_flow", progress=0.0)
+    asyncio.create_task(_run_big_deal_fund_flow_job(payload))
+
+
+@queueable("margin_account")
+async def start_margin_account_job(payload: SyncMarginAccountRequest) -> None:
+    if _job_running("margin_account"):
+        raise HTTPException(status_code=409, detail="Margin account sync already running")
+    monitor.start("margin_account", message="Syncing margin account statistics")
+    monitor.update("margin_account", progress=0.0)
+    asyncio.create_task(_run_margin_account_job(payload))
+
+
+@queueable("stock_main_business")
+async def start_stock_main_business_job(payload: SyncStockMainBusinessRequest) -> None:
+    if _job_running("stock_main_business"):
+        raise HTTPException(status_code=409, detail="Stock main business sync already running")
+    monitor.start("stock_main_business", message="Syncing stock main business data")
+    monitor.update("stock_main_business", progress=0.0)
+    asyncio.create_task(_run_stock_main_business_job(payload))
+
+
+@queueable("stock_main_composition")
+async def start_stock_main_composition_job(payload: SyncStockMainCompositionRequest) -> None:
+    if _job_running("stock_main_composition"):
+        raise HTTPException(status_code=409, detail="Stock main composition sync already running")
+    monitor.start("stock_main_composition", message="Syncing stock main composition data")
+    monitor.update("stock_main_composition", progress=0.0)
+    asyncio.create_task(_run_stock_main_composition_job(payload))
+
+
+@queueable("finance_breakfast")
+async def start_finance_breakfast_job(payload: SyncFinanceBreakfastRequest) -> None:
+    if _job_running("finance_breakfast"):
+        raise HTTPException(status_code=409, detail="Finance breakfast sync already running")
+    monitor.start("finance_breakfast", message="Syncing finance breakfast summaries")
+    monitor.update("finance_breakfast", progress=0.0)
+    asyncio.create_task(_run_finance_breakfast_job(payload))
+
+
+@queueable("global_flash")
+async def start_global_flash_job(payload: SyncGlobalFlashRequest) -> None:
+    if _job_running("global_flash"):
+        raise HTTPException(status_code=409, detail="Global flash sync already running")
+    monitor.start("global_flash", message="Syncing global finance flash data")
+    monitor.update("global_flash", progress=0.0)
+    asyncio.create_task(_run_global_flash_job(payload))
+
+
+@queueable("price_panel")
+async def start_price_panel_job(payload: SyncPricePanelRequest) -> None:
+    if _job_running("price_panel"):
+        raise HTTPException(status_code=409, detail="Price panel rebuild already running")
+    monitor.start("price_panel", message="Rebuilding columnar price panel cache")
+    monitor.update("price_panel", progress=0.0)
+    asyncio.create_task(_run_price_panel_job(payload))
+
+
+@queueable("trade_calendar")
+async def start_trade_calendar_job(payload: SyncTradeCalendarRequest) -> None:
+    if _job_running("trade_calendar"):
+        raise HTTPException(status_code=409, detail="Trade calendar sync already running")
+    monitor.start("trade_calendar", message="Syncing A-share trading calendar")
+    monitor.update("trade_calendar", progress=0.0)
+    asyncio.create_task(_run_trade_calendar_job(payload))
+
+
+@queueable("global_flash_classification")
+async def start_global_flash_classification_job(payload: SyncGlobalFlashClassifyRequest) -> None:
+    if _job_running("global_flash_classification"):
+        raise HTTPException(status_code=409, detail="Global flash classification already running")
+    monitor.start("global_flash_classification", message="Classifying global flash entries")
+    monitor.update("global_flash_classification", progress=0.0)
+    asyncio.create_task(_run_global_flash_classification_job(payload))
+
+
+async def safe_start_stock_basic_job(payload: SyncStockBasicRequest) -> None:
+    try:
+        await start_stock_basic_job(payload)
+    except HTTPException as exc:
+        logger.info("Stock basic sync skipped: %s", exc.detail)
+
+
+async def safe_start_daily_trade_job(payload: SyncDailyTradeRequest) -> None:
+    try:
+        await start_daily_trade_job(payload)
+    except HTTPException as exc:
+        logger.info("Daily trade sync skipped: %s", exc.detail)
+
+
+async def safe_start_daily_trade_metrics_job(payload: SyncDailyTradeMetricsRequest) -> None:
+    try:
+        await start_daily_trade_metrics_job(payload)
+    except HTTPException as exc:
+        logger.info("Daily trade metrics sync skipped: %s", exc.detail)
+
+
+async def safe_start_fundamental_metrics_job(payload: SyncFundamentalMetricsRequest) -> None:
+    try:
+        await start_fundamental_metrics_job(payload)
+    except HTTPException as exc:
+        logger.info("Fundamental metrics sync skipped: %s", exc.detail)
+
+async def safe_start_daily_indicator_job(payload: SyncDailyIndicatorRequest) -> None:
+    try:
+        await start_daily_indicator_job(payload)
+    except HTTPException as exc:
+        logger.info("Daily indicator sync skipped: %s", exc.detail)
+
+
+async def safe_start_income_statement_job(payload: SyncIncomeStatementRequest) -> None:
+    try:
+        await start_income_statement_job(payload)
+    except HTTPException as exc:
+        logger.info("Income statement sync skipped: %s", exc.detail)
+
+
+async def safe_start_financial_indicator_job(payload: SyncFinancialIndicatorRequest) -> None:
+    try:
+        await start_financial_indicator_job(payload)
+    except HTTPException as exc:
+        logger.info("Financial indicator sync skipped: %s", exc.detail)
+
+
+async def safe_start_cashflow_statement_job(payload: SyncCashflowRequest) -> None:
+    try:
+        await start_cashflow_statement_job(payload)
+    except HTTPException as exc:
+        logger.info("Cashflow statement sync skipped: %s", exc.detail)
+
+
+async def safe_start_balance_sheet_job(payload: SyncBalanceSheetRequest) -> None:
+    try:
+        await start_balance_sheet_job(payload)
+    except HTTPException as exc:
+        logger.info("Balance sheet sync skipped: %s", exc.detail)
+
+
+async def safe_start_finance_breakfast_job(payload: SyncFinanceBreakfastRequest) -> None:
+    try:
+        await start_finance_breakfast_job(payload)
+    except HTTPException as exc:
+        logger.info("Finance breakfast sync skipped: %s", exc.detail)
+
+
+async def safe_start_trade_calendar_job(payload: SyncTradeCalendarRequest) -> None:
+    try:
+        await start_trade_calendar_job(payload)
+    except HTTPException as exc:
+        logger.info("Trade calendar sync skipped: %s", exc.detail)
+
+
+async def safe_start_global_flash_classification_job(payload: SyncGlobalFlashClassifyRequest) -> None:
+    try:
+        await start_global_flash_classification_job(payload)
+    except HTTPException as exc:
+        logger.info("Global flash classification skipped: %s", exc.detail)
+
+
+
+async def safe_start_performance_express_job(payload: SyncPerformanceExpressRequest) -> None:
+    try:
+        await start_performance_express_job(payload)
+    except HTTPException as exc:
+        logger.info("Performance express sync skipped: %s", exc.detail)
+
+
+async def safe_start_performance_forecast_job(payload: SyncPerformanceForecastRequest) -> None:
+    try:
+        await start_performance_forecast_job(payload)
+    except HTTPException as exc:
+        logger.info("Performance forecast sync skipped: %s", exc.detail)
+
+
+async def safe_start_profit_forecast_job(payload: SyncProfitForecastRequest) -> None:
+    try:
+        await start_profit_forecast_job(payload)
+    except HTTPException as exc:
+        logger.info("Profit forecast sync skipped: %s", exc.detail)
+
+
+async def safe_start_global_index_job(payload: SyncGlobalIndexRequest) -> None:
+    try:
+        await start_global_index_job(payload)
+    except HTTPException as exc:
+        logger.info("Global index sync skipped: %s", exc.detail)
+
+
+async def safe_start_realtime_index_job(payload: SyncRealtimeIndexRequest) -> None:
+    try:
+        await start_realtime_index_job(payload)
+    except HTTPException as exc:
+        logger.info("Realtime index sync skipped: %s", exc.detail)
+
+
+async def safe_start_dollar_index_job(payload: SyncDollarIndexRequest) -> None:
+    try:
+        await start_dollar_index_job(payload)
+    except HTTPException as exc:
+        logger.info("Dollar index sync skipped: %s", exc.detail)
+
+
+async def safe_start_rmb_midpoint_job(payload: SyncRmbMidpointRequest) -> None:
+    try:
+        await start_rmb_midpoint_job(payload)
+    except HTTPException as exc:
+        logger.info("RMB midpoint sync skipped: %s", exc.detail)
+
+
+async def safe_start_macro_leverage_job(payload: SyncMacroLeverageRequest) -> None:
+    try:
+        await start_macro_leverage_job(payload)
+    except HTTPException as exc:
+        logger.info("Macro leverage sync skipped: %s", exc.detail)
+
+
+async def safe_start_social_financing_job(payload: SyncSocialFinancingRequest) -> None:
+    try:
+        await start_social_financing_job(payload)
+    except HTTPException as exc:
+        logger.info("Social financing sync skipped: %s", exc.detail)
+
+
+async def safe_start_macro_cpi_job(payload: SyncMacroCpiRequest) -> None:
+    try:
+        await start_macro_cpi_job(payload)
+    except HTTPException as exc:
+        logger.info("CPI sync skipped: %s", exc.detail)
+
+
+async def safe_start_macro_pmi_job(payload: SyncMacroPmiRequest) -> None:
+    try:
+        await start_macro_pmi_job(payload)
+    except HTTPException as exc:
+        logger.info("PMI sync skipped: %s", exc.detail)
+
+
+async def safe_start_macro_m2_job(payload: SyncMacroM2Request) -> None:
+    try:
+        await start_macro_m2_job(payload)
+    except HTTPException as exc:
+        logger.info("M2 sync skipped: %s", exc.detail)
+
+
+async def safe_start_macro_ppi_job(payload: SyncMacroPpiRequest) -> None:
+    try:
+        await start_macro_ppi_job(payload)
+    except HTTPException as exc:
+        logger.info("PPI sync skipped: %s", exc.detail)
+
+
+async def safe_start_futures_realtime_job(payload: SyncFuturesRealtimeRequest) -> None:
+    try:
+        await start_futures_realtime_job(payload)
+    except HTTPException as exc:
+        logger.info("Futures realtime sync skipped: %s", exc.detail)
+
+
+async def safe_start_fed_statement_job(payload: SyncFedStatementRequest) -> None:
+    try:
+        await start_fed_statement_job(payload)
+    except HTTPException as exc:
+        logger.info("Fed statements sync skipped: %s", exc.detail)
+
+
+async def safe_start_peripheral_insight_job(payload: SyncPeripheralInsightRequest) -> None:
+    try:
+        await start_peripheral_insight_job(payload)
+    except HTTPException as exc:
+        logger.info("Peripheral insight generation skipped: %s", exc.detail)
+
+
+async def safe_start_macro_aggregate_job(payload: SyncMacroAggregateRequest) -> None:
+    try:
+        await start_macro_aggregate_job(payload)
+    except HTTPException as exc:
+        logger.info("Macro aggregate sync skipped: %s", exc.detail)
+
+
+async def safe_start_peripheral_aggregate_job(payload: SyncPeripheralAggregateRequest) -> None:
+    try:
+        await start_peripheral_aggregate_job(payload)
+    except HTTPException as exc:
+        logger.info("Peripheral aggregate sync skipped: %s", exc.detail)
+
+
+async def safe_start_fund_flow_aggregate_job(payload: SyncFundFlowAggregateRequest) -> None:
+    try:
+        await start_fund_flow_aggregate_job(payload)
+    except HTTPException as exc:
+        logger.info("Fund flow aggregate sync skipped: %s", exc.detail)
+
+
+async def safe_start_industry_fund_flow_job(payload: SyncIndustryFundFlowRequest) -> None:
+    try:
+        await start_industry_fund_flow_job(payload)
+    except HTTPException as exc:
+        logger.info("Industry fund flow sync skipped: %s", exc.detail)
+
+
+async def safe_start_concept_fund_flow_job(payload: SyncConceptFundFlowRequest) -> None:
+    try:
+        await start_concept_fund_flow_job(payload)
+    except HTTPException as exc:
+        logger.info("Concept fund flow sync skipped: %s", exc.detail)
+
+
+async def safe_start_concept_index_history_job(payload: SyncConceptIndexHistoryRequest) -> None:
+    try:
+        await start_concept_index_history_job(payload)
+    except HTTPException as exc:
+        logger.info("Concept index history sync skipped: %s", exc.detail)
+
+
+async def safe_start_concept_constituents_job(payload: SyncConceptConstituentsRequest) -> None:
+    try:
+        await start_concept_constituents_job(payload)
+    except HTTPException as exc:
+        logger.info("Concept constituent refresh skipped: %s", exc.detail)
+
+
+async def safe_start_stock_analysis_job(payload: SyncStockAnalysisRequest) -> None:
+    try:
+        await start_stock_analysis_job(payload)
+    except HTTPException as exc:
+        logger.info("Stock analysis batch skipped: %s", exc.detail)
+
+
+def schedule_peripheral_aggregate_job(config: RuntimeConfig) -> None:
+    job_id = "peripheral_aggregate_daily"
+    try:
+        trigger_hour, trigger_minute = _parse_time_string(config.peripheral_aggregate_time)
+    except HTTPException:
+        trigger_hour, trigger_minute = 6, 0
+    try:
+        scheduler.remove_job(job_id)
+    except Exception:  # pragma: no cover - defensive
+        pass
+
+    scheduler.add_job(
+        lambda: _submit_scheduler_task(
+            safe_start_peripheral_aggregate_job(SyncPeripheralAggregateRequest())
+        ),
+        CronTrigger(hour=trigger_hour, minute=trigger_minute),
+        id=job_id,
+        replace_existing=True,
+    )
+
+
+def _maybe_queue_global_flash_sync(trigger: str) -> None:
+    local_now = datetime.now(tz=scheduler.timezone)
+    try:
+        trading_status = is_trading_day(local_now)
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to determine trading day status: %s", exc)
+        trading_status = None
+
+    is_trading = bool(trading_status)
+    if trading_status is None:
+        logger.debug("Trading day status unknown for %s; defaulting to non-trading logic.", local_now.date())
+
+    hour = local_now.hour
+    minute = local_now.minute
+
+    if trigger == "intraday":
+        if not is_trading or not (8 <= hour < 20):
+            logger.debug(
+                "Skipping global flash intraday run at %s (trading=%s, hour=%s)",
+                local_now.isoformat(),
+                is_trading,
+                hour,
+            )
+            return
+    elif trigger == "intraday_close":
+        if not is_trading or not (hour == 20 and minute == 0):
+            logger.debug(
+                "Skipping global flash 20:00 run at %s (trading=%s)",
+                local_now.isoformat(),
+                is_trading,
+            )
+            return
+    else:  # hourly
+        if is_trading and 8 <= hour <= 20:
+            logger.debug(
+                "Skipping hourly global flash run during trading session (%s)",
+                local_now.isoformat(),
+            )
+            return
+
+    if not _submit_scheduler_task(safe_start_global_flash_job(SyncGlobalFlashRequest())):
+        logger.debug("Global flash job queueing skipped; scheduler loop unavailable.")
+
+
+def schedule_global_flash_job(config: RuntimeConfig) -> None:
+    for job_id in [
+        "global_flash_intraday",
+        "global_flash_intraday_close",
+        "global_flash_hourly",
+    ]:
+        try:
+            scheduler.remove_job(job_id)
+        except Exception:  # pragma: no cover - defensive
+            pass
+
+    scheduler.add_job(
+        lambda: _maybe_queue_global_flash_sync("intraday"),
+        CronTrigger(day_of_week="mon-fri", hour="8-19", minute="*/10"),
+        id="global_flash_intraday",
+        replace_existing=True,
+    )
+    scheduler.add_job(
+        lambda: _maybe_queue_global_flash_sync("intraday_close"),
+        CronTrigger(day_of_week="mon-fri", hour="20", minute="0"),
+        id="global_flash_intraday_close",
+        replace_existing=True,
+    )
+    scheduler.add_job(
+        lambda: _maybe_queue_global_flash_sync("hourly"),
+        CronTrigger(minute=0),
+        id="global_flash_hourly",
+        replace_existing=True,
+    )
+
+
+def configure_realtime_quote_poller(config: RuntimeConfig) -> None:
+    global realtime_quote_poller
+    if realtime_quote_poller is not None:
+        if (
+            config.realtime_quote_poller_enabled
+            and realtime_quote_poller.running
+            and realtime_quote_poller.status()["interval_seconds"] == float(config.realtime_quote_interval_seconds)
+        ):
+            return
+        realtime_quote_poller.stop()
+        realtime_quote_poller = None
+    if not config.realtime_quote_poller_enabled:
+        return
+    realtime_quote_poller = RealtimeQuotePoller(interval_seconds=config.realtime_quote_interval_seconds)
+    realtime_quote_poller.start()
+
+
+def reschedule_jobs(config: RuntimeConfig) -> None:
+    """Re-register the cron jobs whose timing comes from the runtime config."""
+    schedule_peripheral_aggregate_job(config)
+    schedule_global_flash_job(config)
+    schedule_trade_calendar_job()
+    schedule_global_flash_classification_job()
+
+
+def schedule_trade_calendar_job() -> None:
+    job_id = "trade_calendar_daily"
+    try:
+        scheduler.remove_job(job_id)
+    except Exception:  # pragma: no cover - defensive
+        pass
+
+    scheduler.add_job(
+        lambda: _submit_scheduler_task(
+            safe_start_trade_calendar_job(SyncTradeCalendarRequest())
+        ),
+        CronTrigger(hour=2, minute=30),
+        id=job_id,
+        replace_existing=True,
+    )
+
+
+def schedule_global_flash_classification_job(default_batch_size: int = 10) -> None:
+    job_id = "global_flash_classification"
+    try:
+        scheduler.remove_job(job_id)
+    except Exception:  # pragma: no cover - defensive
+        pass
+
+    scheduler.add_job(
+        lambda: _submit_scheduler_task(
+            safe_start_global_flash_classification_job(
+                SyncGlobalFlashClassifyRequest(batch_size=default_batch_size)
+            )
+        ),
+        CronTrigger(minute="*/10"),
+        id=job_id,
+        replace_existing=True,
+    )
+
+
+async def safe_start_individual_fund_flow_job(payload: SyncIndividualFundFlowRequest) -> None:
+    try:
+        await start_individual_fund_flow_job(payload)
+    except HTTPException as exc:
+        logger.info("Individual fund flow sync skipped: %s", exc.detail)
+
+
+async def safe_start_big_deal_fund_flow_job(payload: SyncBigDealFundFlowRequest) -> None:
+    try:
+        await start_big_deal_fund_flow_job(payload)
+    except HTTPException as exc:
+        logger.info("Big deal fund flow sync skipped: %s", exc.detail)
+
+
+async def safe_start_margin_account_job(payload: SyncMarginAccountRequest) -> None:
+    try:
+        await start_margin_account_job(payload)
+    except HTTPException as exc:
+        logger.info("Margin account sync skipped: %s", exc.detail)
+
+
+@queueable("market_activity")
+async def start_market_activity_job(payload: SyncMarketActivityRequest) -> None:
+    if _job_running("market_activity"):
+        raise HTTPException(status_code=409, detail="Market activity sync already running")
+    monitor.start("market_activity", message="Syncing market activity snapshot")
+    monitor.update("market_activity", progress=0.0)
+    asyncio.create_task(_run_market_activity_job(payload))
+
+
+async def safe_start_market_activity_job(payload: SyncMarketActivityRequest) -> None:
+    try:
+        await start_market_activity_job(payload)
+    except HTTPException as exc:
+        logger.info("Market activity sync skipped: %s", exc.detail)
+
+
+@queueable("market_fund_flow")
+async def start_market_fund_flow_job(payload: SyncMarketFundFlowRequest) -> None:
+    if _job_running("market_fund_flow"):
+        raise HTTPException(status_code=409, detail="Market fund flow sync already running")
+    monitor.start("market_fund_flow", message="Syncing market fund flow data")
+    monitor.update("market_fund_flow", progress=0.0)
+    asyncio.create_task(_run_market_fund_flow_job(payload))
+
+
+async def safe_start_market_fund_flow_job(payload: SyncMarketFundFlowRequest) -> None:
+    try:
+        await start_market_fund_flow_job(payload)
+    except HTTPException as exc:
+        logger.info("Market fund flow sync skipped: %s", exc.detail)
+
+
+@queueable("macro_insight")
+async def start_macro_insight_job(payload: SyncMacroInsightRequest) -> None:
+    if _job_running("macro_insight"):
+        raise HTTPException(status_code=409, detail="Macro insight generation is already running")
+    monitor.start("macro_insight", message="Generating macro insight summary")
+    monitor.update("macro_insight", progress=0.0)
+    asyncio.create_task(_run_macro_insight_job(payload))
+
+
+async def safe_start_macro_insight_job(payload: SyncMacroInsightRequest) -> None:
+    try:
+        await start_macro_insight_job(payload)
+    except HTTPException as exc:
+        logger.info("Macro insight generation skipped: %s", exc.detail)
+
+
+@queueable("concept_insight")
+async def start_concept_insight_job(payload: SyncConceptInsightRequest) -> None:
+    if _job_running("concept_insight"):
+        raise HTTPException(status_code=409, detail="Concept insight generation is already running")
+    monitor.start("concept_insight", message="Generating concept insight summary")
+    monitor.update("concept_insight", progress=0.0)
+    asyncio.create_task(_run_concept_insight_job(payload))
+
+
+async def safe_start_concept_insight_job(payload: SyncConceptInsightRequest) -> None:
+    try:
+        await start_concept_insight_job(payload)
+    except HTTPException as exc:
+        logger.info("Concept insight generation skipped: %s", exc.detail)
+
+
+@queueable("industry_insight")
+async def start_industry_insight_job(payload: SyncIndustryInsightRequest) -> None:
+    if _job_running("industry_insight"):
+        raise HTTPException(status_code=409, detail="Industry insight generation is already running")
+    monitor.start("industry_insight", message="Generating industry insight summary")
+    monitor.update("industry_insight", progress=0.0)
+    asyncio.create_task(_run_industry_insight_job(payload))
+
+
+async def safe_start_industry_insight_job(payload: SyncIndustryInsightRequest) -> None:
+    try:
+        await start_industry_insight_job(payload)
+    except HTTPException as exc:
+        logger.info("Industry insight generation skipped: %s", exc.detail)
+
+
+async def safe_start_stock_main_business_job(payload: SyncStockMainBusinessRequest) -> None:
+    try:
+        await start_stock_main_business_job(payload)
+    except HTTPException as exc:
+        logger.info("Stock main business sync skipped: %s", exc.detail)
+
+
+async def safe_start_stock_main_composition_job(payload: SyncStockMainCompositionRequest) -> None:
+    try:
+        await start_stock_main_composition_job(payload)
+    except HTTPException as exc:
+        logger.info("Stock main composition sync skipped: %s", exc.detail)
+
+
+async def safe_start_global_flash_job(payload: SyncGlobalFlashRequest) -> None:
+    try:
+        await start_global_flash_job(payload)
+    except HTTPException as exc:
+        logger.info("Global flash sync skipped: %s", exc.detail)
+
+
+async def safe_start_market_insight_job(payload: SyncMarketInsightRequest) -> None:
+    try:
+        await start_market_insight_job(payload)
+    except HTTPException as exc:
+        logger.info("Market insight job skipped: %s", exc.detail)
+
+
+async def safe_start_sector_insight_job(payload: SyncSectorInsightRequest) -> None:
+    try:
+        await start_sector_insight_job(payload)
+    except HTTPException as exc:
+        logger.info("Sector insight job skipped: %s", exc.detail)
+
+
+async def safe_start_index_history_job(payload: SyncIndexHistoryRequest) -> None:
+    try:
+        await start_index_history_job(payload)
+    except HTTPException as exc:
+        logger.info("Index history sync skipped: %s", exc.detail)
+
+
+async def start_scheduler(*, quote_poller: bool = True) -> None:
+    """Start the scheduler on the running loop, register cron jobs and queue start-up syncs.
+
+    ``quote_poller=False`` leaves the realtime quote poller to the API process (its quotes
+    are served from memory), which is how the scheduler worker starts it.
+    """
+    global scheduler_loop
+    scheduler_loop = asyncio.get_running_loop()
+    if not scheduler.running:
+        scheduler.start()
+        config = load_runtime_config()
+        scheduler.add_job(
+            lambda: _submit_scheduler_task(
+                safe_start_stock_basic_job(SyncStockBasicRequest(list_statuses=["L", "D"], market=None))
+            ),
+            CronTrigger(day=1, hour=0, minute=0),
+            id="stock_basic_monthly",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            lambda: _submit_scheduler_task(
+                safe_start_daily_trade_job(SyncDailyTradeRequest())
+            ),
+            CronTrigger(hour=17, minute=0),
+            id="daily_trade_daily",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            lambda: _submit_scheduler_task(
+                safe_start_daily_indicator_job(SyncDailyIndicatorRequest())
+            ),
+            CronTrigger(hour=17, minute=5),
+            id="daily_indicator_daily",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            lambda: _submit_scheduler_task(
+                safe_start_index_history_job(SyncIndexHistoryRequest())
+            ),
+            CronTrigger(hour=17, minute=0),
+            id="index_history_daily",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            lambda: _submit_scheduler_task(
+                safe_start_daily_trade_metrics_job(SyncDailyTradeMetricsRequest())
+            ),
+            CronTrigger(hour=19, minute=0),
+            id="daily_trade_metrics_daily",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            lambda: _submit_scheduler_task(
+                safe_start_income_statement_job(SyncIncomeStatementRequest(mode="announcement"))
+            ),
+            CronTrigger(hour=18, minute=40),
+            id="income_statement_announcement_daily",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            lambda: _submit_scheduler_task(
+                safe_start_financial_indicator_job(SyncFinancialIndicatorRequest(mode="announcement"))
+            ),
+            CronTrigger(hour=18, minute=45),
+            id="financial_indicator_announcement_daily",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            lambda: _submit_scheduler_task(
+                safe_start_cashflow_statement_job(SyncCashflowRequest(mode="announcement"))
+            ),
+            CronTrigger(hour=18, minute=50),
+            id="cashflow_statement_announcement_daily",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            lambda: _submit_scheduler_task(
+                safe_start_balance_sheet_job(SyncBalanceSheetRequest(mode="announcement"))
+            ),
+            CronTrigger(hour=18, minute=55),
+            id="balance_sheet_announcement_daily",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            lambda: _submit_scheduler_task(
+                safe_start_fundamental_metrics_job(SyncFundamentalMetricsRequest())
+            ),
+            CronTrigger(hour=19, minute=10),
+            id="fundamental_metrics_daily",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            lambda: _submit_scheduler_task(
+                safe_start_finance_breakfast_job(SyncFinanceBreakfastRequest())
+            ),
+            CronTrigger(hour=7, minute=0),
+            id="finance_breakfast_daily",
+            replace_existing=True,
+        )
+
+
+        scheduler.add_job(
+            lambda: _submit_scheduler_task(
+                safe_start_industry_fund_flow_job(SyncIndustryFundFlowRequest())
+            ),
+            CronTrigger(hour=19, minute=25),
+            id="industry_fund_flow_daily",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            lambda: _submit_scheduler_task(
+                safe_start_concept_fund_flow_job(SyncConceptFundFlowRequest())
+            ),
+            CronTrigger(hour=19, minute=30),
+            id="concept_fund_flow_daily",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            lambda: _submit_scheduler_task(
+                safe_start_concept_constituents_job(SyncConceptConstituentsRequest())
+            ),
+            CronTrigger(day_of_week="mon-fri", hour=20, minute=30),
+            id="concept_constituents_daily",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            lambda: _submit_scheduler_task(safe_start_stock_analysis_job(SyncStockAnalysisRequest())),
+            CronTrigger(day_of_week="mon-fri", hour=21, minute=30),
+            id="stock_analysis_daily",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            lambda: _submit_scheduler_task(
+                safe_start_individual_fund_flow_job(SyncIndividualFundFlowRequest())
+            ),
+            CronTrigger(hour=19, minute=35),
+            id="individual_fund_flow_daily",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            lambda: _submit_scheduler_task(
+                safe_start_margin_account_job(SyncMarginAccountRequest())
+            ),
+            CronTrigger(hour=19, minute=37),
+            id="margin_account_daily",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            lambda: _submit_scheduler_task(
+                safe_start_market_fund_flow_job(SyncMarketFundFlowRequest())
+            ),
+            CronTrigger(hour=19, minute=38),
+            id="market_fund_flow_daily",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            lambda: _submit_scheduler_task(
+                safe_start_big_deal_fund_flow_job(SyncBigDealFundFlowRequest())
+            ),
+            CronTrigger(hour=19, minute=39),
+            id="big_deal_fund_flow_daily",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            lambda: _submit_scheduler_task(
+                safe_start_performance_express_job(SyncPerformanceExpressRequest())
+            ),
+            CronTrigger(hour=19, minute=20),
+            id="performance_express_daily",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            lambda: _submit_scheduler_task(
+                safe_start_performance_forecast_job(SyncPerformanceForecastRequest())
+            ),
+            CronTrigger(hour=19, minute=40),
+            id="performance_forecast_daily",
+            replace_existing=True,
+        )
+        reschedule_jobs(config)
+        scheduler.add_job(
+            lambda: _submit_scheduler_task(
+                safe_start_global_index_job(SyncGlobalIndexRequest())
+            ),
+            CronTrigger(minute=0),
+            id="global_index_hourly",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            lambda: _submit_scheduler_task(
+                safe_start_profit_forecast_job(SyncProfitForecastRequest())
+            ),
+            CronTrigger(hour=19, minute=45),
+            id="profit_forecast_daily",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            lambda: _submit_scheduler_task(
+                safe_start_macro_cpi_job(SyncMacroCpiRequest())
+            ),
+            CronTrigger(day=9, hour=22, minute=0),
+            id="macro_cpi_monthly_day9",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            lambda: _submit_scheduler_task(
+                safe_start_macro_cpi_job(SyncMacroCpiRequest())
+            ),
+            CronTrigger(day=10, hour=22, minute=0),
+            id="macro_cpi_monthly_day10",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            lambda: _submit_scheduler_task(
+                safe_start_macro_pmi_job(SyncMacroPmiRequest())
+            ),
+            CronTrigger(day=9, hour=22, minute=0),
+            id="macro_pmi_monthly_day9",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            lambda: _submit_scheduler_task(
+                safe_start_macro_pmi_job(SyncMacroPmiRequest())
+            ),
+            CronTrigger(day=10, hour=22, minute=0),
+            id="macro_pmi_monthly_day10",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            lambda: _submit_scheduler_task(
+                safe_start_macro_m2_job(SyncMacroM2Request())
+            ),
+            CronTrigger(day=10, hour=17, minute=1),
+            id="macro_m2_monthly_day10",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            lambda: _submit_scheduler_task(
+                safe_start_macro_m2_job(SyncMacroM2Request())
+            ),
+            CronTrigger(day=11, hour=17, minute=1),
+            id="macro_m2_monthly_day11",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            lambda: _submit_scheduler_task(
+                safe_start_macro_m2_job(SyncMacroM2Request())
+            ),
+            CronTrigger(day=12, hour=17, minute=1),
+            id="macro_m2_monthly_day12",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            lambda: _submit_scheduler_task(
+                safe_start_macro_ppi_job(SyncMacroPpiRequest())
+            ),
+            CronTrigger(day=9, hour=10, minute=0),
+            id="macro_ppi_monthly_day9",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            lambda: _submit_scheduler_task(
+                safe_start_macro_ppi_job(SyncMacroPpiRequest())
+            ),
+            CronTrigger(day=10, hour=10, minute=0),
+            id="macro_ppi_monthly_day10",
+            replace_existing=True,
+        )
+        _submit_scheduler_task(safe_start_trade_calendar_job(SyncTradeCalendarRequest()))
+        _submit_scheduler_task(
+            safe_start_global_flash_classification_job(SyncGlobalFlashClassifyRequest())
+        )
+        _submit_scheduler_task(safe_start_global_index_job(SyncGlobalIndexRequest()))
+        _maybe_queue_global_flash_sync("hourly")
+        if quote_poller:
+            configure_realtime_quote_poller(config)
+
+
+def stop_scheduler() -> None:
+    """Stop the realtime quote poller and the scheduler."""
+    if realtime_quote_poller is not None:
+        realtime_quote_poller.stop(timeout=2.0)
+    if scheduler.running:
+        scheduler.shutdown(wait=False)
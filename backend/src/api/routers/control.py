@@ -0,0 +1,1278 @@
+"""
+Control panel endpoints: job status, runtime configuration and manual sync triggers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from fastapi import APIRouter, Body
+from fastapi.responses import JSONResponse
+
+from ...config.runtime_config import (
+    RuntimeConfig,
+    VolumeSurgeConfig,
+    ObservationStrategyConfig,
+    load_runtime_config,
+    save_runtime_config,
+    normalize_concept_alias_map,
+)
+from ...config.settings import load_settings
+from ...dao import (
+    DailyIndicatorDAO,
+    DailyTradeDAO,
+    DailyTradeMetricsDAO,
+    FinancialIndicatorDAO,
+    NewsArticleDAO,
+    MarketInsightDAO,
+    NewsSectorInsightDAO,
+    IndexHistoryDAO,
+    TradeCalendarDAO,
+    IncomeStatementDAO,
+    FundamentalMetricsDAO,
+    PerformanceExpressDAO,
+    PerformanceForecastDAO,
+    ProfitForecastDAO,
+    GlobalIndexHistoryDAO,
+    RealtimeIndexDAO,
+    DollarIndexDAO,
+    RmbMidpointDAO,
+    FuturesRealtimeDAO,
+    FedStatementDAO,
+    PeripheralInsightDAO,
+    MacroLeverageDAO,
+    MacroSocialFinancingDAO,
+    MacroCpiDAO,
+    MacroPmiDAO,
+    MacroM2DAO,
+    MacroPpiDAO,
+    MacroLprDAO,
+    MacroShiborDAO,
+    MacroInsightDAO,
+    IndustryFundFlowDAO,
+    ConceptFundFlowDAO,
+    ConceptIndexHistoryDAO,
+    ConceptDirectoryDAO,
+    ConceptInsightDAO,
+    IndustryInsightDAO,
+    IndividualFundFlowDAO,
+    BigDealFundFlowDAO,
+    MarginAccountDAO,
+    MarketActivityDAO,
+    MarketFundFlowDAO,
+    StockBasicDAO,
+    StockMainBusinessDAO,
+    StockMainCompositionDAO,
+    CashflowStatementDAO,
+    BalanceSheetDAO,
+)
+from ...services import (
+    sync_daily_indicator,
+    sync_financial_indicators,
+    sync_finance_breakfast,
+    sync_global_flash,
+    classify_relevance_batch,
+    classify_impact_batch,
+    sync_income_statements,
+    sync_cashflow_statements,
+    sync_balance_sheets,
+    sync_daily_trade,
+    sync_daily_trade_metrics,
+    sync_fundamental_metrics,
+    sync_stock_basic,
+)
+from ...state import monitor
+from ..common import _parse_time_string
+from ..schemas import (
+    SyncDailyTradeRequest,
+    SyncDailyTradeResponse,
+    SyncDailyTradeMetricsRequest,
+    SyncDailyTradeMetricsResponse,
+    SyncFundamentalMetricsRequest,
+    SyncFundamentalMetricsResponse,
+    SyncStockBasicRequest,
+    SyncStockBasicResponse,
+    SyncDailyIndicatorRequest,
+    SyncDailyIndicatorResponse,
+    SyncIncomeStatementRequest,
+    SyncIncomeStatementResponse,
+    SyncFinancialIndicatorRequest,
+    SyncFinancialIndicatorResponse,
+    SyncCashflowRequest,
+    SyncCashflowResponse,
+    SyncBalanceSheetRequest,
+    SyncBalanceSheetResponse,
+    SyncFinanceBreakfastRequest,
+    SyncGlobalFlashRequest,
+    SyncGlobalFlashResponse,
+    SyncConceptDirectoryRequest,
+    SyncTradeCalendarRequest,
+    SyncPricePanelRequest,
+    SyncGlobalFlashClassifyRequest,
+    SyncGlobalFlashClassifyResponse,
+    SyncPerformanceExpressRequest,
+    SyncMarketInsightRequest,
+    SyncSectorInsightRequest,
+    ResetJobRequest,
+    SyncIndexHistoryRequest,
+    SyncPerformanceForecastRequest,
+    SyncProfitForecastRequest,
+    SyncGlobalIndexRequest,
+    SyncRealtimeIndexRequest,
+    SyncDollarIndexRequest,
+    SyncRmbMidpointRequest,
+    SyncMacroLeverageRequest,
+    SyncSocialFinancingRequest,
+    SyncMacroCpiRequest,
+    SyncMacroPmiRequest,
+    SyncMacroM2Request,
+    SyncMacroPpiRequest,
+    SyncMacroLprRequest,
+    SyncMacroShiborRequest,
+    SyncFuturesRealtimeRequest,
+    SyncFedStatementRequest,
+    SyncPeripheralInsightRequest,
+    SyncPeripheralAggregateRequest,
+    SyncMacroAggregateRequest,
+    SyncFundFlowAggregateRequest,
+    SyncIndustryFundFlowRequest,
+    SyncConceptFundFlowRequest,
+    SyncConceptIndexHistoryRequest,
+    SyncConceptConstituentsRequest,
+    SyncSectorVolumePriceRequest,
+    SyncStockAnalysisRequest,
+    SyncConceptInsightRequest,
+    SyncIndustryInsightRequest,
+    SyncIndividualFundFlowRequest,
+    SyncBigDealFundFlowRequest,
+    SyncMarginAccountRequest,
+    SyncMarketActivityRequest,
+    SyncMarketFundFlowRequest,
+    SyncMacroInsightRequest,
+    SyncStockMainBusinessRequest,
+    SyncStockMainCompositionRequest,
+    IndicatorRealtimeRequest,
+    SyncFinanceBreakfastResponse,
+    VolumeSurgeConfigPayload,
+    ObservationPoolConfigPayload,
+    RuntimeConfigPayload,
+    JobStatusPayload,
+    ControlStatusResponse,
+)
+from ..jobs import (
+    scheduler,
+    job_queue_enabled,
+    reset_job,
+    start_concept_directory_job,
+    start_stock_basic_job,
+    start_daily_trade_job,
+    start_daily_trade_metrics_job,
+    start_daily_indicator_job,
+    start_income_statement_job,
+    start_cashflow_statement_job,
+    start_balance_sheet_job,
+    start_financial_indicator_job,
+    start_fundamental_metrics_job,
+    start_performance_express_job,
+    start_performance_forecast_job,
+    start_profit_forecast_job,
+    start_market_insight_job,
+    start_sector_insight_job,
+    start_global_index_job,
+    start_realtime_index_job,
+    start_realtime_trade_job,
+    start_index_history_job,
+    start_dollar_index_job,
+    start_rmb_midpoint_job,
+    start_macro_leverage_job,
+    start_social_financing_job,
+    start_macro_cpi_job,
+    start_macro_pmi_job,
+    start_macro_m2_job,
+    start_macro_ppi_job,
+    start_macro_lpr_job,
+    start_macro_shibor_job,
+    start_futures_realtime_job,
+    start_fed_statement_job,
+    start_peripheral_insight_job,
+    start_macro_aggregate_job,
+    start_peripheral_aggregate_job,
+    start_fund_flow_aggregate_job,
+    start_industry_fund_flow_job,
+    start_concept_fund_flow_job,
+    start_concept_index_history_job,
+    start_concept_constituents_job,
+    start_sector_volume_price_job,
+    start_stock_analysis_job,
+    start_individual_fund_flow_job,
+    start_big_deal_fund_flow_job,
+    start_margin_account_job,
+    start_stock_main_business_job,
+    start_stock_main_composition_job,
+    start_finance_breakfast_job,
+    start_global_flash_job,
+    start_price_panel_job,
+    start_trade_calendar_job,
+    start_global_flash_classification_job,
+    reschedule_jobs,
+    configure_realtime_quote_poller,
+    start_market_activity_job,
+    start_market_fund_flow_job,
+    start_macro_insight_job,
+    start_concept_insight_job,
+    start_industry_insight_job,
+)
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+def _normalize_time_string(value: str) -> str:
+    hour, minute = _parse_time_string(value)
+    return f"{hour:02d}:{minute:02d}"
+
+
+def _runtime_config_to_payload(config: RuntimeConfig) -> RuntimeConfigPayload:
+    return RuntimeConfigPayload(
+        include_st=config.include_st,
+        include_delisted=config.include_delisted,
+        daily_trade_window_days=config.daily_trade_window_days,
+        peripheral_aggregate_time=config.peripheral_aggregate_time,
+        global_flash_frequency_minutes=config.global_flash_frequency_minutes,
+        realtime_quote_poller_enabled=config.realtime_quote_poller_enabled,
+        realtime_quote_interval_seconds=config.realtime_quote_interval_seconds,
+        big_deal_retention_days=config.big_deal_retention_days,
+        sector_index_source=config.sector_index_source,
+        concept_constituent_ttl_hours=config.concept_constituent_ttl_hours,
+        concept_alias_map=config.concept_alias_map,
+        volume_surge_config=VolumeSurgeConfigPayload(
+            min_volume_ratio=config.volume_surge_config.min_volume_ratio,
+            breakout_threshold_percent=config.volume_surge_config.breakout_threshold_percent,
+            daily_change_threshold_percent=config.volume_surge_config.daily_change_threshold_percent,
+            max_range_percent=config.volume_surge_config.max_range_percent,
+        ),
+        observation_strategy_config=ObservationPoolConfigPayload(
+            lookback_days=config.observation_strategy_config.lookback_days,
+            min_history=config.observation_strategy_config.min_history,
+            breakout_buffer_percent=config.observation_strategy_config.breakout_buffer_percent,
+            max_range_percent=config.observation_strategy_config.max_range_percent,
+            volume_ratio_threshold=config.observation_strategy_config.volume_ratio_threshold,
+            volume_average_window=config.observation_strategy_config.volume_average_window,
+            max_weekly_gain_percent=config.observation_strategy_config.max_weekly_gain_percent,
+            require_big_deal_inflow=config.observation_strategy_config.require_big_deal_inflow,
+        ),
+    )
+
+
+@router.get("/control/status", response_model=ControlStatusResponse)
+def get_control_status() -> ControlStatusResponse:
+    config = load_runtime_config()
+    settings = load_settings()
+
+    stats_map: Dict[str, dict] = {}
+    try:
+        stats_map["stock_basic"] = StockBasicDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect stock_basic stats: %s", exc)
+        stats_map["stock_basic"] = {}
+    try:
+        stats_map["daily_trade"] = DailyTradeDAO(settings.postgres).stats()
+        stats_map["realtime_trade"] = stats_map["daily_trade"]
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect daily_trade stats: %s", exc)
+        stats_map["daily_trade"] = {}
+        stats_map["realtime_trade"] = {}
+    try:
+        stats_map["daily_indicator"] = DailyIndicatorDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect daily_indicator stats: %s", exc)
+        stats_map["daily_indicator"] = {}
+    try:
+        stats_map["daily_trade_metrics"] = DailyTradeMetricsDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect daily_trade_metrics stats: %s", exc)
+        stats_map["daily_trade_metrics"] = {}
+    try:
+        stats_map["fundamental_metrics"] = FundamentalMetricsDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect fundamental_metrics stats: %s", exc)
+        stats_map["fundamental_metrics"] = {}
+    try:
+        stats_map["income_statement"] = IncomeStatementDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect income_statement stats: %s", exc)
+        stats_map["income_statement"] = {}
+    try:
+        stats_map["financial_indicator"] = FinancialIndicatorDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect financial_indicator stats: %s", exc)
+        stats_map["financial_indicator"] = {}
+    try:
+        stats_map["cashflow_statements"] = CashflowStatementDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect cashflow_statements stats: %s", exc)
+        stats_map["cashflow_statements"] = {}
+    try:
+        stats_map["balance_sheet_statements"] = BalanceSheetDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect balance_sheet_statements stats: %s", exc)
+        stats_map["balance_sheet_statements"] = {}
+    try:
+        stats_map["performance_express"] = PerformanceExpressDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect performance_express stats: %s", exc)
+        stats_map["performance_express"] = {}
+    try:
+        stats_map["performance_forecast"] = PerformanceForecastDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect performance_forecast stats: %s", exc)
+        stats_map["performance_forecast"] = {}
+    try:
+        stats_map["profit_forecast"] = ProfitForecastDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect profit_forecast stats: %s", exc)
+        stats_map["profit_forecast"] = {}
+    try:
+        stats_map["global_index"] = GlobalIndexHistoryDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect global_index stats: %s", exc)
+        stats_map["global_index"] = {}
+    try:
+        stats_map["realtime_index"] = RealtimeIndexDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect realtime_index stats: %s", exc)
+        stats_map["realtime_index"] = {}
+    try:
+        stats_map["dollar_index"] = DollarIndexDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect dollar_index stats: %s", exc)
+        stats_map["dollar_index"] = {}
+    try:
+        stats_map["rmb_midpoint"] = RmbMidpointDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect rmb_midpoint stats: %s", exc)
+        stats_map["rmb_midpoint"] = {}
+    try:
+        stats_map["index_history"] = IndexHistoryDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect index_history stats: %s", exc)
+        stats_map["index_history"] = {}
+    try:
+        stats_map["futures_realtime"] = FuturesRealtimeDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect futures_realtime stats: %s", exc)
+        stats_map["futures_realtime"] = {}
+    try:
+        stats_map["fed_statements"] = FedStatementDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect fed_statements stats: %s", exc)
+        stats_map["fed_statements"] = {}
+    try:
+        stats_map["peripheral_insight"] = PeripheralInsightDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect peripheral_insight stats: %s", exc)
+        stats_map["peripheral_insight"] = {}
+    try:
+        stats_map["macro_insight"] = MacroInsightDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect macro_insight stats: %s", exc)
+        stats_map["macro_insight"] = {}
+    try:
+        stats_map["leverage_ratio"] = MacroLeverageDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect leverage_ratio stats: %s", exc)
+        stats_map["leverage_ratio"] = {}
+    try:
+        stats_map["social_financing"] = MacroSocialFinancingDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect social_financing stats: %s", exc)
+        stats_map["social_financing"] = {}
+    try:
+        stats_map["cpi_monthly"] = MacroCpiDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect cpi_monthly stats: %s", exc)
+        stats_map["cpi_monthly"] = {}
+    try:
+        stats_map["pmi_monthly"] = MacroPmiDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect pmi_monthly stats: %s", exc)
+        stats_map["pmi_monthly"] = {}
+    try:
+        stats_map["m2_monthly"] = MacroM2DAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect m2_monthly stats: %s", exc)
+        stats_map["m2_monthly"] = {}
+    try:
+        stats_map["ppi_monthly"] = MacroPpiDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect ppi_monthly stats: %s", exc)
+        stats_map["ppi_monthly"] = {}
+    try:
+        stats_map["lpr_rate"] = MacroLprDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect lpr_rate stats: %s", exc)
+        stats_map["lpr_rate"] = {}
+    try:
+        stats_map["shibor_rate"] = MacroShiborDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect shibor_rate stats: %s", exc)
+        stats_map["shibor_rate"] = {}
+    try:
+        stats_map["industry_fund_flow"] = IndustryFundFlowDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect industry_fund_flow stats: %s", exc)
+        stats_map["industry_fund_flow"] = {}
+    try:
+        stats_map["concept_fund_flow"] = ConceptFundFlowDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect concept_fund_flow stats: %s", exc)
+        stats_map["concept_fund_flow"] = {}
+    try:
+        stats_map["concept_index_history"] = ConceptIndexHistoryDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect concept_index_history stats: %s", exc)
+        stats_map["concept_index_history"] = {}
+    try:
+        stats_map["concept_directory"] = ConceptDirectoryDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect concept_directory stats: %s", exc)
+        stats_map["concept_directory"] = {}
+    try:
+        stats_map["concept_insight"] = ConceptInsightDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect concept_insight stats: %s", exc)
+        stats_map["concept_insight"] = {}
+    else:
+        stats = stats_map["concept_insight"]
+        if isinstance(stats, dict) and "latest" in stats and "updated_at" not in stats:
+            stats["updated_at"] = stats.get("latest")
+    try:
+        stats_map["industry_insight"] = IndustryInsightDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect industry_insight stats: %s", exc)
+        stats_map["industry_insight"] = {}
+    else:
+        stats = stats_map["industry_insight"]
+        if isinstance(stats, dict) and "latest" in stats and "updated_at" not in stats:
+            stats["updated_at"] = stats.get("latest")
+    try:
+        stats_map["individual_fund_flow"] = IndividualFundFlowDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect individual_fund_flow stats: %s", exc)
+        stats_map["individual_fund_flow"] = {}
+    try:
+        stats_map["big_deal_fund_flow"] = BigDealFundFlowDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect big_deal_fund_flow stats: %s", exc)
+        stats_map["big_deal_fund_flow"] = {}
+    try:
+        stats_map["margin_account"] = MarginAccountDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect margin_account stats: %s", exc)
+        stats_map["margin_account"] = {}
+    try:
+        activity_dao = MarketActivityDAO(settings.postgres)
+        activity_result = activity_dao.list_entries()
+        stats_map["market_activity"] = {
+            "count": len(activity_result.get("items", [])),
+            "updated_at": activity_result.get("dataset_timestamp"),
+        }
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect market_activity stats: %s", exc)
+        stats_map["market_activity"] = {}
+    try:
+        fund_flow_dao = MarketFundFlowDAO(settings.postgres)
+        entries = fund_flow_dao.list_entries(limit=1)
+        items = entries.get("items", [])
+        latest = items[0] if items else None
+        stats_map["market_fund_flow"] = {
+            "count": len(items),
+            "updated_at": latest.get("trade_date") if latest else None,
+        }
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect market_fund_flow stats: %s", exc)
+        stats_map["market_fund_flow"] = {}
+    try:
+        stats_map["stock_main_business"] = StockMainBusinessDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect stock_main_business stats: %s", exc)
+        stats_map["stock_main_business"] = {}
+    try:
+        stats_map["stock_main_composition"] = StockMainCompositionDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect stock_main_composition stats: %s", exc)
+        stats_map["stock_main_composition"] = {}
+    news_dao = NewsArticleDAO(settings.postgres)
+    try:
+        stats_map["finance_breakfast"] = news_dao.stats(source="finance_breakfast")
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect finance_breakfast stats: %s", exc)
+        stats_map["finance_breakfast"] = {}
+    try:
+        stats_map["global_flash"] = news_dao.stats(source="global_flash")
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect global_flash stats: %s", exc)
+        stats_map["global_flash"] = {}
+    try:
+        stats_map["trade_calendar"] = TradeCalendarDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect trade_calendar stats: %s", exc)
+        stats_map["trade_calendar"] = {}
+    try:
+        stats_map["market_insight"] = MarketInsightDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect market_insight stats: %s", exc)
+        stats_map["market_insight"] = {}
+    else:
+        stats = stats_map["market_insight"]
+        if isinstance(stats, dict) and "latest" in stats and "updated_at" not in stats:
+            stats["updated_at"] = stats.get("latest")
+    try:
+        stats_map["sector_insight"] = NewsSectorInsightDAO(settings.postgres).stats()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to collect sector_insight stats: %s", exc)
+        stats_map["sector_insight"] = {}
+
+    stats_map.setdefault("fund_flow_aggregate", {})
+
+    jobs: Dict[str, JobStatusPayload] = {}
+    for name, info in monitor.snapshot().items():
+        stats = stats_map.get(name, {})
+        finished_at = info.get("finishedAt") or stats.get("updated_at")
+        if finished_at is not None and hasattr(finished_at, "isoformat"):
+            finished_at = finished_at.isoformat()
+        total_rows = info.get("totalRows")
+        if total_rows is None:
+            total_rows = stats.get("count")
+        if total_rows is not None:
+            try:
+                total_rows = int(total_rows)
+            except (TypeError, ValueError):
+                pass
+        logger.debug(
+            "control status job=%s snapshot=%s stats=%s -> finished=%s total=%s",
+            name,
+            info,
+            stats,
+            finished_at,
+            total_rows,
+        )
+        jobs[name] = JobStatusPayload(
+            status=info.get("status"),
+            started_at=info.get("startedAt"),
+            finished_at=finished_at,
+            progress=info.get("progress", 0.0),
+            message=info.get("message"),
+            total_rows=total_rows,
+            last_duration=info.get("lastDuration"),
+            last_market=info.get("lastMarket"),
+            error=info.get("error"),
+        )
+
+    for name, stats in stats_map.items():
+        if name in jobs:
+            continue
+        finished_at = stats.get("updated_at")
+        if finished_at is not None and hasattr(finished_at, "isoformat"):
+            finished_at = finished_at.isoformat()
+        total_rows = stats.get("count")
+        if total_rows is not None:
+            try:
+                total_rows = int(total_rows)
+            except (TypeError, ValueError):
+                pass
+        jobs[name] = JobStatusPayload(
+            status="idle",
+            started_at=None,
+            finished_at=finished_at,
+            progress=0.0,
+            message=None,
+            total_rows=total_rows,
+            last_duration=None,
+            last_market=None,
+            error=None,
+        )
+
+    return ControlStatusResponse(jobs=jobs, config=_runtime_config_to_payload(config))
+
+
+@router.put("/control/config", response_model=RuntimeConfigPayload)
+def update_runtime_config(payload: RuntimeConfigPayload) -> RuntimeConfigPayload:
+    existing = load_runtime_config()
+    time_input = payload.peripheral_aggregate_time if payload.peripheral_aggregate_time else existing.peripheral_aggregate_time
+    peripheral_time = _normalize_time_string(time_input or "06:00")
+    frequency_value = payload.global_flash_frequency_minutes or existing.global_flash_frequency_minutes
+    try:
+        frequency_value = int(frequency_value)
+    except (TypeError, ValueError):
+        frequency_value = existing.global_flash_frequency_minutes
+    if frequency_value <= 0:
+        frequency_value = existing.global_flash_frequency_minutes or 180
+    frequency_value = max(10, min(frequency_value, 1440))
+    alias_field_provided = "concept_alias_map" in payload.__fields_set__
+    if alias_field_provided:
+        alias_map = normalize_concept_alias_map(payload.concept_alias_map or {})
+    else:
+        alias_map = existing.concept_alias_map
+    volume_field_provided = "volume_surge_config" in payload.__fields_set__
+    if volume_field_provided and payload.volume_surge_config is not None:
+        surge_payload = payload.volume_surge_config
+        volume_surge = VolumeSurgeConfig(
+            min_volume_ratio=surge_payload.min_volume_ratio,
+            breakout_threshold_percent=surge_payload.breakout_threshold_percent,
+            daily_change_threshold_percent=surge_payload.daily_change_threshold_percent,
+            max_range_percent=surge_payload.max_range_percent,
+        )
+    else:
+        volume_surge = existing.volume_surge_config
+    observation_field_provided = "observation_strategy_config" in payload.__fields_set__
+    if observation_field_provided and payload.observation_strategy_config is not None:
+        observation_payload = payload.observation_strategy_config
+        observation_config = ObservationStrategyConfig(
+            lookback_days=observation_payload.lookback_days,
+            min_history=observation_payload.min_history,
+            breakout_buffer_percent=observation_payload.breakout_buffer_percent,
+            max_range_percent=observation_payload.max_range_percent,
+            volume_ratio_threshold=observation_payload.volume_ratio_threshold,
+            volume_average_window=observation_payload.volume_average_window,
+            max_weekly_gain_percent=observation_payload.max_weekly_gain_percent,
+            require_big_deal_inflow=observation_payload.require_big_deal_inflow,
+        )
+    else:
+        observation_config = existing.observation_strategy_config
+    if "realtime_quote_poller_enabled" in payload.__fields_set__:
+        poller_enabled = payload.realtime_quote_poller_enabled
+    else:
+        poller_enabled = existing.realtime_quote_poller_enabled
+    if "realtime_quote_interval_seconds" in payload.__fields_set__:
+        poller_interval = payload.realtime_quote_interval_seconds
+    else:
+        poller_interval = existing.realtime_quote_interval_seconds
+    if "big_deal_retention_days" in payload.__fields_set__:
+        big_deal_retention_days = payload.big_deal_retention_days
+    else:
+        big_deal_retention_days = existing.big_deal_retention_days
+    if "sector_index_source" in payload.__fields_set__:
+        sector_index_source = payload.sector_index_source
+    else:
+        sector_index_source = existing.sector_index_source
+    if "concept_constituent_ttl_hours" in payload.__fields_set__:
+        concept_constituent_ttl_hours = payload.concept_constituent_ttl_hours
+    else:
+        concept_constituent_ttl_hours = existing.concept_constituent_ttl_hours
+    config = RuntimeConfig(
+        include_st=payload.include_st,
+        include_delisted=payload.include_delisted,
+        daily_trade_window_days=payload.daily_trade_window_days,
+        peripheral_aggregate_time=peripheral_time,
+        global_flash_frequency_minutes=frequency_value,
+        realtime_quote_poller_enabled=poller_enabled,
+        realtime_quote_interval_seconds=poller_interval,
+        big_deal_retention_days=big_deal_retention_days,
+        sector_index_source=sector_index_source,
+        concept_constituent_ttl_hours=concept_constituent_ttl_hours,
+        concept_alias_map=alias_map,
+        volume_surge_config=volume_surge,
+        observation_strategy_config=observation_config,
+    )
+    save_runtime_config(config)
+    if scheduler.running:
+        reschedule_jobs(config)
+    if scheduler.running or job_queue_enabled():
+        # With the job queue enabled the worker reloads its schedules from the saved
+        # config; the realtime quote poller always lives in the API process.
+        configure_realtime_quote_poller(config)
+    return _runtime_config_to_payload(config)
+
+
+@router.post("/control/sync/market-insight")
+async def control_sync_market_insight(payload: SyncMarketInsightRequest) -> dict[str, str]:
+    await start_market_insight_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/reset-job")
+async def control_reset_job(payload: ResetJobRequest) -> dict[str, str]:
+    job = payload.job
+    await reset_job(job)
+    return {"status": "reset"}
+
+
+@router.post("/control/sync/sector-insight")
+async def control_sync_sector_insight(payload: SyncSectorInsightRequest) -> dict[str, str]:
+    await start_sector_insight_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/stock-basic")
+async def control_sync_stock_basic(payload: SyncStockBasicRequest) -> dict[str, str]:
+    await start_stock_basic_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/concept-directory")
+async def control_sync_concept_directory(payload: SyncConceptDirectoryRequest) -> dict[str, str]:
+    if not payload.refresh:
+        return {"status": "skipped"}
+    await start_concept_directory_job()
+    return {"status": "started"}
+
+
+@router.post("/control/sync/daily-trade")
+async def control_sync_daily_trade(payload: SyncDailyTradeRequest) -> dict[str, str]:
+    await start_daily_trade_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/daily-trade-metrics")
+async def control_sync_daily_trade_metrics(payload: SyncDailyTradeMetricsRequest) -> dict[str, str]:
+    await start_daily_trade_metrics_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/fundamental-metrics")
+async def control_sync_fundamental_metrics(payload: SyncFundamentalMetricsRequest) -> dict[str, str]:
+    await start_fundamental_metrics_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/daily-indicators")
+async def control_sync_daily_indicators(payload: SyncDailyIndicatorRequest) -> dict[str, str]:
+    await start_daily_indicator_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/income-statements")
+async def control_sync_income_statements(payload: SyncIncomeStatementRequest) -> dict[str, str]:
+    await start_income_statement_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/financial-indicators")
+async def control_sync_financial_indicators(payload: SyncFinancialIndicatorRequest) -> dict[str, str]:
+    await start_financial_indicator_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/cashflow-statements")
+async def control_sync_cashflow_statements(payload: SyncCashflowRequest) -> dict[str, str]:
+    await start_cashflow_statement_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/balance-sheet-statements")
+async def control_sync_balance_sheet_statements(payload: SyncBalanceSheetRequest) -> dict[str, str]:
+    await start_balance_sheet_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/performance-express")
+async def control_sync_performance_express(payload: SyncPerformanceExpressRequest) -> dict[str, str]:
+    await start_performance_express_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/performance-forecast")
+async def control_sync_performance_forecast(payload: SyncPerformanceForecastRequest) -> dict[str, str]:
+    await start_performance_forecast_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/profit-forecast")
+async def control_sync_profit_forecast(payload: SyncProfitForecastRequest) -> dict[str, str]:
+    await start_profit_forecast_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/global-indices")
+async def control_sync_global_indices(
+    payload: Optional[SyncGlobalIndexRequest] = Body(default=None),
+) -> dict[str, str]:
+    await start_global_index_job(payload or SyncGlobalIndexRequest())
+    return {"status": "started"}
+
+
+@router.post("/control/sync/dollar-index")
+async def control_sync_dollar_index(payload: SyncDollarIndexRequest) -> dict[str, str]:
+    await start_dollar_index_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/rmb-midpoint")
+async def control_sync_rmb_midpoint(payload: SyncRmbMidpointRequest) -> dict[str, str]:
+    await start_rmb_midpoint_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/leverage-ratio")
+async def control_sync_leverage_ratio(payload: SyncMacroLeverageRequest) -> dict[str, str]:
+    await start_macro_leverage_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/cpi")
+async def control_sync_cpi(payload: SyncMacroCpiRequest) -> dict[str, str]:
+    await start_macro_cpi_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/pmi")
+async def control_sync_pmi(payload: SyncMacroPmiRequest) -> dict[str, str]:
+    await start_macro_pmi_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/m2")
+async def control_sync_m2(payload: SyncMacroM2Request) -> dict[str, str]:
+    await start_macro_m2_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/ppi")
+async def control_sync_ppi(payload: SyncMacroPpiRequest) -> dict[str, str]:
+    await start_macro_ppi_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/lpr")
+async def control_sync_lpr(payload: SyncMacroLprRequest) -> dict[str, str]:
+    await start_macro_lpr_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/pbc-rate")
+async def control_sync_pbc_rate(payload: SyncMacroLprRequest) -> dict[str, str]:
+    await start_macro_lpr_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/shibor")
+async def control_sync_shibor(payload: SyncMacroShiborRequest) -> dict[str, str]:
+    await start_macro_shibor_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/social-financing")
+async def control_sync_social_financing(payload: SyncSocialFinancingRequest) -> dict[str, str]:
+    await start_social_financing_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/futures-realtime")
+async def control_sync_futures_realtime(payload: SyncFuturesRealtimeRequest) -> dict[str, str]:
+    await start_futures_realtime_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/realtime-trade")
+async def control_sync_realtime_trade(payload: IndicatorRealtimeRequest) -> dict[str, str]:
+    await start_realtime_trade_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/fed-statements")
+async def control_sync_fed_statements(payload: SyncFedStatementRequest) -> dict[str, str]:
+    await start_fed_statement_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/macro-aggregate")
+async def control_sync_macro_aggregate(payload: SyncMacroAggregateRequest) -> dict[str, str]:
+    await start_macro_aggregate_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/macro-insight")
+async def control_sync_macro_insight(payload: SyncMacroInsightRequest) -> dict[str, str]:
+    await start_macro_insight_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/fund-flow-aggregate")
+async def control_sync_fund_flow_aggregate(payload: SyncFundFlowAggregateRequest) -> dict[str, str]:
+    await start_fund_flow_aggregate_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/peripheral-aggregate")
+async def control_sync_peripheral_aggregate(payload: SyncPeripheralAggregateRequest) -> dict[str, str]:
+    await start_peripheral_aggregate_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/peripheral-summary")
+async def control_sync_peripheral_summary(payload: SyncPeripheralInsightRequest) -> dict[str, str]:
+    await start_peripheral_insight_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/industry-fund-flow")
+async def control_sync_industry_fund_flow(payload: SyncIndustryFundFlowRequest) -> dict[str, str]:
+    await start_industry_fund_flow_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/concept-fund-flow")
+async def control_sync_concept_fund_flow(payload: SyncConceptFundFlowRequest) -> dict[str, str]:
+    await start_concept_fund_flow_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/concept-index-history")
+async def control_sync_concept_index_history(payload: SyncConceptIndexHistoryRequest) -> dict[str, str]:
+    await start_concept_index_history_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/concept-insight")
+async def control_sync_concept_insight(payload: SyncConceptInsightRequest) -> dict[str, str]:
+    await start_concept_insight_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/industry-insight")
+async def control_sync_industry_insight(payload: SyncIndustryInsightRequest) -> dict[str, str]:
+    await start_industry_insight_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/individual-fund-flow")
+async def control_sync_individual_fund_flow(payload: SyncIndividualFundFlowRequest) -> dict[str, str]:
+    await start_individual_fund_flow_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/concept-constituents")
+async def control_sync_concept_constituents(payload: SyncConceptConstituentsRequest) -> dict[str, str]:
+    await start_concept_constituents_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/sector-volume-price")
+async def control_sync_sector_volume_price(payload: SyncSectorVolumePriceRequest) -> dict[str, str]:
+    await start_sector_volume_price_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/stock-analysis")
+async def control_sync_stock_analysis(payload: SyncStockAnalysisRequest) -> dict[str, str]:
+    await start_stock_analysis_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/big-deal-fund-flow")
+async def control_sync_big_deal_fund_flow(payload: SyncBigDealFundFlowRequest) -> dict[str, str]:
+    await start_big_deal_fund_flow_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/margin-account")
+async def control_sync_margin_account(payload: SyncMarginAccountRequest) -> dict[str, str]:
+    await start_margin_account_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/market-fund-flow")
+async def control_sync_market_fund_flow(payload: SyncMarketFundFlowRequest) -> dict[str, str]:
+    await start_market_fund_flow_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/market-activity")
+async def control_sync_market_activity(payload: SyncMarketActivityRequest) -> dict[str, str]:
+    await start_market_activity_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/stock-main-business")
+async def control_sync_stock_main_business(payload: SyncStockMainBusinessRequest) -> dict[str, str]:
+    await start_stock_main_business_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/stock-main-composition")
+async def control_sync_stock_main_composition(payload: SyncStockMainCompositionRequest) -> dict[str, str]:
+    await start_stock_main_composition_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/finance-breakfast")
+async def control_sync_finance_breakfast(payload: SyncFinanceBreakfastRequest) -> dict[str, str]:
+    await start_finance_breakfast_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/global-flash")
+async def control_sync_global_flash(payload: SyncGlobalFlashRequest) -> dict[str, str]:
+    await start_global_flash_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/realtime-indices")
+async def control_sync_realtime_indices(payload: SyncRealtimeIndexRequest) -> dict[str, str]:
+    await start_realtime_index_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/index-history")
+async def control_sync_index_history(payload: SyncIndexHistoryRequest) -> dict[str, str]:
+    await start_index_history_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/global-flash-classification")
+async def control_sync_global_flash_classification(payload: SyncGlobalFlashClassifyRequest) -> dict[str, str]:
+    await start_global_flash_classification_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/price-panel")
+async def control_sync_price_panel(payload: SyncPricePanelRequest) -> dict[str, str]:
+    await start_price_panel_job(payload)
+    return {"status": "started"}
+
+
+@router.post("/control/sync/trade-calendar")
+async def control_sync_trade_calendar(payload: SyncTradeCalendarRequest) -> dict[str, str]:
+    await start_trade_calendar_job(payload)
+    return {"status": "started"}
+
+
+@router.get("/control/debug/stats", include_in_schema=False)
+def control_debug_stats() -> dict[str, object]:
+    settings = load_settings()
+    news_dao = NewsArticleDAO(settings.postgres)
+    return {
+        "stats": {
+            "stock_basic": StockBasicDAO(settings.postgres).stats(),
+            "daily_trade": DailyTradeDAO(settings.postgres).stats(),
+            "daily_indicator": DailyIndicatorDAO(settings.postgres).stats(),
+            "daily_trade_metrics": DailyTradeMetricsDAO(settings.postgres).stats(),
+            "income_statement": IncomeStatementDAO(settings.postgres).stats(),
+            "financial_indicator": FinancialIndicatorDAO(settings.postgres).stats(),
+            "finance_breakfast": news_dao.stats(source="finance_breakfast"),
+            "global_flash": news_dao.stats(source="global_flash"),
+            "realtime_index": RealtimeIndexDAO(settings.postgres).stats(),
+            "index_history": IndexHistoryDAO(settings.postgres).stats(),
+            "trade_calendar": TradeCalendarDAO(settings.postgres).stats(),
+            "fundamental_metrics": FundamentalMetricsDAO(settings.postgres).stats(),
+            "stock_main_business": StockMainBusinessDAO(settings.postgres).stats(),
+            "stock_main_composition": StockMainCompositionDAO(settings.postgres).stats(),
+            "market_insight": MarketInsightDAO(settings.postgres).stats(),
+            "sector_insight": NewsSectorInsightDAO(settings.postgres).stats(),
+        },
+        "monitor": monitor.snapshot(),
+    }
+
+
+# Backwards compatible endpoints
+
+
+def _queued_with_worker(
+    start_job: Callable[[Any], Awaitable[None]],
+) -> Callable[[Callable[[Any], Any]], Callable[[Any], Awaitable[Any]]]:
+    """Run a blocking legacy sync in a thread, or queue its job when the worker is enabled.
+
+    With the job queue enabled the sync must not run in the API process; the request is
+    handed to the worker through ``start_job`` and answered with ``202 {"status": "queued"}``.
+    """
+
+    def decorator(handler: Callable[[Any], Any]) -> Callable[[Any], Awaitable[Any]]:
+        @functools.wraps(handler)
+        async def wrapper(payload: Any) -> Any:
+            if job_queue_enabled():
+                await start_job(payload)
+                return JSONResponse(status_code=202, content={"status": "queued"})
+            return await asyncio.to_thread(handler, payload)
+
+        return wrapper
+
+    return decorator
+
+
+@router.post("/sync/stock-basic", response_model=SyncStockBasicResponse)
+@_queued_with_worker(start_stock_basic_job)
+def trigger_stock_basic_sync(payload: SyncStockBasicRequest) -> SyncStockBasicResponse:
+    rows = sync_stock_basic(
+        list_statuses=tuple(payload.list_statuses or ["L", "D", "P"]),
+        market=payload.market,
+    )
+    return SyncStockBasicResponse(rows=rows)
+
+
+@router.post("/sync/daily-trade", response_model=SyncDailyTradeResponse)
+@_queued_with_worker(start_daily_trade_job)
+def trigger_daily_trade_sync(payload: SyncDailyTradeRequest) -> SyncDailyTradeResponse:
+    result = sync_daily_trade(
+        batch_size=payload.batch_size or 20,
+        window_days=payload.window_days,
+        start_date=payload.start_date,
+        end_date=payload.end_date,
+        codes=payload.codes,
+        batch_pause_seconds=payload.batch_pause_seconds or 0.6,
+    )
+    return SyncDailyTradeResponse(
+        rows=result["rows"],
+        elapsedSeconds=result["elapsed_seconds"],
+    )
+
+
+@router.post("/sync/daily-trade-metrics", response_model=SyncDailyTradeMetricsResponse)
+@_queued_with_worker(start_daily_trade_metrics_job)
+def trigger_daily_trade_metrics_sync(payload: SyncDailyTradeMetricsRequest) -> SyncDailyTradeMetricsResponse:
+    kwargs: Dict[str, object] = {}
+    if payload.history_window_days is not None:
+        kwargs["history_window_days"] = payload.history_window_days
+    result = sync_daily_trade_metrics(**kwargs)
+    return SyncDailyTradeMetricsResponse(
+        rows=result["rows"],
+        tradeDate=result.get("trade_date"),
+        elapsedSeconds=result["elapsed_seconds"],
+    )
+
+
+@router.post("/sync/fundamental-metrics", response_model=SyncFundamentalMetricsResponse)
+@_queued_with_worker(start_fundamental_metrics_job)
+def trigger_fundamental_metrics_sync(payload: SyncFundamentalMetricsRequest) -> SyncFundamentalMetricsResponse:
+    kwargs: Dict[str, object] = {}
+    if payload.per_code is not None:
+        kwargs["per_code"] = payload.per_code
+    if payload.full_refresh:
+        kwargs["full_refresh"] = True
+    result = sync_fundamental_metrics(**kwargs)
+    return SyncFundamentalMetricsResponse(
+        rows=int(result["rows"]),
+        elapsedSeconds=float(result["elapsed_seconds"]),
+    )
+
+
+@router.post("/sync/daily-indicators", response_model=SyncDailyIndicatorResponse)
+@_queued_with_worker(start_daily_indicator_job)
+def trigger_daily_indicator_sync(payload: SyncDailyIndicatorRequest) -> SyncDailyIndicatorResponse:
+    result = sync_daily_indicator(
+        trade_date=payload.trade_date,
+    )
+    return SyncDailyIndicatorResponse(
+        rows=int(result["rows"]),
+        tradeDate=str(result["trade_date"]),
+        elapsedSeconds=float(result["elapsed_seconds"]),
+    )
+
+
+@router.post("/sync/income-statements", response_model=SyncIncomeStatementResponse)
+@_queued_with_worker(start_income_statement_job)
+def trigger_income_statement_sync(payload: SyncIncomeStatementRequest) -> SyncIncomeStatementResponse:
+    result = sync_income_statements(
+        codes=payload.codes,
+        initial_periods=payload.initial_periods,
+        mode=payload.mode,
+        announced_since=payload.announced_since,
+    )
+    return SyncIncomeStatementResponse(
+        rows=int(result["rows"]),
+        codes=[str(code) for code in result.get("codes", [])],
+        code_count=int(result.get("code_count", len(result.get("codes", [])))),
+        total_codes=int(result.get("total_codes", result.get("code_count", 0))),
+        elapsed_seconds=float(result.get("elapsedSeconds", result.get("elapsed_seconds", 0.0))),
+    )
+
+
+@router.post("/sync/financial-indicators", response_model=SyncFinancialIndicatorResponse)
+@_queued_with_worker(start_financial_indicator_job)
+def trigger_financial_indicator_sync(payload: SyncFinancialIndicatorRequest) -> SyncFinancialIndicatorResponse:
+    result = sync_financial_indicators(
+        codes=payload.codes,
+        limit=payload.limit,
+        mode=payload.mode,
+        announced_since=payload.announced_since,
+    )
+    return SyncFinancialIndicatorResponse(
+        rows=int(result["rows"]),
+        codes=[str(code) for code in result.get("codes", [])],
+        code_count=int(result.get("code_count", len(result.get("codes", [])))),
+        total_codes=int(result.get("total_codes", result.get("code_count", 0))),
+        elapsed_seconds=float(result.get("elapsedSeconds", result.get("elapsed_seconds", 0.0))),
+    )
+
+
+@router.post("/sync/cashflow-statements", response_model=SyncCashflowResponse)
+@_queued_with_worker(start_cashflow_statement_job)
+def trigger_cashflow_statement_sync(payload: SyncCashflowRequest) -> SyncCashflowResponse:
+    result = sync_cashflow_statements(
+        codes=payload.codes,
+        limit=payload.limit,
+        mode=payload.mode,
+        announced_since=payload.announced_since,
+    )
+    return SyncCashflowResponse(
+        rows=int(result.get("rows", 0)),
+        codes=[str(code) for code in result.get("codes", [])],
+        code_count=int(result.get("codeCount", result.get("code_count", 0))),
+        elapsed_seconds=float(result.get("elapsedSeconds", result.get("elapsed_seconds", 0.0))),
+    )
+
+
+@router.post("/sync/balance-sheet-statements", response_model=SyncBalanceSheetResponse)
+@_queued_with_worker(start_balance_sheet_job)
+def trigger_balance_sheet_sync(payload: SyncBalanceSheetRequest) -> SyncBalanceSheetResponse:
+    result = sync_balance_sheets(
+        codes=payload.codes,
+        limit=payload.limit,
+        mode=payload.mode,
+        announced_since=payload.announced_since,
+    )
+    return SyncBalanceSheetResponse(
+        rows=int(result.get("rows", 0)),
+        codes=[str(code) for code in result.get("codes", [])],
+        code_count=int(result.get("codeCount", result.get("code_count", 0))),
+        elapsed_seconds=float(result.get("elapsedSeconds", result.get("elapsed_seconds", 0.0))),
+    )
+
+
+@router.post("/sync/finance-breakfast", response_model=SyncFinanceBreakfastResponse)
+@_queued_with_worker(start_finance_breakfast_job)
+def trigger_finance_breakfast_sync(payload: SyncFinanceBreakfastRequest) -> SyncFinanceBreakfastResponse:
+    del payload
+    result = sync_finance_breakfast()
+    return SyncFinanceBreakfastResponse(
+        rows=int(result["rows"]),
+        elapsedSeconds=float(result.get("elapsedSeconds", result.get("elapsed_seconds", 0.0))),
+    )
+
+
+@router.post("/sync/global-flash", response_model=SyncGlobalFlashResponse)
+@_queued_with_worker(start_global_flash_job)
+def trigger_global_flash_sync(payload: SyncGlobalFlashRequest) -> SyncGlobalFlashResponse:
+    del payload
+    result = sync_global_flash()
+    return SyncGlobalFlashResponse(
+        rows=int(result.get("rows", 0)),
+        elapsedSeconds=float(result.get("elapsedSeconds", result.get("elapsed_seconds", 0.0))),
+    )
+
+
+@router.post("/sync/global-flash/classification", response_model=SyncGlobalFlashClassifyResponse)
+@_queued_with_worker(start_global_flash_classification_job)
+def trigger_global_flash_classification_sync(payload: SyncGlobalFlashClassifyRequest) -> SyncGlobalFlashClassifyResponse:
+    relevance_result = classify_relevance_batch(batch_size=payload.batch_size)
+    impact_result = classify_impact_batch(batch_size=payload.batch_size)
+
+    relevance_rows = int(relevance_result.get("rows", 0) or 0)
+    impact_rows = int(impact_result.get("rows", 0) or 0)
+    relevance_requested = int(relevance_result.get("requested", relevance_rows) or relevance_rows)
+    impact_requested = int(impact_result.get("requested", impact_rows) or impact_rows)
+    elapsed_seconds = float(relevance_result.get("elapsedSeconds", 0.0) or 0.0) + float(
+        impact_result.get("elapsedSeconds", 0.0) or 0.0
+    )
+
+    return SyncGlobalFlashClassifyResponse(
+        rows=relevance_rows + impact_rows,
+        relevanceRows=relevance_rows,
+        relevanceRequested=relevance_requested,
+        impactRows=impact_rows,
+        impactRequested=impact_requested,
+        elapsedSeconds=elapsed_seconds,
+    )
@@ -0,0 +1,251 @@
+"""
+Financial statement, performance filing and forecast endpoints.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from fastapi import APIRouter, Query
+
+from ...services import (
+    list_fundamental_metrics,
+    list_performance_express,
+    list_performance_forecast,
+    list_profit_forecast,
+    list_cashflow_statements,
+    list_balance_sheets,
+)
+from ..schemas import (
+    FundamentalMetricItem,
+    FundamentalMetricsListResponse,
+    PerformanceExpressRecord,
+    PerformanceExpressListResponse,
+    PerformanceForecastRecord,
+    PerformanceForecastListResponse,
+    CashflowRecord,
+    CashflowListResponse,
+    BalanceSheetRecord,
+    BalanceSheetListResponse,
+    ProfitForecastRating,
+    ProfitForecastPoint,
+    ProfitForecastItem,
+    ProfitForecastListResponse,
+)
+
+router = APIRouter()
+
+
+@router.get("/fundamental-metrics", response_model=FundamentalMetricsListResponse)
+def list_fundamental_metrics_api(
+    keyword: Optional[str] = Query(None, description="Keyword to search code/name/industry"),
+    market: Optional[str] = Query(None, description="Filter by market"),
+    exchange: Optional[str] = Query(None, description="Filter by exchange"),
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+) -> FundamentalMetricsListResponse:
+    """Return paginated derived fundamental metrics."""
+    result = list_fundamental_metrics(
+        keyword=keyword,
+        market=market,
+        exchange=exchange,
+        limit=limit,
+        offset=offset,
+    )
+    items = [
+        FundamentalMetricItem(
+            code=item["code"],
+            name=item.get("name"),
+            industry=item.get("industry"),
+            market=item.get("market"),
+            exchange=item.get("exchange"),
+            netIncomeEndDateLatest=item.get("net_income_end_date_latest"),
+            netIncomeEndDatePrev1=item.get("net_income_end_date_prev1"),
+            netIncomeEndDatePrev2=item.get("net_income_end_date_prev2"),
+            revenueEndDateLatest=item.get("revenue_end_date_latest"),
+            roeEndDateLatest=item.get("roe_end_date_latest"),
+            netIncomeYoyLatest=item.get("net_income_yoy_latest"),
+            netIncomeYoyPrev1=item.get("net_income_yoy_prev1"),
+            netIncomeYoyPrev2=item.get("net_income_yoy_prev2"),
+            netIncomeQoqLatest=item.get("net_income_qoq_latest"),
+            revenueYoyLatest=item.get("revenue_yoy_latest"),
+            revenueQoqLatest=item.get("revenue_qoq_latest"),
+            roeYoyLatest=item.get("roe_yoy_latest"),
+            roeQoqLatest=item.get("roe_qoq_latest"),
+        )
+        for item in result["items"]
+    ]
+    return FundamentalMetricsListResponse(total=result["total"], items=items)
+
+
+@router.get("/performance/express", response_model=PerformanceExpressListResponse)
+def list_performance_express_entries(
+    limit: int = Query(100, ge=1, le=500, description="Maximum number of entries to return."),
+    offset: int = Query(0, ge=0, description="Offset for pagination."),
+    start_date: Optional[str] = Query(None, alias="startDate"),
+    end_date: Optional[str] = Query(None, alias="endDate"),
+    keyword: Optional[str] = Query(None, description="Optional keyword filtering ts_code or stock name."),
+) -> PerformanceExpressListResponse:
+    normalized_keyword = keyword.strip() if keyword else None
+    result = list_performance_express(
+        limit=limit,
+        offset=offset,
+        start_date=start_date,
+        end_date=end_date,
+        keyword=normalized_keyword,
+    )
+    items = [
+        PerformanceExpressRecord(
+            symbol=entry.get("symbol"),
+            ts_code=entry.get("ts_code"),
+            name=entry.get("name"),
+            industry=entry.get("industry"),
+            market=entry.get("market"),
+            ann_date=entry.get("announcement_date"),
+            end_date=entry.get("report_period"),
+            report_period=entry.get("report_period"),
+            announcement_date=entry.get("announcement_date"),
+            eps=entry.get("eps"),
+            revenue=entry.get("revenue"),
+            revenue_prev=entry.get("revenue_prev"),
+            revenue_yoy=entry.get("revenue_yoy"),
+            revenue_qoq=entry.get("revenue_qoq"),
+            net_profit=entry.get("net_profit"),
+            net_profit_prev=entry.get("net_profit_prev"),
+            net_profit_yoy=entry.get("net_profit_yoy"),
+            net_profit_qoq=entry.get("net_profit_qoq"),
+            net_assets_per_share=entry.get("net_assets_per_share"),
+            return_on_equity=entry.get("return_on_equity"),
+            row_number=entry.get("row_number"),
+            n_income=entry.get("net_profit"),
+            diluted_eps=entry.get("eps"),
+            diluted_roe=entry.get("return_on_equity"),
+            yoy_net_profit=entry.get("net_profit_yoy"),
+            updated_at=entry.get("updated_at"),
+        )
+        for entry in result.get("items", [])
+    ]
+    return PerformanceExpressListResponse(total=int(result.get("total", 0)), items=items)
+
+
+@router.get("/performance/forecast", response_model=PerformanceForecastListResponse)
+def list_performance_forecast_entries(
+    limit: int = Query(100, ge=1, le=500, description="Maximum number of entries to return."),
+    offset: int = Query(0, ge=0, description="Offset for pagination."),
+    start_date: Optional[str] = Query(None, alias="startDate"),
+    end_date: Optional[str] = Query(None, alias="endDate"),
+    keyword: Optional[str] = Query(None, description="Optional keyword filtering ts_code or stock name."),
+) -> PerformanceForecastListResponse:
+    normalized_keyword = keyword.strip() if keyword else None
+    result = list_performance_forecast(
+        limit=limit,
+        offset=offset,
+        start_date=start_date,
+        end_date=end_date,
+        keyword=normalized_keyword,
+    )
+    items = [
+        PerformanceForecastRecord(
+            symbol=entry.get("symbol"),
+            ts_code=entry.get("ts_code"),
+            name=entry.get("name"),
+            industry=entry.get("industry"),
+            market=entry.get("market"),
+            ann_date=entry.get("announcement_date"),
+            end_date=entry.get("report_period"),
+            report_period=entry.get("report_period"),
+            announcement_date=entry.get("announcement_date"),
+            forecast_metric=entry.get("forecast_metric"),
+            change_description=entry.get("change_description"),
+            forecast_value=entry.get("forecast_value"),
+            change_rate=entry.get("change_rate"),
+            change_reason=entry.get("change_reason"),
+            forecast_type=entry.get("forecast_type"),
+            last_year_value=entry.get("last_year_value"),
+            row_number=entry.get("row_number"),
+            type=entry.get("forecast_type"),
+            p_change_min=entry.get("change_rate"),
+            p_change_max=entry.get("change_rate"),
+            net_profit_min=entry.get("forecast_value"),
+            net_profit_max=entry.get("forecast_value"),
+            updated_at=entry.get("updated_at"),
+        )
+        for entry in result.get("items", [])
+    ]
+    return PerformanceForecastListResponse(total=int(result.get("total", 0)), items=items)
+
+
+@router.get("/financial/cashflow", response_model=CashflowListResponse)
+def list_cashflow_entries(
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    keyword: Optional[str] = Query(None, description="Keyword filtering ts_code or stock name."),
+    ts_code: Optional[str] = Query(None, description="Exact ts_code filter."),
+) -> CashflowListResponse:
+    normalized_keyword = keyword.strip() if keyword else None
+    result = list_cashflow_statements(
+        limit=limit,
+        offset=offset,
+        keyword=normalized_keyword,
+        ts_code=ts_code,
+    )
+    items = [CashflowRecord(**entry) for entry in result.get("items", [])]
+    return CashflowListResponse(total=int(result.get("total", 0)), items=items)
+
+
+@router.get("/financial/balance-sheet", response_model=BalanceSheetListResponse)
+def list_balance_sheet_entries(
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    keyword: Optional[str] = Query(None, description="Keyword filtering ts_code or stock name."),
+    ts_code: Optional[str] = Query(None, description="Exact ts_code filter."),
+) -> BalanceSheetListResponse:
+    normalized_keyword = keyword.strip() if keyword else None
+    result = list_balance_sheets(
+        limit=limit,
+        offset=offset,
+        keyword=normalized_keyword,
+        ts_code=ts_code,
+    )
+    items = [BalanceSheetRecord(**entry) for entry in result.get("items", [])]
+    return BalanceSheetListResponse(total=int(result.get("total", 0)), items=items)
+
+
+@router.get("/profit-forecast", response_model=ProfitForecastListResponse)
+def list_profit_forecast_entries(
+    limit: int = Query(100, ge=1, le=500, description="Maximum number of entries to return."),
+    offset: int = Query(0, ge=0, description="Offset for pagination."),
+    keyword: Optional[str] = Query(None, description="Optional keyword filtering code or name."),
+    industry: Optional[str] = Query(None, description="Optional industry filter."),
+    year: Optional[int] = Query(None, description="Optional forecast year filter."),
+) -> ProfitForecastListResponse:
+    normalized_keyword = keyword.strip() if keyword else None
+    normalized_industry = industry.strip() if industry else None
+    result = list_profit_forecast(
+        limit=limit,
+        offset=offset,
+        keyword=normalized_keyword,
+        industry=normalized_industry,
+        forecast_year=year,
+    )
+    items = [
+        ProfitForecastItem(
+            code=item.get("code"),
+            symbol=item.get("symbol"),
+            tsCode=item.get("tsCode"),
+            name=item.get("name"),
+            industry=item.get("industry"),
+            market=item.get("market"),
+            reportCount=item.get("reportCount"),
+            ratings=ProfitForecastRating(**(item.get("ratings") or {})),
+            forecasts=[ProfitForecastPoint(**point) for point in item.get("forecasts", [])],
+            updatedAt=item.get("updatedAt"),
+        )
+        for item in result.get("items", [])
+    ]
+    return ProfitForecastListResponse(
+        total=int(result.get("total", 0)),
+        items=items,
+        industries=list(result.get("industries", [])),
+        years=list(result.get("years", [])),
+    )
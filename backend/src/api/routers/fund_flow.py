@@ -0,0 +1,218 @@
+"""
+Sector, individual, big-deal and market fund flow endpoints.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from fastapi import APIRouter, Query
+from fastapi.responses import Response
+
+from ...services import (
+    list_industry_fund_flow,
+    list_concept_fund_flow,
+    list_individual_fund_flow,
+    list_market_fund_flow,
+    build_sector_fund_flow_snapshot,
+)
+from ...fast_json import fast_json_response
+from ..common import _build_big_deal_fund_flow_response
+from ..schemas import (
+    IndustryFundFlowRecord,
+    IndustryFundFlowListResponse,
+    ConceptFundFlowRecord,
+    ConceptFundFlowListResponse,
+    FundFlowHotlistSymbol,
+    FundFlowHotlistEntry,
+    FundFlowSectorHotlistResponse,
+    IndividualFundFlowRecord,
+    IndividualFundFlowListResponse,
+    BigDealFundFlowListResponse,
+    MarketFundFlowRecord,
+    MarketFundFlowListResponse,
+)
+
+router = APIRouter()
+
+
+@router.get("/fund-flow/industry", response_model=IndustryFundFlowListResponse)
+def list_industry_fund_flow_entries(
+    symbol: Optional[str] = Query(
+        None,
+        description="Optional ranking symbol filter (例如: 即时, 3日排行).",
+    ),
+    limit: int = Query(100, ge=1, le=500, description="Maximum number of entries to return."),
+    offset: int = Query(0, ge=0, description="Offset for pagination."),
+) -> IndustryFundFlowListResponse:
+    result = list_industry_fund_flow(symbol=symbol, limit=limit, offset=offset)
+    items = [
+        IndustryFundFlowRecord(
+            symbol=entry.get("symbol"),
+            industry=entry.get("industry"),
+            rank=entry.get("rank"),
+            industry_index=entry.get("industry_index"),
+            price_change_percent=entry.get("price_change_percent"),
+            stage_change_percent=entry.get("stage_change_percent"),
+            inflow=entry.get("inflow"),
+            outflow=entry.get("outflow"),
+            net_amount=entry.get("net_amount"),
+            company_count=entry.get("company_count"),
+            leading_stock=entry.get("leading_stock"),
+            leading_stock_change_percent=entry.get("leading_stock_change_percent"),
+            current_price=entry.get("current_price"),
+            updated_at=entry.get("updated_at"),
+        )
+        for entry in result.get("items", [])
+    ]
+    return IndustryFundFlowListResponse(total=int(result.get("total", 0)), items=items)
+
+
+@router.get("/fund-flow/concept", response_model=ConceptFundFlowListResponse)
+def list_concept_fund_flow_entries(
+    symbol: Optional[str] = Query(
+        None,
+        description="Optional ranking symbol filter (例如: 即时, 3日排行).",
+    ),
+    limit: int = Query(100, ge=1, le=500, description="Maximum number of entries to return."),
+    offset: int = Query(0, ge=0, description="Offset for pagination."),
+) -> ConceptFundFlowListResponse:
+    result = list_concept_fund_flow(symbol=symbol, limit=limit, offset=offset)
+    items = [
+        ConceptFundFlowRecord(
+            symbol=entry.get("symbol"),
+            concept=entry.get("concept"),
+            rank=entry.get("rank"),
+            concept_index=entry.get("concept_index"),
+            price_change_percent=entry.get("price_change_percent"),
+            stage_change_percent=entry.get("stage_change_percent"),
+            inflow=entry.get("inflow"),
+            outflow=entry.get("outflow"),
+            net_amount=entry.get("net_amount"),
+            company_count=entry.get("company_count"),
+            leading_stock=entry.get("leading_stock"),
+            leading_stock_change_percent=entry.get("leading_stock_change_percent"),
+            current_price=entry.get("current_price"),
+            updated_at=entry.get("updated_at"),
+        )
+        for entry in result.get("items", [])
+    ]
+    return ConceptFundFlowListResponse(total=int(result.get("total", 0)), items=items)
+
+
+@router.get("/fund-flow/sector-hotlist", response_model=FundFlowSectorHotlistResponse)
+def get_fund_flow_sector_hotlist() -> FundFlowSectorHotlistResponse:
+    snapshot = build_sector_fund_flow_snapshot()
+    symbols = [FundFlowHotlistSymbol(**item) for item in snapshot.get("symbols", [])]
+    industries = [FundFlowHotlistEntry(**item) for item in snapshot.get("industries", [])]
+    concepts = [FundFlowHotlistEntry(**item) for item in snapshot.get("concepts", [])]
+    return FundFlowSectorHotlistResponse(
+        generatedAt=snapshot.get("generatedAt"),
+        symbols=symbols,
+        industries=industries,
+        concepts=concepts,
+    )
+
+
+@router.get("/fund-flow/individual", response_model=IndividualFundFlowListResponse)
+def list_individual_fund_flow_entries(
+    symbol: Optional[str] = Query(
+        None,
+        description="Optional ranking symbol filter (例如: 即时, 3日排行).",
+    ),
+    code: Optional[str] = Query(
+        None,
+        description="Optional stock code filter (例如: 000063.SZ).",
+    ),
+    limit: int = Query(100, ge=1, le=500, description="Maximum number of entries to return."),
+    offset: int = Query(0, ge=0, description="Offset for pagination."),
+) -> IndividualFundFlowListResponse:
+    result = list_individual_fund_flow(symbol=symbol, stock_code=code, limit=limit, offset=offset)
+    items = [
+        IndividualFundFlowRecord(
+            symbol=entry.get("symbol"),
+            stock_code=entry.get("stock_code"),
+            stock_name=entry.get("stock_name"),
+            rank=entry.get("rank"),
+            latest_price=entry.get("latest_price"),
+            price_change_percent=entry.get("price_change_percent"),
+            stage_change_percent=entry.get("stage_change_percent"),
+            turnover_rate=entry.get("turnover_rate"),
+            continuous_turnover_rate=entry.get("continuous_turnover_rate"),
+            inflow=entry.get("inflow"),
+            outflow=entry.get("outflow"),
+            net_amount=entry.get("net_amount"),
+            net_inflow=entry.get("net_inflow"),
+            turnover_amount=entry.get("turnover_amount"),
+            updated_at=entry.get("updated_at"),
+        )
+        for entry in result.get("items", [])
+    ]
+    return IndividualFundFlowListResponse(total=int(result.get("total", 0)), items=items)
+
+
+@router.get("/fund-flow/big-deal", response_model=BigDealFundFlowListResponse)
+def list_big_deal_fund_flow_entries(
+    limit: int = Query(100, ge=1, le=500, description="Maximum number of entries to return."),
+    offset: int = Query(0, ge=0, description="Offset for pagination."),
+    side: Optional[str] = Query(
+        None,
+        description="Optional filter by trade side (e.g. 买盘 / 卖盘).",
+    ),
+    code: Optional[str] = Query(
+        None,
+        description="Optional stock code filter (例如: 000063.SZ).",
+    ),
+) -> Response:
+    return fast_json_response(_build_big_deal_fund_flow_response(limit=limit, offset=offset, side=side, code=code))
+
+
+@router.get("/fund-flow/market", response_model=MarketFundFlowListResponse)
+def list_market_fund_flow_entries(
+    start_date: Optional[str] = Query(None, alias="startDate", description="Filter start date (YYYY-MM-DD)."),
+    end_date: Optional[str] = Query(None, alias="endDate", description="Filter end date (YYYY-MM-DD)."),
+    limit: int = Query(100, ge=1, le=500, description="Max number of records to return."),
+    offset: int = Query(0, ge=0, description="Offset for pagination."),
+) -> MarketFundFlowListResponse:
+    result = list_market_fund_flow(
+        start_date=start_date,
+        end_date=end_date,
+        limit=limit,
+        offset=offset,
+    )
+    items = [
+        MarketFundFlowRecord(
+            tradeDate=entry.get("trade_date"),
+            shanghaiClose=entry.get("shanghai_close"),
+            shanghaiChangePercent=entry.get("shanghai_change_percent"),
+            shenzhenClose=entry.get("shenzhen_close"),
+            shenzhenChangePercent=entry.get("shenzhen_change_percent"),
+            mainNetInflowAmount=entry.get("main_net_inflow_amount"),
+            mainNetInflowRatio=entry.get("main_net_inflow_ratio"),
+            hugeOrderNetInflowAmount=entry.get("huge_order_net_inflow_amount"),
+            hugeOrderNetInflowRatio=entry.get("huge_order_net_inflow_ratio"),
+            largeOrderNetInflowAmount=entry.get("large_order_net_inflow_amount"),
+            largeOrderNetInflowRatio=entry.get("large_order_net_inflow_ratio"),
+            mediumOrderNetInflowAmount=entry.get("medium_order_net_inflow_amount"),
+            mediumOrderNetInflowRatio=entry.get("medium_order_net_inflow_ratio"),
+            smallOrderNetInflowAmount=entry.get("small_order_net_inflow_amount"),
+            smallOrderNetInflowRatio=entry.get("small_order_net_inflow_ratio"),
+            updatedAt=entry.get("updated_at"),
+        )
+        for entry in result.get("items", [])
+    ]
+    total = int(result.get("total", result.get("count", len(items))) or 0)
+    latest_trade_date = result.get("latestTradeDate") or result.get("latest_trade_date")
+    last_synced_at = result.get("lastSyncedAt") or result.get("updated_at")
+    available_years = [
+        int(year)
+        for year in result.get("availableYears", result.get("available_years", []))
+        if year is not None
+    ]
+    return MarketFundFlowListResponse(
+        total=total,
+        items=items,
+        latestTradeDate=latest_trade_date,
+        lastSyncedAt=last_synced_at,
+        availableYears=available_years,
+    )
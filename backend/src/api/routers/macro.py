@@ -0,0 +1,565 @@
+"""
+Macro indicator, global market and peripheral insight endpoints.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import List, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+
+from ...services import (
+    list_global_indices,
+    list_global_index_history,
+    list_dollar_index,
+    list_rmb_midpoint_rates,
+    list_futures_realtime,
+    list_fed_statements,
+    get_latest_peripheral_insight,
+    list_peripheral_insight_history,
+    get_latest_macro_insight,
+    list_macro_leverage_ratios,
+    list_social_financing_ratios,
+    list_macro_cpi,
+    list_macro_pmi,
+    list_macro_m2,
+    list_macro_ppi,
+    list_macro_lpr,
+    list_macro_shibor,
+    get_latest_macro_insight,
+    list_macro_insight_history,
+)
+from ..schemas import (
+    GlobalIndexRecord,
+    GlobalIndexListResponse,
+    GlobalIndexHistoryResponse,
+    DollarIndexRecord,
+    DollarIndexListResponse,
+    RmbMidpointRecord,
+    RmbMidpointListResponse,
+    MacroLeverageRecord,
+    MacroLeverageListResponse,
+    SocialFinancingRecord,
+    SocialFinancingListResponse,
+    CpiRecord,
+    CpiListResponse,
+    PmiRecord,
+    PmiListResponse,
+    M2Record,
+    M2ListResponse,
+    PpiRecord,
+    PpiListResponse,
+    LprRecord,
+    LprListResponse,
+    ShiborRecord,
+    ShiborListResponse,
+    FuturesRealtimeRecord,
+    FuturesRealtimeListResponse,
+    FedStatementRecord,
+    FedStatementListResponse,
+    PeripheralInsightRecord,
+    PeripheralInsightResponse,
+    PeripheralInsightHistoryResponse,
+    MacroInsightDatasetField,
+    MacroInsightDataset,
+    MacroInsightResponse,
+    MacroInsightHistoryItem,
+    MacroInsightHistoryResponse,
+)
+
+router = APIRouter()
+
+
+@router.get("/macro/global-indices", response_model=GlobalIndexListResponse)
+def list_global_indices_api(
+    limit: int = Query(500, ge=1, le=2000, description="Maximum number of entries to return."),
+    offset: int = Query(0, ge=0, description="Offset for pagination."),
+) -> GlobalIndexListResponse:
+    result = list_global_indices(limit=limit, offset=offset)
+    items = [
+        GlobalIndexRecord(
+            code=entry.get("code"),
+            seq=entry.get("seq"),
+            name=entry.get("name"),
+            latestPrice=entry.get("latest_price"),
+            changeAmount=entry.get("change_amount"),
+            changePercent=entry.get("change_percent"),
+            openPrice=entry.get("open_price"),
+            highPrice=entry.get("high_price"),
+            lowPrice=entry.get("low_price"),
+            prevClose=entry.get("prev_close"),
+            amplitude=entry.get("amplitude"),
+            lastQuoteTime=entry.get("last_quote_time"),
+            updatedAt=entry.get("updated_at"),
+        )
+        for entry in result.get("items", [])
+    ]
+    return GlobalIndexListResponse(
+        total=int(result.get("total", 0)),
+        items=items,
+        lastSyncedAt=result.get("lastSyncedAt") or result.get("last_synced_at") or result.get("updated_at"),
+    )
+
+
+@router.get("/macro/global-indices/history", response_model=GlobalIndexHistoryResponse)
+def get_global_index_history_api(
+    code: str = Query(..., min_length=1, description="Yahoo Finance index symbol (e.g. ^DJI)."),
+    limit: int = Query(260, ge=10, le=1000, description="Number of historical rows to return."),
+) -> GlobalIndexHistoryResponse:
+    payload = list_global_index_history(code=code, limit=limit)
+    return GlobalIndexHistoryResponse(**payload)
+
+
+@router.get("/macro/dollar-index", response_model=DollarIndexListResponse)
+def list_dollar_index_api(
+    limit: int = Query(500, ge=1, le=2000, description="Maximum number of entries to return."),
+    offset: int = Query(0, ge=0, description="Offset for pagination."),
+    start_date: Optional[date] = Query(None, alias="startDate", description="Filter results on or after this date."),
+    end_date: Optional[date] = Query(None, alias="endDate", description="Filter results on or before this date."),
+) -> DollarIndexListResponse:
+    result = list_dollar_index(limit=limit, offset=offset, start_date=start_date, end_date=end_date)
+    items = [
+        DollarIndexRecord(
+            tradeDate=entry.get("trade_date"),
+            code=entry.get("code"),
+            name=entry.get("name"),
+            openPrice=entry.get("open_price"),
+            closePrice=entry.get("close_price"),
+            highPrice=entry.get("high_price"),
+            lowPrice=entry.get("low_price"),
+            amplitude=entry.get("amplitude"),
+            updatedAt=entry.get("updated_at"),
+        )
+        for entry in result.get("items", [])
+    ]
+    return DollarIndexListResponse(
+        total=int(result.get("total", 0)),
+        items=items,
+        lastSyncedAt=result.get("lastSyncedAt") or result.get("last_synced_at") or result.get("updated_at"),
+    )
+
+
+@router.get("/macro/rmb-midpoint", response_model=RmbMidpointListResponse)
+def list_rmb_midpoint_api(
+    limit: int = Query(500, ge=1, le=2000, description="Maximum number of entries to return."),
+    offset: int = Query(0, ge=0, description="Offset for pagination."),
+    start_date: Optional[date] = Query(None, alias="startDate", description="Filter results on or after this date."),
+    end_date: Optional[date] = Query(None, alias="endDate", description="Filter results on or before this date."),
+) -> RmbMidpointListResponse:
+    result = list_rmb_midpoint_rates(limit=limit, offset=offset, start_date=start_date, end_date=end_date)
+    items: List[RmbMidpointRecord] = []
+    for entry in result.get("items", []):
+        payload = {
+            "tradeDate": entry.get("trade_date"),
+            "usd": entry.get("usd"),
+            "eur": entry.get("eur"),
+            "jpy": entry.get("jpy"),
+            "hkd": entry.get("hkd"),
+            "gbp": entry.get("gbp"),
+            "aud": entry.get("aud"),
+            "cad": entry.get("cad"),
+            "nzd": entry.get("nzd"),
+            "sgd": entry.get("sgd"),
+            "chf": entry.get("chf"),
+            "myr": entry.get("myr"),
+            "rub": entry.get("rub"),
+            "zar": entry.get("zar"),
+            "krw": entry.get("krw"),
+            "aed": entry.get("aed"),
+            "sar": entry.get("sar"),
+            "huf": entry.get("huf"),
+            "pln": entry.get("pln"),
+            "dkk": entry.get("dkk"),
+            "sek": entry.get("sek"),
+            "nok": entry.get("nok"),
+            "try": entry.get("try"),
+            "mxn": entry.get("mxn"),
+            "thb": entry.get("thb"),
+            "updatedAt": entry.get("updated_at"),
+        }
+        items.append(RmbMidpointRecord(**payload))
+
+    return RmbMidpointListResponse(
+        total=int(result.get("total", 0)),
+        items=items,
+        lastSyncedAt=result.get("lastSyncedAt") or result.get("last_synced_at") or result.get("updated_at"),
+    )
+
+
+@router.get("/macro/futures-realtime", response_model=FuturesRealtimeListResponse)
+def list_futures_realtime_api(
+    limit: int = Query(50, ge=1, le=100, description="Maximum number of entries to return."),
+    offset: int = Query(0, ge=0, description="Offset for pagination."),
+) -> FuturesRealtimeListResponse:
+    result = list_futures_realtime(limit=limit, offset=offset)
+    items = [
+        FuturesRealtimeRecord(
+            name=entry.get("name"),
+            code=entry.get("code"),
+            lastPrice=entry.get("last_price"),
+            priceCny=entry.get("price_cny"),
+            changeAmount=entry.get("change_amount"),
+            changePercent=entry.get("change_percent"),
+            openPrice=entry.get("open_price"),
+            highPrice=entry.get("high_price"),
+            lowPrice=entry.get("low_price"),
+            prevSettlement=entry.get("prev_settlement"),
+            openInterest=entry.get("open_interest"),
+            bidPrice=entry.get("bid_price"),
+            askPrice=entry.get("ask_price"),
+            quoteTime=entry.get("quote_time"),
+            tradeDate=entry.get("trade_date"),
+            updatedAt=entry.get("updated_at"),
+        )
+        for entry in result.get("items", [])
+    ]
+    return FuturesRealtimeListResponse(
+        total=int(result.get("total", 0)),
+        items=items,
+        lastSyncedAt=result.get("lastSyncedAt") or result.get("last_synced_at") or result.get("updated_at"),
+    )
+
+
+@router.get("/macro/fed-statements", response_model=FedStatementListResponse)
+def list_fed_statements_api(
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of statements to return."),
+    offset: int = Query(0, ge=0, description="Offset for pagination."),
+) -> FedStatementListResponse:
+    result = list_fed_statements(limit=limit, offset=offset)
+    items = [
+        FedStatementRecord(
+            title=entry.get("title", ""),
+            url=entry.get("url", ""),
+            statement_date=entry.get("statement_date"),
+            content=entry.get("content"),
+            raw_text=entry.get("raw_text"),
+            position=entry.get("position"),
+            updated_at=entry.get("updated_at"),
+        )
+        for entry in result.get("items", [])
+    ]
+    return FedStatementListResponse(
+        total=int(result.get("total", 0)),
+        items=items,
+        lastSyncedAt=result.get("lastSyncedAt") or result.get("updated_at"),
+    )
+
+
+@router.get("/macro/leverage-ratio", response_model=MacroLeverageListResponse)
+def list_macro_leverage_ratios_api(
+    limit: int = Query(200, ge=1, le=500, description="Maximum number of leverage entries to return."),
+    offset: int = Query(0, ge=0, description="Offset for pagination."),
+) -> MacroLeverageListResponse:
+    result = list_macro_leverage_ratios(limit=limit, offset=offset)
+    items = []
+    for entry in result.get("items", []):
+        items.append(
+            MacroLeverageRecord(
+                period_date=entry.get("period_date"),
+                period_label=entry.get("period_label"),
+                household_ratio=entry.get("household_ratio"),
+                non_financial_corporate_ratio=entry.get("non_financial_corporate_ratio"),
+                government_ratio=entry.get("government_ratio"),
+                central_government_ratio=entry.get("central_government_ratio"),
+                local_government_ratio=entry.get("local_government_ratio"),
+                real_economy_ratio=entry.get("real_economy_ratio"),
+                financial_assets_ratio=entry.get("financial_assets_ratio"),
+                financial_liabilities_ratio=entry.get("financial_liabilities_ratio"),
+                updated_at=entry.get("updated_at"),
+            )
+        )
+    return MacroLeverageListResponse(
+        total=int(result.get("total", 0)),
+        items=items,
+        lastSyncedAt=result.get("lastSyncedAt") or result.get("updated_at"),
+    )
+
+
+@router.get("/macro/social-financing", response_model=SocialFinancingListResponse)
+def list_social_financing_ratios_api(
+    limit: int = Query(200, ge=1, le=500, description="Maximum number of social financing rows to return."),
+    offset: int = Query(0, ge=0, description="Offset for pagination."),
+) -> SocialFinancingListResponse:
+    result = list_social_financing_ratios(limit=limit, offset=offset)
+    items: List[SocialFinancingRecord] = []
+    for entry in result.get("items", []):
+        items.append(
+            SocialFinancingRecord(
+                periodDate=entry.get("period_date"),
+                periodLabel=entry.get("period_label"),
+                totalFinancing=entry.get("total_financing"),
+                renminbiLoans=entry.get("renminbi_loans"),
+                entrustedAndFxLoans=entry.get("entrusted_and_fx_loans"),
+                entrustedLoans=entry.get("entrusted_loans"),
+                trustLoans=entry.get("trust_loans"),
+                undiscountedBankersAcceptance=entry.get("undiscounted_bankers_acceptance"),
+                corporateBonds=entry.get("corporate_bonds"),
+                domesticEquityFinancing=entry.get("domestic_equity_financing"),
+                updatedAt=entry.get("updated_at"),
+            )
+        )
+    return SocialFinancingListResponse(
+        total=int(result.get("total", 0)),
+        items=items,
+        lastSyncedAt=result.get("lastSyncedAt") or result.get("updated_at"),
+    )
+
+
+@router.get("/macro/cpi", response_model=CpiListResponse)
+def list_macro_cpi_api(
+    limit: int = Query(200, ge=1, le=500, description="Maximum number of CPI rows to return."),
+    offset: int = Query(0, ge=0, description="Offset for pagination."),
+) -> CpiListResponse:
+    result = list_macro_cpi(limit=limit, offset=offset)
+    items: List[CpiRecord] = []
+    for entry in result.get("items", []):
+        items.append(
+            CpiRecord(
+                periodDate=entry.get("period_date"),
+                periodLabel=entry.get("period_label"),
+                actualValue=entry.get("actual_value"),
+                forecastValue=entry.get("forecast_value"),
+                previousValue=entry.get("previous_value"),
+                updatedAt=entry.get("updated_at"),
+            )
+        )
+    return CpiListResponse(
+        total=int(result.get("total", 0)),
+        items=items,
+        lastSyncedAt=result.get("lastSyncedAt") or result.get("updated_at"),
+    )
+
+
+@router.get("/macro/pmi", response_model=PmiListResponse)
+def list_macro_pmi_api(
+    limit: int = Query(200, ge=1, le=500, description="Maximum number of PMI rows to return."),
+    offset: int = Query(0, ge=0, description="Offset for pagination."),
+) -> PmiListResponse:
+    result = list_macro_pmi(limit=limit, offset=offset)
+    items: List[PmiRecord] = []
+    for entry in result.get("items", []):
+        items.append(
+            PmiRecord(
+                series=entry.get("series") or "manufacturing",
+                periodDate=entry.get("period_date"),
+                periodLabel=entry.get("period_label"),
+                actualValue=entry.get("actual_value"),
+                forecastValue=entry.get("forecast_value"),
+                previousValue=entry.get("previous_value"),
+                updatedAt=entry.get("updated_at"),
+            )
+        )
+    return PmiListResponse(
+        total=int(result.get("total", 0)),
+        items=items,
+        lastSyncedAt=result.get("lastSyncedAt") or result.get("updated_at"),
+    )
+
+
+@router.get("/macro/m2", response_model=M2ListResponse)
+def list_macro_m2_api(
+    limit: int = Query(200, ge=1, le=500, description="Maximum number of M2 rows to return."),
+    offset: int = Query(0, ge=0, description="Offset for pagination."),
+) -> M2ListResponse:
+    result = list_macro_m2(limit=limit, offset=offset)
+    items: List[M2Record] = []
+    for entry in result.get("items", []):
+        items.append(
+            M2Record(
+                period_date=entry.get("period_date"),
+                period_label=entry.get("period_label"),
+                m0=entry.get("m0"),
+                m0_yoy=entry.get("m0_yoy"),
+                m0_mom=entry.get("m0_mom"),
+                m1=entry.get("m1"),
+                m1_yoy=entry.get("m1_yoy"),
+                m1_mom=entry.get("m1_mom"),
+                m2=entry.get("m2"),
+                m2_yoy=entry.get("m2_yoy"),
+                m2_mom=entry.get("m2_mom"),
+                updated_at=entry.get("updated_at"),
+            )
+        )
+    return M2ListResponse(
+        total=int(result.get("total", 0)),
+        items=items,
+        lastSyncedAt=result.get("lastSyncedAt") or result.get("updated_at"),
+    )
+
+
+@router.get("/macro/ppi", response_model=PpiListResponse)
+def list_macro_ppi_api(
+    limit: int = Query(200, ge=1, le=500, description="Maximum number of PPI rows to return."),
+    offset: int = Query(0, ge=0, description="Offset for pagination."),
+) -> PpiListResponse:
+    result = list_macro_ppi(limit=limit, offset=offset)
+    items: List[PpiRecord] = []
+    for entry in result.get("items", []):
+        items.append(
+            PpiRecord(
+                periodDate=entry.get("period_date"),
+                periodLabel=entry.get("period_label"),
+                currentIndex=entry.get("current_index"),
+                yoyChange=entry.get("yoy_change"),
+                cumulativeIndex=entry.get("cumulative_index"),
+                updatedAt=entry.get("updated_at"),
+            )
+        )
+    return PpiListResponse(
+        total=int(result.get("total", 0)),
+        items=items,
+        lastSyncedAt=result.get("lastSyncedAt") or result.get("updated_at"),
+    )
+
+
+@router.get("/macro/lpr", response_model=LprListResponse)
+def list_macro_lpr_api(
+    limit: int = Query(200, ge=1, le=500, description="Maximum number of LPR rows to return."),
+    offset: int = Query(0, ge=0, description="Offset for pagination."),
+) -> LprListResponse:
+    result = list_macro_lpr(limit=limit, offset=offset)
+    items: List[LprRecord] = []
+    for entry in result.get("items", []):
+        items.append(
+            LprRecord(
+                periodDate=entry.get("period_date"),
+                periodLabel=entry.get("period_label"),
+                rate1Y=entry.get("rate_1y"),
+                rate5Y=entry.get("rate_5y"),
+                updatedAt=entry.get("updated_at"),
+            )
+        )
+    return LprListResponse(
+        total=int(result.get("total", 0)),
+        items=items,
+        lastSyncedAt=result.get("lastSyncedAt") or result.get("updated_at"),
+    )
+
+
+@router.get("/macro/pbc-rate", response_model=LprListResponse)
+def legacy_macro_pbc_rate_api(
+    limit: int = Query(200, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+) -> LprListResponse:
+    return list_macro_lpr_api(limit=limit, offset=offset)
+
+
+@router.get("/macro/shibor", response_model=ShiborListResponse)
+def list_macro_shibor_api(
+    limit: int = Query(200, ge=1, le=500, description="Maximum number of SHIBOR rows to return."),
+    offset: int = Query(0, ge=0, description="Offset for pagination."),
+) -> ShiborListResponse:
+    result = list_macro_shibor(limit=limit, offset=offset)
+    items: List[ShiborRecord] = []
+    for entry in result.get("items", []):
+        items.append(
+            ShiborRecord(
+                periodDate=entry.get("period_date"),
+                periodLabel=entry.get("period_label"),
+                onRate=entry.get("on_rate"),
+                rate1W=entry.get("rate_1w"),
+                rate2W=entry.get("rate_2w"),
+                rate1M=entry.get("rate_1m"),
+                rate3M=entry.get("rate_3m"),
+                rate6M=entry.get("rate_6m"),
+                rate9M=entry.get("rate_9m"),
+                rate1Y=entry.get("rate_1y"),
+                updatedAt=entry.get("updated_at"),
+            )
+        )
+    return ShiborListResponse(
+        total=int(result.get("total", 0)),
+        items=items,
+        lastSyncedAt=result.get("lastSyncedAt") or result.get("updated_at"),
+    )
+
+
+@router.get("/macro/insight", response_model=MacroInsightResponse)
+def get_macro_insight_snapshot() -> MacroInsightResponse:
+    result = get_latest_macro_insight()
+    if not result:
+        raise HTTPException(status_code=404, detail="Macro insight has not been generated yet")
+
+    datasets_payload = []
+    for dataset in result.get("datasets", []) or []:
+        fields = [MacroInsightDatasetField(**field) for field in dataset.get("fields", [])]
+        datasets_payload.append(
+            MacroInsightDataset(
+                key=dataset.get("key"),
+                titleKey=dataset.get("titleKey"),
+                fields=fields,
+                series=dataset.get("series") or [],
+                latest=dataset.get("latest"),
+                updatedAt=dataset.get("updatedAt"),
+            )
+        )
+
+    return MacroInsightResponse(
+        snapshotDate=result.get("snapshot_date"),
+        generatedAt=result.get("generated_at"),
+        summary=result.get("summary"),
+        rawResponse=result.get("raw_response"),
+        model=result.get("model"),
+        datasets=datasets_payload,
+        warnings=list(result.get("warnings", [])),
+    )
+
+
+@router.get("/macro/insight/history", response_model=MacroInsightHistoryResponse)
+def list_macro_insight_history_api(
+    limit: int = Query(6, ge=1, le=20, description="Number of historical macro insight snapshots to return."),
+) -> MacroInsightHistoryResponse:
+    records = list_macro_insight_history(limit=limit)
+    items: List[MacroInsightHistoryItem] = []
+    for record in records:
+        items.append(
+            MacroInsightHistoryItem(
+                snapshotDate=record.get("snapshot_date"),
+                generatedAt=record.get("generated_at"),
+                summaryJson=record.get("summary_json"),
+                rawResponse=record.get("raw_response"),
+                model=record.get("model"),
+            )
+        )
+    return MacroInsightHistoryResponse(items=items)
+
+
+@router.get("/peripheral/insights/latest", response_model=PeripheralInsightResponse)
+def get_latest_peripheral_insight_api() -> PeripheralInsightResponse:
+    record = get_latest_peripheral_insight()
+    if not record:
+        return PeripheralInsightResponse(insight=None)
+
+    payload = PeripheralInsightRecord(
+        snapshotDate=record.get("snapshot_date"),
+        generatedAt=record.get("generated_at"),
+        metrics=record.get("metrics") or {},
+        summary=record.get("summary"),
+        rawResponse=record.get("raw_response"),
+        model=record.get("model"),
+        createdAt=record.get("created_at"),
+        updatedAt=record.get("updated_at"),
+    )
+    return PeripheralInsightResponse(insight=payload)
+
+
+@router.get("/peripheral/insights/history", response_model=PeripheralInsightHistoryResponse)
+def list_peripheral_insight_history_api(
+    limit: int = Query(10, ge=1, le=100, description="Number of historical peripheral insight entries to return."),
+) -> PeripheralInsightHistoryResponse:
+    records = list_peripheral_insight_history(limit=limit)
+    items = [
+        PeripheralInsightRecord(
+            snapshotDate=entry.get("snapshot_date"),
+            generatedAt=entry.get("generated_at"),
+            metrics=entry.get("metrics") or {},
+            summary=entry.get("summary"),
+            rawResponse=entry.get("raw_response"),
+            model=entry.get("model"),
+            createdAt=entry.get("created_at"),
+            updatedAt=entry.get("updated_at"),
+        )
+        for entry in records
+    ]
+    return PeripheralInsightHistoryResponse(items=items)
@@ -0,0 +1,882 @@
+"""
+Market overview, index, activity and market/sector insight endpoints.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+import json
+import math
+import logging
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import Response
+
+from ...services import (
+    list_realtime_indices,
+    list_realtime_quotes,
+    list_concept_index_history,
+    list_concept_insights,
+    build_industry_snapshot,
+    get_latest_industry_insight,
+    list_industry_insights,
+    list_margin_account_info,
+    list_market_activity,
+    collect_recent_market_headlines,
+    get_latest_market_insight,
+    list_market_insights,
+    MARKET_INSIGHT_STAGE_ORDER,
+    MARKET_INSIGHT_STAGE_TITLES,
+    list_index_history,
+    sync_concept_index_history,
+    get_latest_concept_insight,
+    build_concept_snapshot,
+    generate_observation_pool,
+    list_industry_index_history,
+    build_market_overview_payload,
+    INDEX_CONFIG,
+)
+from ...fast_json import fast_json_response
+from ..common import _local_now, _localize_datetime
+from ..schemas import (
+    MarketInsightArticleItem,
+    MarketInsightSummaryPayload,
+    MarketInsightResponse,
+    MarketInsightStagePayload,
+    IndexHistoryRecord,
+    IndexOption,
+    IndexHistoryListResponse,
+    ConceptSnapshot,
+    ConceptInsightSummary,
+    ConceptInsightResponse,
+    ConceptInsightHistoryResponse,
+    IndustrySnapshot,
+    IndustryInsightSummary,
+    IndustryInsightResponse,
+    IndustryInsightHistoryResponse,
+    RealtimeIndexRecord,
+    RealtimeIndexListResponse,
+    RealtimeQuoteRecord,
+    RealtimeQuoteListResponse,
+    MarketInsightHistoryItem,
+    MarketInsightHistoryResponse,
+    MarketOverviewResponse,
+    IndustryIndexBar,
+    IndustryIndexHistoryResponse,
+    ConceptIndexBar,
+    ConceptIndexHistoryResponse,
+    MarginAccountRecord,
+    MarginAccountListResponse,
+    MarketActivityRecord,
+    MarketActivityListResponse,
+)
+from .. import jobs
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+MARKET_INSIGHT_STAGE_COLUMN_MAP = {
+    "index_analysis": "index_stage",
+    "fund_flow_analysis": "fund_stage",
+    "sentiment_analysis": "sentiment_stage",
+    "macro_analysis": "macro_stage",
+    "news_analysis": "news_stage",
+}
+
+DEFAULT_MARKET_INSIGHT_LOOKBACK_HOURS = 24
+MARKET_INSIGHT_STALE_GRACE_HOURS = 2
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return _localize_datetime(value)
+    try:
+        parsed = datetime.fromisoformat(value)
+    except Exception:
+        return None
+    return _localize_datetime(parsed)
+
+
+def _build_concept_insight_payload(
+    summary: Dict[str, Any],
+    *,
+    include_snapshot: bool = True,
+) -> Dict[str, Any]:
+    snapshot_obj = summary.get("summary_snapshot") if include_snapshot else None
+    generated_dt = _parse_datetime(summary.get("generated_at"))
+    window_start_dt = _parse_datetime(summary.get("window_start"))
+    window_end_dt = _parse_datetime(summary.get("window_end"))
+    summary_payload = ConceptInsightSummary(
+        summaryId=str(summary.get("summary_id")),
+        generatedAt=generated_dt.isoformat() if generated_dt else None,
+        windowStart=window_start_dt.isoformat() if window_start_dt else None,
+        windowEnd=window_end_dt.isoformat() if window_end_dt else None,
+        conceptCount=summary.get("concept_count"),
+        summarySnapshot=snapshot_obj if isinstance(snapshot_obj, dict) else (snapshot_obj if include_snapshot else None),
+        summaryJson=summary.get("summary_json"),
+        rawResponse=summary.get("raw_response"),
+        referencedConcepts=summary.get("referenced_concepts"),
+        referencedArticles=summary.get("referenced_articles"),
+        promptTokens=summary.get("prompt_tokens"),
+        completionTokens=summary.get("completion_tokens"),
+        totalTokens=summary.get("total_tokens"),
+        elapsedMs=summary.get("elapsed_ms"),
+        modelUsed=summary.get("model_used"),
+    )
+
+    snapshot_payload: Optional[ConceptSnapshot] = None
+    if include_snapshot and isinstance(snapshot_obj, dict):
+        try:
+            snapshot_payload = ConceptSnapshot(**snapshot_obj)
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.warning("Failed to parse stored concept snapshot for %s: %s", summary.get("summary_id"), exc)
+            snapshot_payload = None
+
+    return {"summary": summary_payload, "snapshot": snapshot_payload}
+
+
+def _build_concept_insight_response(
+    *,
+    summary: Optional[Dict[str, Any]],
+    snapshot: Optional[Dict[str, Any]],
+) -> ConceptInsightResponse:
+    summary_payload: Optional[ConceptInsightSummary] = None
+    snapshot_payload: Optional[ConceptSnapshot] = None
+
+    if summary:
+        payload = _build_concept_insight_payload(summary, include_snapshot=True)
+        summary_payload = payload.get("summary")  # type: ignore[assignment]
+        snapshot_payload = payload.get("snapshot")  # type: ignore[assignment]
+
+    if snapshot and not snapshot_payload:
+        try:
+            snapshot_payload = ConceptSnapshot(**snapshot)
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.warning("Failed to parse on-demand concept snapshot: %s", exc)
+            snapshot_payload = None
+
+    return ConceptInsightResponse(insight=summary_payload, snapshot=snapshot_payload)
+
+
+def _build_industry_insight_response_wrapper(
+    *,
+    summary: Optional[Dict[str, Any]],
+    snapshot: Optional[Dict[str, Any]],
+) -> IndustryInsightResponse:
+    return _build_industry_insight_response(summary=summary, snapshot=snapshot)
+
+
+def _sanitize_for_json(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _sanitize_for_json(val) for key, val in value.items()}
+    if isinstance(value, list):
+        return [_sanitize_for_json(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(_sanitize_for_json(item) for item in value)
+    if isinstance(value, Decimal):
+        value = float(value)
+    if isinstance(value, (int, float)):
+        numeric = float(value)
+        if math.isnan(numeric) or math.isinf(numeric):
+            return None
+        return numeric
+    return value
+
+
+@router.get("/markets/realtime-indices", response_model=RealtimeIndexListResponse)
+def list_realtime_indices_api(
+    limit: int = Query(500, ge=1, le=1000, description="Maximum number of realtime indices to return."),
+    offset: int = Query(0, ge=0, description="Offset for pagination."),
+) -> RealtimeIndexListResponse:
+    result = list_realtime_indices(limit=limit, offset=offset)
+    items = [
+        RealtimeIndexRecord(
+            code=entry.get("code"),
+            name=entry.get("name"),
+            latestPrice=entry.get("latest_price"),
+            changeAmount=entry.get("change_amount"),
+            changePercent=entry.get("change_percent"),
+            prevClose=entry.get("prev_close"),
+            openPrice=entry.get("open_price"),
+            highPrice=entry.get("high_price"),
+            lowPrice=entry.get("low_price"),
+            volume=entry.get("volume"),
+            turnover=entry.get("turnover"),
+            updatedAt=entry.get("updated_at"),
+        )
+        for entry in result.get("items", [])
+    ]
+    return RealtimeIndexListResponse(
+        total=int(result.get("total", 0)),
+        items=items,
+        last_synced_at=result.get("lastSyncedAt") or result.get("last_synced_at") or result.get("updated_at"),
+    )
+
+
+@router.get("/markets/realtime-quotes", response_model=RealtimeQuoteListResponse)
+def list_realtime_quotes_api(
+    codes: str = Query(..., min_length=1, description="Comma-separated ts_codes (e.g. 600000.SH,000001.SZ)."),
+) -> RealtimeQuoteListResponse:
+    requested = [code.strip().upper() for code in codes.split(",") if code.strip()]
+    quotes = list_realtime_quotes(requested)
+    items: List[RealtimeQuoteRecord] = []
+    for code in requested:
+        quote = quotes.get(code)
+        if quote is None:
+            continue
+        items.append(
+            RealtimeQuoteRecord(
+                code=quote["ts_code"],
+                name=quote.get("name"),
+                tradeDate=quote.get("trade_date"),
+                tradeTime=quote.get("trade_time"),
+                open=quote.get("open"),
+                high=quote.get("high"),
+                low=quote.get("low"),
+                close=quote.get("close"),
+                preClose=quote.get("pre_close"),
+                change=quote.get("change"),
+                pctChange=quote.get("pct_chg"),
+                volume=quote.get("volume_hands"),
+                amount=quote.get("amount"),
+                receivedAt=quote.get("received_at"),
+            )
+        )
+    status = jobs.realtime_quote_poller.status() if jobs.realtime_quote_poller is not None else {}
+    return RealtimeQuoteListResponse(
+        items=items,
+        pollerRunning=bool(status.get("running")),
+        updatedAt=status.get("store_updated_at"),
+    )
+
+
+@router.get("/markets/index-history", response_model=IndexHistoryListResponse)
+def get_index_history_api(
+    index_code: Optional[str] = Query(
+        None,
+        alias="indexCode",
+        description="Index code with exchange suffix (e.g. 000001.SH). Defaults to the first configured index.",
+    ),
+    limit: int = Query(
+        500,
+        ge=50,
+        le=2000,
+        description="Maximum number of records to return (oldest to newest).",
+    ),
+    start_date: Optional[date] = Query(
+        None,
+        alias="startDate",
+        description="Optional filter to include records on or after this date.",
+    ),
+    end_date: Optional[date] = Query(
+        None,
+        alias="endDate",
+        description="Optional filter to include records on or before this date.",
+    ),
+) -> IndexHistoryListResponse:
+    default_code = next(iter(INDEX_CONFIG.keys()))
+    selected_code = (index_code or default_code).strip().upper()
+
+    def _safe_numeric(value: Optional[object]) -> Optional[float]:
+        if value is None:
+            return None
+        if isinstance(value, (int, float)):
+            numeric = float(value)
+        else:
+            try:
+                numeric = float(value)
+            except (TypeError, ValueError):
+                return None
+        if math.isnan(numeric) or math.isinf(numeric):
+            return None
+        return numeric
+
+    history_rows = list_index_history(
+        index_code=selected_code,
+        limit=limit,
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+    inferred_name: Optional[str] = None
+    if history_rows:
+        inferred_name = history_rows[-1].get("index_name") or history_rows[0].get("index_name")
+    index_meta = INDEX_CONFIG.get(selected_code)
+    if not inferred_name and index_meta:
+        inferred_name = index_meta.get("name")
+
+    items_payload: List[Dict[str, object]] = []
+    for row in history_rows:
+        item = {
+            "indexCode": row.get("index_code") or selected_code,
+            "indexName": row.get("index_name") or inferred_name,
+            "tradeDate": row.get("trade_date"),
+            "open": _safe_numeric(row.get("open")),
+            "close": _safe_numeric(row.get("close")),
+            "high": _safe_numeric(row.get("high")),
+            "low": _safe_numeric(row.get("low")),
+            "volume": _safe_numeric(row.get("volume")),
+            "amount": _safe_numeric(row.get("amount")),
+            "amplitude": _safe_numeric(row.get("amplitude")),
+            "pctChange": _safe_numeric(row.get("pct_change")),
+            "changeAmount": _safe_numeric(row.get("change_amount")),
+            "turnover": _safe_numeric(row.get("turnover")),
+        }
+        items_payload.append(item)
+
+    available_indices = [
+        {
+            "code": code,
+            "name": meta.get("name", code),
+            "symbol": meta.get("symbol", code),
+        }
+        for code, meta in INDEX_CONFIG.items()
+    ]
+
+    return IndexHistoryListResponse(
+        indexCode=selected_code,
+        indexName=inferred_name,
+        items=[IndexHistoryRecord(**item) for item in items_payload],
+        availableIndices=[IndexOption(**option) for option in available_indices],
+    )
+
+
+@router.get("/market/overview", response_model=MarketOverviewResponse)
+def get_market_overview() -> MarketOverviewResponse:
+    payload = _sanitize_for_json(build_market_overview_payload())
+    return MarketOverviewResponse(**payload)
+
+
+def _refresh_concept_history_on_demand(concept: str, limit: int) -> bool:
+    """Fetch concept index history from THS when cache misses."""
+    concept_name = (concept or "").strip()
+    if not concept_name:
+        return False
+
+    lookback_days = max(120, min(int(limit) * 2, 365))
+    try:
+        end_date = date.today()
+        start_date = end_date - timedelta(days=lookback_days)
+        sync_concept_index_history(
+            [concept_name],
+            start_date=start_date.strftime("%Y%m%d"),
+            end_date=end_date.strftime("%Y%m%d"),
+        )
+        return True
+    except Exception as exc:  # pragma: no cover - best effort safeguard
+        logger.warning("On-demand concept index sync failed for %s: %s", concept_name, exc)
+        return False
+
+
+@router.get("/market/concept-index-history", response_model=ConceptIndexHistoryResponse)
+def get_concept_index_history_api(
+    concept: str = Query(..., min_length=1, description="Concept name to fetch index history for."),
+    limit: int = Query(90, ge=10, le=300, description="Number of trading days to return."),
+) -> ConceptIndexHistoryResponse:
+    try:
+        result = list_concept_index_history(concept_name=concept, limit=limit)
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to load concept index history for %s: %s", concept, exc)
+        raise HTTPException(status_code=500, detail="Failed to load concept index history.") from exc
+
+    rows = result.get("items", [])
+    if not rows:
+        refreshed = _refresh_concept_history_on_demand(concept, limit)
+        if refreshed:
+            try:
+                result = list_concept_index_history(concept_name=concept, limit=limit)
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.warning("Failed to load concept index history after refresh for %s: %s", concept, exc)
+            else:
+                rows = result.get("items", [])
+
+    bars = [ConceptIndexBar(**item) for item in rows if isinstance(item, dict)]
+    total = int(result.get("total") or 0)
+    return ConceptIndexHistoryResponse(concept=concept, total=total, rows=bars)
+
+
+@router.get("/market/industry-index-history", response_model=IndustryIndexHistoryResponse)
+def get_industry_index_history_api(
+    industry: str = Query(..., min_length=1),
+    limit: int = Query(240, ge=30, le=600),
+) -> IndustryIndexHistoryResponse:
+    result = list_industry_index_history(industry, limit=limit)
+    rows = [IndustryIndexBar(**row) for row in result.get("rows", [])]
+    return IndustryIndexHistoryResponse(industry=industry, total=int(result.get("total", 0)), rows=rows)
+
+
+@router.get("/market/industry-insight", response_model=IndustryInsightResponse)
+def get_industry_insight_api(
+    lookback_hours: int = Query(
+        48,
+        ge=1,
+        le=168,
+        alias="lookbackHours",
+        description="Hours to look back when building ad-hoc snapshot.",
+    ),
+    industry_limit: int = Query(
+        5,
+        ge=1,
+        le=15,
+        alias="industryLimit",
+        description="Maximum number of industries to include in snapshot.",
+    ),
+) -> IndustryInsightResponse:
+    summary_record: Optional[Dict[str, Any]] = None
+    snapshot_dict: Optional[Dict[str, Any]] = None
+
+    try:
+        summary = get_latest_industry_insight()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to load latest industry insight: %s", exc)
+        summary = None
+
+    if summary:
+        summary_record = summary
+        existing_snapshot = summary.get("summary_snapshot")
+        if isinstance(existing_snapshot, dict):
+            snapshot_dict = existing_snapshot
+
+    if snapshot_dict is None:
+        try:
+            snapshot_dict = build_industry_snapshot(
+                lookback_hours=lookback_hours,
+                industry_limit=industry_limit,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.warning("Failed to build industry snapshot: %s", exc)
+            snapshot_dict = None
+
+    return _build_industry_insight_response(summary=summary_record, snapshot=snapshot_dict)
+
+
+@router.get("/market/industry-insight/history", response_model=IndustryInsightHistoryResponse)
+def get_industry_insight_history(
+    limit: int = Query(5, ge=1, le=20, description="Number of historical industry insights to return."),
+) -> IndustryInsightHistoryResponse:
+    try:
+        records = list_industry_insights(limit=limit)
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to list industry insight history: %s", exc)
+        records = []
+
+    items: List[IndustryInsightSummary] = []
+    for record in records:
+        payload = _build_industry_insight_payload(record, include_snapshot=False)
+        summary_item = payload.get("summary")
+        if isinstance(summary_item, IndustryInsightSummary):
+            items.append(summary_item)
+    return IndustryInsightHistoryResponse(items=items)
+
+
+@router.get("/market/concept-insight", response_model=ConceptInsightResponse)
+def get_concept_insight_api(
+    lookback_hours: int = Query(
+        48,
+        ge=1,
+        le=168,
+        alias="lookbackHours",
+        description="Hours to look back when building ad-hoc snapshot.",
+    ),
+    concept_limit: int = Query(
+        10,
+        ge=1,
+        le=15,
+        alias="conceptLimit",
+        description="Maximum number of concepts to include in snapshot.",
+    ),
+    refresh_index_history: bool = Query(
+        False,
+        alias="refreshIndexHistory",
+        description="Whether to trigger index history refresh when building snapshot on the fly.",
+    ),
+) -> Response:
+    summary_record: Optional[Dict[str, Any]] = None
+    snapshot_dict: Optional[Dict[str, Any]] = None
+
+    try:
+        summary = get_latest_concept_insight()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to load latest concept insight: %s", exc)
+        summary = None
+
+    if summary:
+        summary_record = summary
+        existing_snapshot = summary.get("summary_snapshot")
+        if isinstance(existing_snapshot, dict):
+            snapshot_dict = existing_snapshot
+
+    if snapshot_dict is None:
+        try:
+            snapshot_dict = build_concept_snapshot(
+                lookback_hours=lookback_hours,
+                concept_limit=concept_limit,
+                refresh_index_history=refresh_index_history,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.warning("Failed to build concept snapshot: %s", exc)
+            snapshot_dict = None
+
+    return fast_json_response(_build_concept_insight_response(summary=summary_record, snapshot=snapshot_dict))
+
+
+@router.get("/market/concept-insight/history", response_model=ConceptInsightHistoryResponse)
+def get_concept_insight_history(
+    limit: int = Query(5, ge=1, le=20, description="Number of historical concept insights to return."),
+) -> ConceptInsightHistoryResponse:
+    try:
+        records = list_concept_insights(limit=limit)
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to list concept insight history: %s", exc)
+        records = []
+
+    items: List[ConceptInsightSummary] = []
+    for record in records:
+        payload = _build_concept_insight_payload(record, include_snapshot=False)
+        summary_item = payload.get("summary")
+        if isinstance(summary_item, ConceptInsightSummary):
+            items.append(summary_item)
+    return ConceptInsightHistoryResponse(items=items)
+
+
+@router.get("/margin/account", response_model=MarginAccountListResponse)
+def list_margin_account_entries(
+    start_date: Optional[str] = Query(
+        None,
+        alias="startDate",
+        description="Optional start date filter (YYYY-MM-DD).",
+    ),
+    end_date: Optional[str] = Query(
+        None,
+        alias="endDate",
+        description="Optional end date filter (YYYY-MM-DD).",
+    ),
+    limit: int = Query(200, ge=1, le=2000, description="Maximum number of entries to return."),
+    offset: int = Query(0, ge=0, description="Offset for pagination."),
+) -> MarginAccountListResponse:
+    result = list_margin_account_info(
+        start_date=start_date,
+        end_date=end_date,
+        limit=limit,
+        offset=offset,
+    )
+    items = [
+        MarginAccountRecord(
+            tradeDate=entry.get("trade_date"),
+            financingBalance=entry.get("financing_balance"),
+            securitiesLendingBalance=entry.get("securities_lending_balance"),
+            financingPurchaseAmount=entry.get("financing_purchase_amount"),
+            securitiesLendingSellAmount=entry.get("securities_lending_sell_amount"),
+            securitiesCompanyCount=entry.get("securities_company_count"),
+            businessDepartmentCount=entry.get("business_department_count"),
+            individualInvestorCount=entry.get("individual_investor_count"),
+            institutionalInvestorCount=entry.get("institutional_investor_count"),
+            participatingInvestorCount=entry.get("participating_investor_count"),
+            liabilityInvestorCount=entry.get("liability_investor_count"),
+            collateralValue=entry.get("collateral_value"),
+            averageCollateralRatio=entry.get("average_collateral_ratio"),
+            updatedAt=entry.get("updated_at"),
+        )
+        for entry in result.get("items", [])
+    ]
+    return MarginAccountListResponse(
+        total=int(result.get("total", 0)),
+        items=items,
+        last_synced_at=result.get("lastSyncedAt") or result.get("last_synced_at") or result.get("updated_at"),
+        availableYears=[int(year) for year in result.get("available_years", []) if year is not None],
+    )
+
+
+@router.get("/market/activity", response_model=MarketActivityListResponse)
+def get_market_activity_snapshot() -> MarketActivityListResponse:
+    result = list_market_activity()
+    items = [
+        MarketActivityRecord(
+            metric=entry.get("metric"),
+            displayOrder=int(entry.get("display_order", idx)),
+            valueText=entry.get("value_text"),
+            valueNumber=entry.get("value_number"),
+            updatedAt=entry.get("updated_at"),
+        )
+        for idx, entry in enumerate(result.get("items", []))
+    ]
+    dataset_timestamp = result.get("datasetTimestamp") or result.get("dataset_timestamp")
+    return MarketActivityListResponse(items=items, datasetTimestamp=dataset_timestamp)
+
+
+@router.get("/market/market-insight", response_model=MarketInsightResponse)
+@router.get("/news/market-insight", response_model=MarketInsightResponse, include_in_schema=False)
+def get_market_insight(
+    lookback_hours: int = Query(24, ge=1, le=72, alias="lookbackHours", description="Hours to look back when no summary exists."),
+    article_limit: int = Query(40, ge=5, le=50, alias="articleLimit", description="Maximum referenced headlines when no summary exists."),
+) -> MarketInsightResponse:
+    summary_payload: Optional[MarketInsightSummaryPayload] = None
+    articles: List[MarketInsightArticleItem] = []
+    summary_age_hours: Optional[float] = None
+
+    try:
+        summary = get_latest_market_insight()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to load latest market insight: %s", exc)
+        summary = None
+
+    if summary:
+        reference_dt = _parse_datetime(summary.get("window_end")) or _parse_datetime(summary.get("generated_at"))
+        if reference_dt:
+            delta = _local_now() - reference_dt
+            summary_age_hours = max(delta.total_seconds() / 3600.0, 0.0)
+        freshness_cutoff = max(lookback_hours, DEFAULT_MARKET_INSIGHT_LOOKBACK_HOURS) + MARKET_INSIGHT_STALE_GRACE_HOURS
+        summary_is_fresh = summary_age_hours is None or summary_age_hours <= freshness_cutoff
+        if summary_is_fresh:
+            payload = _build_market_insight_payload(summary)
+            summary_payload = payload["summary"]
+            articles = payload["articles"]
+        else:
+            logger.info(
+                "Latest market insight summary is stale (age %.1fh, cutoff %.1fh); returning live headlines",
+                summary_age_hours or -1.0,
+                freshness_cutoff,
+            )
+            summary = None
+
+    if summary is None:
+        try:
+            recent_articles = collect_recent_market_headlines(
+                lookback_hours=lookback_hours,
+                limit=article_limit,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.warning("Failed to collect recent market headlines: %s", exc)
+            recent_articles = []
+
+        for entry in recent_articles:
+            published_at = entry.get("published_at")
+            articles.append(
+                MarketInsightArticleItem(
+                    articleId=entry.get("article_id"),
+                    source=entry.get("source"),
+                    title=entry.get("title"),
+                    impactSummary=entry.get("impact_summary"),
+                    impactAnalysis=entry.get("impact_analysis"),
+                    impactConfidence=entry.get("impact_confidence"),
+                    markets=list(entry.get("impact_markets") or []),
+                    publishedAt=_localize_datetime(published_at) if isinstance(published_at, datetime) else None,
+                    url=entry.get("url"),
+                )
+            )
+
+    return MarketInsightResponse(summary=summary_payload, articles=articles)
+
+
+@router.get("/market/market-insight/history", response_model=MarketInsightHistoryResponse)
+@router.get("/news/market-insight/history", response_model=MarketInsightHistoryResponse, include_in_schema=False)
+def get_market_insight_history(
+    limit: int = Query(6, ge=1, le=20, description="Number of historical market insight records to return."),
+) -> MarketInsightHistoryResponse:
+    try:
+        records = list_market_insights(limit=limit)
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to list market insight history: %s", exc)
+        records = []
+
+    items: List[MarketInsightHistoryItem] = []
+    for record in records:
+        summary_json = record.get("summary_json")
+        if isinstance(summary_json, str):
+            try:
+                summary_json = json.loads(summary_json)
+            except json.JSONDecodeError:
+                summary_json = None
+        items.append(
+            MarketInsightHistoryItem(
+                summaryId=record.get("summary_id"),
+                generatedAt=_localize_datetime(record.get("generated_at")),
+                windowStart=_localize_datetime(record.get("window_start")),
+                windowEnd=_localize_datetime(record.get("window_end")),
+                summaryJson=summary_json,
+                modelUsed=record.get("model_used"),
+            )
+        )
+    return MarketInsightHistoryResponse(items=items)
+
+
+def _build_market_insight_payload(summary: Dict[str, object]) -> Dict[str, object]:
+    summary_json = summary.get("summary_json")
+    if isinstance(summary_json, str):
+        try:
+            summary_json = json.loads(summary_json)
+        except json.JSONDecodeError:
+            summary_json = {"text": summary_json}
+    elif summary_json is not None and not isinstance(summary_json, dict):
+        summary_json = {"text": str(summary_json)}
+
+    referenced = summary.get("referenced_articles") or []
+    articles: List[MarketInsightArticleItem] = []
+    if isinstance(referenced, str):
+        try:
+            referenced = json.loads(referenced)
+        except json.JSONDecodeError:
+            referenced = []
+    if isinstance(referenced, list):
+        for entry in referenced:
+            if not isinstance(entry, dict):
+                continue
+            markets = entry.get("markets") or entry.get("impact_markets") or []
+            if isinstance(markets, str):
+                markets = [part.strip() for part in markets.split(",") if part.strip()]
+            published_at = entry.get("published_at") or entry.get("publishedAt")
+            article_payload = {
+                "articleId": entry.get("article_id"),
+                "source": entry.get("source"),
+                "title": entry.get("title"),
+                "impactSummary": entry.get("impact_summary"),
+                "impactAnalysis": entry.get("impact_analysis"),
+                "impactConfidence": entry.get("impact_confidence"),
+                "markets": markets if isinstance(markets, list) else [],
+                "publishedAt": _parse_datetime(published_at),
+                "url": entry.get("url"),
+            }
+            articles.append(MarketInsightArticleItem(**article_payload))
+
+    generated_at = _localize_datetime(summary.get("generated_at"))
+    window_start = _localize_datetime(summary.get("window_start"))
+    window_end = _localize_datetime(summary.get("window_end"))
+    elapsed_ms = summary.get("elapsed_ms")
+    elapsed_seconds = None
+    if isinstance(elapsed_ms, (int, float)):
+        elapsed_seconds = float(elapsed_ms) / 1000.0
+
+    stage_payloads: List[MarketInsightStagePayload] = []
+    for order, stage_key in enumerate(MARKET_INSIGHT_STAGE_ORDER):
+        column = MARKET_INSIGHT_STAGE_COLUMN_MAP.get(stage_key)
+        stage_payloads.append(
+            _build_market_insight_stage_payload(
+                stage_key,
+                summary.get(column),
+                order,
+            )
+        )
+
+    summary_payload = MarketInsightSummaryPayload(
+        summaryId=str(summary.get("summary_id")),
+        generatedAt=generated_at or _local_now(),
+        windowStart=window_start or generated_at or _local_now(),
+        windowEnd=window_end or generated_at or _local_now(),
+        headlineCount=int(summary.get("headline_count") or 0),
+        summary=summary_json,
+        stages=stage_payloads,
+        rawResponse=summary.get("raw_response"),
+        promptTokens=summary.get("prompt_tokens"),
+        completionTokens=summary.get("completion_tokens"),
+        totalTokens=summary.get("total_tokens"),
+        elapsedSeconds=elapsed_seconds,
+        modelUsed=summary.get("model_used"),
+    )
+
+    return {
+        "summary": summary_payload,
+        "articles": articles,
+    }
+
+
+def _build_market_insight_stage_payload(
+    stage_key: str,
+    raw_stage: Optional[object],
+    order: int,
+) -> MarketInsightStagePayload:
+    stage_title = MARKET_INSIGHT_STAGE_TITLES.get(stage_key)
+    stage_data = raw_stage
+    if isinstance(stage_data, str):
+        try:
+            stage_data = json.loads(stage_data)
+        except json.JSONDecodeError:
+            stage_data = None
+    if isinstance(stage_data, dict):
+        result_block = stage_data.get("result") or {}
+        return MarketInsightStagePayload(
+            stage=stage_data.get("stage") or stage_key,
+            title=stage_data.get("title") or stage_title,
+            status=stage_data.get("status") or "pending",
+            startedAt=_localize_datetime(stage_data.get("started_at")),
+            finishedAt=_localize_datetime(stage_data.get("finished_at")),
+            analysis=result_block.get("analysis"),
+            highlights=result_block.get("highlights") or None,
+            bias=result_block.get("bias"),
+            confidence=result_block.get("confidence"),
+            keyMetrics=result_block.get("key_metrics") or None,
+            error=stage_data.get("error"),
+            usage=stage_data.get("usage"),
+            order=order,
+        )
+    return MarketInsightStagePayload(
+        stage=stage_key,
+        title=stage_title,
+        status="pending",
+        order=order,
+    )
+
+
+def _build_industry_insight_payload(
+    summary: Dict[str, Any],
+    *,
+    include_snapshot: bool = True,
+) -> Dict[str, Any]:
+    snapshot_obj = summary.get("summary_snapshot") if include_snapshot else None
+    generated_dt = _parse_datetime(summary.get("generated_at"))
+    window_start_dt = _parse_datetime(summary.get("window_start"))
+    window_end_dt = _parse_datetime(summary.get("window_end"))
+    summary_payload = IndustryInsightSummary(
+        summaryId=str(summary.get("summary_id")),
+        generatedAt=generated_dt.isoformat() if generated_dt else None,
+        windowStart=window_start_dt.isoformat() if window_start_dt else None,
+        windowEnd=window_end_dt.isoformat() if window_end_dt else None,
+        industryCount=summary.get("industry_count"),
+        summarySnapshot=snapshot_obj if isinstance(snapshot_obj, dict) else (snapshot_obj if include_snapshot else None),
+        summaryJson=summary.get("summary_json"),
+        rawResponse=summary.get("raw_response"),
+        referencedIndustries=summary.get("referenced_industries"),
+        referencedArticles=summary.get("referenced_articles"),
+        promptTokens=summary.get("prompt_tokens"),
+        completionTokens=summary.get("completion_tokens"),
+        totalTokens=summary.get("total_tokens"),
+        elapsedMs=summary.get("elapsed_ms"),
+        modelUsed=summary.get("model_used"),
+    )
+
+    snapshot_payload: Optional[IndustrySnapshot] = None
+    if include_snapshot and isinstance(snapshot_obj, dict):
+        try:
+            snapshot_payload = IndustrySnapshot(**snapshot_obj)
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.warning("Failed to parse stored industry snapshot for %s: %s", summary.get("summary_id"), exc)
+            snapshot_payload = None
+
+    return {"summary": summary_payload, "snapshot": snapshot_payload}
+
+
+def _build_industry_insight_response(
+    *,
+    summary: Optional[Dict[str, Any]],
+    snapshot: Optional[Dict[str, Any]],
+) -> IndustryInsightResponse:
+    summary_payload: Optional[IndustryInsightSummary] = None
+    snapshot_payload: Optional[IndustrySnapshot] = None
+
+    if summary:
+        payload = _build_industry_insight_payload(summary, include_snapshot=True)
+        summary_payload = payload.get("summary")  # type: ignore[assignment]
+        snapshot_payload = payload.get("snapshot")  # type: ignore[assignment]
+
+    if snapshot and not snapshot_payload:
+        try:
+            snapshot_payload = IndustrySnapshot(**snapshot)
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.warning("Failed to parse on-demand industry snapshot: %s", exc)
+            snapshot_payload = None
+
+    return IndustryInsightResponse(insight=summary_payload, snapshot=snapshot_payload)
+    generate_observation_pool,
@@ -0,0 +1,236 @@
+"""
+News article, insight and finance breakfast endpoints.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, Query
+
+from ...services import (
+    list_news_articles,
+    collect_recent_sector_headlines,
+    build_sector_group_snapshot,
+    get_latest_sector_insight,
+)
+from ..common import _local_now, _localize_datetime
+from ..schemas import (
+    SyncFinanceBreakfastRequest,
+    SyncGlobalFlashRequest,
+    NewsArticleItem,
+    SectorInsightArticleAssignment,
+    SectorInsightSnapshot,
+    SectorInsightSummaryPayload,
+    SectorInsightResponse,
+)
+from ..jobs import (
+    _submit_scheduler_task,
+    safe_start_finance_breakfast_job,
+    safe_start_global_flash_job,
+)
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+@router.get("/finance-breakfast", response_model=List[NewsArticleItem])
+async def list_finance_breakfast_entries(
+    limit: int = Query(50, ge=1, le=200, description="Maximum number of entries to return."),
+) -> List[NewsArticleItem]:
+    try:
+        entries = list_news_articles(source="finance_breakfast", limit=limit)
+    except Exception as exc:
+        logger.warning("Finance breakfast query failed: %s", exc)
+        entries = []
+    if not entries:
+        if not _submit_scheduler_task(safe_start_finance_breakfast_job(SyncFinanceBreakfastRequest())):
+            logger.debug("Finance breakfast sync could not be scheduled (no running loop).")
+    return [NewsArticleItem(**entry) for entry in entries]
+
+
+@router.get("/news/articles", response_model=List[NewsArticleItem])
+def list_news_articles_endpoint(
+    source: Optional[str] = Query(None, description="Optional source filter (e.g. global_flash, finance_breakfast)."),
+    limit: int = Query(100, ge=1, le=500, description="Maximum number of articles to return."),
+    only_relevant: bool = Query(
+        False,
+        alias="onlyRelevant",
+        description="Return only articles marked as relevant by the classifier.",
+    ),
+    stock: Optional[str] = Query(
+        None,
+        description="Comma-separated stock identifiers used to match tagged articles (code or name).",
+    ),
+    lookback_hours: Optional[int] = Query(
+        None,
+        alias="lookbackHours",
+        ge=1,
+        le=240,
+        description="Limit the publishing window to the most recent N hours.",
+    ),
+    before_published_at: Optional[datetime] = Query(
+        None,
+        alias="beforePublishedAt",
+        description="Keyset cursor: publishedAt of the last article on the previous page.",
+    ),
+    before_id: Optional[str] = Query(
+        None,
+        alias="beforeId",
+        description="Keyset cursor: articleId of the last article on the previous page.",
+    ),
+) -> List[NewsArticleItem]:
+    entries = list_news_articles(
+        source=source,
+        limit=limit,
+        only_relevant=only_relevant,
+        stock=stock,
+        lookback_hours=lookback_hours,
+        before_published_at=before_published_at,
+        before_id=before_id,
+    )
+    return [NewsArticleItem(**entry) for entry in entries]
+
+
+@router.get("/news/global-flash", response_model=List[NewsArticleItem])
+async def list_global_flash_entries(
+    limit: int = Query(100, ge=1, le=500, description="Maximum number of headlines to return."),
+) -> List[NewsArticleItem]:
+    try:
+        entries = list_news_articles(source="global_flash", limit=limit)
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Global flash query failed: %s", exc)
+        entries = []
+
+    if not entries:
+        if not _submit_scheduler_task(safe_start_global_flash_job(SyncGlobalFlashRequest())):
+            logger.debug("Global flash sync could not be scheduled (no running loop).")
+
+    return [NewsArticleItem(**entry) for entry in entries]
+
+
+@router.get("/news/sector-insight", response_model=SectorInsightResponse)
+def get_sector_insight(
+    lookback_hours: int = Query(24, ge=1, le=72, alias="lookbackHours", description="Hours to look back when no cached summary exists."),
+    article_limit: int = Query(40, ge=5, le=80, alias="articleLimit", description="Maximum articles to aggregate when rebuilding snapshot."),
+) -> SectorInsightResponse:
+    summary_record: Optional[Dict[str, Any]] = None
+    snapshot_dict: Optional[Dict[str, Any]] = None
+
+    try:
+        summary = get_latest_sector_insight()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to load latest sector insight: %s", exc)
+        summary = None
+
+    if summary:
+        summary_record = summary
+        group_snapshot = summary.get("group_snapshot")
+        if isinstance(group_snapshot, dict):
+            snapshot_dict = group_snapshot
+    else:
+        try:
+            headlines = collect_recent_sector_headlines(
+                lookback_hours=lookback_hours,
+                limit=article_limit,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.warning("Failed to collect sector-impact headlines: %s", exc)
+            headlines = []
+
+        if headlines:
+            snapshot_dict = build_sector_group_snapshot(
+                headlines,
+                lookback_hours=lookback_hours,
+                reference_time=_local_now(),
+            )
+
+    return _build_sector_insight_response(summary=summary_record, snapshot=snapshot_dict)
+
+
+def _build_sector_insight_payload(summary: Dict[str, object]) -> Dict[str, object]:
+    summary_json = summary.get("summary_json")
+    if isinstance(summary_json, str):
+        try:
+            summary_json = json.loads(summary_json)
+        except json.JSONDecodeError:
+            summary_json = {"text": summary_json}
+    elif summary_json is not None and not isinstance(summary_json, dict):
+        summary_json = {"text": str(summary_json)}
+
+    snapshot = summary.get("group_snapshot")
+    if isinstance(snapshot, str):
+        try:
+            snapshot = json.loads(snapshot)
+        except json.JSONDecodeError:
+            snapshot = None
+
+    snapshot_payload = None
+    if isinstance(snapshot, dict):
+        snapshot_payload = SectorInsightSnapshot(**snapshot)
+
+    referenced = summary.get("referenced_articles")
+    if isinstance(referenced, str):
+        try:
+            referenced = json.loads(referenced)
+        except json.JSONDecodeError:
+            referenced = []
+
+    referenced_items: List[SectorInsightArticleAssignment] = []
+    if isinstance(referenced, list):
+        for item in referenced:
+            if isinstance(item, dict):
+                referenced_items.append(SectorInsightArticleAssignment(**item))
+
+    generated_at = _localize_datetime(summary.get("generated_at"))
+    window_start = _localize_datetime(summary.get("window_start"))
+    window_end = _localize_datetime(summary.get("window_end"))
+    elapsed_ms = summary.get("elapsed_ms")
+    elapsed_seconds = None
+    if isinstance(elapsed_ms, (int, float)):
+        elapsed_seconds = float(elapsed_ms) / 1000.0
+
+    summary_payload = SectorInsightSummaryPayload(
+        summaryId=str(summary.get("summary_id")),
+        generatedAt=generated_at or _local_now(),
+        windowStart=window_start or generated_at or _local_now(),
+        windowEnd=window_end or generated_at or _local_now(),
+        headlineCount=int(summary.get("headline_count") or 0),
+        groupCount=int(summary.get("group_count") or 0),
+        summary=summary_json,
+        groupSnapshot=snapshot_payload,
+        rawResponse=summary.get("raw_response"),
+        promptTokens=summary.get("prompt_tokens"),
+        completionTokens=summary.get("completion_tokens"),
+        totalTokens=summary.get("total_tokens"),
+        elapsedSeconds=elapsed_seconds,
+        modelUsed=summary.get("model_used"),
+        referencedArticles=referenced_items,
+    )
+
+    return {
+        "summary": summary_payload,
+        "snapshot": snapshot_payload,
+    }
+
+
+def _build_sector_insight_response(
+    *,
+    summary: Optional[Dict[str, Any]],
+    snapshot: Optional[Dict[str, Any]],
+) -> SectorInsightResponse:
+    summary_payload: Optional[SectorInsightSummaryPayload] = None
+    snapshot_payload: Optional[SectorInsightSnapshot] = None
+
+    if summary:
+        payload = _build_sector_insight_payload(summary)
+        summary_payload = payload.get("summary")  # type: ignore[assignment]
+        snapshot_payload = payload.get("snapshot")  # type: ignore[assignment]
+
+    if snapshot and not snapshot_payload:
+        snapshot_payload = SectorInsightSnapshot(**snapshot)
+
+    return SectorInsightResponse(summary=summary_payload, snapshot=snapshot_payload)
@@ -0,0 +1,196 @@
+"""
+Indicator screening and observation pool endpoints.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, Query
+from fastapi.responses import Response
+
+from ...config.settings import load_settings
+from ...dao import IndicatorScreeningDAO
+from ...services import (
+    generate_observation_pool,
+    sync_indicator_continuous_volume,
+    sync_indicator_screening,
+    sync_all_indicator_screenings,
+    list_indicator_screenings_async,
+    run_indicator_realtime_refresh,
+)
+from ...services.indicator_screening_service import CONTINUOUS_VOLUME_CODE
+from ...fast_json import fast_json_response
+from ...state import monitor
+from ..schemas import (
+    ObservationPoolResponse,
+    IndicatorScreeningRecord,
+    IndicatorScreeningListResponse,
+    IndicatorSyncResponse,
+    IndicatorSyncBatchResponse,
+    IndicatorRealtimeRequest,
+    IndicatorRealtimeResponse,
+    IndicatorSyncStatsResponse,
+)
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+@router.get("/observation-pool", response_model=ObservationPoolResponse)
+def get_observation_pool() -> ObservationPoolResponse:
+    result = generate_observation_pool()
+    return ObservationPoolResponse(**result)
+
+
+@router.get("/indicator-screenings", response_model=IndicatorScreeningListResponse)
+async def list_indicator_screenings_endpoint(
+    indicators: Optional[List[str]] = Query(None, alias="indicators", description="Indicator code filters."),
+    net_income_yoy_min: Optional[float] = Query(None, alias="netIncomeYoyMin", description="Minimum net income YoY."),
+    net_income_qoq_min: Optional[float] = Query(None, alias="netIncomeQoqMin", description="Minimum net income QoQ."),
+    pe_min: Optional[float] = Query(None, alias="peMin", description="Minimum PE ratio."),
+    pe_max: Optional[float] = Query(None, alias="peMax", description="Maximum PE ratio."),
+    turnover_rate_min: Optional[float] = Query(None, alias="turnoverRateMin", description="Minimum daily turnover rate."),
+    turnover_rate_max: Optional[float] = Query(None, alias="turnoverRateMax", description="Maximum daily turnover rate."),
+    daily_change_min: Optional[float] = Query(None, alias="dailyChangeMin", description="Minimum daily price change."),
+    daily_change_max: Optional[float] = Query(None, alias="dailyChangeMax", description="Maximum daily price change."),
+    pct_change_1w_max: Optional[float] = Query(None, alias="pctChange1WMax", description="Maximum 1-week change."),
+    pct_change_1m_max: Optional[float] = Query(None, alias="pctChange1MMax", description="Maximum 1-month change."),
+    has_big_deal_inflow: Optional[bool] = Query(
+        None,
+        alias="hasBigDealInflow",
+        description="Require same-day big-deal inflow when true.",
+    ),
+    limit: int = Query(200, ge=1, le=500, description="Maximum number of entries to return."),
+    offset: int = Query(0, ge=0, description="Offset for pagination."),
+) -> Response:
+    result = await list_indicator_screenings_async(
+        indicator_codes=indicators,
+        limit=limit,
+        offset=offset,
+        net_income_yoy_min=net_income_yoy_min,
+        net_income_qoq_min=net_income_qoq_min,
+        pe_min=pe_min,
+        pe_max=pe_max,
+        turnover_rate_min=turnover_rate_min,
+        turnover_rate_max=turnover_rate_max,
+        daily_change_min=daily_change_min,
+        daily_change_max=daily_change_max,
+        pct_change_1w_max=pct_change_1w_max,
+        pct_change_1m_max=pct_change_1m_max,
+        has_big_deal_inflow=has_big_deal_inflow,
+    )
+    indicator_code_value = result.get("indicatorCode") or "all"
+    indicator_codes_value = result.get("indicatorCodes") or (
+        [] if indicator_code_value == "all" else [indicator_code_value]
+    )
+    items = [
+        IndicatorScreeningRecord(
+            indicatorCode=entry.get("indicatorCode", "continuous_volume"),
+            indicatorName=entry.get("indicatorName"),
+            capturedAt=entry.get("capturedAt"),
+            rank=entry.get("rank"),
+            stockCode=entry.get("stockCode"),
+            stockCodeFull=entry.get("stockCodeFull"),
+            stockName=entry.get("stockName"),
+            priceChangePercent=entry.get("priceChangePercent"),
+            stageChangePercent=entry.get("stageChangePercent"),
+            lastPrice=entry.get("lastPrice"),
+            volumeShares=entry.get("volumeShares"),
+            volumeText=entry.get("volumeText"),
+            baselineVolumeShares=entry.get("baselineVolumeShares"),
+            baselineVolumeText=entry.get("baselineVolumeText"),
+            volumeDays=entry.get("volumeDays"),
+            turnoverRate=entry.get("turnoverRate"),
+            turnoverAmount=entry.get("turnoverAmount"),
+            turnoverAmountText=entry.get("turnoverAmountText"),
+            highPrice=entry.get("highPrice"),
+            lowPrice=entry.get("lowPrice"),
+            bigDealNetAmount=entry.get("bigDealNetAmount"),
+            bigDealBuyAmount=entry.get("bigDealBuyAmount"),
+            bigDealSellAmount=entry.get("bigDealSellAmount"),
+            bigDealTradeCount=entry.get("bigDealTradeCount"),
+            netIncomeYoyLatest=entry.get("netIncomeYoyLatest"),
+            netIncomeQoqLatest=entry.get("netIncomeQoqLatest"),
+            peRatio=entry.get("peRatio"),
+            turnoverPercent=entry.get("turnoverPercent"),
+            industry=entry.get("industry"),
+            matchedIndicators=entry.get("matchedIndicators") or [],
+            hasBigDealInflow=entry.get("hasBigDealInflow"),
+            indicatorDetails=entry.get("indicatorDetails") or {},
+        )
+        for entry in result.get("items", [])
+    ]
+    return fast_json_response(
+        IndicatorScreeningListResponse(
+            indicatorCode=indicator_code_value,
+            indicatorCodes=indicator_codes_value,
+            indicatorName=result.get("indicatorName"),
+            capturedAt=result.get("capturedAt"),
+            total=int(result.get("total", 0)),
+            items=items,
+        )
+    )
+
+
+@router.get("/indicator-screenings/continuous-volume", response_model=IndicatorScreeningListResponse)
+async def list_indicator_continuous_volume(
+    limit: int = Query(200, ge=1, le=500, description="Maximum number of entries to return."),
+    offset: int = Query(0, ge=0, description="Offset for pagination."),
+) -> Response:
+    return await list_indicator_screenings_endpoint(indicators=[CONTINUOUS_VOLUME_CODE], limit=limit, offset=offset)
+
+
+@router.post("/indicator-screenings/continuous-volume/sync", response_model=IndicatorSyncResponse)
+def sync_indicator_continuous_volume_endpoint() -> IndicatorSyncResponse:
+    result = sync_indicator_continuous_volume()
+    return IndicatorSyncResponse(**result)
+
+
+@router.post("/indicator-screenings/sync", response_model=IndicatorSyncBatchResponse)
+def sync_indicator_screening_endpoint(
+    indicator: Optional[str] = Query(None, description="Indicator code to refresh (default: all)."),
+) -> IndicatorSyncBatchResponse:
+    if indicator:
+        result = sync_indicator_screening(indicator_code=indicator)
+        payload = [IndicatorSyncResponse(**result)]
+    else:
+        batch = sync_all_indicator_screenings()
+        payload = [IndicatorSyncResponse(**item) for item in batch]
+    return IndicatorSyncBatchResponse(results=payload)
+
+
+@router.post("/indicator-screenings/realtime-refresh", response_model=IndicatorRealtimeResponse)
+def indicator_realtime_refresh_endpoint(payload: IndicatorRealtimeRequest) -> IndicatorRealtimeResponse:
+    result = run_indicator_realtime_refresh(payload.codes, sync_all=payload.syncAll)
+    return IndicatorRealtimeResponse(**result)
+
+
+@router.get("/indicator-screenings/stats", response_model=IndicatorSyncStatsResponse)
+def indicator_sync_stats_endpoint() -> IndicatorSyncStatsResponse:
+    snapshot = monitor.snapshot()
+
+    def build_job_payload(name: str) -> Dict[str, Optional[Any]]:
+        state = snapshot.get(name) or {}
+        return {
+            "status": state.get("status", "idle"),
+            "startedAt": state.get("startedAt"),
+            "finishedAt": state.get("finishedAt"),
+            "message": state.get("message"),
+            "totalRows": state.get("totalRows"),
+        }
+
+    settings = load_settings()
+    dao = IndicatorScreeningDAO(settings.postgres)
+    try:
+        captured_at = dao.latest_captured()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to fetch indicator latest capture time: %s", exc)
+        captured_at = None
+
+    return IndicatorSyncStatsResponse(
+        realtimeTrade=build_job_payload("realtime_trade"),
+        bigDeal=build_job_payload("big_deal_fund_flow"),
+        indicatorCapturedAt=captured_at,
+    )
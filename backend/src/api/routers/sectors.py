@@ -0,0 +1,422 @@
+"""
+Concept and industry search, watchlist and volume-price reasoning endpoints.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, Body, HTTPException, Query, Path
+from fastapi.responses import StreamingResponse
+
+from ...services import (
+    list_industry_news,
+    list_concept_news,
+    search_concepts,
+    search_industries,
+    list_concept_watchlist,
+    list_industry_watchlist,
+    get_concept_status,
+    get_industry_status,
+    delete_concept_watch_entry,
+    delete_industry_watch_entry,
+    set_concept_watch_state,
+    set_industry_watch_state,
+    refresh_concept_history,
+    refresh_industry_history,
+    generate_concept_volume_price_reasoning,
+    get_latest_volume_price_reasoning,
+    list_volume_price_history,
+    generate_industry_volume_price_reasoning,
+    get_latest_industry_volume_price_reasoning,
+    list_industry_volume_price_history,
+    list_concept_constituents,
+)
+from ..schemas import (
+    IndustryNewsArticle,
+    ConceptSearchItem,
+    ConceptSearchResponse,
+    ConceptWatchEntry,
+    ConceptWatchlistResponse,
+    ConceptWatchRequest,
+    ConceptStatusResponse,
+    ConceptRefreshRequest,
+    ConceptVolumePriceRequest,
+    ConceptRefreshResponse,
+    ConceptConstituentResponse,
+    IndustrySearchItem,
+    IndustrySearchResponse,
+    IndustryWatchEntry,
+    IndustryWatchlistResponse,
+    IndustryWatchRequest,
+    IndustryStatusResponse,
+    IndustryRefreshRequest,
+    IndustryRefreshResponse,
+    IndustryNewsListResponse,
+    ConceptNewsListResponse,
+    ConceptVolumePriceRecord,
+    ConceptVolumePriceHistoryResponse,
+    IndustryVolumePriceRequest,
+    IndustryVolumePriceRecord,
+    IndustryVolumePriceHistoryResponse,
+)
+
+router = APIRouter()
+
+
+def _stringify_value(value: Any) -> str:
+    if isinstance(value, dict):
+        try:
+            return json.dumps(value, ensure_ascii=False)
+        except (TypeError, ValueError):
+            return str(value)
+    if isinstance(value, (list, tuple)):
+        return "；".join(str(item) for item in value)
+    return str(value)
+
+
+def _format_volume_summary_lines(summary_payload: Any, raw_text: Optional[str]) -> List[str]:
+    parsed_summary: Optional[Dict[str, Any]] = None
+    if isinstance(summary_payload, dict):
+        parsed_summary = summary_payload
+    elif isinstance(summary_payload, str) and summary_payload.strip():
+        try:
+            parsed_summary = json.loads(summary_payload)
+        except (TypeError, json.JSONDecodeError):
+            parsed_summary = None
+    elif raw_text and raw_text.strip():
+        try:
+            parsed_summary = json.loads(raw_text)
+        except (TypeError, json.JSONDecodeError):
+            parsed_summary = None
+
+    lines: List[str] = []
+    if parsed_summary:
+        phase = parsed_summary.get("wyckoffPhase")
+        confidence = parsed_summary.get("confidence")
+        if phase or confidence is not None:
+            header = f"【阶段判定】{phase or '--'}"
+            if confidence is not None:
+                try:
+                    confidence_value = float(confidence)
+                    header += f" · 置信度 {confidence_value * 100:.0f}%"
+                except (TypeError, ValueError):
+                    header += f" · 置信度 {confidence}"
+            lines.append(header)
+            lines.append("")
+
+        summary_text = parsed_summary.get("stageSummary")
+        if summary_text:
+            lines.append("【量价结论】")
+            if isinstance(summary_text, (list, tuple)):
+                lines.extend(str(item) for item in summary_text if item is not None)
+            else:
+                lines.extend(str(summary_text).splitlines())
+            lines.append("")
+
+        intent = parsed_summary.get("compositeIntent")
+        if intent:
+            lines.append(f"【主力意图】{intent}")
+            lines.append("")
+
+        def _append_section(label: str, items: Any) -> None:
+            if not items:
+                return
+            if isinstance(items, (list, tuple)):
+                formatted = [str(item) if not isinstance(item, dict) else _stringify_value(item) for item in items]
+            else:
+                formatted = [str(items)]
+            lines.append(f"【{label}】")
+            for idx, item in enumerate(formatted, start=1):
+                lines.append(f"{idx}. {item}")
+            lines.append("")
+
+        _append_section("量能信号", parsed_summary.get("volumeSignals"))
+        _append_section("价格/结构信号", parsed_summary.get("priceSignals"))
+        _append_section("策略建议", parsed_summary.get("strategy"))
+        _append_section("风险提示", parsed_summary.get("risks"))
+        _append_section("后续观察", parsed_summary.get("checklist"))
+
+    if not lines:
+        fallback = raw_text or (summary_payload if isinstance(summary_payload, str) else "")
+        fallback_text = str(fallback or "").strip()
+        if fallback_text:
+            lines = fallback_text.splitlines()
+        else:
+            lines = ["暂无推理输出。"]
+
+    return lines
+
+
+@router.get("/industries/search", response_model=IndustrySearchResponse)
+def search_industries_api(
+    q: Optional[str] = Query(None, description="Optional keyword to filter industries."),
+    limit: int = Query(20, ge=1, le=100),
+) -> IndustrySearchResponse:
+    items = [IndustrySearchItem(**entry) for entry in search_industries(q, limit=limit)]
+    return IndustrySearchResponse(items=items)
+
+
+@router.get("/industries/watchlist", response_model=IndustryWatchlistResponse)
+def list_industry_watchlist_api() -> IndustryWatchlistResponse:
+    items = [IndustryWatchEntry(**entry) for entry in list_industry_watchlist()]
+    return IndustryWatchlistResponse(items=items)
+
+
+@router.post("/industries/watchlist", response_model=IndustryWatchEntry)
+def add_industry_watch(payload: IndustryWatchRequest = Body(...)) -> IndustryWatchEntry:
+    result = set_industry_watch_state(payload.industry, watch=True)
+    return IndustryWatchEntry(**result)
+
+
+@router.delete("/industries/watchlist/{industry}", response_model=IndustryWatchEntry)
+def remove_industry_watch(
+    industry: str = Path(..., min_length=1),
+    permanent: bool = Query(False, description="When true, delete the entry instead of toggling watch state."),
+) -> IndustryWatchEntry:
+    if permanent:
+        result = delete_industry_watch_entry(industry)
+    else:
+        result = set_industry_watch_state(industry, watch=False)
+    return IndustryWatchEntry(**result)
+
+
+@router.get("/industries/status", response_model=IndustryStatusResponse)
+def get_industry_status_api(industry: str = Query(..., min_length=1)) -> IndustryStatusResponse:
+    data = get_industry_status(industry)
+    return IndustryStatusResponse(**data)
+
+
+@router.post("/industries/refresh-history", response_model=IndustryRefreshResponse)
+def refresh_industry_history_api(payload: IndustryRefreshRequest = Body(...)) -> IndustryRefreshResponse:
+    result = refresh_industry_history(
+        payload.industry,
+        lookback_days=payload.lookback_days or 180,
+    )
+    return IndustryRefreshResponse(**result)
+
+
+@router.get("/industries/news", response_model=IndustryNewsListResponse)
+def list_industry_news_api(
+    industry: str = Query(..., min_length=1),
+    lookback_hours: int = Query(48, ge=1, le=240, alias="lookbackHours"),
+    limit: int = Query(30, ge=1, le=100),
+    before_published_at: Optional[datetime] = Query(
+        None,
+        alias="beforePublishedAt",
+        description="Keyset cursor: publishedAt of the last article on the previous page.",
+    ),
+    before_id: Optional[str] = Query(
+        None,
+        alias="beforeId",
+        description="Keyset cursor: articleId of the last article on the previous page.",
+    ),
+) -> IndustryNewsListResponse:
+    try:
+        records = list_industry_news(
+            industry,
+            lookback_hours=lookback_hours,
+            limit=limit,
+            before_published_at=before_published_at,
+            before_id=before_id,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    items = [IndustryNewsArticle(**entry) for entry in records]
+    return IndustryNewsListResponse(items=items)
+
+
+@router.get("/concepts/search", response_model=ConceptSearchResponse)
+def search_concepts_api(
+    q: Optional[str] = Query(None, description="Optional keyword to filter concepts."),
+    limit: int = Query(20, ge=1, le=100),
+) -> ConceptSearchResponse:
+    items = [ConceptSearchItem(**entry) for entry in search_concepts(q, limit=limit)]
+    return ConceptSearchResponse(items=items)
+
+
+@router.get("/concepts/watchlist", response_model=ConceptWatchlistResponse)
+def list_concept_watchlist_api() -> ConceptWatchlistResponse:
+    items = [ConceptWatchEntry(**entry) for entry in list_concept_watchlist()]
+    return ConceptWatchlistResponse(items=items)
+
+
+@router.post("/concepts/watchlist", response_model=ConceptWatchEntry)
+def add_concept_watch(payload: ConceptWatchRequest = Body(...)) -> ConceptWatchEntry:
+    result = set_concept_watch_state(payload.concept, watch=True)
+    return ConceptWatchEntry(**result)
+
+
+@router.delete("/concepts/watchlist/{concept}", response_model=ConceptWatchEntry)
+def remove_concept_watch(
+    concept: str = Path(..., min_length=1),
+    permanent: bool = Query(False, description="When true, delete the entry instead of toggling watch state."),
+) -> ConceptWatchEntry:
+    if permanent:
+        result = delete_concept_watch_entry(concept)
+    else:
+        result = set_concept_watch_state(concept, watch=False)
+    return ConceptWatchEntry(**result)
+
+
+@router.get("/concepts/status", response_model=ConceptStatusResponse)
+def get_concept_status_api(concept: str = Query(..., min_length=1)) -> ConceptStatusResponse:
+    data = get_concept_status(concept)
+    return ConceptStatusResponse(**data)
+
+
+@router.post("/concepts/refresh-history", response_model=ConceptRefreshResponse)
+def refresh_concept_history_api(payload: ConceptRefreshRequest = Body(...)) -> ConceptRefreshResponse:
+    result = refresh_concept_history(
+        payload.concept,
+        lookback_days=payload.lookback_days or 180,
+    )
+    return ConceptRefreshResponse(**result)
+
+
+@router.get("/concepts/constituents", response_model=ConceptConstituentResponse)
+def get_concept_constituents_api(
+    concept: str = Query(..., min_length=1),
+    max_pages: Optional[int] = Query(None, ge=1, le=10, alias="maxPages"),
+    refresh: bool = Query(False, description="Set true to queue a background THS refresh."),
+) -> ConceptConstituentResponse:
+    result = list_concept_constituents(concept, max_pages=max_pages, refresh=refresh)
+    return ConceptConstituentResponse(**result)
+
+
+@router.get("/concepts/volume-price-analysis/latest", response_model=ConceptVolumePriceRecord)
+def get_concept_volume_price_latest(concept: str = Query(..., min_length=1)) -> ConceptVolumePriceRecord:
+    record = get_latest_volume_price_reasoning(concept)
+    if not record:
+        raise HTTPException(status_code=404, detail="Volume/price reasoning not found for concept.")
+    return ConceptVolumePriceRecord(**record)
+
+
+@router.get("/concepts/volume-price-analysis/history", response_model=ConceptVolumePriceHistoryResponse)
+def list_concept_volume_price_history(
+    concept: str = Query(..., min_length=1),
+    limit: int = Query(10, ge=1, le=50),
+    offset: int = Query(0, ge=0),
+) -> ConceptVolumePriceHistoryResponse:
+    result = list_volume_price_history(concept, limit=limit, offset=offset)
+    items = [ConceptVolumePriceRecord(**entry) for entry in result.get("items", []) if entry]
+    return ConceptVolumePriceHistoryResponse(total=int(result.get("total", 0)), items=items)
+
+
+@router.get("/concepts/news", response_model=ConceptNewsListResponse)
+def list_concept_news_api(
+    concept: str = Query(..., min_length=1),
+    lookback_hours: int = Query(48, ge=1, le=240, alias="lookbackHours"),
+    limit: int = Query(40, ge=1, le=100),
+    before_published_at: Optional[datetime] = Query(
+        None,
+        alias="beforePublishedAt",
+        description="Keyset cursor: publishedAt of the last article on the previous page.",
+    ),
+    before_id: Optional[str] = Query(
+        None,
+        alias="beforeId",
+        description="Keyset cursor: articleId of the last article on the previous page.",
+    ),
+) -> ConceptNewsListResponse:
+    try:
+        records = list_concept_news(
+            concept,
+            lookback_hours=lookback_hours,
+            limit=limit,
+            before_published_at=before_published_at,
+            before_id=before_id,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    items = [IndustryNewsArticle(**entry) for entry in records]
+    return ConceptNewsListResponse(items=items)
+
+
+@router.post("/concepts/volume-price-analysis")
+def stream_concept_volume_price_analysis(payload: ConceptVolumePriceRequest = Body(...)) -> StreamingResponse:
+    def stream_generator():
+        result = generate_concept_volume_price_reasoning(
+            payload.concept,
+            lookback_days=payload.lookback_days,
+            run_llm=payload.run_llm,
+        )
+
+        header_parts = [
+            f"概念: {result.get('concept')} ({result.get('conceptCode')})",
+            f"样本: 最近{result.get('lookbackDays')}个交易日",
+        ]
+        stats = result.get("statistics") or {}
+        change_percent = stats.get("changePercent")
+        if change_percent is not None:
+            header_parts.append(f"区间涨跌幅 {change_percent}%")
+        avg_volume = stats.get("avgVolume")
+        if avg_volume is not None:
+            header_parts.append(f"平均成交量 {avg_volume}")
+        model_name = result.get("model")
+        if model_name:
+            header_parts.append(f"模型 {model_name}")
+        generated_at = result.get("generatedAt")
+        if generated_at:
+            header_parts.append(f"时间 {generated_at}")
+        yield " · ".join(str(part) for part in header_parts if part) + "\n\n"
+
+        for line in _format_volume_summary_lines(result.get("summary"), result.get("rawText")):
+            yield line + "\n"
+
+    return StreamingResponse(stream_generator(), media_type="text/plain; charset=utf-8")
+
+
+@router.get("/industries/volume-price-analysis/latest", response_model=IndustryVolumePriceRecord)
+def get_industry_volume_price_latest(industry: str = Query(..., min_length=1)) -> IndustryVolumePriceRecord:
+    record = get_latest_industry_volume_price_reasoning(industry)
+    if not record:
+        raise HTTPException(status_code=404, detail="Volume/price reasoning not found for industry.")
+    return IndustryVolumePriceRecord(**record)
+
+
+@router.get("/industries/volume-price-analysis/history", response_model=IndustryVolumePriceHistoryResponse)
+def list_industry_volume_price_history_api(
+    industry: str = Query(..., min_length=1),
+    limit: int = Query(10, ge=1, le=50),
+    offset: int = Query(0, ge=0),
+) -> IndustryVolumePriceHistoryResponse:
+    result = list_industry_volume_price_history(industry, limit=limit, offset=offset)
+    items = [IndustryVolumePriceRecord(**entry) for entry in result.get("items", []) if entry]
+    return IndustryVolumePriceHistoryResponse(total=int(result.get("total", 0)), items=items)
+
+
+@router.post("/industries/volume-price-analysis")
+def stream_industry_volume_price_analysis(payload: IndustryVolumePriceRequest = Body(...)) -> StreamingResponse:
+    def stream_generator():
+        result = generate_industry_volume_price_reasoning(
+            payload.industry,
+            lookback_days=payload.lookback_days,
+            run_llm=payload.run_llm,
+        )
+
+        header_parts = [
+            f"行业: {result.get('industry')} ({result.get('industryCode')})",
+            f"样本: 最近{result.get('lookbackDays')}个交易日",
+        ]
+        stats = result.get("statistics") or {}
+        change_percent = stats.get("changePercent")
+        if change_percent is not None:
+            header_parts.append(f"区间涨跌幅 {change_percent}%")
+        avg_volume = stats.get("avgVolume")
+        if avg_volume is not None:
+            header_parts.append(f"平均成交量 {avg_volume}")
+        model_name = result.get("model")
+        if model_name:
+            header_parts.append(f"模型 {model_name}")
+        generated_at = result.get("generatedAt")
+        if generated_at:
+            header_parts.append(f"时间 {generated_at}")
+        yield " · ".join(str(part) for part in header_parts if part) + "\n\n"
+
+        for line in _format_volume_summary_lines(result.get("summary"), result.get("rawText")):
+            yield line + "\n"
+
+    return StreamingResponse(stream_generator(), media_type="text/plain; charset=utf-8")
@@ -0,0 +1,1046 @@
+"""
+Stock list, detail, bundle, notes, analyses, favorites and investment journal endpoints.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import time
+import re
+from datetime import date, datetime
+from typing import Any, Callable, Dict, FrozenSet, List, Optional
+
+from fastapi import APIRouter, Body, HTTPException, Query, Path
+from fastapi.responses import Response
+
+from ...config.runtime_config import load_runtime_config
+from ...services import (
+    get_stock_detail,
+    get_stock_overview_async,
+    get_favorite_status,
+    get_concept_membership_index,
+    list_favorite_entries_async,
+    list_favorite_groups,
+    list_research_reports,
+    analyze_research_reports,
+    list_research_report_distillation,
+    list_stock_news,
+    add_stock_note,
+    list_stock_notes,
+    list_recent_stock_notes,
+    set_favorite_state,
+    sync_research_reports,
+    search_stocks,
+    gather_sections,
+    generate_stock_volume_price_reasoning,
+    get_current_stock_analysis,
+    get_latest_stock_volume_price_reasoning,
+    list_stock_volume_price_history,
+    generate_stock_integrated_analysis,
+    get_latest_stock_integrated_analysis,
+    list_stock_integrated_analysis_history,
+    generate_stock_valuation_analysis,
+    get_latest_stock_valuation_analysis,
+    list_stock_valuation_analysis_history,
+    list_investment_journal_entries,
+    get_investment_journal_entry,
+    upsert_investment_journal_entry,
+    sync_stock_news,
+)
+from ...services.concept_membership_service import normalize_symbol
+from ...fast_json import fast_json_response
+from ..common import LOCAL_TZ, _localize_datetime, _build_big_deal_fund_flow_response
+from ..schemas import (
+    INTEGRATED_NEWS_DAYS_DEFAULT,
+    INTEGRATED_TRADE_DAYS_DEFAULT,
+    StockItem,
+    StockDetailResponse,
+    StockListResponse,
+    StockBundleResponse,
+    FavoriteEntry,
+    FavoriteListResponse,
+    FavoriteStatusResponse,
+    FavoriteGroupItem,
+    FavoriteGroupListResponse,
+    StockNoteItem,
+    StockNoteListResponse,
+    StockNoteCreateRequest,
+    FavoriteUpsertRequest,
+    SyncResearchReportRequest,
+    ResearchReportRecord,
+    ResearchReportListResponse,
+    ResearchReportAnalysisRequest,
+    ResearchReportAnalysisResponse,
+    InvestmentJournalEntryPayload,
+    InvestmentJournalEntryResponse,
+    StockVolumePriceRequest,
+    StockVolumePriceRecord,
+    StockVolumePriceHistoryResponse,
+    StockIntegratedAnalysisRequest,
+    StockIntegratedAnalysisRecord,
+    StockIntegratedAnalysisHistoryResponse,
+    StockValuationAnalysisRequest,
+    StockValuationAnalysisRecord,
+    StockValuationAnalysisHistoryResponse,
+    StockNewsSyncRequest,
+    StockNewsSyncResponse,
+    StockNewsItem,
+    StockNewsListResponse,
+)
+from .financials import list_performance_express_entries, list_performance_forecast_entries
+from .fund_flow import list_individual_fund_flow_entries
+
+router = APIRouter()
+
+DEFAULT_VALUATION_SUMMARY = {
+    "valuationSummary": "尚未生成估值分析。",
+    "valuationRange": {"bear": None, "base": None, "bull": None},
+    "valuationMethods": [],
+    "peerComparison": [],
+    "drivers": [],
+    "risks": [],
+    "recommendation": {"stance": "", "targetPrice": "", "actions": []},
+    "confidence": 0,
+}
+
+_SANITIZE_SCRIPT_STYLE_RE = re.compile(r"<\s*(script|style)[^>]*>.*?<\s*/\s*\1\s*>", re.IGNORECASE | re.DOTALL)
+_SANITIZE_EVENT_RE = re.compile(r"\son[a-z]+\s*=\s*(\"[^\"]*\"|'[^']*')", re.IGNORECASE)
+_SANITIZE_JS_URL_RE = re.compile(r"javascript\s*:", re.IGNORECASE)
+
+
+def _sanitize_rich_text(value: Optional[str]) -> Optional[str]:
+    if value is None:
+        return None
+    sanitized = _SANITIZE_SCRIPT_STYLE_RE.sub("", value)
+    sanitized = _SANITIZE_EVENT_RE.sub("", sanitized)
+    sanitized = _SANITIZE_JS_URL_RE.sub("", sanitized)
+    sanitized = sanitized.strip()
+    return sanitized or None
+
+
+FAVORITE_GROUP_NONE_SENTINEL = "__ungrouped__"
+MAX_FAVORITE_GROUP_LENGTH = 64
+
+
+def _validate_favorite_group_name(value: Optional[str]) -> Optional[str]:
+    """Validate favorite group names from query params or payloads."""
+    if value is None:
+        return None
+    normalized = value.strip()
+    if not normalized:
+        return None
+    if len(normalized) > MAX_FAVORITE_GROUP_LENGTH:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Favorite group name must be at most {MAX_FAVORITE_GROUP_LENGTH} characters.",
+        )
+    if any(ord(char) < 32 for char in normalized):
+        raise HTTPException(
+            status_code=400,
+            detail="Favorite group name contains invalid control characters.",
+        )
+    return normalized
+
+
+def _parse_favorite_group_query(value: Optional[str]) -> tuple[Optional[str], bool]:
+    """Normalize favorite group query parameter."""
+    if value is None:
+        return None, False
+    if value == FAVORITE_GROUP_NONE_SENTINEL:
+        return None, True
+    normalized = value.strip()
+    if not normalized:
+        return None, True
+    return _validate_favorite_group_name(normalized), True
+
+
+SORTABLE_STOCK_FIELDS: dict[str, str] = {
+    "pctchange1y": "pct_change_1y",
+    "pct_change_1y": "pct_change_1y",
+    "pctchange6m": "pct_change_6m",
+    "pct_change_6m": "pct_change_6m",
+    "pctchange3m": "pct_change_3m",
+    "pct_change_3m": "pct_change_3m",
+    "pctchange1m": "pct_change_1m",
+    "pct_change_1m": "pct_change_1m",
+    "pctchange2w": "pct_change_2w",
+    "pct_change_2w": "pct_change_2w",
+    "pctchange1w": "pct_change_1w",
+    "pct_change_1w": "pct_change_1w",
+}
+
+
+@router.get("/stocks", response_model=StockListResponse)
+async def list_stocks(
+    keyword: Optional[str] = Query(None, description="Keyword to search code/name/industry"),
+    industry: Optional[str] = Query(None, description="Filter by industry"),
+    concept: Optional[str] = Query(None, description="Filter by concept name(s), comma separated"),
+    concept_mode: str = Query(
+        "any",
+        alias="conceptMode",
+        regex="^(any|all)$",
+        description="Match stocks in any (OR) or all (AND) of the requested concepts.",
+    ),
+    include_concepts: bool = Query(
+        False,
+        alias="includeConcepts",
+        description="When true, tag each returned stock with its concepts.",
+    ),
+    exchange: Optional[str] = Query(None, description="Filter by exchange"),
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    search_only: bool = Query(
+        False,
+        alias="searchOnly",
+        description="When true, bypass filter metrics and return keyword matches directly.",
+    ),
+    pct_change_min: Optional[float] = Query(
+        None,
+        alias="pctChangeMin",
+        description="Minimum daily percentage change filter.",
+    ),
+    pct_change_max: Optional[float] = Query(
+        None,
+        alias="pctChangeMax",
+        description="Maximum daily percentage change filter.",
+    ),
+    volume_spike_min: Optional[float] = Query(
+        None,
+        alias="volumeSpikeMin",
+        ge=0.0,
+        description="Minimum volume spike ratio (latest volume / 10-day average).",
+    ),
+    market_cap_min: Optional[float] = Query(
+        None,
+        alias="marketCapMin",
+        ge=0.0,
+        description="Minimum market capitalization filter (absolute currency units).",
+    ),
+    market_cap_max: Optional[float] = Query(
+        None,
+        alias="marketCapMax",
+        ge=0.0,
+        description="Maximum market capitalization filter (absolute currency units).",
+    ),
+    pe_min: Optional[float] = Query(
+        None,
+        alias="peMin",
+        description="Minimum PE ratio filter.",
+    ),
+    pe_max: Optional[float] = Query(
+        None,
+        alias="peMax",
+        description="Maximum PE ratio filter.",
+    ),
+    roe_min: Optional[float] = Query(
+        None,
+        alias="roeMin",
+        description="Minimum ROE filter.",
+    ),
+    net_income_qoq_min: Optional[float] = Query(
+        None,
+        alias="netIncomeQoqMin",
+        description="Minimum net income QoQ ratio filter (allow negatives for declines).",
+    ),
+    net_income_yoy_min: Optional[float] = Query(
+        None,
+        alias="netIncomeYoyMin",
+        description="Minimum net income YoY ratio filter (allow negatives for declines).",
+    ),
+    favorites_only: bool = Query(
+        False,
+        alias="favoritesOnly",
+        description="When true, limit the response to favorite stocks only.",
+    ),
+    favorite_group: Optional[str] = Query(
+        None,
+        alias="favoriteGroup",
+        description=(
+            "Optional favorite group filter. "
+            f"Use '{FAVORITE_GROUP_NONE_SENTINEL}' to show ungrouped favorites."
+        ),
+    ),
+    sort_by: Optional[str] = Query(
+        None,
+        alias="sortBy",
+        description="Optional sort field (pctChange1Y, pctChange6M, pctChange3M, pctChange1M, pctChange2W, pctChange1W).",
+    ),
+    sort_order: Optional[str] = Query(
+        "desc",
+        alias="sortOrder",
+        description="Sort order: asc or desc (default desc).",
+    ),
+) -> Response:
+    """Return paginated stock fundamentals enriched with latest trading data."""
+    if keyword is not None:
+        stripped_keyword = keyword.strip()
+        keyword = stripped_keyword or None
+
+    normalized_group, group_specified = _parse_favorite_group_query(favorite_group)
+    effective_favorites_only = favorites_only or group_specified
+    result = await get_stock_overview_async(
+        keyword=keyword,
+        industry=industry,
+        exchange=exchange,
+        limit=None,
+        offset=0,
+        favorites_only=effective_favorites_only,
+        favorite_group=normalized_group,
+        favorite_group_specified=group_specified,
+    )
+
+    concept_filter = [name.strip() for name in re.split(r"[,，]", concept or "") if name.strip()]
+    membership_index = None
+    if concept_filter or include_concepts:
+        membership_index = await asyncio.to_thread(get_concept_membership_index)
+    concept_symbol_filter: Optional[FrozenSet[str]] = None
+    if concept_filter:
+        concept_symbol_filter = membership_index.symbols_for(concept_filter, mode=concept_mode)
+
+    def _build_page() -> Response:
+        # Filtering, sorting and serialising the full universe is CPU-bound work.
+        def _matches_concept(payload: dict[str, object]) -> bool:
+            if concept_symbol_filter is None:
+                return True
+            if not concept_symbol_filter:
+                return False
+            return normalize_symbol(payload.get("code") or payload.get("symbol")) in concept_symbol_filter
+
+        source_items = [item for item in result["items"] if _matches_concept(item)]
+
+        available_industries = sorted(
+            {
+                item.get("industry")
+                for item in source_items
+                if isinstance(item.get("industry"), str) and item.get("industry")
+            }
+        )
+
+        def _passes_filters(payload: dict[str, object]) -> bool:
+            def _extract_numeric(key: str) -> Optional[float]:
+                value = payload.get(key)
+                if value is None:
+                    return None
+                try:
+                    numeric = float(value)
+                except (TypeError, ValueError):
+                    return None
+                if not math.isfinite(numeric):
+                    return None
+                return numeric
+
+            def _gt(key: str, threshold: float) -> bool:
+                if threshold is None:
+                    return True
+                numeric = _extract_numeric(key)
+                if numeric is None:
+                    return False
+                return numeric > threshold
+
+            def _range(
+                key: str, *, minimum: Optional[float] = None, maximum: Optional[float] = None
+            ) -> bool:
+                if minimum is None and maximum is None:
+                    return True
+                numeric = _extract_numeric(key)
+                if numeric is None:
+                    return False
+                if minimum is not None and numeric < minimum:
+                    return False
+                if maximum is not None and numeric > maximum:
+                    return False
+                return True
+
+            return all(
+                (
+                    _range("pct_change", minimum=pct_change_min, maximum=pct_change_max),
+                    _gt("volume_spike", volume_spike_min),
+                    _range("pe_ratio", minimum=pe_min, maximum=pe_max),
+                    _range("market_cap", minimum=market_cap_min, maximum=market_cap_max),
+                    _gt("roe", roe_min),
+                    _gt("net_income_qoq_latest", net_income_qoq_min),
+                    _gt("net_income_yoy_latest", net_income_yoy_min),
+                )
+            )
+
+        keyword_only_search = bool(keyword and keyword.strip())
+        keyword_bypass = bool(search_only and keyword_only_search)
+        filters_at_defaults = (
+            pct_change_min is None
+            and pct_change_max is None
+            and volume_spike_min is None
+            and market_cap_min is None
+            and market_cap_max is None
+            and pe_min is None
+            and pe_max is None
+            and roe_min is None
+            and net_income_qoq_min is None
+            and net_income_yoy_min is None
+            and (industry is None or industry.lower() == "all")
+            and (exchange is None or exchange.lower() == "all")
+            and not concept_filter
+        )
+
+        sort_field = None
+        if sort_by:
+            normalized_sort = sort_by.replace("_", "").lower()
+            sort_field = SORTABLE_STOCK_FIELDS.get(normalized_sort)
+        sort_direction = (sort_order or "desc").lower()
+        if sort_direction not in {"asc", "desc"}:
+            sort_direction = "desc"
+
+        if effective_favorites_only or keyword_bypass or (keyword_only_search and filters_at_defaults):
+            filtered_items = list(source_items)
+        else:
+            filtered_items = [item for item in source_items if _passes_filters(item)]
+
+        if sort_field:
+            reverse = sort_direction != "asc"
+
+            def _sort_value(payload: dict[str, object]) -> float:
+                value = payload.get(sort_field)
+                if value is None:
+                    return float("-inf") if reverse else float("inf")
+                try:
+                    numeric = float(value)
+                except (TypeError, ValueError):
+                    return float("-inf") if reverse else float("inf")
+                if not math.isfinite(numeric):
+                    return float("-inf") if reverse else float("inf")
+                return numeric
+
+            filtered_items = sorted(filtered_items, key=_sort_value, reverse=reverse)
+
+        start_index = offset if offset >= 0 else 0
+        end_index = start_index + limit if limit is not None else None
+        paged_items = filtered_items[start_index:end_index]
+
+        items = [
+            StockItem(
+                code=item["code"],
+                name=item.get("name"),
+                industry=item.get("industry"),
+                market=item.get("market"),
+                exchange=item.get("exchange"),
+                status=item.get("status"),
+                lastPrice=item.get("last_price"),
+                pctChange=item.get("pct_change"),
+                volume=item.get("volume"),
+                tradeDate=item.get("trade_date"),
+                marketCap=item.get("market_cap"),
+                peRatio=item.get("pe_ratio"),
+                turnoverRate=item.get("turnover_rate"),
+                pctChange1Y=item.get("pct_change_1y"),
+                pctChange6M=item.get("pct_change_6m"),
+                pctChange3M=item.get("pct_change_3m"),
+                pctChange1M=item.get("pct_change_1m"),
+                pctChange2W=item.get("pct_change_2w"),
+                pctChange1W=item.get("pct_change_1w"),
+                ma20=item.get("ma_20"),
+                ma10=item.get("ma_10"),
+                ma5=item.get("ma_5"),
+                volumeSpike=item.get("volume_spike"),
+                annDate=item.get("ann_date"),
+                endDate=item.get("end_date"),
+                basicEps=item.get("basic_eps"),
+                revenue=item.get("revenue"),
+                operateProfit=item.get("operate_profit"),
+                netIncome=item.get("net_income"),
+                grossMargin=item.get("gross_margin"),
+                roe=item.get("roe"),
+                netIncomeYoyLatest=item.get("net_income_yoy_latest"),
+                netIncomeYoyPrev1=item.get("net_income_yoy_prev1"),
+                netIncomeYoyPrev2=item.get("net_income_yoy_prev2"),
+                netIncomeQoqLatest=item.get("net_income_qoq_latest"),
+                revenueYoyLatest=item.get("revenue_yoy_latest"),
+                revenueQoqLatest=item.get("revenue_qoq_latest"),
+                roeYoyLatest=item.get("roe_yoy_latest"),
+                roeQoqLatest=item.get("roe_qoq_latest"),
+                favoriteGroup=item.get("favorite_group"),
+                isFavorite=bool(item.get("is_favorite")),
+                concepts=list(membership_index.concepts_for(item["code"])) if include_concepts else None,
+            )
+            for item in paged_items
+        ]
+        return fast_json_response(
+            StockListResponse(total=len(filtered_items), items=items, industries=available_industries)
+        )
+
+    return await asyncio.to_thread(_build_page)
+
+
+@router.get("/stocks/search", response_model=StockListResponse)
+def search_stocks_api(
+    keyword: str = Query(..., min_length=1, description="Keyword to match code/name/industry."),
+    limit: int = Query(20, ge=1, le=200),
+) -> StockListResponse:
+    stripped_keyword = keyword.strip()
+    if not stripped_keyword:
+        return StockListResponse(total=0, items=[], industries=[])
+
+    runtime = load_runtime_config()
+    result = search_stocks(
+        stripped_keyword,
+        limit=limit,
+        include_st=runtime.include_st,
+        include_delisted=runtime.include_delisted,
+    )
+
+    items = [
+        StockItem(
+            code=item["code"],
+            name=item.get("name"),
+            industry=item.get("industry"),
+            market=item.get("market"),
+            exchange=item.get("exchange"),
+            status=item.get("status"),
+        )
+        for item in result["items"]
+    ]
+
+    industries = sorted({item.industry for item in items if isinstance(item.industry, str) and item.industry})
+    return StockListResponse(total=result["total"], items=items, industries=industries)
+
+
+@router.get("/stocks/news", response_model=StockNewsListResponse)
+def list_stock_news_api(
+    code: str = Query(..., min_length=1),
+    limit: int = Query(100, ge=1, le=200),
+) -> StockNewsListResponse:
+    records = list_stock_news(code, limit=limit)
+    items = [StockNewsItem(**entry) for entry in records]
+    return StockNewsListResponse(total=len(items), items=items)
+
+
+@router.post("/stocks/news/sync", response_model=StockNewsSyncResponse)
+def sync_stock_news_api(payload: StockNewsSyncRequest = Body(...)) -> StockNewsSyncResponse:
+    result = sync_stock_news(payload.code)
+    return StockNewsSyncResponse(**result)
+
+
+@router.get("/stocks/{code}", response_model=StockDetailResponse)
+def get_stock_detail_api(
+    code: str,
+    history_limit: int = Query(
+        180,
+        ge=30,
+        le=500,
+        description="Number of most recent trading days to include in the candlestick series.",
+    ),
+) -> Response:
+    detail = get_stock_detail(code, history_limit=history_limit)
+    if not detail:
+        raise HTTPException(status_code=404, detail=f"Stock '{code}' not found")
+    return fast_json_response(StockDetailResponse(**detail))
+
+
+# Section name -> timeout in seconds for /stocks/{code}/bundle. Only the detail section
+# is required; every other section degrades to an entry in ``errors``.
+STOCK_BUNDLE_SECTION_TIMEOUTS: Dict[str, float] = {
+    "detail": 8.0,
+    "favorite": 2.0,
+    "notes": 3.0,
+    "news": 5.0,
+    "researchReports": 5.0,
+    "individualFundFlow": 3.0,
+    "bigDeals": 3.0,
+    "performanceExpress": 3.0,
+    "performanceForecast": 3.0,
+    "volumePrice": 3.0,
+    "integratedAnalysis": 3.0,
+    "valuation": 3.0,
+}
+
+
+def _stock_bundle_loaders(code: str, history_limit: int) -> Dict[str, Callable[[], Any]]:
+    def _detail() -> StockDetailResponse:
+        detail = get_stock_detail(code, history_limit=history_limit)
+        if not detail:
+            raise HTTPException(status_code=404, detail=f"Stock '{code}' not found")
+        return StockDetailResponse(**detail)
+
+    return {
+        "detail": _detail,
+        "favorite": lambda: get_favorite_status_api(code),
+        "notes": lambda: list_stock_notes_api(code, limit=100, offset=0),
+        "news": lambda: list_stock_news_api(code=code, limit=120),
+        "researchReports": lambda: get_research_reports(ts_code=code, limit=200, offset=0),
+        "individualFundFlow": lambda: list_individual_fund_flow_entries(symbol=None, code=code, limit=100, offset=0),
+        "bigDeals": lambda: _build_big_deal_fund_flow_response(limit=5, offset=0, side=None, code=code),
+        "performanceExpress": lambda: list_performance_express_entries(
+            limit=20, offset=0, start_date=None, end_date=None, keyword=code
+        ),
+        "performanceForecast": lambda: list_performance_forecast_entries(
+            limit=20, offset=0, start_date=None, end_date=None, keyword=code
+        ),
+        "volumePrice": lambda: get_stock_volume_price_latest(code=code),
+        "integratedAnalysis": lambda: get_stock_integrated_analysis_latest(code=code),
+        "valuation": lambda: get_stock_valuation_analysis_latest(code=code),
+    }
+
+
+@router.get("/stocks/{code}/bundle", response_model=StockBundleResponse)
+def get_stock_bundle_api(
+    code: str,
+    sections: Optional[str] = Query(
+        None,
+        description="Comma separated section names to load (defaults to every section).",
+    ),
+    history_limit: int = Query(180, ge=30, le=500, alias="historyLimit"),
+    timeout: Optional[float] = Query(
+        None,
+        gt=0,
+        le=30,
+        description="Optional cap in seconds applied to every section timeout.",
+    ),
+) -> Response:
+    """Load every stock detail page section concurrently in a single round trip."""
+    loaders = _stock_bundle_loaders(code, history_limit)
+    if sections:
+        requested = {name.strip() for name in sections.split(",") if name.strip()}
+        unknown = requested - loaders.keys()
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown bundle sections: {', '.join(sorted(unknown))}")
+        loaders = {name: loader for name, loader in loaders.items() if name in requested}
+    timeouts = {
+        name: min(value, timeout) if timeout else value for name, value in STOCK_BUNDLE_SECTION_TIMEOUTS.items()
+    }
+
+    started = time.perf_counter()
+    results, failures = gather_sections(loaders, timeouts=timeouts)
+    detail_error = failures.get("detail")
+    if isinstance(detail_error, HTTPException) and detail_error.status_code == 404:
+        raise detail_error
+
+    errors: Dict[str, str] = {}
+    timed_out: List[str] = []
+    for name, exc in failures.items():
+        if isinstance(exc, TimeoutError):
+            timed_out.append(name)
+        errors[name] = exc.detail if isinstance(exc, HTTPException) else (str(exc) or exc.__class__.__name__)
+    return fast_json_response(
+        StockBundleResponse(
+            code=code,
+            sections=results,
+            errors=errors,
+            timed_out=timed_out,
+            elapsed_ms=int((time.perf_counter() - started) * 1000),
+        )
+    )
+
+
+@router.get("/stocks/{code}/notes", response_model=StockNoteListResponse)
+def list_stock_notes_api(
+    code: str,
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+) -> StockNoteListResponse:
+    try:
+        result = list_stock_notes(code, limit=limit, offset=offset)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    items = [StockNoteItem(**entry) for entry in result.get("items", [])]
+    total = int(result.get("total", len(items)))
+    return StockNoteListResponse(total=total, items=items)
+
+
+@router.post("/stocks/{code}/notes", response_model=StockNoteItem)
+def create_stock_note_api(code: str, payload: StockNoteCreateRequest = Body(...)) -> StockNoteItem:
+    try:
+        record = add_stock_note(code, payload.content)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return StockNoteItem(**record)
+
+
+@router.get("/favorites", response_model=FavoriteListResponse)
+async def list_favorites_api(
+    group: Optional[str] = Query(
+        None,
+        alias="group",
+        description=(
+            "Optional favorite group filter. "
+            f"Use '{FAVORITE_GROUP_NONE_SENTINEL}' to show ungrouped favorites."
+        ),
+    )
+) -> FavoriteListResponse:
+    """Return the persisted favorites list."""
+    normalized_group, group_specified = _parse_favorite_group_query(group)
+    if group_specified:
+        if group == FAVORITE_GROUP_NONE_SENTINEL or (
+            group is not None and not group.strip()
+        ):
+            entries = await list_favorite_entries_async(group=FAVORITE_GROUP_NONE_SENTINEL)
+        else:
+            entries = await list_favorite_entries_async(group=normalized_group)
+    else:
+        entries = await list_favorite_entries_async()
+    items = [
+        FavoriteEntry(
+            code=entry["code"],
+            group=entry.get("group"),
+            created_at=entry.get("created_at"),
+            updated_at=entry.get("updated_at"),
+        )
+        for entry in entries
+    ]
+    return FavoriteListResponse(total=len(items), items=items)
+
+
+@router.get("/favorites/groups", response_model=FavoriteGroupListResponse)
+def list_favorite_groups_api() -> FavoriteGroupListResponse:
+    """Return all available favorite groups."""
+    groups = list_favorite_groups()
+    items = [
+        FavoriteGroupItem(name=entry.get("name"), total=int(entry.get("total") or 0))
+        for entry in groups
+    ]
+    return FavoriteGroupListResponse(items=items)
+
+
+@router.get("/favorites/{code}", response_model=FavoriteStatusResponse)
+def get_favorite_status_api(code: str) -> FavoriteStatusResponse:
+    """Return favorite status for a specific stock code."""
+    try:
+        result = get_favorite_status(code)
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    return FavoriteStatusResponse(**result)
+
+
+@router.put("/favorites/{code}", response_model=FavoriteStatusResponse)
+def add_favorite_api(
+    code: str,
+    payload: FavoriteUpsertRequest | None = Body(default=None),
+) -> FavoriteStatusResponse:
+    """Mark a stock as favorite."""
+    group_value = payload.group if payload else None
+    normalized_group, _ = _parse_favorite_group_query(group_value)
+    try:
+        result = set_favorite_state(code, favorite=True, group=normalized_group)
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    return FavoriteStatusResponse(**result)
+
+
+@router.delete("/favorites/{code}", response_model=FavoriteStatusResponse)
+def remove_favorite_api(code: str) -> FavoriteStatusResponse:
+    """Remove a stock from favorites."""
+    try:
+        result = set_favorite_state(code, favorite=False)
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    return FavoriteStatusResponse(**result)
+
+
+@router.get("/stocks/{ts_code}/research-reports", response_model=ResearchReportListResponse)
+def get_research_reports(
+    ts_code: str = Path(..., description="Stock ts_code"),
+    limit: int = Query(20, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+) -> ResearchReportListResponse:
+    try:
+        result = list_research_reports(ts_code=ts_code, limit=limit, offset=offset)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    items = [
+        ResearchReportRecord(
+            id=entry.get("id"),
+            ts_code=entry.get("ts_code"),
+            report_id=entry.get("report_id"),
+            title=entry.get("title"),
+            report_type=entry.get("report_type"),
+            publish_date=entry.get("publish_date"),
+            org=entry.get("org"),
+            analysts=entry.get("analysts"),
+            detailUrl=entry.get("detail_url"),
+            createdAt=entry.get("created_at"),
+        )
+        for entry in result.get("items", [])
+    ]
+    return ResearchReportListResponse(total=int(result.get("total", 0)), items=items)
+
+
+@router.post("/stocks/research-reports/analyze", response_model=ResearchReportAnalysisResponse)
+def run_research_report_analysis(
+    payload: ResearchReportAnalysisRequest = Body(...),
+) -> ResearchReportAnalysisResponse:
+    try:
+        result = analyze_research_reports(ts_code=payload.ts_code, months=payload.months)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except RuntimeError as exc:
+        raise HTTPException(status_code=503, detail=str(exc)) from exc
+    return ResearchReportAnalysisResponse(**result)
+
+
+@router.get("/stocks/{ts_code}/research-reports/distillation", response_model=ResearchReportAnalysisResponse)
+def get_research_report_distillation(
+    ts_code: str = Path(..., description="Stock ts_code"),
+    months: int = Query(3, ge=1, le=3),
+) -> ResearchReportAnalysisResponse:
+    try:
+        result = list_research_report_distillation(ts_code=ts_code, months=months)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return ResearchReportAnalysisResponse(**result)
+
+
+@router.get("/journal/entries", response_model=List[InvestmentJournalEntryResponse])
+def list_investment_journal_entries_api(
+    start_date: Optional[date] = Query(
+        None,
+        alias="startDate",
+        description="Optional start date (inclusive, YYYY-MM-DD). Defaults to 30 days ago.",
+    ),
+    end_date: Optional[date] = Query(
+        None,
+        alias="endDate",
+        description="Optional end date (inclusive, YYYY-MM-DD). Defaults to today.",
+    ),
+) -> List[InvestmentJournalEntryResponse]:
+    entries = list_investment_journal_entries(start_date=start_date, end_date=end_date)
+    payload = [_journal_entry_to_payload(entry) for entry in entries if entry]
+    return [entry for entry in payload if entry]
+
+
+@router.get("/journal/entries/{entry_date}", response_model=InvestmentJournalEntryResponse)
+def get_investment_journal_entry_api(entry_date: date = Path(..., description="Entry date in YYYY-MM-DD format.")) -> InvestmentJournalEntryResponse:
+    entry = get_investment_journal_entry(entry_date)
+    payload = _journal_entry_to_payload(entry)
+    if payload is None:
+        raise HTTPException(status_code=404, detail="Journal entry not found.")
+    return payload
+
+
+@router.put("/journal/entries/{entry_date}", response_model=InvestmentJournalEntryResponse)
+def upsert_investment_journal_entry_api(
+    entry_date: date = Path(..., description="Entry date in YYYY-MM-DD format."),
+    payload: InvestmentJournalEntryPayload = Body(...),
+) -> InvestmentJournalEntryResponse:
+    review_html = _sanitize_rich_text(payload.review_html)
+    plan_html = _sanitize_rich_text(payload.plan_html)
+    entry = upsert_investment_journal_entry(
+        entry_date,
+        review_html=review_html,
+        plan_html=plan_html,
+    )
+    return _journal_entry_to_payload(entry)
+
+
+@router.get("/journal/stock-notes", response_model=StockNoteListResponse)
+def list_recent_stock_notes_api(
+    start_date: Optional[date] = Query(
+        None,
+        alias="startDate",
+        description="Start date inclusive (YYYY-MM-DD). Defaults to 90 days ago.",
+    ),
+    end_date: Optional[date] = Query(
+        None,
+        alias="endDate",
+        description="End date inclusive (YYYY-MM-DD). Defaults to today.",
+    ),
+    limit: int = Query(200, ge=1, le=500, description="Maximum number of notes to return."),
+) -> StockNoteListResponse:
+    records = list_recent_stock_notes(start_date=start_date, end_date=end_date, limit=limit)
+    items = [StockNoteItem(**entry) for entry in records.get("items", [])]
+    total = records.get("total", len(items)) or len(items)
+    return StockNoteListResponse(total=int(total), items=items)
+
+
+@router.get("/stocks/volume-price-analysis/latest", response_model=StockVolumePriceRecord)
+def get_stock_volume_price_latest(code: str = Query(..., min_length=1)) -> StockVolumePriceRecord:
+    record = get_latest_stock_volume_price_reasoning(code)
+    if not record:
+        fallback_summary = {
+            "wyckoffPhase": "未生成",
+            "stageSummary": "暂未生成量价推理，可点击“生成推理”获取最新分析。",
+            "volumeSignals": [],
+            "priceSignals": [],
+            "compositeIntent": "未知",
+            "strategy": [],
+            "risks": [],
+            "checklist": [],
+            "confidence": 0,
+        }
+        now = datetime.now(LOCAL_TZ)
+        return StockVolumePriceRecord(
+            id=0,
+            code=code,
+            name=None,
+            lookback_days=90,
+            summary=fallback_summary,
+            raw_text=json.dumps(fallback_summary, ensure_ascii=False),
+            model=None,
+            generated_at=now,
+        )
+    return StockVolumePriceRecord(**record)
+
+
+@router.get("/stocks/volume-price-analysis/history", response_model=StockVolumePriceHistoryResponse)
+def list_stock_volume_price_history_api(
+    code: str = Query(..., min_length=1),
+    limit: int = Query(10, ge=1, le=50),
+    offset: int = Query(0, ge=0),
+) -> StockVolumePriceHistoryResponse:
+    result = list_stock_volume_price_history(code, limit=limit, offset=offset)
+    items = [StockVolumePriceRecord(**entry) for entry in result.get("items", []) if entry]
+    return StockVolumePriceHistoryResponse(total=int(result.get("total", 0)), items=items)
+
+
+@router.post("/stocks/volume-price-analysis", response_model=StockVolumePriceRecord)
+def run_stock_volume_price_analysis(payload: StockVolumePriceRequest = Body(...)) -> StockVolumePriceRecord:
+    if not payload.force and payload.run_llm:
+        stored = get_current_stock_analysis("volume_price", payload.code)
+        if stored and stored.get("model") and stored.get("lookbackDays") == payload.lookback_days:
+            return StockVolumePriceRecord(**stored)
+    record = generate_stock_volume_price_reasoning(
+        payload.code,
+        lookback_days=payload.lookback_days,
+        run_llm=payload.run_llm,
+    )
+    return StockVolumePriceRecord(**record)
+
+
+@router.get("/stocks/integrated-analysis/latest", response_model=StockIntegratedAnalysisRecord)
+def get_stock_integrated_analysis_latest(code: str = Query(..., min_length=1)) -> StockIntegratedAnalysisRecord:
+    record = get_latest_stock_integrated_analysis(code)
+    if not record:
+        fallback_summary = {
+            "overview": "尚未生成综合分析，可点击“生成分析”获取最新结论。",
+            "keyFindings": [],
+            "bullBearFactors": {"bull": [], "bear": []},
+            "strategy": {"timeframe": "", "actions": []},
+            "risks": [],
+            "confidence": 0,
+        }
+        now = datetime.now(LOCAL_TZ)
+        return StockIntegratedAnalysisRecord(
+            id=0,
+            code=code,
+            name=None,
+            news_days=INTEGRATED_NEWS_DAYS_DEFAULT,
+            trade_days=INTEGRATED_TRADE_DAYS_DEFAULT,
+            summary=fallback_summary,
+            raw_text=json.dumps(fallback_summary, ensure_ascii=False),
+            model=None,
+            generated_at=now,
+            context=None,
+        )
+    return StockIntegratedAnalysisRecord(**record)
+
+
+@router.get("/stocks/integrated-analysis/history", response_model=StockIntegratedAnalysisHistoryResponse)
+def list_stock_integrated_analysis_history_api(
+    code: str = Query(..., min_length=1),
+    limit: int = Query(10, ge=1, le=50),
+    offset: int = Query(0, ge=0),
+) -> StockIntegratedAnalysisHistoryResponse:
+    result = list_stock_integrated_analysis_history(code, limit=limit, offset=offset)
+    items = [StockIntegratedAnalysisRecord(**entry) for entry in result.get("items", []) if entry]
+    return StockIntegratedAnalysisHistoryResponse(total=int(result.get("total", 0)), items=items)
+
+
+@router.post("/stocks/integrated-analysis", response_model=StockIntegratedAnalysisRecord)
+def run_stock_integrated_analysis(payload: StockIntegratedAnalysisRequest = Body(...)) -> StockIntegratedAnalysisRecord:
+    if not payload.force and payload.run_llm:
+        stored = get_current_stock_analysis("integrated", payload.code)
+        if (
+            stored
+            and stored.get("model")
+            and (stored.get("newsDays"), stored.get("tradeDays")) == (payload.news_days, payload.trade_days)
+        ):
+            return StockIntegratedAnalysisRecord(**stored)
+    try:
+        record = generate_stock_integrated_analysis(
+            payload.code,
+            news_days=payload.news_days,
+            trade_days=payload.trade_days,
+            run_llm=payload.run_llm,
+            force=payload.force,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except RuntimeError as exc:
+        raise HTTPException(status_code=429, detail=str(exc)) from exc
+    return StockIntegratedAnalysisRecord(**record)
+
+
+@router.get("/stocks/valuation-analysis/latest", response_model=StockValuationAnalysisRecord)
+def get_stock_valuation_analysis_latest(code: str = Query(..., min_length=1)) -> StockValuationAnalysisRecord:
+    record = get_latest_stock_valuation_analysis(code)
+    if not record:
+        now = datetime.now(LOCAL_TZ)
+        summary_dict = {**DEFAULT_VALUATION_SUMMARY}
+        payload = json.dumps(summary_dict, ensure_ascii=False)
+        return StockValuationAnalysisRecord(
+            id=0,
+            code=code,
+            name=None,
+            summary=summary_dict,
+            raw_text=payload,
+            model=None,
+            generated_at=now,
+            context=None,
+        )
+    return StockValuationAnalysisRecord(**record)
+
+
+@router.get("/stocks/valuation-analysis/history", response_model=StockValuationAnalysisHistoryResponse)
+def list_stock_valuation_analysis_history_api(
+    code: str = Query(..., min_length=1),
+    limit: int = Query(10, ge=1, le=50),
+    offset: int = Query(0, ge=0),
+) -> StockValuationAnalysisHistoryResponse:
+    result = list_stock_valuation_analysis_history(code, limit=limit, offset=offset)
+    items = [StockValuationAnalysisRecord(**entry) for entry in result.get("items", []) if entry]
+    return StockValuationAnalysisHistoryResponse(total=int(result.get("total", 0)), items=items)
+
+
+@router.post("/stocks/valuation-analysis", response_model=StockValuationAnalysisRecord)
+def run_stock_valuation_analysis(payload: StockValuationAnalysisRequest = Body(...)) -> StockValuationAnalysisRecord:
+    if not payload.force and payload.run_llm:
+        stored = get_current_stock_analysis("valuation", payload.code)
+        if stored and stored.get("model"):
+            return StockValuationAnalysisRecord(**stored)
+    try:
+        record = generate_stock_valuation_analysis(
+            payload.code,
+            run_llm=payload.run_llm,
+            force=payload.force,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except RuntimeError as exc:
+        raise HTTPException(status_code=429, detail=str(exc)) from exc
+    return StockValuationAnalysisRecord(**record)
+
+
+def _journal_entry_to_payload(entry: Optional[Dict[str, object]]) -> Optional[InvestmentJournalEntryResponse]:
+    if entry is None:
+        return None
+    return InvestmentJournalEntryResponse(
+        entryDate=entry.get("entry_date"),
+        reviewHtml=entry.get("review_html"),
+        planHtml=entry.get("plan_html"),
+        createdAt=_localize_datetime(entry.get("created_at")),
+        updatedAt=_localize_datetime(entry.get("updated_at")),
+    )
+
+
+@router.post("/stocks/research-reports/sync")
+async def trigger_research_report_sync(payload: SyncResearchReportRequest) -> dict[str, object]:
+    try:
+        result = sync_research_reports(
+            ts_code=payload.ts_code,
+            symbol=payload.symbol,
+            lookback_years=payload.lookback_years,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return {
+        "rows": int(result.get("rows", 0)),
+        "reports": result.get("reports", []),
+    }
@@ -0,0 +1,3316 @@
+"""
+Request and response models for the Trend View API.
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+from pydantic import BaseModel, Field
+
+INTEGRATED_NEWS_DAYS_DEFAULT = 10
+INTEGRATED_TRADE_DAYS_DEFAULT = 10
+
+
+class StockItem(BaseModel):
+    code: str
+    name: Optional[str] = None
+    industry: Optional[str] = None
+    market: Optional[str] = None
+    exchange: Optional[str] = None
+    status: Optional[str] = None
+    last_price: Optional[float] = Field(None, alias="lastPrice")
+    pct_change: Optional[float] = Field(None, alias="pctChange")
+    volume: Optional[float] = None
+    trade_date: Optional[date] = Field(None, alias="tradeDate")
+    market_cap: Optional[float] = Field(None, alias="marketCap")
+    pe_ratio: Optional[float] = Field(None, alias="peRatio")
+    turnover_rate: Optional[float] = Field(None, alias="turnoverRate")
+    pct_change_1y: Optional[float] = Field(None, alias="pctChange1Y")
+    pct_change_6m: Optional[float] = Field(None, alias="pctChange6M")
+    pct_change_3m: Optional[float] = Field(None, alias="pctChange3M")
+    pct_change_1m: Optional[float] = Field(None, alias="pctChange1M")
+    pct_change_2w: Optional[float] = Field(None, alias="pctChange2W")
+    pct_change_1w: Optional[float] = Field(None, alias="pctChange1W")
+    ma_20: Optional[float] = Field(None, alias="ma20")
+    ma_10: Optional[float] = Field(None, alias="ma10")
+    ma_5: Optional[float] = Field(None, alias="ma5")
+    volume_spike: Optional[float] = Field(None, alias="volumeSpike")
+    ann_date: Optional[str] = Field(None, alias="annDate")
+    end_date: Optional[str] = Field(None, alias="endDate")
+    basic_eps: Optional[float] = Field(None, alias="basicEps")
+    revenue: Optional[float] = None
+    operate_profit: Optional[float] = Field(None, alias="operateProfit")
+    net_income: Optional[float] = Field(None, alias="netIncome")
+    gross_margin: Optional[float] = Field(None, alias="grossMargin")
+    roe: Optional[float] = Field(None, alias="roe")
+    net_income_yoy_latest: Optional[float] = Field(None, alias="netIncomeYoyLatest")
+    net_income_qoq_latest: Optional[float] = Field(None, alias="netIncomeQoqLatest")
+    net_income_yoy_prev1: Optional[float] = Field(None, alias="netIncomeYoyPrev1")
+    net_income_yoy_prev2: Optional[float] = Field(None, alias="netIncomeYoyPrev2")
+    net_income_qoq_latest: Optional[float] = Field(None, alias="netIncomeQoqLatest")
+    revenue_yoy_latest: Optional[float] = Field(None, alias="revenueYoyLatest")
+    revenue_qoq_latest: Optional[float] = Field(None, alias="revenueQoqLatest")
+    roe_yoy_latest: Optional[float] = Field(None, alias="roeYoyLatest")
+    roe_qoq_latest: Optional[float] = Field(None, alias="roeQoqLatest")
+    concepts: Optional[List[str]] = None
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class StockTradingSnapshot(BaseModel):
+    code: str
+    name: Optional[str] = None
+    industry: Optional[str] = None
+    market: Optional[str] = None
+    exchange: Optional[str] = None
+    last_price: Optional[float] = Field(None, alias="lastPrice")
+    pct_change: Optional[float] = Field(None, alias="pctChange")
+    volume: Optional[float] = None
+    market_cap: Optional[float] = Field(None, alias="marketCap")
+    pe_ratio: Optional[float] = Field(None, alias="peRatio")
+    turnover_rate: Optional[float] = Field(None, alias="turnoverRate")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class StockFinancialSnapshot(BaseModel):
+    code: str
+    name: Optional[str] = None
+    ann_date: Optional[str] = Field(None, alias="annDate")
+    end_date: Optional[str] = Field(None, alias="endDate")
+    basic_eps: Optional[float] = Field(None, alias="basicEps")
+    revenue: Optional[float] = None
+    operate_profit: Optional[float] = Field(None, alias="operateProfit")
+    net_income: Optional[float] = Field(None, alias="netIncome")
+    gross_margin: Optional[float] = Field(None, alias="grossMargin")
+    roe: Optional[float] = Field(None, alias="roe")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class StockTradingStats(BaseModel):
+    code: str
+    name: Optional[str] = None
+    pct_change_1y: Optional[float] = Field(None, alias="pctChange1Y")
+    pct_change_6m: Optional[float] = Field(None, alias="pctChange6M")
+    pct_change_3m: Optional[float] = Field(None, alias="pctChange3M")
+    pct_change_1m: Optional[float] = Field(None, alias="pctChange1M")
+    pct_change_2w: Optional[float] = Field(None, alias="pctChange2W")
+    pct_change_1w: Optional[float] = Field(None, alias="pctChange1W")
+    volume_spike: Optional[float] = Field(None, alias="volumeSpike")
+    ma_20: Optional[float] = Field(None, alias="ma20")
+    ma_10: Optional[float] = Field(None, alias="ma10")
+    ma_5: Optional[float] = Field(None, alias="ma5")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class StockFinancialStats(BaseModel):
+    code: str
+    name: Optional[str] = None
+    reporting_period: Optional[str] = Field(None, alias="reportingPeriod")
+    net_income_yoy_latest: Optional[float] = Field(None, alias="netIncomeYoyLatest")
+    net_income_yoy_prev1: Optional[float] = Field(None, alias="netIncomeYoyPrev1")
+    net_income_yoy_prev2: Optional[float] = Field(None, alias="netIncomeYoyPrev2")
+    net_income_qoq_latest: Optional[float] = Field(None, alias="netIncomeQoqLatest")
+    revenue_yoy_latest: Optional[float] = Field(None, alias="revenueYoyLatest")
+    revenue_qoq_latest: Optional[float] = Field(None, alias="revenueQoqLatest")
+    roe_yoy_latest: Optional[float] = Field(None, alias="roeYoyLatest")
+    roe_qoq_latest: Optional[float] = Field(None, alias="roeQoqLatest")
+    is_favorite: bool = Field(False, alias="isFavorite")
+    favorite_group: Optional[str] = Field(None, alias="favoriteGroup")
+
+    class Config:
+        allow_population_by_field_name = True
+        allow_population_by_alias = True
+
+
+class StockBusinessProfile(BaseModel):
+    symbol: Optional[str] = None
+    ts_code: Optional[str] = Field(None, alias="tsCode")
+    main_business: Optional[str] = Field(None, alias="mainBusiness")
+    product_type: Optional[str] = Field(None, alias="productType")
+    product_name: Optional[str] = Field(None, alias="productName")
+    business_scope: Optional[str] = Field(None, alias="businessScope")
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+        allow_population_by_alias = True
+
+
+class StockBusinessCompositionEntry(BaseModel):
+    report_date: Optional[str] = Field(None, alias="reportDate")
+    category_type: Optional[str] = Field(None, alias="categoryType")
+    composition: Optional[str] = None
+    revenue: Optional[float] = None
+    revenue_ratio: Optional[float] = Field(None, alias="revenueRatio")
+    cost: Optional[float] = None
+    cost_ratio: Optional[float] = Field(None, alias="costRatio")
+    profit: Optional[float] = None
+    profit_ratio: Optional[float] = Field(None, alias="profitRatio")
+    gross_margin: Optional[float] = Field(None, alias="grossMargin")
+
+    class Config:
+        allow_population_by_field_name = True
+        allow_population_by_alias = True
+
+
+class StockBusinessCompositionGroup(BaseModel):
+    category_type: Optional[str] = Field(None, alias="categoryType")
+    entries: List[StockBusinessCompositionEntry]
+
+    class Config:
+        allow_population_by_field_name = True
+        allow_population_by_alias = True
+
+
+class StockBusinessComposition(BaseModel):
+    symbol: Optional[str] = None
+    latest_report_date: Optional[str] = Field(None, alias="latestReportDate")
+    groups: List[StockBusinessCompositionGroup]
+
+    class Config:
+        allow_population_by_field_name = True
+        allow_population_by_alias = True
+
+
+class DailyTradeBar(BaseModel):
+    time: str
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: Optional[float] = None
+    pct_change: Optional[float] = Field(None, alias="pctChange")
+
+
+class StockDetailResponse(BaseModel):
+    profile: StockItem
+    trading_data: StockTradingSnapshot = Field(..., alias="tradingData")
+    financial_data: StockFinancialSnapshot = Field(..., alias="financialData")
+    trading_stats: StockTradingStats = Field(..., alias="tradingStats")
+    financial_stats: StockFinancialStats = Field(..., alias="financialStats")
+    business_profile: Optional[StockBusinessProfile] = Field(None, alias="businessProfile")
+    business_composition: Optional[StockBusinessComposition] = Field(None, alias="businessComposition")
+    daily_trade_history: List[DailyTradeBar] = Field(..., alias="dailyTradeHistory")
+    is_favorite: bool = Field(False, alias="isFavorite")
+    favorite_group: Optional[str] = Field(None, alias="favoriteGroup")
+
+    class Config:
+        allow_population_by_field_name = True
+        allow_population_by_alias = True
+
+
+class StockListResponse(BaseModel):
+    total: int
+    items: List[StockItem]
+    industries: List[str] = Field(default_factory=list)
+
+
+class StockBundleResponse(BaseModel):
+    code: str
+    sections: Dict[str, Any] = Field(default_factory=dict)
+    errors: Dict[str, str] = Field(default_factory=dict)
+    timed_out: List[str] = Field(default_factory=list, alias="timedOut")
+    elapsed_ms: int = Field(0, alias="elapsedMs")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class FavoriteEntry(BaseModel):
+    code: str
+    group: Optional[str] = Field(None, alias="group")
+    created_at: Optional[datetime] = Field(None, alias="createdAt")
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class FavoriteListResponse(BaseModel):
+    total: int
+    items: List[FavoriteEntry]
+
+
+class FavoriteStatusResponse(BaseModel):
+    code: str
+    is_favorite: bool = Field(False, alias="isFavorite")
+    group: Optional[str] = Field(None, alias="group")
+    total: int = 0
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class FavoriteGroupItem(BaseModel):
+    name: Optional[str] = Field(None, alias="name")
+    total: int = 0
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class FavoriteGroupListResponse(BaseModel):
+    items: List[FavoriteGroupItem]
+
+
+class StockNoteItem(BaseModel):
+    id: int
+    stock_code: str = Field(..., alias="stockCode")
+    stock_name: Optional[str] = Field(None, alias="stockName")
+    content: str
+    created_at: datetime = Field(..., alias="createdAt")
+    updated_at: datetime = Field(..., alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+        allow_population_by_alias = True
+
+
+class StockNoteListResponse(BaseModel):
+    total: int
+    items: List[StockNoteItem]
+
+
+class StockNoteCreateRequest(BaseModel):
+    content: str = Field(..., min_length=1, max_length=1000)
+
+
+class FavoriteUpsertRequest(BaseModel):
+    group: Optional[str] = Field(None, alias="group")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class FundamentalMetricItem(BaseModel):
+    code: str
+    name: Optional[str] = None
+    industry: Optional[str] = None
+    market: Optional[str] = None
+    exchange: Optional[str] = None
+    net_income_end_date_latest: Optional[str] = Field(None, alias="netIncomeEndDateLatest")
+    net_income_end_date_prev1: Optional[str] = Field(None, alias="netIncomeEndDatePrev1")
+    net_income_end_date_prev2: Optional[str] = Field(None, alias="netIncomeEndDatePrev2")
+    revenue_end_date_latest: Optional[str] = Field(None, alias="revenueEndDateLatest")
+    roe_end_date_latest: Optional[str] = Field(None, alias="roeEndDateLatest")
+    net_income_yoy_latest: Optional[float] = Field(None, alias="netIncomeYoyLatest")
+    net_income_yoy_prev1: Optional[float] = Field(None, alias="netIncomeYoyPrev1")
+    net_income_yoy_prev2: Optional[float] = Field(None, alias="netIncomeYoyPrev2")
+    net_income_qoq_latest: Optional[float] = Field(None, alias="netIncomeQoqLatest")
+    revenue_yoy_latest: Optional[float] = Field(None, alias="revenueYoyLatest")
+    revenue_qoq_latest: Optional[float] = Field(None, alias="revenueQoqLatest")
+    roe_yoy_latest: Optional[float] = Field(None, alias="roeYoyLatest")
+    roe_qoq_latest: Optional[float] = Field(None, alias="roeQoqLatest")
+    is_favorite: bool = Field(False, alias="isFavorite")
+    favorite_group: Optional[str] = Field(None, alias="favoriteGroup")
+
+    class Config:
+        allow_population_by_field_name = True
+        allow_population_by_alias = True
+
+
+class FundamentalMetricsListResponse(BaseModel):
+    total: int
+    items: List[FundamentalMetricItem]
+
+
+class SyncDailyTradeRequest(BaseModel):
+    batch_size: Optional[int] = Field(20, ge=1, le=200)
+    window_days: Optional[int] = Field(None, ge=1, le=3650)
+    start_date: Optional[str] = Field(None, regex=r"^\d{8}$")
+    end_date: Optional[str] = Field(None, regex=r"^\d{8}$")
+    codes: Optional[List[str]] = None
+    batch_pause_seconds: Optional[float] = Field(0.6, ge=0, le=5)
+
+
+class SyncDailyTradeResponse(BaseModel):
+    rows: int
+    elapsed_seconds: float = Field(..., alias="elapsedSeconds")
+
+
+class SyncDailyTradeMetricsRequest(BaseModel):
+    history_window_days: Optional[int] = Field(
+        None,
+        alias="historyWindowDays",
+        ge=180,
+        le=3650,
+        description="How many calendar days of history to load for derived metrics.",
+    )
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncDailyTradeMetricsResponse(BaseModel):
+    rows: int
+    trade_date: Optional[str] = Field(None, alias="tradeDate")
+    elapsed_seconds: float = Field(..., alias="elapsedSeconds")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncFundamentalMetricsRequest(BaseModel):
+    per_code: Optional[int] = Field(8, ge=1, le=24, alias="perCode")
+    full_refresh: bool = Field(False, alias="fullRefresh")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncFundamentalMetricsResponse(BaseModel):
+    rows: int
+    elapsed_seconds: float = Field(..., alias="elapsedSeconds")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncStockBasicRequest(BaseModel):
+    list_statuses: Optional[List[str]] = Field(default_factory=lambda: ["L", "D"])
+    market: Optional[str] = None
+
+
+class SyncStockBasicResponse(BaseModel):
+    rows: int
+
+
+class SyncDailyIndicatorRequest(BaseModel):
+    trade_date: Optional[str] = Field(None, regex=r"^\d{8}$")
+
+
+class SyncDailyIndicatorResponse(BaseModel):
+    rows: int
+    trade_date: str = Field(..., alias="tradeDate")
+    elapsed_seconds: float = Field(..., alias="elapsedSeconds")
+
+
+class SyncIncomeStatementRequest(BaseModel):
+    codes: Optional[List[str]] = Field(
+        None, description="Optional list of ts_code identifiers to refresh."
+    )
+    initial_periods: int = Field(
+        8,
+        ge=1,
+        le=16,
+        alias="initialPeriods",
+        description="Number of recent income statement rows to fetch per security.",
+    )
+    mode: str = Field(
+        "per_code",
+        regex=r"^(per_code|announcement)$",
+        description="per_code walks every security; announcement only fetches filings announced since the last sync.",
+    )
+    announced_since: Optional[date] = Field(
+        None,
+        alias="announcedSince",
+        description="Announcement-date lower bound for announcement mode; defaults to the latest stored announcement.",
+    )
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncIncomeStatementResponse(BaseModel):
+    rows: int
+    codes: List[str]
+    code_count: int = Field(..., alias="codeCount")
+    total_codes: int = Field(..., alias="totalCodes")
+    elapsed_seconds: float = Field(..., alias="elapsedSeconds")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncFinancialIndicatorRequest(BaseModel):
+    codes: Optional[List[str]] = Field(
+        None, description="Optional list of ts_code identifiers to refresh."
+    )
+    limit: int = Field(
+        8,
+        ge=1,
+        le=32,
+        description="Number of recent financial indicator rows to fetch per security.",
+    )
+    mode: str = Field(
+        "per_code",
+        regex=r"^(per_code|announcement)$",
+        description="per_code walks every security; announcement only fetches filings announced since the last sync.",
+    )
+    announced_since: Optional[date] = Field(
+        None,
+        alias="announcedSince",
+        description="Announcement-date lower bound for announcement mode; defaults to the latest stored announcement.",
+    )
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncFinancialIndicatorResponse(BaseModel):
+    rows: int
+    codes: List[str]
+    code_count: int = Field(..., alias="codeCount")
+    total_codes: int = Field(..., alias="totalCodes")
+    elapsed_seconds: float = Field(..., alias="elapsedSeconds")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncCashflowRequest(BaseModel):
+    codes: Optional[List[str]] = Field(
+        None, description="Optional list of ts_code identifiers to refresh."
+    )
+    limit: int = Field(
+        32,
+        ge=1,
+        le=64,
+        description="Number of recent cash flow entries to fetch per security.",
+    )
+    mode: str = Field(
+        "per_code",
+        regex=r"^(per_code|announcement)$",
+        description="per_code walks every security; announcement only fetches filings announced since the last sync.",
+    )
+    announced_since: Optional[date] = Field(
+        None,
+        alias="announcedSince",
+        description="Announcement-date lower bound for announcement mode; defaults to the latest stored announcement.",
+    )
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncCashflowResponse(BaseModel):
+    rows: int
+    codes: List[str]
+    code_count: int = Field(..., alias="codeCount")
+    elapsed_seconds: float = Field(..., alias="elapsedSeconds")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncBalanceSheetRequest(BaseModel):
+    codes: Optional[List[str]] = Field(
+        None, description="Optional list of ts_code identifiers to refresh."
+    )
+    limit: int = Field(
+        32,
+        ge=1,
+        le=64,
+        description="Number of recent balance sheet entries to fetch per security.",
+    )
+    mode: str = Field(
+        "per_code",
+        regex=r"^(per_code|announcement)$",
+        description="per_code walks every security; announcement only fetches filings announced since the last sync.",
+    )
+    announced_since: Optional[date] = Field(
+        None,
+        alias="announcedSince",
+        description="Announcement-date lower bound for announcement mode; defaults to the latest stored announcement.",
+    )
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncBalanceSheetResponse(BaseModel):
+    rows: int
+    codes: List[str]
+    code_count: int = Field(..., alias="codeCount")
+    elapsed_seconds: float = Field(..., alias="elapsedSeconds")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncResearchReportRequest(BaseModel):
+    ts_code: str = Field(..., description="Stock ts_code, e.g. SZ300926 or 300926")
+    symbol: Optional[str] = Field(None, description="Optional query symbol for Sina (sz/sh prefix)")
+    lookback_years: int = Field(1, ge=0, le=5, description="Number of years to include when syncing")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class ResearchReportRecord(BaseModel):
+    id: int
+    ts_code: str
+    report_id: str
+    title: str
+    report_type: Optional[str] = None
+    publish_date: Optional[date] = None
+    org: Optional[str] = None
+    analysts: Optional[str] = None
+    detail_url: Optional[str] = Field(None, alias="detailUrl")
+    created_at: Optional[datetime] = Field(None, alias="createdAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class ResearchReportListResponse(BaseModel):
+    total: int
+    items: List[ResearchReportRecord]
+
+
+class ResearchReportAnalysisRequest(BaseModel):
+    ts_code: str
+    months: int = Field(3, ge=1, le=3, description="Number of months to include (max 3).")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class ResearchReportDistillationRecord(BaseModel):
+    report_id: str = Field(..., alias="reportId")
+    title: str
+    publish_date: Optional[date] = Field(None, alias="publishDate")
+    org: Optional[str] = None
+    report_type: Optional[str] = Field(None, alias="reportType")
+    rating: Optional[str] = None
+    target_price: Optional[str] = Field(None, alias="targetPrice")
+    detail_url: Optional[str] = Field(None, alias="detailUrl")
+    distillation: Optional[dict] = None
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class ResearchReportAnalysisResponse(BaseModel):
+    total: int
+    processed: int
+    items: List[ResearchReportDistillationRecord]
+    summary: Optional[dict] = None
+
+
+class SyncFinanceBreakfastRequest(BaseModel):
+    """Placeholder request model for finance breakfast sync."""
+
+    class Config:
+        extra = "forbid"
+
+
+class SyncGlobalFlashRequest(BaseModel):
+    """Placeholder request model for global flash sync."""
+
+    class Config:
+        extra = "forbid"
+
+
+class SyncGlobalFlashResponse(BaseModel):
+    rows: int
+    elapsed_seconds: float = Field(..., alias="elapsedSeconds")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncConceptDirectoryRequest(BaseModel):
+    refresh: bool = Field(True, alias="refresh")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncStockAnalysisRequest(BaseModel):
+    codes: Optional[List[str]] = Field(
+        None,
+        description="Stock codes to analyse; defaults to every favourite stock.",
+    )
+    analyses: Optional[List[str]] = Field(
+        None,
+        description="Subset of volume_price, integrated and valuation; defaults to all three.",
+    )
+    force: bool = Field(False, description="Regenerate even when the inputs are unchanged.")
+    run_llm: bool = Field(True, alias="runLlm")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncSectorVolumePriceRequest(BaseModel):
+    kind: str = Field(
+        "all",
+        regex=r"^(all|concept|industry)$",
+        description="Sector kind to analyse: concept, industry or all.",
+    )
+    sectors: Optional[List[str]] = Field(
+        None,
+        description="Sector names to analyse (requires kind concept or industry); defaults to the watched sectors.",
+    )
+    lookback_days: int = Field(90, alias="lookbackDays", ge=30, le=240)
+    run_llm: bool = Field(True, alias="runLlm")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncConceptConstituentsRequest(BaseModel):
+    concepts: Optional[List[str]] = Field(
+        None,
+        alias="concepts",
+        description="Concept names to refresh; defaults to the watched concepts.",
+    )
+    force: bool = Field(False, description="Refresh even when the stored snapshot is within its TTL.")
+    max_pages: Optional[int] = Field(None, alias="maxPages", ge=1, le=50)
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncTradeCalendarRequest(BaseModel):
+    start_date: Optional[str] = Field(None, alias="startDate")
+    end_date: Optional[str] = Field(None, alias="endDate")
+    exchange: Optional[str] = "SSE"
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncPricePanelRequest(BaseModel):
+    start_date: Optional[date] = Field(
+        None,
+        alias="startDate",
+        description="First trade date to cache; defaults to January 1st three years back.",
+    )
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncTradeCalendarResponse(BaseModel):
+    rows: int
+    elapsed_seconds: float = Field(..., alias="elapsedSeconds")
+    start_date: Optional[str] = Field(None, alias="startDate")
+    end_date: Optional[str] = Field(None, alias="endDate")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncGlobalFlashClassifyRequest(BaseModel):
+    batch_size: int = Field(10, ge=1, le=100, alias="batchSize")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncGlobalFlashClassifyResponse(BaseModel):
+    rows: int
+    relevance_rows: int = Field(..., alias="relevanceRows")
+    relevance_requested: int = Field(..., alias="relevanceRequested")
+    impact_rows: int = Field(..., alias="impactRows")
+    impact_requested: int = Field(..., alias="impactRequested")
+    elapsed_seconds: float = Field(..., alias="elapsedSeconds")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class NewsRelevancePayload(BaseModel):
+    is_relevant: Optional[bool] = Field(None, alias="isRelevant")
+    confidence: Optional[float] = None
+    reason: Optional[str] = None
+    checked_at: Optional[datetime] = Field(None, alias="checkedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class NewsImpactPayload(BaseModel):
+    summary: Optional[str] = None
+    analysis: Optional[str] = None
+    confidence: Optional[float] = None
+    checked_at: Optional[datetime] = Field(None, alias="checkedAt")
+    levels: List[str] = Field(default_factory=list)
+    markets: List[str] = Field(default_factory=list)
+    industries: List[str] = Field(default_factory=list)
+    sectors: List[str] = Field(default_factory=list)
+    themes: List[str] = Field(default_factory=list)
+    stocks: List[str] = Field(default_factory=list)
+    metadata: Optional[Dict[str, Any]] = None
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class NewsArticleItem(BaseModel):
+    article_id: str = Field(..., alias="articleId")
+    source: str
+    title: str
+    summary: Optional[str] = None
+    content: Optional[str] = None
+    content_type: Optional[str] = Field(None, alias="contentType")
+    published_at: Optional[datetime] = Field(None, alias="publishedAt")
+    url: Optional[str] = None
+    language: Optional[str] = None
+    processing_status: Optional[str] = Field(None, alias="processingStatus")
+    content_fetched: Optional[bool] = Field(None, alias="contentFetched")
+    content_fetched_at: Optional[datetime] = Field(None, alias="contentFetchedAt")
+    relevance_attempts: Optional[int] = Field(None, alias="relevanceAttempts")
+    impact_attempts: Optional[int] = Field(None, alias="impactAttempts")
+    last_error: Optional[str] = Field(None, alias="lastError")
+    relevance: NewsRelevancePayload
+    impact: NewsImpactPayload
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncPerformanceExpressRequest(BaseModel):
+    codes: Optional[List[str]] = Field(
+        None,
+        description="Optional list of securities to refresh (accepts ts_code or symbol).",
+    )
+    report_period: Optional[str] = Field(
+        None,
+        alias="reportPeriod",
+        description="Optional report period override (YYYYMMDD or YYYY-MM-DD).",
+    )
+    lookback_days: Optional[int] = Field(
+        None,
+        ge=1,
+        le=3650,
+        alias="lookbackDays",
+        description="Legacy parameter retained for compatibility; ignored.",
+    )
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncMarketInsightRequest(BaseModel):
+    lookback_hours: int = Field(24, ge=1, le=72, alias="lookbackHours")
+    article_limit: int = Field(40, ge=5, le=50, alias="articleLimit")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncSectorInsightRequest(BaseModel):
+    lookback_hours: int = Field(24, ge=1, le=72, alias="lookbackHours")
+    article_limit: int = Field(40, ge=5, le=60, alias="articleLimit")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class ResetJobRequest(BaseModel):
+    job: str = Field(..., description="Job key to reset (e.g., market_insight)")
+
+
+class SyncIndexHistoryRequest(BaseModel):
+    index_codes: Optional[List[str]] = Field(
+        None,
+        alias="indexCodes",
+        description="Optional subset of index codes to refresh (defaults to all core indices).",
+    )
+
+    class Config:
+        allow_population_by_field_name = True
+        extra = "forbid"
+
+
+class MarketInsightArticleItem(BaseModel):
+    article_id: Optional[str] = Field(None, alias="articleId")
+    source: Optional[str] = None
+    title: Optional[str] = None
+    impact_summary: Optional[str] = Field(None, alias="impactSummary")
+    impact_analysis: Optional[str] = Field(None, alias="impactAnalysis")
+    impact_confidence: Optional[float] = Field(None, alias="impactConfidence")
+    markets: List[str] = Field(default_factory=list)
+    published_at: Optional[datetime] = Field(None, alias="publishedAt")
+    url: Optional[str] = None
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class MarketInsightSummaryPayload(BaseModel):
+    summary_id: str = Field(..., alias="summaryId")
+    generated_at: datetime = Field(..., alias="generatedAt")
+    window_start: datetime = Field(..., alias="windowStart")
+    window_end: datetime = Field(..., alias="windowEnd")
+    headline_count: int = Field(..., alias="headlineCount")
+    summary: Optional[Dict[str, Any]] = None
+    stages: List["MarketInsightStagePayload"] = Field(default_factory=list)
+    raw_response: Optional[str] = Field(None, alias="rawResponse")
+    prompt_tokens: Optional[int] = Field(None, alias="promptTokens")
+    completion_tokens: Optional[int] = Field(None, alias="completionTokens")
+    total_tokens: Optional[int] = Field(None, alias="totalTokens")
+    elapsed_seconds: Optional[float] = Field(None, alias="elapsedSeconds")
+    model_used: Optional[str] = Field(None, alias="modelUsed")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class MarketInsightResponse(BaseModel):
+    summary: Optional[MarketInsightSummaryPayload]
+    articles: List[MarketInsightArticleItem]
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class MarketInsightStagePayload(BaseModel):
+    stage: str
+    title: Optional[str] = None
+    status: str
+    started_at: Optional[datetime] = Field(None, alias="startedAt")
+    finished_at: Optional[datetime] = Field(None, alias="finishedAt")
+    analysis: Optional[str] = None
+    highlights: Optional[List[str]] = None
+    bias: Optional[str] = None
+    confidence: Optional[float] = None
+    key_metrics: Optional[List[Dict[str, Any]]] = Field(None, alias="keyMetrics")
+    error: Optional[str] = None
+    usage: Optional[Dict[str, Any]] = None
+    order: Optional[int] = None
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+MarketInsightSummaryPayload.update_forward_refs(MarketInsightStagePayload=MarketInsightStagePayload)
+
+
+class SectorInsightGroupArticle(BaseModel):
+    article_id: Optional[str] = Field(None, alias="articleId")
+    title: Optional[str] = None
+    impact_summary: Optional[str] = Field(None, alias="impactSummary")
+    impact_analysis: Optional[str] = Field(None, alias="impactAnalysis")
+    confidence: Optional[float] = None
+    severity: Optional[str] = None
+    severity_score: Optional[float] = Field(None, alias="severityScore")
+    event_type: Optional[str] = Field(None, alias="eventType")
+    time_sensitivity: List[str] = Field(default_factory=list, alias="timeSensitivity")
+    published_at: Optional[datetime] = Field(None, alias="publishedAt")
+    source: Optional[str] = None
+    url: Optional[str] = None
+    impact_levels: List[str] = Field(default_factory=list, alias="impactLevels")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SectorInsightArticleAssignment(BaseModel):
+    article_id: Optional[str] = Field(None, alias="articleId")
+    title: Optional[str] = None
+    impact_summary: Optional[str] = Field(None, alias="impactSummary")
+    impact_analysis: Optional[str] = Field(None, alias="impactAnalysis")
+    confidence: Optional[float] = None
+    severity: Optional[str] = None
+    severity_score: Optional[float] = Field(None, alias="severityScore")
+    event_type: Optional[str] = Field(None, alias="eventType")
+    time_sensitivity: List[str] = Field(default_factory=list, alias="timeSensitivity")
+    focus_topics: List[str] = Field(default_factory=list, alias="focusTopics")
+    published_at: Optional[datetime] = Field(None, alias="publishedAt")
+    source: Optional[str] = None
+    url: Optional[str] = None
+    tags: List[str] = Field(default_factory=list)
+    tag_types: List[str] = Field(default_factory=list, alias="tagTypes")
+    impact_levels: List[str] = Field(default_factory=list, alias="impactLevels")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SectorInsightGroup(BaseModel):
+    name: str
+    tag_type: str = Field(..., alias="tagType")
+    article_count: int = Field(..., alias="articleCount")
+    average_confidence: Optional[float] = Field(None, alias="averageConfidence")
+    average_severity_score: Optional[float] = Field(None, alias="averageSeverityScore")
+    max_severity: Optional[str] = Field(None, alias="maxSeverity")
+    max_severity_score: Optional[float] = Field(None, alias="maxSeverityScore")
+    latest_published_at: Optional[datetime] = Field(None, alias="latestPublishedAt")
+    event_types: List[str] = Field(default_factory=list, alias="eventTypes")
+    time_sensitivity: List[str] = Field(default_factory=list, alias="timeSensitivity")
+    focus_topics: List[str] = Field(default_factory=list, alias="focusTopics")
+    impact_levels: List[str] = Field(default_factory=list, alias="impactLevels")
+    sources: List[str] = Field(default_factory=list)
+    score: Optional[float] = None
+    sample_articles: List[SectorInsightGroupArticle] = Field(default_factory=list, alias="sampleArticles")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SectorInsightSnapshot(BaseModel):
+    generated_at: datetime = Field(..., alias="generatedAt")
+    lookback_hours: int = Field(..., alias="lookbackHours")
+    headline_count: int = Field(..., alias="headlineCount")
+    group_count: int = Field(..., alias="groupCount")
+    groups: List[SectorInsightGroup]
+    article_assignments: List[SectorInsightArticleAssignment] = Field(default_factory=list, alias="articleAssignments")
+    excluded_count: Optional[int] = Field(None, alias="excludedCount")
+    excluded_article_ids: Optional[List[str]] = Field(None, alias="excludedArticleIds")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SectorInsightSummaryPayload(BaseModel):
+    summary_id: str = Field(..., alias="summaryId")
+    generated_at: datetime = Field(..., alias="generatedAt")
+    window_start: datetime = Field(..., alias="windowStart")
+    window_end: datetime = Field(..., alias="windowEnd")
+    headline_count: int = Field(..., alias="headlineCount")
+    group_count: int = Field(..., alias="groupCount")
+    summary: Optional[Dict[str, Any]] = None
+    group_snapshot: Optional[SectorInsightSnapshot] = Field(None, alias="groupSnapshot")
+    raw_response: Optional[str] = Field(None, alias="rawResponse")
+    prompt_tokens: Optional[int] = Field(None, alias="promptTokens")
+    completion_tokens: Optional[int] = Field(None, alias="completionTokens")
+    total_tokens: Optional[int] = Field(None, alias="totalTokens")
+    elapsed_seconds: Optional[float] = Field(None, alias="elapsedSeconds")
+    model_used: Optional[str] = Field(None, alias="modelUsed")
+    referenced_articles: List[SectorInsightArticleAssignment] = Field(default_factory=list, alias="referencedArticles")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SectorInsightResponse(BaseModel):
+    summary: Optional[SectorInsightSummaryPayload]
+    snapshot: Optional[SectorInsightSnapshot]
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class IndexHistoryRecord(BaseModel):
+    index_code: str = Field(..., alias="indexCode")
+    index_name: Optional[str] = Field(None, alias="indexName")
+    trade_date: date = Field(..., alias="tradeDate")
+    open: Optional[float] = None
+    close: Optional[float] = None
+    high: Optional[float] = None
+    low: Optional[float] = None
+    volume: Optional[float] = None
+    amount: Optional[float] = None
+    amplitude: Optional[float] = None
+    pct_change: Optional[float] = Field(None, alias="pctChange")
+    change_amount: Optional[float] = Field(None, alias="changeAmount")
+    turnover: Optional[float] = None
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class IndexOption(BaseModel):
+    code: str
+    name: str
+    symbol: str
+
+
+class IndexHistoryListResponse(BaseModel):
+    index_code: str = Field(..., alias="indexCode")
+    index_name: Optional[str] = Field(None, alias="indexName")
+    items: List[IndexHistoryRecord]
+    available_indices: List[IndexOption] = Field(..., alias="availableIndices")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncPerformanceExpressResponse(BaseModel):
+    rows: int
+    codes: List[str]
+    code_count: int = Field(..., alias="codeCount")
+    total_codes: int = Field(..., alias="totalCodes")
+    elapsed_seconds: float = Field(..., alias="elapsedSeconds")
+    report_period: Optional[str] = Field(None, alias="reportPeriod")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncPerformanceForecastRequest(BaseModel):
+    codes: Optional[List[str]] = Field(
+        None,
+        description="Optional list of securities to refresh (accepts ts_code or symbol).",
+    )
+    report_period: Optional[str] = Field(
+        None,
+        alias="reportPeriod",
+        description="Optional report period override (YYYYMMDD or YYYY-MM-DD).",
+    )
+    lookback_days: Optional[int] = Field(
+        None,
+        ge=1,
+        le=3650,
+        alias="lookbackDays",
+        description="Legacy parameter retained for compatibility; ignored.",
+    )
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncPerformanceForecastResponse(BaseModel):
+    rows: int
+    codes: List[str]
+    code_count: int = Field(..., alias="codeCount")
+    total_codes: int = Field(..., alias="totalCodes")
+    elapsed_seconds: float = Field(..., alias="elapsedSeconds")
+    report_period: Optional[str] = Field(None, alias="reportPeriod")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncProfitForecastRequest(BaseModel):
+    symbol: Optional[str] = Field(
+        None,
+        description="Optional industry filter passed to the AkShare profit forecast API.",
+    )
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncProfitForecastResponse(BaseModel):
+    rows: int
+    codes: List[str] = Field(default_factory=list)
+    code_count: int = Field(..., alias="codeCount")
+    elapsed_seconds: float = Field(..., alias="elapsedSeconds")
+    years: List[int] = Field(default_factory=list)
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncGlobalIndexRequest(BaseModel):
+    class Config:
+        extra = "forbid"
+
+
+class SyncGlobalIndexResponse(BaseModel):
+    rows: int
+    history_rows: int = Field(..., alias="historyRows")
+    codes: List[str] = Field(default_factory=list)
+    code_count: int = Field(..., alias="codeCount")
+    elapsed_seconds: float = Field(..., alias="elapsedSeconds")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncRealtimeIndexRequest(BaseModel):
+    class Config:
+        extra = "forbid"
+
+
+class SyncDollarIndexRequest(BaseModel):
+    symbol: Optional[str] = Field(
+        None,
+        description="Optional AkShare symbol name for the index (default: 美元指数).",
+    )
+
+    class Config:
+        extra = "forbid"
+        allow_population_by_field_name = True
+
+
+class SyncDollarIndexResponse(BaseModel):
+    rows: int
+    codes: List[str] = Field(default_factory=list)
+    code_count: int = Field(..., alias="codeCount")
+    elapsed_seconds: float = Field(..., alias="elapsedSeconds")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncRmbMidpointRequest(BaseModel):
+    class Config:
+        extra = "forbid"
+
+
+class SyncMacroLeverageRequest(BaseModel):
+    class Config:
+        extra = "forbid"
+
+
+class SyncSocialFinancingRequest(BaseModel):
+    class Config:
+        extra = "forbid"
+
+
+class SyncRmbMidpointResponse(BaseModel):
+    rows: int
+    elapsed_seconds: float = Field(..., alias="elapsedSeconds")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncSocialFinancingResponse(BaseModel):
+    rows: int
+    elapsed_seconds: float = Field(..., alias="elapsedSeconds")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncMacroCpiRequest(BaseModel):
+    class Config:
+        extra = "forbid"
+
+
+class SyncMacroCpiResponse(BaseModel):
+    rows: int
+    elapsed_seconds: float = Field(..., alias="elapsedSeconds")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncMacroPmiRequest(BaseModel):
+    class Config:
+        extra = "forbid"
+
+
+class SyncMacroPmiResponse(BaseModel):
+    rows: int
+    elapsed_seconds: float = Field(..., alias="elapsedSeconds")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncMacroM2Request(BaseModel):
+    class Config:
+        extra = "forbid"
+
+
+class SyncMacroM2Response(BaseModel):
+    rows: int
+    elapsed_seconds: float = Field(..., alias="elapsedSeconds")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncMacroPpiRequest(BaseModel):
+    class Config:
+        extra = "forbid"
+
+
+class SyncMacroPpiResponse(BaseModel):
+    rows: int
+    elapsed_seconds: float = Field(..., alias="elapsedSeconds")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncMacroLprRequest(BaseModel):
+    class Config:
+        extra = "forbid"
+
+
+class SyncMacroLprResponse(BaseModel):
+    rows: int
+    elapsed_seconds: float = Field(..., alias="elapsedSeconds")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncMacroShiborRequest(BaseModel):
+    class Config:
+        extra = "forbid"
+
+
+class SyncMacroShiborResponse(BaseModel):
+    rows: int
+    elapsed_seconds: float = Field(..., alias="elapsedSeconds")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncFuturesRealtimeRequest(BaseModel):
+    class Config:
+        extra = "forbid"
+
+
+class SyncFuturesRealtimeResponse(BaseModel):
+    rows: int
+    elapsed_seconds: float = Field(..., alias="elapsedSeconds")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncFedStatementRequest(BaseModel):
+    limit: Optional[int] = Field(
+        None,
+        ge=1,
+        le=50,
+        description="Optional override for number of statements to fetch (default: 5).",
+    )
+
+    class Config:
+        extra = "forbid"
+        allow_population_by_field_name = True
+
+
+class SyncFedStatementResponse(BaseModel):
+    rows: int
+    urls: List[str] = Field(default_factory=list)
+    url_count: int = Field(..., alias="urlCount")
+    elapsed_seconds: float = Field(..., alias="elapsedSeconds")
+    pruned: int = 0
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncPeripheralInsightRequest(BaseModel):
+    run_llm: Optional[bool] = Field(True, alias="runLLM")
+
+    class Config:
+        allow_population_by_field_name = True
+        extra = "forbid"
+
+
+class SyncPeripheralAggregateRequest(BaseModel):
+    fed_limit: Optional[int] = Field(
+        None,
+        alias="fedLimit",
+        ge=1,
+        le=50,
+        description="Optional override for number of Fed statements to fetch during aggregate sync.",
+    )
+    run_llm: Optional[bool] = Field(
+        None,
+        alias="runLLM",
+        description="Optional override for generating LLM insight during aggregate sync.",
+    )
+
+    class Config:
+        allow_population_by_field_name = True
+        extra = "forbid"
+
+
+class SyncMacroAggregateRequest(BaseModel):
+    class Config:
+        allow_population_by_field_name = True
+        extra = "forbid"
+
+
+class SyncFundFlowAggregateRequest(BaseModel):
+    class Config:
+        allow_population_by_field_name = True
+        extra = "forbid"
+
+
+class SyncIndustryFundFlowRequest(BaseModel):
+    symbols: Optional[List[str]] = Field(
+        None,
+        description="Optional list of ranking symbols (e.g. 即时, 3日排行).",
+    )
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncIndustryFundFlowResponse(BaseModel):
+    rows: int
+    symbols: List[str]
+    symbol_count: int = Field(..., alias="symbolCount")
+    elapsed_seconds: float = Field(..., alias="elapsedSeconds")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncConceptFundFlowRequest(BaseModel):
+    symbols: Optional[List[str]] = Field(
+        None,
+        description="Optional list of ranking symbols (e.g. 即时, 3日排行).",
+    )
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncConceptFundFlowResponse(BaseModel):
+    rows: int
+    symbols: List[str]
+    symbol_count: int = Field(..., alias="symbolCount")
+    elapsed_seconds: float = Field(..., alias="elapsedSeconds")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class ConceptIndexSyncItem(BaseModel):
+    concept: str
+    ts_code: Optional[str] = Field(None, alias="tsCode")
+    rows: int
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncConceptIndexHistoryRequest(BaseModel):
+    concepts: List[str] = Field(..., alias="concepts", description="List of concept names to sync.")
+    start_date: Optional[str] = Field(None, alias="startDate", description="Optional start date (YYYYMMDD).")
+    end_date: Optional[str] = Field(None, alias="endDate", description="Optional end date (YYYYMMDD).")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncConceptIndexHistoryResponse(BaseModel):
+    concepts: List[ConceptIndexSyncItem]
+    errors: List[Dict[str, Any]]
+    start_date: str = Field(..., alias="startDate")
+    end_date: str = Field(..., alias="endDate")
+    total_rows: int = Field(..., alias="totalRows")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class ConceptIndexHistoryRecord(BaseModel):
+    ts_code: str = Field(..., alias="tsCode")
+    concept_name: Optional[str] = Field(None, alias="conceptName")
+    trade_date: date = Field(..., alias="tradeDate")
+    open: Optional[float] = None
+    high: Optional[float] = None
+    low: Optional[float] = None
+    close: Optional[float] = None
+    pre_close: Optional[float] = Field(None, alias="preClose")
+    change: Optional[float] = None
+    pct_chg: Optional[float] = Field(None, alias="pctChg")
+    vol: Optional[float] = None
+    amount: Optional[float] = None
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class ConceptFundFlowBreakdown(BaseModel):
+    score: Optional[float] = None
+    best_rank: Optional[int] = Field(None, alias="bestRank")
+    best_symbol: Optional[str] = Field(None, alias="bestSymbol")
+    total_net_amount: Optional[float] = Field(None, alias="totalNetAmount")
+    total_inflow: Optional[float] = Field(None, alias="totalInflow")
+    total_outflow: Optional[float] = Field(None, alias="totalOutflow")
+    stages: List[FundFlowStageSnapshot] = Field(default_factory=list)
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class ConceptIndexMetrics(BaseModel):
+    latest_close: Optional[float] = Field(None, alias="latestClose")
+    change1d: Optional[float] = None
+    change5d: Optional[float] = None
+    change20d: Optional[float] = None
+    avg_volume5d: Optional[float] = Field(None, alias="avgVolume5d")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class ConceptNewsArticle(BaseModel):
+    article_id: Optional[str] = Field(None, alias="articleId")
+    source: Optional[str] = None
+    title: Optional[str] = None
+    summary: Optional[str] = None
+    published_at: Optional[str] = Field(None, alias="publishedAt")
+    url: Optional[str] = None
+    impact_summary: Optional[str] = Field(None, alias="impactSummary")
+    impact_analysis: Optional[str] = Field(None, alias="impactAnalysis")
+    impact_confidence: Optional[float] = Field(None, alias="impactConfidence")
+    relevance_confidence: Optional[float] = Field(None, alias="relevanceConfidence")
+    relevance_reason: Optional[str] = Field(None, alias="relevanceReason")
+    impact_themes: Optional[Any] = Field(None, alias="impactThemes")
+    impact_industries: Optional[Any] = Field(None, alias="impactIndustries")
+    impact_sectors: Optional[Any] = Field(None, alias="impactSectors")
+    impact_stocks: Optional[Any] = Field(None, alias="impactStocks")
+    extra_metadata: Optional[Dict[str, Any]] = Field(None, alias="extraMetadata")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class ConceptSnapshotEntry(BaseModel):
+    name: str
+    ts_code: Optional[str] = Field(None, alias="tsCode")
+    latest_trade_date: Optional[str] = Field(None, alias="latestTradeDate")
+    fund_flow: ConceptFundFlowBreakdown = Field(..., alias="fundFlow")
+    index_metrics: Optional[ConceptIndexMetrics] = Field(None, alias="indexMetrics")
+    news: List[ConceptNewsArticle] = Field(default_factory=list)
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class ConceptSnapshot(BaseModel):
+    generated_at: Optional[str] = Field(None, alias="generatedAt")
+    lookback_hours: Optional[int] = Field(None, alias="lookbackHours")
+    concept_count: Optional[int] = Field(None, alias="conceptCount")
+    concepts: List[ConceptSnapshotEntry] = Field(default_factory=list)
+    fund_snapshot: Optional[FundFlowSectorHotlistResponse] = Field(None, alias="fundSnapshot")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncConceptInsightRequest(BaseModel):
+    lookback_hours: int = Field(48, ge=1, le=168, alias="lookbackHours")
+    concept_limit: int = Field(10, ge=1, le=15, alias="conceptLimit")
+    run_llm: bool = Field(True, alias="runLLM")
+    refresh_index_history: bool = Field(True, alias="refreshIndexHistory")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class ConceptInsightSummary(BaseModel):
+    summary_id: str = Field(..., alias="summaryId")
+    generated_at: Optional[str] = Field(None, alias="generatedAt")
+    window_start: Optional[str] = Field(None, alias="windowStart")
+    window_end: Optional[str] = Field(None, alias="windowEnd")
+    concept_count: Optional[int] = Field(None, alias="conceptCount")
+    summary_snapshot: Optional[Dict[str, Any]] = Field(None, alias="summarySnapshot")
+    summary_json: Optional[Dict[str, Any]] = Field(None, alias="summaryJson")
+    raw_response: Optional[str] = Field(None, alias="rawResponse")
+    referenced_concepts: Optional[Sequence[str]] = Field(None, alias="referencedConcepts")
+    referenced_articles: Optional[Sequence[Dict[str, Any]]] = Field(None, alias="referencedArticles")
+    prompt_tokens: Optional[int] = Field(None, alias="promptTokens")
+    completion_tokens: Optional[int] = Field(None, alias="completionTokens")
+    total_tokens: Optional[int] = Field(None, alias="totalTokens")
+    elapsed_ms: Optional[int] = Field(None, alias="elapsedMs")
+    model_used: Optional[str] = Field(None, alias="modelUsed")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class ConceptInsightResponse(BaseModel):
+    insight: Optional[ConceptInsightSummary]
+    snapshot: Optional[ConceptSnapshot]
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class ConceptInsightHistoryResponse(BaseModel):
+    items: List[ConceptInsightSummary] = Field(default_factory=list)
+
+ConceptInsightSummary.update_forward_refs(ConceptSnapshot=ConceptSnapshot, Sequence=Sequence)
+ConceptInsightResponse.update_forward_refs(ConceptInsightSummary=ConceptInsightSummary, ConceptSnapshot=ConceptSnapshot)
+ConceptInsightHistoryResponse.update_forward_refs(ConceptInsightSummary=ConceptInsightSummary, Sequence=Sequence)
+
+class IndustryNewsArticle(BaseModel):
+    article_id: Optional[str] = Field(None, alias="articleId")
+    source: Optional[str] = None
+    title: Optional[str] = None
+    summary: Optional[str] = None
+    published_at: Optional[str] = Field(None, alias="publishedAt")
+    url: Optional[str] = None
+    impact_summary: Optional[str] = Field(None, alias="impactSummary")
+    impact_analysis: Optional[str] = Field(None, alias="impactAnalysis")
+    impact_confidence: Optional[float] = Field(None, alias="impactConfidence")
+    relevance_confidence: Optional[float] = Field(None, alias="relevanceConfidence")
+    relevance_reason: Optional[str] = Field(None, alias="relevanceReason")
+    impact_themes: Optional[Any] = Field(None, alias="impactThemes")
+    impact_industries: Optional[Any] = Field(None, alias="impactIndustries")
+    impact_sectors: Optional[Any] = Field(None, alias="impactSectors")
+    impact_stocks: Optional[Any] = Field(None, alias="impactStocks")
+    extra_metadata: Optional[Dict[str, Any]] = Field(None, alias="extraMetadata")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class IndustrySnapshotEntry(BaseModel):
+    name: str
+    fund_flow: ConceptFundFlowBreakdown = Field(..., alias="fundFlow")
+    stage_metrics: Dict[str, Optional[float]] = Field(default_factory=dict, alias="stageMetrics")
+    news: List[IndustryNewsArticle] = Field(default_factory=list)
+    latest_updated_at: Optional[str] = Field(None, alias="latestUpdatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class IndustrySnapshot(BaseModel):
+    generated_at: Optional[str] = Field(None, alias="generatedAt")
+    lookback_hours: Optional[int] = Field(None, alias="lookbackHours")
+    industry_count: Optional[int] = Field(None, alias="industryCount")
+    industries: List[IndustrySnapshotEntry] = Field(default_factory=list)
+    fund_snapshot: Optional[Dict[str, Any]] = Field(None, alias="fundSnapshot")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncIndustryInsightRequest(BaseModel):
+    lookback_hours: int = Field(48, ge=1, le=168, alias="lookbackHours")
+    industry_limit: int = Field(5, ge=1, le=10, alias="industryLimit")
+    run_llm: bool = Field(True, alias="runLLM")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class IndustryInsightSummary(BaseModel):
+    summary_id: str = Field(..., alias="summaryId")
+    generated_at: Optional[str] = Field(None, alias="generatedAt")
+    window_start: Optional[str] = Field(None, alias="windowStart")
+    window_end: Optional[str] = Field(None, alias="windowEnd")
+    industry_count: Optional[int] = Field(None, alias="industryCount")
+    summary_snapshot: Optional[Dict[str, Any]] = Field(None, alias="summarySnapshot")
+    summary_json: Optional[Dict[str, Any]] = Field(None, alias="summaryJson")
+    raw_response: Optional[str] = Field(None, alias="rawResponse")
+    referenced_industries: Optional[Sequence[str]] = Field(None, alias="referencedIndustries")
+    referenced_articles: Optional[Sequence[Dict[str, Any]]] = Field(None, alias="referencedArticles")
+    prompt_tokens: Optional[int] = Field(None, alias="promptTokens")
+    completion_tokens: Optional[int] = Field(None, alias="completionTokens")
+    total_tokens: Optional[int] = Field(None, alias="totalTokens")
+    elapsed_ms: Optional[int] = Field(None, alias="elapsedMs")
+    model_used: Optional[str] = Field(None, alias="modelUsed")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class IndustryInsightResponse(BaseModel):
+    insight: Optional[IndustryInsightSummary]
+    snapshot: Optional[IndustrySnapshot]
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class IndustryInsightHistoryResponse(BaseModel):
+    items: List[IndustryInsightSummary] = Field(default_factory=list)
+
+IndustryInsightSummary.update_forward_refs(IndustrySnapshot=IndustrySnapshot, Sequence=Sequence)
+IndustryInsightResponse.update_forward_refs(IndustryInsightSummary=IndustryInsightSummary, IndustrySnapshot=IndustrySnapshot)
+IndustryInsightHistoryResponse.update_forward_refs(IndustryInsightSummary=IndustryInsightSummary, Sequence=Sequence)
+
+
+class SyncIndividualFundFlowRequest(BaseModel):
+    symbols: Optional[List[str]] = Field(
+        None,
+        description="Optional list of ranking symbols (e.g. 即时, 3日排行).",
+    )
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncIndividualFundFlowResponse(BaseModel):
+    rows: int
+    symbols: List[str]
+    symbol_count: int = Field(..., alias="symbolCount")
+    elapsed_seconds: float = Field(..., alias="elapsedSeconds")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncBigDealFundFlowRequest(BaseModel):
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncBigDealFundFlowResponse(BaseModel):
+    rows: int
+    elapsed_seconds: float = Field(..., alias="elapsedSeconds")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+
+class SyncMarginAccountRequest(BaseModel):
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncMarginAccountResponse(BaseModel):
+    rows: int
+    trade_dates: List[str] = Field(default_factory=list, alias="tradeDates")
+    trade_date_count: int = Field(..., alias="tradeDateCount")
+    elapsed_seconds: float = Field(..., alias="elapsedSeconds")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncMarketActivityRequest(BaseModel):
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncMarketActivityResponse(BaseModel):
+    rows: int
+    dataset_timestamp: Optional[datetime] = Field(None, alias="datasetTimestamp")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncMarketFundFlowRequest(BaseModel):
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncMarketFundFlowResponse(BaseModel):
+    rows: int
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncMacroInsightRequest(BaseModel):
+    run_llm: bool = Field(True, alias="runLLM")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncMacroInsightResponse(BaseModel):
+    snapshot_date: date = Field(..., alias="snapshotDate")
+    generated_at: datetime = Field(..., alias="generatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncStockMainBusinessRequest(BaseModel):
+    codes: Optional[List[str]] = Field(
+        None,
+        description="Optional list of stock codes (symbol or ts_code) to refresh.",
+    )
+    include_list_statuses: Optional[List[str]] = Field(
+        None,
+        alias="includeListStatuses",
+        description="Optional list of list_status values used when codes are omitted.",
+    )
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncStockMainBusinessResponse(BaseModel):
+    rows: int
+    codes: List[str]
+    code_count: int = Field(..., alias="codeCount")
+    elapsed_seconds: float = Field(..., alias="elapsedSeconds")
+    skipped_count: int = Field(0, alias="skippedCount")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncStockMainCompositionRequest(BaseModel):
+    codes: Optional[List[str]] = Field(
+        None,
+        description="Optional list of stock codes (symbol or ts_code) to refresh.",
+    )
+    include_list_statuses: Optional[List[str]] = Field(
+        None,
+        alias="includeListStatuses",
+        description="Optional list of list_status values used when codes are omitted.",
+    )
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncStockMainCompositionResponse(BaseModel):
+    rows: int
+    codes: List[str]
+    code_count: int = Field(..., alias="codeCount")
+    elapsed_seconds: float = Field(..., alias="elapsedSeconds")
+    skipped_symbols: int = Field(0, alias="skippedSymbols")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class PerformanceExpressRecord(BaseModel):
+    symbol: str
+    ts_code: Optional[str] = Field(None, alias="tsCode")
+    name: Optional[str] = None
+    industry: Optional[str] = None
+    market: Optional[str] = None
+    ann_date: Optional[date] = Field(None, alias="annDate")
+    end_date: Optional[date] = Field(None, alias="endDate")
+    report_period: Optional[date] = Field(None, alias="reportPeriod")
+    announcement_date: Optional[date] = Field(None, alias="announcementDate")
+    eps: Optional[float] = None
+    revenue: Optional[float] = None
+    revenue_prev: Optional[float] = Field(None, alias="revenuePrev")
+    revenue_yoy: Optional[float] = Field(None, alias="revenueYearlyGrowth")
+    revenue_qoq: Optional[float] = Field(None, alias="revenueQuarterlyGrowth")
+    net_profit: Optional[float] = Field(None, alias="netProfit")
+    net_profit_prev: Optional[float] = Field(None, alias="netProfitPrev")
+    net_profit_yoy: Optional[float] = Field(None, alias="netProfitYearlyGrowth")
+    net_profit_qoq: Optional[float] = Field(None, alias="netProfitQuarterlyGrowth")
+    net_assets_per_share: Optional[float] = Field(None, alias="netAssetsPerShare")
+    return_on_equity: Optional[float] = Field(None, alias="returnOnEquity")
+    row_number: Optional[int] = Field(None, alias="rowNumber")
+    n_income: Optional[float] = Field(None, alias="netIncome")
+    diluted_eps: Optional[float] = Field(None, alias="dilutedEps")
+    diluted_roe: Optional[float] = Field(None, alias="dilutedRoe")
+    yoy_net_profit: Optional[float] = Field(None, alias="yoyNetProfit")
+    perf_summary: Optional[str] = Field(None, alias="perfSummary")
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class PerformanceExpressListResponse(BaseModel):
+    total: int
+    items: List[PerformanceExpressRecord]
+
+
+class PerformanceForecastRecord(BaseModel):
+    symbol: str
+    ts_code: Optional[str] = Field(None, alias="tsCode")
+    name: Optional[str] = None
+    industry: Optional[str] = None
+    market: Optional[str] = None
+    ann_date: Optional[date] = Field(None, alias="annDate")
+    end_date: Optional[date] = Field(None, alias="endDate")
+    report_period: Optional[date] = Field(None, alias="reportPeriod")
+    announcement_date: Optional[date] = Field(None, alias="announcementDate")
+    forecast_metric: Optional[str] = Field(None, alias="forecastMetric")
+    change_description: Optional[str] = Field(None, alias="changeDescription")
+    forecast_value: Optional[float] = Field(None, alias="forecastValue")
+    change_rate: Optional[float] = Field(None, alias="changeRate")
+    change_reason: Optional[str] = Field(None, alias="changeReason")
+    forecast_type: Optional[str] = Field(None, alias="forecastType")
+    last_year_value: Optional[float] = Field(None, alias="lastYearValue")
+    row_number: Optional[int] = Field(None, alias="rowNumber")
+    type: Optional[str] = Field(None, alias="type")
+    summary: Optional[str] = None
+    p_change_min: Optional[float] = Field(None, alias="pctChangeMin")
+    p_change_max: Optional[float] = Field(None, alias="pctChangeMax")
+    net_profit_min: Optional[float] = Field(None, alias="netProfitMin")
+    net_profit_max: Optional[float] = Field(None, alias="netProfitMax")
+    last_parent_net: Optional[float] = Field(None, alias="lastParentNet")
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class PerformanceForecastListResponse(BaseModel):
+    total: int
+    items: List[PerformanceForecastRecord]
+
+
+class CashflowRecord(BaseModel):
+    ts_code: Optional[str] = Field(None, alias="tsCode")
+    name: Optional[str] = None
+    industry: Optional[str] = None
+    market: Optional[str] = None
+    ann_date: Optional[date] = Field(None, alias="annDate")
+    end_date: Optional[date] = Field(None, alias="endDate")
+    c_fr_sale_sg: Optional[float] = Field(None, alias="cFrSaleSg")
+    c_paid_goods_s: Optional[float] = Field(None, alias="cPaidGoodsS")
+    c_paid_to_for_empl: Optional[float] = Field(None, alias="cPaidToForEmpl")
+    n_cashflow_act: Optional[float] = Field(None, alias="nCashflowAct")
+    c_pay_acq_const_fiolta: Optional[float] = Field(None, alias="cPayAcqConstFiolta")
+    n_cashflow_inv_act: Optional[float] = Field(None, alias="nCashflowInvAct")
+    c_recp_borrow: Optional[float] = Field(None, alias="cRecpBorrow")
+    c_prepay_amt_borr: Optional[float] = Field(None, alias="cPrepayAmtBorr")
+    c_pay_dist_dpcp_int_exp: Optional[float] = Field(None, alias="cPayDistDpcpIntExp")
+    n_cash_flows_fnc_act: Optional[float] = Field(None, alias="nCashFlowsFncAct")
+    n_incr_cash_cash_equ: Optional[float] = Field(None, alias="nIncrCashCashEqu")
+    c_cash_equ_beg_period: Optional[float] = Field(None, alias="cCashEquBegPeriod")
+    c_cash_equ_end_period: Optional[float] = Field(None, alias="cCashEquEndPeriod")
+    free_cashflow: Optional[float] = Field(None, alias="freeCashflow")
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class CashflowListResponse(BaseModel):
+    total: int
+    items: List[CashflowRecord]
+
+
+class BalanceSheetRecord(BaseModel):
+    ts_code: Optional[str] = Field(None, alias="tsCode")
+    name: Optional[str] = None
+    industry: Optional[str] = None
+    market: Optional[str] = None
+    ann_date: Optional[date] = Field(None, alias="annDate")
+    end_date: Optional[date] = Field(None, alias="endDate")
+    money_cap: Optional[float] = Field(None, alias="moneyCap")
+    accounts_receiv: Optional[float] = Field(None, alias="accountsReceiv")
+    inventories: Optional[float] = None
+    fix_assets: Optional[float] = Field(None, alias="fixAssets")
+    total_cur_assets: Optional[float] = Field(None, alias="totalCurAssets")
+    total_nca: Optional[float] = Field(None, alias="totalNca")
+    total_assets: Optional[float] = Field(None, alias="totalAssets")
+    st_borr: Optional[float] = Field(None, alias="stBorr")
+    lt_borr: Optional[float] = Field(None, alias="ltBorr")
+    acct_payable: Optional[float] = Field(None, alias="acctPayable")
+    total_cur_liab: Optional[float] = Field(None, alias="totalCurLiab")
+    total_ncl: Optional[float] = Field(None, alias="totalNcl")
+    total_liab: Optional[float] = Field(None, alias="totalLiab")
+    total_share: Optional[float] = Field(None, alias="totalShare")
+    cap_rese: Optional[float] = Field(None, alias="capRese")
+    surplus_rese: Optional[float] = Field(None, alias="surplusRese")
+    undistr_porfit: Optional[float] = Field(None, alias="undistrPorfit")
+    total_hldr_eqy_exc_min_int: Optional[float] = Field(None, alias="totalHldrEqyExcMinInt")
+    total_liab_hldr_eqy: Optional[float] = Field(None, alias="totalLiabHldrEqy")
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class BalanceSheetListResponse(BaseModel):
+    total: int
+    items: List[BalanceSheetRecord]
+
+
+class ProfitForecastRating(BaseModel):
+    buy: Optional[float] = None
+    add: Optional[float] = None
+    neutral: Optional[float] = None
+    reduce: Optional[float] = None
+    sell: Optional[float] = None
+
+
+class ProfitForecastPoint(BaseModel):
+    year: int
+    eps: Optional[float] = None
+
+
+class ProfitForecastItem(BaseModel):
+    code: str
+    symbol: str
+    ts_code: Optional[str] = Field(None, alias="tsCode")
+    name: Optional[str] = None
+    industry: Optional[str] = None
+    market: Optional[str] = None
+    report_count: Optional[int] = Field(None, alias="reportCount")
+    ratings: ProfitForecastRating
+    forecasts: List[ProfitForecastPoint] = Field(default_factory=list)
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class ProfitForecastListResponse(BaseModel):
+    total: int
+    items: List[ProfitForecastItem]
+    industries: List[str] = Field(default_factory=list)
+    years: List[int] = Field(default_factory=list)
+
+
+class GlobalIndexRecord(BaseModel):
+    code: str
+    seq: Optional[int] = None
+    name: Optional[str] = None
+    latest_price: Optional[float] = Field(None, alias="latestPrice")
+    change_amount: Optional[float] = Field(None, alias="changeAmount")
+    change_percent: Optional[float] = Field(None, alias="changePercent")
+    open_price: Optional[float] = Field(None, alias="openPrice")
+    high_price: Optional[float] = Field(None, alias="highPrice")
+    low_price: Optional[float] = Field(None, alias="lowPrice")
+    prev_close: Optional[float] = Field(None, alias="prevClose")
+    amplitude: Optional[float] = None
+    last_quote_time: Optional[datetime] = Field(None, alias="lastQuoteTime")
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class GlobalIndexListResponse(BaseModel):
+    total: int
+    items: List[GlobalIndexRecord]
+    last_synced_at: Optional[datetime] = Field(None, alias="lastSyncedAt")
+
+
+class GlobalIndexHistoryPoint(BaseModel):
+    trade_date: date = Field(..., alias="tradeDate")
+    open_price: Optional[float] = Field(None, alias="openPrice")
+    high_price: Optional[float] = Field(None, alias="highPrice")
+    low_price: Optional[float] = Field(None, alias="lowPrice")
+    close_price: Optional[float] = Field(None, alias="closePrice")
+    volume: Optional[float] = None
+    prev_close: Optional[float] = Field(None, alias="prevClose")
+    change_amount: Optional[float] = Field(None, alias="changeAmount")
+    change_percent: Optional[float] = Field(None, alias="changePercent")
+    currency: Optional[str] = None
+    timezone: Optional[str] = None
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class GlobalIndexHistoryResponse(BaseModel):
+    code: str
+    name: Optional[str] = None
+    items: List[GlobalIndexHistoryPoint]
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class RealtimeIndexRecord(BaseModel):
+    code: str
+    name: Optional[str] = None
+    latest_price: Optional[float] = Field(None, alias="latestPrice")
+    change_amount: Optional[float] = Field(None, alias="changeAmount")
+    change_percent: Optional[float] = Field(None, alias="changePercent")
+    prev_close: Optional[float] = Field(None, alias="prevClose")
+    open_price: Optional[float] = Field(None, alias="openPrice")
+    high_price: Optional[float] = Field(None, alias="highPrice")
+    low_price: Optional[float] = Field(None, alias="lowPrice")
+    volume: Optional[float] = None
+    turnover: Optional[float] = None
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class RealtimeIndexListResponse(BaseModel):
+    total: int
+    items: List[RealtimeIndexRecord]
+    last_synced_at: Optional[datetime] = Field(None, alias="lastSyncedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class RealtimeQuoteRecord(BaseModel):
+    code: str
+    name: Optional[str] = None
+    trade_date: Optional[date] = Field(None, alias="tradeDate")
+    trade_time: Optional[str] = Field(None, alias="tradeTime")
+    open: Optional[float] = None
+    high: Optional[float] = None
+    low: Optional[float] = None
+    close: Optional[float] = None
+    pre_close: Optional[float] = Field(None, alias="preClose")
+    change: Optional[float] = None
+    pct_change: Optional[float] = Field(None, alias="pctChange")
+    volume: Optional[float] = None
+    amount: Optional[float] = None
+    received_at: Optional[datetime] = Field(None, alias="receivedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class RealtimeQuoteListResponse(BaseModel):
+    items: List[RealtimeQuoteRecord]
+    poller_running: bool = Field(False, alias="pollerRunning")
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class DollarIndexRecord(BaseModel):
+    trade_date: date = Field(..., alias="tradeDate")
+    code: str
+    name: Optional[str] = None
+    open_price: Optional[float] = Field(None, alias="openPrice")
+    close_price: Optional[float] = Field(None, alias="closePrice")
+    high_price: Optional[float] = Field(None, alias="highPrice")
+    low_price: Optional[float] = Field(None, alias="lowPrice")
+    amplitude: Optional[float] = None
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class DollarIndexListResponse(BaseModel):
+    total: int
+    items: List[DollarIndexRecord]
+    last_synced_at: Optional[datetime] = Field(None, alias="lastSyncedAt")
+
+
+class RmbMidpointRecord(BaseModel):
+    trade_date: date = Field(..., alias="tradeDate")
+    usd: Optional[float] = None
+    eur: Optional[float] = None
+    jpy: Optional[float] = None
+    hkd: Optional[float] = None
+    gbp: Optional[float] = None
+    aud: Optional[float] = None
+    cad: Optional[float] = None
+    nzd: Optional[float] = None
+    sgd: Optional[float] = None
+    chf: Optional[float] = None
+    myr: Optional[float] = None
+    rub: Optional[float] = None
+    zar: Optional[float] = None
+    krw: Optional[float] = None
+    aed: Optional[float] = None
+    sar: Optional[float] = None
+    huf: Optional[float] = None
+    pln: Optional[float] = None
+    dkk: Optional[float] = None
+    sek: Optional[float] = None
+    nok: Optional[float] = None
+    try_value: Optional[float] = Field(None, alias="try")
+    mxn: Optional[float] = None
+    thb: Optional[float] = None
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class RmbMidpointListResponse(BaseModel):
+    total: int
+    items: List[RmbMidpointRecord]
+    last_synced_at: Optional[datetime] = Field(None, alias="lastSyncedAt")
+
+
+class MacroLeverageRecord(BaseModel):
+    period_date: date = Field(..., alias="periodDate")
+    period_label: Optional[str] = Field(None, alias="periodLabel")
+    household_ratio: Optional[float] = Field(None, alias="householdRatio")
+    non_financial_corporate_ratio: Optional[float] = Field(None, alias="nonFinancialCorporateRatio")
+    government_ratio: Optional[float] = Field(None, alias="governmentRatio")
+    central_government_ratio: Optional[float] = Field(None, alias="centralGovernmentRatio")
+    local_government_ratio: Optional[float] = Field(None, alias="localGovernmentRatio")
+    real_economy_ratio: Optional[float] = Field(None, alias="realEconomyRatio")
+    financial_assets_ratio: Optional[float] = Field(None, alias="financialAssetsRatio")
+    financial_liabilities_ratio: Optional[float] = Field(None, alias="financialLiabilitiesRatio")
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class MacroLeverageListResponse(BaseModel):
+    total: int
+    items: List[MacroLeverageRecord]
+    last_synced_at: Optional[datetime] = Field(None, alias="lastSyncedAt")
+
+
+class SocialFinancingRecord(BaseModel):
+    period_date: date = Field(..., alias="periodDate")
+    period_label: Optional[str] = Field(None, alias="periodLabel")
+    total_financing: Optional[float] = Field(None, alias="totalFinancing")
+    renminbi_loans: Optional[float] = Field(None, alias="renminbiLoans")
+    entrusted_and_fx_loans: Optional[float] = Field(None, alias="entrustedAndFxLoans")
+    entrusted_loans: Optional[float] = Field(None, alias="entrustedLoans")
+    trust_loans: Optional[float] = Field(None, alias="trustLoans")
+    undiscounted_bankers_acceptance: Optional[float] = Field(None, alias="undiscountedBankersAcceptance")
+    corporate_bonds: Optional[float] = Field(None, alias="corporateBonds")
+    domestic_equity_financing: Optional[float] = Field(None, alias="domesticEquityFinancing")
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SocialFinancingListResponse(BaseModel):
+    total: int
+    items: List[SocialFinancingRecord]
+    last_synced_at: Optional[datetime] = Field(None, alias="lastSyncedAt")
+
+
+class CpiRecord(BaseModel):
+    period_date: date = Field(..., alias="periodDate")
+    period_label: Optional[str] = Field(None, alias="periodLabel")
+    actual_value: Optional[float] = Field(None, alias="actualValue")
+    forecast_value: Optional[float] = Field(None, alias="forecastValue")
+    previous_value: Optional[float] = Field(None, alias="previousValue")
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class CpiListResponse(BaseModel):
+    total: int
+    items: List[CpiRecord]
+    last_synced_at: Optional[datetime] = Field(None, alias="lastSyncedAt")
+
+
+class PmiRecord(BaseModel):
+    series: str = Field(..., alias="series")
+    period_date: date = Field(..., alias="periodDate")
+    period_label: Optional[str] = Field(None, alias="periodLabel")
+    actual_value: Optional[float] = Field(None, alias="actualValue")
+    forecast_value: Optional[float] = Field(None, alias="forecastValue")
+    previous_value: Optional[float] = Field(None, alias="previousValue")
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class PmiListResponse(BaseModel):
+    total: int
+    items: List[PmiRecord]
+    last_synced_at: Optional[datetime] = Field(None, alias="lastSyncedAt")
+
+
+class M2Record(BaseModel):
+    period_date: date = Field(..., alias="periodDate")
+    period_label: Optional[str] = Field(None, alias="periodLabel")
+    m0: Optional[float]
+    m0_yoy: Optional[float]
+    m0_mom: Optional[float]
+    m1: Optional[float]
+    m1_yoy: Optional[float]
+    m1_mom: Optional[float]
+    m2: Optional[float]
+    m2_yoy: Optional[float]
+    m2_mom: Optional[float]
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class M2ListResponse(BaseModel):
+    total: int
+    items: List[M2Record]
+    last_synced_at: Optional[datetime] = Field(None, alias="lastSyncedAt")
+
+
+class PpiRecord(BaseModel):
+    period_date: date = Field(..., alias="periodDate")
+    period_label: Optional[str] = Field(None, alias="periodLabel")
+    current_index: Optional[float] = Field(None, alias="currentIndex")
+    yoy_change: Optional[float] = Field(None, alias="yoyChange")
+    cumulative_index: Optional[float] = Field(None, alias="cumulativeIndex")
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class PpiListResponse(BaseModel):
+    total: int
+    items: List[PpiRecord]
+    last_synced_at: Optional[datetime] = Field(None, alias="lastSyncedAt")
+
+
+class LprRecord(BaseModel):
+    period_date: date = Field(..., alias="periodDate")
+    period_label: Optional[str] = Field(None, alias="periodLabel")
+    rate_1y: Optional[float] = Field(None, alias="rate1Y")
+    rate_5y: Optional[float] = Field(None, alias="rate5Y")
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class LprListResponse(BaseModel):
+    total: int
+    items: List[LprRecord]
+    last_synced_at: Optional[datetime] = Field(None, alias="lastSyncedAt")
+
+
+class ShiborRecord(BaseModel):
+    period_date: date = Field(..., alias="periodDate")
+    period_label: Optional[str] = Field(None, alias="periodLabel")
+    on_rate: Optional[float] = Field(None, alias="onRate")
+    rate_1w: Optional[float] = Field(None, alias="rate1W")
+    rate_2w: Optional[float] = Field(None, alias="rate2W")
+    rate_1m: Optional[float] = Field(None, alias="rate1M")
+    rate_3m: Optional[float] = Field(None, alias="rate3M")
+    rate_6m: Optional[float] = Field(None, alias="rate6M")
+    rate_9m: Optional[float] = Field(None, alias="rate9M")
+    rate_1y: Optional[float] = Field(None, alias="rate1Y")
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class ShiborListResponse(BaseModel):
+    total: int
+    items: List[ShiborRecord]
+    last_synced_at: Optional[datetime] = Field(None, alias="lastSyncedAt")
+
+
+class FuturesRealtimeRecord(BaseModel):
+    name: str
+    code: Optional[str] = None
+    last_price: Optional[float] = Field(None, alias="lastPrice")
+    price_cny: Optional[float] = Field(None, alias="priceCny")
+    change_amount: Optional[float] = Field(None, alias="changeAmount")
+    change_percent: Optional[float] = Field(None, alias="changePercent")
+    open_price: Optional[float] = Field(None, alias="openPrice")
+    high_price: Optional[float] = Field(None, alias="highPrice")
+    low_price: Optional[float] = Field(None, alias="lowPrice")
+    prev_settlement: Optional[float] = Field(None, alias="prevSettlement")
+    open_interest: Optional[float] = Field(None, alias="openInterest")
+    bid_price: Optional[float] = Field(None, alias="bidPrice")
+    ask_price: Optional[float] = Field(None, alias="askPrice")
+    quote_time: Optional[str] = Field(None, alias="quoteTime")
+    trade_date: Optional[date] = Field(None, alias="tradeDate")
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class FuturesRealtimeListResponse(BaseModel):
+    total: int
+    items: List[FuturesRealtimeRecord]
+    last_synced_at: Optional[datetime] = Field(None, alias="lastSyncedAt")
+
+
+class FedStatementRecord(BaseModel):
+    title: str
+    url: str
+    statement_date: Optional[date] = Field(None, alias="statementDate")
+    content: Optional[str] = None
+    raw_text: Optional[str] = Field(None, alias="rawText")
+    position: Optional[int] = None
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class FedStatementListResponse(BaseModel):
+    total: int
+    items: List[FedStatementRecord]
+    last_synced_at: Optional[datetime] = Field(None, alias="lastSyncedAt")
+
+
+class PeripheralInsightRecord(BaseModel):
+    snapshot_date: date = Field(..., alias="snapshotDate")
+    generated_at: datetime = Field(..., alias="generatedAt")
+    metrics: Dict[str, Any]
+    summary: Optional[str] = None
+    raw_response: Optional[str] = Field(None, alias="rawResponse")
+    model: Optional[str] = None
+    created_at: Optional[datetime] = Field(None, alias="createdAt")
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class PeripheralInsightResponse(BaseModel):
+    insight: Optional[PeripheralInsightRecord]
+
+
+class PeripheralInsightHistoryResponse(BaseModel):
+    items: List[PeripheralInsightRecord]
+
+
+class MacroInsightDatasetField(BaseModel):
+    key: str
+    label_key: str = Field(..., alias="labelKey")
+    format: Optional[str] = None
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class MacroInsightDataset(BaseModel):
+    key: str
+    title_key: str = Field(..., alias="titleKey")
+    fields: List[MacroInsightDatasetField]
+    series: List[Dict[str, Any]]
+    latest: Optional[Dict[str, Any]]
+    updated_at: Optional[str] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class MacroInsightResponse(BaseModel):
+    snapshot_date: date = Field(..., alias="snapshotDate")
+    generated_at: datetime = Field(..., alias="generatedAt")
+    summary: Optional[Dict[str, Any]]
+    raw_response: Optional[str] = Field(None, alias="rawResponse")
+    model: Optional[str]
+    datasets: List[MacroInsightDataset]
+    warnings: List[str] = Field(default_factory=list)
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class MacroInsightHistoryItem(BaseModel):
+    snapshot_date: date = Field(..., alias="snapshotDate")
+    generated_at: Optional[datetime] = Field(None, alias="generatedAt")
+    summary_json: Optional[Dict[str, Any]] = Field(None, alias="summaryJson")
+    raw_response: Optional[str] = Field(None, alias="rawResponse")
+    model: Optional[str] = None
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class MacroInsightHistoryResponse(BaseModel):
+    items: List[MacroInsightHistoryItem]
+
+
+class MarketInsightHistoryItem(BaseModel):
+    summary_id: str = Field(..., alias="summaryId")
+    generated_at: Optional[datetime] = Field(None, alias="generatedAt")
+    window_start: Optional[datetime] = Field(None, alias="windowStart")
+    window_end: Optional[datetime] = Field(None, alias="windowEnd")
+    summary_json: Optional[Dict[str, Any]] = Field(None, alias="summaryJson")
+    model_used: Optional[str] = Field(None, alias="modelUsed")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class MarketInsightHistoryResponse(BaseModel):
+    items: List[MarketInsightHistoryItem]
+
+
+class MarketOverviewReasoningSnapshot(BaseModel):
+    summary: Optional[Dict[str, Any]] = None
+    raw_text: Optional[str] = Field(None, alias="rawText")
+    model: Optional[str] = None
+    generated_at: Optional[datetime] = Field(None, alias="generatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class MarketOverviewResponse(BaseModel):
+    generated_at: datetime = Field(..., alias="generatedAt")
+    realtime_indices: List[Dict[str, Any]] = Field(default_factory=list, alias="realtimeIndices")
+    index_history: Dict[str, List[Dict[str, Any]]] = Field(default_factory=dict, alias="indexHistory")
+    market_insight: Optional[Dict[str, Any]] = Field(None, alias="marketInsight")
+    macro_insight: Optional[Dict[str, Any]] = Field(None, alias="macroInsight")
+    market_fund_flow: List[Dict[str, Any]] = Field(default_factory=list, alias="marketFundFlow")
+    margin_account: List[Dict[str, Any]] = Field(default_factory=list, alias="marginAccount")
+    peripheral_insight: Optional[Dict[str, Any]] = Field(None, alias="peripheralInsight")
+    market_activity: List[Dict[str, Any]] = Field(default_factory=list, alias="marketActivity")
+    latest_reasoning: Optional[MarketOverviewReasoningSnapshot] = Field(None, alias="latestReasoning")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class InvestmentJournalEntryPayload(BaseModel):
+    review_html: Optional[str] = Field(None, alias="reviewHtml")
+    plan_html: Optional[str] = Field(None, alias="planHtml")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class InvestmentJournalEntryResponse(BaseModel):
+    entry_date: date = Field(..., alias="entryDate")
+    review_html: Optional[str] = Field(None, alias="reviewHtml")
+    plan_html: Optional[str] = Field(None, alias="planHtml")
+    created_at: Optional[datetime] = Field(None, alias="createdAt")
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class IndustryFundFlowRecord(BaseModel):
+    symbol: str
+    industry: str
+    rank: Optional[int] = None
+    industry_index: Optional[float] = Field(None, alias="industryIndex")
+    price_change_percent: Optional[float] = Field(None, alias="priceChangePercent")
+    stage_change_percent: Optional[float] = Field(None, alias="stageChangePercent")
+    inflow: Optional[float] = None
+    outflow: Optional[float] = None
+    net_amount: Optional[float] = Field(None, alias="netAmount")
+    company_count: Optional[int] = Field(None, alias="companyCount")
+    leading_stock: Optional[str] = Field(None, alias="leadingStock")
+    leading_stock_change_percent: Optional[float] = Field(None, alias="leadingStockChangePercent")
+    current_price: Optional[float] = Field(None, alias="currentPrice")
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class IndustryFundFlowListResponse(BaseModel):
+    total: int
+    items: List[IndustryFundFlowRecord]
+
+
+class ConceptFundFlowRecord(BaseModel):
+    symbol: str
+    concept: str
+    rank: Optional[int] = None
+    concept_index: Optional[float] = Field(None, alias="conceptIndex")
+    price_change_percent: Optional[float] = Field(None, alias="priceChangePercent")
+    stage_change_percent: Optional[float] = Field(None, alias="stageChangePercent")
+    inflow: Optional[float] = None
+    outflow: Optional[float] = None
+    net_amount: Optional[float] = Field(None, alias="netAmount")
+    company_count: Optional[int] = Field(None, alias="companyCount")
+    leading_stock: Optional[str] = Field(None, alias="leadingStock")
+    leading_stock_change_percent: Optional[float] = Field(None, alias="leadingStockChangePercent")
+    current_price: Optional[float] = Field(None, alias="currentPrice")
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class ConceptFundFlowListResponse(BaseModel):
+    total: int
+    items: List[ConceptFundFlowRecord]
+
+
+class ConceptSearchItem(BaseModel):
+    name: str
+    code: str
+
+
+class ConceptSearchResponse(BaseModel):
+    items: List[ConceptSearchItem]
+
+
+class ConceptWatchEntry(BaseModel):
+    concept: str
+    concept_code: str = Field(..., alias="conceptCode")
+    is_watched: bool = Field(True, alias="isWatched")
+    last_synced_at: Optional[datetime] = Field(None, alias="lastSyncedAt")
+    created_at: Optional[datetime] = Field(None, alias="createdAt")
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+    latest_trade_date: Optional[str] = Field(None, alias="latestTradeDate")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class ConceptWatchlistResponse(BaseModel):
+    items: List[ConceptWatchEntry]
+
+
+class ConceptWatchRequest(BaseModel):
+    concept: str
+
+
+class ConceptStatusResponse(BaseModel):
+    concept: str
+    concept_code: str = Field(..., alias="conceptCode")
+    is_watched: bool = Field(..., alias="isWatched")
+    last_synced_at: Optional[datetime] = Field(None, alias="lastSyncedAt")
+    latest_trade_date: Optional[str] = Field(None, alias="latestTradeDate")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class ConceptRefreshRequest(BaseModel):
+    concept: str
+    lookback_days: Optional[int] = Field(180, alias="lookbackDays", ge=1, le=1095)
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class ConceptVolumePriceRequest(BaseModel):
+    concept: str
+    lookback_days: int = Field(90, alias="lookbackDays", ge=30, le=240)
+    run_llm: bool = Field(True, alias="runLlm")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class ConceptRefreshResponse(BaseModel):
+    concept: str
+    concept_code: str = Field(..., alias="conceptCode")
+    start_date: Optional[str] = Field(None, alias="startDate")
+    end_date: Optional[str] = Field(None, alias="endDate")
+    total_rows: Optional[int] = Field(None, alias="totalRows")
+    last_synced_at: Optional[datetime] = Field(None, alias="lastSyncedAt")
+    latest_trade_date: Optional[str] = Field(None, alias="latestTradeDate")
+    is_watched: bool = Field(False, alias="isWatched")
+    errors: List[Dict[str, Any]] = Field(default_factory=list)
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class ConceptConstituentItem(BaseModel):
+    rank: Optional[int] = None
+    symbol: Optional[str] = None
+    name: Optional[str] = None
+    last_price: Optional[float] = Field(None, alias="lastPrice")
+    change_percent: Optional[float] = Field(None, alias="changePercent")
+    change_amount: Optional[float] = Field(None, alias="changeAmount")
+    speed_percent: Optional[float] = Field(None, alias="speedPercent")
+    turnover_rate: Optional[float] = Field(None, alias="turnoverRate")
+    volume_ratio: Optional[float] = Field(None, alias="volumeRatio")
+    amplitude_percent: Optional[float] = Field(None, alias="amplitudePercent")
+    turnover_amount: Optional[float] = Field(None, alias="turnoverAmount")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class ConceptConstituentResponse(BaseModel):
+    concept: str
+    concept_code: str = Field(..., alias="conceptCode")
+    total_pages: int = Field(..., alias="totalPages")
+    pages_fetched: int = Field(..., alias="pagesFetched")
+    blocked: bool
+    items: List[ConceptConstituentItem]
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+    stale: bool = False
+    refreshing: bool = False
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class IndustrySearchItem(BaseModel):
+    name: str
+    code: str
+
+
+class IndustrySearchResponse(BaseModel):
+    items: List[IndustrySearchItem]
+
+
+class IndustryWatchEntry(BaseModel):
+    industry: str
+    industry_code: str = Field(..., alias="industryCode")
+    is_watched: bool = Field(True, alias="isWatched")
+    last_synced_at: Optional[datetime] = Field(None, alias="lastSyncedAt")
+    created_at: Optional[datetime] = Field(None, alias="createdAt")
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+    latest_trade_date: Optional[str] = Field(None, alias="latestTradeDate")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class IndustryWatchlistResponse(BaseModel):
+    items: List[IndustryWatchEntry]
+
+
+class IndustryWatchRequest(BaseModel):
+    industry: str
+
+
+class IndustryStatusResponse(BaseModel):
+    industry: str
+    industry_code: str = Field(..., alias="industryCode")
+    is_watched: bool = Field(..., alias="isWatched")
+    last_synced_at: Optional[datetime] = Field(None, alias="lastSyncedAt")
+    latest_trade_date: Optional[str] = Field(None, alias="latestTradeDate")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class IndustryRefreshRequest(BaseModel):
+    industry: str
+    lookback_days: Optional[int] = Field(180, alias="lookbackDays", ge=1, le=1095)
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class IndustryRefreshResponse(BaseModel):
+    industry: str
+    industry_code: str = Field(..., alias="industryCode")
+    start_date: Optional[str] = Field(None, alias="startDate")
+    end_date: Optional[str] = Field(None, alias="endDate")
+    total_rows: Optional[int] = Field(None, alias="totalRows")
+    last_synced_at: Optional[datetime] = Field(None, alias="lastSyncedAt")
+    latest_trade_date: Optional[str] = Field(None, alias="latestTradeDate")
+    is_watched: bool = Field(False, alias="isWatched")
+    errors: List[str] = Field(default_factory=list)
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class IndustryIndexBar(BaseModel):
+    trade_date: date = Field(..., alias="tradeDate")
+    open: Optional[float] = None
+    high: Optional[float] = None
+    low: Optional[float] = None
+    close: Optional[float] = None
+    pct_chg: Optional[float] = Field(None, alias="pctChg")
+    vol: Optional[float] = None
+    amount: Optional[float] = None
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class IndustryIndexHistoryResponse(BaseModel):
+    industry: str
+    total: int
+    rows: List[IndustryIndexBar]
+
+
+class IndustryNewsListResponse(BaseModel):
+    items: List[IndustryNewsArticle] = Field(default_factory=list)
+
+
+class ConceptNewsListResponse(BaseModel):
+    items: List[IndustryNewsArticle] = Field(default_factory=list)
+
+
+class ObservationStrategyCandidate(BaseModel):
+    ts_code: str = Field(..., alias="tsCode")
+    symbol: Optional[str] = None
+    name: Optional[str] = None
+    latest_trade_date: Optional[str] = Field(None, alias="latestTradeDate")
+    close: Optional[float] = None
+    pct_change: Optional[float] = Field(None, alias="pctChange")
+    volume_ratio: Optional[float] = Field(None, alias="volumeRatio")
+    range_amplitude: Optional[float] = Field(None, alias="rangeAmplitude")
+    range_high: Optional[float] = Field(None, alias="rangeHigh")
+    range_low: Optional[float] = Field(None, alias="rangeLow")
+    breakout_level: Optional[float] = Field(None, alias="breakoutLevel")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class ObservationStrategy(BaseModel):
+    id: str
+    name: str
+    description: Optional[str] = None
+    parameters: Dict[str, object]
+    candidate_count: int = Field(..., alias="candidateCount")
+    candidates: List[ObservationStrategyCandidate]
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class ObservationPoolResponse(BaseModel):
+    generated_at: Optional[str] = Field(None, alias="generatedAt")
+    latest_trade_date: Optional[str] = Field(None, alias="latestTradeDate")
+    universe_total: int = Field(..., alias="universeTotal")
+    total_candidates: int = Field(..., alias="totalCandidates")
+    summary_notes: List[str] = Field(default_factory=list, alias="summaryNotes")
+    strategies: List[ObservationStrategy]
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class ConceptVolumePriceRecord(BaseModel):
+    id: int
+    concept: str
+    concept_code: str = Field(..., alias="conceptCode")
+    lookback_days: int = Field(..., alias="lookbackDays")
+    summary: Dict[str, Any]
+    raw_text: str = Field(..., alias="rawText")
+    model: Optional[str]
+    generated_at: datetime = Field(..., alias="generatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class ConceptVolumePriceHistoryResponse(BaseModel):
+    total: int
+    items: List[ConceptVolumePriceRecord]
+
+
+class IndustryVolumePriceRequest(BaseModel):
+    industry: str
+    lookback_days: int = Field(90, alias="lookbackDays", ge=30, le=240)
+    run_llm: bool = Field(True, alias="runLlm")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class IndustryVolumePriceRecord(BaseModel):
+    id: int
+    industry: str
+    industry_code: str = Field(..., alias="industryCode")
+    lookback_days: int = Field(..., alias="lookbackDays")
+    summary: Dict[str, Any]
+    raw_text: str = Field(..., alias="rawText")
+    model: Optional[str]
+    generated_at: datetime = Field(..., alias="generatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class IndustryVolumePriceHistoryResponse(BaseModel):
+    total: int
+    items: List[IndustryVolumePriceRecord]
+
+
+class StockVolumePriceRequest(BaseModel):
+    code: str
+    lookback_days: int = Field(90, alias="lookbackDays", ge=30, le=240)
+    run_llm: bool = Field(True, alias="runLlm")
+    force: bool = False
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class StockVolumePriceRecord(BaseModel):
+    id: int
+    code: str
+    name: Optional[str]
+    lookback_days: int = Field(..., alias="lookbackDays")
+    summary: Dict[str, Any]
+    raw_text: str = Field(..., alias="rawText")
+    model: Optional[str]
+    generated_at: datetime = Field(..., alias="generatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class StockVolumePriceHistoryResponse(BaseModel):
+    total: int
+    items: List[StockVolumePriceRecord]
+
+
+class StockIntegratedAnalysisRequest(BaseModel):
+    code: str
+    news_days: int = Field(INTEGRATED_NEWS_DAYS_DEFAULT, alias="newsDays", ge=1, le=30)
+    trade_days: int = Field(INTEGRATED_TRADE_DAYS_DEFAULT, alias="tradeDays", ge=5, le=30)
+    run_llm: bool = Field(True, alias="runLlm")
+    force: bool = False
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class StockIntegratedAnalysisRecord(BaseModel):
+    id: int
+    code: str
+    name: Optional[str]
+    news_days: int = Field(..., alias="newsDays")
+    trade_days: int = Field(..., alias="tradeDays")
+    summary: Dict[str, Any]
+    raw_text: str = Field(..., alias="rawText")
+    model: Optional[str]
+    generated_at: datetime = Field(..., alias="generatedAt")
+    context: Optional[Dict[str, Any]] = None
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class StockIntegratedAnalysisHistoryResponse(BaseModel):
+    total: int
+    items: List[StockIntegratedAnalysisRecord]
+
+
+class StockValuationAnalysisRequest(BaseModel):
+    code: str
+    run_llm: bool = Field(True, alias="runLlm")
+    force: bool = False
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class StockValuationAnalysisRecord(BaseModel):
+    id: int
+    code: str
+    name: Optional[str]
+    summary: Dict[str, Any]
+    raw_text: str = Field(..., alias="rawText")
+    model: Optional[str]
+    generated_at: datetime = Field(..., alias="generatedAt")
+    context: Optional[Dict[str, Any]] = None
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class StockValuationAnalysisHistoryResponse(BaseModel):
+    total: int
+    items: List[StockValuationAnalysisRecord]
+
+
+class StockNewsSyncRequest(BaseModel):
+    code: str
+
+
+class StockNewsSyncResponse(BaseModel):
+    fetched: int
+    inserted: int
+
+
+class StockNewsItem(BaseModel):
+    id: int
+    stock_code: str = Field(..., alias="stockCode")
+    keyword: Optional[str] = None
+    title: str
+    content: Optional[str] = None
+    source: Optional[str] = None
+    url: Optional[str] = None
+    published_at: Optional[datetime] = Field(None, alias="publishedAt")
+    created_at: Optional[datetime] = Field(None, alias="createdAt")
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class StockNewsListResponse(BaseModel):
+    total: int
+    items: List[StockNewsItem]
+
+
+class ConceptIndexBar(BaseModel):
+    trade_date: date = Field(..., alias="tradeDate")
+    open: Optional[float] = None
+    high: Optional[float] = None
+    low: Optional[float] = None
+    close: Optional[float] = None
+    pre_close: Optional[float] = Field(None, alias="preClose")
+    change: Optional[float] = None
+    pct_chg: Optional[float] = Field(None, alias="pctChg")
+    vol: Optional[float] = None
+    amount: Optional[float] = None
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class ConceptIndexHistoryResponse(BaseModel):
+    concept: str
+    total: int
+    rows: List[ConceptIndexBar]
+
+
+class FundFlowHotlistSymbol(BaseModel):
+    symbol: str
+    weight: float
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class FundFlowStageSnapshot(BaseModel):
+    symbol: str
+    weight: float
+    rank: Optional[int] = None
+    net_amount: Optional[float] = Field(None, alias="netAmount")
+    inflow: Optional[float] = None
+    outflow: Optional[float] = None
+    price_change_percent: Optional[float] = Field(None, alias="priceChangePercent")
+    stage_change_percent: Optional[float] = Field(None, alias="stageChangePercent")
+    index_value: Optional[float] = Field(None, alias="indexValue")
+    current_price: Optional[float] = Field(None, alias="currentPrice")
+    company_count: Optional[int] = Field(None, alias="companyCount")
+    leading_stock: Optional[str] = Field(None, alias="leadingStock")
+    leading_stock_change_percent: Optional[float] = Field(None, alias="leadingStockChangePercent")
+    updated_at: Optional[str] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+ConceptFundFlowBreakdown.update_forward_refs(FundFlowStageSnapshot=FundFlowStageSnapshot)
+
+
+class FundFlowHotlistEntry(BaseModel):
+    name: str
+    score: float
+    best_rank: Optional[int] = Field(None, alias="bestRank")
+    best_symbol: Optional[str] = Field(None, alias="bestSymbol")
+    total_net_amount: Optional[float] = Field(None, alias="totalNetAmount")
+    total_inflow: Optional[float] = Field(None, alias="totalInflow")
+    total_outflow: Optional[float] = Field(None, alias="totalOutflow")
+    stages: List[FundFlowStageSnapshot] = Field(default_factory=list)
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class FundFlowSectorHotlistResponse(BaseModel):
+    generated_at: Optional[str] = Field(None, alias="generatedAt")
+    symbols: List[FundFlowHotlistSymbol] = Field(default_factory=list)
+    industries: List[FundFlowHotlistEntry] = Field(default_factory=list)
+    concepts: List[FundFlowHotlistEntry] = Field(default_factory=list)
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+ConceptSnapshot.update_forward_refs(FundFlowSectorHotlistResponse=FundFlowSectorHotlistResponse)
+
+
+class IndividualFundFlowRecord(BaseModel):
+    symbol: str
+    stock_code: str = Field(..., alias="stockCode")
+    stock_name: Optional[str] = Field(None, alias="stockName")
+    rank: Optional[int] = None
+    latest_price: Optional[float] = Field(None, alias="latestPrice")
+    price_change_percent: Optional[float] = Field(None, alias="priceChangePercent")
+    stage_change_percent: Optional[float] = Field(None, alias="stageChangePercent")
+    turnover_rate: Optional[float] = Field(None, alias="turnoverRate")
+    continuous_turnover_rate: Optional[float] = Field(None, alias="continuousTurnoverRate")
+    inflow: Optional[float] = None
+    outflow: Optional[float] = None
+    net_amount: Optional[float] = Field(None, alias="netAmount")
+    net_inflow: Optional[float] = Field(None, alias="netInflow")
+    turnover_amount: Optional[float] = Field(None, alias="turnoverAmount")
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class IndividualFundFlowListResponse(BaseModel):
+    total: int
+    items: List[IndividualFundFlowRecord]
+
+
+class BigDealFundFlowRecord(BaseModel):
+    trade_time: Optional[datetime] = Field(None, alias="tradeTime")
+    stock_code: str = Field(..., alias="stockCode")
+    stock_name: Optional[str] = Field(None, alias="stockName")
+    trade_price: Optional[float] = Field(None, alias="tradePrice")
+    trade_volume: Optional[int] = Field(None, alias="tradeVolume")
+    trade_amount: Optional[float] = Field(None, alias="tradeAmount")
+    trade_side: Optional[str] = Field(None, alias="tradeSide")
+    price_change_percent: Optional[float] = Field(None, alias="priceChangePercent")
+    price_change: Optional[float] = Field(None, alias="priceChange")
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class BigDealFundFlowListResponse(BaseModel):
+    total: int
+    items: List[BigDealFundFlowRecord]
+
+
+class MarginAccountRecord(BaseModel):
+    trade_date: Optional[date] = Field(None, alias="tradeDate")
+    financing_balance: Optional[float] = Field(None, alias="financingBalance")
+    securities_lending_balance: Optional[float] = Field(None, alias="securitiesLendingBalance")
+    financing_purchase_amount: Optional[float] = Field(None, alias="financingPurchaseAmount")
+    securities_lending_sell_amount: Optional[float] = Field(None, alias="securitiesLendingSellAmount")
+    securities_company_count: Optional[float] = Field(None, alias="securitiesCompanyCount")
+    business_department_count: Optional[float] = Field(None, alias="businessDepartmentCount")
+    individual_investor_count: Optional[float] = Field(None, alias="individualInvestorCount")
+    institutional_investor_count: Optional[float] = Field(None, alias="institutionalInvestorCount")
+    participating_investor_count: Optional[float] = Field(None, alias="participatingInvestorCount")
+    liability_investor_count: Optional[float] = Field(None, alias="liabilityInvestorCount")
+    collateral_value: Optional[float] = Field(None, alias="collateralValue")
+    average_collateral_ratio: Optional[float] = Field(None, alias="averageCollateralRatio")
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class MarginAccountListResponse(BaseModel):
+    total: int
+    items: List[MarginAccountRecord]
+    last_synced_at: Optional[datetime] = Field(None, alias="lastSyncedAt")
+    available_years: List[int] = Field(default_factory=list, alias="availableYears")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class MarketActivityRecord(BaseModel):
+    metric: str
+    display_order: int = Field(..., alias="displayOrder")
+    value_text: Optional[str] = Field(None, alias="valueText")
+    value_number: Optional[float] = Field(None, alias="valueNumber")
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class MarketActivityListResponse(BaseModel):
+    items: List[MarketActivityRecord]
+    dataset_timestamp: Optional[datetime] = Field(None, alias="datasetTimestamp")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class IndicatorScreeningRecord(BaseModel):
+    indicator_code: str = Field(..., alias="indicatorCode")
+    indicator_name: Optional[str] = Field(None, alias="indicatorName")
+    captured_at: Optional[datetime] = Field(None, alias="capturedAt")
+    rank: Optional[int]
+    stock_code: Optional[str] = Field(None, alias="stockCode")
+    stock_code_full: Optional[str] = Field(None, alias="stockCodeFull")
+    stock_name: Optional[str] = Field(None, alias="stockName")
+    price_change_percent: Optional[float] = Field(None, alias="priceChangePercent")
+    stage_change_percent: Optional[float] = Field(None, alias="stageChangePercent")
+    last_price: Optional[float] = Field(None, alias="lastPrice")
+    volume_shares: Optional[float] = Field(None, alias="volumeShares")
+    volume_text: Optional[str] = Field(None, alias="volumeText")
+    baseline_volume_shares: Optional[float] = Field(None, alias="baselineVolumeShares")
+    baseline_volume_text: Optional[str] = Field(None, alias="baselineVolumeText")
+    volume_days: Optional[int] = Field(None, alias="volumeDays")
+    industry: Optional[str]
+    turnover_percent: Optional[float] = Field(None, alias="turnoverPercent")
+    turnover_rate: Optional[float] = Field(None, alias="turnoverRate")
+    turnover_amount: Optional[float] = Field(None, alias="turnoverAmount")
+    turnover_amount_text: Optional[str] = Field(None, alias="turnoverAmountText")
+    high_price: Optional[float] = Field(None, alias="highPrice")
+    low_price: Optional[float] = Field(None, alias="lowPrice")
+    big_deal_net_amount: Optional[float] = Field(None, alias="bigDealNetAmount")
+    big_deal_buy_amount: Optional[float] = Field(None, alias="bigDealBuyAmount")
+    big_deal_sell_amount: Optional[float] = Field(None, alias="bigDealSellAmount")
+    big_deal_trade_count: Optional[int] = Field(None, alias="bigDealTradeCount")
+    net_income_yoy_latest: Optional[float] = Field(None, alias="netIncomeYoyLatest")
+    pe_ratio: Optional[float] = Field(None, alias="peRatio")
+    matched_indicators: List[str] = Field(default_factory=list, alias="matchedIndicators")
+    has_big_deal_inflow: Optional[bool] = Field(None, alias="hasBigDealInflow")
+    indicator_details: Dict[str, Dict[str, Any]] = Field(default_factory=dict, alias="indicatorDetails")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class IndicatorScreeningListResponse(BaseModel):
+    indicator_code: str = Field(..., alias="indicatorCode")
+    indicator_codes: List[str] = Field(default_factory=list, alias="indicatorCodes")
+    indicator_name: Optional[str] = Field(None, alias="indicatorName")
+    captured_at: Optional[datetime] = Field(None, alias="capturedAt")
+    total: int
+    items: List[IndicatorScreeningRecord]
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class IndicatorSyncResponse(BaseModel):
+    indicator_code: str = Field(..., alias="indicatorCode")
+    indicator_name: Optional[str] = Field(None, alias="indicatorName")
+    rows: int
+    captured_at: Optional[datetime] = Field(None, alias="capturedAt")
+    skipped: bool = False
+    reason: Optional[str] = None
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class IndicatorSyncBatchResponse(BaseModel):
+    results: List[IndicatorSyncResponse]
+
+
+class IndicatorRealtimeRequest(BaseModel):
+    codes: Optional[List[str]] = Field(None, description="Optional subset of ts_codes to refresh.")
+    syncAll: bool = Field(False, description="Refresh all stocks when true.")
+
+
+class IndicatorRealtimeResponse(BaseModel):
+    processed: int
+    metricsUpdated: int
+    codes: List[str]
+    updatedAt: datetime
+
+
+class IndicatorSyncStatsResponse(BaseModel):
+    realtimeTrade: Dict[str, Optional[Any]] = Field(default_factory=dict)
+    bigDeal: Dict[str, Optional[Any]] = Field(default_factory=dict)
+    indicatorCapturedAt: Optional[datetime] = Field(None, alias="indicatorCapturedAt")
+
+
+class MarketFundFlowRecord(BaseModel):
+    trade_date: date = Field(..., alias="tradeDate")
+    shanghai_close: Optional[float] = Field(None, alias="shanghaiClose")
+    shanghai_change_percent: Optional[float] = Field(None, alias="shanghaiChangePercent")
+    shenzhen_close: Optional[float] = Field(None, alias="shenzhenClose")
+    shenzhen_change_percent: Optional[float] = Field(None, alias="shenzhenChangePercent")
+    main_net_inflow_amount: Optional[float] = Field(None, alias="mainNetInflowAmount")
+    main_net_inflow_ratio: Optional[float] = Field(None, alias="mainNetInflowRatio")
+    huge_order_net_inflow_amount: Optional[float] = Field(None, alias="hugeOrderNetInflowAmount")
+    huge_order_net_inflow_ratio: Optional[float] = Field(None, alias="hugeOrderNetInflowRatio")
+    large_order_net_inflow_amount: Optional[float] = Field(None, alias="largeOrderNetInflowAmount")
+    large_order_net_inflow_ratio: Optional[float] = Field(None, alias="largeOrderNetInflowRatio")
+    medium_order_net_inflow_amount: Optional[float] = Field(None, alias="mediumOrderNetInflowAmount")
+    medium_order_net_inflow_ratio: Optional[float] = Field(None, alias="mediumOrderNetInflowRatio")
+    small_order_net_inflow_amount: Optional[float] = Field(None, alias="smallOrderNetInflowAmount")
+    small_order_net_inflow_ratio: Optional[float] = Field(None, alias="smallOrderNetInflowRatio")
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class MarketFundFlowListResponse(BaseModel):
+    total: int
+    items: List[MarketFundFlowRecord]
+    latest_trade_date: Optional[date] = Field(None, alias="latestTradeDate")
+    last_synced_at: Optional[datetime] = Field(None, alias="lastSyncedAt")
+    available_years: List[int] = Field(default_factory=list, alias="availableYears")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class SyncFinanceBreakfastResponse(BaseModel):
+    rows: int
+    elapsed_seconds: float = Field(..., alias="elapsedSeconds")
+
+class VolumeSurgeConfigPayload(BaseModel):
+    min_volume_ratio: float = Field(3.0, alias="minVolumeRatio", ge=0.5, le=1000)
+    breakout_threshold_percent: float = Field(3.0, alias="breakoutPercent", ge=0.0, le=100.0)
+    daily_change_threshold_percent: float = Field(7.0, alias="dailyChangePercent", ge=0.0, le=200.0)
+    max_range_percent: float = Field(25.0, alias="maxRangePercent", ge=1.0, le=200.0)
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class ObservationPoolConfigPayload(BaseModel):
+    lookback_days: int = Field(60, alias="lookbackDays", ge=20, le=360)
+    min_history: int = Field(45, alias="minHistory", ge=10, le=360)
+    breakout_buffer_percent: float = Field(0.5, alias="breakoutBufferPercent", ge=0.0, le=20.0)
+    max_range_percent: float = Field(15.0, alias="maxRangePercent", ge=1.0, le=200.0)
+    volume_ratio_threshold: float = Field(2.0, alias="volumeRatioThreshold", ge=0.5, le=200.0)
+    volume_average_window: int = Field(20, alias="volumeAverageWindow", ge=5, le=120)
+    max_weekly_gain_percent: float = Field(3.0, alias="maxWeeklyGainPercent", ge=0.0, le=200.0)
+    require_big_deal_inflow: bool = Field(False, alias="requireBigDealInflow")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class RuntimeConfigPayload(BaseModel):
+    include_st: bool = Field(..., alias="includeST")
+    include_delisted: bool = Field(..., alias="includeDelisted")
+    daily_trade_window_days: int = Field(..., alias="dailyTradeWindowDays", ge=1, le=3650)
+    peripheral_aggregate_time: Optional[str] = Field(
+        None,
+        alias="peripheralAggregateTime",
+        description="Daily run time (HH:MM, 24h) for peripheral aggregate scheduler.",
+    )
+    global_flash_frequency_minutes: int = Field(
+        180,
+        alias="globalFlashFrequencyMinutes",
+        ge=10,
+        le=1440,
+        description="Interval in minutes between global flash data refresh runs.",
+    )
+    realtime_quote_poller_enabled: bool = Field(
+        False,
+        alias="realtimeQuotePollerEnabled",
+        description="Keep an in-memory realtime quote store refreshed during trading sessions.",
+    )
+    realtime_quote_interval_seconds: int = Field(
+        30,
+        alias="realtimeQuoteIntervalSeconds",
+        ge=5,
+        le=600,
+        description="Seconds between realtime quote polling passes over the listed universe.",
+    )
+    big_deal_retention_days: int = Field(
+        30,
+        alias="bigDealRetentionDays",
+        ge=1,
+        le=3650,
+        description="Days of raw big deal trades to keep; the daily per-stock rollup is kept for good.",
+    )
+    sector_index_source: str = Field(
+        "remote",
+        alias="sectorIndexSource",
+        regex=r"^(remote|cap_weighted|equal_weighted)$",
+        description="Concept/industry index history source: remote scrape or computed locally from constituents.",
+    )
+    concept_constituent_ttl_hours: int = Field(
+        24,
+        alias="conceptConstituentTtlHours",
+        ge=1,
+        le=720,
+        description="Hours before stored concept constituents are refreshed in the background.",
+    )
+    concept_alias_map: Dict[str, List[str]] = Field(
+        default_factory=dict,
+        alias="conceptAliasMap",
+        description="Mapping between concept name and whitespace-separated alias keywords.",
+    )
+    volume_surge_config: VolumeSurgeConfigPayload = Field(
+        default_factory=VolumeSurgeConfigPayload,
+        alias="volumeSurgeConfig",
+        description="Threshold controls for the volume surge breakout indicator.",
+    )
+    observation_strategy_config: ObservationPoolConfigPayload = Field(
+        default_factory=ObservationPoolConfigPayload,
+        alias="observationStrategyConfig",
+        description="Parameters for observation pool range-breakout screening.",
+    )
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class JobStatusPayload(BaseModel):
+    status: str
+    started_at: Optional[str]
+    finished_at: Optional[str]
+    progress: float
+    message: Optional[str]
+    total_rows: Optional[int]
+    last_duration: Optional[float]
+    last_market: Optional[str]
+    error: Optional[str]
+
+    class Config:
+        allow_population_by_field_name = True
+        fields = {
+            "started_at": "startedAt",
+            "finished_at": "finishedAt",
+            "total_rows": "totalRows",
+            "last_duration": "lastDuration",
+            "last_market": "lastMarket",
+        }
+
+
+class ControlStatusResponse(BaseModel):
+    jobs: Dict[str, JobStatusPayload]
+    config: RuntimeConfigPayload
@@ -1,90 +1,110 @@
-"""API client package exports."""
+"""API client package exports.
 
-from .tushare_api import (
-    DAILY_INDICATOR_FIELDS,
-    DAILY_TRADE_FIELDS,
-    DATE_COLUMNS,
-    INCOME_STATEMENT_FIELDS,
-    FINANCIAL_INDICATOR_FIELDS,
-    CASHFLOW_FIELDS,
-    BALANCE_SHEET_FIELDS,
-    STOCK_BASIC_FIELDS,
-    MACRO_M2_COLUMN_MAP,
-    LPR_COLUMN_MAP,
-    SHIBOR_COLUMN_MAP,
-    fetch_stock_basic,
-    fetch_trade_calendar,
-    fetch_macro_m2_yearly,
-    fetch_lpr_rates,
-    fetch_shibor_rates,
-    fetch_macro_pmi_yearly,
-    fetch_macro_non_man_pmi,
-    fetch_macro_cpi_monthly,
-    get_daily_indicator,
-    get_daily_trade,
-    get_income_statements,
-    get_financial_indicators,
-    get_cashflow_statements,
-    get_balance_sheets,
-    get_realtime_quotes,
-    TRADE_CALENDAR_FIELDS,
-)
-from .akshare_api import (
-    FINANCE_BREAKFAST_COLUMNS,
-    PERFORMANCE_EXPRESS_COLUMN_MAP,
-    PERFORMANCE_FORECAST_COLUMN_MAP,
-    INDUSTRY_FUND_FLOW_COLUMN_MAP,
-    CONCEPT_FUND_FLOW_COLUMN_MAP,
-    INDIVIDUAL_FUND_FLOW_COLUMN_MAP,
-    BIG_DEAL_FUND_FLOW_COLUMN_MAP,
-    MARGIN_ACCOUNT_COLUMN_MAP,
-    MARKET_FUND_FLOW_COLUMN_MAP,
-    STOCK_MAIN_BUSINESS_COLUMN_MAP,
-    STOCK_MAIN_COMPOSITION_COLUMN_MAP,
-    DOLLAR_INDEX_COLUMN_MAP,
-    RMB_MIDPOINT_COLUMN_MAP,
-    FUTURES_REALTIME_COLUMN_MAP,
-    FUTURES_TARGET_CODES,
-    MACRO_LEVERAGE_COLUMN_MAP,
-    MACRO_SOCIAL_FINANCING_COLUMN_MAP,
-    MACRO_CPI_COLUMN_MAP,
-    MACRO_PMI_COLUMN_MAP,
-    MACRO_PPI_COLUMN_MAP,
-    GLOBAL_FLASH_COLUMN_MAP,
-    PROFIT_FORECAST_BASE_COLUMN_MAP,
-    STOCK_NEWS_COLUMN_MAP,
-    fetch_market_activity_legu,
-    fetch_finance_breakfast,
-    fetch_performance_express_em,
-    fetch_performance_forecast_em,
-    fetch_profit_forecast_em,
-    fetch_industry_fund_flow,
-    fetch_concept_fund_flow,
-    fetch_individual_fund_flow,
-    fetch_big_deal_fund_flow,
-    fetch_margin_account_info,
-    fetch_market_fund_flow,
-    fetch_stock_main_business,
-    fetch_stock_main_composition,
-    fetch_stock_rank_cxfl_ths,
-    fetch_stock_rank_xstp_ths,
-    fetch_stock_rank_lxsz_ths,
-    fetch_stock_rank_ljqs_ths,
-    fetch_dollar_index_history,
-    fetch_rmb_midpoint_rates,
-    fetch_futures_realtime,
-    fetch_macro_leverage_ratios,
-    fetch_macro_social_financing,
-    fetch_macro_ppi_monthly,
-    fetch_global_flash_news,
-    fetch_stock_news,
-)
-from .sina_reports import fetch_sina_reports, fetch_sina_report_detail
-from .yahoo_finance_api import fetch_yahoo_daily_history, fetch_yahoo_daily_history_range
-from .eastmoney_news import EastmoneyNewsDetail, fetch_eastmoney_detail
-from .deepseek_api import generate_finance_analysis
-from .coze_api import run_coze_agent
-from .fed_board import fetch_fed_press_releases
+Clients resolve on first access (PEP 562): AkShare and Tushare are only imported by
+code paths that actually call them.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any, Dict, Tuple
+
+# Submodule -> names it exports.
+_SUBMODULE_EXPORTS: Dict[str, Tuple[str, ...]] = {
+    "tushare_api": (
+        "DAILY_INDICATOR_FIELDS",
+        "DAILY_TRADE_FIELDS",
+        "DATE_COLUMNS",
+        "INCOME_STATEMENT_FIELDS",
+        "FINANCIAL_INDICATOR_FIELDS",
+        "CASHFLOW_FIELDS",
+        "BALANCE_SHEET_FIELDS",
+        "STOCK_BASIC_FIELDS",
+        "MACRO_M2_COLUMN_MAP",
+        "LPR_COLUMN_MAP",
+        "SHIBOR_COLUMN_MAP",
+        "fetch_stock_basic",
+        "fetch_trade_calendar",
+        "fetch_macro_m2_yearly",
+        "fetch_lpr_rates",
+        "fetch_shibor_rates",
+        "fetch_macro_pmi_yearly",
+        "fetch_macro_non_man_pmi",
+        "fetch_macro_cpi_monthly",
+        "get_daily_indicator",
+        "get_daily_trade",
+        "get_income_statements",
+        "get_financial_indicators",
+        "get_cashflow_statements",
+        "get_balance_sheets",
+        "get_income_statements_vip",
+        "get_financial_indicators_vip",
+        "get_cashflow_statements_vip",
+        "get_balance_sheets_vip",
+        "get_realtime_quotes",
+        "TRADE_CALENDAR_FIELDS",
+    ),
+    "akshare_api": (
+        "FINANCE_BREAKFAST_COLUMNS",
+        "PERFORMANCE_EXPRESS_COLUMN_MAP",
+        "PERFORMANCE_FORECAST_COLUMN_MAP",
+        "INDUSTRY_FUND_FLOW_COLUMN_MAP",
+        "CONCEPT_FUND_FLOW_COLUMN_MAP",
+        "INDIVIDUAL_FUND_FLOW_COLUMN_MAP",
+        "BIG_DEAL_FUND_FLOW_COLUMN_MAP",
+        "MARGIN_ACCOUNT_COLUMN_MAP",
+        "MARKET_FUND_FLOW_COLUMN_MAP",
+        "STOCK_MAIN_BUSINESS_COLUMN_MAP",
+        "STOCK_MAIN_COMPOSITION_COLUMN_MAP",
+        "DOLLAR_INDEX_COLUMN_MAP",
+        "RMB_MIDPOINT_COLUMN_MAP",
+        "FUTURES_REALTIME_COLUMN_MAP",
+        "FUTURES_TARGET_CODES",
+        "MACRO_LEVERAGE_COLUMN_MAP",
+        "MACRO_SOCIAL_FINANCING_COLUMN_MAP",
+        "MACRO_CPI_COLUMN_MAP",
+        "MACRO_PMI_COLUMN_MAP",
+        "MACRO_PPI_COLUMN_MAP",
+        "GLOBAL_FLASH_COLUMN_MAP",
+        "PROFIT_FORECAST_BASE_COLUMN_MAP",
+        "STOCK_NEWS_COLUMN_MAP",
+        "fetch_market_activity_legu",
+        "fetch_finance_breakfast",
+        "fetch_performance_express_em",
+        "fetch_performance_forecast_em",
+        "fetch_profit_forecast_em",
+        "fetch_industry_fund_flow",
+        "fetch_concept_fund_flow",
+        "fetch_individual_fund_flow",
+        "fetch_big_deal_fund_flow",
+        "fetch_margin_account_info",
+        "fetch_market_fund_flow",
+        "fetch_stock_main_business",
+        "fetch_stock_main_composition",
+        "fetch_stock_rank_cxfl_ths",
+        "fetch_stock_rank_xstp_ths",
+        "fetch_stock_rank_lxsz_ths",
+        "fetch_stock_rank_ljqs_ths",
+        "fetch_dollar_index_history",
+        "fetch_rmb_midpoint_rates",
+        "fetch_futures_realtime",
+        "fetch_macro_leverage_ratios",
+        "fetch_macro_social_financing",
+        "fetch_macro_ppi_monthly",
+        "fetch_global_flash_news",
+        "fetch_stock_news",
+    ),
+    "sina_reports": ("fetch_sina_reports", "fetch_sina_report_detail"),
+    "yahoo_finance_api": ("fetch_yahoo_daily_history", "fetch_yahoo_daily_history_range"),
+    "eastmoney_news": ("EastmoneyNewsDetail", "fetch_eastmoney_detail"),
+    "deepseek_api": ("generate_finance_analysis",),
+    "coze_api": ("run_coze_agent",),
+    "fed_board": ("fetch_fed_press_releases",),
+}
+
+_EXPORTS: Dict[str, Tuple[str, str]] = {
+    name: (module, name) for module, names in _SUBMODULE_EXPORTS.items() for name in names
+}
 
 __all__ = [
     "DAILY_INDICATOR_FIELDS",
@@ -99,6 +119,10 @@ __all__ = [
     "get_daily_trade",
     "get_income_statements",
     "get_financial_indicators",
+    "get_income_statements_vip",
+    "get_financial_indicators_vip",
+    "get_cashflow_statements_vip",
+    "get_balance_sheets_vip",
     "get_realtime_quotes",
     "TRADE_CALENDAR_FIELDS",
     "PERFORMANCE_EXPRESS_COLUMN_MAP",
@@ -168,3 +192,17 @@ __all__ = [
     "fetch_sina_reports",
     "fetch_sina_report_detail",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    target = _EXPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = target
+    value = getattr(import_module(f".{module_name}", __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -7,13 +7,14 @@ This module only contains helpers responsible for fetching data from Tushare.
 from __future__ import annotations
 
 import logging
-from typing import Final, List, Optional, Sequence
+from typing import Callable, Final, List, Optional, Sequence
 
 import pandas as pd
 import tushare as ts
 
 logger = logging.getLogger(__name__)
 
+VIP_PAGE_SIZE = 3000
 
 STOCK_BASIC_FIELDS: Sequence[str] = (
     "ts_code",
@@ -652,6 +653,123 @@ def get_balance_sheets(
     return df.loc[:, list(BALANCE_SHEET_FIELDS)]
 
 
+def _fetch_vip_pages(
+    endpoint: Callable[..., Optional[pd.DataFrame]],
+    fields: Sequence[str],
+    params: dict[str, object],
+    *,
+    page_size: int,
+) -> pd.DataFrame:
+    """
+    Page through a whole-market VIP endpoint using ``offset``/``limit`` until a short page is returned.
+    """
+    page_size = max(1, int(page_size))
+    frames: List[pd.DataFrame] = []
+    offset = 0
+    while True:
+        df = endpoint(fields=",".join(fields), offset=offset, limit=page_size, **params)
+        if df is None or df.empty:
+            break
+        frames.append(df)
+        if len(df.index) < page_size:
+            break
+        offset += len(df.index)
+
+    if not frames:
+        return pd.DataFrame(columns=fields)
+
+    combined = pd.concat(frames, ignore_index=True)
+    for column in fields:
+        if column not in combined.columns:
+            combined[column] = None
+    return combined.loc[:, list(fields)]
+
+
+def _build_vip_params(
+    *,
+    period: Optional[str],
+    ann_date: Optional[str],
+    start_date: Optional[str],
+    end_date: Optional[str],
+) -> dict[str, object]:
+    if not any((period, ann_date, start_date, end_date)):
+        raise ValueError("period, ann_date or an announcement date range is required for VIP statement queries.")
+    params: dict[str, object] = {}
+    if period:
+        params["period"] = period
+    if ann_date:
+        params["ann_date"] = ann_date
+    if start_date:
+        params["start_date"] = start_date
+    if end_date:
+        params["end_date"] = end_date
+    return params
+
+
+def get_income_statements_vip(
+    pro: ts.pro_api,
+    *,
+    period: Optional[str] = None,
+    ann_date: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    page_size: int = VIP_PAGE_SIZE,
+) -> pd.DataFrame:
+    """
+    Fetch whole-market income statements by report period or announcement date via ``pro.income_vip``.
+    """
+    params = _build_vip_params(period=period, ann_date=ann_date, start_date=start_date, end_date=end_date)
+    return _fetch_vip_pages(pro.income_vip, INCOME_STATEMENT_FIELDS, params, page_size=page_size)
+
+
+def get_financial_indicators_vip(
+    pro: ts.pro_api,
+    *,
+    period: Optional[str] = None,
+    ann_date: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    page_size: int = VIP_PAGE_SIZE,
+) -> pd.DataFrame:
+    """
+    Fetch whole-market financial indicators by report period or announcement date via ``pro.fina_indicator_vip``.
+    """
+    params = _build_vip_params(period=period, ann_date=ann_date, start_date=start_date, end_date=end_date)
+    return _fetch_vip_pages(pro.fina_indicator_vip, FINANCIAL_INDICATOR_FIELDS, params, page_size=page_size)
+
+
+def get_cashflow_statements_vip(
+    pro: ts.pro_api,
+    *,
+    period: Optional[str] = None,
+    ann_date: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    page_size: int = VIP_PAGE_SIZE,
+) -> pd.DataFrame:
+    """
+    Fetch whole-market cash flow statements by report period or announcement date via ``pro.cashflow_vip``.
+    """
+    params = _build_vip_params(period=period, ann_date=ann_date, start_date=start_date, end_date=end_date)
+    return _fetch_vip_pages(pro.cashflow_vip, CASHFLOW_FIELDS, params, page_size=page_size)
+
+
+def get_balance_sheets_vip(
+    pro: ts.pro_api,
+    *,
+    period: Optional[str] = None,
+    ann_date: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    page_size: int = VIP_PAGE_SIZE,
+) -> pd.DataFrame:
+    """
+    Fetch whole-market balance sheets by report period or announcement date via ``pro.balancesheet_vip``.
+    """
+    params = _build_vip_params(period=period, ann_date=ann_date, start_date=start_date, end_date=end_date)
+    return _fetch_vip_pages(pro.balancesheet_vip, BALANCE_SHEET_FIELDS, params, page_size=page_size)
+
+
 def get_realtime_quotes(
     ts_codes: Sequence[str],
     *,
@@ -11,6 +11,7 @@ from pathlib import Path
 from typing import Any, Dict, List
 
 CONFIG_FILE = Path(__file__).resolve().parents[2] / "config" / "control_config.json"
+SECTOR_INDEX_SOURCES = ("remote", "cap_weighted", "equal_weighted")
 _LOCK = threading.Lock()
 
 
@@ -108,6 +109,11 @@ class RuntimeConfig:
     daily_trade_window_days: int = 420
     peripheral_aggregate_time: str = "06:00"
     global_flash_frequency_minutes: int = 180
+    realtime_quote_poller_enabled: bool = False
+    realtime_quote_interval_seconds: int = 30
+    big_deal_retention_days: int = 30
+    sector_index_source: str = "remote"
+    concept_constituent_ttl_hours: int = 24
     concept_alias_map: Dict[str, List[str]] = field(default_factory=dict)
     volume_surge_config: VolumeSurgeConfig = field(default_factory=VolumeSurgeConfig)
     observation_strategy_config: ObservationStrategyConfig = field(default_factory=ObservationStrategyConfig)
@@ -127,6 +133,27 @@ class RuntimeConfig:
             daily_trade_window_days=int(data.get("daily_trade_window_days", 420)),
             peripheral_aggregate_time=time_value,
             global_flash_frequency_minutes=frequency_value,
+            realtime_quote_poller_enabled=_sanitize_bool(data.get("realtime_quote_poller_enabled"), default=False),
+            realtime_quote_interval_seconds=_sanitize_int(
+                data.get("realtime_quote_interval_seconds"),
+                default=30,
+                minimum=5,
+            ),
+            big_deal_retention_days=_sanitize_int(
+                data.get("big_deal_retention_days"),
+                default=30,
+                minimum=1,
+            ),
+            sector_index_source=_sanitize_choice(
+                data.get("sector_index_source"),
+                choices=SECTOR_INDEX_SOURCES,
+                default="remote",
+            ),
+            concept_constituent_ttl_hours=_sanitize_int(
+                data.get("concept_constituent_ttl_hours"),
+                default=24,
+                minimum=1,
+            ),
             concept_alias_map=normalize_concept_alias_map(data.get("concept_alias_map")),
             volume_surge_config=VolumeSurgeConfig.from_dict(
                 data.get("volume_surge_config") or data.get("volume_surge")
@@ -143,6 +170,11 @@ class RuntimeConfig:
             "daily_trade_window_days": self.daily_trade_window_days,
             "peripheral_aggregate_time": self.peripheral_aggregate_time,
             "global_flash_frequency_minutes": self.global_flash_frequency_minutes,
+            "realtime_quote_poller_enabled": self.realtime_quote_poller_enabled,
+            "realtime_quote_interval_seconds": self.realtime_quote_interval_seconds,
+            "big_deal_retention_days": self.big_deal_retention_days,
+            "sector_index_source": self.sector_index_source,
+            "concept_constituent_ttl_hours": self.concept_constituent_ttl_hours,
             "concept_alias_map": self.concept_alias_map,
             "volume_surge_config": self.volume_surge_config.to_dict(),
             "observation_pool": self.observation_strategy_config.to_dict(),
@@ -249,6 +281,11 @@ def _sanitize_int(value: Any, *, default: int, minimum: int) -> int:
     return numeric
 
 
+def _sanitize_choice(value: Any, *, choices: tuple[str, ...], default: str) -> str:
+    text = str(value).strip().lower() if value is not None else ""
+    return text if text in choices else default
+
+
 def _sanitize_bool(value: Any, *, default: bool = False) -> bool:
     if isinstance(value, bool):
         return value
@@ -81,6 +81,7 @@ class PostgresSettings:
     industry_insight_table: str
     individual_fund_flow_table: str
     big_deal_fund_flow_table: str
+    big_deal_fund_flow_daily_table: str
     stock_integrated_analysis_table: str
     stock_valuation_analysis_table: str
     cashflow_statement_table: str
@@ -311,6 +312,9 @@ def load_settings(path: Optional[str] = None) -> AppSettings:
             big_deal_fund_flow_table=str(
                 postgres_config.get("big_deal_fund_flow_table", "big_deal_fund_flow")
             ),
+            big_deal_fund_flow_daily_table=str(
+                postgres_config.get("big_deal_fund_flow_daily_table", "big_deal_fund_flow_daily")
+            ),
             stock_integrated_analysis_table=str(
                 postgres_config.get("stock_integrated_analysis_table", "stock_integrated_analysis")
             ),
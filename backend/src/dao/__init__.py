@@ -1,74 +1,90 @@
-"""Database access objects."""
+"""Database access objects.
 
-from .base import PostgresDAOBase
-from .daily_indicator_dao import DailyIndicatorDAO
-from .daily_trade_metrics_dao import DailyTradeMetricsDAO
-from .income_statement_dao import IncomeStatementDAO
-from .financial_indicator_dao import FinancialIndicatorDAO
-from .fundamental_metrics_dao import FundamentalMetricsDAO
-from .finance_breakfast_dao import FinanceBreakfastDAO
-from .daily_trade_dao import DailyTradeDAO
-from .stock_basic_dao import StockBasicDAO
-from .favorite_stock_dao import FavoriteStockDAO
-from .performance_express_dao import PerformanceExpressDAO
-from .performance_forecast_dao import PerformanceForecastDAO
-from .industry_fund_flow_dao import IndustryFundFlowDAO
-from .concept_fund_flow_dao import ConceptFundFlowDAO
-from .concept_index_history_dao import ConceptIndexHistoryDAO
-from .concept_insight_dao import ConceptInsightDAO
-from .industry_insight_dao import IndustryInsightDAO
-from .individual_fund_flow_dao import IndividualFundFlowDAO
-from .big_deal_fund_flow_dao import BigDealFundFlowDAO
-from .stock_main_business_dao import StockMainBusinessDAO
-from .stock_main_composition_dao import StockMainCompositionDAO
-from .profit_forecast_dao import ProfitForecastDAO
-from .global_index_history_dao import GlobalIndexHistoryDAO
-from .dollar_index_dao import DollarIndexDAO
-from .rmb_midpoint_dao import RmbMidpointDAO
-from .futures_realtime_dao import FuturesRealtimeDAO
-from .fed_statement_dao import FedStatementDAO
-from .peripheral_insight_dao import PeripheralInsightDAO
-from .macro_leverage_dao import MacroLeverageDAO
-from .macro_social_financing_dao import MacroSocialFinancingDAO
-from .macro_cpi_dao import MacroCpiDAO
-from .macro_m2_dao import MacroM2DAO
-from .macro_pmi_dao import MacroPmiDAO
-from .macro_ppi_dao import MacroPpiDAO
-from .macro_lpr_dao import MacroLprDAO
-from .macro_shibor_dao import MacroShiborDAO
-from .global_flash_dao import GlobalFlashDAO
-from .trade_calendar_dao import TradeCalendarDAO
-from .news_article_dao import NewsArticleDAO
-from .news_insight_dao import NewsInsightDAO
-from .market_insight_dao import MarketInsightDAO
-from .news_sector_insight_dao import NewsSectorInsightDAO
-from .index_history_dao import IndexHistoryDAO
-from .realtime_index_dao import RealtimeIndexDAO
-from .margin_account_dao import MarginAccountDAO
-from .market_activity_dao import MarketActivityDAO
-from .market_fund_flow_dao import MarketFundFlowDAO
-from .macro_insight_dao import MacroInsightDAO
-from .concept_watchlist_dao import ConceptWatchlistDAO
-from .concept_constituent_dao import ConceptConstituentDAO
-from .concept_directory_dao import ConceptDirectoryDAO
-from .concept_volume_price_reasoning_dao import ConceptVolumePriceReasoningDAO
-from .industry_directory_dao import IndustryDirectoryDAO
-from .industry_watchlist_dao import IndustryWatchlistDAO
-from .industry_index_history_dao import IndustryIndexHistoryDAO
-from .industry_volume_price_reasoning_dao import IndustryVolumePriceReasoningDAO
-from .stock_volume_price_reasoning_dao import StockVolumePriceReasoningDAO
-from .stock_news_dao import StockNewsDAO
-from .stock_integrated_analysis_dao import StockIntegratedAnalysisDAO
-from .stock_valuation_analysis_dao import StockValuationAnalysisDAO
-from .cashflow_statement_dao import CashflowStatementDAO
-from .balance_sheet_dao import BalanceSheetDAO
-from .research_report_dao import ResearchReportDAO
-from .research_report_summary_dao import ResearchReportSummaryDAO
-from .stock_note_dao import StockNoteDAO
-from .intraday_volume_profile_daily_dao import IntradayVolumeProfileDailyDAO
-from .intraday_volume_profile_avg_dao import IntradayVolumeProfileAverageDAO
-from .indicator_screening_dao import IndicatorScreeningDAO
-from .investment_journal_dao import InvestmentJournalDAO
+DAO classes resolve on first access (PEP 562) so callers only import the modules they use.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any, Dict, Tuple
+
+# Submodule -> names it exports.
+_SUBMODULE_EXPORTS: Dict[str, Tuple[str, ...]] = {
+    "base": ("PostgresDAOBase",),
+    "daily_indicator_dao": ("DailyIndicatorDAO",),
+    "daily_trade_metrics_dao": ("DailyTradeMetricsDAO",),
+    "income_statement_dao": ("IncomeStatementDAO",),
+    "financial_indicator_dao": ("FinancialIndicatorDAO",),
+    "fundamental_metrics_dao": ("FundamentalMetricsDAO",),
+    "finance_breakfast_dao": ("FinanceBreakfastDAO",),
+    "daily_trade_dao": ("DailyTradeDAO",),
+    "stock_basic_dao": ("StockBasicDAO",),
+    "favorite_stock_dao": ("FavoriteStockDAO",),
+    "performance_express_dao": ("PerformanceExpressDAO",),
+    "performance_forecast_dao": ("PerformanceForecastDAO",),
+    "industry_fund_flow_dao": ("IndustryFundFlowDAO",),
+    "concept_fund_flow_dao": ("ConceptFundFlowDAO",),
+    "concept_index_history_dao": ("ConceptIndexHistoryDAO",),
+    "concept_insight_dao": ("ConceptInsightDAO",),
+    "industry_insight_dao": ("IndustryInsightDAO",),
+    "individual_fund_flow_dao": ("IndividualFundFlowDAO",),
+    "big_deal_fund_flow_dao": ("BigDealFundFlowDAO",),
+    "stock_main_business_dao": ("StockMainBusinessDAO",),
+    "stock_main_composition_dao": ("StockMainCompositionDAO",),
+    "profit_forecast_dao": ("ProfitForecastDAO",),
+    "global_index_history_dao": ("GlobalIndexHistoryDAO",),
+    "dollar_index_dao": ("DollarIndexDAO",),
+    "rmb_midpoint_dao": ("RmbMidpointDAO",),
+    "futures_realtime_dao": ("FuturesRealtimeDAO",),
+    "fed_statement_dao": ("FedStatementDAO",),
+    "peripheral_insight_dao": ("PeripheralInsightDAO",),
+    "macro_leverage_dao": ("MacroLeverageDAO",),
+    "macro_social_financing_dao": ("MacroSocialFinancingDAO",),
+    "macro_cpi_dao": ("MacroCpiDAO",),
+    "macro_m2_dao": ("MacroM2DAO",),
+    "macro_pmi_dao": ("MacroPmiDAO",),
+    "macro_ppi_dao": ("MacroPpiDAO",),
+    "macro_lpr_dao": ("MacroLprDAO",),
+    "macro_shibor_dao": ("MacroShiborDAO",),
+    "global_flash_dao": ("GlobalFlashDAO",),
+    "trade_calendar_dao": ("TradeCalendarDAO",),
+    "news_article_dao": ("NewsArticleDAO",),
+    "news_insight_dao": ("NewsInsightDAO",),
+    "market_insight_dao": ("MarketInsightDAO",),
+    "news_sector_insight_dao": ("NewsSectorInsightDAO",),
+    "index_history_dao": ("IndexHistoryDAO",),
+    "realtime_index_dao": ("RealtimeIndexDAO",),
+    "margin_account_dao": ("MarginAccountDAO",),
+    "market_activity_dao": ("MarketActivityDAO",),
+    "market_fund_flow_dao": ("MarketFundFlowDAO",),
+    "macro_insight_dao": ("MacroInsightDAO",),
+    "concept_watchlist_dao": ("ConceptWatchlistDAO",),
+    "concept_constituent_dao": ("ConceptConstituentDAO",),
+    "concept_directory_dao": ("ConceptDirectoryDAO",),
+    "concept_volume_price_reasoning_dao": ("ConceptVolumePriceReasoningDAO",),
+    "industry_directory_dao": ("IndustryDirectoryDAO",),
+    "industry_watchlist_dao": ("IndustryWatchlistDAO",),
+    "industry_index_history_dao": ("IndustryIndexHistoryDAO",),
+    "industry_volume_price_reasoning_dao": ("IndustryVolumePriceReasoningDAO",),
+    "stock_volume_price_reasoning_dao": ("StockVolumePriceReasoningDAO",),
+    "stock_news_dao": ("StockNewsDAO",),
+    "stock_integrated_analysis_dao": ("StockIntegratedAnalysisDAO",),
+    "stock_valuation_analysis_dao": ("StockValuationAnalysisDAO",),
+    "cashflow_statement_dao": ("CashflowStatementDAO",),
+    "balance_sheet_dao": ("BalanceSheetDAO",),
+    "research_report_dao": ("ResearchReportDAO",),
+    "research_report_summary_dao": ("ResearchReportSummaryDAO",),
+    "stock_note_dao": ("StockNoteDAO",),
+    "intraday_volume_profile_daily_dao": ("IntradayVolumeProfileDailyDAO",),
+    "intraday_volume_profile_avg_dao": ("IntradayVolumeProfileAverageDAO",),
+    "indicator_screening_dao": ("IndicatorScreeningDAO",),
+    "investment_journal_dao": ("InvestmentJournalDAO",),
+    "job_queue_dao": ("JobQueueDAO",),
+}
+
+_EXPORTS: Dict[str, Tuple[str, str]] = {
+    name: (module, name) for module, names in _SUBMODULE_EXPORTS.items() for name in names
+}
 
 __all__ = [
     "DailyIndicatorDAO",
@@ -140,4 +156,19 @@ __all__ = [
     "IntradayVolumeProfileAverageDAO",
     "IndicatorScreeningDAO",
     "InvestmentJournalDAO",
+    "JobQueueDAO",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    target = _EXPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = target
+    value = getattr(import_module(f".{module_name}", __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
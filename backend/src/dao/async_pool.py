@@ -0,0 +1,165 @@
+"""
+asyncpg connection pools for the async read path.
+
+Hot read endpoints await their queries instead of parking a threadpool worker on a
+psycopg2 socket. DAOs keep composing queries with ``psycopg2.sql``; ``render_query``
+turns those composables into asyncpg SQL (quoted identifiers, ``$n`` placeholders), so
+the sync and async paths share one query builder. When asyncpg is not installed the
+async helpers fall back to running the sync DAO call in a worker thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import threading
+from typing import Any, Dict, List, Sequence, Tuple
+
+from psycopg2 import sql
+
+from ..config.settings import PostgresSettings
+
+try:  # Optional dependency: only the async read path needs it.
+    import asyncpg
+except ImportError:  # pragma: no cover - depends on the environment
+    asyncpg = None
+
+ASYNC_POOL_MIN_SIZE = 2
+ASYNC_POOL_MAX_SIZE = 20
+ASYNC_POOL_COMMAND_TIMEOUT_SECONDS = 30.0
+
+_PLACEHOLDER_PATTERN = re.compile(r"%%|%s")
+
+_pools: Dict[Tuple[Any, ...], "asyncpg.Pool"] = {}
+_pool_locks: Dict[Tuple[Any, ...], asyncio.Lock] = {}
+_registry_lock = threading.Lock()
+
+
+def async_driver_available() -> bool:
+    """Return whether asyncpg is installed."""
+    return asyncpg is not None
+
+
+def _quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _render(composable: sql.Composable) -> str:
+    if isinstance(composable, sql.Composed):
+        return "".join(_render(part) for part in composable.seq)
+    if isinstance(composable, sql.SQL):
+        return composable.string
+    if isinstance(composable, sql.Identifier):
+        return ".".join(_quote_identifier(part) for part in composable.strings)
+    if isinstance(composable, sql.Placeholder):
+        if composable.name:
+            raise ValueError("Named placeholders are not supported on the async path")
+        return "%s"
+    raise TypeError(f"Unsupported SQL composable for the async path: {type(composable).__name__}")
+
+
+def render_query(query: sql.Composable | str) -> str:
+    """Render a psycopg2 query into asyncpg syntax (``%s`` -> ``$1``, ``%%`` -> ``%``)."""
+    text = query if isinstance(query, str) else _render(query)
+    counter = 0
+
+    def _replace(match: re.Match[str]) -> str:
+        nonlocal counter
+        if match.group(0) == "%%":
+            return "%"
+        counter += 1
+        return f"${counter}"
+
+    return _PLACEHOLDER_PATTERN.sub(_replace, text)
+
+
+def _pool_key(config: PostgresSettings) -> Tuple[Any, ...]:
+    # asyncpg pools are bound to the event loop that created them.
+    return (
+        id(asyncio.get_running_loop()),
+        config.host,
+        config.port,
+        config.database,
+        config.user,
+    )
+
+
+async def _create_pool(config: PostgresSettings) -> "asyncpg.Pool":
+    server_settings = {"application_name": config.application_name}
+    if config.statement_timeout_ms is not None:
+        server_settings["statement_timeout"] = str(int(config.statement_timeout_ms))
+    if config.idle_in_transaction_session_timeout_ms is not None:
+        server_settings["idle_in_transaction_session_timeout"] = str(
+            int(config.idle_in_transaction_session_timeout_ms)
+        )
+    return await asyncpg.create_pool(
+        host=config.host,
+        port=config.port,
+        database=config.database,
+        user=config.user,
+        password=config.password,
+        min_size=ASYNC_POOL_MIN_SIZE,
+        max_size=ASYNC_POOL_MAX_SIZE,
+        timeout=config.connect_timeout,
+        command_timeout=ASYNC_POOL_COMMAND_TIMEOUT_SECONDS,
+        server_settings=server_settings,
+    )
+
+
+async def get_async_pool(config: PostgresSettings) -> "asyncpg.Pool":
+    """Return the shared pool for ``config`` on the running event loop, creating it once."""
+    if asyncpg is None:
+        raise RuntimeError("asyncpg is not installed; the async read path is unavailable.")
+    key = _pool_key(config)
+    pool = _pools.get(key)
+    if pool is not None:
+        return pool
+    with _registry_lock:
+        lock = _pool_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = await _create_pool(config)
+            _pools[key] = pool
+    return pool
+
+
+async def fetch_rows(
+    config: PostgresSettings,
+    query: sql.Composable | str,
+    params: Sequence[Any] = (),
+) -> List[Any]:
+    """Run a read query on the shared pool and return its records (tuple-like rows)."""
+    pool = await get_async_pool(config)
+    return await pool.fetch(render_query(query), *params)
+
+
+async def fetch_snapshot(
+    config: PostgresSettings,
+    queries: Sequence[Tuple[sql.Composable | str, Sequence[Any]]],
+) -> List[List[Any]]:
+    """Run ``queries`` in order on one connection inside a read-only REPEATABLE READ
+    transaction, so a COUNT and the page it describes see the same snapshot."""
+    pool = await get_async_pool(config)
+    async with pool.acquire() as conn:
+        async with conn.transaction(isolation="repeatable_read", readonly=True):
+            return [await conn.fetch(render_query(query), *params) for query, params in queries]
+
+
+async def close_async_pools() -> None:
+    """Close every pool created on the running event loop."""
+    loop_id = id(asyncio.get_running_loop())
+    for key in [key for key in _pools if key[0] == loop_id]:
+        pool = _pools.pop(key)
+        _pool_locks.pop(key, None)
+        await pool.close()
+
+
+__all__ = [
+    "async_driver_available",
+    "close_async_pools",
+    "fetch_rows",
+    "fetch_snapshot",
+    "get_async_pool",
+    "render_query",
+]
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 from typing import Any, Dict, Optional, Sequence
 
@@ -208,6 +208,20 @@ class BalanceSheetDAO(PostgresDAOBase):
         items = [dict(zip(columns, row)) for row in rows]
         return {"total": int(total), "items": items}
 
+    def latest_ann_date(self) -> Optional[date]:
+        """Return the most recent announcement date stored across all securities."""
+        with self.connect() as conn:
+            self.ensure_table(conn)
+            with conn.cursor() as cur:
+                cur.execute(
+                    sql.SQL("SELECT MAX(ann_date) FROM {schema}.{table}").format(
+                        schema=sql.Identifier(self.config.schema),
+                        table=sql.Identifier(self._table_name),
+                    )
+                )
+                latest = cur.fetchone()[0]
+        return latest
+
     def stats(self) -> Dict[str, Any]:
         query = sql.SQL(
             """
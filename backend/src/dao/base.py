@@ -4,6 +4,7 @@ Shared PostgreSQL DAO utilities for the Trend View backend.
 
 from __future__ import annotations
 
+import asyncio
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
@@ -18,6 +19,7 @@ from psycopg2 import sql, errors
 from psycopg2.extras import execute_values
 
 from ..config.settings import PostgresSettings
+from .async_pool import async_driver_available, fetch_rows, fetch_snapshot
 
 DEFAULT_CONNECT_TIMEOUT = 3
 DEFAULT_APPLICATION_NAME = "trend_view_backend"
@@ -25,6 +27,8 @@ _ADD_COLUMN_PATTERN = re.compile(
     r"ADD\s+COLUMN\s+IF\s+NOT\s+EXISTS\s+\"?([A-Za-z0-9_]+)\"?",
     re.IGNORECASE,
 )
+# (DAO class, schema, table) whose ensure_table already ran for the async read path.
+_ASYNC_READY_TABLES: set[tuple[str, str, Optional[str]]] = set()
 
 
 @dataclass(frozen=True)
@@ -85,6 +89,55 @@ class PostgresDAOBase:
             if not conn.closed:
                 conn.close()
 
+    def _fetch_all(self, query: sql.Composable | str, params: Sequence[object] = ()) -> list:
+        """Run a read query after ``ensure_table`` and return every row."""
+        with self.connect() as conn:
+            self.ensure_table(conn)
+            with conn.cursor() as cur:
+                cur.execute(query, params)
+                return cur.fetchall()
+
+    def _fetch_snapshot(self, queries: Sequence[tuple[sql.Composable | str, Sequence[object]]]) -> list[list]:
+        """Run read queries in order within one REPEATABLE READ transaction and return their rows."""
+        with self.connect() as conn:
+            self.ensure_table(conn)
+            conn.commit()
+            with conn.cursor() as cur:
+                cur.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ READ ONLY")
+                results = []
+                for query, params in queries:
+                    cur.execute(query, params)
+                    results.append(cur.fetchall())
+                return results
+
+    async def _ensure_table_async(self) -> None:
+        key = (type(self).__name__, self.config.schema, getattr(self, "_table_name", None))
+        if key in _ASYNC_READY_TABLES:
+            return
+
+        def _ensure() -> None:
+            with self.connect() as conn:
+                self.ensure_table(conn)
+
+        await asyncio.to_thread(_ensure)
+        _ASYNC_READY_TABLES.add(key)
+
+    async def _fetch_all_async(self, query: sql.Composable | str, params: Sequence[object] = ()) -> list:
+        """Async ``_fetch_all`` on the shared asyncpg pool (worker thread without asyncpg)."""
+        if not async_driver_available():
+            return await asyncio.to_thread(self._fetch_all, query, params)
+        await self._ensure_table_async()
+        return await fetch_rows(self.config, query, params)
+
+    async def _fetch_snapshot_async(
+        self, queries: Sequence[tuple[sql.Composable | str, Sequence[object]]]
+    ) -> list[list]:
+        """Async ``_fetch_snapshot``: one pooled connection, so the queries share a snapshot."""
+        if not async_driver_available():
+            return await asyncio.to_thread(self._fetch_snapshot, queries)
+        await self._ensure_table_async()
+        return await fetch_snapshot(self.config, queries)
+
     @staticmethod
     def _normalize_dataframe(
         dataframe: pd.DataFrame,
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime, date, time, timedelta
 from pathlib import Path
-from typing import List, Optional, Sequence
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
 
 import math
 import pandas as pd
@@ -17,6 +17,11 @@ from .base import PostgresDAOBase
 
 
 SCHEMA_SQL_PATH = Path(__file__).resolve().parents[2] / "config" / "big_deal_fund_flow_schema.sql"
+DAILY_SCHEMA_SQL_PATH = Path(__file__).resolve().parents[2] / "config" / "big_deal_fund_flow_daily_schema.sql"
+
+DEFAULT_RETENTION_DAYS = 30
+BUY_SIDE_PATTERN = "%买%"
+SELL_SIDE_PATTERN = "%卖%"
 
 BIG_DEAL_FUND_FLOW_FIELDS: Sequence[str] = (
     "trade_time",
@@ -30,26 +35,140 @@ BIG_DEAL_FUND_FLOW_FIELDS: Sequence[str] = (
     "price_change",
 )
 
+BIG_DEAL_DAILY_FIELDS: Sequence[str] = (
+    "stock_code",
+    "stock_name",
+    "buy_amount",
+    "sell_amount",
+    "trade_count",
+    "last_trade_time",
+    "net_amount",
+)
+
+
+def partition_name(table_name: str, day: date) -> str:
+    """Name of the daily partition of ``table_name`` holding trades from ``day``."""
+    return f"{table_name}_p{day:%Y%m%d}"
+
+
+def partition_day(table_name: str, name: str) -> Optional[date]:
+    """Inverse of :func:`partition_name`; ``None`` for the default or foreign partitions."""
+    prefix = f"{table_name}_p"
+    if not name.startswith(prefix):
+        return None
+    try:
+        return datetime.strptime(name[len(prefix):], "%Y%m%d").date()
+    except ValueError:
+        return None
+
+
+def retention_cutoff(retention_days: int, today: Optional[date] = None) -> date:
+    """First trade date kept when only the latest ``retention_days`` days are retained."""
+    return (today or date.today()) - timedelta(days=max(1, int(retention_days)) - 1)
+
 
 class BigDealFundFlowDAO(PostgresDAOBase):
-    """Persistence helper for big deal fund flow data."""
+    """Persistence helper for big deal fund flow data.
+
+    Raw trades live in ``big_deal_fund_flow``, range-partitioned by ``trade_time`` with
+    one partition per trade date so retention is a ``DROP TABLE`` per expired day. The
+    ``big_deal_fund_flow_daily`` rollup keeps per-stock buy/sell totals for each date;
+    it is refreshed for the touched stocks on every upsert and serves all aggregate reads.
+    """
 
     _conflict_keys: Sequence[str] = ("trade_time", "stock_code", "trade_side", "trade_volume", "trade_amount")
 
     def __init__(self, config: PostgresSettings, table_name: str | None = None) -> None:
         super().__init__(config=config)
         self._table_name = table_name or getattr(config, "big_deal_fund_flow_table", "big_deal_fund_flow")
+        self._daily_table_name = getattr(config, "big_deal_fund_flow_daily_table", f"{self._table_name}_daily")
         self._schema_sql_template = SCHEMA_SQL_PATH.read_text(encoding="utf-8")
+        self._daily_schema_sql_template = DAILY_SCHEMA_SQL_PATH.read_text(encoding="utf-8")
+        self._table_ready = False
+        self._known_partitions: set[date] = set()
 
     def ensure_table(self, conn: PGConnection) -> None:
+        if self._table_ready:
+            return
         self._execute_schema_template(
             conn,
             self._schema_sql_template,
             schema=self.config.schema,
             table=self._table_name,
         )
+        self._execute_schema_template(
+            conn,
+            self._daily_schema_sql_template,
+            schema=self.config.schema,
+            table=self._daily_table_name,
+            net_amount_idx=f"{self._daily_table_name}_net_amount_idx",
+        )
+        if self._is_partitioned(conn):
+            with conn.cursor() as cur:
+                cur.execute(
+                    sql.SQL(
+                        "CREATE TABLE IF NOT EXISTS {schema}.{partition} PARTITION OF {schema}.{table} DEFAULT"
+                    ).format(
+                        schema=sql.Identifier(self.config.schema),
+                        partition=sql.Identifier(f"{self._table_name}_default"),
+                        table=sql.Identifier(self._table_name),
+                    )
+                )
+            today = date.today()
+            self._ensure_day_partitions(conn, (today, today + timedelta(days=1)))
+        self._table_ready = True
+
+    def _is_partitioned(self, conn: PGConnection) -> bool:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT c.relkind
+                FROM pg_class AS c
+                JOIN pg_namespace AS n ON n.oid = c.relnamespace
+                WHERE n.nspname = %s AND c.relname = %s
+                """,
+                (self.config.schema, self._table_name),
+            )
+            row = cur.fetchone()
+        return bool(row) and row[0] == "p"
+
+    def _ensure_day_partitions(self, conn: PGConnection, days: Iterable[date], *, parent: Optional[str] = None) -> None:
+        parent_table = parent or self._table_name
+        pending = sorted(set(days) - self._known_partitions) if parent is None else sorted(set(days))
+        with conn.cursor() as cur:
+            for day in pending:
+                start = datetime.combine(day, time.min)
+                cur.execute(
+                    sql.SQL(
+                        "CREATE TABLE IF NOT EXISTS {schema}.{partition} "
+                        "PARTITION OF {schema}.{table} FOR VALUES FROM (%s) TO (%s)"
+                    ).format(
+                        schema=sql.Identifier(self.config.schema),
+                        partition=sql.Identifier(partition_name(self._table_name, day)),
+                        table=sql.Identifier(parent_table),
+                    ),
+                    (start, start + timedelta(days=1)),
+                )
+        if parent is None:
+            self._known_partitions.update(pending)
+
+    def _list_partitions(self, conn: PGConnection) -> List[str]:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT child.relname
+                FROM pg_inherits AS i
+                JOIN pg_class AS child ON child.oid = i.inhrelid
+                JOIN pg_class AS parent ON parent.oid = i.inhparent
+                JOIN pg_namespace AS n ON n.oid = parent.relnamespace
+                WHERE n.nspname = %s AND parent.relname = %s
+                """,
+                (self.config.schema, self._table_name),
+            )
+            return [row[0] for row in cur.fetchall()]
 
     def upsert(self, dataframe: pd.DataFrame, *, conn: Optional[PGConnection] = None) -> int:
+        """Upsert raw trades and refresh the daily rollup of every touched stock and date."""
         if dataframe.empty:
             return 0
 
@@ -59,11 +178,21 @@ class BigDealFundFlowDAO(PostgresDAOBase):
 
         if conn is None:
             with self.connect() as owned_conn:
-                self.ensure_table(owned_conn)
-                return self._upsert_rows(owned_conn, normalized)
+                return self._upsert_with_rollup(owned_conn, normalized)
+        return self._upsert_with_rollup(conn, normalized)
 
+    def _upsert_with_rollup(self, conn: PGConnection, dataframe: pd.DataFrame) -> int:
         self.ensure_table(conn)
-        return self._upsert_rows(conn, normalized)
+        trade_days = pd.to_datetime(dataframe["trade_time"]).dt.date
+        if self._is_partitioned(conn):
+            self._ensure_day_partitions(conn, trade_days.unique())
+        affected = self._upsert_rows(conn, dataframe)
+        touched: Dict[date, List[str]] = {
+            day: sorted(codes.unique())
+            for day, codes in dataframe["stock_code"].groupby(trade_days.to_numpy())
+        }
+        self.refresh_rollup(conn, touched)
+        return affected
 
     def _upsert_rows(self, conn: PGConnection, dataframe: pd.DataFrame) -> int:
         if dataframe.empty:
@@ -103,6 +232,221 @@ class BigDealFundFlowDAO(PostgresDAOBase):
 
         return len(values)
 
+    def refresh_rollup(self, conn: PGConnection, touched: Mapping[date, Sequence[str]]) -> int:
+        """Recompute rollup rows for ``{trade_date: stock_codes}`` from the raw trades.
+
+        Totals are rebuilt from the stored trades rather than incremented, so feeds that
+        resend the same deals never double count. Returns the number of rollup rows written.
+        """
+        statement = sql.SQL(
+            """
+            INSERT INTO {schema}.{daily} (
+                trade_date, stock_code, stock_name, buy_amount, sell_amount,
+                net_amount, trade_count, last_trade_time, updated_at
+            )
+            SELECT %s::date,
+                   stock_code,
+                   MAX(stock_name),
+                   COALESCE(SUM(CASE WHEN trade_side LIKE %s THEN trade_amount ELSE 0 END), 0),
+                   COALESCE(SUM(CASE WHEN trade_side LIKE %s THEN trade_amount ELSE 0 END), 0),
+                   COALESCE(SUM(CASE WHEN trade_side LIKE %s THEN trade_amount ELSE 0 END), 0)
+                   - COALESCE(SUM(CASE WHEN trade_side LIKE %s THEN trade_amount ELSE 0 END), 0),
+                   COUNT(*),
+                   MAX(trade_time),
+                   CURRENT_TIMESTAMP
+            FROM {schema}.{table}
+            WHERE trade_time >= %s AND trade_time < %s AND stock_code = ANY(%s)
+            GROUP BY stock_code
+            ON CONFLICT (trade_date, stock_code) DO UPDATE SET
+                stock_name = EXCLUDED.stock_name,
+                buy_amount = EXCLUDED.buy_amount,
+                sell_amount = EXCLUDED.sell_amount,
+                net_amount = EXCLUDED.net_amount,
+                trade_count = EXCLUDED.trade_count,
+                last_trade_time = EXCLUDED.last_trade_time,
+                updated_at = CURRENT_TIMESTAMP
+            """
+        ).format(
+            schema=sql.Identifier(self.config.schema),
+            daily=sql.Identifier(self._daily_table_name),
+            table=sql.Identifier(self._table_name),
+        )
+        written = 0
+        with conn.cursor() as cur:
+            for day, codes in sorted(touched.items()):
+                if not codes:
+                    continue
+                start = datetime.combine(day, time.min)
+                cur.execute(
+                    statement,
+                    (
+                        day,
+                        BUY_SIDE_PATTERN,
+                        SELL_SIDE_PATTERN,
+                        BUY_SIDE_PATTERN,
+                        SELL_SIDE_PATTERN,
+                        start,
+                        start + timedelta(days=1),
+                        list(codes),
+                    ),
+                )
+                written += cur.rowcount or 0
+        return written
+
+    def _stored_trade_days(
+        self,
+        conn: PGConnection,
+        *,
+        since: Optional[date] = None,
+        until: Optional[date] = None,
+    ) -> Dict[date, List[str]]:
+        """Return ``{trade_date: stock_codes}`` of the raw trades stored in ``[since, until)``."""
+        with conn.cursor() as cur:
+            cur.execute(
+                sql.SQL(
+                    "SELECT trade_time::date, ARRAY_AGG(DISTINCT stock_code) FROM {schema}.{table} "
+                    "WHERE trade_time >= %s AND trade_time < %s GROUP BY 1"
+                ).format(
+                    schema=sql.Identifier(self.config.schema),
+                    table=sql.Identifier(self._table_name),
+                ),
+                (
+                    datetime.combine(since or date.min, time.min),
+                    datetime.combine(until, time.min) if until else datetime.max,
+                ),
+            )
+            return {day: codes for day, codes in cur.fetchall()}
+
+    def rebuild_rollup(self, *, since: Optional[date] = None) -> int:
+        """Recompute the rollup for every stored trade date (from ``since`` when given)."""
+        with self.connect() as conn:
+            self.ensure_table(conn)
+            return self.refresh_rollup(conn, self._stored_trade_days(conn, since=since))
+
+    def purge_expired(
+        self,
+        retention_days: int = DEFAULT_RETENTION_DAYS,
+        *,
+        conn: Optional[PGConnection] = None,
+    ) -> dict[str, int]:
+        """
+        Drop raw trades older than the retention window; the daily rollup is kept.
+
+        The expiring days are rolled up first, in the same transaction, so trades that
+        never went through :meth:`upsert` (e.g. copied in by :meth:`partition_by_day`)
+        are not lost. Expired daily partitions are then dropped whole. Leftovers in the
+        default partition (or every row of a table that has not been partitioned yet)
+        are deleted.
+        """
+        if conn is None:
+            with self.connect() as owned_conn:
+                return self.purge_expired(retention_days, conn=owned_conn)
+
+        self.ensure_table(conn)
+        cutoff = retention_cutoff(retention_days)
+        rolled_up = self.refresh_rollup(conn, self._stored_trade_days(conn, until=cutoff))
+        dropped = 0
+        if self._is_partitioned(conn):
+            for name in self._list_partitions(conn):
+                day = partition_day(self._table_name, name)
+                if day is None or day >= cutoff:
+                    continue
+                with conn.cursor() as cur:
+                    cur.execute(
+                        sql.SQL("DROP TABLE {schema}.{partition}").format(
+                            schema=sql.Identifier(self.config.schema),
+                            partition=sql.Identifier(name),
+                        )
+                    )
+                self._known_partitions.discard(day)
+                dropped += 1
+        with conn.cursor() as cur:
+            cur.execute(
+                sql.SQL("DELETE FROM {schema}.{table} WHERE trade_time < %s").format(
+                    schema=sql.Identifier(self.config.schema),
+                    table=sql.Identifier(self._table_name),
+                ),
+                (datetime.combine(cutoff, time.min),),
+            )
+            deleted = cur.rowcount or 0
+        return {"droppedPartitions": dropped, "deletedRows": deleted, "rolledUp": rolled_up}
+
+    def partition_by_day(self) -> int:
+        """
+        Rebuild a legacy unpartitioned table as ``PARTITION BY RANGE (trade_time)``.
+
+        One partition is created per stored trade date, rows are copied and the old table
+        is dropped in the same transaction. Returns the number of rows copied, or 0 when
+        the table is already partitioned.
+        """
+        schema = sql.Identifier(self.config.schema)
+        table = sql.Identifier(self._table_name)
+        staging_name = f"{self._table_name}_partitioned"
+        staging = sql.Identifier(staging_name)
+
+        with self.connect() as conn:
+            self.ensure_table(conn)
+            if self._is_partitioned(conn):
+                return 0
+            with conn.cursor() as cur:
+                cur.execute(
+                    sql.SQL("SELECT DISTINCT trade_time::date FROM {schema}.{table}").format(
+                        schema=schema,
+                        table=table,
+                    )
+                )
+                days = [row[0] for row in cur.fetchall()]
+                cur.execute(
+                    sql.SQL(
+                        "CREATE TABLE {schema}.{staging} "
+                        "(LIKE {schema}.{table} INCLUDING DEFAULTS) PARTITION BY RANGE (trade_time)"
+                    ).format(schema=schema, staging=staging, table=table)
+                )
+                cur.execute(
+                    sql.SQL("ALTER TABLE {schema}.{staging} ADD PRIMARY KEY ({keys})").format(
+                        schema=schema,
+                        staging=staging,
+                        keys=sql.SQL(", ").join(sql.Identifier(key) for key in self._conflict_keys),
+                    )
+                )
+                cur.execute(
+                    sql.SQL("CREATE TABLE {schema}.{partition} PARTITION OF {schema}.{staging} DEFAULT").format(
+                        schema=schema,
+                        partition=sql.Identifier(f"{self._table_name}_default"),
+                        staging=staging,
+                    )
+                )
+            today = date.today()
+            self._ensure_day_partitions(conn, [*days, today, today + timedelta(days=1)], parent=staging_name)
+
+            with conn.cursor() as cur:
+                cur.execute(
+                    sql.SQL("INSERT INTO {schema}.{staging} SELECT * FROM {schema}.{table}").format(
+                        schema=schema,
+                        staging=staging,
+                        table=table,
+                    )
+                )
+                copied = cur.rowcount or 0
+                cur.execute(sql.SQL("DROP TABLE {schema}.{table}").format(schema=schema, table=table))
+                cur.execute(
+                    sql.SQL("ALTER TABLE {schema}.{staging} RENAME TO {table}").format(
+                        schema=schema,
+                        staging=staging,
+                        table=table,
+                    )
+                )
+                cur.execute(
+                    sql.SQL("ALTER TABLE {schema}.{table} RENAME CONSTRAINT {old_pkey} TO {new_pkey}").format(
+                        schema=schema,
+                        table=table,
+                        old_pkey=sql.Identifier(f"{staging_name}_pkey"),
+                        new_pkey=sql.Identifier(f"{self._table_name}_pkey"),
+                    )
+                )
+        self._known_partitions.clear()
+        return copied
+
     def stats(self) -> dict[str, Optional[datetime]]:
         with self.connect() as conn:
             self.ensure_table(conn)
@@ -231,85 +575,39 @@ class BigDealFundFlowDAO(PostgresDAOBase):
         offset: int = 0,
     ) -> dict[str, object]:
         day = trade_date or datetime.now().date()
-        start = datetime.combine(day, time.min)
-        end = start + timedelta(days=1)
-        buy_pattern = "%买%"
-        sell_pattern = "%卖%"
 
         count_query = sql.SQL(
-            """
-            SELECT COUNT(*)
-            FROM (
-                SELECT stock_code
-                FROM {schema}.{table}
-                WHERE trade_time >= %s AND trade_time < %s
-                GROUP BY stock_code
-                HAVING (SUM(CASE WHEN trade_side LIKE %s THEN trade_amount ELSE 0 END)
-                        - SUM(CASE WHEN trade_side LIKE %s THEN trade_amount ELSE 0 END)) > 0
-            ) AS positive
-            """
+            "SELECT COUNT(*) FROM {schema}.{daily} WHERE trade_date = %s AND net_amount > 0"
         ).format(
             schema=sql.Identifier(self.config.schema),
-            table=sql.Identifier(self._table_name),
+            daily=sql.Identifier(self._daily_table_name),
         )
 
         data_query = sql.SQL(
             """
-            SELECT stock_code,
-                   MAX(stock_name) AS stock_name,
-                   SUM(CASE WHEN trade_side LIKE %s THEN trade_amount ELSE 0 END) AS buy_amount,
-                   SUM(CASE WHEN trade_side LIKE %s THEN trade_amount ELSE 0 END) AS sell_amount,
-                   COUNT(*) AS trade_count,
-                   MAX(trade_time) AS last_trade_time,
-                   (SUM(CASE WHEN trade_side LIKE %s THEN trade_amount ELSE 0 END)
-                    - SUM(CASE WHEN trade_side LIKE %s THEN trade_amount ELSE 0 END)) AS net_amount
-            FROM {schema}.{table}
-            WHERE trade_time >= %s AND trade_time < %s
-            GROUP BY stock_code
-            HAVING (SUM(CASE WHEN trade_side LIKE %s THEN trade_amount ELSE 0 END)
-                    - SUM(CASE WHEN trade_side LIKE %s THEN trade_amount ELSE 0 END)) > 0
+            SELECT {columns}
+            FROM {schema}.{daily}
+            WHERE trade_date = %s AND net_amount > 0
             ORDER BY net_amount DESC
             LIMIT %s OFFSET %s
             """
         ).format(
+            columns=sql.SQL(", ").join(sql.Identifier(column) for column in BIG_DEAL_DAILY_FIELDS),
             schema=sql.Identifier(self.config.schema),
-            table=sql.Identifier(self._table_name),
-        )
-
-        params_count = (start, end, buy_pattern, sell_pattern)
-        params_data = (
-            buy_pattern,
-            sell_pattern,
-            buy_pattern,
-            sell_pattern,
-            start,
-            end,
-            buy_pattern,
-            sell_pattern,
-            limit,
-            offset,
+            daily=sql.Identifier(self._daily_table_name),
         )
 
         with self.connect() as conn:
             self.ensure_table(conn)
             with conn.cursor() as cur:
-                cur.execute(count_query, params_count)
+                cur.execute(count_query, (day,))
                 total = cur.fetchone()[0] or 0
-                cur.execute(data_query, params_data)
+                cur.execute(data_query, (day, limit, offset))
                 rows = cur.fetchall()
 
-        columns = [
-            "stock_code",
-            "stock_name",
-            "buy_amount",
-            "sell_amount",
-            "trade_count",
-            "last_trade_time",
-            "net_amount",
-        ]
         items: list[dict[str, object]] = []
         for row in rows:
-            record = dict(zip(columns, row))
+            record = dict(zip(BIG_DEAL_DAILY_FIELDS, row))
             try:
                 record["buy_amount"] = float(record.get("buy_amount") or 0.0)
             except (TypeError, ValueError):
@@ -340,37 +638,23 @@ class BigDealFundFlowDAO(PostgresDAOBase):
             return {}
 
         day = trade_date or datetime.now().date()
-        start = datetime.combine(day, time.min)
-        end = start + timedelta(days=1)
 
-        code_placeholders = sql.SQL(", ").join(sql.Placeholder() for _ in unique_codes)
         query = sql.SQL(
             """
-            SELECT stock_code,
-                   COALESCE(SUM(CASE WHEN trade_side LIKE %s THEN trade_amount ELSE 0 END), 0) AS buy_amount,
-                   COALESCE(SUM(CASE WHEN trade_side LIKE %s THEN trade_amount ELSE 0 END), 0) AS sell_amount,
-                   COUNT(*) AS trade_count
-            FROM {schema}.{table}
-            WHERE stock_code IN ({codes})
-              AND trade_time >= %s
-              AND trade_time < %s
-            GROUP BY stock_code
+            SELECT stock_code, buy_amount, sell_amount, trade_count
+            FROM {schema}.{daily}
+            WHERE trade_date = %s AND stock_code = ANY(%s)
             """
         ).format(
             schema=sql.Identifier(self.config.schema),
-            table=sql.Identifier(self._table_name),
-            codes=code_placeholders,
+            daily=sql.Identifier(self._daily_table_name),
         )
 
-        params: List[object] = ["%买%", "%卖%"]
-        params.extend(unique_codes)
-        params.extend([start, end])
-
         results: dict[str, dict[str, float | int]] = {}
         with self.connect() as conn:
             self.ensure_table(conn)
             with conn.cursor() as cur:
-                cur.execute(query, params)
+                cur.execute(query, (day, unique_codes))
                 for stock_code, buy_amount, sell_amount, trade_count in cur.fetchall():
                     try:
                         buy_numeric = float(buy_amount or 0.0)
@@ -393,8 +677,31 @@ class BigDealFundFlowDAO(PostgresDAOBase):
                     }
         return results
 
+    def latest_rollup_updated_at_for_codes(self, stock_codes: Sequence[str]) -> Dict[str, datetime]:
+        """Return when each code's daily rollup was last refreshed (time zone aware).
+
+        The rollup is rewritten whenever new deals arrive, so its ``updated_at`` tracks
+        the raw trades without scanning the partitioned table.
+        """
+        if not stock_codes:
+            return {}
+        query = sql.SQL(
+            "SELECT stock_code, MAX(updated_at) AT TIME ZONE current_setting('TimeZone') FROM {schema}.{daily} "
+            "WHERE stock_code = ANY(%s) GROUP BY stock_code"
+        ).format(
+            schema=sql.Identifier(self.config.schema),
+            daily=sql.Identifier(self._daily_table_name),
+        )
+        rows = self._fetch_all(query, (list(stock_codes),))
+        return {code: updated_at for code, updated_at in rows if updated_at is not None}
+
 
 __all__ = [
+    "BIG_DEAL_DAILY_FIELDS",
     "BIG_DEAL_FUND_FLOW_FIELDS",
+    "DEFAULT_RETENTION_DAYS",
     "BigDealFundFlowDAO",
+    "partition_day",
+    "partition_name",
+    "retention_cutoff",
 ]
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
 from psycopg2 import sql
 
@@ -36,8 +37,19 @@ class ConceptConstituentDAO(PostgresDAOBase):
             index_concept=f"{self._table}_concept_idx",
         )
 
-    def replace_entries(self, concept_name: str, concept_code: str, items: Iterable[Dict[str, Any]]) -> None:
-        """Upsert entries for the concept (keeps previously stored symbols)."""
+    def replace_entries(
+        self,
+        concept_name: str,
+        concept_code: str,
+        items: Iterable[Dict[str, Any]],
+        *,
+        prune: bool = False,
+    ) -> None:
+        """Upsert entries for the concept.
+
+        Previously stored symbols are kept unless ``prune`` is set, which drops the ones
+        missing from ``items`` (use it only when ``items`` is a complete snapshot).
+        """
         rows = list(items)
         with self.connect() as conn:
             self.ensure_table(conn)
@@ -112,8 +124,45 @@ class ConceptConstituentDAO(PostgresDAOBase):
                     for item in rows
                 ]
                 cur.executemany(insert, payload)
+                if prune:
+                    cur.execute(
+                        sql.SQL("DELETE FROM {table} WHERE concept_name = %s AND NOT (symbol = ANY(%s))").format(
+                            table=self._qualified_table()
+                        ),
+                        (concept_name, [row["symbol"] for row in payload]),
+                    )
             conn.commit()
 
+    def fetch_updated_at(self, concept_names: Optional[Sequence[str]] = None) -> Dict[str, datetime]:
+        """Return the latest refresh time of each stored concept snapshot."""
+        query = "SELECT concept_name, MAX(updated_at) FROM {table}"
+        params: List[Any] = []
+        if concept_names is not None:
+            if not concept_names:
+                return {}
+            query += " WHERE concept_name = ANY(%s)"
+            params.append(list(concept_names))
+        query += " GROUP BY concept_name"
+        with self.connect() as conn:
+            self.ensure_table(conn)
+            with conn.cursor() as cur:
+                cur.execute(sql.SQL(query).format(table=self._qualified_table()), params)
+                rows = cur.fetchall()
+        return {concept_name: updated_at for concept_name, updated_at in rows}
+
+    def list_memberships(self) -> Dict[str, List[str]]:
+        """Return ``{concept_name: [symbol, ...]}`` for every stored concept snapshot."""
+        with self.connect() as conn:
+            self.ensure_table(conn)
+            with conn.cursor() as cur:
+                cur.execute(
+                    sql.SQL(
+                        "SELECT concept_name, ARRAY_AGG(symbol ORDER BY symbol) FROM {table} GROUP BY concept_name"
+                    ).format(table=self._qualified_table())
+                )
+                rows = cur.fetchall()
+        return {concept_name: list(symbols) for concept_name, symbols in rows}
+
     def list_entries(self, concept_name: str) -> List[Dict[str, Any]]:
         """Return the latest stored constituent snapshot for the concept."""
         with self.connect() as conn:
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
-from typing import List, Optional, Sequence, Set, Tuple
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
 import math
 import pandas as pd
@@ -254,5 +254,67 @@ class ConceptIndexHistoryDAO(PostgresDAOBase):
         latest = row[0] if row else None
         return latest.strftime("%Y-%m-%d") if latest else None
 
+    def list_recent_frame(self, concept_names: Sequence[str], *, per_name: int) -> pd.DataFrame:
+        """Return the latest ``per_name`` bars of each concept in one query, oldest first."""
+        columns = ["concept_name", "trade_date", "open", "high", "low", "close", "pre_close", "pct_chg", "vol", "amount"]
+        if not concept_names or per_name <= 0:
+            return pd.DataFrame(columns=columns)
+        query = sql.SQL(
+            """
+            SELECT concept_name, trade_date, open, high, low, close, pre_close, pct_chg, vol, amount
+            FROM (
+                SELECT h.*, ROW_NUMBER() OVER (PARTITION BY h.concept_name ORDER BY h.trade_date DESC) AS recency
+                FROM {schema}.{table} AS h
+                WHERE h.concept_name = ANY(%s)
+            ) AS ranked
+            WHERE recency <= %s
+            ORDER BY concept_name, trade_date
+            """
+        ).format(
+            schema=sql.Identifier(self.config.schema),
+            table=sql.Identifier(self._table_name),
+        )
+        rows = self._fetch_all(query, (list(concept_names), int(per_name)))
+        frame = pd.DataFrame(rows, columns=columns)
+        numeric = columns[2:]
+        frame[numeric] = frame[numeric].apply(pd.to_numeric, errors="coerce").replace([math.inf, -math.inf], math.nan)
+        return frame
+
+    def fetch_latest_closes(self, ts_codes: Sequence[str], *, before: date) -> Dict[str, float]:
+        """Last stored close per series strictly before ``before`` (anchors for chained indices)."""
+        if not ts_codes:
+            return {}
+        query = sql.SQL(
+            """
+            SELECT DISTINCT ON (ts_code) ts_code, close
+            FROM {schema}.{table}
+            WHERE ts_code = ANY(%s) AND trade_date < %s AND close IS NOT NULL
+            ORDER BY ts_code, trade_date DESC
+            """
+        ).format(
+            schema=sql.Identifier(self.config.schema),
+            table=sql.Identifier(self._table_name),
+        )
+        rows = self._fetch_all(query, (list(ts_codes), before))
+        return {ts_code: float(close) for ts_code, close in rows}
+
+    def delete_other_sources(self, concept_names: Sequence[str], *, keep_prefix: str) -> int:
+        """Drop rows of the given concepts stored under a ``ts_code`` not starting with ``keep_prefix``."""
+        if not concept_names:
+            return 0
+        with self.connect() as conn:
+            self.ensure_table(conn)
+            with conn.cursor() as cur:
+                cur.execute(
+                    sql.SQL(
+                        "DELETE FROM {schema}.{table} WHERE concept_name = ANY(%s) AND ts_code NOT LIKE %s"
+                    ).format(
+                        schema=sql.Identifier(self.config.schema),
+                        table=sql.Identifier(self._table_name),
+                    ),
+                    (list(concept_names), f"{keep_prefix}%"),
+                )
+                return cur.rowcount or 0
+
 
 __all__ = ["CONCEPT_INDEX_HISTORY_FIELDS", "ConceptIndexHistoryDAO"]
@@ -91,11 +91,8 @@ class DailyIndicatorDAO(PostgresDAOBase):
                 count, last_updated = cur.fetchone()
         return {"count": count or 0, "updated_at": last_updated}
 
-    def fetch_latest_indicators(self, codes: Sequence[str]) -> Dict[str, dict]:
-        if not codes:
-            return {}
-
-        query = sql.SQL(
+    def _latest_indicators_query(self) -> sql.Composed:
+        return sql.SQL(
             """
             SELECT DISTINCT ON (ts_code)
                    ts_code,
@@ -112,12 +109,8 @@ class DailyIndicatorDAO(PostgresDAOBase):
             table=sql.Identifier(self._table_name),
         )
 
-        with self.connect() as conn:
-            self.ensure_table(conn)
-            with conn.cursor() as cur:
-                cur.execute(query, (list(codes),))
-                rows = cur.fetchall()
-
+    @staticmethod
+    def _latest_indicators_from_rows(rows: Sequence[Sequence[object]]) -> Dict[str, dict]:
         results: Dict[str, dict] = {}
         for ts_code, trade_date, pe, total_mv, turnover_rate in rows:
             pe_value = float(pe) if pe is not None else None
@@ -141,6 +134,46 @@ class DailyIndicatorDAO(PostgresDAOBase):
             }
         return results
 
+    def fetch_latest_indicators(self, codes: Sequence[str]) -> Dict[str, dict]:
+        if not codes:
+            return {}
+        rows = self._fetch_all(self._latest_indicators_query(), (list(codes),))
+        return self._latest_indicators_from_rows(rows)
+
+    def fetch_latest_float_shares(self, codes: Optional[Sequence[str]] = None) -> Dict[str, float]:
+        """Latest free-float share count per stock (in shares), for cap-weighted aggregates."""
+        condition = sql.SQL("WHERE float_share IS NOT NULL")
+        params: tuple = ()
+        if codes is not None:
+            if not codes:
+                return {}
+            condition = condition + sql.SQL(" AND ts_code = ANY(%s)")
+            params = (list(codes),)
+        query = sql.SQL(
+            """
+            SELECT DISTINCT ON (ts_code) ts_code, float_share
+            FROM {schema}.{table}
+            {condition}
+            ORDER BY ts_code, trade_date DESC
+            """
+        ).format(
+            schema=sql.Identifier(self.config.schema),
+            table=sql.Identifier(self._table_name),
+            condition=condition,
+        )
+        results: Dict[str, float] = {}
+        for ts_code, float_share in self._fetch_all(query, params):
+            value = float(float_share)
+            if math.isfinite(value) and value > 0:
+                results[ts_code] = value * 10000  # Tushare reports float_share in 10k shares.
+        return results
+
+    async def fetch_latest_indicators_async(self, codes: Sequence[str]) -> Dict[str, dict]:
+        if not codes:
+            return {}
+        rows = await self._fetch_all_async(self._latest_indicators_query(), (list(codes),))
+        return self._latest_indicators_from_rows(rows)
+
 
 __all__ = [
     "DAILY_INDICATOR_FIELDS",
@@ -6,7 +6,7 @@ from __future__ import annotations
 
 from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, Optional, Sequence
+from typing import Dict, Iterable, Optional, Sequence
 
 import pandas as pd
 from psycopg2 import sql
@@ -18,6 +18,9 @@ from .base import PostgresDAOBase
 
 SCHEMA_SQL_PATH = Path(__file__).resolve().parents[2] / "config" / "daily_trade_schema.sql"
 DATE_FORMAT = "%Y%m%d"
+FLOAT_COLUMNS = ("open", "high", "low", "close", "pre_close", "change", "pct_chg", "vol", "amount")
+
+_MIGRATED_TABLES: set[tuple[str, str]] = set()
 
 
 class DailyTradeDAO(PostgresDAOBase):
@@ -35,23 +38,160 @@ class DailyTradeDAO(PostgresDAOBase):
         self._schema_sql_template = SCHEMA_SQL_PATH.read_text(encoding="utf-8")
 
     def ensure_table(self, conn) -> None:
-        """Ensure the destination table exists."""
+        """Ensure the destination table, its indexes and any yearly partitions exist."""
         self._execute_schema_template(
             conn,
             self._schema_sql_template,
             schema=self.config.schema,
             table=self._table_name,
+            trade_date_idx=f"{self._table_name}_trade_date_idx",
+            final_trade_date_idx=f"{self._table_name}_final_trade_date_idx",
         )
+        self._migrate_numeric_columns(conn)
+        if self._is_partitioned(conn):
+            current_year = date.today().year
+            self._ensure_year_partitions(conn, range(current_year, current_year + 2))
+
+    def _migrate_numeric_columns(self, conn) -> None:
+        """Convert legacy ``NUMERIC`` price/volume columns to ``double precision`` once."""
+        key = (self.config.schema, self._table_name)
+        if key in _MIGRATED_TABLES:
+            return
         with conn.cursor() as cur:
             cur.execute(
-                sql.SQL(
-                    "ALTER TABLE {schema}.{table} "
-                    "ADD COLUMN IF NOT EXISTS is_intraday BOOLEAN NOT NULL DEFAULT FALSE"
-                ).format(
-                    schema=sql.Identifier(self.config.schema),
-                    table=sql.Identifier(self._table_name),
+                """
+                SELECT column_name
+                FROM information_schema.columns
+                WHERE table_schema = %s AND table_name = %s AND data_type = 'numeric'
+                """,
+                (self.config.schema, self._table_name),
+            )
+            legacy_columns = [row[0] for row in cur.fetchall() if row[0] in FLOAT_COLUMNS]
+            if legacy_columns:
+                # A single ALTER rewrites the table once for all columns.
+                cur.execute(
+                    sql.SQL("ALTER TABLE {schema}.{table} {changes}").format(
+                        schema=sql.Identifier(self.config.schema),
+                        table=sql.Identifier(self._table_name),
+                        changes=sql.SQL(", ").join(
+                            sql.SQL("ALTER COLUMN {column} TYPE DOUBLE PRECISION USING {column}::double precision").format(
+                                column=sql.Identifier(column)
+                            )
+                            for column in legacy_columns
+                        ),
+                    )
                 )
+        _MIGRATED_TABLES.add(key)
+
+    def _is_partitioned(self, conn) -> bool:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT c.relkind
+                FROM pg_class AS c
+                JOIN pg_namespace AS n ON n.oid = c.relnamespace
+                WHERE n.nspname = %s AND c.relname = %s
+                """,
+                (self.config.schema, self._table_name),
             )
+            row = cur.fetchone()
+        return bool(row) and row[0] == "p"
+
+    def _ensure_year_partitions(self, conn, years: Iterable[int], *, parent: Optional[str] = None) -> None:
+        parent_table = parent or self._table_name
+        with conn.cursor() as cur:
+            for year in years:
+                cur.execute(
+                    sql.SQL(
+                        "CREATE TABLE IF NOT EXISTS {schema}.{partition} "
+                        "PARTITION OF {schema}.{table} FOR VALUES FROM (%s) TO (%s)"
+                    ).format(
+                        schema=sql.Identifier(self.config.schema),
+                        partition=sql.Identifier(f"{self._table_name}_{year}"),
+                        table=sql.Identifier(parent_table),
+                    ),
+                    (date(year, 1, 1), date(year + 1, 1, 1)),
+                )
+
+    def partition_by_year(self) -> int:
+        """
+        Rebuild the table as ``PARTITION BY RANGE (trade_date)`` with one partition per year.
+
+        Rows are copied into the new layout and the old table is dropped in the same
+        transaction. Dates outside the yearly partitions land in a default partition.
+        Returns the number of rows copied, or 0 when the table is already partitioned.
+        """
+        schema = sql.Identifier(self.config.schema)
+        table = sql.Identifier(self._table_name)
+        staging_name = f"{self._table_name}_partitioned"
+        staging = sql.Identifier(staging_name)
+
+        with self.connect() as conn:
+            self.ensure_table(conn)
+            if self._is_partitioned(conn):
+                return 0
+            with conn.cursor() as cur:
+                cur.execute(
+                    sql.SQL("SELECT MIN(trade_date), MAX(trade_date) FROM {schema}.{table}").format(
+                        schema=schema,
+                        table=table,
+                    )
+                )
+                first_date, last_date = cur.fetchone()
+                current_year = date.today().year
+                first_year = first_date.year if first_date else current_year
+                last_year = max(last_date.year if last_date else current_year, current_year) + 1
+
+                cur.execute(
+                    sql.SQL(
+                        "CREATE TABLE {schema}.{staging} "
+                        "(LIKE {schema}.{table} INCLUDING DEFAULTS) PARTITION BY RANGE (trade_date)"
+                    ).format(schema=schema, staging=staging, table=table)
+                )
+                cur.execute(
+                    sql.SQL("ALTER TABLE {schema}.{staging} ADD PRIMARY KEY (ts_code, trade_date)").format(
+                        schema=schema,
+                        staging=staging,
+                    )
+                )
+                cur.execute(
+                    sql.SQL("CREATE TABLE {schema}.{partition} PARTITION OF {schema}.{staging} DEFAULT").format(
+                        schema=schema,
+                        partition=sql.Identifier(f"{self._table_name}_default"),
+                        staging=staging,
+                    )
+                )
+            self._ensure_year_partitions(conn, range(first_year, last_year + 1), parent=staging_name)
+
+            with conn.cursor() as cur:
+                cur.execute(
+                    sql.SQL("INSERT INTO {schema}.{staging} SELECT * FROM {schema}.{table}").format(
+                        schema=schema,
+                        staging=staging,
+                        table=table,
+                    )
+                )
+                copied = cur.rowcount or 0
+                cur.execute(sql.SQL("DROP TABLE {schema}.{table}").format(schema=schema, table=table))
+                cur.execute(
+                    sql.SQL("ALTER TABLE {schema}.{staging} RENAME TO {table}").format(
+                        schema=schema,
+                        staging=staging,
+                        table=table,
+                    )
+                )
+                cur.execute(
+                    sql.SQL("ALTER TABLE {schema}.{table} RENAME CONSTRAINT {old_pkey} TO {new_pkey}").format(
+                        schema=schema,
+                        table=table,
+                        old_pkey=sql.Identifier(f"{staging_name}_pkey"),
+                        new_pkey=sql.Identifier(f"{self._table_name}_pkey"),
+                    )
+                )
+            # Recreate the secondary indexes on the partitioned parent.
+            self.ensure_table(conn)
+
+        return copied
 
     def clear_table(self) -> int:
         """Remove all rows from the daily trade table."""
@@ -103,22 +243,23 @@ class DailyTradeDAO(PostgresDAOBase):
                 count, last_updated = cur.fetchone()
         return {"count": count or 0, "updated_at": last_updated}
 
-    def latest_trade_date(self, *, include_intraday: bool = False) -> Optional[datetime]:
-        """Return the most recent trade_date available in the table."""
+    def _latest_trade_date_query(self, include_intraday: bool) -> sql.Composed:
         where_clause = sql.SQL("")
         if not include_intraday:
             where_clause = sql.SQL(" WHERE is_intraday = FALSE")
+        return sql.SQL("SELECT MAX(trade_date) FROM {schema}.{table}").format(
+            schema=sql.Identifier(self.config.schema),
+            table=sql.Identifier(self._table_name),
+        ) + where_clause
 
-        with self.connect() as conn:
-            self.ensure_table(conn)
-            query = sql.SQL("SELECT MAX(trade_date) FROM {schema}.{table}").format(
-                schema=sql.Identifier(self.config.schema),
-                table=sql.Identifier(self._table_name),
-            ) + where_clause
-            with conn.cursor() as cur:
-                cur.execute(query)
-                row = cur.fetchone()
-        return row[0] if row else None
+    def latest_trade_date(self, *, include_intraday: bool = False) -> Optional[datetime]:
+        """Return the most recent trade_date available in the table."""
+        rows = self._fetch_all(self._latest_trade_date_query(include_intraday))
+        return rows[0][0] if rows else None
+
+    async def latest_trade_date_async(self, *, include_intraday: bool = False) -> Optional[datetime]:
+        rows = await self._fetch_all_async(self._latest_trade_date_query(include_intraday))
+        return rows[0][0] if rows else None
 
     def latest_trade_dates_for_codes(self, codes: Sequence[str]) -> Dict[str, datetime]:
         """Return the latest trade_date for each provided code."""
@@ -140,6 +281,25 @@ class DailyTradeDAO(PostgresDAOBase):
 
         return {code: trade_date for code, trade_date in rows if trade_date is not None}
 
+    def latest_bar_updated_at_for_codes(self, codes: Sequence[str]) -> Dict[str, datetime]:
+        """Return when the latest finalised bar of each code was last written (time zone aware).
+
+        ``updated_at`` holds ``CURRENT_TIMESTAMP`` in the session time zone, so it is
+        tagged with that zone before leaving the database.
+        """
+        if not codes:
+            return {}
+        query = sql.SQL(
+            "SELECT DISTINCT ON (ts_code) ts_code, updated_at AT TIME ZONE current_setting('TimeZone') "
+            "FROM {schema}.{table} "
+            "WHERE ts_code = ANY(%s) AND is_intraday = FALSE ORDER BY ts_code, trade_date DESC"
+        ).format(
+            schema=sql.Identifier(self.config.schema),
+            table=sql.Identifier(self._table_name),
+        )
+        rows = self._fetch_all(query, (list(codes),))
+        return {code: updated_at for code, updated_at in rows if updated_at is not None}
+
     def upsert(self, dataframe: pd.DataFrame) -> int:
         """Synchronise the provided DataFrame into the daily trade table."""
         if dataframe.empty:
@@ -159,18 +319,12 @@ class DailyTradeDAO(PostgresDAOBase):
 
         return affected
 
-    def fetch_latest_metrics(self, codes: Sequence[str], *, include_intraday: bool = False) -> Dict[str, dict]:
-        """
-        Return the latest trade metrics for the provided security codes.
-        """
-        if not codes:
-            return {}
-
+    def _latest_metrics_query(self, include_intraday: bool) -> sql.Composed:
         where_clause = sql.SQL("WHERE ts_code = ANY(%s)")
         if not include_intraday:
             where_clause += sql.SQL(" AND is_intraday = FALSE")
 
-        query = sql.SQL(
+        return sql.SQL(
             """
             SELECT DISTINCT ON (ts_code)
                    ts_code,
@@ -188,22 +342,35 @@ class DailyTradeDAO(PostgresDAOBase):
             where_clause=where_clause,
         )
 
-        with self.connect() as conn:
-            self.ensure_table(conn)
-            with conn.cursor() as cur:
-                cur.execute(query, (list(codes),))
-                rows = cur.fetchall()
-
+    @staticmethod
+    def _latest_metrics_from_rows(rows: Sequence[Sequence[object]]) -> Dict[str, dict]:
         metrics: Dict[str, dict] = {}
         for ts_code, trade_date, close, pct_chg, vol in rows:
             metrics[ts_code] = {
                 "trade_date": trade_date,
-                "last_price": float(close) if close is not None else None,
-                "pct_change": float(pct_chg) if pct_chg is not None else None,
-                "volume": float(vol) if vol is not None else None,
+                "last_price": close,
+                "pct_change": pct_chg,
+                "volume": vol,
             }
         return metrics
 
+    def fetch_latest_metrics(self, codes: Sequence[str], *, include_intraday: bool = False) -> Dict[str, dict]:
+        """
+        Return the latest trade metrics for the provided security codes.
+        """
+        if not codes:
+            return {}
+        rows = self._fetch_all(self._latest_metrics_query(include_intraday), (list(codes),))
+        return self._latest_metrics_from_rows(rows)
+
+    async def fetch_latest_metrics_async(
+        self, codes: Sequence[str], *, include_intraday: bool = False
+    ) -> Dict[str, dict]:
+        if not codes:
+            return {}
+        rows = await self._fetch_all_async(self._latest_metrics_query(include_intraday), (list(codes),))
+        return self._latest_metrics_from_rows(rows)
+
     def fetch_pct_change_windows(
         self,
         codes: Sequence[str],
@@ -330,6 +497,48 @@ class DailyTradeDAO(PostgresDAOBase):
         frame["trade_date"] = pd.to_datetime(frame["trade_date"], errors="coerce")
         return frame
 
+    def fetch_ohlcv(
+        self,
+        *,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        include_intraday: bool = False,
+        fields: Sequence[str] = ("open", "high", "low", "close", "pre_close", "vol", "amount"),
+    ) -> pd.DataFrame:
+        """
+        Load OHLCV bars within ``[start_date, end_date]``.
+        """
+        clauses: list[sql.Composable] = []
+        params: list[object] = []
+        if start_date:
+            clauses.append(sql.SQL("trade_date >= %s"))
+            params.append(start_date)
+        if end_date:
+            clauses.append(sql.SQL("trade_date <= %s"))
+            params.append(end_date)
+        if not include_intraday:
+            clauses.append(sql.SQL("is_intraday = FALSE"))
+
+        columns = sql.SQL(", ").join(
+            sql.Identifier(field) for field in fields
+        )
+        where_clause = sql.SQL(" WHERE ") + sql.SQL(" AND ").join(clauses) if clauses else sql.SQL("")
+        query = sql.SQL(
+            "SELECT ts_code, trade_date, {columns} FROM {schema}.{table}{where_clause} ORDER BY ts_code, trade_date"
+        ).format(
+            columns=columns,
+            schema=sql.Identifier(self.config.schema),
+            table=sql.Identifier(self._table_name),
+            where_clause=where_clause,
+        )
+
+        with self.connect() as conn:
+            self.ensure_table(conn)
+            frame = pd.read_sql_query(query.as_string(conn), conn, params=params)
+
+        frame["trade_date"] = pd.to_datetime(frame["trade_date"], errors="coerce")
+        return frame
+
     def fetch_price_history(
         self,
         ts_code: str,
@@ -383,12 +592,12 @@ class DailyTradeDAO(PostgresDAOBase):
             history.append(
                 {
                     "trade_date": trade_date.isoformat() if isinstance(trade_date, date) else str(trade_date),
-                    "open": float(open_price) if open_price is not None else None,
-                    "high": float(high_price) if high_price is not None else None,
-                    "low": float(low_price) if low_price is not None else None,
-                    "close": float(close_price) if close_price is not None else None,
-                    "volume": float(volume) if volume is not None else None,
-                    "pct_change": float(pct_change) if pct_change is not None else None,
+                    "open": open_price,
+                    "high": high_price,
+                    "low": low_price,
+                    "close": close_price,
+                    "volume": volume,
+                    "pct_change": pct_change,
                     "is_intraday": bool(is_intraday),
                 }
             )
@@ -441,12 +650,12 @@ class DailyTradeDAO(PostgresDAOBase):
         trade_date, open_price, high_price, low_price, close_price, volume, pct_change, is_intraday = row
         return {
             "trade_date": trade_date.isoformat() if isinstance(trade_date, date) else str(trade_date),
-            "open": float(open_price) if open_price is not None else None,
-            "high": float(high_price) if high_price is not None else None,
-            "low": float(low_price) if low_price is not None else None,
-            "close": float(close_price) if close_price is not None else None,
-            "volume": float(volume) if volume is not None else None,
-            "pct_change": float(pct_change) if pct_change is not None else None,
+            "open": open_price,
+            "high": high_price,
+            "low": low_price,
+            "close": close_price,
+            "volume": volume,
+            "pct_change": pct_change,
             "is_intraday": bool(is_intraday),
         }
 
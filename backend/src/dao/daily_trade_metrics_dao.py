@@ -122,11 +122,8 @@ class DailyTradeMetricsDAO(PostgresDAOBase):
             "latest_trade_date": latest_trade_date,
         }
 
-    def fetch_metrics(self, codes: Sequence[str]) -> Dict[str, dict]:
-        if not codes:
-            return {}
-
-        query = sql.SQL(
+    def _metrics_query(self) -> sql.Composed:
+        return sql.SQL(
             """
             SELECT DISTINCT ON (ts_code)
                    ts_code,
@@ -149,12 +146,8 @@ class DailyTradeMetricsDAO(PostgresDAOBase):
             table=sql.Identifier(self._table_name),
         )
 
-        with self.connect() as conn:
-            self.ensure_table(conn)
-            with conn.cursor() as cur:
-                cur.execute(query, (list(codes),))
-                rows = cur.fetchall()
-
+    @staticmethod
+    def _metrics_from_rows(rows: Sequence[Sequence[object]]) -> Dict[str, dict]:
         metrics: Dict[str, dict] = {}
         for (
             ts_code,
@@ -183,6 +176,18 @@ class DailyTradeMetricsDAO(PostgresDAOBase):
             }
         return metrics
 
+    def fetch_metrics(self, codes: Sequence[str]) -> Dict[str, dict]:
+        if not codes:
+            return {}
+        rows = self._fetch_all(self._metrics_query(), (list(codes),))
+        return self._metrics_from_rows(rows)
+
+    async def fetch_metrics_async(self, codes: Sequence[str]) -> Dict[str, dict]:
+        if not codes:
+            return {}
+        rows = await self._fetch_all_async(self._metrics_query(), (list(codes),))
+        return self._metrics_from_rows(rows)
+
 
 __all__ = [
     "DailyTradeMetricsDAO",
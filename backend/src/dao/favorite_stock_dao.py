@@ -5,7 +5,7 @@ Data access object for managing the stock favorites list.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from psycopg2 import sql
 
@@ -51,27 +51,24 @@ class FavoriteStockDAO(PostgresDAOBase):
                 ).format(table=self._qualified_table())
             )
 
-    def list_entries(self, group: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Return favorite records ordered by most recent activity."""
-        with self.connect() as conn:
-            self.ensure_table(conn)
-            query = [
-                sql.SQL(
-                    "SELECT ts_code, group_name, created_at, updated_at FROM {table}"
-                ).format(table=self._qualified_table())
-            ]
-            params: List[Any] = []
-            if group is not None:
-                normalized_group = self._normalize_group_value(group)
-                if normalized_group is None:
-                    query.append(sql.SQL(" WHERE group_name IS NULL"))
-                else:
-                    query.append(sql.SQL(" WHERE group_name = %s"))
-                    params.append(normalized_group)
-            query.append(sql.SQL(" ORDER BY updated_at DESC"))
-            with conn.cursor() as cur:
-                cur.execute(sql.Composed(query), params)
-                rows = cur.fetchall()
+    def _list_entries_query(self, group: Optional[str]) -> tuple[sql.Composed, List[Any]]:
+        query = [
+            sql.SQL(
+                "SELECT ts_code, group_name, created_at, updated_at FROM {table}"
+            ).format(table=self._qualified_table())
+        ]
+        params: List[Any] = []
+        if group is not None:
+            normalized_group = self._normalize_group_value(group)
+            if normalized_group is None:
+                query.append(sql.SQL(" WHERE group_name IS NULL"))
+            else:
+                query.append(sql.SQL(" WHERE group_name = %s"))
+                params.append(normalized_group)
+        query.append(sql.SQL(" ORDER BY updated_at DESC"))
+        return sql.Composed(query), params
+
+    def _entries_from_rows(self, rows: Sequence[Sequence[Any]]) -> List[Dict[str, Any]]:
         return [
             {
                 "code": row[0],
@@ -82,6 +79,15 @@ class FavoriteStockDAO(PostgresDAOBase):
             for row in rows
         ]
 
+    def list_entries(self, group: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Return favorite records ordered by most recent activity."""
+        query, params = self._list_entries_query(group)
+        return self._entries_from_rows(self._fetch_all(query, params))
+
+    async def list_entries_async(self, group: Optional[str] = None) -> List[Dict[str, Any]]:
+        query, params = self._list_entries_query(group)
+        return self._entries_from_rows(await self._fetch_all_async(query, params))
+
     def list_codes(self, group: Optional[str] = None) -> List[str]:
         """Return all favorite stock codes ordered by most recently updated."""
         return [entry["code"] for entry in self.list_entries(group=group)]
@@ -6,7 +6,7 @@ from __future__ import annotations
 
 from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, Optional, Sequence
+from typing import Dict, List, Optional, Sequence
 
 import pandas as pd
 from psycopg2 import sql
@@ -101,7 +101,7 @@ class FinancialIndicatorDAO(PostgresDAOBase):
                 count, last_updated = cur.fetchone()
         return {"count": count or 0, "updated_at": last_updated}
 
-    def fetch_recent(self, per_code: int = 8) -> pd.DataFrame:
+    def fetch_recent(self, per_code: int = 8, *, codes: Optional[Sequence[str]] = None) -> pd.DataFrame:
         """Return the most recent financial indicators per security."""
         if per_code <= 0:
             raise ValueError("per_code must be positive")
@@ -121,6 +121,7 @@ class FinancialIndicatorDAO(PostgresDAOBase):
                            roe,
                            ROW_NUMBER() OVER (PARTITION BY ts_code ORDER BY end_date DESC, ann_date DESC) AS rn
                     FROM {schema}.{table}
+                    {where_clause}
                 ) ranked
                 WHERE rn <= %s
                 ORDER BY ts_code, end_date
@@ -128,13 +129,44 @@ class FinancialIndicatorDAO(PostgresDAOBase):
             ).format(
                 schema=sql.Identifier(self.config.schema),
                 table=sql.Identifier(self._table_name),
+                where_clause=sql.SQL("WHERE ts_code = ANY(%s)") if codes is not None else sql.SQL(""),
             )
+            params: tuple[object, ...] = (list(codes), per_code) if codes is not None else (per_code,)
             query_str = query.as_string(conn)
-            frame = pd.read_sql_query(query_str, conn, params=(per_code,))
+            frame = pd.read_sql_query(query_str, conn, params=params)
         frame["ann_date"] = pd.to_datetime(frame["ann_date"], errors="coerce")
         frame["end_date"] = pd.to_datetime(frame["end_date"], errors="coerce")
         return frame
 
+    def codes_updated_since(self, since: datetime) -> List[str]:
+        """Return codes with at least one row written after ``since``."""
+        query = sql.SQL(
+            "SELECT DISTINCT ts_code FROM {schema}.{table} WHERE updated_at > %s"
+        ).format(
+            schema=sql.Identifier(self.config.schema),
+            table=sql.Identifier(self._table_name),
+        )
+        with self.connect() as conn:
+            self.ensure_table(conn)
+            with conn.cursor() as cur:
+                cur.execute(query, (since,))
+                rows = cur.fetchall()
+        return [row[0] for row in rows if row[0]]
+
+    def latest_ann_date(self) -> Optional[date]:
+        """Return the most recent announcement date stored across all securities."""
+        with self.connect() as conn:
+            self.ensure_table(conn)
+            with conn.cursor() as cur:
+                cur.execute(
+                    sql.SQL("SELECT MAX(ann_date) FROM {schema}.{table}").format(
+                        schema=sql.Identifier(self.config.schema),
+                        table=sql.Identifier(self._table_name),
+                    )
+                )
+                latest = cur.fetchone()[0]
+        return latest
+
     def latest_period_end(self) -> Optional[date]:
         with self.connect() as conn:
             self.ensure_table(conn)
@@ -148,11 +180,8 @@ class FinancialIndicatorDAO(PostgresDAOBase):
                 latest = cur.fetchone()[0]
         return latest
 
-    def fetch_latest_indicators(self, codes: Sequence[str]) -> Dict[str, dict]:
-        if not codes:
-            return {}
-
-        query = sql.SQL(
+    def _latest_indicators_query(self) -> sql.Composed:
+        return sql.SQL(
             """
             SELECT DISTINCT ON (ts_code)
                    ts_code,
@@ -169,12 +198,8 @@ class FinancialIndicatorDAO(PostgresDAOBase):
             table=sql.Identifier(self._table_name),
         )
 
-        with self.connect() as conn:
-            self.ensure_table(conn)
-            with conn.cursor() as cur:
-                cur.execute(query, (list(codes),))
-                rows = cur.fetchall()
-
+    @staticmethod
+    def _latest_indicators_from_rows(rows: Sequence[Sequence[object]]) -> Dict[str, dict]:
         indicators: Dict[str, dict] = {}
         for ts_code, ann_date, end_date, gross_margin, roe in rows:
             indicators[ts_code] = {
@@ -185,6 +210,18 @@ class FinancialIndicatorDAO(PostgresDAOBase):
             }
         return indicators
 
+    def fetch_latest_indicators(self, codes: Sequence[str]) -> Dict[str, dict]:
+        if not codes:
+            return {}
+        rows = self._fetch_all(self._latest_indicators_query(), (list(codes),))
+        return self._latest_indicators_from_rows(rows)
+
+    async def fetch_latest_indicators_async(self, codes: Sequence[str]) -> Dict[str, dict]:
+        if not codes:
+            return {}
+        rows = await self._fetch_all_async(self._latest_indicators_query(), (list(codes),))
+        return self._latest_indicators_from_rows(rows)
+
 
 __all__ = [
     "FINANCIAL_INDICATOR_FIELDS",
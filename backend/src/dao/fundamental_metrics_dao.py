@@ -39,6 +39,13 @@ class FundamentalMetricsDAO(PostgresDAOBase):
     """Handles persistence for derived fundamental metrics."""
 
     _conflict_keys: Sequence[str] = ("ts_code",)
+    _date_columns: Sequence[str] = (
+        "net_income_end_date_latest",
+        "net_income_end_date_prev1",
+        "net_income_end_date_prev2",
+        "revenue_end_date_latest",
+        "roe_end_date_latest",
+    )
 
     def __init__(self, config: PostgresSettings, table_name: Optional[str] = None) -> None:
         super().__init__(config=config)
@@ -53,28 +60,12 @@ class FundamentalMetricsDAO(PostgresDAOBase):
             table=self._table_name,
         )
 
-    def replace_all(self, dataframe: pd.DataFrame) -> int:
+    def upsert(self, dataframe: pd.DataFrame) -> int:
         if dataframe.empty:
-            with self.connect() as conn:
-                self.ensure_table(conn)
-                with conn.cursor() as cur:
-                    cur.execute(
-                        sql.SQL("TRUNCATE TABLE {schema}.{table}").format(
-                            schema=sql.Identifier(self.config.schema),
-                            table=sql.Identifier(self._table_name),
-                        )
-                    )
             return 0
 
         with self.connect() as conn:
             self.ensure_table(conn)
-            with conn.cursor() as cur:
-                cur.execute(
-                    sql.SQL("TRUNCATE TABLE {schema}.{table}").format(
-                        schema=sql.Identifier(self.config.schema),
-                        table=sql.Identifier(self._table_name),
-                    )
-                )
             affected = self._upsert_dataframe(
                 conn,
                 schema=self.config.schema,
@@ -82,16 +73,41 @@ class FundamentalMetricsDAO(PostgresDAOBase):
                 dataframe=dataframe,
                 columns=FUNDAMENTAL_METRICS_FIELDS,
                 conflict_keys=self._conflict_keys,
-                date_columns=(
-                    "net_income_end_date_latest",
-                    "net_income_end_date_prev1",
-                    "net_income_end_date_prev2",
-                    "revenue_end_date_latest",
-                    "roe_end_date_latest",
-                ),
+                date_columns=self._date_columns,
             )
         return affected
 
+    def delete_except(self, codes: Sequence[str]) -> int:
+        """Remove metrics for codes outside ``codes`` (all rows when ``codes`` is empty)."""
+        with self.connect() as conn:
+            self.ensure_table(conn)
+            with conn.cursor() as cur:
+                cur.execute(
+                    sql.SQL("DELETE FROM {schema}.{table} WHERE NOT (ts_code = ANY(%s))").format(
+                        schema=sql.Identifier(self.config.schema),
+                        table=sql.Identifier(self._table_name),
+                    ),
+                    (list(codes),),
+                )
+                return cur.rowcount
+
+    def fetch_frame(self, codes: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """Return stored metrics rows (optionally limited to ``codes``) as a DataFrame."""
+        columns = sql.SQL(", ").join(sql.Identifier(column) for column in FUNDAMENTAL_METRICS_FIELDS)
+        where_clause = sql.SQL(" WHERE ts_code = ANY(%s)") if codes is not None else sql.SQL("")
+        query = sql.SQL("SELECT {columns} FROM {schema}.{table}{where_clause}").format(
+            columns=columns,
+            schema=sql.Identifier(self.config.schema),
+            table=sql.Identifier(self._table_name),
+            where_clause=where_clause,
+        )
+        with self.connect() as conn:
+            self.ensure_table(conn)
+            with conn.cursor() as cur:
+                cur.execute(query, (list(codes),) if codes is not None else None)
+                rows = cur.fetchall()
+        return pd.DataFrame(rows, columns=list(FUNDAMENTAL_METRICS_FIELDS))
+
     def stats(self) -> dict[str, Optional[datetime]]:
         with self.connect() as conn:
             self.ensure_table(conn)
@@ -105,11 +121,8 @@ class FundamentalMetricsDAO(PostgresDAOBase):
                 count, updated_at = cur.fetchone()
         return {"count": count or 0, "updated_at": updated_at}
 
-    def fetch_metrics(self, codes: Sequence[str]) -> dict[str, dict]:
-        if not codes:
-            return {}
-
-        query = sql.SQL(
+    def _metrics_query(self) -> sql.Composed:
+        return sql.SQL(
             """
             SELECT ts_code,
                    net_income_yoy_latest,
@@ -128,12 +141,8 @@ class FundamentalMetricsDAO(PostgresDAOBase):
             table=sql.Identifier(self._table_name),
         )
 
-        with self.connect() as conn:
-            self.ensure_table(conn)
-            with conn.cursor() as cur:
-                cur.execute(query, (list(codes),))
-                rows = cur.fetchall()
-
+    @staticmethod
+    def _metrics_from_rows(rows: Sequence[Sequence[object]]) -> dict[str, dict]:
         metrics: dict[str, dict] = {}
         for (
             ts_code,
@@ -158,6 +167,18 @@ class FundamentalMetricsDAO(PostgresDAOBase):
             }
         return metrics
 
+    def fetch_metrics(self, codes: Sequence[str]) -> dict[str, dict]:
+        if not codes:
+            return {}
+        rows = self._fetch_all(self._metrics_query(), (list(codes),))
+        return self._metrics_from_rows(rows)
+
+    async def fetch_metrics_async(self, codes: Sequence[str]) -> dict[str, dict]:
+        if not codes:
+            return {}
+        rows = await self._fetch_all_async(self._metrics_query(), (list(codes),))
+        return self._metrics_from_rows(rows)
+
     def query_metrics(
         self,
         *,
@@ -6,7 +6,7 @@ from __future__ import annotations
 
 from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, Optional, Sequence
+from typing import Dict, List, Optional, Sequence
 
 import pandas as pd
 from psycopg2 import sql
@@ -100,7 +100,7 @@ class IncomeStatementDAO(PostgresDAOBase):
                 count, last_updated = cur.fetchone()
         return {"count": count or 0, "updated_at": last_updated}
 
-    def fetch_recent(self, per_code: int = 8) -> pd.DataFrame:
+    def fetch_recent(self, per_code: int = 8, *, codes: Optional[Sequence[str]] = None) -> pd.DataFrame:
         """Return the most recent income statements per security."""
         if per_code <= 0:
             raise ValueError("per_code must be positive")
@@ -122,6 +122,7 @@ class IncomeStatementDAO(PostgresDAOBase):
                            n_income,
                            ROW_NUMBER() OVER (PARTITION BY ts_code ORDER BY end_date DESC, ann_date DESC) AS rn
                     FROM {schema}.{table}
+                    {where_clause}
                 ) ranked
                 WHERE rn <= %s
                 ORDER BY ts_code, end_date
@@ -129,13 +130,44 @@ class IncomeStatementDAO(PostgresDAOBase):
             ).format(
                 schema=sql.Identifier(self.config.schema),
                 table=sql.Identifier(self._table_name),
+                where_clause=sql.SQL("WHERE ts_code = ANY(%s)") if codes is not None else sql.SQL(""),
             )
+            params: tuple[object, ...] = (list(codes), per_code) if codes is not None else (per_code,)
             query_str = query.as_string(conn)
-            frame = pd.read_sql_query(query_str, conn, params=(per_code,))
+            frame = pd.read_sql_query(query_str, conn, params=params)
         frame["ann_date"] = pd.to_datetime(frame["ann_date"], errors="coerce")
         frame["end_date"] = pd.to_datetime(frame["end_date"], errors="coerce")
         return frame
 
+    def codes_updated_since(self, since: datetime) -> List[str]:
+        """Return codes with at least one row written after ``since``."""
+        query = sql.SQL(
+            "SELECT DISTINCT ts_code FROM {schema}.{table} WHERE updated_at > %s"
+        ).format(
+            schema=sql.Identifier(self.config.schema),
+            table=sql.Identifier(self._table_name),
+        )
+        with self.connect() as conn:
+            self.ensure_table(conn)
+            with conn.cursor() as cur:
+                cur.execute(query, (since,))
+                rows = cur.fetchall()
+        return [row[0] for row in rows if row[0]]
+
+    def latest_ann_date(self) -> Optional[date]:
+        """Return the most recent announcement date stored across all securities."""
+        with self.connect() as conn:
+            self.ensure_table(conn)
+            with conn.cursor() as cur:
+                cur.execute(
+                    sql.SQL("SELECT MAX(ann_date) FROM {schema}.{table}").format(
+                        schema=sql.Identifier(self.config.schema),
+                        table=sql.Identifier(self._table_name),
+                    )
+                )
+                latest = cur.fetchone()[0]
+        return latest
+
     def latest_period_end(self) -> Optional[date]:
         with self.connect() as conn:
             self.ensure_table(conn)
@@ -149,11 +181,8 @@ class IncomeStatementDAO(PostgresDAOBase):
                 latest = cur.fetchone()[0]
         return latest
 
-    def fetch_latest_statements(self, codes: Sequence[str]) -> Dict[str, dict]:
-        if not codes:
-            return {}
-
-        query = sql.SQL(
+    def _latest_statements_query(self) -> sql.Composed:
+        return sql.SQL(
             """
             SELECT DISTINCT ON (ts_code)
                    ts_code,
@@ -172,12 +201,8 @@ class IncomeStatementDAO(PostgresDAOBase):
             table=sql.Identifier(self._table_name),
         )
 
-        with self.connect() as conn:
-            self.ensure_table(conn)
-            with conn.cursor() as cur:
-                cur.execute(query, (list(codes),))
-                rows = cur.fetchall()
-
+    @staticmethod
+    def _latest_statements_from_rows(rows: Sequence[Sequence[object]]) -> Dict[str, dict]:
         statements: Dict[str, dict] = {}
         for (
             ts_code,
@@ -198,6 +223,18 @@ class IncomeStatementDAO(PostgresDAOBase):
             }
         return statements
 
+    def fetch_latest_statements(self, codes: Sequence[str]) -> Dict[str, dict]:
+        if not codes:
+            return {}
+        rows = self._fetch_all(self._latest_statements_query(), (list(codes),))
+        return self._latest_statements_from_rows(rows)
+
+    async def fetch_latest_statements_async(self, codes: Sequence[str]) -> Dict[str, dict]:
+        if not codes:
+            return {}
+        rows = await self._fetch_all_async(self._latest_statements_query(), (list(codes),))
+        return self._latest_statements_from_rows(rows)
+
     def latest_ann_dates(
         self,
         codes: Sequence[str] | None = None,
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import date
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence
 
 import pandas as pd
 from psycopg2 import sql
@@ -145,6 +145,64 @@ class IndexHistoryDAO(PostgresDAOBase):
         ]
         return [{column: value for column, value in zip(columns, row)} for row in rows]
 
+    def list_history_many(
+        self,
+        index_codes: Sequence[str],
+        *,
+        limit: int = 10,
+    ) -> Dict[str, List[Dict[str, object]]]:
+        """Return the latest ``limit`` bars for each index code in a single query."""
+        codes = [code for code in dict.fromkeys(index_codes) if code]
+        if not codes:
+            return {}
+        limit_value = max(1, min(int(limit), 2000))
+        columns = [
+            "index_code",
+            "index_name",
+            "trade_date",
+            "open",
+            "close",
+            "high",
+            "low",
+            "volume",
+            "amount",
+            "amplitude",
+            "pct_change",
+            "change_amount",
+            "turnover",
+        ]
+
+        with self.connect() as conn:
+            self.ensure_table(conn)
+            with conn.cursor() as cur:
+                cur.execute(
+                    sql.SQL(
+                        """
+                        SELECT {columns}
+                        FROM (
+                            SELECT {columns},
+                                   ROW_NUMBER() OVER (PARTITION BY index_code ORDER BY trade_date DESC) AS rn
+                            FROM {schema}.{table}
+                            WHERE index_code = ANY(%s)
+                        ) AS ranked
+                        WHERE rn <= %s
+                        ORDER BY index_code, trade_date DESC
+                        """
+                    ).format(
+                        columns=sql.SQL(", ").join(sql.Identifier(column) for column in columns),
+                        schema=sql.Identifier(self.config.schema),
+                        table=sql.Identifier(self._table_name),
+                    ),
+                    (codes, limit_value),
+                )
+                rows = cur.fetchall()
+
+        history: Dict[str, List[Dict[str, object]]] = {code: [] for code in codes}
+        for row in rows:
+            record = {column: value for column, value in zip(columns, row)}
+            history.setdefault(record["index_code"], []).append(record)
+        return history
+
     def stats(self, index_code: Optional[str] = None) -> Dict[str, object]:
         with self.connect() as conn:
             self.ensure_table(conn)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime, time, timedelta
+from datetime import date
 from pathlib import Path
 from threading import Lock
 from typing import Dict, List, Optional, Sequence
@@ -41,6 +41,50 @@ INDICATOR_SCREENING_COLUMNS: Sequence[str] = (
     "high_price",
     "low_price",
 )
+LATEST_ENTRY_COLUMNS: Sequence[str] = (
+    "indicator_code",
+    "indicator_name",
+    "captured_at",
+    *INDICATOR_SCREENING_COLUMNS[3:],
+)
+# Output columns of ``query_full_universe``.
+FULL_UNIVERSE_COLUMNS: Sequence[str] = (
+    "ts_code",
+    "stock_code",
+    "stock_name",
+    "industry",
+    "trade_date",
+    "close",
+    "pct_chg",
+    "turnover_rate",
+    "pe_ratio",
+    "net_income_yoy_latest",
+    "net_income_qoq_latest",
+    "pct_change_1w",
+    "pct_change_1m",
+    "big_deal_net_amount",
+    "big_deal_buy_amount",
+    "big_deal_sell_amount",
+    "big_deal_trade_count",
+    "indicator_code",
+    "indicator_name",
+    "indicator_captured_at",
+    "indicator_rank",
+    "indicator_price_change_percent",
+    "indicator_stage_change_percent",
+    "indicator_last_price",
+    "indicator_volume_shares",
+    "indicator_volume_text",
+    "indicator_baseline_volume_shares",
+    "indicator_baseline_volume_text",
+    "indicator_volume_days",
+    "indicator_turnover_percent",
+    "indicator_turnover_rate",
+    "indicator_turnover_amount",
+    "indicator_turnover_amount_text",
+    "indicator_high_price",
+    "indicator_low_price",
+)
 
 
 class IndicatorScreeningDAO(PostgresDAOBase):
@@ -235,17 +279,8 @@ class IndicatorScreeningDAO(PostgresDAOBase):
                 row = cur.fetchone()
                 return row[0] if row else None
 
-    def fetch_latest_entries_for_codes(
-        self,
-        *,
-        indicator_code: str,
-        stock_codes: Sequence[str],
-    ) -> Dict[str, dict[str, object]]:
-        if not indicator_code or not stock_codes:
-            return {}
-
-        columns = ["indicator_code", "indicator_name", "captured_at", *INDICATOR_SCREENING_COLUMNS[3:]]
-        select_list = sql.SQL(", ").join(sql.Identifier(col) for col in columns)
+    def _latest_entries_query(self) -> sql.Composed:
+        select_list = sql.SQL(", ").join(sql.Identifier(col) for col in LATEST_ENTRY_COLUMNS)
 
         latest_captured_sql = sql.SQL(
             "SELECT MAX(captured_at) FROM {schema}.{table} WHERE indicator_code = %s"
@@ -254,7 +289,7 @@ class IndicatorScreeningDAO(PostgresDAOBase):
             table=sql.Identifier(self._table_name),
         )
 
-        query = sql.SQL(
+        return sql.SQL(
             """
             SELECT {columns}
             FROM {schema}.{table} AS s
@@ -269,21 +304,43 @@ class IndicatorScreeningDAO(PostgresDAOBase):
             latest_subquery=latest_captured_sql,
         )
 
-        with self.connect() as conn:
-            self.ensure_table(conn)
-            with conn.cursor() as cur:
-                cur.execute(query, (indicator_code, list(stock_codes), indicator_code))
-                rows = cur.fetchall()
-
+    @staticmethod
+    def _latest_entries_from_rows(rows: Sequence[Sequence[object]]) -> Dict[str, dict[str, object]]:
         results: Dict[str, dict[str, object]] = {}
         for row in rows:
-            record = {column: value for column, value in zip(columns, row)}
+            record = {column: value for column, value in zip(LATEST_ENTRY_COLUMNS, row)}
             stock_code_full = record.get("stock_code_full")
             if stock_code_full:
                 results[str(stock_code_full)] = record
         return results
 
-    def query_full_universe(
+    def fetch_latest_entries_for_codes(
+        self,
+        *,
+        indicator_code: str,
+        stock_codes: Sequence[str],
+    ) -> Dict[str, dict[str, object]]:
+        if not indicator_code or not stock_codes:
+            return {}
+        rows = self._fetch_all(
+            self._latest_entries_query(), (indicator_code, list(stock_codes), indicator_code)
+        )
+        return self._latest_entries_from_rows(rows)
+
+    async def fetch_latest_entries_for_codes_async(
+        self,
+        *,
+        indicator_code: str,
+        stock_codes: Sequence[str],
+    ) -> Dict[str, dict[str, object]]:
+        if not indicator_code or not stock_codes:
+            return {}
+        rows = await self._fetch_all_async(
+            self._latest_entries_query(), (indicator_code, list(stock_codes), indicator_code)
+        )
+        return self._latest_entries_from_rows(rows)
+
+    def _full_universe_queries(
         self,
         *,
         trade_date: date,
@@ -303,7 +360,8 @@ class IndicatorScreeningDAO(PostgresDAOBase):
         pct_change_1m_max: float | None,
         require_big_deal_inflow: bool,
         tables: dict[str, str],
-    ) -> dict[str, object]:
+    ) -> tuple[sql.Composed, list[object], sql.Composed, list[object]]:
+        """Return ``(count_query, count_params, data_query, data_params)`` for the screening CTE."""
         limit = max(1, min(int(limit), MAX_FETCH_LIMIT))
         offset = max(0, int(offset))
         indicator_list = list(dict.fromkeys(indicator_codes or []))
@@ -314,7 +372,7 @@ class IndicatorScreeningDAO(PostgresDAOBase):
         daily_indicator_table = sql.Identifier(tables["daily_indicator"])
         trade_metrics_table = sql.Identifier(tables["daily_trade_metrics"])
         fundamental_table = sql.Identifier(tables["fundamental_metrics"])
-        big_deal_table = sql.Identifier(tables["big_deal"])
+        big_deal_table = sql.Identifier(tables["big_deal_daily"])
 
         indicator_cte = sql.SQL(
             """
@@ -378,24 +436,16 @@ class IndicatorScreeningDAO(PostgresDAOBase):
             """
         ).format(schema=schema_identifier, table=trade_metrics_table)
 
-        start_dt = datetime.combine(trade_date, time.min)
-        end_dt = start_dt + timedelta(days=1)
-        buy_pattern = "买%"
-        sell_pattern = "卖%"
-
         big_deal_cte = sql.SQL(
             """
             big_deal_summary AS (
                 SELECT stock_code,
-                       COALESCE(SUM(CASE WHEN trade_side LIKE %s THEN trade_amount ELSE 0 END), 0) AS buy_amount,
-                       COALESCE(SUM(CASE WHEN trade_side LIKE %s THEN trade_amount ELSE 0 END), 0) AS sell_amount,
-                       COALESCE(SUM(CASE WHEN trade_side LIKE %s THEN trade_amount ELSE 0 END), 0)
-                       - COALESCE(SUM(CASE WHEN trade_side LIKE %s THEN trade_amount ELSE 0 END), 0) AS net_amount,
-                       COUNT(*) AS trade_count
+                       buy_amount,
+                       sell_amount,
+                       net_amount,
+                       trade_count
                 FROM {schema}.{table}
-                WHERE trade_time >= %s
-                  AND trade_time < %s
-                GROUP BY stock_code
+                WHERE trade_date = %s
             )
             """
         ).format(schema=schema_identifier, table=big_deal_table)
@@ -563,62 +613,42 @@ class IndicatorScreeningDAO(PostgresDAOBase):
             + sql.SQL(" LIMIT %s OFFSET %s")
         )
 
-        cte_params = [buy_pattern, sell_pattern, buy_pattern, sell_pattern, start_dt, end_dt]
+        cte_params = [trade_date]
         count_params = cte_params + primary_params + where_params
         data_params = count_params + [limit, offset]
 
-        with self.connect() as conn:
-            self.ensure_table(conn)
-            with conn.cursor() as cur:
-                cur.execute(count_query, count_params)
-                total = cur.fetchone()[0] or 0
-                cur.execute(data_query, data_params)
-                rows = cur.fetchall()
-
-        column_names = [
-            "ts_code",
-            "stock_code",
-            "stock_name",
-            "industry",
-            "trade_date",
-            "close",
-            "pct_chg",
-            "turnover_rate",
-            "pe_ratio",
-            "net_income_yoy_latest",
-            "net_income_qoq_latest",
-            "pct_change_1w",
-            "pct_change_1m",
-            "big_deal_net_amount",
-            "big_deal_buy_amount",
-            "big_deal_sell_amount",
-            "big_deal_trade_count",
-            "indicator_code",
-            "indicator_name",
-            "indicator_captured_at",
-            "indicator_rank",
-            "indicator_price_change_percent",
-            "indicator_stage_change_percent",
-            "indicator_last_price",
-            "indicator_volume_shares",
-            "indicator_volume_text",
-            "indicator_baseline_volume_shares",
-            "indicator_baseline_volume_text",
-            "indicator_volume_days",
-            "indicator_turnover_percent",
-            "indicator_turnover_rate",
-            "indicator_turnover_amount",
-            "indicator_turnover_amount_text",
-            "indicator_high_price",
-            "indicator_low_price",
-        ]
+        return count_query, count_params, data_query, data_params
 
+    @staticmethod
+    def _full_universe_result(total: int, rows: Sequence[Sequence[object]], trade_date: date) -> dict[str, object]:
         items: list[dict[str, object]] = [
-            {column: value for column, value in zip(column_names, row)} for row in rows
+            {column: value for column, value in zip(FULL_UNIVERSE_COLUMNS, row)} for row in rows
         ]
-
         return {
             "total": int(total),
             "items": items,
             "trade_date": trade_date,
         }
+
+    def query_full_universe(self, *, trade_date: date, **filters: object) -> dict[str, object]:
+        """Screen the full universe for ``trade_date``; see ``_full_universe_queries`` for filters."""
+        count_query, count_params, data_query, data_params = self._full_universe_queries(
+            trade_date=trade_date, **filters
+        )
+        with self.connect() as conn:
+            self.ensure_table(conn)
+            with conn.cursor() as cur:
+                cur.execute(count_query, count_params)
+                total = cur.fetchone()[0] or 0
+                cur.execute(data_query, data_params)
+                rows = cur.fetchall()
+        return self._full_universe_result(total, rows, trade_date)
+
+    async def query_full_universe_async(self, *, trade_date: date, **filters: object) -> dict[str, object]:
+        count_query, count_params, data_query, data_params = self._full_universe_queries(
+            trade_date=trade_date, **filters
+        )
+        count_rows, rows = await self._fetch_snapshot_async(
+            [(count_query, count_params), (data_query, data_params)]
+        )
+        return self._full_universe_result(count_rows[0][0] or 0, rows, trade_date)
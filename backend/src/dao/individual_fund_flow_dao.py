@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Sequence
+from typing import Dict, List, Optional, Sequence
 
 import math
 import pandas as pd
@@ -96,6 +96,24 @@ class IndividualFundFlowDAO(PostgresDAOBase):
                 count, last_updated = cur.fetchone()
         return {"count": count or 0, "updated_at": last_updated}
 
+    def latest_updated_at_for_codes(self, stock_codes: Sequence[str]) -> Dict[str, datetime]:
+        """Return when each code's fund-flow rows were last written (time zone aware).
+
+        ``updated_at`` holds ``CURRENT_TIMESTAMP`` in the session time zone, so it is
+        tagged with that zone before leaving the database.
+        """
+        if not stock_codes:
+            return {}
+        query = sql.SQL(
+            "SELECT stock_code, MAX(updated_at) AT TIME ZONE current_setting('TimeZone') FROM {schema}.{table} "
+            "WHERE stock_code = ANY(%s) GROUP BY stock_code"
+        ).format(
+            schema=sql.Identifier(self.config.schema),
+            table=sql.Identifier(self._table_name),
+        )
+        rows = self._fetch_all(query, (list(stock_codes),))
+        return {code: updated_at for code, updated_at in rows if updated_at is not None}
+
     def list_entries(
         self,
         *,
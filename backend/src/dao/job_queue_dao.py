@@ -0,0 +1,130 @@
+"""
+DAO for the job queue shared by the API process and the scheduler worker.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from psycopg2 import sql
+from psycopg2.extensions import connection as PGConnection
+
+from ..config.settings import PostgresSettings
+from .base import PostgresDAOBase
+
+SCHEMA_SQL_PATH = Path(__file__).resolve().parents[2] / "config" / "job_queue_schema.sql"
+
+JOB_QUEUE_FIELDS = ("id", "job", "payload", "status", "detail", "enqueued_at", "claimed_at", "finished_at")
+
+
+class JobQueueDAO(PostgresDAOBase):
+    """Persistence helper for queued sync/insight job requests.
+
+    At most one row per job is ``queued`` at a time (a partial unique index), so repeated
+    clicks on the control panel collapse into a single run. Workers claim rows with
+    ``FOR UPDATE SKIP LOCKED`` and record the outcome of the hand-off.
+    """
+
+    def __init__(self, config: PostgresSettings, table_name: Optional[str] = None) -> None:
+        super().__init__(config=config)
+        self._table_name = table_name or getattr(config, "job_queue_table", "job_queue")
+        self._schema_sql_template = SCHEMA_SQL_PATH.read_text(encoding="utf-8")
+        self._table_ready = False
+
+    def ensure_table(self, conn: PGConnection) -> None:
+        if self._table_ready:
+            return
+        self._execute_schema_template(
+            conn,
+            self._schema_sql_template,
+            schema=self.config.schema,
+            table=self._table_name,
+            index_pending=f"{self._table_name}_pending_job_uidx",
+            index_status=f"{self._table_name}_status_idx",
+        )
+        self._table_ready = True
+
+    def _format(self, template: str) -> sql.Composed:
+        return sql.SQL(template).format(
+            schema=sql.Identifier(self.config.schema),
+            table=sql.Identifier(self._table_name),
+        )
+
+    def enqueue(self, job: str, payload: Optional[Dict[str, Any]] = None) -> Optional[int]:
+        """Queue ``job``; returns the new row id, or ``None`` if it is already queued."""
+        with self.connect() as conn:
+            self.ensure_table(conn)
+            with conn.cursor() as cur:
+                cur.execute(
+                    self._format(
+                        "INSERT INTO {schema}.{table} (job, payload) VALUES (%s, %s::jsonb) "
+                        "ON CONFLICT (job) WHERE status = 'queued' DO NOTHING "
+                        "RETURNING id"
+                    ),
+                    (job, json.dumps(payload or {}, ensure_ascii=False)),
+                )
+                row = cur.fetchone()
+        return int(row[0]) if row else None
+
+    def claim_next(self) -> Optional[Dict[str, Any]]:
+        """Mark the oldest queued row as ``claimed`` and return it (``None`` when idle)."""
+        with self.connect() as conn:
+            self.ensure_table(conn)
+            with conn.cursor() as cur:
+                cur.execute(
+                    self._format(
+                        "UPDATE {schema}.{table} SET status = 'claimed', claimed_at = CURRENT_TIMESTAMP "
+                        "WHERE id = ("
+                        "SELECT id FROM {schema}.{table} WHERE status = 'queued' "
+                        "ORDER BY id LIMIT 1 FOR UPDATE SKIP LOCKED"
+                        ") RETURNING " + ", ".join(JOB_QUEUE_FIELDS)
+                    )
+                )
+                row = cur.fetchone()
+        if row is None:
+            return None
+        record = dict(zip(JOB_QUEUE_FIELDS, row))
+        if isinstance(record["payload"], str):
+            record["payload"] = json.loads(record["payload"])
+        return record
+
+    def mark_finished(self, job_id: int, *, status: str, detail: Optional[str] = None) -> None:
+        """Record how the worker handled a claimed row (``started``, ``rejected`` or ``failed``)."""
+        with self.connect() as conn:
+            self.ensure_table(conn)
+            with conn.cursor() as cur:
+                cur.execute(
+                    self._format(
+                        "UPDATE {schema}.{table} SET status = %s, detail = %s, "
+                        "finished_at = CURRENT_TIMESTAMP WHERE id = %s"
+                    ),
+                    (status, detail, job_id),
+                )
+
+    def list_recent(self, limit: int = 50) -> List[Dict[str, Any]]:
+        rows = self._fetch_all(
+            self._format(
+                "SELECT " + ", ".join(JOB_QUEUE_FIELDS) + " FROM {schema}.{table} ORDER BY id DESC LIMIT %s"
+            ),
+            (limit,),
+        )
+        return [dict(zip(JOB_QUEUE_FIELDS, row)) for row in rows]
+
+    def purge_finished(self, keep_days: int = 7) -> int:
+        """Delete handled rows older than ``keep_days``; returns the number removed."""
+        with self.connect() as conn:
+            self.ensure_table(conn)
+            with conn.cursor() as cur:
+                cur.execute(
+                    self._format(
+                        "DELETE FROM {schema}.{table} WHERE status NOT IN ('queued', 'claimed') "
+                        "AND enqueued_at < CURRENT_TIMESTAMP - make_interval(days => %s)"
+                    ),
+                    (int(keep_days),),
+                )
+                return cur.rowcount or 0
+
+
+__all__ = ["JobQueueDAO", "JOB_QUEUE_FIELDS"]
@@ -60,6 +60,8 @@ class NewsArticleDAO(PostgresDAOBase):
             table=self._table_name,
             table_source_item_idx=f"{self._table_name}_source_item_idx",
             table_status_idx=f"{self._table_name}_status_idx",
+            table_published_idx=f"{self._table_name}_published_idx",
+            table_source_published_idx=f"{self._table_name}_source_published_idx",
         )
 
     def upsert(self, dataframe: pd.DataFrame) -> int:
@@ -39,6 +39,26 @@ DATE_COLUMNS: tuple[str, ...] = (
     "impact_checked_at",
 )
 
+TAG_COLUMNS: tuple[str, ...] = (
+    "impact_levels",
+    "impact_markets",
+    "impact_industries",
+    "impact_sectors",
+    "impact_themes",
+    "impact_stocks",
+)
+
+# Tag columns filtered with containment/existence operators get a GIN index.
+INDEXED_TAG_COLUMNS: tuple[str, ...] = (
+    "impact_levels",
+    "impact_industries",
+    "impact_sectors",
+    "impact_themes",
+    "impact_stocks",
+)
+
+_MIGRATED_TABLES: set[tuple[str, str]] = set()
+
 
 class NewsInsightDAO(PostgresDAOBase):
     """Persistence helper for LLM-driven news insights."""
@@ -56,6 +76,53 @@ class NewsInsightDAO(PostgresDAOBase):
             table=self._table_name,
             table_relevance_idx=f"{self._table_name}_relevance_idx",
         )
+        key = (self.config.schema, self._table_name)
+        if key in _MIGRATED_TABLES:
+            return
+        self._migrate_tag_columns(conn)
+        with conn.cursor() as cur:
+            for column in INDEXED_TAG_COLUMNS:
+                cur.execute(
+                    sql.SQL("CREATE INDEX IF NOT EXISTS {index} ON {schema}.{table} USING GIN ({column})").format(
+                        index=sql.Identifier(f"{self._table_name}_{column}_gin_idx"),
+                        schema=sql.Identifier(self.config.schema),
+                        table=sql.Identifier(self._table_name),
+                        column=sql.Identifier(column),
+                    )
+                )
+        _MIGRATED_TABLES.add(key)
+
+    def _migrate_tag_columns(self, conn) -> None:
+        """Convert legacy JSON-in-TEXT tag columns to ``JSONB`` in a single rewrite."""
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT column_name
+                FROM information_schema.columns
+                WHERE table_schema = %s AND table_name = %s AND data_type = 'text'
+                """,
+                (self.config.schema, self._table_name),
+            )
+            legacy_columns = [row[0] for row in cur.fetchall() if row[0] in TAG_COLUMNS]
+            if not legacy_columns:
+                return
+            # Rows written before JSON serialisation hold comma-separated text.
+            changes = [
+                sql.SQL(
+                    "ALTER COLUMN {column} TYPE JSONB USING CASE "
+                    "WHEN {column} IS NULL OR btrim({column}) = '' THEN NULL "
+                    "WHEN left(btrim({column}), 1) = '[' THEN {column}::jsonb "
+                    "ELSE to_jsonb(regexp_split_to_array(btrim({column}), '\\s*,\\s*')) END"
+                ).format(column=sql.Identifier(column))
+                for column in legacy_columns
+            ]
+            cur.execute(
+                sql.SQL("ALTER TABLE {schema}.{table} {changes}").format(
+                    schema=sql.Identifier(self.config.schema),
+                    table=sql.Identifier(self._table_name),
+                    changes=sql.SQL(", ").join(changes),
+                )
+            )
 
     def upsert(self, dataframe: pd.DataFrame) -> int:
         if dataframe.empty:
@@ -134,9 +201,11 @@ class NewsInsightDAO(PostgresDAOBase):
         return result
 
     @staticmethod
-    def _decode_array(value: Optional[str]) -> List[str]:
+    def _decode_array(value: object) -> List[str]:
         if not value:
             return []
+        if isinstance(value, (list, tuple)):
+            return [str(item).strip() for item in value if str(item).strip()]
         try:
             data = json.loads(value)
             if isinstance(data, list):
@@ -162,6 +162,28 @@ class PerformanceExpressDAO(PostgresDAOBase):
 
         return {ts_code: ann_date for ts_code, ann_date in rows}
 
+    def list_codes_announced_between(self, start_date: date, end_date: date) -> List[str]:
+        """Return ``ts_code`` values with an announcement dated within ``[start_date, end_date]``."""
+        query = sql.SQL(
+            """
+            SELECT DISTINCT ts_code
+            FROM {schema}.{table}
+            WHERE announcement_date BETWEEN %s AND %s
+              AND ts_code IS NOT NULL
+              AND ts_code <> ''
+            ORDER BY ts_code
+            """
+        ).format(
+            schema=sql.Identifier(self.config.schema),
+            table=sql.Identifier(self._table_name),
+        )
+        with self.connect() as conn:
+            self.ensure_table(conn)
+            with conn.cursor() as cur:
+                cur.execute(query, (start_date, end_date))
+                rows = cur.fetchall()
+        return [row[0] for row in rows]
+
     def list_entries(
         self,
         *,
@@ -111,23 +111,20 @@ class StockBasicDAO(PostgresDAOBase):
 
         return [row[0] for row in rows]
 
-    def query_fundamentals(
+    def _fundamentals_queries(
         self,
         *,
-        keyword: str | None = None,
-        market: str | None = None,
-        industry: str | None = None,
-        exchange: str | None = None,
-        include_st: bool = True,
-        include_delisted: bool = True,
-        limit: int = 50,
-        offset: int = 0,
-        codes: Sequence[str] | None = None,
-        filters: dict[str, object] | None = None,
-    ) -> dict[str, object]:
-        """
-        Retrieve stock fundamentals with optional filtering and pagination.
-        """
+        keyword: str | None,
+        market: str | None,
+        industry: str | None,
+        exchange: str | None,
+        include_st: bool,
+        include_delisted: bool,
+        limit: int | None,
+        offset: int,
+        codes: Sequence[str] | None,
+    ) -> tuple[sql.Composed, list[object], sql.Composed, list[object]]:
+        """Return ``(query, query_params, count_query, count_params)`` for ``query_fundamentals``."""
         select_base = sql.SQL(
             """
             SELECT ts_code, name, industry, market, exchange, list_status
@@ -207,6 +204,51 @@ class StockBasicDAO(PostgresDAOBase):
 
         count_query = count_base + where_clause
         count_params = params.copy()
+        return query, query_params, count_query, count_params
+
+    @staticmethod
+    def _fundamentals_from_rows(total: int, rows: Sequence[Sequence[object]]) -> dict[str, object]:
+        items = [
+            {
+                "code": row[0],
+                "name": row[1],
+                "industry": row[2],
+                "market": row[3],
+                "exchange": row[4],
+                "status": row[5],
+            }
+            for row in rows
+        ]
+        return {"total": total, "items": items}
+
+    def query_fundamentals(
+        self,
+        *,
+        keyword: str | None = None,
+        market: str | None = None,
+        industry: str | None = None,
+        exchange: str | None = None,
+        include_st: bool = True,
+        include_delisted: bool = True,
+        limit: int = 50,
+        offset: int = 0,
+        codes: Sequence[str] | None = None,
+        filters: dict[str, object] | None = None,
+    ) -> dict[str, object]:
+        """
+        Retrieve stock fundamentals with optional filtering and pagination.
+        """
+        query, query_params, count_query, count_params = self._fundamentals_queries(
+            keyword=keyword,
+            market=market,
+            industry=industry,
+            exchange=exchange,
+            include_st=include_st,
+            include_delisted=include_delisted,
+            limit=limit,
+            offset=offset,
+            codes=codes,
+        )
 
         with self.connect() as conn:
             self.ensure_table(conn)
@@ -216,18 +258,64 @@ class StockBasicDAO(PostgresDAOBase):
                 cur.execute(query, query_params)
                 rows = cur.fetchall()
 
-        items = [
+        return self._fundamentals_from_rows(total, rows)
+
+    async def query_fundamentals_async(
+        self,
+        *,
+        keyword: str | None = None,
+        market: str | None = None,
+        industry: str | None = None,
+        exchange: str | None = None,
+        include_st: bool = True,
+        include_delisted: bool = True,
+        limit: int = 50,
+        offset: int = 0,
+        codes: Sequence[str] | None = None,
+    ) -> dict[str, object]:
+        query, query_params, count_query, count_params = self._fundamentals_queries(
+            keyword=keyword,
+            market=market,
+            industry=industry,
+            exchange=exchange,
+            include_st=include_st,
+            include_delisted=include_delisted,
+            limit=limit,
+            offset=offset,
+            codes=codes,
+        )
+        count_rows, rows = await self._fetch_snapshot_async([(count_query, count_params), (query, query_params)])
+        return self._fundamentals_from_rows(count_rows[0][0], rows)
+
+    def list_search_entries(self) -> List[dict[str, object]]:
+        """Return the identifying columns of every stock, used to build the search index."""
+        query = sql.SQL(
+            """
+            SELECT ts_code, symbol, name, industry, market, exchange, list_status
+            FROM {schema}.{table}
+            ORDER BY ts_code
+            """
+        ).format(
+            schema=sql.Identifier(self.config.schema),
+            table=sql.Identifier(self.config.stock_table),
+        )
+        with self.connect() as conn:
+            self.ensure_table(conn)
+            with conn.cursor() as cur:
+                cur.execute(query)
+                rows = cur.fetchall()
+        return [
             {
                 "code": row[0],
-                "name": row[1],
-                "industry": row[2],
-                "market": row[3],
-                "exchange": row[4],
-                "status": row[5],
+                "symbol": row[1],
+                "name": row[2],
+                "industry": row[3],
+                "market": row[4],
+                "exchange": row[5],
+                "status": row[6],
             }
             for row in rows
         ]
-        return {"total": total, "items": items}
 
     def fetch_names(self, codes: Sequence[str]) -> dict[str, str]:
         unique = sorted({(code or "").strip().upper() for code in codes if code})
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from psycopg2 import sql
 from psycopg2.extras import Json, execute_values
@@ -191,6 +191,24 @@ class StockNewsDAO(PostgresDAOBase):
                 row = cur.fetchone()
         return row[0] if row else None
 
+    def latest_created_at_for_codes(self, stock_codes: Sequence[str]) -> Dict[str, datetime]:
+        """Return when the newest stored article of each code was first inserted (time zone aware).
+
+        ``created_at`` holds ``CURRENT_TIMESTAMP`` in the session time zone, so it is
+        tagged with that zone before leaving the database.
+        """
+        if not stock_codes:
+            return {}
+        query = sql.SQL(
+            "SELECT stock_code, MAX(created_at) AT TIME ZONE current_setting('TimeZone') FROM {schema}.{table} "
+            "WHERE stock_code = ANY(%s) GROUP BY stock_code"
+        ).format(
+            schema=sql.Identifier(self.config.schema),
+            table=sql.Identifier(self._table_name),
+        )
+        rows = self._fetch_all(query, (list(stock_codes),))
+        return {code: created_at for code, created_at in rows if created_at is not None}
+
     def list_since(
         self,
         stock_code: str,
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Sequence
 
 from psycopg2 import sql
 from psycopg2.extras import Json
@@ -112,6 +112,20 @@ class StockValuationAnalysisDAO(PostgresDAOBase):
             return None
         return self._row_to_dict(row)
 
+    def fetch_latest_generated_at(self, stock_codes: Sequence[str]) -> Dict[str, datetime]:
+        """Return the most recent ``generated_at`` of each code that has a snapshot."""
+        if not stock_codes:
+            return {}
+        query = sql.SQL(
+            "SELECT stock_code, MAX(generated_at) FROM {schema}.{table} "
+            "WHERE stock_code = ANY(%s) GROUP BY stock_code"
+        ).format(
+            schema=sql.Identifier(self.config.schema),
+            table=sql.Identifier(self._table_name),
+        )
+        rows = self._fetch_all(query, (list(stock_codes),))
+        return {code: generated_at for code, generated_at in rows if generated_at is not None}
+
     def list_history(
         self,
         stock_code: str,
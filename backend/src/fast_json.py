@@ -0,0 +1,60 @@
+"""
+orjson fast path for large API payloads.
+
+Endpoints that build their ``response_model`` instance themselves can return
+``fast_json_response(model)`` instead of the model. FastAPI returns ``Response``
+objects untouched, so the already-validated model is not validated a second time
+or walked by ``jsonable_encoder``; it is dumped by alias and serialized with orjson.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any
+
+import numpy as np
+import orjson
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.dict(by_alias=True)
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize ``content`` (models, dicts, lists) to JSON bytes with orjson."""
+    if isinstance(content, BaseModel):
+        content = content.dict(by_alias=True)
+    return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+
+
+class ORJSONModelResponse(JSONResponse):
+    """JSON response rendered with orjson; accepts pydantic models directly."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def fast_json_response(content: Any, *, status_code: int = 200) -> ORJSONModelResponse:
+    return ORJSONModelResponse(content=content, status_code=status_code)
+
+
+__all__ = [
+    "ORJSONModelResponse",
+    "dumps",
+    "fast_json_response",
+]
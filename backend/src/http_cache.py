@@ -0,0 +1,247 @@
+"""
+Conditional-request caching for read-mostly GET endpoints.
+
+Each cached path is tied to the sync jobs that write its data. The version of a
+response is derived from those jobs' completion times in ``SyncMonitor`` (plus a
+local generation bumped by any write request under the same top-level path), so a
+cached body stays valid until one of its source jobs finishes again. Responses carry
+``ETag``/``Last-Modified``/``Cache-Control`` and conditional requests whose ETag
+still matches are answered with ``304 Not Modified`` without running the handler.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from fastapi import Request
+from starlette.responses import Response
+
+from .state import SyncMonitor, monitor
+
+LOCAL_TZ = ZoneInfo("Asia/Shanghai")
+
+DEFAULT_MAX_AGE_SECONDS = 30
+DEFAULT_TTL_SECONDS = 600
+DEFAULT_MAX_ENTRIES = 256
+
+_MARKET_OVERVIEW_JOBS = (
+    "realtime_index",
+    "index_history",
+    "market_insight",
+    "macro_insight",
+    "market_fund_flow",
+    "margin_account",
+    "peripheral_insight",
+    "market_activity",
+)
+_SCREENING_JOBS = (
+    "daily_trade",
+    "daily_trade_metrics",
+    "daily_indicator",
+    "fundamental_metrics",
+    "big_deal_fund_flow",
+    "realtime_trade",
+)
+
+# Exact GET path -> sync jobs whose completion changes the response.
+CACHED_ENDPOINT_JOBS: Dict[str, Tuple[str, ...]] = {
+    "/market/overview": _MARKET_OVERVIEW_JOBS,
+    "/markets/realtime-indices": ("realtime_index",),
+    "/markets/index-history": ("index_history",),
+    "/macro/global-indices": ("global_index",),
+    "/macro/global-indices/history": ("global_index",),
+    "/macro/dollar-index": ("dollar_index",),
+    "/macro/rmb-midpoint": ("rmb_midpoint",),
+    "/macro/futures-realtime": ("futures_realtime",),
+    "/macro/fed-statements": ("fed_statements",),
+    "/macro/leverage-ratio": ("leverage_ratio",),
+    "/macro/social-financing": ("social_financing",),
+    "/macro/cpi": ("cpi_monthly",),
+    "/macro/pmi": ("pmi_monthly",),
+    "/macro/m2": ("m2_monthly",),
+    "/macro/ppi": ("ppi_monthly",),
+    "/macro/lpr": ("lpr_rate",),
+    "/macro/pbc-rate": ("lpr_rate",),
+    "/macro/shibor": ("shibor_rate",),
+    "/macro/insight": ("macro_insight",),
+    "/macro/insight/history": ("macro_insight",),
+    "/fund-flow/industry": ("industry_fund_flow",),
+    "/fund-flow/concept": ("concept_fund_flow",),
+    "/fund-flow/sector-hotlist": ("industry_fund_flow", "concept_fund_flow"),
+    "/fund-flow/individual": ("individual_fund_flow",),
+    "/fund-flow/big-deal": ("big_deal_fund_flow",),
+    "/fund-flow/market": ("market_fund_flow",),
+    "/market/activity": ("market_activity",),
+    "/market/concept-index-history": ("concept_index_history",),
+    "/market/industry-insight": ("industry_insight",),
+    "/market/industry-insight/history": ("industry_insight",),
+    "/market/concept-insight": ("concept_insight",),
+    "/market/concept-insight/history": ("concept_insight",),
+    "/market/market-insight": ("market_insight",),
+    "/market/market-insight/history": ("market_insight",),
+    "/indicator-screenings": _SCREENING_JOBS,
+    "/indicator-screenings/continuous-volume": _SCREENING_JOBS,
+}
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    version: str
+    etag: str
+    body: bytes
+    media_type: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+
+
+def _top_level(path: str) -> str:
+    return "/" + path.strip("/").split("/", 1)[0]
+
+
+def _http_date(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=LOCAL_TZ)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+    candidates = {item.strip() for item in header.split(",")}
+    return "*" in candidates or etag in candidates or etag.removeprefix("W/") in candidates
+
+
+class ResponseCache:
+    """In-process LRU of serialized GET bodies keyed by path and query string."""
+
+    def __init__(
+        self,
+        endpoint_jobs: Mapping[str, Iterable[str]],
+        *,
+        sync_monitor: SyncMonitor = monitor,
+        max_age_seconds: int = DEFAULT_MAX_AGE_SECONDS,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        self._endpoint_jobs = {path: tuple(jobs) for path, jobs in endpoint_jobs.items()}
+        self._monitor = sync_monitor
+        self._max_age_seconds = max_age_seconds
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def is_cached_path(self, path: str) -> bool:
+        return path in self._endpoint_jobs
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Invalidate every cached path under ``path``'s top-level segment (or everything)."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                return
+            group = _top_level(path)
+            self._generations[group] = self._generations.get(group, 0) + 1
+
+    def version(self, path: str) -> Tuple[str, Optional[datetime]]:
+        finished = [self._monitor.finished_at(job) for job in self._endpoint_jobs.get(path, ())]
+        with self._lock:
+            generation = self._generations.get(_top_level(path), 0)
+        stamps = ",".join(value.isoformat() if value else "-" for value in finished)
+        latest = max((value for value in finished if value is not None), default=None)
+        return f"{generation}|{stamps}", latest
+
+    def lookup(self, key: str, version: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.version != version or time.monotonic() - entry.stored_at > self._ttl_seconds:
+                self._entries.pop(key, None)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def store(
+        self,
+        key: str,
+        version: str,
+        body: bytes,
+        *,
+        media_type: Optional[str],
+        last_modified: Optional[datetime],
+    ) -> CachedResponse:
+        entry = CachedResponse(
+            version=version,
+            etag=f'W/"{hashlib.sha1(body).hexdigest()[:20]}"',
+            body=body,
+            media_type=media_type,
+            last_modified=_http_date(last_modified) if last_modified else None,
+            stored_at=time.monotonic(),
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def headers(self, entry: CachedResponse) -> Dict[str, str]:
+        headers = {
+            "ETag": entry.etag,
+            "Cache-Control": f"private, max-age={self._max_age_seconds}, must-revalidate",
+        }
+        if entry.last_modified:
+            headers["Last-Modified"] = entry.last_modified
+        return headers
+
+    async def handle(self, request: Request, call_next) -> Response:
+        """``@app.middleware("http")`` entry point."""
+        path = request.url.path
+        if request.method not in ("GET", "HEAD"):
+            response = await call_next(request)
+            if response.status_code < 400:
+                self.invalidate(path)
+            return response
+        if not self.is_cached_path(path):
+            return await call_next(request)
+
+        key = f"{path}?{request.url.query}"
+        version, last_modified = self.version(path)
+        entry = self.lookup(key, version)
+        if entry is None:
+            response = await call_next(request)
+            if response.status_code != 200:
+                return response
+            body = b"".join([chunk async for chunk in response.body_iterator])
+            entry = self.store(
+                key,
+                version,
+                body,
+                media_type=response.media_type or response.headers.get("content-type"),
+                last_modified=last_modified,
+            )
+
+        headers = self.headers(entry)
+        if _etag_matches(request.headers.get("if-none-match"), entry.etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=entry.body, media_type=entry.media_type, headers=headers)
+
+
+response_cache = ResponseCache(CACHED_ENDPOINT_JOBS)
+
+
+__all__ = [
+    "CACHED_ENDPOINT_JOBS",
+    "ResponseCache",
+    "response_cache",
+]
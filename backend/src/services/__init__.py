@@ -1,178 +1,247 @@
-# Service package exports.
+"""Service package exports.
 
-from .daily_indicator_service import sync_daily_indicator
-from .income_statement_service import sync_income_statements
-from .financial_indicator_service import sync_financial_indicators
-from .finance_breakfast_service import sync_finance_breakfast
-from .performance_express_service import list_performance_express, sync_performance_express
-from .performance_forecast_service import list_performance_forecast, sync_performance_forecast
-from .profit_forecast_service import list_profit_forecast, sync_profit_forecast
-from .global_index_service import list_global_indices, list_global_index_history, sync_global_indices
-from .dollar_index_service import list_dollar_index, sync_dollar_index
-from .rmb_midpoint_service import list_rmb_midpoint_rates, sync_rmb_midpoint_rates
-from .futures_realtime_service import list_futures_realtime, sync_futures_realtime
-from .fed_statement_service import list_fed_statements, sync_fed_statements
-from .peripheral_summary_service import generate_peripheral_insight, get_latest_peripheral_insight, list_peripheral_insight_history
-from .macro_leverage_service import list_macro_leverage_ratios, sync_macro_leverage_ratios
-from .social_financing_service import list_social_financing_ratios, sync_social_financing_ratios
-from .macro_cpi_service import list_macro_cpi, sync_macro_cpi
-from .macro_pmi_service import list_macro_pmi, sync_macro_pmi
-from .macro_m2_service import list_macro_m2, sync_macro_m2
-from .macro_ppi_service import list_macro_ppi, sync_macro_ppi
-from .macro_lpr_service import list_macro_lpr, sync_macro_lpr
-from .macro_shibor_service import list_macro_shibor, sync_macro_shibor
-from .daily_trade_service import sync_daily_trade
-from .daily_trade_metrics_service import sync_daily_trade_metrics
-from .stock_basic_service import get_stock_overview, get_stock_detail, sync_stock_basic
-from .fundamental_metrics_service import list_fundamental_metrics, sync_fundamental_metrics
-from .industry_fund_flow_service import list_industry_fund_flow, sync_industry_fund_flow
-from .concept_fund_flow_service import list_concept_fund_flow, sync_concept_fund_flow
-from .concept_index_history_service import list_concept_index_history, sync_concept_index_history
-from .concept_insight_service import (
-    build_concept_snapshot,
-    generate_concept_insight_summary,
-    get_latest_concept_insight,
-    list_concept_insights,
-    list_concept_news,
-)
-from .concept_constituent_service import list_concept_constituents, sync_concept_directory
-from .concept_market_service import (
-    search_concepts,
-    list_all_concepts,
-    list_concept_watchlist,
-    get_concept_status,
-    set_concept_watch_state,
-    delete_concept_watch_entry,
-    refresh_concept_history,
-)
-from .concept_volume_price_service import (
-    build_volume_price_dataset,
-    generate_concept_volume_price_reasoning,
-    get_latest_volume_price_reasoning,
-    list_volume_price_history,
-)
-from .industry_volume_price_service import (
-    build_industry_volume_price_dataset,
-    generate_industry_volume_price_reasoning,
-    get_latest_industry_volume_price_reasoning,
-    list_industry_volume_price_history,
-)
-from .stock_volume_price_service import (
-    build_stock_volume_price_dataset,
-    generate_stock_volume_price_reasoning,
-    get_latest_stock_volume_price_reasoning,
-    list_stock_volume_price_history,
-)
-from .stock_integrated_analysis_service import (
-    build_stock_integrated_context,
-    generate_stock_integrated_analysis,
-    get_latest_stock_integrated_analysis,
-    list_stock_integrated_analysis_history,
-)
-from .stock_valuation_analysis_service import (
-    generate_stock_valuation_analysis,
-    get_latest_stock_valuation_analysis,
-    list_stock_valuation_analysis_history,
-)
-from .cashflow_statement_service import (
-    sync_cashflow_statements,
-    list_cashflow_statements,
-)
-from .balance_sheet_service import (
-    sync_balance_sheets,
-    list_balance_sheets,
-)
-from .research_report_service import (
-    sync_research_reports,
-    list_research_reports,
-    analyze_research_reports,
-    list_research_report_distillation,
-)
-from .industry_directory_service import (
-    list_industry_directory,
-    resolve_industry_label,
-    search_industry_directory,
-)
-from .industry_market_service import (
-    search_industries,
-    list_all_industries,
-    list_industry_watchlist,
-    get_industry_status,
-    set_industry_watch_state,
-    delete_industry_watch_entry,
-    refresh_industry_history,
-)
-from .industry_index_history_service import (
-    sync_industry_index_history,
-    list_industry_index_history,
-)
-from .industry_insight_service import (
-    build_industry_snapshot,
-    generate_industry_insight_summary,
-    get_latest_industry_insight,
-    list_industry_insights,
-    list_industry_news,
-)
-from .individual_fund_flow_service import list_individual_fund_flow, sync_individual_fund_flow
-from .big_deal_fund_flow_service import list_big_deal_fund_flow, sync_big_deal_fund_flow
-from .stock_main_business_service import get_stock_main_business, sync_stock_main_business
-from .stock_main_composition_service import get_stock_main_composition, sync_stock_main_composition
-from .stock_news_service import list_stock_news, sync_stock_news
-from .observation_pool_service import generate_observation_pool
-from .stock_note_service import add_stock_note, list_stock_notes, list_recent_stock_notes
-from .intraday_volume_profile_service import sync_intraday_volume_profiles
-from .global_flash_service import sync_global_flash
-from .news_classification_service import classify_relevance_batch, classify_impact_batch
-from .news_query_service import list_news_articles
-from .market_insight_service import (
-    collect_recent_market_headlines,
-    generate_market_insight_summary,
-    get_latest_market_insight,
-    list_market_insights,
-    STAGE_ORDER as MARKET_INSIGHT_STAGE_ORDER,
-    STAGE_TITLE_MAP as MARKET_INSIGHT_STAGE_TITLES,
-)
-from .index_history_service import INDEX_CONFIG, list_index_history, sync_index_history
-from .realtime_index_service import list_realtime_indices, sync_realtime_indices
-from .trade_calendar_service import sync_trade_calendar, is_trading_day
-from .margin_account_service import list_margin_account_info, sync_margin_account_info
-from .market_activity_service import list_market_activity, sync_market_activity
-from .market_fund_flow_service import list_market_fund_flow, sync_market_fund_flow
-from .macro_insight_service import generate_macro_insight, get_latest_macro_insight, list_macro_insight_history
-from .market_overview_service import build_market_overview_payload
-from .sector_fund_flow_service import build_sector_fund_flow_snapshot
-from .sector_insight_service import (
-    collect_recent_sector_headlines,
-    build_sector_group_snapshot,
-    generate_sector_insight_summary,
-    get_latest_sector_insight,
-    list_sector_insights,
-)
-from .favorite_stock_service import (
-    add_stock_to_favorites,
-    remove_stock_from_favorites,
-    list_favorite_codes,
-    list_favorite_groups,
-    is_stock_favorite,
-    list_favorite_entries,
-    set_favorite_state,
-    get_favorite_status,
-)
-from .indicator_screening_service import (
-    sync_indicator_continuous_volume,
-    sync_indicator_screening,
-    sync_all_indicator_screenings,
-    list_indicator_screenings,
-    run_indicator_realtime_refresh,
-)
-from .investment_journal_service import (
-    upsert_investment_journal_entry,
-    get_investment_journal_entry,
-    list_investment_journal_entries,
-)
+Exports resolve on first access (PEP 562), so importing one service does not import
+every other service module and, through them, every data-source client and DAO.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any, Dict, Tuple
+
+# Submodule -> names it exports.
+_SUBMODULE_EXPORTS: Dict[str, Tuple[str, ...]] = {
+    "daily_indicator_service": ("sync_daily_indicator",),
+    "income_statement_service": ("sync_income_statements",),
+    "financial_indicator_service": ("sync_financial_indicators",),
+    "finance_breakfast_service": ("sync_finance_breakfast",),
+    "performance_express_service": ("list_performance_express", "sync_performance_express"),
+    "performance_forecast_service": ("list_performance_forecast", "sync_performance_forecast"),
+    "profit_forecast_service": ("list_profit_forecast", "sync_profit_forecast"),
+    "global_index_service": (
+        "list_global_indices",
+        "list_global_index_history",
+        "sync_global_indices",
+    ),
+    "dollar_index_service": ("list_dollar_index", "sync_dollar_index"),
+    "rmb_midpoint_service": ("list_rmb_midpoint_rates", "sync_rmb_midpoint_rates"),
+    "futures_realtime_service": ("list_futures_realtime", "sync_futures_realtime"),
+    "fed_statement_service": ("list_fed_statements", "sync_fed_statements"),
+    "peripheral_summary_service": (
+        "generate_peripheral_insight",
+        "get_latest_peripheral_insight",
+        "list_peripheral_insight_history",
+    ),
+    "macro_leverage_service": ("list_macro_leverage_ratios", "sync_macro_leverage_ratios"),
+    "social_financing_service": ("list_social_financing_ratios", "sync_social_financing_ratios"),
+    "macro_cpi_service": ("list_macro_cpi", "sync_macro_cpi"),
+    "macro_pmi_service": ("list_macro_pmi", "sync_macro_pmi"),
+    "macro_m2_service": ("list_macro_m2", "sync_macro_m2"),
+    "macro_ppi_service": ("list_macro_ppi", "sync_macro_ppi"),
+    "macro_lpr_service": ("list_macro_lpr", "sync_macro_lpr"),
+    "macro_shibor_service": ("list_macro_shibor", "sync_macro_shibor"),
+    "daily_trade_service": ("sync_daily_trade",),
+    "daily_trade_metrics_service": ("sync_daily_trade_metrics",),
+    "stock_basic_service": (
+        "get_stock_overview",
+        "get_stock_overview_async",
+        "get_stock_detail",
+        "sync_stock_basic",
+    ),
+    "stock_search_service": ("refresh_stock_search_index", "search_stocks"),
+    "stock_bundle_service": ("gather_sections",),
+    "fundamental_metrics_service": ("list_fundamental_metrics", "sync_fundamental_metrics"),
+    "industry_fund_flow_service": ("list_industry_fund_flow", "sync_industry_fund_flow"),
+    "concept_fund_flow_service": ("list_concept_fund_flow", "sync_concept_fund_flow"),
+    "concept_index_history_service": ("list_concept_index_history", "sync_concept_index_history"),
+    "concept_insight_service": (
+        "build_concept_snapshot",
+        "generate_concept_insight_summary",
+        "get_latest_concept_insight",
+        "list_concept_insights",
+        "list_concept_news",
+    ),
+    "concept_constituent_service": (
+        "list_concept_constituents",
+        "sync_concept_constituents",
+        "sync_concept_directory",
+    ),
+    "concept_membership_service": ("get_concept_membership_index", "refresh_concept_membership_index"),
+    "concept_market_service": (
+        "search_concepts",
+        "list_all_concepts",
+        "list_concept_watchlist",
+        "get_concept_status",
+        "set_concept_watch_state",
+        "delete_concept_watch_entry",
+        "refresh_concept_history",
+    ),
+    "concept_volume_price_service": (
+        "build_volume_price_dataset",
+        "generate_concept_volume_price_reasoning",
+        "get_latest_volume_price_reasoning",
+        "list_volume_price_history",
+    ),
+    "industry_volume_price_service": (
+        "build_industry_volume_price_dataset",
+        "generate_industry_volume_price_reasoning",
+        "get_latest_industry_volume_price_reasoning",
+        "list_industry_volume_price_history",
+    ),
+    "sector_volume_price_service": ("generate_sector_volume_price_batch",),
+    "stock_volume_price_service": (
+        "build_stock_volume_price_dataset",
+        "generate_stock_volume_price_reasoning",
+        "get_latest_stock_volume_price_reasoning",
+        "list_stock_volume_price_history",
+    ),
+    "stock_context_service": (
+        "clear_stock_context",
+        "invalidate_stock_context",
+        "invalidate_stock_context_piece",
+        "prime_stock_context_versions",
+    ),
+    "stock_integrated_analysis_service": (
+        "build_stock_integrated_context",
+        "generate_stock_integrated_analysis",
+        "get_latest_stock_integrated_analysis",
+        "list_stock_integrated_analysis_history",
+    ),
+    "stock_analysis_batch_service": ("generate_stock_analysis_batch", "get_current_stock_analysis"),
+    "stock_valuation_analysis_service": (
+        "generate_stock_valuation_analysis",
+        "get_latest_stock_valuation_analysis",
+        "list_stock_valuation_analysis_history",
+    ),
+    "cashflow_statement_service": ("sync_cashflow_statements", "list_cashflow_statements"),
+    "balance_sheet_service": ("sync_balance_sheets", "list_balance_sheets"),
+    "research_report_service": (
+        "sync_research_reports",
+        "list_research_reports",
+        "analyze_research_reports",
+        "list_research_report_distillation",
+    ),
+    "industry_directory_service": (
+        "list_industry_directory",
+        "resolve_industry_label",
+        "search_industry_directory",
+    ),
+    "industry_market_service": (
+        "search_industries",
+        "list_all_industries",
+        "list_industry_watchlist",
+        "get_industry_status",
+        "set_industry_watch_state",
+        "delete_industry_watch_entry",
+        "refresh_industry_history",
+    ),
+    "industry_index_history_service": (
+        "sync_industry_index_history",
+        "list_industry_index_history",
+    ),
+    "industry_insight_service": (
+        "build_industry_snapshot",
+        "generate_industry_insight_summary",
+        "get_latest_industry_insight",
+        "list_industry_insights",
+        "list_industry_news",
+    ),
+    "individual_fund_flow_service": ("list_individual_fund_flow", "sync_individual_fund_flow"),
+    "big_deal_fund_flow_service": ("list_big_deal_fund_flow", "sync_big_deal_fund_flow"),
+    "stock_main_business_service": ("get_stock_main_business", "sync_stock_main_business"),
+    "stock_main_composition_service": (
+        "get_stock_main_composition",
+        "sync_stock_main_composition",
+    ),
+    "stock_news_service": ("list_stock_news", "sync_stock_news"),
+    "observation_pool_service": ("generate_observation_pool",),
+    "stock_note_service": ("add_stock_note", "list_stock_notes", "list_recent_stock_notes"),
+    "intraday_volume_profile_service": ("sync_intraday_volume_profiles",),
+    "global_flash_service": ("sync_global_flash",),
+    "news_classification_service": ("classify_relevance_batch", "classify_impact_batch"),
+    "news_query_service": ("list_news_articles",),
+    "market_insight_service": (
+        "collect_recent_market_headlines",
+        "generate_market_insight_summary",
+        "get_latest_market_insight",
+        "list_market_insights",
+    ),
+    "index_history_service": ("INDEX_CONFIG", "list_index_history", "sync_index_history"),
+    "realtime_index_service": ("list_realtime_indices", "sync_realtime_indices"),
+    "price_panel_service": (
+        "PricePanel",
+        "load_ohlcv_history",
+        "price_panel_store",
+        "rebuild_price_panel",
+    ),
+    "sector_index_service": ("compute_sector_indices", "sync_sector_indices"),
+    "realtime_quote_service": (
+        "RealtimeQuotePoller",
+        "get_realtime_quote",
+        "list_realtime_quotes",
+        "realtime_quote_store",
+    ),
+    "trade_calendar_service": ("sync_trade_calendar", "is_trading_day"),
+    "margin_account_service": ("list_margin_account_info", "sync_margin_account_info"),
+    "market_activity_service": ("list_market_activity", "sync_market_activity"),
+    "market_fund_flow_service": ("list_market_fund_flow", "sync_market_fund_flow"),
+    "macro_insight_service": (
+        "generate_macro_insight",
+        "get_latest_macro_insight",
+        "list_macro_insight_history",
+    ),
+    "market_overview_service": (
+        "build_market_overview_payload",
+        "invalidate_market_overview_cache",
+        "invalidate_market_overview_on_job",
+    ),
+    "sector_fund_flow_service": ("build_sector_fund_flow_snapshot",),
+    "sector_insight_service": (
+        "collect_recent_sector_headlines",
+        "build_sector_group_snapshot",
+        "generate_sector_insight_summary",
+        "get_latest_sector_insight",
+        "list_sector_insights",
+    ),
+    "favorite_stock_service": (
+        "add_stock_to_favorites",
+        "remove_stock_from_favorites",
+        "list_favorite_codes",
+        "list_favorite_groups",
+        "is_stock_favorite",
+        "list_favorite_entries",
+        "list_favorite_entries_async",
+        "set_favorite_state",
+        "get_favorite_status",
+    ),
+    "indicator_screening_service": (
+        "sync_indicator_continuous_volume",
+        "sync_indicator_screening",
+        "sync_all_indicator_screenings",
+        "list_indicator_screenings",
+        "list_indicator_screenings_async",
+        "run_indicator_realtime_refresh",
+    ),
+    "investment_journal_service": (
+        "upsert_investment_journal_entry",
+        "get_investment_journal_entry",
+        "list_investment_journal_entries",
+    ),
+}
+# Exported name -> (submodule, attribute) for names re-exported under another name.
+_ALIASED_EXPORTS: Dict[str, Tuple[str, str]] = {
+    "MARKET_INSIGHT_STAGE_ORDER": ("market_insight_service", "STAGE_ORDER"),
+    "MARKET_INSIGHT_STAGE_TITLES": ("market_insight_service", "STAGE_TITLE_MAP"),
+}
+
+_EXPORTS: Dict[str, Tuple[str, str]] = {
+    name: (module, name) for module, names in _SUBMODULE_EXPORTS.items() for name in names
+}
+_EXPORTS.update(_ALIASED_EXPORTS)
 
 __all__ = [
     "get_stock_overview",
+    "get_stock_overview_async",
     "sync_daily_indicator",
     "sync_income_statements",
     "sync_financial_indicators",
@@ -214,6 +283,14 @@ __all__ = [
     "list_global_indices",
     "list_global_index_history",
     "list_realtime_indices",
+    "PricePanel",
+    "load_ohlcv_history",
+    "price_panel_store",
+    "rebuild_price_panel",
+    "RealtimeQuotePoller",
+    "get_realtime_quote",
+    "list_realtime_quotes",
+    "realtime_quote_store",
     "list_dollar_index",
     "list_rmb_midpoint_rates",
     "list_futures_realtime",
@@ -234,6 +311,8 @@ __all__ = [
     "list_macro_insight_history",
     "build_sector_fund_flow_snapshot",
     "build_market_overview_payload",
+    "invalidate_market_overview_cache",
+    "invalidate_market_overview_on_job",
     "collect_recent_sector_headlines",
     "build_sector_group_snapshot",
     "generate_sector_insight_summary",
@@ -250,7 +329,10 @@ __all__ = [
     "list_concept_fund_flow",
     "list_concept_index_history",
     "list_concept_constituents",
+    "sync_concept_constituents",
     "sync_concept_directory",
+    "get_concept_membership_index",
+    "refresh_concept_membership_index",
     "search_concepts",
     "list_all_concepts",
     "list_concept_watchlist",
@@ -264,16 +346,23 @@ __all__ = [
     "list_volume_price_history",
     "build_industry_volume_price_dataset",
     "generate_industry_volume_price_reasoning",
+    "generate_sector_volume_price_batch",
     "get_latest_industry_volume_price_reasoning",
     "list_industry_volume_price_history",
     "build_stock_volume_price_dataset",
     "generate_stock_volume_price_reasoning",
     "get_latest_stock_volume_price_reasoning",
     "list_stock_volume_price_history",
+    "clear_stock_context",
+    "invalidate_stock_context",
+    "invalidate_stock_context_piece",
+    "prime_stock_context_versions",
     "build_stock_integrated_context",
     "generate_stock_integrated_analysis",
     "get_latest_stock_integrated_analysis",
     "list_stock_integrated_analysis_history",
+    "generate_stock_analysis_batch",
+    "get_current_stock_analysis",
     "generate_stock_valuation_analysis",
     "get_latest_stock_valuation_analysis",
     "list_stock_valuation_analysis_history",
@@ -292,6 +381,9 @@ __all__ = [
     "sync_daily_trade",
     "sync_daily_trade_metrics",
     "sync_stock_basic",
+    "refresh_stock_search_index",
+    "search_stocks",
+    "gather_sections",
     "sync_fundamental_metrics",
     "sync_industry_fund_flow",
     "sync_concept_fund_flow",
@@ -319,6 +411,7 @@ __all__ = [
     "list_favorite_groups",
     "is_stock_favorite",
     "list_favorite_entries",
+    "list_favorite_entries_async",
     "set_favorite_state",
     "get_favorite_status",
     "get_stock_main_business",
@@ -339,6 +432,7 @@ __all__ = [
     "sync_indicator_screening",
     "sync_all_indicator_screenings",
     "list_indicator_screenings",
+    "list_indicator_screenings_async",
     "run_indicator_realtime_refresh",
     "sync_cashflow_statements",
     "list_cashflow_statements",
@@ -348,3 +442,17 @@ __all__ = [
     "list_research_reports",
     "analyze_research_reports",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    target = _EXPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = target
+    value = getattr(import_module(f".{module_name}", __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -1,11 +1,15 @@
 """
-Shared AkShare helper utilities for report period and symbol handling.
+Shared AkShare helper utilities for report period, symbol and numeric text handling.
 """
 
 from __future__ import annotations
 
 from datetime import date, datetime
-from typing import Optional
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
 
 _REPORT_PERIOD_MONTH_DAY: tuple[tuple[int, int], ...] = (
     (3, 31),
@@ -94,4 +98,105 @@ def symbol_to_ts_code(symbol: Optional[str]) -> Optional[str]:
     return f"{digits}.{suffix}"
 
 
-__all__ = ["latest_report_period", "resolve_report_period", "normalize_symbol", "symbol_to_ts_code"]
+_MISSING_TEXT: tuple[str, ...] = ("", "--", "-")
+_AMOUNT_PATTERN = r"^([+-]?\d+(?:\.\d+)?)([万亿兆]?)"
+_AMOUNT_UNIT_MULTIPLIER = {
+    "": 1.0,
+    "万": 1e4,
+    "亿": 1e8,
+    "兆": 1e12,
+}
+
+
+def _clean_text(series: pd.Series, *remove: str) -> pd.Series:
+    text = series.astype("string").str.strip()
+    for token in (",", *remove):
+        text = text.str.replace(token, "", regex=False)
+    return text.mask(text.isin(_MISSING_TEXT))
+
+
+def _to_float(text: pd.Series) -> pd.Series:
+    """Cast cleaned text to float, coercing only when some value is not a plain number."""
+    try:
+        return text.astype(float)
+    except (TypeError, ValueError):
+        return pd.to_numeric(text, errors="coerce")
+
+
+def _parse_series(series: pd.Series, parse_text: Callable[[pd.Series], pd.Series]) -> pd.Series:
+    if is_numeric_dtype(series) and not is_bool_dtype(series):
+        return series.astype(float)
+    parsed = parse_text(series)
+    return pd.Series(parsed.to_numpy(dtype=float, na_value=np.nan), index=series.index, name=series.name)
+
+
+def parse_numeric_series(series: pd.Series) -> pd.Series:
+    """
+    Vectorised number parsing: strips whitespace and thousands separators; ``--``/``-``,
+    blanks and unparseable text become NaN.
+    """
+    return _parse_series(series, lambda text: _to_float(_clean_text(text)))
+
+
+def parse_percent_series(series: pd.Series) -> pd.Series:
+    """Like ``parse_numeric_series`` but also accepts a trailing ``%`` (``"0.53%"`` -> ``0.53``)."""
+
+    def parse_text(text: pd.Series) -> pd.Series:
+        return _to_float(_clean_text(text).str.removesuffix("%"))
+
+    return _parse_series(series, parse_text)
+
+
+def parse_amount_series(series: pd.Series) -> pd.Series:
+    """
+    Vectorised amount parsing with Chinese units: ``"111.98万"`` -> ``1119800.0`` and
+    ``"1.48亿元"`` -> ``148000000.0``. Values with a trailing unit are split with string
+    slicing; anything else is read like the scalar parsers this replaces (leading number
+    plus optional unit, then plain-number rules).
+    """
+
+    def parse_text(raw: pd.Series) -> pd.Series:
+        text = _clean_text(raw, "人民币", "元")
+        unit = text.str[-1]
+        multiplier = unit.map(_AMOUNT_UNIT_MULTIPLIER).astype(float)
+        has_unit = multiplier.notna() & (unit != "")
+        number_text = text.where(~has_unit, text.str[:-1])
+        parsed = _to_float(number_text) * multiplier.where(has_unit, 1.0)
+        leftover = parsed.isna() & text.notna()
+        if leftover.any():
+            parts = text[leftover].str.extract(_AMOUNT_PATTERN)
+            extracted = pd.to_numeric(parts[0], errors="coerce") * parts[1].map(_AMOUNT_UNIT_MULTIPLIER).astype(float)
+            fallback = extracted.isna()
+            extracted[fallback] = pd.to_numeric(text[leftover][fallback], errors="coerce")
+            parsed[leftover] = extracted
+        return parsed
+
+    return _parse_series(series, parse_text)
+
+
+def normalize_symbol_series(series: pd.Series) -> pd.Series:
+    """
+    Vectorised ``normalize_symbol`` that also drops exchange suffixes (``"600000.SH"``);
+    blanks become ``<NA>``.
+    """
+    text = series.astype("string").str.strip().str.upper()
+    text = text.mask(text == "")
+    dotted = text.str.contains(".", regex=False).fillna(False)
+    if dotted.any():
+        text[dotted] = text[dotted].str.partition(".")[0]
+    short_digits = (text.str.isdigit() & (text.str.len() < 6)).fillna(False)
+    if short_digits.any():
+        text[short_digits] = text[short_digits].str.zfill(6)
+    return text
+
+
+__all__ = [
+    "latest_report_period",
+    "resolve_report_period",
+    "normalize_symbol",
+    "normalize_symbol_series",
+    "parse_amount_series",
+    "parse_numeric_series",
+    "parse_percent_series",
+    "symbol_to_ts_code",
+]
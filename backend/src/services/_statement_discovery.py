@@ -0,0 +1,126 @@
+"""
+Shared helpers for announcement-driven financial statement syncs.
+
+Instead of walking every ``ts_code``, the announcement mode asks Tushare's whole-market
+VIP endpoints for filings published inside an announcement-date window. When the token
+lacks VIP access, the codes that announced inside the window are discovered from the
+locally stored performance express / forecast tables and only those are fetched.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import date, timedelta
+from typing import Callable, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from ..config.settings import AppSettings
+from ..dao import PerformanceExpressDAO, PerformanceForecastDAO
+
+logger = logging.getLogger(__name__)
+
+SYNC_MODE_PER_CODE = "per_code"
+SYNC_MODE_ANNOUNCEMENT = "announcement"
+SYNC_MODES: Tuple[str, ...] = (SYNC_MODE_PER_CODE, SYNC_MODE_ANNOUNCEMENT)
+
+ANNOUNCEMENT_LOOKBACK_DAYS = 7
+ANNOUNCEMENT_OVERLAP_DAYS = 1
+
+
+def validate_sync_mode(mode: Optional[str]) -> str:
+    resolved = (mode or SYNC_MODE_PER_CODE).strip().lower()
+    if resolved not in SYNC_MODES:
+        raise ValueError(f"Unsupported statement sync mode: {mode!r}. Expected one of {', '.join(SYNC_MODES)}.")
+    return resolved
+
+
+def resolve_announcement_window(
+    latest_ann_date: Optional[date],
+    *,
+    announced_since: Optional[date] = None,
+    today: Optional[date] = None,
+) -> Tuple[date, date]:
+    """
+    Return the ``(start, end)`` announcement-date window to catch up on.
+
+    An explicit ``announced_since`` wins; otherwise the window starts one day before the latest
+    stored announcement (so late same-day filings are re-read) and never reaches further back
+    than ``ANNOUNCEMENT_LOOKBACK_DAYS`` when the table is empty.
+    """
+    end = today or date.today()
+    if announced_since is not None:
+        start = announced_since
+    elif latest_ann_date is not None:
+        start = latest_ann_date - timedelta(days=ANNOUNCEMENT_OVERLAP_DAYS)
+    else:
+        start = end - timedelta(days=ANNOUNCEMENT_LOOKBACK_DAYS)
+    if start > end:
+        start = end
+    return start, end
+
+
+def fetch_announced_frame(
+    fetcher: Callable[..., pd.DataFrame],
+    pro_client: object,
+    start: date,
+    end: date,
+    *,
+    codes: Optional[Iterable[str]] = None,
+) -> Optional[pd.DataFrame]:
+    """
+    Fetch whole-market filings announced within ``[start, end]`` through a VIP endpoint.
+
+    Returns ``None`` when the endpoint is unavailable (usually missing VIP permission) so the caller
+    can fall back to local announcement discovery.
+    """
+    try:
+        frame = fetcher(
+            pro_client,
+            start_date=start.strftime("%Y%m%d"),
+            end_date=end.strftime("%Y%m%d"),
+        )
+    except Exception as exc:  # pragma: no cover - external dependency
+        logger.warning("Bulk statement fetch for %s-%s unavailable, falling back to discovery: %s", start, end, exc)
+        return None
+
+    if frame is None:
+        return None
+    if codes is not None and not frame.empty:
+        wanted = {code for code in codes if code}
+        frame = frame[frame["ts_code"].isin(wanted)]
+    return frame.reset_index(drop=True)
+
+
+def discover_announced_codes(
+    settings: AppSettings,
+    start: date,
+    end: date,
+    *,
+    codes: Optional[Iterable[str]] = None,
+) -> List[str]:
+    """
+    Return codes with a performance express or forecast announcement inside ``[start, end]``.
+    """
+    discovered: set[str] = set()
+    for dao_cls in (PerformanceExpressDAO, PerformanceForecastDAO):
+        try:
+            discovered.update(dao_cls(settings.postgres).list_codes_announced_between(start, end))
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.warning("Failed to discover announced codes via %s: %s", dao_cls.__name__, exc)
+
+    if codes is not None:
+        discovered &= {code for code in codes if code}
+    return sorted(discovered)
+
+
+__all__ = [
+    "ANNOUNCEMENT_LOOKBACK_DAYS",
+    "SYNC_MODE_ANNOUNCEMENT",
+    "SYNC_MODE_PER_CODE",
+    "SYNC_MODES",
+    "discover_announced_codes",
+    "fetch_announced_frame",
+    "resolve_announcement_window",
+    "validate_sync_mode",
+]
@@ -4,14 +4,23 @@ from __future__ import annotations
 
 import logging
 import time
+from datetime import date
 from typing import Iterable, List, Optional
 
 import pandas as pd
 import tushare as ts
 
-from ..api_clients import BALANCE_SHEET_FIELDS, fetch_stock_basic, get_balance_sheets
+from ..api_clients import BALANCE_SHEET_FIELDS, fetch_stock_basic, get_balance_sheets, get_balance_sheets_vip
 from ..config.settings import load_settings
 from ..dao import BalanceSheetDAO, StockBasicDAO
+from ._statement_discovery import (
+    SYNC_MODE_ANNOUNCEMENT,
+    SYNC_MODE_PER_CODE,
+    discover_announced_codes,
+    fetch_announced_frame,
+    resolve_announcement_window,
+    validate_sync_mode,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -91,12 +100,48 @@ def sync_balance_sheets(
     codes: Optional[Iterable[str]] = None,
     limit: int = INITIAL_PERIOD_COUNT,
     settings_path: Optional[str] = None,
+    mode: str = SYNC_MODE_PER_CODE,
+    announced_since: Optional[date] = None,
 ) -> dict[str, object]:
+    """
+    Fetch the latest ``limit`` balance sheets per code, or with ``mode="announcement"`` only the
+    filings announced since ``announced_since`` via ``pro.balancesheet_vip`` (falling back to codes
+    with a stored express/forecast announcement in that window).
+    """
+    started = time.perf_counter()
     settings = load_settings(settings_path)
     resolved_token = _resolve_token(settings, token)
     stock_dao = StockBasicDAO(settings.postgres)
     dao = BalanceSheetDAO(settings.postgres)
     pro_client = ts.pro_api(resolved_token)
+    mode = validate_sync_mode(mode)
+
+    if mode == SYNC_MODE_ANNOUNCEMENT:
+        codes = list(dict.fromkeys(code for code in codes if code)) if codes is not None else None
+        window_start, window_end = resolve_announcement_window(
+            dao.latest_ann_date(),
+            announced_since=announced_since,
+        )
+        bulk_frame = fetch_announced_frame(
+            get_balance_sheets_vip,
+            pro_client,
+            window_start,
+            window_end,
+            codes=codes,
+        )
+        if bulk_frame is not None:
+            prepared = _prepare_balance_sheet_frame(bulk_frame)
+            affected_rows = dao.upsert(prepared)
+            announced_codes = sorted(prepared["ts_code"].dropna().unique().tolist()) if not prepared.empty else []
+            return {
+                "rows": affected_rows,
+                "codes": announced_codes[:10],
+                "codeCount": len(announced_codes),
+                "elapsedSeconds": time.perf_counter() - started,
+            }
+        codes = discover_announced_codes(settings, window_start, window_end, codes=codes)
+        if not codes:
+            return {"rows": 0, "codes": [], "codeCount": 0, "elapsedSeconds": time.perf_counter() - started}
 
     rate_limiter = _RateLimiter(RATE_LIMIT_PER_MINUTE)
     target_codes = _ensure_codes(stock_dao, resolved_token, codes)
@@ -106,7 +151,6 @@ def sync_balance_sheets(
 
     affected_rows = 0
     processed_codes: list[str] = []
-    started = time.perf_counter()
 
     for idx, code in enumerate(target_codes, start=1):
         rate_limiter.wait()
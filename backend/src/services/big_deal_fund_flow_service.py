@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import logging
-import re
 import time
+from datetime import date, datetime
 from typing import Callable, Optional, Sequence
 
 import pandas as pd
@@ -12,6 +12,13 @@ import pandas as pd
 from ..api_clients import BIG_DEAL_FUND_FLOW_COLUMN_MAP, fetch_big_deal_fund_flow
 from ..config.settings import load_settings
 from ..dao import BigDealFundFlowDAO
+from ..dao.big_deal_fund_flow_dao import DEFAULT_RETENTION_DAYS, retention_cutoff
+from ._akshare_utils import (
+    normalize_symbol_series,
+    parse_amount_series,
+    parse_numeric_series,
+    parse_percent_series,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -24,89 +31,7 @@ AMOUNT_COLUMNS: tuple[str, ...] = ("trade_amount",)
 VOLUME_COLUMNS: tuple[str, ...] = ("trade_volume",)
 PERCENT_COLUMNS: tuple[str, ...] = ("price_change_percent",)
 
-_UNIT_PATTERN = re.compile(r"([+-]?\d+(?:\.\d+)?)([万亿兆]?)", re.IGNORECASE)
-_UNIT_MULTIPLIER = {
-    "": 1.0,
-    "万": 1e4,
-    "亿": 1e8,
-    "兆": 1e12,
-}
-
-
-def _normalize_stock_code(value: object) -> Optional[str]:
-    if value is None:
-        return None
-    text = str(value).strip().upper()
-    if not text:
-        return None
-    if text.isdigit():
-        return text.zfill(6)
-    if "." in text:
-        symbol, _suffix = text.split(".", 1)
-        if symbol.isdigit():
-            return symbol.zfill(6)
-        return symbol
-    return text
-
-
-def _parse_numeric(value: object) -> Optional[float]:
-    if value is None:
-        return None
-    if isinstance(value, (int, float)):
-        return float(value)
-    text = str(value).strip()
-    if not text or text in {"--", "-"}:
-        return None
-    text = text.replace(",", "")
-    try:
-        return float(text)
-    except ValueError:
-        return None
-
-
-def _parse_percent(value: object) -> Optional[float]:
-    if value is None:
-        return None
-    if isinstance(value, (int, float)):
-        return float(value)
-    text = str(value).strip()
-    if not text or text in {"--", "-"}:
-        return None
-    if text.endswith("%"):
-        text = text[:-1]
-    text = text.replace(",", "")
-    try:
-        return float(text)
-    except ValueError:
-        return None
-
-
-def _parse_amount(value: object) -> Optional[float]:
-    if value is None:
-        return None
-    if isinstance(value, (int, float)):
-        return float(value)
-    text = str(value).strip()
-    if not text or text in {"--", "-"}:
-        return None
-    text = text.replace(",", "").replace("人民币", "").replace("元", "")
-    match = _UNIT_PATTERN.match(text)
-    if not match:
-        return _parse_numeric(text)
-    number, unit = match.groups()
-    try:
-        numeric = float(number)
-    except ValueError:
-        return None
-    multiplier = _UNIT_MULTIPLIER.get(unit, 1.0)
-    return numeric * multiplier
-
-
-def _parse_volume(value: object) -> Optional[int]:
-    numeric = _parse_numeric(value)
-    if numeric is None:
-        return None
-    return int(round(numeric))
+DEDUPE_COLUMNS: tuple[str, ...] = ("trade_time", "stock_code", "trade_side", "trade_volume", "trade_amount")
 
 
 def _prepare_frame(dataframe: pd.DataFrame) -> pd.DataFrame:
@@ -115,67 +40,40 @@ def _prepare_frame(dataframe: pd.DataFrame) -> pd.DataFrame:
         if column not in frame.columns:
             frame[column] = None
 
-    frame["trade_time"] = pd.to_datetime(frame.get("trade_time"), errors="coerce")
-    if "stock_code" in frame.columns:
-        frame["stock_code"] = frame["stock_code"].map(_normalize_stock_code)
-    if "trade_side" in frame.columns:
-        frame["trade_side"] = frame["trade_side"].astype(str).str.strip()
+    frame["trade_time"] = pd.to_datetime(frame["trade_time"], errors="coerce")
+    frame["stock_code"] = normalize_symbol_series(frame["stock_code"])
+    trade_side = frame["trade_side"].astype("string").str.strip()
+    frame["trade_side"] = trade_side.mask(trade_side == "")
 
     for column in NUMERIC_COLUMNS:
-        if column in frame.columns:
-            frame[column] = frame[column].map(_parse_numeric)
-
+        frame[column] = parse_numeric_series(frame[column])
     for column in AMOUNT_COLUMNS:
-        if column in frame.columns:
-            frame[column] = frame[column].map(_parse_amount)
-            frame[column] = frame[column].map(lambda val: round(val, 2) if val is not None else None)
-
+        frame[column] = parse_amount_series(frame[column]).round(2)
     for column in VOLUME_COLUMNS:
-        if column in frame.columns:
-            frame[column] = frame[column].map(_parse_volume)
-
+        frame[column] = parse_numeric_series(frame[column]).round().astype("Int64")
     for column in PERCENT_COLUMNS:
-        if column in frame.columns:
-            parsed = frame[column].map(_parse_percent)
-            frame[column] = parsed.map(lambda val: round(val, 4) if val is not None else None)
-
-    if "price_change" in frame.columns:
-        frame["price_change"] = frame["price_change"].map(_parse_numeric)
-        frame["price_change"] = frame["price_change"].map(lambda val: round(val, 4) if val is not None else None)
+        frame[column] = parse_percent_series(frame[column]).round(4)
+    frame["price_change"] = frame["price_change"].round(4)
 
     required = list(BIG_DEAL_FUND_FLOW_COLUMN_MAP.values())
-    frame = frame.dropna(subset=["trade_time", "stock_code", "trade_side", "trade_volume", "trade_amount"])
-    if not frame.empty:
-        key_columns = ["trade_time", "stock_code", "trade_side", "trade_volume", "trade_amount"]
-
-        def _build_key(row: pd.Series) -> str:
-            trade_time = row["trade_time"]
-            if pd.isna(trade_time):
-                time_key = ""
-            else:
-                time_key = trade_time.isoformat()
-            volume = row["trade_volume"]
-            amount = row["trade_amount"]
-            volume_key = str(int(volume)) if volume is not None else ""
-            amount_key = ""
-            if amount is not None:
-                amount_key = str(int(round(amount * 100)))
-            side_key = (row["trade_side"] or "").strip()
-            code_key = (row["stock_code"] or "").strip()
-            return "|".join([time_key, code_key, side_key, volume_key, amount_key])
-
-        frame = frame.assign(__dedupe_key=frame.apply(_build_key, axis=1))
-        frame = frame.sort_values(["__dedupe_key"]).drop_duplicates(subset="__dedupe_key", keep="last")
-        frame = frame.drop(columns="__dedupe_key")
-
+    frame = frame.dropna(subset=list(DEDUPE_COLUMNS))
+    # Amounts are already rounded to cents, so the native columns identify a trade.
+    frame = frame.drop_duplicates(subset=list(DEDUPE_COLUMNS), keep="last")
     return frame.loc[:, required]
 
 
+def _drop_expired_rows(frame: pd.DataFrame, cutoff: date) -> pd.DataFrame:
+    """Skip trades older than the retention window so dropped partitions stay dropped."""
+    return frame.loc[frame["trade_time"] >= datetime.combine(cutoff, datetime.min.time())]
+
+
 def sync_big_deal_fund_flow(
     *,
     settings_path: Optional[str] = None,
+    retention_days: int = DEFAULT_RETENTION_DAYS,
     progress_callback: Optional[Callable[[float, Optional[str], Optional[int]], None]] = None,
 ) -> dict[str, object]:
+    """Upsert the big deal feed, refresh its daily rollup and drop trades past ``retention_days``."""
     started = time.perf_counter()
     settings = load_settings(settings_path)
     dao = BigDealFundFlowDAO(settings.postgres)
@@ -193,7 +91,7 @@ def sync_big_deal_fund_flow(
             "elapsedSeconds": elapsed,
         }
 
-    prepared = _prepare_frame(frame)
+    prepared = _drop_expired_rows(_prepare_frame(frame), retention_cutoff(retention_days))
 
     if progress_callback:
         progress_callback(0.6, f"Upserting {len(prepared)} big deal rows", len(prepared))
@@ -201,7 +99,16 @@ def sync_big_deal_fund_flow(
     with dao.connect() as conn:
         dao.ensure_table(conn)
         affected = dao.upsert(prepared, conn=conn)
+        purged = dao.purge_expired(retention_days, conn=conn)
         conn.commit()
+    if purged["droppedPartitions"] or purged["deletedRows"]:
+        logger.info(
+            "Big deal retention (%s days): rolled up %s stock-days, dropped %s partitions, deleted %s rows",
+            retention_days,
+            purged["rolledUp"],
+            purged["droppedPartitions"],
+            purged["deletedRows"],
+        )
 
     elapsed = time.perf_counter() - started
 
@@ -210,6 +117,7 @@ def sync_big_deal_fund_flow(
 
     return {
         "rows": int(affected),
+        "droppedPartitions": purged["droppedPartitions"],
         "elapsedSeconds": elapsed,
     }
 
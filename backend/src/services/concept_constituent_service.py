@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
 from io import StringIO
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
 
 import akshare as ak
 import pandas as pd
@@ -14,13 +17,26 @@ import requests
 from akshare.datasets import get_ths_js
 from py_mini_racer import MiniRacer
 
+from ..config.runtime_config import load_runtime_config
 from ..config.settings import load_settings
-from ..dao import ConceptConstituentDAO, ConceptDirectoryDAO
+from ..dao import ConceptConstituentDAO, ConceptDirectoryDAO, ConceptWatchlistDAO
+from .concept_membership_service import refresh_concept_membership_index
+from .sector_name_service import get_sector_name_index, refresh_sector_name_index
 
 logger = logging.getLogger(__name__)
 
 _CONCEPT_CODE_CACHE: Optional[Dict[str, str]] = None
 _THS_JS_SOURCE: Optional[str] = None
+_REFRESH_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_PENDING_REFRESHES: Set[str] = set()
+_REFRESH_LOCK = threading.Lock()
+
+# Pages of one concept are fetched on this many sessions; request spacing starts at
+# PAGE_MIN_DELAY seconds, doubles on every blocked response up to PAGE_MAX_DELAY and
+# shrinks again on success.
+CONSTITUENT_PAGE_CONCURRENCY = 3
+PAGE_MIN_DELAY = 0.5
+PAGE_MAX_DELAY = 30.0
 
 PAGE_INFO_PATTERN = re.compile(r'class="page_info">\s*(\d+)\s*/\s*(\d+)\s*<')
 
@@ -83,10 +99,10 @@ def _load_concept_codes(*, settings_path: Optional[str] = None, refresh: bool =
     rows = directory_dao.list_entries()
     if rows and not refresh:
         mapping = {row["concept_name"]: row["concept_code"] for row in rows}
-        _CONCEPT_CODE_CACHE = mapping
-        return mapping
-    mapping = _fetch_remote_concept_codes()
-    directory_dao.replace_all(mapping)
+    else:
+        mapping = _fetch_remote_concept_codes()
+        directory_dao.replace_all(mapping)
+    refresh_sector_name_index("concept", mapping)
     _CONCEPT_CODE_CACHE = mapping
     return mapping
 
@@ -97,11 +113,10 @@ def _resolve_concept_code(concept: str, *, settings_path: Optional[str] = None)
     normalized = target.strip()
     if not normalized:
         raise ConceptNotFoundError("Concept name cannot be empty.")
-    if normalized in lookup:
-        return normalized, lookup[normalized]
-    for name, code in lookup.items():
-        if normalized.lower() == name.lower():
-            return name, code
+    index = get_sector_name_index("concept") or refresh_sector_name_index("concept", lookup)
+    name = index.match(normalized)
+    if name in lookup:
+        return name, lookup[name]
     raise ConceptNotFoundError(f"Concept '{concept}' is not present in THS dictionary.")
 
 
@@ -163,6 +178,34 @@ def _build_ajax_url(concept_code: str, page: int) -> str:
     return f"https://q.10jqka.com.cn/gn/detail/code/{concept_code}/ajax/1/page/{page}/"
 
 
+class _PageThrottle:
+    """Space THS page requests, widening the gap when requests get blocked."""
+
+    def __init__(self, *, min_delay: float = PAGE_MIN_DELAY, max_delay: float = PAGE_MAX_DELAY) -> None:
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.delay = min_delay
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_at)
+            self._next_at = slot + self.delay
+        if slot > now:
+            time.sleep(slot - now)
+
+    def success(self) -> None:
+        with self._lock:
+            self.delay = max(self.min_delay, self.delay * 0.8)
+
+    def blocked(self) -> None:
+        with self._lock:
+            self.delay = min(self.max_delay, self.delay * 2)
+            self._next_at = max(self._next_at, time.monotonic() + self.delay)
+
+
 def _fetch_page_html(
     session: requests.Session,
     concept_code: str,
@@ -170,25 +213,30 @@ def _fetch_page_html(
     *,
     max_attempts: int = 5,
     timeout: int = 10,
+    throttle: Optional[_PageThrottle] = None,
 ) -> str:
     url = _build_ajax_url(concept_code, page)
+    throttle = throttle or _PageThrottle()
     attempts = 0
     while attempts < max_attempts:
         attempts += 1
+        throttle.wait()
         try:
             response = session.get(url, timeout=timeout)
         except Exception as exc:  # pragma: no cover - network failures
             logger.warning("Concept constituent request failed for page %s: %s", page, exc)
+            throttle.blocked()
             _refresh_session_token(session, concept_code, detail_prefetch=True)
             continue
         if response.status_code == 200 and "<table" in response.text:
+            throttle.success()
             response.encoding = "gbk"
             return response.text
         logger.debug(
             "THS ajax response blocked (status=%s len=%s attempt=%s)", response.status_code, len(response.text), attempts
         )
+        throttle.blocked()
         _refresh_session_token(session, concept_code, detail_prefetch=True)
-        time.sleep(0.25)
     raise RuntimeError(f"Failed to load THS constituent page {page} after {max_attempts} attempts.")
 
 
@@ -277,65 +325,66 @@ def _frame_to_records(frame: pd.DataFrame) -> List[dict]:
     return records
 
 
-def list_concept_constituents(
+def _crawl_constituent_pages(
+    concept_code: str,
+    *,
+    max_pages: Optional[int],
+    concurrency: int,
+) -> Tuple[List[pd.DataFrame], int, int, bool]:
+    """Fetch the first page, then the remaining ones on ``concurrency`` sessions."""
+    throttle = _PageThrottle()
+    first_html = _fetch_page_html(_prepare_session(concept_code), concept_code, 1, throttle=throttle)
+    total_pages = _extract_total_pages(first_html)
+    limit = total_pages if max_pages is None else max(1, min(max_pages, total_pages))
+    frames: Dict[int, pd.DataFrame] = {1: _prepare_dataframe(first_html)}
+    pages = list(range(2, limit + 1))
+    blocked = False
+    if pages:
+        sessions = threading.local()
+
+        def fetch(page: int) -> pd.DataFrame:
+            session = getattr(sessions, "session", None)
+            if session is None:
+                session = sessions.session = _prepare_session(concept_code)
+            return _prepare_dataframe(_fetch_page_html(session, concept_code, page, throttle=throttle))
+
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(pages)))) as executor:
+            futures = {executor.submit(fetch, page): page for page in pages}
+            for future in as_completed(futures):
+                page = futures[future]
+                try:
+                    frames[page] = future.result()
+                except Exception as exc:  # pragma: no cover - network volatility
+                    logger.warning("Skipped THS constituent page %s due to: %s", page, exc)
+                    blocked = True
+    ordered = [frames[page] for page in sorted(frames)]
+    return ordered, total_pages, len(frames), blocked or len(frames) < total_pages
+
+
+def refresh_concept_constituents(
     concept: str,
     *,
     max_pages: Optional[int] = None,
-    page_delay: float = 5.0,
+    concurrency: int = CONSTITUENT_PAGE_CONCURRENCY,
     settings_path: Optional[str] = None,
-    refresh: bool = False,
 ) -> dict:
-    """Fetch or load cached Tonghuashun concept constituents."""
+    """Scrape the concept's Tonghuashun constituents and store them."""
 
     resolved_name, concept_code = _resolve_concept_code(concept, settings_path=settings_path)
     settings = load_settings(settings_path)
     dao = ConceptConstituentDAO(settings.postgres)
+    logger.info("Refreshing concept constituents for %s (max pages=%s)", resolved_name, max_pages)
 
-    if not refresh:
-        cached = dao.list_entries(resolved_name)
-        return {
-            "concept": resolved_name,
-            "conceptCode": concept_code,
-            "totalPages": 0,
-            "pagesFetched": 0,
-            "blocked": False,
-            "items": cached,
-        }
-
-    session = _prepare_session(concept_code)
-    first_html = _fetch_page_html(session, concept_code, 1)
-    total_pages = _extract_total_pages(first_html)
-    limit = total_pages if max_pages is None else max(1, min(max_pages, total_pages))
-    logger.info("Refreshing concept constituents for %s (max pages=%s)", resolved_name, limit)
-
-    frames: List[pd.DataFrame] = []
-    frames.append(_prepare_dataframe(first_html))
-
-    pages_fetched = 1
-    blocked = False
-
-    page = 2
-    while page <= total_pages and pages_fetched < limit:
-        try:
-            html = _fetch_page_html(session, concept_code, page)
-        except Exception as exc:  # pragma: no cover - network volatility
-            logger.warning("Stopped fetching THS constituents at page %s due to: %s", page, exc)
-            blocked = True
-            break
-        frames.append(_prepare_dataframe(html))
-        pages_fetched += 1
-        page += 1
-        if page_delay > 0:
-            time.sleep(page_delay)
-
+    frames, total_pages, pages_fetched, blocked = _crawl_constituent_pages(
+        concept_code,
+        max_pages=max_pages,
+        concurrency=concurrency,
+    )
     combined = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=COLUMN_MAPPING.values())
     combined = combined.sort_values(by="rank", na_position="last").reset_index(drop=True)
 
-    limit_reached = pages_fetched >= limit
-    blocked = blocked or (not limit_reached and pages_fetched < total_pages)
-
     records = _frame_to_records(combined)
-    dao.replace_entries(resolved_name, concept_code, records)
+    dao.replace_entries(resolved_name, concept_code, records, prune=not blocked)
 
     logger.info(
         "Concept constituents refreshed: %s (pages=%s/%s, blocked=%s, rows=%s)",
@@ -356,6 +405,137 @@ def list_concept_constituents(
     }
 
 
+def _is_stale(updated_at: Optional[datetime], ttl_hours: int, *, now: Optional[datetime] = None) -> bool:
+    if updated_at is None:
+        return True
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+    current = now or datetime.now(timezone.utc)
+    return current - updated_at >= timedelta(hours=ttl_hours)
+
+
+def _run_background_refresh(concept_name: str, max_pages: Optional[int], settings_path: Optional[str]) -> None:
+    try:
+        refresh_concept_constituents(concept_name, max_pages=max_pages, settings_path=settings_path)
+        refresh_concept_membership_index(settings_path=settings_path)
+    except Exception as exc:  # pragma: no cover - network volatility
+        logger.warning("Background refresh of concept constituents failed for %s: %s", concept_name, exc)
+    finally:
+        with _REFRESH_LOCK:
+            _PENDING_REFRESHES.discard(concept_name)
+
+
+def schedule_concept_constituent_refresh(
+    concept_name: str,
+    *,
+    max_pages: Optional[int] = None,
+    settings_path: Optional[str] = None,
+) -> bool:
+    """Queue a background refresh of ``concept_name``; ``False`` if one is already queued."""
+    global _REFRESH_EXECUTOR
+    with _REFRESH_LOCK:
+        if concept_name in _PENDING_REFRESHES:
+            return False
+        _PENDING_REFRESHES.add(concept_name)
+        if _REFRESH_EXECUTOR is None:
+            # One concept at a time; each refresh already fetches its pages concurrently.
+            _REFRESH_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="concept-constituents")
+        executor = _REFRESH_EXECUTOR
+    executor.submit(_run_background_refresh, concept_name, max_pages, settings_path)
+    return True
+
+
+def list_concept_constituents(
+    concept: str,
+    *,
+    max_pages: Optional[int] = None,
+    settings_path: Optional[str] = None,
+    refresh: bool = False,
+) -> dict:
+    """Return stored Tonghuashun concept constituents without waiting on THS.
+
+    Snapshots older than ``concept_constituent_ttl_hours`` (or any snapshot when
+    ``refresh`` is set) are refreshed in the background; ``refreshing`` reports it.
+    """
+
+    resolved_name, concept_code = _resolve_concept_code(concept, settings_path=settings_path)
+    settings = load_settings(settings_path)
+    cached = ConceptConstituentDAO(settings.postgres).list_entries(resolved_name)
+    updated_at = max((row["updatedAt"] for row in cached if row.get("updatedAt")), default=None)
+    stale = _is_stale(updated_at, load_runtime_config().concept_constituent_ttl_hours)
+    if refresh or stale:
+        schedule_concept_constituent_refresh(resolved_name, max_pages=max_pages, settings_path=settings_path)
+    return {
+        "concept": resolved_name,
+        "conceptCode": concept_code,
+        "totalPages": 0,
+        "pagesFetched": 0,
+        "blocked": False,
+        "items": cached,
+        "updatedAt": updated_at,
+        "stale": stale,
+        "refreshing": resolved_name in _PENDING_REFRESHES,
+    }
+
+
+def sync_concept_constituents(
+    concepts: Optional[Sequence[str]] = None,
+    *,
+    force: bool = False,
+    max_pages: Optional[int] = None,
+    settings_path: Optional[str] = None,
+    progress_callback: Optional[Callable[[float, Optional[str], Optional[int]], None]] = None,
+) -> Dict[str, object]:
+    """Refresh the constituents of ``concepts`` (default: watched concepts) past their TTL."""
+    settings = load_settings(settings_path)
+    errors: List[Dict[str, str]] = []
+    if concepts is None:
+        names = [
+            entry["concept_name"]
+            for entry in ConceptWatchlistDAO(settings.postgres).list_entries()
+            if entry.get("is_watched", True)
+        ]
+    else:
+        names = []
+        for concept in concepts:
+            try:
+                names.append(_resolve_concept_code(concept, settings_path=settings_path)[0])
+            except ConceptNotFoundError as exc:
+                errors.append({"concept": concept, "error": str(exc)})
+
+    if force:
+        due = list(names)
+    else:
+        ttl_hours = load_runtime_config().concept_constituent_ttl_hours
+        updated = ConceptConstituentDAO(settings.postgres).fetch_updated_at(names)
+        due = [name for name in names if _is_stale(updated.get(name), ttl_hours)]
+
+    total_rows = 0
+    refreshed = 0
+    for position, name in enumerate(due, start=1):
+        try:
+            result = refresh_concept_constituents(name, max_pages=max_pages, settings_path=settings_path)
+            total_rows += len(result["items"])
+            refreshed += 1
+        except Exception as exc:  # pragma: no cover - network volatility
+            logger.warning("Failed to refresh concept constituents for %s: %s", name, exc)
+            errors.append({"concept": name, "error": str(exc)})
+        if progress_callback:
+            progress_callback(position / len(due), f"Refreshed constituents for {name}", total_rows)
+
+    # Rebuilding the membership index reads every concept, so do it once per sync.
+    if refreshed:
+        refresh_concept_membership_index(settings_path=settings_path)
+
+    return {
+        "concepts": len(names),
+        "refreshed": refreshed,
+        "skipped": len(names) - len(due),
+        "rows": total_rows,
+        "errors": errors,
+    }
+
+
 def list_concept_directory(*, settings_path: Optional[str] = None, refresh: bool = False) -> Dict[str, str]:
     """Return a copy of the THS concept name -> code mapping."""
     return _load_concept_codes(settings_path=settings_path, refresh=refresh).copy()
@@ -405,6 +585,9 @@ def resolve_concept_label(concept: str, *, settings_path: Optional[str] = None)
 
 __all__ = [
     "list_concept_constituents",
+    "refresh_concept_constituents",
+    "schedule_concept_constituent_refresh",
+    "sync_concept_constituents",
     "ConceptNotFoundError",
     "list_concept_directory",
     "search_concept_directory",
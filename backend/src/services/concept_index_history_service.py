@@ -4,22 +4,20 @@ from __future__ import annotations
 
 import logging
 from datetime import date, datetime, timedelta
-from difflib import SequenceMatcher
 from typing import Dict, List, Optional, Sequence, Tuple
-import re
 
 import numpy as np
 import pandas as pd
 import akshare as ak
 
+from ..config.runtime_config import load_runtime_config
 from ..config.settings import load_settings
 from ..dao import ConceptDirectoryDAO, ConceptIndexHistoryDAO
+from .sector_index_service import SECTOR_INDEX_METHODS, local_ts_code, sync_sector_indices
+from .sector_name_service import SectorNameIndex, get_sector_name_index, normalize_sector_label, refresh_sector_name_index
 
 logger = logging.getLogger(__name__)
 
-_CONCEPT_NAME_LOOKUP: Dict[str, str] | None = None
-_NORMALIZED_CONCEPT_MAP: Dict[str, str] | None = None
-
 
 def _load_directory_concept_names() -> List[str]:
     try:
@@ -50,8 +48,6 @@ CONCEPT_KEYWORD_HINTS: Tuple[Tuple[str, str], ...] = (
     ("光伏", "光伏概念"),
 )
 
-_NORMALIZE_PATTERN = re.compile(r"[\s·•()（）-]+")
-
 
 def _normalise_dates(
     start_date: Optional[str] = None,
@@ -70,20 +66,10 @@ def _normalise_dates(
     return start.strftime("%Y%m%d"), end.strftime("%Y%m%d")
 
 
-def _normalize_concept_label(label: str) -> str:
-    if not label:
-        return ""
-    text = str(label).strip().lower()
-    text = text.replace("概念", "")
-    text = re.sub(r"[·•]+", "", text)
-    text = _NORMALIZE_PATTERN.sub("", text)
-    return text
-
-
-def _ensure_concept_name_lookup() -> None:
-    global _CONCEPT_NAME_LOOKUP, _NORMALIZED_CONCEPT_MAP
-    if _CONCEPT_NAME_LOOKUP is not None and _NORMALIZED_CONCEPT_MAP is not None:
-        return
+def _concept_name_index() -> SectorNameIndex:
+    index = get_sector_name_index("concept")
+    if index is not None:
+        return index
     names = _load_directory_concept_names()
     if not names:
         try:
@@ -94,29 +80,7 @@ def _ensure_concept_name_lookup() -> None:
         if isinstance(frame, pd.DataFrame) and "name" in frame.columns:
             values = frame["name"].dropna().astype(str)
             names = [value.strip() for value in values if value.strip()]
-
-    if not names:
-        _CONCEPT_NAME_LOOKUP = {}
-        _NORMALIZED_CONCEPT_MAP = {}
-        return
-
-    lookup = {name: name for name in names}
-    normalized: Dict[str, str] = {}
-    for name in names:
-        norm = _normalize_concept_label(name)
-        if norm and norm not in normalized:
-            normalized[norm] = name
-
-    _CONCEPT_NAME_LOOKUP = lookup
-    _NORMALIZED_CONCEPT_MAP = normalized
-
-
-def _overlap_score(a: str, b: str) -> int:
-    if not a or not b:
-        return 0
-    set_a = {ch for ch in a if "\u4e00" <= ch <= "\u9fff"}
-    set_b = {ch for ch in b if "\u4e00" <= ch <= "\u9fff"}
-    return len(set_a & set_b)
+    return refresh_sector_name_index("concept", names)
 
 
 def _resolve_concept_symbol(concept_name: str) -> Optional[str]:
@@ -124,41 +88,28 @@ def _resolve_concept_symbol(concept_name: str) -> Optional[str]:
     if not label:
         return None
 
-    _ensure_concept_name_lookup()
-    if not _CONCEPT_NAME_LOOKUP:
+    index = _concept_name_index()
+    if not len(index):
         return None
 
-    if label in _CONCEPT_NAME_LOOKUP:
+    if label in index:
         return label
 
-    normalized = _normalize_concept_label(label)
+    normalized = normalize_sector_label(label)
     alias_target = CONCEPT_SYNONYM_MAP.get(normalized) or CONCEPT_SYNONYM_MAP.get(label.lower())
-    if alias_target and alias_target in _CONCEPT_NAME_LOOKUP:
+    if alias_target and alias_target in index:
         return alias_target
 
-    if normalized in _NORMALIZED_CONCEPT_MAP:
-        return _NORMALIZED_CONCEPT_MAP[normalized]
+    matched = index.match(label)
+    if matched:
+        return matched
 
     for keyword, target in CONCEPT_KEYWORD_HINTS:
-        if keyword in label and target in _CONCEPT_NAME_LOOKUP:
+        if keyword in label and target in index:
             return target
 
-    best_name = None
-    best_score = 0.0
-    for candidate_norm, candidate_name in _NORMALIZED_CONCEPT_MAP.items():
-        overlap = _overlap_score(normalized, candidate_norm)
-        if overlap >= 2:
-            score = 0.8 + overlap * 0.05
-        else:
-            score = SequenceMatcher(None, normalized, candidate_norm).ratio()
-        if score > best_score:
-            best_score = score
-            best_name = candidate_name
+    return index.closest(label)
 
-    if best_name and best_score >= 0.65:
-        return best_name
-
-    return None
 
 def _fetch_history_from_ths(concept_name: str, start: str, end: str) -> pd.DataFrame:
     resolved_symbol = _resolve_concept_symbol(concept_name)
@@ -250,6 +201,15 @@ def sync_concept_index_history(
 
     start, end = _normalise_dates(start_date, end_date)
 
+    source = load_runtime_config().sector_index_source
+    if source in SECTOR_INDEX_METHODS:
+        return _sync_local_concept_history(
+            concept_names,
+            method=source,
+            start_date=datetime.strptime(start, "%Y%m%d").date() if start_date else None,
+            settings_path=settings_path,
+        )
+
     settings = load_settings(settings_path)
     dao = ConceptIndexHistoryDAO(settings.postgres)
 
@@ -268,6 +228,7 @@ def sync_concept_index_history(
             errors.append({"concept": concept_name, "error": "ths_no_data"})
             continue
 
+        dao.delete_other_sources([concept_name], keep_prefix="THS-")
         affected = dao.upsert(ths_frame)
         total_rows += affected
         synced_concepts.append(
@@ -295,6 +256,41 @@ def sync_concept_index_history(
     }
 
 
+def _sync_local_concept_history(
+    concept_names: Sequence[str],
+    *,
+    method: str,
+    start_date: Optional[date],
+    settings_path: Optional[str],
+) -> Dict[str, object]:
+    """Compute the concepts' indices from stored constituents instead of scraping THS.
+
+    The series is always recomputed up to today; without ``start_date`` the
+    incremental window is chained onto the stored series.
+    """
+    names = [name.strip() for name in concept_names if name and name.strip()]
+    result = sync_sector_indices(
+        method=method,
+        kinds=("concept",),
+        sector_names=names,
+        start_date=start_date,
+        settings_path=settings_path,
+    )
+    rows_by_concept = result["sectorRows"].get("concept", {})
+    synced = [
+        {"concept": name, "ts_code": local_ts_code(name), "rows": rows_by_concept[name], "source": method}
+        for name in names
+        if rows_by_concept.get(name)
+    ]
+    return {
+        "concepts": synced,
+        "errors": [{"concept": name, "error": "no_constituents"} for name in names if not rows_by_concept.get(name)],
+        "startDate": str(result["startDate"]).replace("-", ""),
+        "endDate": str(result["endDate"]).replace("-", ""),
+        "totalRows": result["rows"],
+    }
+
+
 def list_concept_index_history(
     *,
     ts_code: Optional[str] = None,
@@ -6,12 +6,10 @@ import json
 import logging
 import time
 from datetime import datetime, timedelta, date
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from zoneinfo import ZoneInfo
 
-from psycopg2 import sql
-
 from ..api_clients import generate_finance_analysis
 from ..config.settings import load_settings
 from ..config.runtime_config import load_runtime_config
@@ -23,6 +21,7 @@ from ..dao import (
 )
 from .concept_index_history_service import sync_concept_index_history
 from .concept_constituent_service import resolve_concept_label
+from .news_query_service import fetch_news_with_insights
 from .sector_fund_flow_service import build_sector_fund_flow_snapshot
 
 logger = logging.getLogger(__name__)
@@ -155,63 +154,30 @@ def _fetch_concept_news(
     lookback_hours: int,
     limit: int,
     alias_terms: Optional[Sequence[str]] = None,
+    before: Optional[Tuple[datetime, Optional[str]]] = None,
 ) -> List[Dict[str, Any]]:
     search_terms: List[str] = []
     for term in [concept_name, *(alias_terms or [])]:
         if not term:
             continue
-        normalized = str(term).strip().lower()
+        normalized = str(term).strip()
         if not normalized:
             continue
         if normalized not in search_terms:
             search_terms.append(normalized)
     if not search_terms:
         return []
-    like_patterns = [f"%{term}%" for term in search_terms]
 
     window_start = _local_now() - timedelta(hours=max(1, lookback_hours))
-
-    with article_dao.connect() as conn:
-        article_dao.ensure_table(conn)
-        insight_dao.ensure_table(conn)
-        with conn.cursor() as cur:
-            term_clauses: List[sql.SQL] = []
-            params: List[Any] = [window_start]
-            columns = ("impact_themes", "impact_industries", "impact_sectors")
-            for column in columns:
-                for _pattern in like_patterns:
-                    term_clauses.append(
-                        sql.SQL("LOWER(COALESCE(i.{column}, '')) LIKE %s").format(column=sql.Identifier(column))
-                    )
-                    params.append(_pattern)
-            where_clause = sql.SQL(" OR ").join(term_clauses) if term_clauses else sql.SQL("FALSE")
-            params.append(limit)
-            cur.execute(
-                sql.SQL(
-                    """
-                    SELECT a.article_id, a.source, a.title, a.summary, a.published_at, a.url,
-                           i.impact_summary, i.impact_analysis, i.impact_confidence,
-                           i.relevance_confidence, i.relevance_reason,
-                           i.impact_themes, i.impact_industries, i.impact_sectors, i.impact_stocks,
-                           i.extra_metadata
-                    FROM {schema_articles}.{articles} AS a
-                    JOIN {schema_insights}.{insights} AS i ON i.article_id = a.article_id
-                    WHERE a.processing_status = 'completed'
-                      AND a.published_at >= %s
-                      AND ({where_clause})
-                    ORDER BY a.published_at DESC
-                    LIMIT %s
-                    """
-                ).format(
-                    schema_articles=sql.Identifier(article_dao.config.schema),
-                    articles=sql.Identifier(article_dao._table_name),
-                    schema_insights=sql.Identifier(insight_dao.config.schema),
-                    insights=sql.Identifier(insight_dao._table_name),
-                    where_clause=where_clause,
-                ),
-                params,
-            )
-            rows = cur.fetchall()
+    rows = fetch_news_with_insights(
+        article_dao,
+        insight_dao,
+        completed_only=True,
+        published_after=window_start,
+        tag_terms=search_terms,
+        before=before,
+        limit=limit,
+    )
 
     columns = [
         "article_id",
@@ -234,7 +200,7 @@ def _fetch_concept_news(
 
     results: List[Dict[str, Any]] = []
     for row in rows:
-        record = {column: value for column, value in zip(columns, row)}
+        record = {column: row[column] for column in columns}
         record["published_at"] = _iso(record.get("published_at"))
         record["impact_summary"] = _truncate_text(record.get("impact_summary"), 200)
         record["impact_analysis"] = _truncate_text(record.get("impact_analysis"), 320)
@@ -520,6 +486,8 @@ def list_concept_news(
     *,
     lookback_hours: int = DEFAULT_LOOKBACK_HOURS,
     limit: int = 50,
+    before_published_at: Optional[datetime] = None,
+    before_id: Optional[str] = None,
     settings_path: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     resolved = resolve_concept_label(concept, settings_path=settings_path)
@@ -535,6 +503,7 @@ def list_concept_news(
         lookback_hours=lookback_hours,
         limit=max(1, min(limit, 200)),
         alias_terms=alias_terms,
+        before=(before_published_at, before_id) if before_published_at else None,
     )
 
 
@@ -0,0 +1,144 @@
+"""
+In-process concept membership index for concept-filtered stock listings.
+
+Every stored concept snapshot is loaded once into an inverted index: each concept maps
+to an integer bitset over the constituent symbols and each symbol maps to its concept
+tags. Multi-concept AND/OR filters are bitwise operations decoded once per request, so
+``/stocks?concept=`` never queries PostgreSQL. The index is rebuilt whenever a concept's
+constituents are refreshed.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from ..config.settings import load_settings
+from ..dao import ConceptConstituentDAO
+
+logger = logging.getLogger(__name__)
+
+CONCEPT_MATCH_MODES: Tuple[str, ...] = ("any", "all")
+EXCHANGE_PREFIXES = ("SH", "SZ", "BJ")
+
+
+def normalize_symbol(value: object) -> Optional[str]:
+    """Reduce ``600000.SH``/``SH600000``/``600000`` to the bare exchange symbol."""
+    if value is None:
+        return None
+    text = str(value).strip().upper()
+    if "." in text:
+        text = text.split(".", 1)[0]
+    if len(text) > 2 and text[:2] in EXCHANGE_PREFIXES:
+        text = text[2:]
+    return text or None
+
+
+def _concept_key(name: object) -> str:
+    return str(name or "").strip().casefold()
+
+
+class ConceptMembershipIndex:
+    """Immutable concept -> symbol bitset and symbol -> concepts index."""
+
+    def __init__(self, memberships: Mapping[str, Iterable[object]] = ()) -> None:
+        self._symbols: List[str] = []
+        self._positions: Dict[str, int] = {}
+        self._bitsets: Dict[str, int] = {}
+        self._names: Dict[str, str] = {}
+        tags: Dict[str, List[str]] = {}
+        for concept in sorted(memberships, key=str):
+            name = str(concept).strip()
+            if not name:
+                continue
+            bits = self._bitsets.get(_concept_key(name), 0)
+            for raw_symbol in memberships[concept]:
+                symbol = normalize_symbol(raw_symbol)
+                if symbol is None:
+                    continue
+                position = self._positions.get(symbol)
+                if position is None:
+                    position = len(self._symbols)
+                    self._positions[symbol] = position
+                    self._symbols.append(symbol)
+                bit = 1 << position
+                if bits & bit:
+                    continue
+                bits |= bit
+                tags.setdefault(symbol, []).append(name)
+            self._bitsets[_concept_key(name)] = bits
+            self._names.setdefault(_concept_key(name), name)
+        self._tags: Dict[str, Tuple[str, ...]] = {symbol: tuple(names) for symbol, names in tags.items()}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    @property
+    def concepts(self) -> List[str]:
+        return sorted(self._names.values())
+
+    def mask(self, concepts: Sequence[str], *, mode: str = "any") -> int:
+        """Return the bitset of symbols in any (OR) or all (AND) of ``concepts``."""
+        keys = [_concept_key(concept) for concept in concepts if _concept_key(concept)]
+        if not keys:
+            return 0
+        bitsets = [self._bitsets.get(key, 0) for key in keys]
+        result = bitsets[0]
+        for bits in bitsets[1:]:
+            result = result & bits if mode == "all" else result | bits
+        return result
+
+    def symbols_for(self, concepts: Sequence[str], *, mode: str = "any") -> FrozenSet[str]:
+        """Return the symbols matching ``concepts`` under ``mode``."""
+        bits = self.mask(concepts, mode=mode)
+        if not bits:
+            return frozenset()
+        digits = bin(bits)[:1:-1]
+        return frozenset(self._symbols[position] for position, digit in enumerate(digits) if digit == "1")
+
+    def concepts_for(self, code: object) -> Tuple[str, ...]:
+        """Return the concept tags of a stock code or symbol."""
+        symbol = normalize_symbol(code)
+        if symbol is None:
+            return ()
+        return self._tags.get(symbol, ())
+
+
+_INDEX: Optional[ConceptMembershipIndex] = None
+_INDEX_LOCK = threading.Lock()
+_BUILD_LOCK = threading.Lock()
+
+
+def refresh_concept_membership_index(*, settings_path: Optional[str] = None) -> ConceptMembershipIndex:
+    """Rebuild the membership index from the constituent table and swap it in atomically."""
+    global _INDEX
+    settings = load_settings(settings_path)
+    index = ConceptMembershipIndex(ConceptConstituentDAO(settings.postgres).list_memberships())
+    with _INDEX_LOCK:
+        _INDEX = index
+    logger.info("Concept membership index rebuilt with %s concepts", len(index))
+    return index
+
+
+def get_concept_membership_index(*, settings_path: Optional[str] = None) -> ConceptMembershipIndex:
+    """Return the shared membership index, building it on first use.
+
+    Concurrent first requests wait for a single build instead of each scanning the table.
+    """
+    index = _INDEX
+    if index is not None:
+        return index
+    with _BUILD_LOCK:
+        if _INDEX is not None:
+            return _INDEX
+        return refresh_concept_membership_index(settings_path=settings_path)
+
+
+__all__ = [
+    "CONCEPT_MATCH_MODES",
+    "ConceptMembershipIndex",
+    "get_concept_membership_index",
+    "normalize_symbol",
+    "refresh_concept_membership_index",
+]
@@ -165,6 +165,16 @@ def generate_concept_volume_price_reasoning(
     settings_path: Optional[str] = None,
 ) -> Dict[str, Any]:
     dataset = build_volume_price_dataset(concept, lookback_days=lookback_days, settings_path=settings_path)
+    return run_volume_price_reasoning(dataset, run_llm=run_llm, settings_path=settings_path)
+
+
+def run_volume_price_reasoning(
+    dataset: Dict[str, Any],
+    *,
+    run_llm: bool = True,
+    settings_path: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Run the LLM over a prepared dataset and store the snapshot."""
     settings = load_settings(settings_path)
     generated_at = datetime.now(LOCAL_TZ)
     generated_at_db = generated_at.replace(tzinfo=None)
@@ -299,6 +309,7 @@ def list_volume_price_history(
 __all__ = [
     "build_volume_price_dataset",
     "generate_concept_volume_price_reasoning",
+    "run_volume_price_reasoning",
     "get_latest_volume_price_reasoning",
     "list_volume_price_history",
 ]
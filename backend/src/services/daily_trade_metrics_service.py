@@ -14,6 +14,7 @@ import pandas as pd
 
 from ..config.settings import load_settings
 from ..dao import DailyTradeDAO, DailyTradeMetricsDAO
+from .price_panel_service import load_ohlcv_history
 
 logger = logging.getLogger(__name__)
 
@@ -155,7 +156,8 @@ def sync_daily_trade_metrics(
 
     window_days = max(history_window_days, MIN_HISTORY_DAYS)
     start_date = latest_trade_date - timedelta(days=window_days)
-    frame = daily_trade_dao.fetch_close_prices(start_date=start_date, end_date=latest_trade_date)
+    frame = load_ohlcv_history(daily_trade_dao, start_date, latest_trade_date, fields=("close", "vol"))
+    frame = frame.rename(columns={"vol": "volume"})
 
     if frame.empty:
         message = "No price history available for derived metrics window."
@@ -18,6 +18,7 @@ from ..api_clients import get_daily_trade
 from ..config.runtime_config import load_runtime_config
 from ..config.settings import AppSettings, load_settings
 from ..dao import DailyTradeDAO, StockBasicDAO
+from .price_panel_service import append_price_panel
 
 logger = logging.getLogger(__name__)
 
@@ -214,6 +215,15 @@ def sync_daily_trade(
     inserted = daily_dao.upsert(combined)
     logger.info("Upsert completed, affected rows: %s", inserted)
 
+    try:
+        # Only a full-universe incremental sync proves every bar up to its last date is present.
+        complete_through = None
+        if codes is None and not start_date:
+            complete_through = pd.to_datetime(combined["trade_date"], errors="coerce").max().date()
+        append_price_panel(combined, complete_through=complete_through)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Failed to append daily trade rows to the price panel cache: %s", exc)
+
     if progress_callback:
         progress_callback(1.0, "Daily trade sync completed", inserted)
 
@@ -42,17 +42,12 @@ def list_favorite_codes(settings_path: str | None = None) -> List[str]:
     return [entry["code"] for entry in entries]
 
 
-def list_favorite_entries(
-    group: Optional[str] = None, *, settings_path: str | None = None
-) -> List[Dict[str, object]]:
-    """Return favorite entries with timestamps (optionally filtered by group)."""
-    settings = load_settings(settings_path)
-    favorites_dao, _ = _get_daos(settings)
+def _favorite_group_filter(group: Optional[str]) -> Optional[str]:
     normalized_group = _normalize_group(group)
-    if normalized_group == FAVORITE_GROUP_NONE_SENTINEL:
-        entries = favorites_dao.list_entries(group="")
-    else:
-        entries = favorites_dao.list_entries(group=normalized_group)
+    return "" if normalized_group == FAVORITE_GROUP_NONE_SENTINEL else normalized_group
+
+
+def _favorite_entries_payload(entries: List[Dict[str, object]]) -> List[Dict[str, object]]:
     return [
         {
             "code": entry["code"],
@@ -64,6 +59,26 @@ def list_favorite_entries(
     ]
 
 
+def list_favorite_entries(
+    group: Optional[str] = None, *, settings_path: str | None = None
+) -> List[Dict[str, object]]:
+    """Return favorite entries with timestamps (optionally filtered by group)."""
+    settings = load_settings(settings_path)
+    favorites_dao, _ = _get_daos(settings)
+    entries = favorites_dao.list_entries(group=_favorite_group_filter(group))
+    return _favorite_entries_payload(entries)
+
+
+async def list_favorite_entries_async(
+    group: Optional[str] = None, *, settings_path: str | None = None
+) -> List[Dict[str, object]]:
+    """Async ``list_favorite_entries`` backed by the shared asyncpg pool."""
+    settings = load_settings(settings_path)
+    favorites_dao, _ = _get_daos(settings)
+    entries = await favorites_dao.list_entries_async(group=_favorite_group_filter(group))
+    return _favorite_entries_payload(entries)
+
+
 def list_favorite_groups(settings_path: str | None = None) -> List[Dict[str, object]]:
     """Return distinct favorite groups and their counts."""
     settings = load_settings(settings_path)
@@ -168,6 +183,7 @@ __all__ = [
     "remove_stock_from_favorites",
     "list_favorite_codes",
     "list_favorite_entries",
+    "list_favorite_entries_async",
     "list_favorite_groups",
     "is_stock_favorite",
     "set_favorite_state",
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import logging
 import time
+from datetime import date
 from typing import Callable, Iterable, List, Optional, Sequence, Set
 
 import pandas as pd
@@ -15,9 +16,18 @@ from ..api_clients import (
     FINANCIAL_INDICATOR_FIELDS,
     fetch_stock_basic,
     get_financial_indicators,
+    get_financial_indicators_vip,
 )
 from ..config.settings import AppSettings, load_settings
 from ..dao import FinancialIndicatorDAO, StockBasicDAO
+from ._statement_discovery import (
+    SYNC_MODE_ANNOUNCEMENT,
+    SYNC_MODE_PER_CODE,
+    discover_announced_codes,
+    fetch_announced_frame,
+    resolve_announcement_window,
+    validate_sync_mode,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -88,6 +98,19 @@ def _ensure_codes(
     return codes
 
 
+def _prepare_indicator_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    dataframe = frame.drop_duplicates(subset=["ts_code", "end_date"], keep="last").copy()
+
+    for column in ("ann_date", "end_date"):
+        dataframe[column] = pd.to_datetime(dataframe[column], errors="coerce").dt.date
+
+    categorical: Sequence[str] = ("ts_code", "ann_date", "end_date")
+    numeric_columns = [col for col in FINANCIAL_INDICATOR_FIELDS if col not in categorical]
+    for column in numeric_columns:
+        dataframe[column] = pd.to_numeric(dataframe[column], errors="coerce")
+    return dataframe
+
+
 def sync_financial_indicators(
     token: Optional[str] = None,
     *,
@@ -96,17 +119,68 @@ def sync_financial_indicators(
     limit: int = DEFAULT_LIMIT,
     rate_limit_per_minute: int = RATE_LIMIT_PER_MINUTE,
     progress_callback: Optional[Callable[[float, Optional[str], Optional[int]], None]] = None,
+    mode: str = SYNC_MODE_PER_CODE,
+    announced_since: Optional[date] = None,
 ) -> dict[str, object]:
     """
     Synchronise financial indicator data (fina_indicator) into PostgreSQL.
 
-    Fetches the latest ``limit`` indicator rows per stock code.
+    Fetches the latest ``limit`` indicator rows per stock code. With ``mode="announcement"``
+    only indicators announced since ``announced_since`` (default: the latest stored
+    announcement) are requested in bulk via ``pro.fina_indicator_vip``, falling back to the
+    codes with a stored express/forecast announcement in that window.
     """
     started = time.perf_counter()
     settings = load_settings(settings_path)
     resolved_token = _resolve_token(token, settings)
     indicator_dao = FinancialIndicatorDAO(settings.postgres)
     stock_dao = StockBasicDAO(settings.postgres)
+    mode = validate_sync_mode(mode)
+
+    if mode == SYNC_MODE_ANNOUNCEMENT:
+        codes = _unique_codes(codes) if codes is not None else None
+        window_start, window_end = resolve_announcement_window(
+            indicator_dao.latest_ann_date(),
+            announced_since=announced_since,
+        )
+        if progress_callback:
+            progress_callback(0.0, f"Fetching financial indicators announced {window_start} ~ {window_end}", 0)
+        bulk_frame = fetch_announced_frame(
+            get_financial_indicators_vip,
+            ts.pro_api(resolved_token),
+            window_start,
+            window_end,
+            codes=codes,
+        )
+        if bulk_frame is not None:
+            affected = 0
+            announced_codes: List[str] = []
+            if not bulk_frame.empty:
+                dataframe = _prepare_indicator_frame(bulk_frame)
+                affected = indicator_dao.upsert(dataframe)
+                announced_codes = sorted(dataframe["ts_code"].dropna().unique().tolist())
+            elapsed = time.perf_counter() - started
+            if progress_callback:
+                progress_callback(1.0, "Financial indicator announcement sync completed", affected)
+            return {
+                "codes": announced_codes[:10],
+                "code_count": len(announced_codes),
+                "total_codes": len(announced_codes),
+                "rows": affected,
+                "elapsed_seconds": elapsed,
+            }
+        codes = discover_announced_codes(settings, window_start, window_end, codes=codes)
+        if not codes:
+            elapsed = time.perf_counter() - started
+            if progress_callback:
+                progress_callback(1.0, "No newly announced financial indicators detected", 0)
+            return {
+                "codes": [],
+                "code_count": 0,
+                "total_codes": 0,
+                "rows": 0,
+                "elapsed_seconds": elapsed,
+            }
 
     available_codes = _ensure_codes(resolved_token, stock_dao, codes)
     if not available_codes:
@@ -168,18 +242,7 @@ def sync_financial_indicators(
             "elapsed_seconds": elapsed,
         }
 
-    dataframe = (
-        pd.concat(frames, ignore_index=True)
-        .drop_duplicates(subset=["ts_code", "end_date"], keep="last")
-    )
-
-    for column in ("ann_date", "end_date"):
-        dataframe[column] = pd.to_datetime(dataframe[column], errors="coerce").dt.date
-
-    categorical: Sequence[str] = ("ts_code", "ann_date", "end_date")
-    numeric_columns = [col for col in FINANCIAL_INDICATOR_FIELDS if col not in categorical]
-    for column in numeric_columns:
-        dataframe[column] = pd.to_numeric(dataframe[column], errors="coerce")
+    dataframe = _prepare_indicator_frame(pd.concat(frames, ignore_index=True))
 
     if progress_callback:
         progress_callback(
@@ -7,8 +7,8 @@ from __future__ import annotations
 import logging
 import math
 import time
-from datetime import date, datetime
-from typing import Callable, Optional
+from datetime import date, datetime, timedelta
+from typing import Callable, Optional, Sequence
 
 import numpy as np
 import pandas as pd
@@ -21,40 +21,139 @@ from ..dao.fundamental_metrics_dao import FundamentalMetricsDAO, FUNDAMENTAL_MET
 logger = logging.getLogger(__name__)
 
 
-def _calc_growth(current: Optional[float], previous: Optional[float]) -> Optional[float]:
-    if current is None or previous is None:
-        return None
-    try:
-        current_val = float(current)
-        previous_val = float(previous)
-    except (TypeError, ValueError):
-        return None
-    if not np.isfinite(previous_val) or previous_val == 0:
-        return None
-    if not np.isfinite(current_val):
-        return None
-    return (current_val - previous_val) / abs(previous_val)
-
-
-def _safe_value(value: Optional[float]) -> Optional[float]:
-    if value is None:
-        return None
-    try:
-        numeric = float(value)
-    except (TypeError, ValueError):
-        return None
-    if not np.isfinite(numeric):
-        return None
-    return numeric
+METRICS_WATERMARK_OVERLAP = timedelta(minutes=30)
+METRICS_FLOAT_TOLERANCE = 1e-9
+
+_METRIC_DATE_COLUMNS = (
+    "net_income_end_date_latest",
+    "net_income_end_date_prev1",
+    "net_income_end_date_prev2",
+    "revenue_end_date_latest",
+    "roe_end_date_latest",
+)
+_METRIC_VALUE_COLUMNS = tuple(
+    column for column in FUNDAMENTAL_METRICS_FIELDS if column != "ts_code" and column not in _METRIC_DATE_COLUMNS
+)
+
+
+def _growth(current: pd.Series, previous: pd.Series) -> pd.Series:
+    """Vectorised ``(current - previous) / |previous|``; NaN where either side is unusable."""
+    current_val = pd.to_numeric(current, errors="coerce").astype(float)
+    previous_val = pd.to_numeric(previous, errors="coerce").astype(float)
+    valid = np.isfinite(current_val) & np.isfinite(previous_val) & (previous_val != 0)
+    return ((current_val - previous_val) / previous_val.abs()).where(valid)
+
+
+def _prepare_periods(frame: pd.DataFrame, value_columns: Sequence[str]) -> pd.DataFrame:
+    if frame.empty:
+        return pd.DataFrame(columns=["ts_code", "end_date", *value_columns])
+    prepared = frame.dropna(subset=["ts_code", "end_date"])
+    prepared = prepared.drop_duplicates(subset=["ts_code", "end_date"], keep="last")
+    prepared = prepared.sort_values(["ts_code", "end_date"]).reset_index(drop=True)
+    prepared["end_date"] = pd.to_datetime(prepared["end_date"])
+    for column in value_columns:
+        prepared[column] = pd.to_numeric(prepared[column], errors="coerce").astype(float)
+    return prepared[["ts_code", "end_date", *value_columns]]
+
+
+def _with_growth(frame: pd.DataFrame, value_columns: Sequence[str]) -> pd.DataFrame:
+    """
+    Attach ``<column>_yoy`` / ``<column>_qoq`` by self-joining each row with the same code's
+    report one year and one quarter earlier.
+    """
+    enriched = frame.copy()
+    enriched["_prev_year"] = enriched["end_date"] - pd.DateOffset(years=1)
+    enriched["_prev_quarter"] = enriched["end_date"] - pd.offsets.QuarterEnd(1)
+    for key, suffix in (("_prev_year", "yoy"), ("_prev_quarter", "qoq")):
+        prior = frame[["ts_code", "end_date", *value_columns]].rename(
+            columns={"end_date": key, **{column: f"_{column}_{suffix}_base" for column in value_columns}}
+        )
+        enriched = enriched.merge(prior, on=["ts_code", key], how="left")
+        for column in value_columns:
+            base_column = f"_{column}_{suffix}_base"
+            enriched[f"{column}_{suffix}"] = _growth(enriched[column], enriched[base_column])
+            enriched = enriched.drop(columns=[base_column])
+    enriched["_rank"] = enriched.groupby("ts_code").cumcount(ascending=False)
+    return enriched.drop(columns=["_prev_year", "_prev_quarter"])
+
+
+def _rank_slice(frame: pd.DataFrame, rank: int) -> pd.DataFrame:
+    return frame[frame["_rank"] == rank].set_index("ts_code")
+
+
+def _compute_metrics_frame(income_df: pd.DataFrame, financial_df: pd.DataFrame) -> pd.DataFrame:
+    """Derive one metrics row per code from recent income statements and financial indicators."""
+    income = _prepare_periods(income_df, ("n_income", "revenue"))
+    if income.empty:
+        return pd.DataFrame(columns=list(FUNDAMENTAL_METRICS_FIELDS))
+    income = _with_growth(income, ("n_income", "revenue"))
+
+    latest = _rank_slice(income, 0)
+    prev1 = _rank_slice(income, 1).reindex(latest.index)
+    prev2 = _rank_slice(income, 2).reindex(latest.index)
+
+    metrics = pd.DataFrame(index=latest.index)
+    metrics["net_income_end_date_latest"] = latest["end_date"]
+    metrics["net_income_end_date_prev1"] = prev1["end_date"]
+    metrics["net_income_end_date_prev2"] = prev2["end_date"]
+    metrics["revenue_end_date_latest"] = latest["end_date"]
+    metrics["net_income_yoy_latest"] = latest["n_income_yoy"]
+    metrics["net_income_yoy_prev1"] = prev1["n_income_yoy"]
+    metrics["net_income_yoy_prev2"] = prev2["n_income_yoy"]
+    metrics["net_income_qoq_latest"] = latest["n_income_qoq"]
+    metrics["revenue_yoy_latest"] = latest["revenue_yoy"]
+    metrics["revenue_qoq_latest"] = latest["revenue_qoq"]
+
+    financial = _prepare_periods(financial_df, ("roe",))
+    if financial.empty:
+        metrics["roe_end_date_latest"] = pd.NaT
+        metrics["roe_yoy_latest"] = np.nan
+        metrics["roe_qoq_latest"] = np.nan
+    else:
+        roe_latest = _rank_slice(_with_growth(financial, ("roe",)), 0).reindex(metrics.index)
+        metrics["roe_end_date_latest"] = roe_latest["end_date"]
+        metrics["roe_yoy_latest"] = roe_latest["roe_yoy"]
+        metrics["roe_qoq_latest"] = roe_latest["roe_qoq"]
+
+    for column in _METRIC_DATE_COLUMNS:
+        metrics[column] = pd.to_datetime(metrics[column]).dt.date
+    metrics = metrics.reset_index()
+    metrics = metrics.astype(object).where(pd.notnull(metrics), None)
+    return metrics[list(FUNDAMENTAL_METRICS_FIELDS)]
+
+
+def _changed_rows(computed: pd.DataFrame, stored: pd.DataFrame) -> pd.DataFrame:
+    """Return the rows of ``computed`` that are new or differ from ``stored``."""
+    if computed.empty or stored.empty:
+        return computed
+    merged = computed.merge(stored, on="ts_code", how="left", suffixes=("", "_stored"), indicator=True)
+    changed = (merged["_merge"] == "left_only").to_numpy(copy=True)
+    for column in _METRIC_DATE_COLUMNS:
+        current = pd.to_datetime(merged[column], errors="coerce")
+        previous = pd.to_datetime(merged[f"{column}_stored"], errors="coerce")
+        same = (current == previous) | (current.isna() & previous.isna())
+        changed |= ~same.to_numpy()
+    for column in _METRIC_VALUE_COLUMNS:
+        current = pd.to_numeric(merged[column], errors="coerce").astype(float).to_numpy()
+        previous = pd.to_numeric(merged[f"{column}_stored"], errors="coerce").astype(float).to_numpy()
+        changed |= ~np.isclose(current, previous, rtol=0.0, atol=METRICS_FLOAT_TOLERANCE, equal_nan=True)
+    return computed.loc[changed].reset_index(drop=True)
 
 
 def sync_fundamental_metrics(
     *,
     settings_path: Optional[str] = None,
     per_code: int = 8,
+    full_refresh: bool = False,
     progress_callback: Optional[Callable[[float, Optional[str], Optional[int]], None]] = None,
 ) -> dict[str, float | int]:
-    """Compute YoY/QoQ metrics from fundamentals and persist to PostgreSQL."""
+    """
+    Compute YoY/QoQ metrics from fundamentals and persist to PostgreSQL.
+
+    By default only codes whose statements were written since the previous run are recomputed,
+    and only rows whose metrics actually changed are upserted. ``full_refresh`` (or an empty
+    metrics table) recomputes every code and drops metrics for codes without statements.
+    """
     started = time.perf_counter()
     settings = load_settings(settings_path)
 
@@ -62,140 +161,61 @@ def sync_fundamental_metrics(
     financial_dao = FinancialIndicatorDAO(settings.postgres)
     metrics_dao = FundamentalMetricsDAO(settings.postgres)
 
+    candidates: Optional[list[str]] = None
+    if not full_refresh:
+        metrics_stats = metrics_dao.stats()
+        last_updated = metrics_stats.get("updated_at")
+        if metrics_stats.get("count") and last_updated is not None:
+            since = last_updated - METRICS_WATERMARK_OVERLAP
+            candidates = sorted(
+                set(income_dao.codes_updated_since(since)) | set(financial_dao.codes_updated_since(since))
+            )
+            if not candidates:
+                elapsed = time.perf_counter() - started
+                if progress_callback:
+                    progress_callback(1.0, "No statement changes since last run", 0)
+                return {"rows": 0, "candidates": 0, "elapsed_seconds": elapsed}
+
     if progress_callback:
-        progress_callback(0.05, "Loading recent income statements", None)
+        progress_callback(0.05, "Loading recent income statements", len(candidates) if candidates else None)
 
-    income_df = income_dao.fetch_recent(per_code=per_code)
-    if income_df.empty:
+    income_df = income_dao.fetch_recent(per_code=per_code, codes=candidates)
+    if income_df.empty and candidates is None:
         logger.warning("Income statements not available; skipping fundamental metrics computation")
-        metrics_dao.replace_all(pd.DataFrame(columns=list(FUNDAMENTAL_METRICS_FIELDS)))
+        metrics_dao.delete_except([])
         elapsed = time.perf_counter() - started
         if progress_callback:
             progress_callback(1.0, "No income statements found", 0)
-        return {"rows": 0, "elapsed_seconds": elapsed}
+        return {"rows": 0, "candidates": 0, "elapsed_seconds": elapsed}
 
     if progress_callback:
         progress_callback(0.15, "Loading recent financial indicators", None)
 
-    financial_df = financial_dao.fetch_recent(per_code=per_code)
+    financial_df = financial_dao.fetch_recent(per_code=per_code, codes=candidates)
 
     if progress_callback:
         progress_callback(0.35, "Computing metrics", None)
 
-    income_df = income_df.dropna(subset=["ts_code", "end_date"]).copy()
-    financial_df = financial_df.dropna(subset=["ts_code", "end_date"]).copy()
-
-    records: list[dict[str, object]] = []
-
-    income_groups = income_df.groupby("ts_code", sort=False)
-    financial_groups = financial_df.groupby("ts_code", sort=False)
-
-    for ts_code, group in income_groups:
-        group = group.drop_duplicates(subset=["end_date"], keep="last").sort_values("end_date")
-        if group.empty:
-            continue
+    metrics_df = _compute_metrics_frame(income_df, financial_df)
 
-        net_income_map: dict[pd.Timestamp, dict[str, Optional[float]]] = {}
-        revenue_map: dict[pd.Timestamp, dict[str, Optional[float]]] = {}
-
-        date_index = {row.end_date: row for row in group.itertuples()}
-
-        for row in group.itertuples():
-            end_date: pd.Timestamp = row.end_date
-            prev_year = end_date - pd.DateOffset(years=1)
-            prev_year_row = date_index.get(prev_year)
-            net_income_yoy = _calc_growth(row.n_income, prev_year_row.n_income if prev_year_row else None)
-            revenue_yoy = _calc_growth(row.revenue, prev_year_row.revenue if prev_year_row else None)
-            net_income_map[end_date] = {
-                "value": _safe_value(row.n_income),
-                "yoy": net_income_yoy,
-            }
-            revenue_map[end_date] = {
-                "value": _safe_value(row.revenue),
-                "yoy": revenue_yoy,
-            }
-
-        end_dates = list(group["end_date"].tolist())
-        latest_end = end_dates[-1]
-        prev_end = end_dates[-2] if len(end_dates) >= 2 else None
-        prev2_end = end_dates[-3] if len(end_dates) >= 3 else None
-
-        net_income_yoy_latest = net_income_map.get(latest_end, {}).get("yoy")
-        net_income_yoy_prev1 = net_income_map.get(prev_end, {}).get("yoy") if prev_end else None
-        net_income_yoy_prev2 = net_income_map.get(prev2_end, {}).get("yoy") if prev2_end else None
-
-        net_income_qoq_latest = None
-        revenue_qoq_latest = None
-        revenue_yoy_latest = revenue_map.get(latest_end, {}).get("yoy")
-
-        latest_income_val = net_income_map.get(latest_end, {}).get("value")
-        latest_revenue_val = revenue_map.get(latest_end, {}).get("value")
-
-        if prev_end is not None:
-            prev_income_val = net_income_map.get(prev_end, {}).get("value")
-            net_income_qoq_latest = _calc_growth(latest_income_val, prev_income_val)
-            prev_revenue_val = revenue_map.get(prev_end, {}).get("value")
-            revenue_qoq_latest = _calc_growth(latest_revenue_val, prev_revenue_val)
-
-        # Compare revenue YoY already computed
-
-        financial_group = financial_groups.get_group(ts_code) if ts_code in financial_groups.groups else pd.DataFrame()
-        roe_yoy_latest = None
-        roe_qoq_latest = None
-        roe_end_date = None
-        if not financial_group.empty:
-            financial_group = financial_group.drop_duplicates(subset=["end_date"], keep="last").sort_values("end_date")
-            fin_dates = list(financial_group["end_date"].tolist())
-            roe_end_date = fin_dates[-1]
-            fin_latest = financial_group.iloc[-1]
-            fin_prev = financial_group.iloc[-2] if len(financial_group) >= 2 else None
-            prev_year_end = fin_latest.end_date - pd.DateOffset(years=1)
-            prev_year_row = financial_group[financial_group["end_date"] == prev_year_end]
-            prev_year_val = None
-            if not prev_year_row.empty:
-                prev_year_val = _safe_value(prev_year_row.iloc[0]["roe"])
-            roe_latest_val = _safe_value(fin_latest["roe"])
-            roe_yoy_latest = _calc_growth(roe_latest_val, prev_year_val)
-            if fin_prev is not None:
-                prev_val = _safe_value(fin_prev["roe"])
-                roe_qoq_latest = _calc_growth(roe_latest_val, prev_val)
-        else:
-            roe_latest_val = None
-
-        record = {
-            "ts_code": ts_code,
-            "net_income_end_date_latest": latest_end.date() if isinstance(latest_end, pd.Timestamp) else latest_end,
-            "net_income_end_date_prev1": prev_end.date() if isinstance(prev_end, pd.Timestamp) else prev_end,
-            "net_income_end_date_prev2": prev2_end.date() if isinstance(prev2_end, pd.Timestamp) else prev2_end,
-            "revenue_end_date_latest": latest_end.date() if isinstance(latest_end, pd.Timestamp) else latest_end,
-            "roe_end_date_latest": roe_end_date.date() if isinstance(roe_end_date, pd.Timestamp) else roe_end_date,
-            "net_income_yoy_latest": net_income_yoy_latest,
-            "net_income_yoy_prev1": net_income_yoy_prev1,
-            "net_income_yoy_prev2": net_income_yoy_prev2,
-            "net_income_qoq_latest": net_income_qoq_latest,
-            "revenue_yoy_latest": revenue_yoy_latest,
-            "revenue_qoq_latest": revenue_qoq_latest,
-            "roe_yoy_latest": roe_yoy_latest,
-            "roe_qoq_latest": roe_qoq_latest,
-        }
-        records.append(record)
-
-    if not records:
-        metrics_dao.replace_all(pd.DataFrame(columns=list(FUNDAMENTAL_METRICS_FIELDS)))
-        elapsed = time.perf_counter() - started
-        if progress_callback:
-            progress_callback(1.0, "No fundamental metrics to compute", 0)
-        return {"rows": 0, "elapsed_seconds": elapsed}
-
-    metrics_df = pd.DataFrame.from_records(records, columns=list(FUNDAMENTAL_METRICS_FIELDS))
+    if progress_callback:
+        progress_callback(0.7, "Comparing with stored metrics", len(metrics_df))
 
-    affected = metrics_dao.replace_all(metrics_df)
+    stored_df = metrics_dao.fetch_frame(candidates)
+    changed_df = _changed_rows(metrics_df, stored_df)
+    affected = metrics_dao.upsert(changed_df)
+    if candidates is None:
+        metrics_dao.delete_except(metrics_df["ts_code"].tolist())
     elapsed = time.perf_counter() - started
 
     if progress_callback:
         progress_callback(1.0, "Fundamental metrics sync completed", affected)
 
-    return {"rows": affected, "elapsed_seconds": elapsed}
+    return {
+        "rows": affected,
+        "candidates": len(metrics_df),
+        "elapsed_seconds": elapsed,
+    }
 
 
 def list_fundamental_metrics(
@@ -12,9 +12,22 @@ from typing import Callable, Iterable, List, Optional, Sequence, Set
 import pandas as pd
 import tushare as ts
 
-from ..api_clients import INCOME_STATEMENT_FIELDS, fetch_stock_basic, get_income_statements
+from ..api_clients import (
+    INCOME_STATEMENT_FIELDS,
+    fetch_stock_basic,
+    get_income_statements,
+    get_income_statements_vip,
+)
 from ..config.settings import AppSettings, load_settings
 from ..dao import IncomeStatementDAO, StockBasicDAO
+from ._statement_discovery import (
+    SYNC_MODE_ANNOUNCEMENT,
+    SYNC_MODE_PER_CODE,
+    discover_announced_codes,
+    fetch_announced_frame,
+    resolve_announcement_window,
+    validate_sync_mode,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -171,18 +184,68 @@ def sync_income_statements(
     initial_periods: int = INITIAL_PERIOD_COUNT,
     rate_limit_per_minute: int = RATE_LIMIT_PER_MINUTE,
     progress_callback: Optional[Callable[[float, Optional[str], Optional[int]], None]] = None,
+    mode: str = SYNC_MODE_PER_CODE,
+    announced_since: Optional[date] = None,
 ) -> dict[str, object]:
     """
     Synchronise income statement data into PostgreSQL.
 
     Performs per-code incremental updates using the last known announcement date while fetching
     initial batches for codes that have not been persisted yet.
+
+    With ``mode="announcement"`` only filings announced since ``announced_since`` (default: the
+    latest stored announcement) are requested in bulk through ``pro.income_vip``; without VIP
+    access the per-code loop is restricted to codes with a stored express/forecast announcement
+    in that window.
     """
     started = time.perf_counter()
     settings = load_settings(settings_path)
     resolved_token = _resolve_token(token, settings)
     statement_dao = IncomeStatementDAO(settings.postgres)
     stock_dao = StockBasicDAO(settings.postgres)
+    mode = validate_sync_mode(mode)
+
+    if mode == SYNC_MODE_ANNOUNCEMENT:
+        codes = _unique_codes(codes) if codes is not None else None
+        window_start, window_end = resolve_announcement_window(
+            statement_dao.latest_ann_date(),
+            announced_since=announced_since,
+        )
+        if progress_callback:
+            progress_callback(0.0, f"Fetching income statements announced {window_start} ~ {window_end}", 0)
+        bulk_frame = fetch_announced_frame(
+            get_income_statements_vip,
+            ts.pro_api(resolved_token),
+            window_start,
+            window_end,
+            codes=codes,
+        )
+        if bulk_frame is not None:
+            prepared = _prepare_income_frame(bulk_frame)
+            affected = statement_dao.upsert(prepared) if not prepared.empty else 0
+            announced_codes = sorted(prepared["ts_code"].dropna().unique().tolist()) if not prepared.empty else []
+            elapsed = time.perf_counter() - started
+            if progress_callback:
+                progress_callback(1.0, "Income statement announcement sync completed", affected)
+            return {
+                "codes": announced_codes[:10],
+                "code_count": len(announced_codes),
+                "total_codes": len(announced_codes),
+                "rows": affected,
+                "elapsed_seconds": elapsed,
+            }
+        codes = discover_announced_codes(settings, window_start, window_end, codes=codes)
+        if not codes:
+            elapsed = time.perf_counter() - started
+            if progress_callback:
+                progress_callback(1.0, "No newly announced income statements detected", 0)
+            return {
+                "codes": [],
+                "code_count": 0,
+                "total_codes": 0,
+                "rows": 0,
+                "elapsed_seconds": elapsed,
+            }
 
     available_codes = _ensure_codes(resolved_token, stock_dao, codes)
     if not available_codes:
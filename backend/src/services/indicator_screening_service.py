@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import math
 from datetime import date, datetime, timedelta, time
 from typing import Any, Dict, Iterable, List, Optional, Sequence
@@ -33,6 +34,7 @@ from .intraday_volume_profile_service import (
     load_average_profile_map,
 )
 from .daily_trade_metrics_service import recompute_trade_metrics_for_codes
+from .price_panel_service import load_ohlcv_history
 
 LOCAL_TZ = ZoneInfo("Asia/Shanghai")
 
@@ -48,6 +50,20 @@ CONTINUOUS_RISE_NAME = "连续上涨"
 VOLUME_SURGE_BREAKOUT_CODE = "volume_surge_breakout"
 VOLUME_SURGE_BREAKOUT_NAME = "爆量启动"
 BIG_DEAL_INDICATOR_CODE = "big_deal_inflow"
+# Keyword filters accepted by ``list_indicator_screenings``.
+SCREENING_FILTER_NAMES = (
+    "net_income_yoy_min",
+    "net_income_qoq_min",
+    "pe_min",
+    "pe_max",
+    "turnover_rate_min",
+    "turnover_rate_max",
+    "daily_change_min",
+    "daily_change_max",
+    "pct_change_1w_max",
+    "pct_change_1m_max",
+    "has_big_deal_inflow",
+)
 BIG_DEAL_INDICATOR_NAME = "当日大单净流入"
 
 DEFAULT_INDICATOR_CODE = CONTINUOUS_VOLUME_CODE
@@ -539,8 +555,9 @@ def _fetch_volume_surge_breakout_candidates(settings) -> pd.DataFrame:
         return pd.DataFrame()
 
     daily_trade_dao = DailyTradeDAO(settings.postgres)
-    start_date = (datetime.now(LOCAL_TZ) - timedelta(days=VOLUME_SURGE_FETCH_DAYS)).strftime("%Y%m%d")
-    trade_frame = daily_trade_dao.fetch_close_prices(start_date=start_date)
+    start_date = (datetime.now(LOCAL_TZ) - timedelta(days=VOLUME_SURGE_FETCH_DAYS)).date()
+    trade_frame = load_ohlcv_history(daily_trade_dao, start_date, fields=("close", "vol"))
+    trade_frame = trade_frame.rename(columns={"vol": "volume"})
     if trade_frame.empty:
         return trade_frame
 
@@ -719,24 +736,77 @@ def _perform_indicator_sync(
     }
 
 
+def _full_universe_arguments(
+    codes: Sequence[str],
+    *,
+    limit: int,
+    offset: int,
+    filters: dict[str, Any],
+) -> dict[str, Any]:
+    unknown = set(filters) - set(SCREENING_FILTER_NAMES)
+    if unknown:
+        raise TypeError(f"Unknown screening filters: {', '.join(sorted(unknown))}")
+    arguments: dict[str, Any] = {name: filters.get(name) for name in SCREENING_FILTER_NAMES}
+    has_big_deal_inflow = arguments.pop("has_big_deal_inflow")
+    arguments.update(
+        indicator_codes=codes,
+        primary_indicator_code=codes[0] if codes else None,
+        limit=limit,
+        offset=offset,
+        require_big_deal_inflow=has_big_deal_inflow is True or BIG_DEAL_INDICATOR_CODE in codes,
+    )
+    return arguments
+
+
+def _screening_tables(settings, dao: IndicatorScreeningDAO, daily_trade_dao: DailyTradeDAO) -> dict[str, str]:
+    return {
+        "daily_trade": daily_trade_dao._table_name,  # noqa: SLF001
+        "stock_basic": settings.postgres.stock_table,
+        "daily_indicator": DailyIndicatorDAO(settings.postgres)._table_name,  # noqa: SLF001
+        "daily_trade_metrics": DailyTradeMetricsDAO(settings.postgres)._table_name,  # noqa: SLF001
+        "fundamental_metrics": FundamentalMetricsDAO(settings.postgres)._table_name,  # noqa: SLF001
+        "big_deal_daily": settings.postgres.big_deal_fund_flow_daily_table,
+    }
+
+
+def _screening_response(
+    dataset: dict[str, Any],
+    *,
+    trade_date: date,
+    codes: Sequence[str],
+    primary_code: str | None,
+    indicator_detail_map: dict[str, dict[str, dict[str, Any]]],
+) -> dict[str, Any]:
+    entries = _compose_screening_entries(
+        dataset.get("items", []),
+        trade_date=trade_date,
+        indicator_codes=codes,
+        primary_indicator_code=primary_code,
+        indicator_details=indicator_detail_map,
+    )
+
+    response_captured = _resolve_response_captured_at(entries, trade_date)
+    indicator_name = INDICATOR_DEFINITIONS[primary_code]["name"] if primary_code else "All Indicators"
+
+    return {
+        "indicatorCode": primary_code or "all",
+        "indicatorCodes": list(codes),
+        "indicatorName": indicator_name,
+        "capturedAt": response_captured,
+        "total": dataset.get("total", 0),
+        "items": entries,
+    }
+
+
 def list_indicator_screenings(
     *,
     indicator_codes: Sequence[str] | None = None,
     limit: int = 200,
     offset: int = 0,
-    net_income_yoy_min: float | None = None,
-    net_income_qoq_min: float | None = None,
-    pe_min: float | None = None,
-    pe_max: float | None = None,
-    turnover_rate_min: float | None = None,
-    turnover_rate_max: float | None = None,
-    daily_change_min: float | None = None,
-    daily_change_max: float | None = None,
-    pct_change_1w_max: float | None = None,
-    pct_change_1m_max: float | None = None,
-    has_big_deal_inflow: bool | None = None,
     settings_path: str | None = None,
+    **filters: Any,
 ) -> dict[str, Any]:
+    """Screen the latest trade date; ``filters`` are the ``query_full_universe`` thresholds."""
     codes = _normalize_indicator_codes(indicator_codes)
     settings = load_settings(settings_path)
     dao = IndicatorScreeningDAO(settings.postgres)
@@ -745,64 +815,69 @@ def list_indicator_screenings(
     if trade_date is None:
         raise RuntimeError("Daily trade dataset is empty; run the daily trade sync first.")
 
-    daily_indicator_dao = DailyIndicatorDAO(settings.postgres)
-    trade_metrics_dao = DailyTradeMetricsDAO(settings.postgres)
-    fundamental_dao = FundamentalMetricsDAO(settings.postgres)
-    require_big_deal_filter = has_big_deal_inflow is True or BIG_DEAL_INDICATOR_CODE in codes
     primary_code = codes[0] if codes else None
-
-    table_names = {
-        "daily_trade": daily_trade_dao._table_name,  # noqa: SLF001
-        "stock_basic": settings.postgres.stock_table,
-        "daily_indicator": daily_indicator_dao._table_name,  # noqa: SLF001
-        "daily_trade_metrics": trade_metrics_dao._table_name,  # noqa: SLF001
-        "fundamental_metrics": fundamental_dao._table_name,  # noqa: SLF001
-        "big_deal": settings.postgres.big_deal_fund_flow_table,
-    }
-
     dataset = dao.query_full_universe(
         trade_date=trade_date,
-        indicator_codes=codes,
-        primary_indicator_code=primary_code,
-        limit=limit,
-        offset=offset,
-        net_income_yoy_min=net_income_yoy_min,
-        net_income_qoq_min=net_income_qoq_min,
-        pe_min=pe_min,
-        pe_max=pe_max,
-        turnover_rate_min=turnover_rate_min,
-        turnover_rate_max=turnover_rate_max,
-        daily_change_min=daily_change_min,
-        daily_change_max=daily_change_max,
-        pct_change_1w_max=pct_change_1w_max,
-        pct_change_1m_max=pct_change_1m_max,
-        require_big_deal_inflow=require_big_deal_filter,
-        tables=table_names,
+        **_full_universe_arguments(codes, limit=limit, offset=offset, filters=filters),
+        tables=_screening_tables(settings, dao, daily_trade_dao),
     )
 
     rows: list[dict[str, Any]] = dataset.get("items", [])
     stock_codes = [row.get("ts_code") for row in rows if row.get("ts_code")]
     indicator_detail_map = _build_indicator_detail_map(dao, codes, stock_codes)
+    return _screening_response(
+        dataset,
+        trade_date=trade_date,
+        codes=codes,
+        primary_code=primary_code,
+        indicator_detail_map=indicator_detail_map,
+    )
 
-    entries = _compose_screening_entries(
-        rows,
+
+async def list_indicator_screenings_async(
+    *,
+    indicator_codes: Sequence[str] | None = None,
+    limit: int = 200,
+    offset: int = 0,
+    settings_path: str | None = None,
+    **filters: Any,
+) -> dict[str, Any]:
+    """Async ``list_indicator_screenings`` backed by the shared asyncpg pool."""
+    codes = _normalize_indicator_codes(indicator_codes)
+    settings = load_settings(settings_path)
+    dao = IndicatorScreeningDAO(settings.postgres)
+    daily_trade_dao = DailyTradeDAO(settings.postgres)
+    trade_date = await daily_trade_dao.latest_trade_date_async(include_intraday=False)
+    if trade_date is None:
+        raise RuntimeError("Daily trade dataset is empty; run the daily trade sync first.")
+
+    primary_code = codes[0] if codes else None
+    dataset = await dao.query_full_universe_async(
         trade_date=trade_date,
-        indicator_codes=codes,
-        primary_indicator_code=primary_code,
-        indicator_details=indicator_detail_map,
+        **_full_universe_arguments(codes, limit=limit, offset=offset, filters=filters),
+        tables=_screening_tables(settings, dao, daily_trade_dao),
     )
 
-    response_captured = _resolve_response_captured_at(entries, trade_date)
-    indicator_name = INDICATOR_DEFINITIONS[primary_code]["name"] if primary_code else "All Indicators"
+    rows: list[dict[str, Any]] = dataset.get("items", [])
+    stock_codes = list(dict.fromkeys(row.get("ts_code") for row in rows if row.get("ts_code")))
+    per_indicator = await asyncio.gather(
+        *(
+            dao.fetch_latest_entries_for_codes_async(indicator_code=code, stock_codes=stock_codes)
+            for code in codes
+        )
+    )
+    indicator_detail_map: dict[str, dict[str, dict[str, Any]]] = {}
+    for code, per_code in zip(codes, per_indicator):
+        for ts_code, record in per_code.items():
+            indicator_detail_map.setdefault(ts_code, {})[code] = record
+    return _screening_response(
+        dataset,
+        trade_date=trade_date,
+        codes=codes,
+        primary_code=primary_code,
+        indicator_detail_map=indicator_detail_map,
+    )
 
-    return {
-        "indicatorCode": primary_code or "all",
-        "indicatorCodes": list(codes),
-        "indicatorName": indicator_name,
-        "capturedAt": response_captured,
-        "total": dataset.get("total", 0),
-        "items": entries,
-    }
 
 def run_indicator_realtime_refresh(
     codes: Sequence[str] | None,
@@ -1400,5 +1475,6 @@ __all__ = [
     "sync_indicator_screening",
     "sync_indicator_continuous_volume",
     "list_indicator_screenings",
+    "list_indicator_screenings_async",
     "run_indicator_realtime_refresh",
 ]
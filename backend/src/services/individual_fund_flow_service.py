@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-import re
 import time
 from typing import Callable, Optional, Sequence
 
@@ -13,6 +12,7 @@ from ..api_clients import fetch_individual_fund_flow
 from ..config.settings import load_settings
 from ..dao import IndividualFundFlowDAO
 from ..dao.individual_fund_flow_dao import INDIVIDUAL_FUND_FLOW_FIELDS
+from ._akshare_utils import parse_amount_series, parse_numeric_series, parse_percent_series
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +27,8 @@ NUMERIC_COLUMNS: tuple[str, ...] = (
     "turnover_amount",
 )
 
+AMOUNT_COLUMNS: tuple[str, ...] = ("inflow", "outflow", "net_amount", "net_inflow", "turnover_amount")
+
 PERCENT_COLUMNS: tuple[str, ...] = (
     "price_change_percent",
     "stage_change_percent",
@@ -34,78 +36,6 @@ PERCENT_COLUMNS: tuple[str, ...] = (
     "continuous_turnover_rate",
 )
 
-_UNIT_PATTERN = re.compile(r"([+-]?\d+(?:\.\d+)?)([万亿兆]?)(?:元)?", re.IGNORECASE)
-_UNIT_MULTIPLIER = {
-    "": 1.0,
-    "万": 1e4,
-    "亿": 1e8,
-    "兆": 1e12,
-}
-
-
-def _parse_numeric(value: object) -> Optional[float]:
-    if value is None:
-        return None
-    if isinstance(value, (int, float)):
-        return float(value)
-    text = str(value).strip()
-    if not text or text in {"--", "-"}:
-        return None
-    text = text.replace(",", "")
-    try:
-        return float(text)
-    except ValueError:
-        return None
-
-
-def _parse_percent(value: object) -> Optional[float]:
-    if value is None:
-        return None
-    if isinstance(value, (int, float)):
-        return float(value)
-    text = str(value).strip()
-    if not text or text in {"--", "-"}:
-        return None
-    if text.endswith("%"):
-        text = text[:-1]
-    text = text.replace(",", "")
-    try:
-        return float(text)
-    except ValueError:
-        return None
-
-
-def _parse_amount(value: object) -> Optional[float]:
-    if value is None:
-        return None
-    if isinstance(value, (int, float)):
-        return float(value)
-    text = str(value).strip()
-    if not text or text in {"--", "-"}:
-        return None
-    text = text.replace("人民币", "").replace("元", "")
-    match = _UNIT_PATTERN.match(text)
-    if not match:
-        return _parse_numeric(text)
-    number, unit = match.groups()
-    try:
-        numeric = float(number)
-    except ValueError:
-        return None
-    multiplier = _UNIT_MULTIPLIER.get(unit, 1.0)
-    return numeric * multiplier
-
-
-def _normalize_stock_code(value: object) -> Optional[str]:
-    if value is None:
-        return None
-    text = str(value).strip()
-    if not text:
-        return None
-    if text.isdigit():
-        return text.zfill(6) if len(text) <= 6 else text
-    return text
-
 
 def _prepare_frame(dataframe: pd.DataFrame, symbol: str) -> pd.DataFrame:
     frame = dataframe.copy()
@@ -114,30 +44,28 @@ def _prepare_frame(dataframe: pd.DataFrame, symbol: str) -> pd.DataFrame:
     if "stock_name" not in frame.columns:
         frame["stock_name"] = dataframe.get("股票简称")
 
-    frame = frame.dropna(subset=["stock_code"])
-    frame["stock_code"] = frame["stock_code"].map(_normalize_stock_code)
-    frame = frame.dropna(subset=["stock_code"])
+    stock_code = frame["stock_code"].astype("string").str.strip()
+    short_digits = (stock_code.str.isdigit() & (stock_code.str.len() < 6)).fillna(False)
+    stock_code[short_digits] = stock_code[short_digits].str.zfill(6)
+    frame["stock_code"] = stock_code
+    frame = frame.loc[stock_code.fillna("") != ""].copy()
 
     frame["symbol"] = symbol
     frame["rank"] = pd.to_numeric(frame.get("rank"), errors="coerce").astype("Int64")
 
     frame = frame.drop_duplicates(subset=["stock_code"], keep="first")
 
-    frame["latest_price"] = frame.get("latest_price").map(_parse_numeric)
-    frame["turnover_amount"] = frame.get("turnover_amount").map(_parse_amount)
-    frame["net_inflow"] = frame.get("net_inflow").map(_parse_amount)
-    for column in ("inflow", "outflow", "net_amount"):
-        frame[column] = frame.get(column).map(_parse_amount)
-
-    for column in PERCENT_COLUMNS:
-        if column in frame.columns:
-            frame[column] = frame[column].map(_parse_percent)
-
     required_columns = set(INDIVIDUAL_FUND_FLOW_FIELDS)
     for column in required_columns:
         if column not in frame.columns:
             frame[column] = None
 
+    frame["latest_price"] = parse_numeric_series(frame["latest_price"])
+    for column in AMOUNT_COLUMNS:
+        frame[column] = parse_amount_series(frame[column])
+    for column in PERCENT_COLUMNS:
+        frame[column] = parse_percent_series(frame[column])
+
     ordered = list(INDIVIDUAL_FUND_FLOW_FIELDS)
     return frame.loc[:, ordered]
 
@@ -9,6 +9,7 @@ import akshare as ak
 
 from ..config.settings import load_settings
 from ..dao import IndustryDirectoryDAO
+from .sector_name_service import get_sector_name_index, refresh_sector_name_index
 
 logger = logging.getLogger(__name__)
 
@@ -46,11 +47,11 @@ def _load_industry_codes(*, settings_path: Optional[str] = None, refresh: bool =
     rows = directory_dao.list_entries()
     if rows and not refresh:
         mapping = {row["industry_name"]: row["industry_code"] for row in rows}
-        _INDUSTRY_CACHE = mapping
-        return mapping
-    mapping = _fetch_remote_industry_codes()
-    if mapping:
-        directory_dao.replace_all(mapping)
+    else:
+        mapping = _fetch_remote_industry_codes()
+        if mapping:
+            directory_dao.replace_all(mapping)
+    refresh_sector_name_index("industry", mapping)
     _INDUSTRY_CACHE = mapping
     return mapping
 
@@ -82,11 +83,10 @@ def resolve_industry_label(industry: str, *, settings_path: Optional[str] = None
     target = (industry or "").strip()
     if not target:
         raise ValueError("Industry name cannot be empty.")
-    if target in mapping:
-        return {"name": target, "code": mapping[target]}
-    for name, code in mapping.items():
-        if target.lower() == name.lower():
-            return {"name": name, "code": code}
+    index = get_sector_name_index("industry") or refresh_sector_name_index("industry", mapping)
+    name = index.match(target)
+    if name in mapping:
+        return {"name": name, "code": mapping[name]}
     raise ValueError(f"Industry '{industry}' is not available in the Eastmoney directory.")
 
 
@@ -9,8 +9,10 @@ from typing import Dict, Iterable, List, Optional, Tuple
 import akshare as ak
 import pandas as pd
 
+from ..config.runtime_config import load_runtime_config
 from ..config.settings import load_settings
 from ..dao import IndustryIndexHistoryDAO
+from .sector_index_service import SECTOR_INDEX_METHODS, sync_sector_indices
 
 logger = logging.getLogger(__name__)
 
@@ -96,6 +98,24 @@ def sync_industry_index_history(
     if not names:
         return {"startDate": start_date, "endDate": end_date, "totalRows": 0, "errors": []}
     start, end = _normalise_dates(start_date, end_date)
+    source = load_runtime_config().sector_index_source
+    if source in SECTOR_INDEX_METHODS:
+        # Computed from stored constituents up to today; without an explicit start the
+        # incremental window is chained onto the stored series.
+        result = sync_sector_indices(
+            method=source,
+            kinds=("industry",),
+            sector_names=names,
+            start_date=datetime.strptime(start, "%Y%m%d").date() if start_date else None,
+            settings_path=settings_path,
+        )
+        rows_by_industry = result["sectorRows"].get("industry", {})
+        return {
+            "startDate": str(result["startDate"]).replace("-", ""),
+            "endDate": str(result["endDate"]).replace("-", ""),
+            "totalRows": result["rows"],
+            "errors": [name for name in names if not rows_by_industry.get(name)],
+        }
     settings = load_settings(settings_path)
     dao = IndustryIndexHistoryDAO(settings.postgres)
     total_rows = 0
@@ -106,6 +126,7 @@ def sync_industry_index_history(
             errors.append(name)
             continue
         try:
+            dao.delete_other_sources([name], keep_prefix="EM-")
             inserted = dao.upsert(frame)
             total_rows += inserted
         except Exception as exc:  # pragma: no cover - persistence failure
@@ -6,16 +6,15 @@ import json
 import logging
 import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from zoneinfo import ZoneInfo
 
-from psycopg2 import sql
-
 from ..api_clients import generate_finance_analysis
 from ..config.settings import load_settings
 from ..dao import IndustryInsightDAO, NewsArticleDAO, NewsInsightDAO
 from .industry_directory_service import resolve_industry_label
+from .news_query_service import fetch_news_with_insights
 from .sector_fund_flow_service import build_sector_fund_flow_snapshot
 
 logger = logging.getLogger(__name__)
@@ -135,52 +134,22 @@ def _fetch_industry_news(
     *,
     lookback_hours: int,
     limit: int,
+    before: Optional[Tuple[datetime, Optional[str]]] = None,
 ) -> List[Dict[str, Any]]:
     key = industry_name.strip().lower()
     if not key:
         return []
 
     window_start = _local_now() - timedelta(hours=max(1, lookback_hours))
-
-    with article_dao.connect() as conn:
-        article_dao.ensure_table(conn)
-        insight_dao.ensure_table(conn)
-        with conn.cursor() as cur:
-            cur.execute(
-                sql.SQL(
-                    """
-                    SELECT a.article_id, a.source, a.title, a.summary, a.published_at, a.url,
-                           i.impact_summary, i.impact_analysis, i.impact_confidence,
-                           i.relevance_confidence, i.relevance_reason,
-                           i.impact_themes, i.impact_industries, i.impact_sectors, i.impact_stocks,
-                           i.extra_metadata
-                    FROM {articles_schema}.{articles_table} AS a
-                    JOIN {insights_schema}.{insights_table} AS i ON i.article_id = a.article_id
-                    WHERE a.processing_status = 'completed'
-                      AND a.published_at >= %s
-                      AND (
-                          LOWER(COALESCE(i.impact_industries, '')) LIKE %s
-                       OR LOWER(COALESCE(i.impact_sectors, '')) LIKE %s
-                       OR LOWER(COALESCE(i.impact_themes, '')) LIKE %s
-                      )
-                    ORDER BY a.published_at DESC
-                    LIMIT %s
-                    """
-                ).format(
-                    articles_schema=sql.Identifier(article_dao.config.schema),
-                    articles_table=sql.Identifier(article_dao._table_name),  # type: ignore[attr-defined]
-                    insights_schema=sql.Identifier(insight_dao.config.schema),
-                    insights_table=sql.Identifier(insight_dao._table_name),  # type: ignore[attr-defined]
-                ),
-                (
-                    window_start,
-                    f"%{key}%",
-                    f"%{key}%",
-                    f"%{key}%",
-                    limit,
-                ),
-            )
-            rows = cur.fetchall()
+    rows = fetch_news_with_insights(
+        article_dao,
+        insight_dao,
+        completed_only=True,
+        published_after=window_start,
+        tag_terms=[industry_name],
+        before=before,
+        limit=limit,
+    )
 
     columns = [
         "article_id",
@@ -203,7 +172,7 @@ def _fetch_industry_news(
 
     results: List[Dict[str, Any]] = []
     for row in rows:
-        record = {column: value for column, value in zip(columns, row)}
+        record = {column: row[column] for column in columns}
         record["published_at"] = _iso(record.get("published_at"))
         record["impact_summary"] = _truncate_text(record.get("impact_summary"), 200)
         record["impact_analysis"] = _truncate_text(record.get("impact_analysis"), 320)
@@ -453,6 +422,8 @@ def list_industry_news(
     *,
     lookback_hours: int = DEFAULT_LOOKBACK_HOURS,
     limit: int = 50,
+    before_published_at: Optional[datetime] = None,
+    before_id: Optional[str] = None,
     settings_path: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     resolved = resolve_industry_label(industry, settings_path=settings_path)
@@ -465,6 +436,7 @@ def list_industry_news(
         resolved["name"],
         lookback_hours=lookback_hours,
         limit=max(1, min(limit, 200)),
+        before=(before_published_at, before_id) if before_published_at else None,
     )
 
 
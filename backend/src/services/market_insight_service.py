@@ -514,9 +514,11 @@ def _format_fund_flow_fact_text(overview_payload: Dict[str, object]) -> Optional
 
 
 
-def _decode_json_list(value: Optional[str]) -> List[str]:
+def _decode_json_list(value: object) -> List[str]:
     if not value:
         return []
+    if isinstance(value, (list, tuple)):
+        return [str(item).strip() for item in value if str(item).strip()]
     try:
         parsed = json.loads(value)
         if isinstance(parsed, list):
@@ -632,8 +634,8 @@ def collect_recent_market_headlines(
                       AND i.impact_checked_at IS NOT NULL
                       AND a.published_at BETWEEN %s AND %s
                       AND (
-                          (i.impact_levels IS NOT NULL AND POSITION('"market"' IN i.impact_levels) > 0)
-                          OR (i.impact_markets IS NOT NULL AND LENGTH(TRIM(i.impact_markets)) > 0)
+                          i.impact_levels @> '["market"]'::jsonb
+                          OR i.impact_markets <> '[]'::jsonb
                       )
                     ORDER BY i.impact_confidence DESC NULLS LAST, a.published_at DESC
                     LIMIT %s
@@ -786,7 +788,7 @@ def generate_market_insight_summary(
     window_end = _local_now()
     window_start = window_end - timedelta(hours=max(lookback_hours, 1))
 
-    overview_payload = build_market_overview_payload(settings_path=settings_path)
+    overview_payload = build_market_overview_payload(settings_path=settings_path, use_cache=False)
     overview_payload["marketHeadlines"] = _build_stage_headlines_payload(articles)
     _notify(0.18, "完成市场概览与参考数据整理")
 
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import copy
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from zoneinfo import ZoneInfo
 
 from ..config.settings import load_settings
@@ -29,6 +33,21 @@ _INDEX_CODES = [
 
 _LOCAL_TZ = ZoneInfo("Asia/Shanghai")
 
+MARKET_OVERVIEW_CACHE_TTL_SECONDS = 300
+# SyncMonitor job names whose completion changes one of the overview sections.
+MARKET_OVERVIEW_SOURCE_JOBS = frozenset(
+    {
+        "realtime_index",
+        "index_history",
+        "market_insight",
+        "macro_insight",
+        "market_fund_flow",
+        "margin_account",
+        "peripheral_insight",
+        "market_activity",
+    }
+)
+
 
 def _serialize_datetime(value: Optional[datetime]) -> Optional[str]:
     if value is None:
@@ -85,17 +104,8 @@ def _fetch_latest_market_insight(settings) -> Optional[Dict[str, Any]]:
     return record
 
 
-def build_market_overview_payload(*, settings_path: Optional[str] = None) -> Dict[str, Any]:
-    settings = load_settings(settings_path)
-
-    realtime_dao = RealtimeIndexDAO(settings.postgres)
-    history_dao = IndexHistoryDAO(settings.postgres)
-    market_fund_flow_dao = MarketFundFlowDAO(settings.postgres)
-    margin_dao = MarginAccountDAO(settings.postgres)
-    peripheral_dao = PeripheralInsightDAO(settings.postgres)
-    activity_dao = MarketActivityDAO(settings.postgres)
-
-    realtime_rows = realtime_dao.list_entries(limit=500)["items"]
+def _load_realtime_indices(settings) -> List[Dict[str, Any]]:
+    realtime_rows = RealtimeIndexDAO(settings.postgres).list_entries(limit=500)["items"]
     realtime_filtered: List[Dict[str, Any]] = []
     for row in realtime_rows:
         if (row.get("turnover") or 0) <= 5e11:
@@ -112,12 +122,15 @@ def build_market_overview_payload(*, settings_path: Optional[str] = None) -> Dic
             else:
                 entry["change_percent"] = None
         realtime_filtered.append(entry)
+    return realtime_filtered
+
 
+def _load_index_history(settings) -> Dict[str, List[Dict[str, Any]]]:
+    history = IndexHistoryDAO(settings.postgres).list_history_many(_INDEX_CODES, limit=10)
     index_history: Dict[str, List[Dict[str, Any]]] = {}
     for code in _INDEX_CODES:
-        history_rows = history_dao.list_history(index_code=code, limit=10)
         normalised_rows: List[Dict[str, Any]] = []
-        for row in history_rows:
+        for row in history.get(code, []):
             entry = dict(row)
             pct_change = entry.get("pct_change")
             if pct_change is not None:
@@ -127,34 +140,32 @@ def build_market_overview_payload(*, settings_path: Optional[str] = None) -> Dic
                     pct_value = None
                 if pct_value is not None:
                     entry["pct_change"] = pct_value / 100.0
-            for numeric_key in ("open", "close", "high", "low", "volume", "amount", "change_amount", "turnover"):
-                value = entry.get(numeric_key)
-                if value is None:
-                    continue
-                try:
-                    entry[numeric_key] = float(value)
-                except (TypeError, ValueError):
-                    pass
             normalised_rows.append(entry)
         index_history[code] = normalised_rows
+    return index_history
+
 
+def _load_market_insight(settings) -> Optional[Dict[str, Any]]:
     market_insight = _fetch_latest_market_insight(settings)
     if market_insight:
         market_insight.pop("referenced_articles", None)
         for key in ("generated_at", "window_start", "window_end"):
             if key in market_insight and market_insight[key] is not None:
                 market_insight[key] = _serialize_datetime(market_insight[key])
+    return market_insight
+
 
+def _load_macro_insight(settings) -> Optional[Dict[str, Any]]:
     macro_insight = get_latest_macro_insight()
     if macro_insight:
         for key in ("generated_at", "updated_at", "created_at"):
             if macro_insight.get(key) is not None:
                 macro_insight[key] = _serialize_datetime(macro_insight[key])
+    return macro_insight
 
-    market_fund_flow = market_fund_flow_dao.list_entries(limit=10).get("items", [])
-    margin_stats = margin_dao.list_entries(limit=10).get("items", [])
 
-    peripheral = peripheral_dao.fetch_latest()
+def _load_peripheral_insight(settings) -> Optional[Dict[str, Any]]:
+    peripheral = PeripheralInsightDAO(settings.postgres).fetch_latest()
     if peripheral:
         metrics = peripheral.get("metrics")
         if isinstance(metrics, str):
@@ -165,23 +176,86 @@ def build_market_overview_payload(*, settings_path: Optional[str] = None) -> Dic
         for key in ("generated_at", "created_at", "updated_at"):
             if peripheral.get(key) is not None:
                 peripheral[key] = _serialize_datetime(peripheral[key])
+    return peripheral
+
+
+_SECTION_LOADERS: Dict[str, Callable[[Any], Any]] = {
+    "realtimeIndices": _load_realtime_indices,
+    "indexHistory": _load_index_history,
+    "marketInsight": _load_market_insight,
+    "macroInsight": _load_macro_insight,
+    "marketFundFlow": lambda settings: MarketFundFlowDAO(settings.postgres).list_entries(limit=10).get("items", []),
+    "marginAccount": lambda settings: MarginAccountDAO(settings.postgres).list_entries(limit=10).get("items", []),
+    "peripheralInsight": _load_peripheral_insight,
+    "marketActivity": lambda settings: MarketActivityDAO(settings.postgres).list_entries().get("items", []),
+}
+
+_cache_lock = threading.Lock()
+_cached_payload: Optional[Dict[str, Any]] = None
+_cached_at: float = 0.0
+_cache_generation = 0
 
-    activity_rows = activity_dao.list_entries().get("items", [])
 
-    now_local = datetime.now(_LOCAL_TZ)
+def invalidate_market_overview_cache() -> None:
+    """Drop the cached overview so the next request rebuilds it from the source tables."""
+    global _cached_payload, _cache_generation
+    with _cache_lock:
+        _cached_payload = None
+        _cache_generation += 1
+
+
+def invalidate_market_overview_on_job(job: str, success: bool) -> None:
+    """``SyncMonitor`` finish listener: invalidate when a source job of the overview completes."""
+    if success and job in MARKET_OVERVIEW_SOURCE_JOBS:
+        invalidate_market_overview_cache()
+
+
+def _assemble_market_overview_payload(settings) -> Dict[str, Any]:
+    with ThreadPoolExecutor(max_workers=len(_SECTION_LOADERS), thread_name_prefix="market-overview") as executor:
+        futures = {key: executor.submit(loader, settings) for key, loader in _SECTION_LOADERS.items()}
+        sections = {key: future.result() for key, future in futures.items()}
 
     payload = {
-        "generatedAt": now_local.isoformat(),
-        "realtimeIndices": realtime_filtered,
-        "indexHistory": index_history,
-        "marketInsight": market_insight,
-        "macroInsight": macro_insight,
-        "marketFundFlow": market_fund_flow,
-        "marginAccount": margin_stats,
-        "peripheralInsight": peripheral,
-        "marketActivity": activity_rows,
+        "generatedAt": datetime.now(_LOCAL_TZ).isoformat(),
+        **sections,
         "latestReasoning": None,
     }
-
     return _serialise_value(payload)
-__all__ = ["build_market_overview_payload"]
+
+
+def build_market_overview_payload(
+    *,
+    settings_path: Optional[str] = None,
+    use_cache: bool = True,
+) -> Dict[str, Any]:
+    """
+    Return the landing dashboard payload, loading its sections concurrently.
+
+    The assembled payload is cached until one of ``MARKET_OVERVIEW_SOURCE_JOBS`` completes
+    (see ``invalidate_market_overview_on_job``) or ``MARKET_OVERVIEW_CACHE_TTL_SECONDS`` passes.
+    """
+    global _cached_payload, _cached_at
+    if use_cache:
+        with _cache_lock:
+            if _cached_payload is not None and time.monotonic() - _cached_at < MARKET_OVERVIEW_CACHE_TTL_SECONDS:
+                return copy.deepcopy(_cached_payload)
+            generation = _cache_generation
+
+    payload = _assemble_market_overview_payload(load_settings(settings_path))
+
+    if use_cache:
+        with _cache_lock:
+            # Skip the store if a source job finished while this payload was being built.
+            if generation == _cache_generation:
+                _cached_payload = payload
+                _cached_at = time.monotonic()
+        payload = copy.deepcopy(payload)
+    return payload
+
+
+__all__ = [
+    "MARKET_OVERVIEW_SOURCE_JOBS",
+    "build_market_overview_payload",
+    "invalidate_market_overview_cache",
+    "invalidate_market_overview_on_job",
+]
@@ -6,8 +6,9 @@ from __future__ import annotations
 
 import json
 from datetime import datetime, timedelta
-from typing import Dict, Iterable, List, Optional, Sequence
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
+from psycopg2 import sql
 from zoneinfo import ZoneInfo
 
 from ..config.settings import load_settings
@@ -16,6 +17,142 @@ from ..dao import NewsArticleDAO, NewsInsightDAO
 LOCAL_TZ = ZoneInfo("Asia/Shanghai")
 
 
+NEWS_ARTICLE_COLUMNS: Tuple[str, ...] = (
+    "article_id",
+    "source",
+    "source_item_id",
+    "title",
+    "summary",
+    "content",
+    "content_type",
+    "published_at",
+    "url",
+    "language",
+    "content_fetched",
+    "content_fetched_at",
+    "processing_status",
+    "relevance_attempts",
+    "impact_attempts",
+    "last_error",
+)
+NEWS_INSIGHT_COLUMNS: Tuple[str, ...] = (
+    "is_relevant",
+    "relevance_confidence",
+    "relevance_reason",
+    "relevance_checked_at",
+    "impact_levels",
+    "impact_markets",
+    "impact_industries",
+    "impact_sectors",
+    "impact_themes",
+    "impact_stocks",
+    "impact_summary",
+    "impact_analysis",
+    "impact_confidence",
+    "impact_checked_at",
+    "extra_metadata",
+)
+NEWS_INSIGHT_ARRAY_COLUMNS: Tuple[str, ...] = (
+    "impact_levels",
+    "impact_markets",
+    "impact_industries",
+    "impact_sectors",
+    "impact_themes",
+    "impact_stocks",
+)
+NEWS_TAG_COLUMNS: Tuple[str, ...] = ("impact_themes", "impact_industries", "impact_sectors")
+MAX_NEWS_PAGE_SIZE = 500
+
+
+def fetch_news_with_insights(
+    article_dao: NewsArticleDAO,
+    insight_dao: NewsInsightDAO,
+    *,
+    source: Optional[str] = None,
+    only_relevant: bool = False,
+    completed_only: bool = False,
+    published_after: Optional[datetime] = None,
+    stocks: Optional[Iterable[str]] = None,
+    tag_terms: Optional[Iterable[str]] = None,
+    before: Optional[Tuple[datetime, Optional[str]]] = None,
+    limit: int = 100,
+) -> List[Dict[str, object]]:
+    """
+    Return one keyset page of articles joined with their insights, newest first.
+
+    All filters run in SQL and use the GIN-indexed JSONB tag columns: ``stocks`` must be
+    one of the tagged stocks and ``tag_terms`` one of the tagged themes, industries or
+    sectors. ``before`` is the ``(published_at, article_id)`` of the last row of the
+    previous page.
+    """
+    conditions: List[sql.Composable] = []
+    params: List[object] = []
+    if source:
+        conditions.append(sql.SQL("a.source = %s"))
+        params.append(source)
+    if completed_only:
+        conditions.append(sql.SQL("a.processing_status = 'completed'"))
+    if only_relevant:
+        conditions.append(sql.SQL("i.is_relevant IS TRUE"))
+    if published_after is not None:
+        conditions.append(sql.SQL("a.published_at >= %s"))
+        params.append(_to_local_naive(published_after))
+    if before is not None:
+        before_published_at, before_id = before
+        if before_id:
+            conditions.append(sql.SQL("(a.published_at, a.article_id) < (%s, %s)"))
+            params.extend([_to_local_naive(before_published_at), before_id])
+        else:
+            conditions.append(sql.SQL("a.published_at < %s"))
+            params.append(_to_local_naive(before_published_at))
+    stock_keys = _case_variants(stocks)
+    if stock_keys:
+        conditions.append(sql.SQL("i.impact_stocks ?| %s"))
+        params.append(stock_keys)
+    tag_keys = _case_variants(tag_terms)
+    if tag_keys:
+        tag_clauses = []
+        for column in NEWS_TAG_COLUMNS:
+            tag_clauses.append(sql.SQL("i.{column} ?| %s").format(column=sql.Identifier(column)))
+            params.append(tag_keys)
+        conditions.append(sql.SQL("(") + sql.SQL(" OR ").join(tag_clauses) + sql.SQL(")"))
+
+    where_clause = sql.SQL("")
+    if conditions:
+        where_clause = sql.SQL("WHERE ") + sql.SQL(" AND ").join(conditions)
+
+    columns = [sql.SQL("a.{}").format(sql.Identifier(column)) for column in NEWS_ARTICLE_COLUMNS]
+    columns += [sql.SQL("i.{}").format(sql.Identifier(column)) for column in NEWS_INSIGHT_COLUMNS]
+    query = sql.SQL(
+        """
+        SELECT {columns}
+        FROM {articles_schema}.{articles_table} AS a
+        LEFT JOIN {insights_schema}.{insights_table} AS i ON i.article_id = a.article_id
+        {where_clause}
+        ORDER BY a.published_at DESC, a.article_id DESC
+        LIMIT %s
+        """
+    ).format(
+        columns=sql.SQL(", ").join(columns),
+        articles_schema=sql.Identifier(article_dao.config.schema),
+        articles_table=sql.Identifier(article_dao._table_name),  # type: ignore[attr-defined]
+        insights_schema=sql.Identifier(insight_dao.config.schema),
+        insights_table=sql.Identifier(insight_dao._table_name),  # type: ignore[attr-defined]
+        where_clause=where_clause,
+    )
+    params.append(max(1, min(int(limit), MAX_NEWS_PAGE_SIZE)))
+
+    with article_dao.connect() as conn:
+        article_dao.ensure_table(conn)
+        insight_dao.ensure_table(conn)
+        with conn.cursor() as cur:
+            cur.execute(query, params)
+            rows = cur.fetchall()
+
+    names = NEWS_ARTICLE_COLUMNS + NEWS_INSIGHT_COLUMNS
+    return [dict(zip(names, row)) for row in rows]
+
+
 def list_news_articles(
     *,
     source: Optional[str] = None,
@@ -23,6 +160,8 @@ def list_news_articles(
     only_relevant: bool = False,
     stock: Optional[str] = None,
     lookback_hours: Optional[int] = None,
+    before_published_at: Optional[datetime] = None,
+    before_id: Optional[str] = None,
     settings_path: Optional[str] = None,
 ) -> List[Dict[str, object]]:
     """
@@ -32,54 +171,58 @@ def list_news_articles(
         source: Optional source identifier (e.g. "global_flash" or "finance_breakfast").
         limit: Maximum number of rows to return.
         only_relevant: When True, filter to articles marked as relevant by the LLM.
+        stock: Comma-separated stock identifiers matched against the tagged stocks.
+        lookback_hours: Restrict to articles published within the last N hours.
+        before_published_at: Keyset cursor; return articles older than this timestamp.
+        before_id: Article id paired with ``before_published_at`` to break ties.
         settings_path: Optional override to load a different configuration file.
     """
     settings = load_settings(settings_path)
     article_dao = NewsArticleDAO(settings.postgres)
     insight_dao = NewsInsightDAO(settings.postgres)
 
-    fetch_limit = limit
-    stock_tokens = _normalize_stock_filters(stock)
-    if stock_tokens:
-        fetch_limit = min(limit * 5, 500)
-    articles = article_dao.list_articles(source=source, limit=fetch_limit)
-    if not articles:
-        return []
-
-    article_ids = [article["article_id"] for article in articles]
-    insight_map = insight_dao.fetch_many(article_ids)
-
     min_published_at: Optional[datetime] = None
     if lookback_hours and lookback_hours > 0:
         min_published_at = datetime.now(LOCAL_TZ) - timedelta(hours=int(lookback_hours))
 
+    rows = fetch_news_with_insights(
+        article_dao,
+        insight_dao,
+        source=source,
+        only_relevant=only_relevant,
+        published_after=min_published_at,
+        stocks=sorted(_normalize_stock_filters(stock)),
+        before=(before_published_at, before_id) if before_published_at else None,
+        limit=limit,
+    )
+
     results: List[Dict[str, object]] = []
-    for article in articles:
-        insight = insight_map.get(article["article_id"], {})
-        if only_relevant and not insight.get("is_relevant"):
-            continue
-        merged = _merge_article_insight(article, insight)
-        if min_published_at:
-            published_at = article.get("published_at")
-            if isinstance(published_at, datetime):
-                reference = (
-                    published_at.replace(tzinfo=LOCAL_TZ)
-                    if published_at.tzinfo is None
-                    else published_at.astimezone(LOCAL_TZ)
-                )
-                if reference < min_published_at:
-                    continue
-        if stock_tokens:
-            impact_stocks = merged.get("impact", {}).get("stocks") or []
-            normalized_stocks = {_normalize_stock_token(value) for value in impact_stocks if value}
-            if not normalized_stocks.intersection(stock_tokens):
-                continue
-        results.append(merged)
-        if len(results) >= limit:
-            break
+    for row in rows:
+        article = {column: row[column] for column in NEWS_ARTICLE_COLUMNS}
+        insight = {column: row[column] for column in NEWS_INSIGHT_COLUMNS}
+        for column in NEWS_INSIGHT_ARRAY_COLUMNS:
+            insight[column] = NewsInsightDAO._decode_array(insight[column])
+        results.append(_merge_article_insight(article, insight))
     return results
 
 
+def _to_local_naive(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(LOCAL_TZ).replace(tzinfo=None)
+
+
+def _case_variants(values: Optional[Iterable[str]]) -> List[str]:
+    # JSONB key existence is case-sensitive; tags are stored as the classifier wrote them.
+    variants: List[str] = []
+    for value in values or []:
+        text = str(value).strip() if value is not None else ""
+        for variant in (text, text.upper(), text.lower()):
+            if variant and variant not in variants:
+                variants.append(variant)
+    return variants
+
+
 def _merge_article_insight(article: Dict[str, object], insight: Dict[str, object]) -> Dict[str, object]:
     relevance_checked_at = insight.get("relevance_checked_at")
     impact_checked_at = insight.get("impact_checked_at")
@@ -137,12 +280,6 @@ def _normalize_stock_filters(stock: Optional[str]) -> set[str]:
     return {token.lower() for token in tokens if token}
 
 
-def _normalize_stock_token(value: object) -> str:
-    if value is None:
-        return ""
-    return str(value).strip().lower()
-
-
 def _format_datetime(value: object) -> Optional[datetime]:
     if value is None:
         return None
@@ -173,4 +310,4 @@ def _coerce_metadata(value: object) -> Optional[object]:
     return value
 
 
-__all__ = ["list_news_articles"]
+__all__ = ["fetch_news_with_insights", "list_news_articles"]
@@ -11,6 +11,7 @@ import pandas as pd
 from ..config.runtime_config import ObservationStrategyConfig, load_runtime_config
 from ..config.settings import AppSettings, load_settings
 from ..dao import BigDealFundFlowDAO, DailyTradeDAO
+from .price_panel_service import load_ohlcv_history
 
 
 @dataclass
@@ -84,28 +85,25 @@ def _load_trade_window(daily_dao: DailyTradeDAO, settings: AppSettings, lookback
         return pd.DataFrame()
     start_date = latest_date - timedelta(days=lookback_days * 2)
     schema = settings.postgres.schema
-    trade_table = daily_dao._table_name
     stock_table = settings.postgres.stock_table
     query = f"""
-        SELECT t.ts_code,
-               t.trade_date,
-               t.open,
-               t.high,
-               t.low,
-               t.close,
-               t.pre_close,
-               t.vol,
+        SELECT sb.ts_code,
                sb.name,
                sb.symbol
-        FROM {schema}.{trade_table} AS t
-        JOIN {schema}.{stock_table} AS sb ON sb.ts_code = t.ts_code
-        WHERE t.trade_date >= %s
-          AND sb.list_status = 'L'
+        FROM {schema}.{stock_table} AS sb
+        WHERE sb.list_status = 'L'
     """
     with daily_dao.connect() as conn:
-        daily_dao.ensure_table(conn)
-        frame = pd.read_sql_query(query, conn, params=[start_date])
-    return frame
+        listed = pd.read_sql_query(query, conn)
+    if listed.empty:
+        return pd.DataFrame()
+    trades = load_ohlcv_history(
+        daily_dao,
+        start_date,
+        fields=("open", "high", "low", "close", "pre_close", "vol"),
+        include_intraday=True,
+    )
+    return trades.merge(listed, on="ts_code", how="inner")
 
 
 WEEK_WINDOW_DAYS = 5
@@ -0,0 +1,392 @@
+"""
+Columnar on-disk cache of daily OHLCV bars for analytics workloads.
+
+Final (non-intraday) ``daily_trade`` bars are stored as one uncompressed Arrow IPC file per
+calendar year under ``backend/data/price_panel``. Files are memory-mapped on read, so loading a
+date range touches only the pages it needs and numeric columns arrive as float64 without the
+Decimal/date re-parsing a ``pd.read_sql_query`` round trip requires. ``sync_daily_trade`` appends
+to the cache after every upsert; ``rebuild_price_panel`` bootstraps it from PostgreSQL.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from ..config.settings import load_settings
+from ..dao import DailyTradeDAO
+
+logger = logging.getLogger(__name__)
+
+PRICE_PANEL_DIR = Path(__file__).resolve().parents[2] / "data" / "price_panel"
+PANEL_FIELDS: Tuple[str, ...] = ("open", "high", "low", "close", "pre_close", "vol", "amount")
+DEFAULT_REBUILD_YEARS = 3
+
+_MANIFEST_NAME = "manifest.json"
+_SCHEMA = pa.schema(
+    [("ts_code", pa.string()), ("trade_date", pa.date32())]
+    + [(field, pa.float64()) for field in PANEL_FIELDS]
+)
+
+
+def _to_date(value: date | datetime | str | None) -> Optional[date]:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    parsed = pd.to_datetime(str(value).strip(), errors="coerce")
+    if pd.isna(parsed):
+        raise ValueError(f"Invalid date value: {value!r}")
+    return parsed.date()
+
+
+@dataclass(frozen=True)
+class PricePanel:
+    """Dense ``dates x codes`` NumPy matrices per field; missing bars are NaN."""
+
+    dates: np.ndarray
+    codes: np.ndarray
+    values: Dict[str, np.ndarray]
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self.values[field]
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return len(self.dates), len(self.codes)
+
+
+class PricePanelStore:
+    """Year-partitioned Arrow IPC files plus a small JSON manifest describing coverage."""
+
+    def __init__(self, root: Path | str = PRICE_PANEL_DIR) -> None:
+        self._root = Path(root)
+        self._lock = threading.Lock()
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    def _year_path(self, year: int) -> Path:
+        return self._root / f"daily_{year}.arrow"
+
+    def _read_manifest(self) -> Dict[str, object]:
+        try:
+            return json.loads((self._root / _MANIFEST_NAME).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning("Ignoring unreadable price panel manifest: %s", exc)
+            return {}
+
+    def _write_manifest(self, manifest: Dict[str, object]) -> None:
+        self._root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._root / f"{_MANIFEST_NAME}.tmp"
+        tmp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+        tmp_path.replace(self._root / _MANIFEST_NAME)
+
+    def coverage(self) -> Optional[Tuple[date, date]]:
+        """Return the ``(start, end)`` trade-date range the cache is complete for, if any."""
+        manifest = self._read_manifest()
+        start = manifest.get("start_date")
+        end = manifest.get("end_date")
+        if not start or not end:
+            return None
+        return date.fromisoformat(str(start)), date.fromisoformat(str(end))
+
+    def covers(self, start_date: date, end_date: Optional[date] = None) -> bool:
+        coverage = self.coverage()
+        if coverage is None:
+            return False
+        return coverage[0] <= start_date and (end_date is None or end_date <= coverage[1])
+
+    def _load_year(self, year: int, *, memory_map: bool = True) -> Optional[pa.Table]:
+        path = self._year_path(year)
+        if not path.exists():
+            return None
+        if memory_map:
+            return pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+        # Writers read into memory so the partition can be replaced while no mapping is held.
+        with pa.OSFile(str(path), "rb") as source:
+            return pa.ipc.open_file(source).read_all()
+
+    def _write_year(self, year: int, table: pa.Table) -> None:
+        self._root.mkdir(parents=True, exist_ok=True)
+        path = self._year_path(year)
+        tmp_path = path.with_suffix(".arrow.tmp")
+        with pa.OSFile(str(tmp_path), "wb") as sink:
+            with pa.ipc.new_file(sink, _SCHEMA) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _frame_to_table(frame: pd.DataFrame) -> pa.Table:
+        prepared = pd.DataFrame(
+            {
+                "ts_code": frame["ts_code"].astype(str),
+                "trade_date": pd.to_datetime(frame["trade_date"], errors="coerce").dt.date,
+            }
+        )
+        for field in PANEL_FIELDS:
+            source = frame[field] if field in frame.columns else None
+            prepared[field] = (
+                pd.to_numeric(source, errors="coerce").astype(float) if source is not None else np.nan
+            )
+        prepared = prepared.dropna(subset=["ts_code", "trade_date"])
+        return pa.Table.from_pandas(prepared, schema=_SCHEMA, preserve_index=False)
+
+    def write(
+        self,
+        frame: pd.DataFrame,
+        *,
+        mark_start: Optional[date] = None,
+        mark_end: Optional[date] = None,
+    ) -> int:
+        """
+        Merge ``frame`` into the year partitions it touches (new rows win on ``(ts_code, trade_date)``).
+
+        ``mark_start``/``mark_end`` widen the manifest coverage; they are only passed when the caller
+        knows every bar inside that range has been written (bootstrap or an incremental sync).
+        """
+        if "is_intraday" in frame.columns:
+            frame = frame[~frame["is_intraday"].fillna(False).astype(bool)]
+        written = 0
+        with self._lock:
+            if not frame.empty:
+                incoming = self._frame_to_table(frame)
+                years = pc.year(incoming["trade_date"])
+                for year in sorted(set(years.to_pylist())):
+                    chunk = incoming.filter(pc.equal(years, year))
+                    written += chunk.num_rows
+                    existing = self._load_year(year, memory_map=False)
+                    if existing is not None:
+                        keys = pc.binary_join_element_wise(
+                            chunk["ts_code"], pc.cast(chunk["trade_date"], pa.string()), "|"
+                        )
+                        existing_keys = pc.binary_join_element_wise(
+                            existing["ts_code"], pc.cast(existing["trade_date"], pa.string()), "|"
+                        )
+                        keep = pc.invert(pc.is_in(existing_keys, value_set=keys))
+                        chunk = pa.concat_tables([existing.filter(keep), chunk])
+                    chunk = chunk.sort_by([("ts_code", "ascending"), ("trade_date", "ascending")])
+                    self._write_year(year, chunk)
+            manifest = self._read_manifest()
+            if mark_start is not None or mark_end is not None:
+                current_start = manifest.get("start_date")
+                current_end = manifest.get("end_date")
+                if mark_start is not None and (not current_start or mark_start.isoformat() < current_start):
+                    manifest["start_date"] = mark_start.isoformat()
+                if mark_end is not None and (not current_end or mark_end.isoformat() > current_end):
+                    manifest["end_date"] = mark_end.isoformat()
+            manifest["updated_at"] = datetime.now().isoformat(timespec="seconds")
+            self._write_manifest(manifest)
+        return written
+
+    def clear(self) -> None:
+        with self._lock:
+            if not self._root.exists():
+                return
+            for path in self._root.glob("daily_*.arrow"):
+                path.unlink()
+            manifest = self._root / _MANIFEST_NAME
+            if manifest.exists():
+                manifest.unlink()
+
+    def read_table(
+        self,
+        start_date: date,
+        end_date: date,
+        *,
+        codes: Optional[Sequence[str]] = None,
+        fields: Sequence[str] = PANEL_FIELDS,
+    ) -> pa.Table:
+        unknown = [field for field in fields if field not in PANEL_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown price panel fields: {', '.join(unknown)}")
+        start_scalar = pa.scalar(start_date, pa.date32())
+        end_scalar = pa.scalar(end_date, pa.date32())
+        code_set = pa.array(list(dict.fromkeys(codes)), pa.string()) if codes is not None else None
+        tables: List[pa.Table] = []
+        for year in range(start_date.year, end_date.year + 1):
+            table = self._load_year(year)
+            if table is None:
+                continue
+            mask = pc.and_(
+                pc.greater_equal(table["trade_date"], start_scalar),
+                pc.less_equal(table["trade_date"], end_scalar),
+            )
+            if code_set is not None:
+                mask = pc.and_(mask, pc.is_in(table["ts_code"], value_set=code_set))
+            tables.append(table.filter(mask).select(["ts_code", "trade_date", *fields]))
+        if not tables:
+            return _SCHEMA.empty_table().select(["ts_code", "trade_date", *fields])
+        return pa.concat_tables(tables)
+
+    def read_frame(
+        self,
+        start_date: date,
+        end_date: date,
+        *,
+        codes: Optional[Sequence[str]] = None,
+        fields: Sequence[str] = PANEL_FIELDS,
+    ) -> pd.DataFrame:
+        """Long-format frame (``ts_code``, ``trade_date`` as datetime64, float fields)."""
+        frame = self.read_table(start_date, end_date, codes=codes, fields=fields).to_pandas()
+        frame["trade_date"] = pd.to_datetime(frame["trade_date"])
+        return frame
+
+    def read_panel(
+        self,
+        start_date: date,
+        end_date: date,
+        *,
+        codes: Optional[Sequence[str]] = None,
+        fields: Sequence[str] = ("close",),
+    ) -> PricePanel:
+        """
+        Dense panel for ``[start_date, end_date]``. Columns follow ``codes`` when given (codes without
+        data stay all-NaN), otherwise every cached code in sorted order.
+        """
+        table = self.read_table(start_date, end_date, codes=codes, fields=fields)
+        trade_dates = table["trade_date"].to_numpy().astype("datetime64[D]")
+        row_codes = table["ts_code"].to_numpy(zero_copy_only=False)
+        dates = np.unique(trade_dates)
+        if codes is not None:
+            panel_codes = np.array(list(dict.fromkeys(codes)), dtype=object)
+        else:
+            panel_codes = np.unique(row_codes).astype(object)
+        date_index = np.searchsorted(dates, trade_dates)
+        code_order = np.argsort(panel_codes)
+        code_index = code_order[np.searchsorted(panel_codes[code_order], row_codes)] if len(row_codes) else row_codes
+        values: Dict[str, np.ndarray] = {}
+        for field in fields:
+            matrix = np.full((len(dates), len(panel_codes)), np.nan)
+            if len(row_codes):
+                matrix[date_index, code_index] = table[field].to_numpy(zero_copy_only=False)
+            values[field] = matrix
+        return PricePanel(dates=dates, codes=panel_codes, values=values)
+
+
+price_panel_store = PricePanelStore()
+
+
+def append_price_panel(
+    frame: pd.DataFrame,
+    *,
+    store: Optional[PricePanelStore] = None,
+    complete_through: Optional[date] = None,
+) -> int:
+    """
+    Merge freshly synced ``daily_trade`` rows into an existing cache.
+
+    Nothing is written until the cache has been bootstrapped, otherwise a partial cache would
+    claim coverage it does not have. ``complete_through`` extends the covered range when the
+    caller synced every listed code up to that date.
+    """
+    target = store or price_panel_store
+    if target.coverage() is None:
+        return 0
+    return target.write(frame, mark_end=complete_through)
+
+
+def rebuild_price_panel(
+    *,
+    start_date: Optional[date | str] = None,
+    settings_path: Optional[str] = None,
+    store: Optional[PricePanelStore] = None,
+    progress_callback: Optional[Callable[[float, Optional[str], Optional[int]], None]] = None,
+) -> dict[str, object]:
+    """Rebuild the cache from PostgreSQL one year at a time."""
+    started = time.perf_counter()
+    target = store or price_panel_store
+    settings = load_settings(settings_path)
+    daily_dao = DailyTradeDAO(settings.postgres)
+    latest = _to_date(daily_dao.latest_trade_date())
+    if latest is None:
+        if progress_callback:
+            progress_callback(1.0, "Daily trade table is empty; nothing to cache", 0)
+        return {"rows": 0, "start_date": None, "end_date": None, "elapsed_seconds": time.perf_counter() - started}
+
+    start = _to_date(start_date) or date(latest.year - DEFAULT_REBUILD_YEARS + 1, 1, 1)
+    years = list(range(start.year, latest.year + 1))
+    target.clear()
+    total = 0
+    for index, year in enumerate(years, start=1):
+        year_start = max(start, date(year, 1, 1))
+        year_end = min(latest, date(year, 12, 31))
+        frame = daily_dao.fetch_ohlcv(start_date=year_start, end_date=year_end, fields=PANEL_FIELDS)
+        total += target.write(frame)
+        if progress_callback:
+            progress_callback(index / len(years), f"Cached {year} price history", total)
+    target.write(pd.DataFrame(), mark_start=start, mark_end=latest)
+    return {
+        "rows": total,
+        "start_date": start.isoformat(),
+        "end_date": latest.isoformat(),
+        "elapsed_seconds": time.perf_counter() - started,
+    }
+
+
+def load_ohlcv_history(
+    daily_dao: DailyTradeDAO,
+    start_date: date | datetime | str,
+    end_date: date | datetime | str | None = None,
+    *,
+    fields: Sequence[str] = PANEL_FIELDS,
+    include_intraday: bool = False,
+    store: Optional[PricePanelStore] = None,
+) -> pd.DataFrame:
+    """
+    Load long-format OHLCV history, serving the cached part from the columnar store and only
+    querying PostgreSQL for bars after the cache end (plus intraday bars when requested).
+    """
+    target = store or price_panel_store
+    start = _to_date(start_date)
+    end = _to_date(end_date)
+    coverage = target.coverage()
+    if coverage is None or start is None or coverage[0] > start:
+        return daily_dao.fetch_ohlcv(
+            start_date=start,
+            end_date=end,
+            include_intraday=include_intraday,
+            fields=fields,
+        )
+
+    cached_end = coverage[1] if end is None else min(end, coverage[1])
+    frames = [target.read_frame(start, cached_end, fields=fields)]
+    if end is None or end > cached_end or include_intraday:
+        tail = daily_dao.fetch_ohlcv(
+            start_date=cached_end + timedelta(days=1),
+            end_date=end,
+            include_intraday=include_intraday,
+            fields=fields,
+        )
+        if not tail.empty:
+            frames.append(tail)
+    frame = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+    return frame.sort_values(["ts_code", "trade_date"], kind="stable").reset_index(drop=True)
+
+
+__all__ = [
+    "PANEL_FIELDS",
+    "PricePanel",
+    "PricePanelStore",
+    "append_price_panel",
+    "load_ohlcv_history",
+    "price_panel_store",
+    "rebuild_price_panel",
+]
@@ -0,0 +1,446 @@
+"""
+Long-running realtime quote poller backed by a shared in-memory tick store.
+
+During A-share trading sessions the poller walks the listed universe in 50-code
+``realtime_quote`` chunks, keeps the latest quote per code in ``realtime_quote_store``
+and periodically flushes intraday bars for the codes that moved into ``daily_trade``.
+API handlers read live prices from the store instead of calling Tushare per request.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from datetime import date, datetime, time as dtime
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+from zoneinfo import ZoneInfo
+
+from ..api_clients import DAILY_TRADE_FIELDS, get_realtime_quotes
+from ..config.settings import load_settings
+from ..dao import DailyTradeDAO, StockBasicDAO
+from .intraday_volume_profile_service import estimate_full_day_volume, load_average_profile_map
+from .trade_calendar_service import is_trading_day
+
+logger = logging.getLogger(__name__)
+
+LOCAL_TZ = ZoneInfo("Asia/Shanghai")
+
+QUOTE_CHUNK_SIZE = 50  # Tushare realtime endpoint limits 50 codes per request
+DEFAULT_POLL_INTERVAL_SECONDS = 30
+DEFAULT_FLUSH_INTERVAL_SECONDS = 300
+DEFAULT_QUOTE_MAX_AGE_SECONDS = 180
+TRADING_SESSIONS: Tuple[Tuple[dtime, dtime], ...] = (
+    (dtime(9, 25), dtime(11, 30)),
+    (dtime(13, 0), dtime(15, 0)),
+)
+
+
+def _local_now() -> datetime:
+    return datetime.now(LOCAL_TZ)
+
+
+def _safe_float(value: object) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        numeric = float(value)
+    except (TypeError, ValueError):
+        return None
+    if not math.isfinite(numeric):
+        return None
+    return numeric
+
+
+def quote_max_age_seconds(interval_seconds: float) -> float:
+    """Return how long a stored quote stays usable when the poller runs every ``interval_seconds``."""
+    # Tolerate up to three missed cycles before readers fall back to a live request.
+    return max(float(DEFAULT_QUOTE_MAX_AGE_SECONDS), 3.0 * float(interval_seconds))
+
+
+def _parse_trade_date(value: object, fallback: date) -> date:
+    text = str(value or "").strip()
+    for fmt in ("%Y-%m-%d", "%Y%m%d"):
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    return fallback
+
+
+def is_within_trading_session(moment: datetime) -> bool:
+    """Return True when ``moment`` (local time) falls inside a continuous-auction session."""
+    current = moment.time()
+    return any(start <= current <= end for start, end in TRADING_SESSIONS)
+
+
+def normalize_quote_frame(frame: pd.DataFrame, *, received_at: Optional[datetime] = None) -> List[dict[str, object]]:
+    """
+    Convert a ``get_realtime_quotes`` frame into quote dicts keyed by ``ts_code``.
+
+    Volume is kept in shares (as reported upstream); ``volume_hands`` mirrors ``daily_trade.vol``.
+    """
+    if frame is None or frame.empty:
+        return []
+    received = received_at or _local_now()
+    quotes: List[dict[str, object]] = []
+    for record in frame.to_dict("records"):
+        ts_code = str(record.get("code") or "").strip().upper()
+        if not ts_code:
+            continue
+        close_price = _safe_float(record.get("close"))
+        pre_close = _safe_float(record.get("pre_close"))
+        change_value = None
+        pct_change = None
+        if close_price is not None and pre_close not in (None, 0):
+            change_value = close_price - pre_close
+            pct_change = change_value / pre_close * 100
+        volume = _safe_float(record.get("volume"))
+        quotes.append(
+            {
+                "ts_code": ts_code,
+                "name": record.get("name"),
+                "trade_date": _parse_trade_date(record.get("trade_date"), received.date()),
+                "trade_time": str(record.get("trade_time") or "").strip() or None,
+                "open": _safe_float(record.get("open")),
+                "high": _safe_float(record.get("high")),
+                "low": _safe_float(record.get("low")),
+                "close": close_price,
+                "pre_close": pre_close,
+                "change": change_value,
+                "pct_chg": pct_change,
+                "volume": volume,
+                "volume_hands": volume / 100.0 if volume is not None else None,
+                "amount": _safe_float(record.get("amount")),
+                "received_at": received,
+            }
+        )
+    return quotes
+
+
+class RealtimeQuoteStore:
+    """Thread-safe latest-quote-per-code store shared by the poller and API handlers."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._quotes: Dict[str, dict[str, object]] = {}
+        self._dirty: set[str] = set()
+        self._updated_at: Optional[datetime] = None
+        self.max_age_seconds: float = float(DEFAULT_QUOTE_MAX_AGE_SECONDS)
+
+    def update(self, quotes: Iterable[dict[str, object]]) -> int:
+        """Store ``quotes``; codes whose price or volume moved are marked for the next flush."""
+        changed = 0
+        with self._lock:
+            for quote in quotes:
+                code = quote.get("ts_code")
+                if not code:
+                    continue
+                previous = self._quotes.get(code)
+                self._quotes[code] = dict(quote)
+                if (
+                    previous is None
+                    or previous.get("close") != quote.get("close")
+                    or previous.get("volume") != quote.get("volume")
+                    or previous.get("trade_date") != quote.get("trade_date")
+                ):
+                    self._dirty.add(code)
+                    changed += 1
+            self._updated_at = _local_now()
+        return changed
+
+    def get(self, code: str, *, max_age_seconds: Optional[float] = None) -> Optional[dict[str, object]]:
+        with self._lock:
+            quote = self._quotes.get((code or "").strip().upper())
+        if quote is None or not self._is_fresh(quote, max_age_seconds):
+            return None
+        return dict(quote)
+
+    def get_many(
+        self,
+        codes: Sequence[str],
+        *,
+        max_age_seconds: Optional[float] = None,
+    ) -> Dict[str, dict[str, object]]:
+        result: Dict[str, dict[str, object]] = {}
+        with self._lock:
+            for code in codes:
+                quote = self._quotes.get((code or "").strip().upper())
+                if quote is not None and self._is_fresh(quote, max_age_seconds):
+                    result[quote["ts_code"]] = dict(quote)
+        return result
+
+    def drain_dirty(self) -> List[dict[str, object]]:
+        """Return quotes changed since the previous drain and reset the dirty set."""
+        with self._lock:
+            quotes = [dict(self._quotes[code]) for code in sorted(self._dirty) if code in self._quotes]
+            self._dirty.clear()
+        return quotes
+
+    def mark_dirty(self, codes: Iterable[str]) -> None:
+        with self._lock:
+            self._dirty.update(code for code in codes if code in self._quotes)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._quotes.clear()
+            self._dirty.clear()
+            self._updated_at = None
+
+    def stats(self) -> dict[str, object]:
+        with self._lock:
+            return {
+                "count": len(self._quotes),
+                "pending": len(self._dirty),
+                "updated_at": self._updated_at,
+            }
+
+    @staticmethod
+    def _is_fresh(quote: dict[str, object], max_age_seconds: Optional[float]) -> bool:
+        if max_age_seconds is None:
+            return True
+        received_at = quote.get("received_at")
+        if not isinstance(received_at, datetime):
+            return False
+        return (_local_now() - received_at).total_seconds() <= max_age_seconds
+
+
+realtime_quote_store = RealtimeQuoteStore()
+
+
+def build_intraday_bars(
+    quotes: Sequence[dict[str, object]],
+    *,
+    profile_map: Optional[Dict[str, Dict[int, float]]] = None,
+) -> pd.DataFrame:
+    """
+    Turn stored quotes into ``daily_trade`` rows flagged ``is_intraday``.
+
+    ``vol`` is the estimated full-day volume in hands, matching the rows written by the
+    indicator realtime refresh so screening ratios stay comparable.
+    """
+    rows: List[dict[str, object]] = []
+    for quote in quotes:
+        volume = quote.get("volume")
+        if volume is None:
+            continue
+        estimated_shares, _ = estimate_full_day_volume(
+            str(quote["ts_code"]),
+            str(quote.get("trade_time") or "15:00:00"),
+            float(volume),
+            profile_map=profile_map if profile_map is not None else {},
+        )
+        rows.append(
+            {
+                "ts_code": quote["ts_code"],
+                "trade_date": quote["trade_date"],
+                "open": quote.get("open"),
+                "high": quote.get("high"),
+                "low": quote.get("low"),
+                "close": quote.get("close"),
+                "pre_close": quote.get("pre_close"),
+                "change": quote.get("change"),
+                "pct_chg": quote.get("pct_chg"),
+                "vol": estimated_shares / 100,
+                "amount": quote.get("amount"),
+                "is_intraday": True,
+            }
+        )
+    return pd.DataFrame(rows, columns=list(DAILY_TRADE_FIELDS))
+
+
+class RealtimeQuotePoller:
+    """
+    Background thread that refreshes ``realtime_quote_store`` during trading sessions.
+
+    Each cycle polls the whole universe chunk by chunk; dirty quotes are flushed to
+    ``daily_trade`` every ``flush_interval_seconds`` and once more after the close.
+    """
+
+    def __init__(
+        self,
+        *,
+        store: RealtimeQuoteStore = realtime_quote_store,
+        interval_seconds: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        settings_path: Optional[str] = None,
+        fetch_quotes: Optional[Callable[[Sequence[str]], pd.DataFrame]] = None,
+        clock: Callable[[], datetime] = _local_now,
+    ) -> None:
+        self._store = store
+        self._interval = max(5.0, float(interval_seconds))
+        store.max_age_seconds = quote_max_age_seconds(self._interval)
+        self._flush_interval = max(self._interval, float(flush_interval_seconds))
+        self._settings_path = settings_path
+        self._fetch_quotes = fetch_quotes
+        self._clock = clock
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._universe: List[str] = []
+        self._universe_date: Optional[date] = None
+        self._trading_day_cache: Dict[date, bool] = {}
+        self._last_flush = 0.0
+        self._last_cycle_at: Optional[datetime] = None
+        self._last_error: Optional[str] = None
+        self._rows_flushed = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> bool:
+        if self.running:
+            return False
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="realtime-quote-poller", daemon=True)
+        self._thread.start()
+        logger.info("Realtime quote poller started (interval=%ss, flush=%ss)", self._interval, self._flush_interval)
+        return True
+
+    def stop(self, *, timeout: float = 10.0) -> None:
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            thread.join(timeout=timeout)
+        self._thread = None
+
+    def status(self) -> dict[str, object]:
+        return {
+            "running": self.running,
+            "interval_seconds": self._interval,
+            "flush_interval_seconds": self._flush_interval,
+            "universe": len(self._universe),
+            "last_cycle_at": self._last_cycle_at,
+            "last_error": self._last_error,
+            "rows_flushed": self._rows_flushed,
+            **{f"store_{key}": value for key, value in self._store.stats().items()},
+        }
+
+    def should_poll(self, moment: datetime) -> bool:
+        if not is_within_trading_session(moment):
+            return False
+        current_date = moment.date()
+        if current_date not in self._trading_day_cache:
+            try:
+                status = is_trading_day(current_date, settings_path=self._settings_path)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Failed to resolve trading day for realtime poller: %s", exc)
+                status = None
+            if status is None:
+                # Unknown calendar: fall back to weekdays, but retry the lookup next cycle.
+                return current_date.weekday() < 5
+            self._trading_day_cache[current_date] = bool(status)
+        return self._trading_day_cache[current_date]
+
+    def poll_once(self, codes: Optional[Sequence[str]] = None) -> int:
+        """Fetch one full pass over ``codes`` (the listed universe by default) into the store."""
+        targets = list(codes) if codes is not None else self._load_universe()
+        updated = 0
+        for start in range(0, len(targets), QUOTE_CHUNK_SIZE):
+            if self._stop_event.is_set():
+                break
+            chunk = targets[start : start + QUOTE_CHUNK_SIZE]
+            try:
+                frame = self._fetch(chunk)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Realtime quote chunk failed for %s: %s", chunk[:3], exc)
+                continue
+            updated += self._store.update(normalize_quote_frame(frame, received_at=self._clock()))
+        self._last_cycle_at = self._clock()
+        return updated
+
+    def flush(self) -> int:
+        """Write quotes changed since the previous flush to ``daily_trade``."""
+        quotes = self._store.drain_dirty()
+        self._last_flush = time.monotonic()
+        if not quotes:
+            return 0
+        codes = [str(quote["ts_code"]) for quote in quotes]
+        try:
+            settings = load_settings(self._settings_path)
+            profile_map = load_average_profile_map(codes, settings_path=self._settings_path)
+            frame = build_intraday_bars(quotes, profile_map=profile_map)
+            affected = DailyTradeDAO(settings.postgres).upsert(frame)
+        except Exception:
+            self._store.mark_dirty(codes)
+            raise
+        self._rows_flushed += affected
+        return affected
+
+    def _fetch(self, chunk: Sequence[str]) -> pd.DataFrame:
+        if self._fetch_quotes is not None:
+            return self._fetch_quotes(chunk)
+        settings = load_settings(self._settings_path)
+        return get_realtime_quotes(chunk, token=settings.tushare.token, chunk_size=QUOTE_CHUNK_SIZE)
+
+    def _load_universe(self) -> List[str]:
+        today = self._clock().date()
+        if self._universe_date != today or not self._universe:
+            settings = load_settings(self._settings_path)
+            self._universe = StockBasicDAO(settings.postgres).list_codes()
+            self._universe_date = today
+        return self._universe
+
+    def _run(self) -> None:
+        in_session = False
+        while not self._stop_event.is_set():
+            cycle_started = time.monotonic()
+            try:
+                if self.should_poll(self._clock()):
+                    in_session = True
+                    self.poll_once()
+                    if time.monotonic() - self._last_flush >= self._flush_interval:
+                        self.flush()
+                    self._last_error = None
+                elif in_session:
+                    # First idle cycle after a session: persist the closing snapshot.
+                    in_session = False
+                    self.flush()
+            except Exception as exc:  # noqa: BLE001
+                self._last_error = str(exc)
+                logger.exception("Realtime quote poller cycle failed: %s", exc)
+            elapsed = time.monotonic() - cycle_started
+            self._stop_event.wait(max(1.0, self._interval - elapsed))
+        if in_session:
+            try:
+                self.flush()
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Final realtime quote flush failed: %s", exc)
+
+
+def get_realtime_quote(code: str, *, max_age_seconds: Optional[float] = None) -> Optional[dict]:
+    """Return the latest stored quote for ``code`` if the poller refreshed it recently.
+
+    ``max_age_seconds`` defaults to the store's limit, which follows the poller interval.
+    """
+    if max_age_seconds is None:
+        max_age_seconds = realtime_quote_store.max_age_seconds
+    return realtime_quote_store.get(code, max_age_seconds=max_age_seconds)
+
+
+def list_realtime_quotes(
+    codes: Sequence[str],
+    *,
+    max_age_seconds: Optional[float] = None,
+) -> Dict[str, dict]:
+    """Return the latest stored quotes for ``codes`` (stale entries are omitted)."""
+    if max_age_seconds is None:
+        max_age_seconds = realtime_quote_store.max_age_seconds
+    return realtime_quote_store.get_many(codes, max_age_seconds=max_age_seconds)
+
+
+__all__ = [
+    "QUOTE_CHUNK_SIZE",
+    "RealtimeQuotePoller",
+    "RealtimeQuoteStore",
+    "build_intraday_bars",
+    "get_realtime_quote",
+    "is_within_trading_session",
+    "list_realtime_quotes",
+    "normalize_quote_frame",
+    "quote_max_age_seconds",
+    "realtime_quote_store",
+]
@@ -0,0 +1,298 @@
+"""
+Concept and industry index series computed locally from constituent daily bars.
+
+Instead of one THS/Eastmoney request per sector, every sector index is derived in a single
+pass over a ``dates x stocks`` price panel: a membership matrix (sectors x stocks) turns the
+constituents' daily returns into weighted sector returns with a couple of matrix products.
+Weights are either previous-close free-float market cap (``cap_weighted``) or equal. Index
+levels are chained from the last stored close, so incremental runs extend the series that
+earlier runs wrote. Membership is today's snapshot (``concept_constituents`` and
+``stock_basic.industry``) applied to the whole window.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from ..config.settings import load_settings
+from ..dao import (
+    ConceptConstituentDAO,
+    ConceptIndexHistoryDAO,
+    DailyIndicatorDAO,
+    DailyTradeDAO,
+    IndustryIndexHistoryDAO,
+    StockBasicDAO,
+)
+from .price_panel_service import PricePanel, load_ohlcv_history
+
+logger = logging.getLogger(__name__)
+
+SECTOR_INDEX_METHODS: tuple[str, ...] = ("cap_weighted", "equal_weighted")
+SECTOR_KINDS: tuple[str, ...] = ("concept", "industry")
+LOCAL_TS_CODE_PREFIX = "LOCAL-"
+INDEX_BASE_LEVEL = 1000.0
+DEFAULT_INCREMENTAL_DAYS = 30
+DEFAULT_BOOTSTRAP_DAYS = 365
+
+_PANEL_FIELDS: tuple[str, ...] = ("open", "high", "low", "close", "pre_close", "vol", "amount")
+_INDEX_COLUMNS: tuple[str, ...] = (
+    "sector_name",
+    "trade_date",
+    "open",
+    "high",
+    "low",
+    "close",
+    "pre_close",
+    "change",
+    "pct_chg",
+    "vol",
+    "amount",
+)
+
+
+def local_ts_code(sector_name: str) -> str:
+    return f"{LOCAL_TS_CODE_PREFIX}{sector_name}"
+
+
+def build_price_panel(frame: pd.DataFrame, codes: Sequence[str]) -> PricePanel:
+    """Pivot long-format OHLCV rows into a :class:`PricePanel` over ``codes``."""
+    panel_codes = np.array(list(dict.fromkeys(codes)), dtype=object)
+    if frame.empty:
+        empty = np.empty((0, len(panel_codes)))
+        return PricePanel(
+            dates=np.array([], dtype="datetime64[D]"),
+            codes=panel_codes,
+            values={field: empty for field in _PANEL_FIELDS},
+        )
+    trade_dates = pd.to_datetime(frame["trade_date"]).to_numpy().astype("datetime64[D]")
+    dates = np.unique(trade_dates)
+    code_index = pd.Index(panel_codes).get_indexer(frame["ts_code"])
+    known = code_index >= 0
+    date_index = np.searchsorted(dates, trade_dates[known])
+    values: Dict[str, np.ndarray] = {}
+    for field in _PANEL_FIELDS:
+        matrix = np.full((len(dates), len(panel_codes)), np.nan)
+        if field in frame.columns:
+            matrix[date_index, code_index[known]] = pd.to_numeric(frame[field], errors="coerce").to_numpy(float)[known]
+        values[field] = matrix
+    return PricePanel(dates=dates, codes=panel_codes, values=values)
+
+
+def compute_sector_indices(
+    panel: PricePanel,
+    memberships: Mapping[str, Sequence[str]],
+    *,
+    float_shares: Optional[Mapping[str, float]] = None,
+    base_levels: Optional[Mapping[str, float]] = None,
+) -> pd.DataFrame:
+    """
+    Compute daily OHLC, volume and amount for every sector in ``memberships`` at once.
+
+    With ``float_shares`` each constituent is weighted by ``float_shares * pre_close``
+    (stocks without a share count drop out); otherwise constituents are equal-weighted.
+    Open/high/low are the weighted relative moves against the previous close. Levels start
+    at ``base_levels[sector]`` (the last stored close) or :data:`INDEX_BASE_LEVEL`; days on
+    which no constituent traded are skipped.
+    """
+    sectors = [name for name, members in memberships.items() if members]
+    if not sectors or not len(panel.dates):
+        return pd.DataFrame(columns=list(_INDEX_COLUMNS))
+
+    code_position = {code: index for index, code in enumerate(panel.codes)}
+    membership = np.zeros((len(sectors), len(panel.codes)))
+    for row, sector in enumerate(sectors):
+        columns = [code_position[code] for code in memberships[sector] if code in code_position]
+        membership[row, columns] = 1.0
+
+    close = panel["close"]
+    pre_close = panel["pre_close"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = close / pre_close - 1.0
+        relative = {field: panel[field] / pre_close - 1.0 for field in ("open", "high", "low")}
+    valid = np.isfinite(returns) & (pre_close > 0)
+    if float_shares is not None:
+        shares = np.array([float_shares.get(code, np.nan) for code in panel.codes])
+        weights = np.where(valid, pre_close * shares, 0.0)
+    else:
+        weights = valid.astype(float)
+    weights = np.nan_to_num(weights, nan=0.0)
+    returns = np.where(valid, returns, 0.0)
+
+    # (dates x stocks) @ (stocks x sectors): one product per aggregated quantity.
+    denominator = weights @ membership.T
+    traded = denominator > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sector_returns = np.where(traded, (weights * returns) @ membership.T / denominator, 0.0)
+        sector_relative = {
+            field: np.where(
+                traded,
+                (weights * np.where(np.isfinite(values), values, returns)) @ membership.T / denominator,
+                0.0,
+            )
+            for field, values in relative.items()
+        }
+
+    anchors = np.array([(base_levels or {}).get(sector, INDEX_BASE_LEVEL) for sector in sectors])
+    growth = np.cumprod(1.0 + sector_returns, axis=0)
+    close_level = anchors * growth
+    pre_level = close_level / (1.0 + sector_returns)
+    open_level = pre_level * (1.0 + sector_relative["open"])
+    high_level = np.maximum.reduce([pre_level * (1.0 + sector_relative["high"]), open_level, close_level])
+    low_level = np.minimum.reduce([pre_level * (1.0 + sector_relative["low"]), open_level, close_level])
+    volume = np.nan_to_num(panel["vol"]) @ membership.T
+    amount = np.nan_to_num(panel["amount"]) @ membership.T
+
+    date_index, sector_index = np.nonzero(traded)
+    frame = pd.DataFrame(
+        {
+            "sector_name": np.array(sectors, dtype=object)[sector_index],
+            "trade_date": pd.to_datetime(panel.dates[date_index]).date,
+            "open": open_level[date_index, sector_index],
+            "high": high_level[date_index, sector_index],
+            "low": low_level[date_index, sector_index],
+            "close": close_level[date_index, sector_index],
+            "pre_close": pre_level[date_index, sector_index],
+            "pct_chg": sector_returns[date_index, sector_index] * 100.0,
+            "vol": volume[date_index, sector_index],
+            "amount": amount[date_index, sector_index],
+        }
+    )
+    frame["change"] = frame["close"] - frame["pre_close"]
+    return frame.loc[:, list(_INDEX_COLUMNS)].round(4)
+
+
+def _load_memberships(settings, kinds: Sequence[str]) -> tuple[Dict[str, Dict[str, List[str]]], List[str]]:
+    """Return ``({kind: {sector: [ts_code, ...]}}, all_codes)`` from stored constituent data."""
+    stock_rows = StockBasicDAO(settings.postgres).list_search_entries()
+    listed = [row for row in stock_rows if (row.get("status") or "L") == "L"]
+    symbol_to_code = {str(row["symbol"]): str(row["code"]) for row in listed if row.get("symbol")}
+    memberships: Dict[str, Dict[str, List[str]]] = {}
+    if "industry" in kinds:
+        industries: Dict[str, List[str]] = {}
+        for row in listed:
+            industry = (row.get("industry") or "").strip()
+            if industry:
+                industries.setdefault(industry, []).append(str(row["code"]))
+        memberships["industry"] = industries
+    if "concept" in kinds:
+        concepts = ConceptConstituentDAO(settings.postgres).list_memberships()
+        memberships["concept"] = {
+            concept: [symbol_to_code[symbol] for symbol in symbols if symbol in symbol_to_code]
+            for concept, symbols in concepts.items()
+        }
+    codes = sorted({code for groups in memberships.values() for members in groups.values() for code in members})
+    return memberships, codes
+
+
+def sync_sector_indices(
+    *,
+    method: str = "cap_weighted",
+    kinds: Sequence[str] = SECTOR_KINDS,
+    sector_names: Optional[Sequence[str]] = None,
+    start_date: Optional[date] = None,
+    settings_path: Optional[str] = None,
+    progress_callback: Optional[Callable[[float, Optional[str], Optional[int]], None]] = None,
+) -> dict[str, object]:
+    """
+    Recompute local concept/industry index series from ``daily_trade`` and persist them.
+
+    Without ``start_date`` the last :data:`DEFAULT_INCREMENTAL_DAYS` are recomputed and
+    chained onto the stored series, or :data:`DEFAULT_BOOTSTRAP_DAYS` on the first run.
+    Local series are stored as ``LOCAL-<name>`` and replace remote rows of the same sector.
+    """
+    if method not in SECTOR_INDEX_METHODS:
+        raise ValueError(f"Unknown sector index method: {method}")
+    unknown = [kind for kind in kinds if kind not in SECTOR_KINDS]
+    if unknown:
+        raise ValueError(f"Unknown sector kinds: {', '.join(unknown)}")
+
+    started = time.perf_counter()
+    settings = load_settings(settings_path)
+    memberships, codes = _load_memberships(settings, kinds)
+    if sector_names is not None:
+        wanted = {name.strip() for name in sector_names if name and name.strip()}
+        memberships = {
+            kind: {name: members for name, members in groups.items() if name in wanted}
+            for kind, groups in memberships.items()
+        }
+        codes = sorted({code for groups in memberships.values() for members in groups.values() for code in members})
+
+    history_daos = {
+        "concept": ConceptIndexHistoryDAO(settings.postgres),
+        "industry": IndustryIndexHistoryDAO(settings.postgres),
+    }
+    name_columns = {"concept": "concept_name", "industry": "industry_name"}
+
+    today = date.today()
+    start = start_date or today - timedelta(days=DEFAULT_INCREMENTAL_DAYS)
+    anchors: Dict[str, Dict[str, float]] = {
+        kind: history_daos[kind].fetch_latest_closes([local_ts_code(name) for name in groups], before=start)
+        for kind, groups in memberships.items()
+    }
+    if start_date is None and not any(anchors.values()):
+        start = today - timedelta(days=DEFAULT_BOOTSTRAP_DAYS)
+        anchors = {kind: {} for kind in memberships}
+
+    if progress_callback:
+        progress_callback(0.1, f"Loading daily bars for {len(codes)} constituents since {start}", None)
+    history = load_ohlcv_history(DailyTradeDAO(settings.postgres), start, today, fields=_PANEL_FIELDS)
+    panel = build_price_panel(history, codes)
+    float_shares = None
+    if method == "cap_weighted":
+        float_shares = DailyIndicatorDAO(settings.postgres).fetch_latest_float_shares(codes)
+
+    summary: Dict[str, int] = {}
+    sector_rows: Dict[str, Dict[str, int]] = {}
+    total_rows = 0
+    for position, (kind, groups) in enumerate(memberships.items(), start=1):
+        base_levels = {
+            name: anchors[kind][local_ts_code(name)] for name in groups if local_ts_code(name) in anchors[kind]
+        }
+        frame = compute_sector_indices(panel, groups, float_shares=float_shares, base_levels=base_levels)
+        if frame.empty:
+            summary[kind] = 0
+            sector_rows[kind] = {}
+            continue
+        frame = frame.rename(columns={"sector_name": name_columns[kind]})
+        frame.insert(0, "ts_code", LOCAL_TS_CODE_PREFIX + frame[name_columns[kind]])
+        dao = history_daos[kind]
+        dao.delete_other_sources(sorted(frame[name_columns[kind]].unique()), keep_prefix=LOCAL_TS_CODE_PREFIX)
+        affected = dao.upsert(frame)
+        summary[kind] = int(affected)
+        sector_rows[kind] = {name: int(count) for name, count in frame[name_columns[kind]].value_counts().items()}
+        total_rows += int(affected)
+        if progress_callback:
+            progress_callback(
+                0.1 + 0.9 * position / len(memberships),
+                f"Stored {affected} local {kind} index rows",
+                total_rows,
+            )
+
+    elapsed = time.perf_counter() - started
+    logger.info("Local sector indices (%s) computed since %s: %s in %.2fs", method, start, summary, elapsed)
+    return {
+        "method": method,
+        "startDate": start.isoformat(),
+        "endDate": today.isoformat(),
+        "rows": total_rows,
+        "sectors": {kind: len(groups) for kind, groups in memberships.items()},
+        "rowsByKind": summary,
+        "sectorRows": sector_rows,
+        "elapsedSeconds": elapsed,
+    }
+
+
+__all__ = [
+    "LOCAL_TS_CODE_PREFIX",
+    "SECTOR_INDEX_METHODS",
+    "build_price_panel",
+    "compute_sector_indices",
+    "local_ts_code",
+    "sync_sector_indices",
+]
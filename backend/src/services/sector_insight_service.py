@@ -245,9 +245,9 @@ def collect_recent_sector_headlines(
                       AND i.impact_checked_at IS NOT NULL
                       AND a.published_at BETWEEN %s AND %s
                       AND (
-                           (i.impact_industries IS NOT NULL AND LENGTH(TRIM(i.impact_industries)) > 0)
-                        OR (i.impact_sectors IS NOT NULL AND LENGTH(TRIM(i.impact_sectors)) > 0)
-                        OR (i.impact_themes IS NOT NULL AND LENGTH(TRIM(i.impact_themes)) > 0)
+                           i.impact_industries <> '[]'::jsonb
+                        OR i.impact_sectors <> '[]'::jsonb
+                        OR i.impact_themes <> '[]'::jsonb
                       )
                     ORDER BY a.published_at DESC
                     LIMIT %s
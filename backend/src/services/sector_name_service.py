@@ -0,0 +1,154 @@
+"""
+Shared name resolution for concept and industry directories.
+
+Each directory is indexed once: exact, case-folded and normalised names resolve through
+dict lookups, and fuzzy matches only score the names that share at least one character
+with the query (found through a character posting list) instead of every directory
+entry. Fuzzy resolutions are cached per index. Indexes are swapped in whenever a
+directory is (re)loaded, which also drops the cached resolutions.
+
+Label resolvers that feed watchlists, constituent syncs and insights only accept
+:meth:`SectorNameIndex.match`; a fuzzy hit there would act on the wrong sector.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+SECTOR_NAME_KINDS: Tuple[str, ...] = ("concept", "industry")
+FUZZY_MATCH_THRESHOLD = 0.65
+RESOLUTION_CACHE_SIZE = 4096
+
+_NORMALIZE_PATTERN = re.compile(r"[\s·•()（）-]+")
+
+
+def normalize_sector_label(label: object) -> str:
+    """Lower-case ``label`` and drop separators, brackets and the ``概念`` suffix."""
+    if not label:
+        return ""
+    text = str(label).strip().lower()
+    text = text.replace("概念", "")
+    text = re.sub(r"[·•]+", "", text)
+    return _NORMALIZE_PATTERN.sub("", text)
+
+
+def _cjk_chars(text: str) -> Set[str]:
+    return {ch for ch in text if "\u4e00" <= ch <= "\u9fff"}
+
+
+class SectorNameIndex:
+    """Immutable lookup and character inverted index over one sector directory."""
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        self._exact: Set[str] = set()
+        self._folded: Dict[str, str] = {}
+        self._normalized: Dict[str, str] = {}
+        self._norms: List[str] = []
+        self._targets: List[str] = []
+        self._postings: Dict[str, List[int]] = {}
+        self._resolved: Dict[str, Optional[str]] = {}
+        for raw_name in names:
+            name = str(raw_name or "").strip()
+            if not name or name in self._exact:
+                continue
+            self._exact.add(name)
+            self._folded.setdefault(name.casefold(), name)
+            norm = normalize_sector_label(name)
+            if not norm or norm in self._normalized:
+                continue
+            self._normalized[norm] = name
+            doc_id = len(self._norms)
+            self._norms.append(norm)
+            self._targets.append(name)
+            for ch in set(norm):
+                self._postings.setdefault(ch, []).append(doc_id)
+
+    def __len__(self) -> int:
+        return len(self._exact)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._exact
+
+    def match(self, label: str) -> Optional[str]:
+        """Return the directory name equal to ``label`` up to case or normalisation."""
+        text = (label or "").strip()
+        if not text:
+            return None
+        if text in self._exact:
+            return text
+        folded = self._folded.get(text.casefold())
+        if folded is not None:
+            return folded
+        return self._normalized.get(normalize_sector_label(text))
+
+    def closest(self, label: str, *, threshold: float = FUZZY_MATCH_THRESHOLD) -> Optional[str]:
+        """Return the best fuzzy match for ``label`` scoring at least ``threshold``."""
+        norm = normalize_sector_label(label)
+        if not norm:
+            return None
+        cache_key = f"{threshold}\0{norm}"
+        if cache_key in self._resolved:
+            return self._resolved[cache_key]
+
+        candidates: Set[int] = set()
+        for ch in set(norm):
+            candidates.update(self._postings.get(ch, ()))
+        overlaps: Dict[int, int] = {}
+        for ch in _cjk_chars(norm):
+            for doc_id in self._postings.get(ch, ()):
+                overlaps[doc_id] = overlaps.get(doc_id, 0) + 1
+
+        # Names sharing no character with the query score 0 and are never visited.
+        best_name: Optional[str] = None
+        best_score = 0.0
+        for doc_id in sorted(candidates):
+            overlap = overlaps.get(doc_id, 0)
+            if overlap >= 2:
+                score = 0.8 + overlap * 0.05
+            else:
+                score = SequenceMatcher(None, norm, self._norms[doc_id]).ratio()
+            if score > best_score:
+                best_score = score
+                best_name = self._targets[doc_id]
+
+        result = best_name if best_name and best_score >= threshold else None
+        if len(self._resolved) >= RESOLUTION_CACHE_SIZE:
+            self._resolved.clear()
+        self._resolved[cache_key] = result
+        return result
+
+
+_INDEXES: Dict[str, SectorNameIndex] = {}
+_INDEX_LOCK = threading.Lock()
+
+
+def refresh_sector_name_index(kind: str, names: Iterable[str]) -> SectorNameIndex:
+    """Build the ``kind`` directory index from ``names`` and swap it in atomically."""
+    if kind not in SECTOR_NAME_KINDS:
+        raise ValueError(f"Unsupported sector name kind: {kind}")
+    index = SectorNameIndex(names)
+    with _INDEX_LOCK:
+        _INDEXES[kind] = index
+    logger.debug("%s name index rebuilt with %s entries", kind.capitalize(), len(index))
+    return index
+
+
+def get_sector_name_index(kind: str) -> Optional[SectorNameIndex]:
+    """Return the current ``kind`` directory index, or ``None`` before it is loaded."""
+    return _INDEXES.get(kind)
+
+
+__all__ = [
+    "FUZZY_MATCH_THRESHOLD",
+    "SECTOR_NAME_KINDS",
+    "SectorNameIndex",
+    "get_sector_name_index",
+    "normalize_sector_label",
+    "refresh_sector_name_index",
+]
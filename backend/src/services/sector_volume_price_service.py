@@ -0,0 +1,289 @@
+"""
+Batch Wyckoff volume/price reasoning across watched concepts and industries.
+
+The single-sector services rebuild one dataset per call and block on one LLM request.
+Here the index history of every requested sector is loaded in one windowed query, the
+statistics are computed with one grouped pass, and the LLM requests run on a thread
+pool. A module-wide semaphore caps the number of requests in flight across concurrent
+batches. Each snapshot is stored as soon as its request completes.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from ..config.settings import load_settings
+from ..dao import ConceptIndexHistoryDAO, ConceptWatchlistDAO, IndustryIndexHistoryDAO, IndustryWatchlistDAO
+from .concept_constituent_service import resolve_concept_label
+from .concept_volume_price_service import run_volume_price_reasoning
+from .industry_directory_service import resolve_industry_label
+from .industry_volume_price_service import run_industry_volume_price_reasoning
+
+logger = logging.getLogger(__name__)
+
+SECTOR_KINDS: Tuple[str, ...] = ("concept", "industry")
+STATISTIC_WINDOWS: Tuple[int, ...] = (5, 20, 60)
+LLM_CONCURRENCY = 4
+
+_LLM_SLOTS = threading.BoundedSemaphore(LLM_CONCURRENCY)
+
+
+@dataclass(frozen=True)
+class _SectorKind:
+    label_key: str
+    code_key: str
+    name_column: str
+    resolve: Callable[..., Dict[str, str]]
+    history_dao: Callable[..., Any]
+    watchlist_dao: Callable[..., Any]
+    reason: Callable[..., Dict[str, Any]]
+
+
+_KINDS: Dict[str, _SectorKind] = {
+    "concept": _SectorKind(
+        label_key="concept",
+        code_key="conceptCode",
+        name_column="concept_name",
+        resolve=resolve_concept_label,
+        history_dao=ConceptIndexHistoryDAO,
+        watchlist_dao=ConceptWatchlistDAO,
+        reason=run_volume_price_reasoning,
+    ),
+    "industry": _SectorKind(
+        label_key="industry",
+        code_key="industryCode",
+        name_column="industry_name",
+        resolve=resolve_industry_label,
+        history_dao=IndustryIndexHistoryDAO,
+        watchlist_dao=IndustryWatchlistDAO,
+        reason=run_industry_volume_price_reasoning,
+    ),
+}
+
+
+def _scalar(value: Any, digits: Optional[int] = None) -> Optional[float]:
+    if value is None:
+        return None
+    numeric = float(value)
+    if not math.isfinite(numeric):
+        return None
+    return round(numeric, digits) if digits is not None else numeric
+
+
+def _stored(value: Any) -> Any:
+    """Return a frame value as the Python scalar the row held (``None`` for gaps)."""
+    if value is None or (isinstance(value, float) and math.isnan(value)) or value is pd.NA:
+        return None
+    if hasattr(value, "item"):
+        value = value.item()
+        if isinstance(value, float) and math.isnan(value):
+            return None
+    return value
+
+
+def _percent_change(first: Any, last: Any) -> Optional[float]:
+    start = _scalar(first)
+    end = _scalar(last)
+    if start in (None, 0) or end is None:
+        return None
+    return round(((end - start) / start) * 100, 2)
+
+
+def compute_volume_price_statistics(frame: pd.DataFrame, *, key: str) -> Dict[str, Dict[str, Any]]:
+    """Return the per-sector ``statistics`` block for a lookback-trimmed history frame.
+
+    ``frame`` holds one row per bar, sorted by ``key`` then ``trade_date``. Missing
+    prices and volumes are skipped exactly like the single-sector dataset builders do,
+    and the extremes (``maxClose`` ... ``maxVolume``) keep the stored value's type.
+    """
+    if frame.empty:
+        return {}
+    grouped = frame.groupby(key, sort=False)
+    summary = grouped.agg(
+        firstDate=("date", "first"),
+        lastDate=("date", "last"),
+        firstClose=("close", "first"),
+        lastClose=("close", "last"),
+        maxClose=("close", "max"),
+        minClose=("close", "min"),
+        maxHigh=("high", "max"),
+        minLow=("low", "min"),
+        avgVolume=("vol", "mean"),
+        volumeStd=("vol", "std"),
+        volumeCount=("vol", "count"),
+        maxVolume=("vol", "max"),
+    )
+    # Population standard deviation from the sample one (statistics.pstdev semantics).
+    counts = summary["volumeCount"]
+    summary["volumeStd"] = (summary["volumeStd"] * ((counts - 1) / counts) ** 0.5).where(counts > 1)
+
+    windows: Dict[int, pd.DataFrame] = {}
+    for window in STATISTIC_WINDOWS:
+        tail = grouped.tail(window).groupby(key, sort=False)
+        windows[window] = tail.agg(
+            size=("date", "size"),
+            firstClose=("close", "first"),
+            lastClose=("close", "last"),
+            avgVolume=("vol", "mean"),
+        )
+
+    statistics: Dict[str, Dict[str, Any]] = {}
+    for name, row in summary.iterrows():
+        stats: Dict[str, Any] = {
+            "firstDate": row["firstDate"],
+            "lastDate": row["lastDate"],
+            "changePercent": _percent_change(row["firstClose"], row["lastClose"]),
+            "maxClose": _stored(row["maxClose"]),
+            "minClose": _stored(row["minClose"]),
+            "maxHigh": _stored(row["maxHigh"]),
+            "minLow": _stored(row["minLow"]),
+            "avgVolume": _scalar(row["avgVolume"], 2),
+            "volumeStd": _scalar(row["volumeStd"], 2),
+            "maxVolume": _stored(row["maxVolume"]),
+        }
+        for window, metrics in windows.items():
+            window_row = metrics.loc[name]
+            stats[f"window{window}"] = {
+                "window": int(window_row["size"]),
+                "changePercent": _percent_change(window_row["firstClose"], window_row["lastClose"]),
+                "avgVolume": _scalar(window_row["avgVolume"], 2),
+            }
+        statistics[name] = stats
+    return statistics
+
+
+def _history_records(group: pd.DataFrame) -> List[Dict[str, Any]]:
+    renamed = group.loc[:, ["date", "open", "high", "low", "close", "pre_close", "pct_chg", "vol", "amount"]].rename(
+        columns={"pre_close": "preClose", "pct_chg": "pctChange", "vol": "volume"}
+    )
+    cleaned = renamed.astype(object).where(renamed.notna(), None)
+    return cleaned.to_dict(orient="records")
+
+
+def build_sector_volume_price_datasets(
+    kind: str,
+    sectors: Sequence[str],
+    *,
+    lookback_days: int = 90,
+    settings_path: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, str]]]:
+    """Build the reasoning datasets of many sectors; returns ``(datasets, errors)``."""
+    spec = _KINDS[kind]
+    resolved: Dict[str, str] = {}
+    errors: List[Dict[str, str]] = []
+    for sector in sectors:
+        try:
+            label = spec.resolve(sector, settings_path=settings_path)
+        except ValueError as exc:
+            errors.append({"sector": sector, "error": str(exc)})
+            continue
+        resolved.setdefault(label["name"], label["code"])
+
+    settings = load_settings(settings_path)
+    frame = spec.history_dao(settings.postgres).list_recent_frame(list(resolved), per_name=lookback_days)
+    frame["date"] = pd.to_datetime(frame["trade_date"]).dt.strftime("%Y-%m-%d")
+    statistics = compute_volume_price_statistics(frame, key=spec.name_column)
+    histories = {name: _history_records(group) for name, group in frame.groupby(spec.name_column, sort=False)}
+
+    datasets = [
+        {
+            spec.label_key: name,
+            spec.code_key: code,
+            "lookbackDays": lookback_days,
+            "history": histories.get(name, []),
+            "statistics": statistics.get(name, {}),
+        }
+        for name, code in resolved.items()
+    ]
+    return datasets, errors
+
+
+def _watched_sectors(kind: str, settings_path: Optional[str]) -> List[str]:
+    spec = _KINDS[kind]
+    settings = load_settings(settings_path)
+    return [
+        entry[spec.name_column]
+        for entry in spec.watchlist_dao(settings.postgres).list_entries()
+        if entry.get("is_watched", True)
+    ]
+
+
+def _reason_with_slot(reason: Callable[..., Dict[str, Any]], dataset: Dict[str, Any], **kwargs: Any) -> Dict[str, Any]:
+    with _LLM_SLOTS:
+        return reason(dataset, **kwargs)
+
+
+def generate_sector_volume_price_batch(
+    kind: str,
+    sectors: Optional[Sequence[str]] = None,
+    *,
+    lookback_days: int = 90,
+    run_llm: bool = True,
+    settings_path: Optional[str] = None,
+    progress_callback: Optional[Callable[[float, Optional[str], Optional[int]], None]] = None,
+) -> Dict[str, Any]:
+    """Run volume/price reasoning for ``sectors`` (default: the watched ones) of ``kind``."""
+    if kind not in _KINDS:
+        raise ValueError(f"Unsupported sector kind: {kind}")
+    spec = _KINDS[kind]
+    names = list(sectors) if sectors is not None else _watched_sectors(kind, settings_path)
+    datasets, errors = build_sector_volume_price_datasets(
+        kind,
+        names,
+        lookback_days=lookback_days,
+        settings_path=settings_path,
+    )
+
+    generated: List[Dict[str, Any]] = []
+    if datasets:
+        with ThreadPoolExecutor(max_workers=min(LLM_CONCURRENCY, len(datasets))) as executor:
+            futures = {
+                executor.submit(
+                    _reason_with_slot,
+                    spec.reason,
+                    dataset,
+                    run_llm=run_llm,
+                    settings_path=settings_path,
+                ): dataset[spec.label_key]
+                for dataset in datasets
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                name = futures[future]
+                try:
+                    record = future.result()
+                except Exception as exc:  # pragma: no cover - LLM/network volatility
+                    logger.warning("Volume/price reasoning failed for %s %s: %s", kind, name, exc)
+                    errors.append({"sector": name, "error": str(exc)})
+                else:
+                    generated.append(
+                        {
+                            "sector": name,
+                            "wyckoffPhase": (record.get("summary") or {}).get("wyckoffPhase"),
+                            "generatedAt": record.get("generatedAt"),
+                        }
+                    )
+                if progress_callback:
+                    progress_callback(done / len(datasets), f"Analysed {kind} {name}", len(generated))
+
+    return {
+        "kind": kind,
+        "sectors": len(names),
+        "generated": generated,
+        "errors": errors,
+    }
+
+
+__all__ = [
+    "LLM_CONCURRENCY",
+    "SECTOR_KINDS",
+    "build_sector_volume_price_datasets",
+    "compute_volume_price_statistics",
+    "generate_sector_volume_price_batch",
+]
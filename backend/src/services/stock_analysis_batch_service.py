@@ -0,0 +1,255 @@
+"""
+Batch generation of stock volume/price, integrated and valuation analyses.
+
+The single-stock endpoints return the stored snapshot while it is current and only
+build the context and wait on the LLM otherwise. This batch runs the analyses for every
+favourite stock (or the given codes) on a thread pool ahead of those requests.
+The analyses of one stock run in order: volume/price first, so the integrated context
+picks up the fresh reasoning. A module-wide semaphore caps the number of LLM requests
+in flight across concurrent batches, and each snapshot is stored as soon as it
+completes. An analysis is skipped while its last ``generatedAt`` is newer than the
+stock's inputs: the latest finalised daily bar, the newest stored article, the fund-flow
+rows and the big-deal rollup. The integrated and valuation analyses also count the
+stock's volume/price reasoning as an input.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from zoneinfo import ZoneInfo
+
+from ..config.settings import load_settings
+from ..dao import (
+    BigDealFundFlowDAO,
+    DailyTradeDAO,
+    FavoriteStockDAO,
+    IndividualFundFlowDAO,
+    StockIntegratedAnalysisDAO,
+    StockNewsDAO,
+    StockValuationAnalysisDAO,
+    StockVolumePriceReasoningDAO,
+)
+from .stock_context_service import prime_stock_context_versions
+from .stock_integrated_analysis_service import generate_stock_integrated_analysis, get_latest_stock_integrated_analysis
+from .stock_valuation_analysis_service import generate_stock_valuation_analysis, get_latest_stock_valuation_analysis
+from .stock_volume_price_service import generate_stock_volume_price_reasoning, get_latest_stock_volume_price_reasoning
+
+logger = logging.getLogger(__name__)
+
+LOCAL_TZ = ZoneInfo("Asia/Shanghai")
+STOCK_ANALYSIS_KINDS: Tuple[str, ...] = ("volume_price", "integrated", "valuation")
+LLM_CONCURRENCY = 3
+# Analyses whose context embeds the stored volume/price reasoning.
+_REASONING_DEPENDENTS = frozenset({"integrated", "valuation"})
+
+_LLM_SLOTS = threading.BoundedSemaphore(LLM_CONCURRENCY)
+
+
+@dataclass(frozen=True)
+class _AnalysisKind:
+    dao: Callable[..., Any]
+    generate: Callable[..., Dict[str, Any]]
+    latest: Callable[..., Optional[Dict[str, Any]]]
+
+
+_KINDS: Dict[str, _AnalysisKind] = {
+    "volume_price": _AnalysisKind(
+        dao=StockVolumePriceReasoningDAO,
+        generate=generate_stock_volume_price_reasoning,
+        latest=get_latest_stock_volume_price_reasoning,
+    ),
+    "integrated": _AnalysisKind(
+        dao=StockIntegratedAnalysisDAO,
+        generate=generate_stock_integrated_analysis,
+        latest=get_latest_stock_integrated_analysis,
+    ),
+    "valuation": _AnalysisKind(
+        dao=StockValuationAnalysisDAO,
+        generate=generate_stock_valuation_analysis,
+        latest=get_latest_stock_valuation_analysis,
+    ),
+}
+
+
+def _as_local(value: datetime) -> datetime:
+    return value.replace(tzinfo=LOCAL_TZ) if value.tzinfo is None else value
+
+
+def _latest(*stamps: Optional[datetime]) -> Optional[datetime]:
+    present = [_as_local(stamp) for stamp in stamps if stamp is not None]
+    return max(present) if present else None
+
+
+def _input_watermarks(codes: Sequence[str], settings) -> Dict[str, datetime]:
+    """Return, per code, the last time any analysis input was written."""
+    # The fund-flow tables key rows by the bare symbol rather than the ts_code.
+    symbols = {code: code.partition(".")[0] for code in codes}
+    bar_updates = DailyTradeDAO(settings.postgres).latest_bar_updated_at_for_codes(codes)
+    news_updates = StockNewsDAO(settings.postgres).latest_created_at_for_codes(codes)
+    flow_updates = IndividualFundFlowDAO(settings.postgres).latest_updated_at_for_codes(sorted(set(symbols.values())))
+    deal_updates = BigDealFundFlowDAO(settings.postgres).latest_rollup_updated_at_for_codes(
+        sorted(set(symbols.values()))
+    )
+    watermarks: Dict[str, datetime] = {}
+    for code, symbol in symbols.items():
+        latest = _latest(
+            bar_updates.get(code),
+            news_updates.get(code),
+            flow_updates.get(symbol),
+            deal_updates.get(symbol),
+        )
+        if latest is not None:
+            watermarks[code] = latest
+    return watermarks
+
+
+def _is_current(generated_at: Optional[datetime], watermark: Optional[datetime]) -> bool:
+    if generated_at is None:
+        return False
+    if watermark is None:
+        return True
+    # ``generated_at`` is naive Asia/Shanghai wall time written by the generators, while the
+    # watermarks come back zone-aware from the database's CURRENT_TIMESTAMP columns.
+    return _as_local(generated_at) >= _as_local(watermark)
+
+
+def plan_stock_analysis_batch(
+    codes: Sequence[str],
+    analyses: Sequence[str],
+    *,
+    force: bool = False,
+    settings_path: Optional[str] = None,
+) -> Tuple[Dict[str, List[str]], int]:
+    """Return ``({code: [pending analyses]}, skipped)`` for the requested batch."""
+    settings = load_settings(settings_path)
+    analyses = [kind for kind in STOCK_ANALYSIS_KINDS if kind in analyses]
+    pending: Dict[str, List[str]] = {code: [] for code in codes}
+    if force:
+        for code in codes:
+            pending[code].extend(analyses)
+        return {code: kinds for code, kinds in pending.items() if kinds}, 0
+
+    watermarks = _input_watermarks(codes, settings)
+    generated = {kind: _KINDS[kind].dao(settings.postgres).fetch_latest_generated_at(codes) for kind in analyses}
+    if _REASONING_DEPENDENTS.intersection(analyses) and "volume_price" not in generated:
+        generated["volume_price"] = _KINDS["volume_price"].dao(settings.postgres).fetch_latest_generated_at(codes)
+    skipped = 0
+    for kind in analyses:
+        for code in codes:
+            watermark = watermarks.get(code)
+            if kind in _REASONING_DEPENDENTS:
+                # A reasoning regenerated in this batch also supersedes the dependent analysis.
+                if "volume_price" in pending[code]:
+                    pending[code].append(kind)
+                    continue
+                watermark = _latest(watermark, generated["volume_price"].get(code))
+            if _is_current(generated[kind].get(code), watermark):
+                skipped += 1
+            else:
+                pending[code].append(kind)
+    return {code: kinds for code, kinds in pending.items() if kinds}, skipped
+
+
+def get_current_stock_analysis(
+    kind: str,
+    code: str,
+    *,
+    settings_path: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    """Return the stored ``kind`` analysis of ``code`` when its inputs are unchanged since."""
+    if kind not in _KINDS:
+        raise ValueError(f"Unsupported stock analysis: {kind}")
+    normalized = (code or "").strip().upper()
+    if not normalized:
+        return None
+    pending, _skipped = plan_stock_analysis_batch([normalized], [kind], settings_path=settings_path)
+    if pending:
+        return None
+    return _KINDS[kind].latest(normalized, settings_path=settings_path)
+
+
+def _run_stock_analyses(
+    code: str,
+    kinds: Sequence[str],
+    *,
+    run_llm: bool,
+    settings_path: Optional[str],
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, str]]]:
+    generated: List[Dict[str, Any]] = []
+    errors: List[Dict[str, str]] = []
+    for kind in kinds:
+        try:
+            with _LLM_SLOTS:
+                record = _KINDS[kind].generate(code, run_llm=run_llm, settings_path=settings_path)
+        except Exception as exc:  # pragma: no cover - LLM/network volatility
+            logger.warning("Stock %s analysis failed for %s: %s", kind, code, exc)
+            errors.append({"code": code, "analysis": kind, "error": str(exc)})
+            continue
+        generated.append({"code": code, "analysis": kind, "generatedAt": record.get("generatedAt")})
+    return generated, errors
+
+
+def generate_stock_analysis_batch(
+    codes: Optional[Sequence[str]] = None,
+    *,
+    analyses: Optional[Sequence[str]] = None,
+    force: bool = False,
+    run_llm: bool = True,
+    settings_path: Optional[str] = None,
+    progress_callback: Optional[Callable[[float, Optional[str], Optional[int]], None]] = None,
+) -> Dict[str, Any]:
+    """Run the stock analyses for ``codes`` (default: every favourite stock)."""
+    kinds = [kind for kind in STOCK_ANALYSIS_KINDS if analyses is None or kind in analyses]
+    unknown = set(analyses or ()) - set(STOCK_ANALYSIS_KINDS)
+    if unknown:
+        raise ValueError(f"Unsupported stock analyses: {', '.join(sorted(unknown))}")
+    if codes is None:
+        settings = load_settings(settings_path)
+        codes = FavoriteStockDAO(settings.postgres).list_codes()
+    targets = list(dict.fromkeys(code.strip().upper() for code in codes if code and code.strip()))
+
+    pending, skipped = plan_stock_analysis_batch(targets, kinds, force=force, settings_path=settings_path)
+    generated: List[Dict[str, Any]] = []
+    errors: List[Dict[str, str]] = []
+    if pending:
+        prime_stock_context_versions(pending, settings_path=settings_path)
+        with ThreadPoolExecutor(max_workers=min(LLM_CONCURRENCY, len(pending))) as executor:
+            futures = {
+                executor.submit(
+                    _run_stock_analyses,
+                    code,
+                    stock_kinds,
+                    run_llm=run_llm,
+                    settings_path=settings_path,
+                ): code
+                for code, stock_kinds in pending.items()
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                stock_generated, stock_errors = future.result()
+                generated.extend(stock_generated)
+                errors.extend(stock_errors)
+                if progress_callback:
+                    progress_callback(done / len(pending), f"Analysed {futures[future]}", len(generated))
+
+    return {
+        "stocks": len(targets),
+        "analyses": kinds,
+        "generated": generated,
+        "skipped": skipped,
+        "errors": errors,
+    }
+
+
+__all__ = [
+    "LLM_CONCURRENCY",
+    "STOCK_ANALYSIS_KINDS",
+    "generate_stock_analysis_batch",
+    "get_current_stock_analysis",
+    "plan_stock_analysis_batch",
+]
@@ -4,8 +4,10 @@ Service layer for synchronising Tushare stock basic data into PostgreSQL.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import math
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 from typing import Dict, Optional, Sequence
 
@@ -22,8 +24,10 @@ from ..dao import (
     FavoriteStockDAO,
     StockBasicDAO,
 )
+from .realtime_quote_service import get_realtime_quote
 from .stock_main_business_service import get_stock_main_business
 from .stock_main_composition_service import get_stock_main_composition
+from .stock_search_service import refresh_stock_search_index
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +64,40 @@ def _fetch_realtime_snapshot(ts_code: str, token: Optional[str]) -> dict[str, Op
     }
 
 
+def _snapshot_from_quote_store(ts_code: str) -> dict[str, Optional[float]]:
+    """Return the poller's in-memory quote in ``_fetch_realtime_snapshot`` shape, if fresh."""
+    quote = get_realtime_quote(ts_code)
+    if not quote:
+        return {}
+    return {
+        "open": quote.get("open"),
+        "high": quote.get("high"),
+        "low": quote.get("low"),
+        "close": quote.get("close"),
+        "pre_close": quote.get("pre_close"),
+        "volume": quote.get("volume_hands"),
+        "trade_date": quote.get("trade_date"),
+    }
+
+
+def _as_date(value: object) -> Optional[date]:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return None
+
+
+def _quote_applies_to_bar(bar: dict[str, object], snapshot: dict[str, object]) -> bool:
+    """Whether ``snapshot`` describes the same session as ``bar`` (never a finalised earlier day)."""
+    if not snapshot:
+        return False
+    if bar.get("is_intraday"):
+        return True
+    quote_date = _as_date(snapshot.get("trade_date"))
+    return quote_date is not None and quote_date == _as_date(bar.get("trade_date"))
+
+
 def _resolve_token(token: str | None, settings: AppSettings) -> str:
     resolved = token or settings.tushare.token
     if not resolved:
@@ -110,81 +148,51 @@ def sync_stock_basic(
 
     affected = dao.upsert(dataframe)
     logger.info("Insert completed, affected rows: %s", affected)
+    try:
+        refresh_stock_search_index(settings_path=settings_path)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Failed to refresh stock search index: %s", exc)
     return affected
 
 
-def get_stock_overview(
+def _favorite_codes_filter(
+    favorite_code_map: Dict[str, Optional[str]],
     *,
-    keyword: str | None = None,
-    market: str | None = None,
-    industry: str | None = None,
-    exchange: str | None = None,
-    limit: Optional[int] = 50,
-    offset: int = 0,
-    codes: Optional[Sequence[str]] = None,
-    favorites_only: bool = False,
-    favorite_group: Optional[str] = None,
-    favorite_group_specified: bool = False,
-    settings_path: str | None = None,
+    codes: Optional[Sequence[str]],
+    favorites_only: bool,
+    favorite_group: Optional[str],
+    favorite_group_specified: bool,
+) -> tuple[bool, Optional[Sequence[str]]]:
+    """Return ``(empty, codes_filter)`` for the favorites options of ``get_stock_overview``."""
+    if codes is not None:
+        return False, None
+    if favorite_group_specified:
+        if favorite_group is None:
+            filtered_codes = [code for code, group in favorite_code_map.items() if not group]
+        else:
+            filtered_codes = [code for code, group in favorite_code_map.items() if group == favorite_group]
+        if not filtered_codes:
+            return True, None
+        return False, filtered_codes
+    if favorites_only:
+        if not favorite_code_map:
+            return True, None
+        return False, list(favorite_code_map)
+    return False, None
+
+
+def _enrich_overview_items(
+    result: dict[str, object],
+    *,
+    metrics: Dict[str, dict],
+    indicators: Dict[str, dict],
+    derived_metrics: Dict[str, dict],
+    fundamental_metrics: Dict[str, dict],
+    income_statements: Dict[str, dict],
+    financials: Dict[str, dict],
+    favorite_code_map: Dict[str, Optional[str]],
 ) -> dict[str, object]:
-    """
-    Retrieve stock fundamentals enriched with latest trading metrics.
-    """
-    settings = load_settings(settings_path)
-    stock_dao = StockBasicDAO(settings.postgres)
-    favorites_dao = FavoriteStockDAO(settings.postgres)
-    runtime_config = load_runtime_config()
-    favorite_entries = favorites_dao.list_entries()
-    favorite_code_map: Dict[str, Optional[str]] = {
-        entry["code"]: entry.get("group") for entry in favorite_entries
-    }
-    favorite_code_set = set(favorite_code_map.keys())
-    favorite_codes_filter: Optional[Sequence[str]] = None
-
-    if codes is None:
-        if favorite_group_specified:
-            if favorite_group is None:
-                filtered_codes = [
-                    code for code, group in favorite_code_map.items() if not group
-                ]
-            else:
-                filtered_codes = [
-                    code
-                    for code, group in favorite_code_map.items()
-                    if group == favorite_group
-                ]
-            if favorites_only or favorite_group_specified:
-                if not filtered_codes:
-                    return {"total": 0, "items": []}
-                favorite_codes_filter = filtered_codes
-        elif favorites_only:
-            if not favorite_code_set:
-                return {"total": 0, "items": []}
-            favorite_codes_filter = list(favorite_code_set)
-
-    result = stock_dao.query_fundamentals(
-        keyword=keyword,
-        market=market,
-        industry=industry,
-        exchange=exchange,
-        include_st=runtime_config.include_st,
-        include_delisted=runtime_config.include_delisted,
-        limit=limit,
-        offset=offset,
-        codes=codes or favorite_codes_filter,
-    )
-
-    codes = [item["code"] for item in result["items"]]
-    daily_dao = DailyTradeDAO(settings.postgres)
-    metrics: Dict[str, dict] = daily_dao.fetch_latest_metrics(codes)
-    indicator_dao = DailyIndicatorDAO(settings.postgres)
-    indicators: Dict[str, dict] = indicator_dao.fetch_latest_indicators(codes)
-    derived_metrics = DailyTradeMetricsDAO(settings.postgres).fetch_metrics(codes)
-    fundamental_metrics = FundamentalMetricsDAO(settings.postgres).fetch_metrics(codes)
-    income_dao = IncomeStatementDAO(settings.postgres)
-    income_statements = income_dao.fetch_latest_statements(codes)
-    financial_dao = FinancialIndicatorDAO(settings.postgres)
-    financials = financial_dao.fetch_latest_indicators(codes)
+    favorite_code_set = set(favorite_code_map)
 
     def _safe_float(value: object) -> Optional[float]:
         if value is None:
@@ -261,6 +269,138 @@ def get_stock_overview(
     return result
 
 
+def get_stock_overview(
+    *,
+    keyword: str | None = None,
+    market: str | None = None,
+    industry: str | None = None,
+    exchange: str | None = None,
+    limit: Optional[int] = 50,
+    offset: int = 0,
+    codes: Optional[Sequence[str]] = None,
+    favorites_only: bool = False,
+    favorite_group: Optional[str] = None,
+    favorite_group_specified: bool = False,
+    settings_path: str | None = None,
+) -> dict[str, object]:
+    """
+    Retrieve stock fundamentals enriched with latest trading metrics.
+    """
+    settings = load_settings(settings_path)
+    stock_dao = StockBasicDAO(settings.postgres)
+    favorites_dao = FavoriteStockDAO(settings.postgres)
+    runtime_config = load_runtime_config()
+    favorite_code_map: Dict[str, Optional[str]] = {
+        entry["code"]: entry.get("group") for entry in favorites_dao.list_entries()
+    }
+    empty, favorite_codes_filter = _favorite_codes_filter(
+        favorite_code_map,
+        codes=codes,
+        favorites_only=favorites_only,
+        favorite_group=favorite_group,
+        favorite_group_specified=favorite_group_specified,
+    )
+    if empty:
+        return {"total": 0, "items": []}
+
+    result = stock_dao.query_fundamentals(
+        keyword=keyword,
+        market=market,
+        industry=industry,
+        exchange=exchange,
+        include_st=runtime_config.include_st,
+        include_delisted=runtime_config.include_delisted,
+        limit=limit,
+        offset=offset,
+        codes=codes or favorite_codes_filter,
+    )
+
+    codes = [item["code"] for item in result["items"]]
+    return _enrich_overview_items(
+        result,
+        metrics=DailyTradeDAO(settings.postgres).fetch_latest_metrics(codes),
+        indicators=DailyIndicatorDAO(settings.postgres).fetch_latest_indicators(codes),
+        derived_metrics=DailyTradeMetricsDAO(settings.postgres).fetch_metrics(codes),
+        fundamental_metrics=FundamentalMetricsDAO(settings.postgres).fetch_metrics(codes),
+        income_statements=IncomeStatementDAO(settings.postgres).fetch_latest_statements(codes),
+        financials=FinancialIndicatorDAO(settings.postgres).fetch_latest_indicators(codes),
+        favorite_code_map=favorite_code_map,
+    )
+
+
+async def get_stock_overview_async(
+    *,
+    keyword: str | None = None,
+    market: str | None = None,
+    industry: str | None = None,
+    exchange: str | None = None,
+    limit: Optional[int] = 50,
+    offset: int = 0,
+    codes: Optional[Sequence[str]] = None,
+    favorites_only: bool = False,
+    favorite_group: Optional[str] = None,
+    favorite_group_specified: bool = False,
+    settings_path: str | None = None,
+) -> dict[str, object]:
+    """Async ``get_stock_overview``: the per-code enrichment queries run concurrently on the pool."""
+    settings = load_settings(settings_path)
+    runtime_config = load_runtime_config()
+    favorite_entries = await FavoriteStockDAO(settings.postgres).list_entries_async()
+    favorite_code_map: Dict[str, Optional[str]] = {
+        entry["code"]: entry.get("group") for entry in favorite_entries
+    }
+    empty, favorite_codes_filter = _favorite_codes_filter(
+        favorite_code_map,
+        codes=codes,
+        favorites_only=favorites_only,
+        favorite_group=favorite_group,
+        favorite_group_specified=favorite_group_specified,
+    )
+    if empty:
+        return {"total": 0, "items": []}
+
+    result = await StockBasicDAO(settings.postgres).query_fundamentals_async(
+        keyword=keyword,
+        market=market,
+        industry=industry,
+        exchange=exchange,
+        include_st=runtime_config.include_st,
+        include_delisted=runtime_config.include_delisted,
+        limit=limit,
+        offset=offset,
+        codes=codes or favorite_codes_filter,
+    )
+
+    codes = [item["code"] for item in result["items"]]
+    (
+        metrics,
+        indicators,
+        derived_metrics,
+        fundamental_metrics,
+        income_statements,
+        financials,
+    ) = await asyncio.gather(
+        DailyTradeDAO(settings.postgres).fetch_latest_metrics_async(codes),
+        DailyIndicatorDAO(settings.postgres).fetch_latest_indicators_async(codes),
+        DailyTradeMetricsDAO(settings.postgres).fetch_metrics_async(codes),
+        FundamentalMetricsDAO(settings.postgres).fetch_metrics_async(codes),
+        IncomeStatementDAO(settings.postgres).fetch_latest_statements_async(codes),
+        FinancialIndicatorDAO(settings.postgres).fetch_latest_indicators_async(codes),
+    )
+    # Enriching an unpaged result walks the whole universe; keep it off the event loop.
+    return await asyncio.to_thread(
+        _enrich_overview_items,
+        result,
+        metrics=metrics,
+        indicators=indicators,
+        derived_metrics=derived_metrics,
+        fundamental_metrics=fundamental_metrics,
+        income_statements=income_statements,
+        financials=financials,
+        favorite_code_map=favorite_code_map,
+    )
+
+
 def get_stock_detail(
     code: str,
     *,
@@ -293,15 +433,30 @@ def get_stock_detail(
     settings = load_settings(settings_path)
     daily_trade_dao = DailyTradeDAO(settings.postgres)
     favorites_dao = FavoriteStockDAO(settings.postgres)
-    favorite_entry = favorites_dao.get_entry(code)
+    # The remaining lookups are independent of each other; run them side by side.
+    with ThreadPoolExecutor(max_workers=5, thread_name_prefix="stock-detail") as executor:
+        favorite_future = executor.submit(favorites_dao.get_entry, code)
+        history_future = executor.submit(
+            daily_trade_dao.fetch_price_history, code, limit=history_limit, include_intraday=True
+        )
+        latest_bar_future = executor.submit(daily_trade_dao.fetch_latest_bar, code, include_intraday=True)
+        business_future = executor.submit(get_stock_main_business, item["code"], settings_path=settings_path)
+        composition_future = executor.submit(
+            get_stock_main_composition, item["code"], settings_path=settings_path
+        )
+        favorite_entry = favorite_future.result()
+        history_rows = history_future.result()
+        latest_bar = latest_bar_future.result()
+        business_profile = business_future.result()
+        business_composition = composition_future.result()
     is_favorite = favorite_entry is not None
     favorite_group = favorite_entry.get("group") if favorite_entry else None
-    history_rows = daily_trade_dao.fetch_price_history(code, limit=history_limit, include_intraday=True)
-    latest_bar = daily_trade_dao.fetch_latest_bar(code, include_intraday=True)
-    realtime_snapshot: dict[str, Optional[float]] = {}
-    if latest_bar and latest_bar.get("is_intraday"):
+    realtime_snapshot: dict[str, Optional[float]] = _snapshot_from_quote_store(code) if latest_bar else {}
+    if not realtime_snapshot and latest_bar and latest_bar.get("is_intraday"):
         token = getattr(settings.tushare, "token", None)
         realtime_snapshot = _fetch_realtime_snapshot(code, token)
+    if latest_bar and not _quote_applies_to_bar(latest_bar, realtime_snapshot):
+        realtime_snapshot = {}
     if latest_bar:
         if realtime_snapshot.get("close") is not None:
             latest_bar["close"] = realtime_snapshot["close"]
@@ -417,9 +572,6 @@ def get_stock_detail(
         "favoriteGroup": favorite_group,
     }
 
-    business_profile = get_stock_main_business(item["code"], settings_path=settings_path)
-    business_composition = get_stock_main_composition(item["code"], settings_path=settings_path)
-
     return {
         "profile": profile,
         "tradingData": trading_data,
@@ -437,5 +589,6 @@ def get_stock_detail(
 __all__ = [
     "sync_stock_basic",
     "get_stock_overview",
+    "get_stock_overview_async",
     "get_stock_detail",
 ]
@@ -0,0 +1,61 @@
+"""
+Concurrent section loader backing the ``/stocks/{code}/bundle`` endpoint.
+
+The stock detail page needs a dozen independent payloads. ``gather_sections`` runs the
+section loaders on a shared thread pool and waits for each one only up to its own
+timeout, so the response is bounded by the slowest section that finishes in time and
+sections that fail or time out are reported instead of failing the whole bundle.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SECTION_TIMEOUT_SECONDS = 5.0
+MAX_BUNDLE_WORKERS = 16
+
+# Long-lived pool: a timed-out loader cannot be cancelled, so it keeps its worker until
+# it returns instead of blocking the request on executor shutdown.
+_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_BUNDLE_WORKERS, thread_name_prefix="stock-bundle")
+
+
+def gather_sections(
+    loaders: Mapping[str, Callable[[], Any]],
+    *,
+    timeouts: Optional[Mapping[str, float]] = None,
+    default_timeout: float = DEFAULT_SECTION_TIMEOUT_SECONDS,
+) -> Tuple[Dict[str, Any], Dict[str, BaseException]]:
+    """Run ``loaders`` concurrently and return ``(sections, errors)``.
+
+    Each section gets ``timeouts[name]`` seconds (``default_timeout`` otherwise) measured
+    from submission. Sections that raise or time out are left out of ``sections`` and
+    their exception (``TimeoutError`` for timeouts) is returned in ``errors``.
+    """
+    timeouts = timeouts or {}
+    started = time.monotonic()
+    futures = {name: _EXECUTOR.submit(loader) for name, loader in loaders.items()}
+
+    sections: Dict[str, Any] = {}
+    errors: Dict[str, BaseException] = {}
+    for name, future in futures.items():
+        deadline = started + float(timeouts.get(name, default_timeout))
+        try:
+            sections[name] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except FutureTimeoutError:
+            errors[name] = TimeoutError(f"Section '{name}' timed out")
+            logger.warning("Stock bundle section %s timed out", name)
+        except Exception as exc:  # noqa: BLE001
+            errors[name] = exc
+            logger.warning("Stock bundle section %s failed: %s", name, exc)
+    return sections, errors
+
+
+__all__ = [
+    "DEFAULT_SECTION_TIMEOUT_SECONDS",
+    "gather_sections",
+]
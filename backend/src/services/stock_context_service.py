@@ -0,0 +1,305 @@
+"""
+Short-lived per-stock context shared by the stock analysis generators.
+
+The integrated, valuation and volume/price analyses read overlapping inputs: the stock
+detail, fund flow, big deals, news, price history and the latest volume reasoning.
+Each piece is memoised per stock under the stock's data version (the latest daily bar
+stored for it) and expires after a short TTL so realtime quotes and news stay fresh.
+Concurrent requests for the same piece wait on a single load instead of repeating it.
+Cached values are shared between callers and must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+from zoneinfo import ZoneInfo
+
+from ..config.settings import load_settings
+from ..dao import DailyTradeDAO, StockNewsDAO
+from .big_deal_fund_flow_service import list_big_deal_fund_flow
+from .individual_fund_flow_service import list_individual_fund_flow
+from .stock_basic_service import get_stock_detail, get_stock_overview
+
+logger = logging.getLogger(__name__)
+
+LOCAL_TZ = ZoneInfo("Asia/Shanghai")
+STOCK_CONTEXT_TTL_SECONDS = 300
+DATA_VERSION_TTL_SECONDS = 30
+STOCK_CONTEXT_MAX_ENTRIES = 4096
+DETAIL_HISTORY_LIMIT = 180
+FUND_FLOW_FETCH_LIMIT = 100
+BIG_DEAL_FETCH_LIMIT = 30
+VOLUME_REASONING_PIECE = "volumeReasoning"
+
+
+@dataclass(frozen=True)
+class _Entry:
+    version: str
+    expires_at: float
+    value: Any
+
+
+class StockContextCache:
+    """Thread-safe ``(code, piece)`` memo invalidated by TTL or a new data version."""
+
+    def __init__(
+        self,
+        version_loader: Callable[[Sequence[str]], Dict[str, Any]],
+        *,
+        ttl: float = STOCK_CONTEXT_TTL_SECONDS,
+        version_ttl: float = DATA_VERSION_TTL_SECONDS,
+        max_entries: int = STOCK_CONTEXT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._version_loader = version_loader
+        self._ttl = ttl
+        self._version_ttl = version_ttl
+        self._max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[str, str], _Entry] = {}
+        self._versions: Dict[str, Tuple[str, float]] = {}
+        self._loading: Dict[Tuple[str, str], threading.Lock] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def prime_versions(self, codes: Iterable[str]) -> Dict[str, str]:
+        """Return the data version of every code, loading the expired ones in one query."""
+        normalized = [_normalize_code(code) for code in codes]
+        now = self._clock()
+        versions: Dict[str, str] = {}
+        missing = []
+        with self._lock:
+            for code in dict.fromkeys(filter(None, normalized)):
+                cached = self._versions.get(code)
+                if cached and cached[1] > now:
+                    versions[code] = cached[0]
+                else:
+                    missing.append(code)
+        if missing:
+            loaded = self._version_loader(missing)
+            expires_at = self._clock() + self._version_ttl
+            with self._lock:
+                for code in missing:
+                    value = loaded.get(code)
+                    version = value.isoformat() if hasattr(value, "isoformat") else str(value or "")
+                    self._versions[code] = (version, expires_at)
+                    versions[code] = version
+        return versions
+
+    def version(self, code: str) -> str:
+        normalized = _normalize_code(code)
+        return self.prime_versions([normalized]).get(normalized, "")
+
+    def get(self, code: str, piece: str, loader: Callable[[], Any]) -> Any:
+        """Return the cached ``piece`` of ``code``, calling ``loader`` at most once per version."""
+        normalized = _normalize_code(code)
+        key = (normalized, piece)
+        version = self.version(normalized)
+        with self._lock:
+            entry = self._lookup(key, version)
+            if entry is not None:
+                return entry.value
+            load_lock = self._loading.setdefault(key, threading.Lock())
+        with load_lock:
+            with self._lock:
+                entry = self._lookup(key, version)
+                if entry is not None:
+                    return entry.value
+            try:
+                value = loader()
+                with self._lock:
+                    self._store(key, _Entry(version, self._clock() + self._ttl, value))
+            finally:
+                with self._lock:
+                    self._loading.pop(key, None)
+        return value
+
+    def invalidate(self, code: str, piece: Optional[str] = None) -> None:
+        """Drop one cached piece of ``code``, or all of them when ``piece`` is omitted."""
+        normalized = _normalize_code(code)
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == normalized]:
+                if piece is None or key[1] == piece:
+                    del self._entries[key]
+
+    def invalidate_piece(self, piece: str) -> None:
+        """Drop ``piece`` of every cached stock."""
+        with self._lock:
+            for key in [key for key in self._entries if key[1] == piece]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+
+    def _lookup(self, key: Tuple[str, str], version: str) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.version != version or entry.expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        return entry
+
+    def _store(self, key: Tuple[str, str], entry: _Entry) -> None:
+        if key not in self._entries and len(self._entries) >= self._max_entries:
+            now = self._clock()
+            for stale_key in [k for k, v in self._entries.items() if v.expires_at <= now]:
+                del self._entries[stale_key]
+            while len(self._entries) >= self._max_entries:
+                del self._entries[next(iter(self._entries))]
+        self._entries[key] = entry
+
+
+def _normalize_code(code: Optional[str]) -> str:
+    return (code or "").strip().upper()
+
+
+_CACHES: Dict[Optional[str], StockContextCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_stock_context_cache(settings_path: Optional[str] = None) -> StockContextCache:
+    """Return the process-wide context cache for ``settings_path``."""
+    cache = _CACHES.get(settings_path)
+    if cache is not None:
+        return cache
+    with _CACHES_LOCK:
+        cache = _CACHES.get(settings_path)
+        if cache is None:
+
+            def _load_versions(codes: Sequence[str]) -> Dict[str, Any]:
+                settings = load_settings(settings_path)
+                return DailyTradeDAO(settings.postgres).latest_trade_dates_for_codes(codes)
+
+            cache = StockContextCache(_load_versions)
+            _CACHES[settings_path] = cache
+    return cache
+
+
+def cached_stock_piece(
+    code: str,
+    piece: str,
+    loader: Callable[[], Any],
+    *,
+    settings_path: Optional[str] = None,
+) -> Any:
+    return get_stock_context_cache(settings_path).get(code, piece, loader)
+
+
+def prime_stock_context_versions(codes: Iterable[str], *, settings_path: Optional[str] = None) -> Dict[str, str]:
+    """Resolve the data version of many stocks at once ahead of a batch of analyses."""
+    return get_stock_context_cache(settings_path).prime_versions(codes)
+
+
+def invalidate_stock_context(code: str, piece: Optional[str] = None, *, settings_path: Optional[str] = None) -> None:
+    get_stock_context_cache(settings_path).invalidate(code, piece)
+
+
+def invalidate_stock_context_piece(piece: str) -> None:
+    """Drop ``piece`` of every cached stock (all settings files), e.g. after a batch job."""
+    with _CACHES_LOCK:
+        caches = list(_CACHES.values())
+    for cache in caches:
+        cache.invalidate_piece(piece)
+
+
+def clear_stock_context() -> None:
+    """Drop every cached stock context (all settings files)."""
+    with _CACHES_LOCK:
+        caches = list(_CACHES.values())
+    for cache in caches:
+        cache.clear()
+
+
+def load_stock_detail(code: str, *, settings_path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    return cached_stock_piece(
+        code,
+        "detail",
+        lambda: get_stock_detail(code, history_limit=DETAIL_HISTORY_LIMIT, settings_path=settings_path),
+        settings_path=settings_path,
+    )
+
+
+def load_stock_profile(code: str, *, settings_path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    def _load() -> Optional[Dict[str, Any]]:
+        overview = get_stock_overview(codes=[code], limit=None, offset=0, settings_path=settings_path)
+        return overview["items"][0] if overview["items"] else None
+
+    return cached_stock_piece(code, "profile", _load, settings_path=settings_path)
+
+
+def load_stock_price_history(code: str, *, limit: int, settings_path: Optional[str] = None) -> list:
+    def _load() -> list:
+        settings = load_settings(settings_path)
+        return DailyTradeDAO(settings.postgres).fetch_price_history(code, limit=limit)
+
+    return cached_stock_piece(code, f"priceHistory:{limit}", _load, settings_path=settings_path)
+
+
+def _sliced(snapshot: Any, limit: int) -> Dict[str, Any]:
+    if not isinstance(snapshot, dict):
+        return {"total": 0, "items": []}
+    items = snapshot.get("items") or []
+    return {"total": snapshot.get("total", len(items)), "items": items[:limit]}
+
+
+def load_individual_fund_flow(code: str, *, limit: int, settings_path: Optional[str] = None) -> Dict[str, Any]:
+    """Return the latest ``limit`` fund-flow rows; every caller shares one fetch."""
+    fetch_limit = max(limit, FUND_FLOW_FETCH_LIMIT)
+    snapshot = cached_stock_piece(
+        code,
+        f"individualFundFlow:{fetch_limit}",
+        lambda: list_individual_fund_flow(stock_code=code, limit=fetch_limit, settings_path=settings_path),
+        settings_path=settings_path,
+    )
+    return _sliced(snapshot, limit)
+
+
+def load_big_deal_fund_flow(code: str, *, limit: int, settings_path: Optional[str] = None) -> Dict[str, Any]:
+    """Return the latest ``limit`` big-deal trades; every caller shares one fetch."""
+    fetch_limit = max(limit, BIG_DEAL_FETCH_LIMIT)
+    snapshot = cached_stock_piece(
+        code,
+        f"bigDeals:{fetch_limit}",
+        lambda: list_big_deal_fund_flow(stock_code=code, limit=fetch_limit, settings_path=settings_path),
+        settings_path=settings_path,
+    )
+    return _sliced(snapshot, limit)
+
+
+def load_stock_news(code: str, *, days: int, limit: int, settings_path: Optional[str] = None) -> list:
+    def _load() -> list:
+        settings = load_settings(settings_path)
+        since = (datetime.now(LOCAL_TZ) - timedelta(days=days)).replace(tzinfo=None)
+        return StockNewsDAO(settings.postgres).list_since(code, since=since, limit=limit)
+
+    return cached_stock_piece(code, f"news:{days}:{limit}", _load, settings_path=settings_path)
+
+
+__all__ = [
+    "STOCK_CONTEXT_TTL_SECONDS",
+    "StockContextCache",
+    "VOLUME_REASONING_PIECE",
+    "cached_stock_piece",
+    "clear_stock_context",
+    "get_stock_context_cache",
+    "invalidate_stock_context",
+    "invalidate_stock_context_piece",
+    "load_big_deal_fund_flow",
+    "load_individual_fund_flow",
+    "load_stock_detail",
+    "load_stock_news",
+    "load_stock_price_history",
+    "load_stock_profile",
+    "prime_stock_context_versions",
+]
@@ -11,10 +11,15 @@ from zoneinfo import ZoneInfo
 
 from ..api_clients import generate_finance_analysis, run_coze_agent
 from ..config.settings import load_settings
-from ..dao import StockIntegratedAnalysisDAO, StockNewsDAO
-from .big_deal_fund_flow_service import list_big_deal_fund_flow
-from .individual_fund_flow_service import list_individual_fund_flow
-from .stock_basic_service import get_stock_detail
+from ..dao import StockIntegratedAnalysisDAO
+from .stock_context_service import (
+    VOLUME_REASONING_PIECE,
+    cached_stock_piece,
+    load_big_deal_fund_flow,
+    load_individual_fund_flow,
+    load_stock_detail,
+    load_stock_news,
+)
 from .stock_volume_price_service import get_latest_stock_volume_price_reasoning
 
 LOCAL_TZ = ZoneInfo("Asia/Shanghai")
@@ -26,6 +31,7 @@ MIN_TRADE_DAYS = 5
 MAX_TRADE_DAYS = 30
 COOLDOWN_MINUTES = 0
 NEWS_LIMIT = 80
+FUND_FLOW_LIMIT = 100
 BIG_DEAL_LIMIT = 12
 
 INTEGRATED_PROMPT_TEMPLATE = """
@@ -174,23 +180,27 @@ def build_stock_integrated_context(
     trade_days: int = DEFAULT_TRADE_DAYS,
     settings_path: Optional[str] = None,
 ) -> Dict[str, Any]:
-    detail = get_stock_detail(code, history_limit=180, settings_path=settings_path)
+    # Every input comes from the shared per-stock context, so the valuation and
+    # volume/price analyses of the same stock reuse these fetches.
+    detail = load_stock_detail(code, settings_path=settings_path)
     if not detail:
         raise ValueError(f"Stock '{code}' not found.")
 
     normalized_news_days = max(MIN_NEWS_DAYS, min(news_days, MAX_NEWS_DAYS))
     normalized_trade_days = max(MIN_TRADE_DAYS, min(trade_days, MAX_TRADE_DAYS))
 
-    settings = load_settings(settings_path)
-    news_dao = StockNewsDAO(settings.postgres)
-    news_since = datetime.now(LOCAL_TZ) - timedelta(days=normalized_news_days)
-    since_naive = news_since.replace(tzinfo=None)
-    news_records = news_dao.list_since(detail["profile"]["code"], since=since_naive, limit=NEWS_LIMIT)
+    stock_code = detail["profile"]["code"]
+    news_records = load_stock_news(stock_code, days=normalized_news_days, limit=NEWS_LIMIT, settings_path=settings_path)
     news_items = _sanitize_news_records(news_records)
 
-    individual_flow = list_individual_fund_flow(stock_code=detail["profile"]["code"], limit=100, settings_path=settings_path)
-    big_deals = list_big_deal_fund_flow(stock_code=detail["profile"]["code"], limit=BIG_DEAL_LIMIT, settings_path=settings_path)
-    volume_reasoning = get_latest_stock_volume_price_reasoning(detail["profile"]["code"], settings_path=settings_path)
+    individual_flow = load_individual_fund_flow(stock_code, limit=FUND_FLOW_LIMIT, settings_path=settings_path)
+    big_deals = load_big_deal_fund_flow(stock_code, limit=BIG_DEAL_LIMIT, settings_path=settings_path)
+    volume_reasoning = cached_stock_piece(
+        stock_code,
+        VOLUME_REASONING_PIECE,
+        lambda: get_latest_stock_volume_price_reasoning(stock_code, settings_path=settings_path),
+        settings_path=settings_path,
+    )
 
     trade_history = _normalize_trade_history(detail.get("dailyTradeHistory") or [], normalized_trade_days)
 
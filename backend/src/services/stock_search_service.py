@@ -0,0 +1,233 @@
+"""
+In-process typeahead index for stock search.
+
+Every listed code is indexed once by code, symbol, name, pinyin initials and industry
+using unigram/bigram posting lists. A keystroke intersects the postings of the query's
+n-grams, verifies the substring match and ranks exact/prefix hits first, so lookups
+never touch PostgreSQL. The index is rebuilt after ``sync_stock_basic``.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from pypinyin import Style, lazy_pinyin
+
+from ..config.settings import load_settings
+from ..dao import StockBasicDAO
+
+logger = logging.getLogger(__name__)
+
+# Base score per field; exact and prefix hits add a bonus on top.
+FIELD_WEIGHTS: Tuple[Tuple[str, int], ...] = (
+    ("code", 90),
+    ("symbol", 90),
+    ("name", 80),
+    ("initials", 70),
+    ("industry", 30),
+)
+EXACT_MATCH_BONUS = 20
+PREFIX_MATCH_BONUS = 10
+ST_PREFIXES = ("ST", "*ST")
+DELISTED_STATUSES = ("D", "P")
+
+
+def _normalize(value: object) -> str:
+    if value is None:
+        return ""
+    return str(value).strip().upper()
+
+
+def _pinyin_initials(name: str) -> str:
+    if not name:
+        return ""
+    return "".join(lazy_pinyin(name, style=Style.FIRST_LETTER)).upper()
+
+
+def _ngrams(text: str) -> Set[str]:
+    if len(text) <= 1:
+        return {text} if text else set()
+    return {text[idx : idx + 2] for idx in range(len(text) - 1)}
+
+
+@dataclass(frozen=True)
+class StockSearchEntry:
+    code: str
+    symbol: str
+    name: str
+    industry: str
+    market: Optional[str]
+    exchange: Optional[str]
+    status: Optional[str]
+    initials: str
+
+    @classmethod
+    def from_record(cls, record: Mapping[str, object]) -> "StockSearchEntry":
+        name = str(record.get("name") or "").strip()
+        return cls(
+            code=_normalize(record.get("code")),
+            symbol=_normalize(record.get("symbol")),
+            name=name,
+            industry=str(record.get("industry") or "").strip(),
+            market=record.get("market"),  # type: ignore[arg-type]
+            exchange=record.get("exchange"),  # type: ignore[arg-type]
+            status=record.get("status"),  # type: ignore[arg-type]
+            initials=_pinyin_initials(name),
+        )
+
+    def searchable(self) -> Dict[str, str]:
+        return {
+            "code": self.code,
+            "symbol": self.symbol,
+            "name": self.name.upper(),
+            "initials": self.initials,
+            "industry": self.industry.upper(),
+        }
+
+    def to_item(self) -> Dict[str, object]:
+        return {
+            "code": self.code,
+            "name": self.name or None,
+            "industry": self.industry or None,
+            "market": self.market,
+            "exchange": self.exchange,
+            "status": self.status,
+        }
+
+
+class StockSearchIndex:
+    """Immutable n-gram inverted index over stock identifiers."""
+
+    def __init__(self, records: Iterable[Mapping[str, object]] = ()) -> None:
+        self._entries: List[StockSearchEntry] = []
+        self._fields: List[Dict[str, str]] = []
+        self._postings: Dict[str, Set[int]] = {}
+        for record in records:
+            entry = StockSearchEntry.from_record(record)
+            if not entry.code:
+                continue
+            doc_id = len(self._entries)
+            fields = entry.searchable()
+            self._entries.append(entry)
+            self._fields.append(fields)
+            grams: Set[str] = set()
+            for value in fields.values():
+                grams.update(value)
+                grams.update(_ngrams(value))
+            for gram in grams:
+                self._postings.setdefault(gram, set()).add(doc_id)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _candidates(self, term: str) -> Set[int]:
+        postings = []
+        for gram in _ngrams(term):
+            posting = self._postings.get(gram)
+            if not posting:
+                return set()
+            postings.append(posting)
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+        return candidates
+
+    def _score(self, doc_id: int, term: str) -> int:
+        fields = self._fields[doc_id]
+        best = 0
+        for field, weight in FIELD_WEIGHTS:
+            value = fields[field]
+            if not value or term not in value:
+                continue
+            if value == term:
+                score = weight + EXACT_MATCH_BONUS
+            elif value.startswith(term):
+                score = weight + PREFIX_MATCH_BONUS
+            else:
+                score = weight
+            best = max(best, score)
+        return best
+
+    def search(
+        self,
+        keyword: str,
+        *,
+        limit: int = 20,
+        include_st: bool = True,
+        include_delisted: bool = True,
+    ) -> List[Dict[str, object]]:
+        """Return up to ``limit`` ranked matches for ``keyword``."""
+        term = _normalize(keyword)
+        if not term or limit <= 0:
+            return []
+
+        ranked: List[Tuple[int, bool, int, str, StockSearchEntry]] = []
+        for doc_id in self._candidates(term):
+            entry = self._entries[doc_id]
+            if not include_delisted and entry.status in DELISTED_STATUSES:
+                continue
+            if not include_st and entry.name.upper().startswith(ST_PREFIXES):
+                continue
+            score = self._score(doc_id, term)
+            if score <= 0:
+                continue
+            ranked.append((-score, entry.status != "L", len(entry.name), entry.code, entry))
+
+        ranked.sort(key=lambda item: item[:4])
+        return [item[-1].to_item() for item in ranked[:limit]]
+
+
+_INDEX: Optional[StockSearchIndex] = None
+_INDEX_LOCK = threading.Lock()
+
+
+def refresh_stock_search_index(*, settings_path: Optional[str] = None) -> StockSearchIndex:
+    """Rebuild the search index from ``stock_basic`` and swap it in atomically."""
+    global _INDEX
+    settings = load_settings(settings_path)
+    index = StockSearchIndex(StockBasicDAO(settings.postgres).list_search_entries())
+    with _INDEX_LOCK:
+        _INDEX = index
+    logger.info("Stock search index rebuilt with %s entries", len(index))
+    return index
+
+
+def get_stock_search_index(*, settings_path: Optional[str] = None) -> StockSearchIndex:
+    """Return the shared search index, building it on first use."""
+    index = _INDEX
+    if index is not None:
+        return index
+    with _INDEX_LOCK:
+        if _INDEX is not None:
+            return _INDEX
+    return refresh_stock_search_index(settings_path=settings_path)
+
+
+def search_stocks(
+    keyword: str,
+    *,
+    limit: int = 20,
+    include_st: bool = True,
+    include_delisted: bool = True,
+    settings_path: Optional[str] = None,
+) -> Dict[str, object]:
+    """Return ranked typeahead matches in the ``query_fundamentals`` result shape."""
+    items = get_stock_search_index(settings_path=settings_path).search(
+        keyword,
+        limit=limit,
+        include_st=include_st,
+        include_delisted=include_delisted,
+    )
+    return {"total": len(items), "items": items}
+
+
+__all__ = [
+    "StockSearchIndex",
+    "get_stock_search_index",
+    "refresh_stock_search_index",
+    "search_stocks",
+]
@@ -6,14 +6,21 @@ import json
 from datetime import datetime
 import math
 from statistics import mean, pstdev
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, List, Optional
 
 from zoneinfo import ZoneInfo
 
 from ..api_clients import generate_finance_analysis
 from ..config.settings import load_settings
-from ..dao import BigDealFundFlowDAO, DailyTradeDAO, IndividualFundFlowDAO, StockVolumePriceReasoningDAO
-from .stock_basic_service import get_stock_overview
+from ..dao import StockVolumePriceReasoningDAO
+from .stock_context_service import (
+    VOLUME_REASONING_PIECE,
+    invalidate_stock_context,
+    load_big_deal_fund_flow,
+    load_individual_fund_flow,
+    load_stock_price_history,
+    load_stock_profile,
+)
 
 LOCAL_TZ = ZoneInfo("Asia/Shanghai")
 INDIVIDUAL_FLOW_LIMIT = 40
@@ -96,56 +103,21 @@ def _normalize_record_for_json(record: Dict[str, Any]) -> Dict[str, Any]:
     return normalized
 
 
-def _normalize_code_aliases(ts_code: str) -> List[str]:
-    text = (ts_code or "").strip().upper()
-    if not text:
-        return []
-    aliases = {text}
-    if "." in text:
-        prefix, _suffix = text.split(".", 1)
-        prefix = prefix.strip()
-        if prefix:
-            aliases.add(prefix)
-            if prefix.isdigit():
-                aliases.add(prefix.zfill(6))
-    elif text.isdigit():
-        aliases.add(text.zfill(6))
-    digits_only = "".join(ch for ch in text if ch.isdigit())
-    if digits_only:
-        aliases.add(digits_only.zfill(6))
-    return [alias for alias in aliases if alias]
-
-
-def _load_individual_fund_flow_snapshot(code_aliases: Sequence[str], settings) -> Dict[str, Any]:
-    dao = IndividualFundFlowDAO(settings.postgres)
-    snapshot = dao.list_entries(stock_codes=code_aliases or None, limit=INDIVIDUAL_FLOW_LIMIT, offset=0)
-    items = snapshot.get("items") or []
-    snapshot["items"] = [_normalize_record_for_json(item) for item in items]
-    return snapshot
-
-
-def _load_big_deal_snapshot(code_aliases: Sequence[str], settings) -> Dict[str, Any]:
-    dao = BigDealFundFlowDAO(settings.postgres)
-    snapshot = dao.list_entries(
-        stock_codes=code_aliases or None,
-        limit=BIG_DEAL_SNAPSHOT_LIMIT,
-        offset=0,
-    )
-    items = snapshot.get("items") or []
-    snapshot["items"] = [_normalize_record_for_json(item) for item in items]
-    return snapshot
+def _load_individual_fund_flow_snapshot(code: str, *, settings_path: Optional[str] = None) -> Dict[str, Any]:
+    snapshot = load_individual_fund_flow(code, limit=INDIVIDUAL_FLOW_LIMIT, settings_path=settings_path)
+    return {**snapshot, "items": [_normalize_record_for_json(item) for item in snapshot["items"]]}
+
+
+def _load_big_deal_snapshot(code: str, *, settings_path: Optional[str] = None) -> Dict[str, Any]:
+    snapshot = load_big_deal_fund_flow(code, limit=BIG_DEAL_SNAPSHOT_LIMIT, settings_path=settings_path)
+    return {**snapshot, "items": [_normalize_record_for_json(item) for item in snapshot["items"]]}
 
 
 def _resolve_stock_profile(code: str, *, settings_path: Optional[str] = None) -> dict[str, Any]:
-    overview = get_stock_overview(
-        codes=[code],
-        limit=None,
-        offset=0,
-        settings_path=settings_path,
-    )
-    if not overview["items"]:
+    profile = load_stock_profile(code, settings_path=settings_path)
+    if not profile:
         raise ValueError(f"Stock '{code}' not found.")
-    return overview["items"][0]
+    return profile
 
 
 def build_stock_volume_price_dataset(
@@ -155,12 +127,13 @@ def build_stock_volume_price_dataset(
     settings_path: Optional[str] = None,
 ) -> Dict[str, Any]:
     profile = _resolve_stock_profile(code, settings_path=settings_path)
-    settings = load_settings(settings_path)
-    daily_trade_dao = DailyTradeDAO(settings.postgres)
-    code_aliases = _normalize_code_aliases(profile["code"])
-    individual_fund_flow = _load_individual_fund_flow_snapshot(code_aliases, settings)
-    big_deal_snapshot = _load_big_deal_snapshot(code_aliases, settings)
-    history_rows = daily_trade_dao.fetch_price_history(profile["code"], limit=min(max(lookback_days + 30, 120), 400))
+    individual_fund_flow = _load_individual_fund_flow_snapshot(profile["code"], settings_path=settings_path)
+    big_deal_snapshot = _load_big_deal_snapshot(profile["code"], settings_path=settings_path)
+    history_rows = load_stock_price_history(
+        profile["code"],
+        limit=min(max(lookback_days + 30, 120), 400),
+        settings_path=settings_path,
+    )
     if not history_rows:
         return {
             "code": profile["code"],
@@ -327,6 +300,7 @@ def generate_stock_volume_price_reasoning(
         generated_at=generated_at_db,
     )
     record["id"] = record_id
+    invalidate_stock_context(dataset["code"], VOLUME_REASONING_PIECE, settings_path=settings_path)
     return record
 
 
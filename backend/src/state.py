@@ -1,5 +1,9 @@
 """
 Shared in-memory state for sync jobs and progress tracking.
+
+Job state is persisted to ``control_state.json``. When jobs run in a separate worker
+process, the worker publishes every transition (``publish_live``) and the API process
+follows the file (``follow_disk``) instead of writing it.
 """
 
 from __future__ import annotations
@@ -7,10 +11,11 @@ from __future__ import annotations
 import json
 import logging
 import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 from zoneinfo import ZoneInfo
 
 
@@ -45,6 +50,7 @@ class SyncMonitor:
             "stock_basic": JobProgress(),
             "daily_trade": JobProgress(),
             "daily_trade_metrics": JobProgress(),
+            "price_panel": JobProgress(),
             "daily_indicator": JobProgress(),
             "income_statement": JobProgress(),
             "financial_indicator": JobProgress(),
@@ -73,6 +79,9 @@ class SyncMonitor:
             "industry_fund_flow": JobProgress(),
             "concept_fund_flow": JobProgress(),
             "concept_index_history": JobProgress(),
+            "concept_constituents": JobProgress(),
+            "sector_volume_price": JobProgress(),
+            "stock_analysis": JobProgress(),
             "concept_insight": JobProgress(),
             "industry_insight": JobProgress(),
             "individual_fund_flow": JobProgress(),
@@ -92,6 +101,12 @@ class SyncMonitor:
             "lpr_rate": JobProgress(),
             "shibor_rate": JobProgress(),
         }
+        self._finish_listeners: List[Callable[[str, bool], None]] = []
+        self._publish_interval: Optional[float] = None
+        self._last_publish = 0.0
+        self._follow_interval: Optional[float] = None
+        self._last_follow_check = 0.0
+        self._followed_raw: Optional[str] = None
         self._hydrate_from_disk()
         if not self._state_file.exists():
             with self._lock:
@@ -102,14 +117,20 @@ class SyncMonitor:
             self._jobs[job] = JobProgress()
         return self._jobs[job]
 
-    def _hydrate_from_disk(self) -> None:
+    def _read_state_file(self) -> Optional[str]:
         try:
-            raw = self._state_file.read_text(encoding="utf-8")
+            return self._state_file.read_text(encoding="utf-8")
         except FileNotFoundError:
-            return
+            return None
         except OSError as exc:
             logger.warning("Failed to read persisted control state: %s", exc)
-            return
+            return None
+
+    def _hydrate_from_disk(self, raw: Optional[str] = None) -> None:
+        if raw is None:
+            raw = self._read_state_file()
+            if raw is None:
+                return
 
         try:
             data = json.loads(raw)
@@ -170,8 +191,16 @@ class SyncMonitor:
                 state.message = message
             elif message is None:
                 state.message = None
+            error = payload.get("error")
+            state.error = error if isinstance(error, str) else None
+            last_market = payload.get("last_market")
+            if isinstance(last_market, str):
+                state.last_market = last_market
 
     def _persist_locked(self) -> None:
+        if self._follow_interval is not None:
+            return
+        self._last_publish = time.monotonic()
         snapshot = {}
         for name, state in self._jobs.items():
             snapshot[name] = {
@@ -182,6 +211,8 @@ class SyncMonitor:
                 "started_at": state.started_at.isoformat() if state.started_at else None,
                 "finished_at": state.finished_at.isoformat() if state.finished_at else None,
                 "message": state.message,
+                "error": state.error,
+                "last_market": state.last_market,
             }
 
         try:
@@ -195,6 +226,72 @@ class SyncMonitor:
         except OSError as exc:
             logger.warning("Failed to persist control state: %s", exc)
 
+    def _publish_due_locked(self) -> bool:
+        interval = self._publish_interval
+        return interval is not None and time.monotonic() - self._last_publish >= interval
+
+    @staticmethod
+    def _notify_finished(
+        finished: List[Tuple[str, bool]],
+        listeners: List[Callable[[str, bool], None]],
+    ) -> None:
+        for job, success in finished:
+            for listener in listeners:
+                try:
+                    listener(job, success)
+                except Exception as exc:  # noqa: BLE001
+                    logger.warning("Job finish listener failed for %s: %s", job, exc)
+
+    def add_finish_listener(self, listener: Callable[[str, bool], None]) -> None:
+        """Register ``listener(job, success)`` to be called whenever a job finishes."""
+        with self._lock:
+            self._finish_listeners.append(listener)
+
+    def publish_live(self, interval: float = 1.0) -> None:
+        """Persist on start and at most every ``interval`` seconds of progress updates."""
+        with self._lock:
+            self._publish_interval = max(0.0, float(interval))
+            self._follow_interval = None
+
+    def follow_disk(self, interval: float = 1.0) -> None:
+        """Mirror the state file written by another process instead of persisting locally.
+
+        The file is re-read at most every ``interval`` seconds from ``snapshot`` and
+        ``finished_at``; finish listeners fire for jobs whose ``finished_at`` advanced.
+        """
+        with self._lock:
+            self._follow_interval = max(0.0, float(interval))
+            self._publish_interval = None
+            self._last_follow_check = 0.0
+            self._followed_raw = None
+        self._refresh_from_disk()
+
+    def _refresh_from_disk(self) -> None:
+        if self._follow_interval is None:
+            return
+        with self._lock:
+            now = time.monotonic()
+            if self._follow_interval is None or now - self._last_follow_check < self._follow_interval:
+                return
+            self._last_follow_check = now
+            # The file is small; comparing contents avoids missing writes that land within
+            # the filesystem's mtime granularity.
+            raw = self._read_state_file()
+            if raw is None or raw == self._followed_raw:
+                return
+            self._followed_raw = raw
+            previous = {name: state.finished_at for name, state in self._jobs.items()}
+            self._hydrate_from_disk(raw)
+            finished = [
+                (name, state.status == "success")
+                for name, state in self._jobs.items()
+                if state.finished_at is not None
+                and state.finished_at != previous.get(name)
+                and state.status in {"success", "failed"}
+            ]
+            listeners = list(self._finish_listeners)
+        self._notify_finished(finished, listeners)
+
     def start(self, job: str, *, message: Optional[str] = None) -> None:
         with self._lock:
             state = self._get(job)
@@ -204,6 +301,8 @@ class SyncMonitor:
             state.progress = 0.0
             state.message = message
             state.error = None
+            if self._publish_interval is not None:
+                self._persist_locked()
 
     def update(
         self,
@@ -229,7 +328,7 @@ class SyncMonitor:
                 should_persist = True
             if last_market is not None:
                 state.last_market = last_market
-            if should_persist:
+            if should_persist or self._publish_due_locked():
                 self._persist_locked()
 
     def finish(
@@ -270,8 +369,19 @@ class SyncMonitor:
             elif state.started_at and state.finished_at:
                 state.last_duration = (state.finished_at - state.started_at).total_seconds()
             self._persist_locked()
+            listeners = list(self._finish_listeners)
+
+        self._notify_finished([(job, success)], listeners)
+
+    def finished_at(self, job: str) -> Optional[datetime]:
+        """Return when ``job`` last finished, or ``None`` if it has not run."""
+        self._refresh_from_disk()
+        with self._lock:
+            state = self._jobs.get(job)
+            return state.finished_at if state else None
 
     def snapshot(self) -> Dict[str, Dict[str, Optional[str]]]:
+        self._refresh_from_disk()
         with self._lock:
             result: Dict[str, Dict[str, Optional[str]]] = {}
             for name, state in self._jobs.items():
@@ -0,0 +1,126 @@
+"""
+Scheduler worker: owns the APScheduler cron jobs and executes every sync/insight job.
+
+Start the API with ``TREND_VIEW_JOB_WORKER=1`` and run ``python -m backend.src.worker``
+next to it. The API then only enqueues jobs (``job_queue`` table) and mirrors their
+progress from ``control_state.json``, so batch jobs no longer share the API's event
+loop and default thread pool with request handlers.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+from typing import Optional
+
+from fastapi import HTTPException
+
+from .api import jobs
+from .config.runtime_config import CONFIG_FILE, load_runtime_config
+from .config.settings import load_settings
+from .dao import JobQueueDAO
+from .state import monitor
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLL_INTERVAL_SECONDS = 1.0
+CONFIG_CHECK_INTERVAL_SECONDS = 5.0
+QUEUE_RETENTION_DAYS = 7
+
+
+async def process_next_job(queue: JobQueueDAO) -> bool:
+    """Claim and start one queued job; returns ``False`` when the queue is empty."""
+    record = await asyncio.to_thread(queue.claim_next)
+    if record is None:
+        return False
+    job = record["job"]
+    status, detail = "started", None
+    try:
+        await jobs.run_queued_job(job, record.get("payload"))
+    except HTTPException as exc:
+        status, detail = "rejected", str(exc.detail)
+        logger.info("Queued job %s rejected: %s", job, exc.detail)
+    except KeyError:
+        status, detail = "failed", "unknown job"
+        logger.warning("Queued job %s is not known to this worker", job)
+    except Exception as exc:  # noqa: BLE001
+        status, detail = "failed", str(exc)
+        logger.exception("Queued job %s failed to start", job)
+    await asyncio.to_thread(queue.mark_finished, record["id"], status=status, detail=detail)
+    return True
+
+
+async def _consume_queue(queue: JobQueueDAO, poll_interval: float) -> None:
+    while True:
+        try:
+            if await process_next_job(queue):
+                continue
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Job queue poll failed: %s", exc)
+            await asyncio.sleep(poll_interval * 5)
+            continue
+        await asyncio.sleep(poll_interval)
+
+
+def _config_mtime() -> Optional[int]:
+    try:
+        return CONFIG_FILE.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+async def _watch_runtime_config(interval: float) -> None:
+    """Re-register config-driven cron jobs after the API saves a new runtime config."""
+    last_seen = _config_mtime()
+    while True:
+        await asyncio.sleep(interval)
+        current = _config_mtime()
+        if current == last_seen:
+            continue
+        last_seen = current
+        try:
+            jobs.reschedule_jobs(load_runtime_config())
+            logger.info("Runtime config changed; cron jobs rescheduled")
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Failed to apply runtime config change: %s", exc)
+
+
+async def run_worker(poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS) -> None:
+    monitor.publish_live()
+    queue = JobQueueDAO(load_settings().postgres)
+    try:
+        removed = await asyncio.to_thread(queue.purge_finished, QUEUE_RETENTION_DAYS)
+        if removed:
+            logger.info("Purged %s handled job queue rows", removed)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Job queue cleanup failed: %s", exc)
+    await jobs.start_scheduler(quote_poller=False)
+    logger.info("Scheduler worker started (poll interval %.1fs)", poll_interval)
+    try:
+        await asyncio.gather(
+            _consume_queue(queue, poll_interval),
+            _watch_runtime_config(CONFIG_CHECK_INTERVAL_SECONDS),
+        )
+    finally:
+        jobs.stop_scheduler()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=DEFAULT_POLL_INTERVAL_SECONDS,
+        help="Seconds between job queue polls when the queue is empty.",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    try:
+        asyncio.run(run_worker(args.poll_interval))
+    except KeyboardInterrupt:
+        logger.info("Scheduler worker stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import asyncio
+import time
+
+import pytest
+
+from backend.src import state as state_module
+from backend.src.api import jobs
+from backend.src.api.schemas import SyncMacroInsightRequest
+
+
+@pytest.fixture
+def monitor(tmp_path, monkeypatch):
+    monkeypatch.setattr(state_module, "STATE_FILE", tmp_path / "control_state.json")
+    fresh = state_module.SyncMonitor()
+    monkeypatch.setattr(jobs, "monitor", fresh)
+    return fresh
+
+
+def _step(job, delay, *, source="akshare", after=(), fail=False, log=None):
+    async def runner(request):
+        if log is not None:
+            log.append(("start", job))
+        await asyncio.sleep(delay)
+        if log is not None:
+            log.append(("end", job))
+        if fail:
+            raise RuntimeError(f"{job} upstream error")
+
+    return jobs.AggregateStep(job, f"Syncing {job}", runner, SyncMacroInsightRequest(), source=source, after=after)
+
+
+def test_independent_steps_run_concurrently(monitor):
+    steps = [_step(f"step_{index}", 0.2) for index in range(4)]
+
+    started = time.perf_counter()
+    errors = asyncio.run(jobs._run_aggregate_steps("fund_flow_aggregate", steps))
+    elapsed = time.perf_counter() - started
+
+    assert errors == {f"step_{index}": None for index in range(4)}
+    assert elapsed < 0.5
+    assert monitor.snapshot()["fund_flow_aggregate"]["progress"] == 1.0
+
+
+def test_failures_are_isolated_and_dependents_skipped(monitor):
+    log = []
+    steps = [
+        _step("cpi_monthly", 0.01, fail=True, log=log),
+        _step("m2_monthly", 0.05, log=log),
+        _step("macro_insight", 0.01, source="llm", after=("cpi_monthly", "m2_monthly"), log=log),
+    ]
+
+    asyncio.run(jobs._run_aggregate_job("macro_aggregate", "macro", steps))
+
+    snapshot = monitor.snapshot()
+    assert ("end", "m2_monthly") in log
+    assert ("start", "macro_insight") not in log
+    assert snapshot["macro_aggregate"]["status"] == "failed"
+    assert snapshot["macro_aggregate"]["totalRows"] == 1
+    assert "cpi_monthly: cpi_monthly upstream error" in snapshot["macro_aggregate"]["error"]
+    assert snapshot["macro_insight"]["error"] == "skipped: cpi_monthly failed"
+
+
+def test_dependents_wait_and_sources_are_limited(monitor, monkeypatch):
+    monkeypatch.setitem(jobs.AGGREGATE_SOURCE_LIMITS, "tushare", 1)
+    log = []
+    steps = [
+        _step("lpr_rate", 0.05, source="tushare", log=log),
+        _step("shibor_rate", 0.05, source="tushare", log=log),
+        _step("macro_insight", 0.0, source="llm", after=("lpr_rate", "shibor_rate"), log=log),
+    ]
+
+    errors = asyncio.run(jobs._run_aggregate_steps("macro_aggregate", steps))
+
+    assert set(errors.values()) == {None}
+    assert log[:2] == [("start", "lpr_rate"), ("end", "lpr_rate")]
+    assert log[-2:] == [("start", "macro_insight"), ("end", "macro_insight")]
+
+
+def test_undeclared_dependency_is_rejected(monitor):
+    with pytest.raises(ValueError):
+        asyncio.run(jobs._run_aggregate_steps("macro_aggregate", [_step("macro_insight", 0.0, after=("cpi_monthly",))]))
@@ -0,0 +1,46 @@
+import importlib
+import subprocess
+import sys
+
+from test_http_cache import _Client
+
+import backend.src.app as app_module
+
+
+def test_importing_app_defers_routers_and_services():
+    script = (
+        "import sys, backend.src.app; "
+        "heavy = [m for m in sys.modules if m.startswith(('backend.src.api', 'backend.src.services', "
+        "'backend.src.dao', 'pandas', 'akshare', 'tushare'))]; "
+        "print(','.join(heavy))"
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == ""
+
+
+def test_every_router_path_maps_back_to_its_module():
+    for name in sorted(set(app_module.ROUTER_PREFIXES.values())):
+        module = importlib.import_module(f"backend.src.api.routers.{name}")
+        assert module.router.routes
+        for route in module.router.routes:
+            assert app_module.router_for_path(route.path) == name, route.path
+
+
+def test_health_is_served_without_loading_routers():
+    response = _Client(app_module.app).get("/health")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+
+def test_router_is_loaded_on_first_request_to_its_prefix():
+    client = _Client(app_module.app)
+
+    response = client.get("/fund-flow/not-a-route")
+
+    assert response.status_code == 404
+    assert "fund_flow" in app_module._loaded_routers
+    paths = {route.path for route in app_module.app.routes}
+    assert "/fund-flow/industry" in paths
+    assert client.get("/unknown-prefix").status_code == 404
@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+from psycopg2 import sql
+
+from backend.src.dao import async_pool
+from backend.src.dao.async_pool import render_query
+
+
+def test_render_query_numbers_placeholders_and_quotes_identifiers():
+    query = sql.SQL("SELECT {columns} FROM {table} WHERE code = %s AND trade_date >= %s LIMIT %s").format(
+        columns=sql.SQL(", ").join(sql.Identifier(name) for name in ("ts_code", "close")),
+        table=sql.Identifier("public", "daily_trade"),
+    )
+
+    assert render_query(query) == (
+        'SELECT "ts_code", "close" FROM "public"."daily_trade" '
+        "WHERE code = $1 AND trade_date >= $2 LIMIT $3"
+    )
+
+
+def test_render_query_unescapes_literal_percent_and_renders_placeholders():
+    query = sql.SQL("SELECT * FROM t WHERE name LIKE '%%bank%%' AND code = {code}").format(
+        code=sql.Placeholder()
+    )
+
+    assert render_query(query) == "SELECT * FROM t WHERE name LIKE '%bank%' AND code = $1"
+
+
+def test_render_query_escapes_quotes_in_identifiers():
+    assert render_query(sql.SQL("SELECT {col}").format(col=sql.Identifier('we"ird'))) == 'SELECT "we""ird"'
+
+
+def test_render_query_rejects_named_placeholders():
+    with pytest.raises(ValueError):
+        render_query(sql.SQL("SELECT {value}").format(value=sql.Placeholder("value")))
+
+
+def test_get_async_pool_requires_driver(monkeypatch):
+    monkeypatch.setattr(async_pool, "asyncpg", None)
+
+    assert async_pool.async_driver_available() is False
+    with pytest.raises(RuntimeError):
+        asyncio.run(async_pool.get_async_pool(object()))
+
+
+def test_fetch_snapshot_runs_queries_in_one_repeatable_read_transaction(monkeypatch):
+    events = []
+
+    class FakeTransaction:
+        def __init__(self, **options) -> None:
+            events.append(("begin", options))
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc_info):
+            events.append(("commit",))
+
+    class FakeConnection:
+        def transaction(self, **options):
+            return FakeTransaction(**options)
+
+        async def fetch(self, query, *params):
+            events.append(("fetch", query, params))
+            return [(len(events),)]
+
+    class FakeAcquire:
+        async def __aenter__(self):
+            events.append(("acquire",))
+            return FakeConnection()
+
+        async def __aexit__(self, *exc_info):
+            events.append(("release",))
+
+    class FakePool:
+        def acquire(self):
+            return FakeAcquire()
+
+    async def fake_get_async_pool(_config):
+        return FakePool()
+
+    monkeypatch.setattr(async_pool, "get_async_pool", fake_get_async_pool)
+
+    results = asyncio.run(
+        async_pool.fetch_snapshot(
+            object(),
+            [
+                (sql.SQL("SELECT COUNT(*) FROM t WHERE code = %s"), ["A"]),
+                (sql.SQL("SELECT * FROM t WHERE code = %s LIMIT %s"), ["A", 10]),
+            ],
+        )
+    )
+
+    assert events == [
+        ("acquire",),
+        ("begin", {"isolation": "repeatable_read", "readonly": True}),
+        ("fetch", "SELECT COUNT(*) FROM t WHERE code = $1", ("A",)),
+        ("fetch", "SELECT * FROM t WHERE code = $1 LIMIT $2", ("A", 10)),
+        ("commit",),
+        ("release",),
+    ]
+    assert results == [[(3,)], [(4,)]]
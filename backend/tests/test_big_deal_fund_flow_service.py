@@ -1,9 +1,43 @@
+import math
+import time
 import unittest
+from datetime import date, timedelta
+from types import SimpleNamespace
+from unittest import mock
 
 import pandas as pd
 
+from backend.src.services._akshare_utils import (
+    normalize_symbol_series,
+    parse_amount_series,
+    parse_numeric_series,
+    parse_percent_series,
+)
+from backend.src.dao.big_deal_fund_flow_dao import (
+    BigDealFundFlowDAO,
+    partition_day,
+    partition_name,
+    retention_cutoff,
+)
+from backend.src.services import big_deal_fund_flow_service as service
 from backend.src.services.big_deal_fund_flow_service import _prepare_frame, _normalize_query_codes
 
+# Raw AkShare values and what the former row-by-row parsers returned for them.
+PARITY_VALUES = [
+    " 5.67 ", "1,234.5", 3, 2.5, None, "--", "-", "", "111.98万",
+    "-571.77万", "1.48亿", "2.5亿元", "人民币3亿", "0.53%", "-1.2%", "abc", "12万股",
+]
+EXPECTED_NUMERIC = [5.67, 1234.5, 3.0, 2.5] + [None] * 13
+EXPECTED_PERCENT = [5.67, 1234.5, 3.0, 2.5] + [None] * 9 + [0.53, -1.2, None, None]
+EXPECTED_AMOUNT = [
+    5.67, 1234.5, 3.0, 2.5, None, None, None, None, 1119800.0,
+    -5717700.0, 148000000.0, 250000000.0, 300000000.0, 0.53, -1.2, None, 120000.0,
+]
+
+
+def _as_optional(values):
+    return [None if isinstance(value, float) and math.isnan(value) else value for value in values]
+
 
 class BigDealFundFlowServiceTests(unittest.TestCase):
     def test_prepare_frame_parses_numeric_fields(self) -> None:
@@ -80,6 +114,70 @@ class BigDealFundFlowServiceTests(unittest.TestCase):
         self.assertEqual(prepared.iloc[0]["trade_amount"], round(111.98 * 1e4, 2))
         self.assertEqual(prepared.iloc[0]["trade_volume"], 100000)
 
+    def test_series_parsers_match_former_scalar_parsers(self) -> None:
+        raw = pd.Series(PARITY_VALUES, dtype=object)
+
+        self.assertEqual(_as_optional(parse_numeric_series(raw).tolist()), EXPECTED_NUMERIC)
+        self.assertEqual(_as_optional(parse_percent_series(raw).tolist()), EXPECTED_PERCENT)
+        self.assertEqual(_as_optional(parse_amount_series(raw).tolist()), EXPECTED_AMOUNT)
+
+    def test_normalize_symbol_series(self) -> None:
+        raw = pd.Series(["601668", " 1668", "000063.sz", None, "", "abc.x", 1668], dtype=object)
+
+        self.assertEqual(
+            normalize_symbol_series(raw).tolist(),
+            ["601668", "001668", "000063", pd.NA, pd.NA, "ABC", "001668"],
+        )
+
+    def test_prepare_frame_dedupes_on_native_keys_and_keeps_last(self) -> None:
+        base = {
+            "trade_time": "2024-08-19 14:56:02",
+            "stock_code": "000063",
+            "stock_name": "中兴通讯",
+            "trade_price": "30.10",
+            "trade_volume": "4000",
+            "trade_amount": "12.04万",
+            "trade_side": "卖盘",
+            "price_change_percent": "-0.5%",
+            "price_change": "-0.15",
+        }
+        raw = pd.DataFrame(
+            [
+                base,
+                {**base, "trade_amount": "120400", "stock_name": "ZTE"},
+                {**base, "trade_side": "买盘"},
+                {**base, "trade_volume": "--"},
+            ]
+        )
+
+        prepared = _prepare_frame(raw)
+
+        self.assertEqual(len(prepared), 2)
+        self.assertEqual(prepared["stock_name"].tolist(), ["ZTE", "中兴通讯"])
+        self.assertEqual(prepared["trade_side"].tolist(), ["卖盘", "买盘"])
+        self.assertEqual(prepared["trade_amount"].tolist(), [120400.0, 120400.0])
+
+    def test_prepare_frame_handles_large_dumps(self) -> None:
+        rows = 100_000
+        raw = pd.DataFrame(
+            {
+                "trade_time": pd.date_range("2024-08-19 09:30:00", periods=rows, freq="s").strftime("%Y-%m-%d %H:%M:%S"),
+                "stock_code": [f"{index % 5000:06d}" for index in range(rows)],
+                "trade_price": "5.67",
+                "trade_volume": "100000",
+                "trade_amount": "111.98万",
+                "trade_side": "买盘",
+                "price_change_percent": "0.53%",
+                "price_change": "0.03",
+            }
+        )
+
+        started = time.perf_counter()
+        prepared = _prepare_frame(raw)
+
+        self.assertEqual(len(prepared), rows)
+        self.assertLess(time.perf_counter() - started, 3.0)
+
     def test_normalize_query_codes(self) -> None:
         result = _normalize_query_codes("000063.SZ")
         self.assertIn("000063", result)
@@ -87,5 +185,110 @@ class BigDealFundFlowServiceTests(unittest.TestCase):
         self.assertNotIn("", result)
 
 
+class _FakeConnection:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def commit(self) -> None:
+        pass
+
+
+class _FakeBigDealDAO:
+    def __init__(self) -> None:
+        self.upserted = None
+        self.retention_days = None
+
+    def connect(self):
+        return _FakeConnection()
+
+    def ensure_table(self, conn) -> None:
+        pass
+
+    def upsert(self, frame, *, conn=None) -> int:
+        self.upserted = frame
+        return len(frame)
+
+    def purge_expired(self, retention_days, *, conn=None):
+        self.retention_days = retention_days
+        return {"droppedPartitions": 2, "deletedRows": 0, "rolledUp": 3}
+
+
+class BigDealRetentionTests(unittest.TestCase):
+    def test_partition_names_round_trip(self) -> None:
+        name = partition_name("big_deal_fund_flow", date(2024, 8, 19))
+        self.assertEqual(name, "big_deal_fund_flow_p20240819")
+        self.assertEqual(partition_day("big_deal_fund_flow", name), date(2024, 8, 19))
+        self.assertIsNone(partition_day("big_deal_fund_flow", "big_deal_fund_flow_default"))
+        self.assertIsNone(partition_day("big_deal_fund_flow", "big_deal_fund_flow_daily"))
+
+    def test_retention_cutoff_keeps_today(self) -> None:
+        self.assertEqual(retention_cutoff(1, today=date(2024, 8, 19)), date(2024, 8, 19))
+        self.assertEqual(retention_cutoff(30, today=date(2024, 8, 19)), date(2024, 7, 21))
+        self.assertEqual(retention_cutoff(0, today=date(2024, 8, 19)), date(2024, 8, 19))
+
+    def test_sync_skips_expired_trades_and_purges(self) -> None:
+        today = date.today()
+        raw = pd.DataFrame(
+            [
+                {
+                    "trade_time": f"{day:%Y-%m-%d} 10:00:00",
+                    "stock_code": "601668",
+                    "stock_name": "中国建筑",
+                    "trade_price": "5.67",
+                    "trade_volume": "100000",
+                    "trade_amount": "111.98万",
+                    "trade_side": "买盘",
+                    "price_change_percent": "0.53%",
+                    "price_change": "0.03",
+                }
+                for day in (today, date(2000, 1, 3))
+            ]
+        )
+        dao = _FakeBigDealDAO()
+        with mock.patch.object(service, "load_settings", return_value=mock.Mock()), mock.patch.object(
+            service, "BigDealFundFlowDAO", return_value=dao
+        ), mock.patch.object(service, "fetch_big_deal_fund_flow", return_value=raw):
+            result = service.sync_big_deal_fund_flow(retention_days=5)
+
+        self.assertEqual(result["rows"], 1)
+        self.assertEqual(result["droppedPartitions"], 2)
+        self.assertEqual(dao.retention_days, 5)
+        self.assertEqual(dao.upserted["trade_time"].dt.date.tolist(), [today])
+
+    def test_purge_rolls_up_expiring_days_before_dropping_them(self) -> None:
+        events = []
+        cutoff = retention_cutoff(5)
+        expired = cutoff - timedelta(days=1)
+        dao = BigDealFundFlowDAO(SimpleNamespace(schema="public"))
+
+        cursor = mock.MagicMock(rowcount=0)
+        cursor.execute.side_effect = lambda statement, *args: events.append(("execute", repr(statement)))
+        conn = mock.MagicMock()
+        conn.cursor.return_value.__enter__.return_value = cursor
+
+        def fake_stored_days(_conn, *, since=None, until=None):
+            events.append(("days", until))
+            return {expired: ["601668"]}
+
+        def fake_refresh(_conn, touched):
+            events.append(("rollup", dict(touched)))
+            return 1
+
+        partitions = [partition_name(dao._table_name, day) for day in (expired, cutoff)]
+        with mock.patch.object(dao, "ensure_table"), mock.patch.object(
+            dao, "_is_partitioned", return_value=True
+        ), mock.patch.object(dao, "_list_partitions", return_value=partitions), mock.patch.object(
+            dao, "_stored_trade_days", side_effect=fake_stored_days
+        ), mock.patch.object(dao, "refresh_rollup", side_effect=fake_refresh):
+            result = dao.purge_expired(5, conn=conn)
+
+        self.assertEqual(result, {"droppedPartitions": 1, "deletedRows": 0, "rolledUp": 1})
+        self.assertEqual(events[:2], [("days", cutoff), ("rollup", {expired: ["601668"]})])
+        self.assertIn("DROP TABLE", events[2][1])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,173 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from backend.src.config.runtime_config import RuntimeConfig
+from backend.src.services import concept_constituent_service as service
+from backend.src.services.sector_name_service import SectorNameIndex
+
+
+NOW = datetime.now(timezone.utc)
+_resolve_concept_code = service._resolve_concept_code
+
+
+class DummySettings:
+    postgres = object()
+
+
+class FakeConstituentDAO:
+    updated = {
+        "人工智能": NOW - timedelta(hours=1),
+        "光伏概念": NOW - timedelta(hours=30),
+    }
+
+    def __init__(self, _config) -> None:
+        pass
+
+    def list_entries(self, concept_name):
+        updated_at = self.updated.get(concept_name)
+        if updated_at is None:
+            return []
+        return [{"concept": concept_name, "symbol": "600000", "name": "浦发银行", "updatedAt": updated_at}]
+
+    def fetch_updated_at(self, concept_names=None):
+        return {name: value for name, value in self.updated.items() if name in concept_names}
+
+
+class FakeWatchlistDAO:
+    def __init__(self, _config) -> None:
+        pass
+
+    def list_entries(self):
+        return [
+            {"concept_name": "人工智能", "is_watched": True},
+            {"concept_name": "光伏概念", "is_watched": True},
+            {"concept_name": "白酒概念", "is_watched": True},
+            {"concept_name": "芯片概念", "is_watched": False},
+        ]
+
+
+@pytest.fixture(autouse=True)
+def patch_dependencies(monkeypatch):
+    monkeypatch.setattr(service, "load_settings", lambda _path=None: DummySettings())
+    monkeypatch.setattr(service, "load_runtime_config", lambda: RuntimeConfig(concept_constituent_ttl_hours=24))
+    monkeypatch.setattr(service, "ConceptConstituentDAO", FakeConstituentDAO)
+    monkeypatch.setattr(service, "ConceptWatchlistDAO", FakeWatchlistDAO)
+    monkeypatch.setattr(service, "_resolve_concept_code", lambda concept, settings_path=None: (concept, "300000"))
+    monkeypatch.setattr(service, "refresh_concept_membership_index", lambda settings_path=None: None)
+
+
+def test_list_serves_stored_rows_and_queues_stale_refresh(monkeypatch):
+    scheduled = []
+    monkeypatch.setattr(
+        service,
+        "schedule_concept_constituent_refresh",
+        lambda name, max_pages=None, settings_path=None: scheduled.append(name) or True,
+    )
+    monkeypatch.setattr(
+        service,
+        "refresh_concept_constituents",
+        lambda *args, **kwargs: pytest.fail("user requests must not scrape THS"),
+    )
+
+    fresh = service.list_concept_constituents("人工智能")
+    stale = service.list_concept_constituents("光伏概念")
+    missing = service.list_concept_constituents("白酒概念")
+    forced = service.list_concept_constituents("人工智能", refresh=True)
+
+    assert (fresh["stale"], len(fresh["items"])) == (False, 1)
+    assert (stale["stale"], missing["stale"], forced["stale"]) == (True, True, False)
+    assert missing["items"] == []
+    assert scheduled == ["光伏概念", "白酒概念", "人工智能"]
+
+
+def test_sync_refreshes_only_watched_concepts_past_ttl(monkeypatch):
+    refreshed = []
+
+    def fake_refresh(name, max_pages=None, settings_path=None):
+        refreshed.append(name)
+        if name == "白酒概念":
+            raise RuntimeError("blocked")
+        return {"items": [{"symbol": "600000"}, {"symbol": "000001"}]}
+
+    monkeypatch.setattr(service, "refresh_concept_constituents", fake_refresh)
+    index_refreshes = []
+    monkeypatch.setattr(
+        service,
+        "refresh_concept_membership_index",
+        lambda settings_path=None: index_refreshes.append(settings_path),
+    )
+    progress = []
+
+    result = service.sync_concept_constituents(progress_callback=lambda *args: progress.append(args))
+
+    assert refreshed == ["光伏概念", "白酒概念"]
+    assert result["concepts"] == 3
+    assert (result["refreshed"], result["skipped"], result["rows"]) == (1, 1, 2)
+    assert result["errors"] == [{"concept": "白酒概念", "error": "blocked"}]
+    assert [entry[0] for entry in progress] == [0.5, 1.0]
+    assert index_refreshes == [None]
+
+    refreshed.clear()
+    service.sync_concept_constituents(["人工智能"], force=True)
+    assert refreshed == ["人工智能"]
+
+
+def test_background_refresh_is_deduplicated(monkeypatch):
+    class RecordingExecutor:
+        def __init__(self) -> None:
+            self.calls = []
+
+        def submit(self, fn, *args):
+            self.calls.append(args)
+
+    executor = RecordingExecutor()
+    monkeypatch.setattr(service, "_REFRESH_EXECUTOR", executor)
+    monkeypatch.setattr(service, "_PENDING_REFRESHES", set())
+
+    assert service.schedule_concept_constituent_refresh("光伏概念") is True
+    assert service.schedule_concept_constituent_refresh("光伏概念") is False
+    assert len(executor.calls) == 1
+
+    index_refreshes = []
+    monkeypatch.setattr(service, "refresh_concept_constituents", lambda *args, **kwargs: {})
+    monkeypatch.setattr(
+        service,
+        "refresh_concept_membership_index",
+        lambda settings_path=None: index_refreshes.append(settings_path),
+    )
+    service._run_background_refresh("光伏概念", None, None)
+    assert service._PENDING_REFRESHES == set()
+    assert index_refreshes == [None]
+
+
+def test_page_throttle_backs_off_and_recovers():
+    throttle = service._PageThrottle(min_delay=0.5, max_delay=4.0)
+
+    for _ in range(4):
+        throttle.blocked()
+    assert throttle.delay == 4.0
+
+    throttle.success()
+    assert throttle.delay == pytest.approx(3.2)
+    for _ in range(20):
+        throttle.success()
+    assert throttle.delay == 0.5
+
+
+def test_is_stale_handles_missing_and_naive_timestamps():
+    now = datetime(2025, 1, 2, 12, tzinfo=timezone.utc)
+
+    assert service._is_stale(None, 24, now=now) is True
+    assert service._is_stale(datetime(2025, 1, 2, 0), 24, now=now) is False
+    assert service._is_stale(datetime(2025, 1, 1, 12, tzinfo=timezone.utc), 24, now=now) is True
+
+
+def test_concept_names_must_match_the_directory(monkeypatch):
+    lookup = {"人工智能": "300001", "中国银行概念": "300002"}
+    monkeypatch.setattr(service, "_load_concept_codes", lambda settings_path=None: lookup)
+    monkeypatch.setattr(service, "get_sector_name_index", lambda kind: SectorNameIndex(lookup))
+
+    assert _resolve_concept_code(" 中国银行 ") == ("中国银行概念", "300002")
+    with pytest.raises(service.ConceptNotFoundError):
+        _resolve_concept_code("中国石油")
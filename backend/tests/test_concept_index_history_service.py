@@ -9,8 +9,9 @@ import pytest
 
 sys.modules.setdefault("akshare", types.ModuleType("akshare"))
 
-import backend.src.app as app_module
+import backend.src.api.routers.market as market_router
 from backend.src.services import concept_index_history_service as service
+from backend.src.services import sector_name_service
 
 
 class DummySettings:
@@ -34,13 +35,16 @@ def test_sync_concept_index_history(monkeypatch):
             recorded_frames.append(frame.copy())
             return len(frame)
 
+        def delete_other_sources(self, concept_names, *, keep_prefix):
+            assert keep_prefix == "THS-"
+            return 0
+
     monkeypatch.setattr(service, "ConceptIndexHistoryDAO", RecordingDAO)
 
     def fake_concept_name_list():
         return pd.DataFrame({"name": ["AI算力"]})
 
-    service._CONCEPT_NAME_LOOKUP = None
-    service._NORMALIZED_CONCEPT_MAP = None
+    monkeypatch.setattr(sector_name_service, "_INDEXES", {})
 
     def fake_ths_fetch(symbol, start_date, end_date):
         assert symbol == "AI算力"
@@ -81,6 +85,35 @@ def test_sync_concept_index_history(monkeypatch):
     assert stored.iloc[0]["trade_date"].isoformat() == "2025-01-02"
 
 
+def test_local_concept_history_uses_requested_start_and_reports_computed_range(monkeypatch):
+    calls = []
+
+    def fake_sync_sector_indices(**kwargs):
+        calls.append(kwargs)
+        start = kwargs["start_date"] or date(2025, 3, 1)
+        return {
+            "startDate": start.isoformat(),
+            "endDate": "2025-03-31",
+            "rows": 5,
+            "sectorRows": {"concept": {"AI算力": 5}},
+        }
+
+    monkeypatch.setattr(
+        service, "load_runtime_config", lambda: types.SimpleNamespace(sector_index_source="cap_weighted")
+    )
+    monkeypatch.setattr(service, "sync_sector_indices", fake_sync_sector_indices)
+
+    result = service.sync_concept_index_history(["AI算力"], start_date="20250101", end_date="20250131")
+
+    assert calls[0]["start_date"] == date(2025, 1, 1)
+    assert calls[0]["sector_names"] == ["AI算力"]
+    assert (result["startDate"], result["endDate"]) == ("20250101", "20250331")
+    assert result["concepts"][0]["source"] == "cap_weighted"
+
+    service.sync_concept_index_history(["AI算力"])
+    assert calls[1]["start_date"] is None
+
+
 def test_concept_index_history_endpoint(monkeypatch):
     sample_rows = [
         {
@@ -104,9 +137,9 @@ def test_concept_index_history_endpoint(monkeypatch):
         assert kwargs["limit"] == 30
         return {"total": len(sample_rows), "items": sample_rows}
 
-    monkeypatch.setattr(app_module, "list_concept_index_history", fake_list_concept_index_history)
+    monkeypatch.setattr(market_router, "list_concept_index_history", fake_list_concept_index_history)
 
-    response = app_module.get_concept_index_history_api(concept="AI算力", limit=30)
+    response = market_router.get_concept_index_history_api(concept="AI算力", limit=30)
 
     assert response.concept == "AI算力"
     assert response.total == 1
@@ -148,10 +181,10 @@ def test_concept_index_history_endpoint_auto_refresh(monkeypatch):
         captured_sync["end_date"] = end_date
         return {"totalRows": len(sample_rows), "concepts": [{"concept": concepts[0], "rows": len(sample_rows)}]}
 
-    monkeypatch.setattr(app_module, "list_concept_index_history", fake_list_concept_index_history)
-    monkeypatch.setattr(app_module, "sync_concept_index_history", fake_sync_concept_index_history)
+    monkeypatch.setattr(market_router, "list_concept_index_history", fake_list_concept_index_history)
+    monkeypatch.setattr(market_router, "sync_concept_index_history", fake_sync_concept_index_history)
 
-    response = app_module.get_concept_index_history_api(concept="AI算力", limit=60)
+    response = market_router.get_concept_index_history_api(concept="AI算力", limit=60)
 
     assert list_calls["count"] >= 2
     assert captured_sync["concepts"] == ["AI算力"]
@@ -165,8 +198,7 @@ def test_resolve_concept_symbol_alias(monkeypatch):
     def fake_concept_name_list():
         return pd.DataFrame({"name": ["东数西算(算力)", "光伏概念"]})
 
-    service._CONCEPT_NAME_LOOKUP = None
-    service._NORMALIZED_CONCEPT_MAP = None
+    monkeypatch.setattr(sector_name_service, "_INDEXES", {})
     ak_stub = types.SimpleNamespace(stock_board_concept_name_ths=fake_concept_name_list)
     monkeypatch.setattr(service, "ak", ak_stub)
 
@@ -0,0 +1,82 @@
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from backend.src.services import concept_membership_service as service
+from backend.src.services.concept_membership_service import ConceptMembershipIndex, normalize_symbol
+
+
+MEMBERSHIPS = {
+    "人工智能": ["600000", "000001", "300750"],
+    "芯片概念": ["000001", "300750", "688981"],
+    "白酒": ["600519"],
+    "空概念": [],
+}
+
+
+class ConceptMembershipIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.index = ConceptMembershipIndex(MEMBERSHIPS)
+
+    def test_any_and_all_modes(self) -> None:
+        self.assertEqual(
+            self.index.symbols_for(["人工智能", "芯片概念"]),
+            {"600000", "000001", "300750", "688981"},
+        )
+        self.assertEqual(self.index.symbols_for(["人工智能", "芯片概念"], mode="all"), {"000001", "300750"})
+        self.assertEqual(self.index.symbols_for(["人工智能", "白酒"], mode="all"), set())
+
+    def test_unknown_concepts(self) -> None:
+        self.assertEqual(self.index.symbols_for(["白酒", "不存在"]), {"600519"})
+        self.assertEqual(self.index.symbols_for(["白酒", "不存在"], mode="all"), set())
+        self.assertEqual(self.index.symbols_for(["空概念"]), set())
+        self.assertEqual(self.index.symbols_for([" "]), set())
+
+    def test_concept_tags_accept_any_code_format(self) -> None:
+        self.assertEqual(self.index.concepts_for("300750.SZ"), ("人工智能", "芯片概念"))
+        self.assertEqual(self.index.concepts_for("SH600519"), ("白酒",))
+        self.assertEqual(self.index.concepts_for("830799.BJ"), ())
+        self.assertEqual(len(self.index), 4)
+
+    def test_normalize_symbol(self) -> None:
+        self.assertEqual(normalize_symbol(" 600000.sh "), "600000")
+        self.assertEqual(normalize_symbol("SZ000001"), "000001")
+        self.assertIsNone(normalize_symbol(None))
+        self.assertIsNone(normalize_symbol(""))
+
+
+
+class ConceptMembershipIndexCacheTests(unittest.TestCase):
+    def test_cold_start_builds_the_index_once(self) -> None:
+        scans = []
+
+        class FakeConstituentDAO:
+            def __init__(self, _config) -> None:
+                pass
+
+            def list_memberships(self):
+                scans.append(1)
+                time.sleep(0.05)
+                return MEMBERSHIPS
+
+        results = []
+        with mock.patch.object(service, "_INDEX", None), mock.patch.object(
+            service, "load_settings", return_value=SimpleNamespace(postgres=None)
+        ), mock.patch.object(service, "ConceptConstituentDAO", FakeConstituentDAO):
+            threads = [
+                threading.Thread(target=lambda: results.append(service.get_concept_membership_index()))
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(scans), 1)
+        self.assertTrue(all(index is results[0] for index in results))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import List, Optional
+
+import numpy as np
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, Field
+
+from backend.src.fast_json import dumps, fast_json_response
+
+
+class _Item(BaseModel):
+    stock_code: str = Field(..., alias="stockCode")
+    trade_time: Optional[datetime] = Field(None, alias="tradeTime")
+    amount: Optional[float] = None
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class _Payload(BaseModel):
+    total: int
+    as_of: Optional[date] = Field(None, alias="asOf")
+    items: List[_Item]
+
+
+def _sample() -> _Payload:
+    return _Payload(
+        total=2,
+        asOf=date(2025, 4, 28),
+        items=[
+            _Item(stock_code="600000.SH", trade_time=datetime(2025, 4, 28, 9, 30, 15, 120000), amount=1.5),
+            _Item(stock_code="000001.SZ"),
+        ],
+    )
+
+
+def test_orjson_output_matches_fastapi_encoder():
+    payload = _sample()
+    assert json.loads(dumps(payload)) == jsonable_encoder(payload, by_alias=True)
+
+
+def test_fallback_types_are_serialized():
+    content = {"amount": Decimal("1.25"), "value": np.float64(2.5), "codes": ("a", "b"), 1: "x"}
+    assert json.loads(dumps(content)) == {"amount": 1.25, "value": 2.5, "codes": ["a", "b"], "1": "x"}
+
+
+def test_fast_json_response_renders_model():
+    response = fast_json_response(_sample())
+    assert response.media_type == "application/json"
+    assert json.loads(response.body)["items"][0]["stockCode"] == "600000.SH"
@@ -0,0 +1,85 @@
+import unittest
+from datetime import date
+
+import pandas as pd
+
+from backend.src.services.fundamental_metrics_service import _changed_rows, _compute_metrics_frame
+
+
+def _income_frame() -> pd.DataFrame:
+    rows = [
+        ("000001.SZ", "2024-03-31", 100.0, 10.0),
+        ("000001.SZ", "2024-06-30", 200.0, 20.0),
+        ("000001.SZ", "2024-09-30", 300.0, 30.0),
+        ("000001.SZ", "2024-12-31", 400.0, 40.0),
+        ("000001.SZ", "2025-03-31", 150.0, 12.0),
+        ("000001.SZ", "2025-06-30", 240.0, 30.0),
+        ("000002.SZ", "2024-12-31", 50.0, 0.0),
+        ("000002.SZ", "2025-06-30", 80.0, 4.0),
+    ]
+    frame = pd.DataFrame(rows, columns=["ts_code", "end_date", "revenue", "n_income"])
+    frame["end_date"] = pd.to_datetime(frame["end_date"])
+    frame["ann_date"] = frame["end_date"] + pd.Timedelta(days=30)
+    return frame
+
+
+def _financial_frame() -> pd.DataFrame:
+    rows = [
+        ("000001.SZ", "2024-06-30", 4.0),
+        ("000001.SZ", "2025-03-31", 2.0),
+        ("000001.SZ", "2025-06-30", 5.0),
+    ]
+    frame = pd.DataFrame(rows, columns=["ts_code", "end_date", "roe"])
+    frame["end_date"] = pd.to_datetime(frame["end_date"])
+    frame["ann_date"] = frame["end_date"] + pd.Timedelta(days=30)
+    return frame
+
+
+class FundamentalMetricsComputationTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.metrics = _compute_metrics_frame(_income_frame(), _financial_frame()).set_index("ts_code")
+
+    def test_growth_uses_same_quarter_last_year_and_prior_quarter(self) -> None:
+        row = self.metrics.loc["000001.SZ"]
+        self.assertEqual(row["net_income_end_date_latest"], date(2025, 6, 30))
+        self.assertEqual(row["net_income_end_date_prev1"], date(2025, 3, 31))
+        self.assertEqual(row["net_income_end_date_prev2"], date(2024, 12, 31))
+        self.assertAlmostEqual(row["net_income_yoy_latest"], 0.5)
+        self.assertAlmostEqual(row["net_income_yoy_prev1"], 0.2)
+        self.assertIsNone(row["net_income_yoy_prev2"])
+        self.assertAlmostEqual(row["net_income_qoq_latest"], 1.5)
+        self.assertAlmostEqual(row["revenue_yoy_latest"], 0.2)
+        self.assertAlmostEqual(row["revenue_qoq_latest"], 0.6)
+
+    def test_roe_growth_comes_from_latest_indicator(self) -> None:
+        row = self.metrics.loc["000001.SZ"]
+        self.assertEqual(row["roe_end_date_latest"], date(2025, 6, 30))
+        self.assertAlmostEqual(row["roe_yoy_latest"], 0.25)
+        self.assertAlmostEqual(row["roe_qoq_latest"], 1.5)
+
+    def test_missing_quarter_and_zero_base_yield_none(self) -> None:
+        row = self.metrics.loc["000002.SZ"]
+        self.assertIsNone(row["net_income_qoq_latest"])
+        self.assertIsNone(row["net_income_yoy_latest"])
+        self.assertIsNone(row["roe_end_date_latest"])
+        self.assertIsNone(row["roe_yoy_latest"])
+
+
+class ChangedRowsTests(unittest.TestCase):
+    def test_only_new_or_changed_codes_are_returned(self) -> None:
+        computed = _compute_metrics_frame(_income_frame(), _financial_frame())
+        stored = computed.copy()
+        stored = stored[stored["ts_code"] == "000001.SZ"].reset_index(drop=True)
+        self.assertEqual(_changed_rows(computed, stored)["ts_code"].tolist(), ["000002.SZ"])
+
+        stored.loc[0, "revenue_yoy_latest"] = 0.2 + 1e-12
+        self.assertEqual(_changed_rows(computed, stored)["ts_code"].tolist(), ["000002.SZ"])
+
+        stored.loc[0, "revenue_yoy_latest"] = 0.25
+        changed = _changed_rows(computed, stored).set_index("ts_code")
+        self.assertEqual(sorted(changed.index), ["000001.SZ", "000002.SZ"])
+        self.assertAlmostEqual(changed.loc["000001.SZ", "revenue_yoy_latest"], 0.2)
+
+
+if __name__ == "__main__":
+    unittest.main()
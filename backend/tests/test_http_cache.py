@@ -0,0 +1,129 @@
+import asyncio
+import json
+
+from fastapi import FastAPI
+
+from backend.src.http_cache import CACHED_ENDPOINT_JOBS, ResponseCache
+from backend.src.state import SyncMonitor
+
+
+class _Response:
+    def __init__(self, status_code, headers, content):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class _Client:
+    """Minimal ASGI driver (the starlette TestClient needs httpx)."""
+
+    def __init__(self, app):
+        self.app = app
+
+    def request(self, method, path, headers=None):
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": b"",
+            "root_path": "",
+            "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+            "client": ("test", 1),
+            "server": ("test", 80),
+        }
+        messages = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            messages.append(message)
+
+        asyncio.run(self.app(scope, receive, send))
+        start = next(m for m in messages if m["type"] == "http.response.start")
+        body = b"".join(m.get("body", b"") for m in messages if m["type"] == "http.response.body")
+        response_headers = {k.decode().lower(): v.decode() for k, v in start["headers"]}
+        return _Response(start["status"], response_headers, body)
+
+    def get(self, path, headers=None):
+        return self.request("GET", path, headers)
+
+    def post(self, path, headers=None):
+        return self.request("POST", path, headers)
+
+
+def _build_app():
+    sync_monitor = SyncMonitor()
+    cache = ResponseCache({"/macro/cpi": ("cpi_monthly",)}, sync_monitor=sync_monitor)
+    app = FastAPI()
+    app.middleware("http")(cache.handle)
+    calls = {"count": 0}
+
+    @app.get("/macro/cpi")
+    def cpi():
+        calls["count"] += 1
+        return {"calls": calls["count"]}
+
+    @app.post("/macro/cpi")
+    def update_cpi():
+        return {"ok": True}
+
+    @app.get("/health")
+    def health():
+        calls["count"] += 1
+        return {"status": "ok"}
+
+    return _Client(app), sync_monitor, calls
+
+
+def test_cached_body_and_conditional_request():
+    client, _, calls = _build_app()
+
+    first = client.get("/macro/cpi")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert "max-age" in first.headers["cache-control"]
+
+    second = client.get("/macro/cpi")
+    assert second.json() == first.json()
+    assert calls["count"] == 1
+
+    not_modified = client.get("/macro/cpi", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert calls["count"] == 1
+
+
+def test_job_completion_and_writes_invalidate():
+    client, sync_monitor, calls = _build_app()
+    etag = client.get("/macro/cpi").headers["etag"]
+
+    sync_monitor.start("cpi_monthly")
+    sync_monitor.finish("cpi_monthly", success=True)
+    refreshed = client.get("/macro/cpi", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.json() == {"calls": 2}
+    assert "last-modified" in refreshed.headers
+
+    client.post("/macro/cpi")
+    assert client.get("/macro/cpi").json() == {"calls": 3}
+
+
+def test_uncached_paths_pass_through():
+    client, _, calls = _build_app()
+    client.get("/health")
+    response = client.get("/health")
+    assert "etag" not in response.headers
+    assert calls["count"] == 2
+
+
+def test_screenings_follow_intraday_refresh():
+    for path in ("/indicator-screenings", "/indicator-screenings/continuous-volume"):
+        assert "realtime_trade" in CACHED_ENDPOINT_JOBS[path]
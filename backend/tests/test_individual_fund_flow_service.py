@@ -39,6 +39,24 @@ class IndividualFundFlowServiceTests(unittest.TestCase):
         self.assertAlmostEqual(prepared.loc[0, "inflow"], 6.49e8)
         self.assertAlmostEqual(prepared.loc[0, "net_inflow"], -571.77e4)
 
+    def test_prepare_frame_pads_codes_and_keeps_first_duplicate(self) -> None:
+        raw = pd.DataFrame(
+            [
+                {"rank": "1", "stock_code": "63", "stock_name": "中兴通讯", "latest_price": "--", "inflow": "1.5亿"},
+                {"rank": "2", "stock_code": " 000063 ", "stock_name": "重复", "latest_price": "30.1", "inflow": "2亿"},
+                {"rank": "3", "stock_code": "", "stock_name": "空", "latest_price": "1", "inflow": "1"},
+                {"rank": "4", "stock_code": None, "stock_name": "无", "latest_price": "1", "inflow": "1"},
+            ]
+        )
+
+        prepared = _prepare_frame(raw, "3日排行")
+
+        self.assertEqual(prepared["stock_code"].tolist(), ["000063"])
+        self.assertEqual(prepared.iloc[0]["stock_name"], "中兴通讯")
+        self.assertTrue(pd.isna(prepared.iloc[0]["latest_price"]))
+        self.assertAlmostEqual(prepared.iloc[0]["inflow"], 1.5e8)
+        self.assertTrue(pd.isna(prepared.iloc[0]["turnover_rate"]))
+
     def test_normalize_for_query(self) -> None:
         normalized = _normalize_for_query("000063.SZ")
         self.assertIn("000063", normalized)
@@ -0,0 +1,141 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from backend.src import state as state_module
+from backend.src import worker
+from backend.src.api import jobs
+from backend.src.api.routers import control
+from backend.src.api.schemas import SyncDailyTradeRequest
+
+
+class _FakeQueue:
+    def __init__(self):
+        self.rows = []
+        self.finished = {}
+
+    def enqueue(self, job, payload=None):
+        if any(row["job"] == job and row["status"] == "queued" for row in self.rows):
+            return None
+        self.rows.append({"id": len(self.rows) + 1, "job": job, "payload": payload or {}, "status": "queued"})
+        return len(self.rows)
+
+    def claim_next(self):
+        for row in self.rows:
+            if row["status"] == "queued":
+                row["status"] = "claimed"
+                return dict(row)
+        return None
+
+    def mark_finished(self, job_id, *, status, detail=None):
+        self.finished[job_id] = (status, detail)
+
+
+@pytest.fixture
+def queue(monkeypatch):
+    fake = _FakeQueue()
+    monkeypatch.setattr(jobs, "_job_queue", fake)
+    monkeypatch.setattr(jobs, "_job_running", lambda job: False)
+    return fake
+
+
+def test_every_start_job_is_queueable():
+    assert len(jobs.QUEUEABLE_JOBS) >= 50
+    assert jobs.QUEUEABLE_JOBS["daily_trade"].__name__ == "start_daily_trade_job"
+    assert jobs.start_daily_trade_job.__wrapped__ is jobs.QUEUEABLE_JOBS["daily_trade"]
+
+
+def test_start_job_only_enqueues_when_queue_enabled(queue):
+    payload = SyncDailyTradeRequest(codes=["600000.SH"])
+
+    asyncio.run(jobs.start_daily_trade_job(payload))
+    asyncio.run(jobs.start_daily_trade_job(payload))
+
+    assert [(row["job"], row["status"]) for row in queue.rows] == [("daily_trade", "queued")]
+    assert SyncDailyTradeRequest.parse_obj(queue.rows[0]["payload"]) == payload
+
+
+def test_start_job_rejects_running_job_before_enqueueing(queue, monkeypatch):
+    monkeypatch.setattr(jobs, "_job_running", lambda job: job == "daily_trade")
+
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(jobs.start_daily_trade_job(SyncDailyTradeRequest()))
+
+    assert excinfo.value.status_code == 409
+    assert queue.rows == []
+
+
+def test_worker_starts_claimed_job_with_parsed_payload(queue, monkeypatch):
+    started = []
+
+    async def fake_start(payload: SyncDailyTradeRequest) -> None:
+        started.append(payload)
+
+    monkeypatch.setitem(jobs.QUEUEABLE_JOBS, "daily_trade", fake_start)
+    queue.enqueue("daily_trade", {"codes": ["000001.SZ"]})
+    queue.enqueue("no_such_job", {})
+
+    assert asyncio.run(worker.process_next_job(queue)) is True
+    assert asyncio.run(worker.process_next_job(queue)) is True
+    assert asyncio.run(worker.process_next_job(queue)) is False
+
+    assert started == [SyncDailyTradeRequest(codes=["000001.SZ"])]
+    assert queue.finished == {1: ("started", None), 2: ("failed", "unknown job")}
+
+
+def test_follower_mirrors_published_state_and_fires_finish_listeners(tmp_path, monkeypatch):
+    monkeypatch.setattr(state_module, "STATE_FILE", tmp_path / "control_state.json")
+    publisher = state_module.SyncMonitor()
+    publisher.publish_live(interval=0.0)
+    follower = state_module.SyncMonitor()
+    follower.follow_disk(interval=0.0)
+    finished = []
+    follower.add_finish_listener(lambda job, success: finished.append((job, success)))
+
+    publisher.start("daily_trade", message="Syncing")
+    assert follower.snapshot()["daily_trade"]["status"] == "running"
+
+    publisher.update("daily_trade", progress=0.5, last_market="SH")
+    assert follower.snapshot()["daily_trade"]["progress"] == 0.5
+    assert follower.snapshot()["daily_trade"]["lastMarket"] == "SH"
+
+    publisher.finish("daily_trade", success=False, error="boom")
+    snapshot = follower.snapshot()["daily_trade"]
+    assert (snapshot["status"], snapshot["error"]) == ("failed", "boom")
+    assert follower.finished_at("daily_trade") == publisher.finished_at("daily_trade")
+    assert finished == [("daily_trade", False)]
+
+    follower.finish("daily_trade", success=True)
+    assert publisher.snapshot()["daily_trade"]["status"] == "failed"
+
+
+def test_worker_completions_refresh_api_state(tmp_path, monkeypatch):
+    monkeypatch.setattr(state_module, "STATE_FILE", tmp_path / "control_state.json")
+    publisher = state_module.SyncMonitor()
+    publisher.publish_live(interval=0.0)
+    follower = state_module.SyncMonitor()
+    follower.follow_disk(interval=0.0)
+    monkeypatch.setattr(jobs, "monitor", follower)
+    monkeypatch.setattr(jobs, "_job_queue", None)
+    refreshed = threading.Event()
+    monkeypatch.setattr(jobs, "WORKER_JOB_REFRESHERS", {"stock_basic": refreshed.set})
+
+    jobs.enable_job_queue(_FakeQueue())
+    publisher.start("daily_trade")
+    publisher.finish("daily_trade", success=True)
+    publisher.start("stock_basic")
+    publisher.finish("stock_basic", success=True)
+    follower.snapshot()
+
+    assert refreshed.wait(1.0)
+
+
+def test_legacy_sync_endpoints_enqueue_instead_of_running(queue, monkeypatch):
+    monkeypatch.setattr(control, "sync_daily_trade", lambda **kwargs: pytest.fail("sync must run in the worker"))
+
+    response = asyncio.run(control.trigger_daily_trade_sync(SyncDailyTradeRequest(codes=["600000.SH"])))
+
+    assert response.status_code == 202
+    assert [(row["job"], row["payload"]["codes"]) for row in queue.rows] == [("daily_trade", ["600000.SH"])]
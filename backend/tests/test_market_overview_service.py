@@ -1,6 +1,13 @@
+import threading
 import unittest
+from unittest import mock
 
-from backend.src.services.market_overview_service import build_market_overview_payload
+from backend.src.services import market_overview_service
+from backend.src.services.market_overview_service import (
+    build_market_overview_payload,
+    invalidate_market_overview_cache,
+    invalidate_market_overview_on_job,
+)
 
 
 class MarketOverviewServiceTests(unittest.TestCase):
@@ -25,5 +32,54 @@ class MarketOverviewServiceTests(unittest.TestCase):
         self.assertIn("peripheralInsight", payload)
         self.assertIn("marketActivity", payload)
 
+
+class MarketOverviewCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        invalidate_market_overview_cache()
+        self.calls = []
+        self.threads = set()
+
+        def _loader(key):
+            def _load(settings):
+                self.calls.append(key)
+                self.threads.add(threading.get_ident())
+                return [key]
+
+            return _load
+
+        loaders = {key: _loader(key) for key in market_overview_service._SECTION_LOADERS}
+        patches = [
+            mock.patch.object(market_overview_service, "_SECTION_LOADERS", loaders),
+            mock.patch.object(market_overview_service, "load_settings", lambda path=None: None),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(invalidate_market_overview_cache)
+
+    def test_sections_load_concurrently_and_payload_is_cached(self) -> None:
+        first = build_market_overview_payload()
+        self.assertEqual(first["marketFundFlow"], ["marketFundFlow"])
+        self.assertIsNone(first["latestReasoning"])
+        self.assertEqual(len(self.calls), len(market_overview_service._SECTION_LOADERS))
+        self.assertNotIn(threading.get_ident(), self.threads)
+
+        first["marketFundFlow"].append("mutated")
+        second = build_market_overview_payload()
+        self.assertEqual(second["marketFundFlow"], ["marketFundFlow"])
+        self.assertEqual(len(self.calls), len(market_overview_service._SECTION_LOADERS))
+
+    def test_source_job_completion_invalidates_cache(self) -> None:
+        build_market_overview_payload()
+        invalidate_market_overview_on_job("daily_trade", True)
+        invalidate_market_overview_on_job("market_fund_flow", False)
+        build_market_overview_payload()
+        self.assertEqual(len(self.calls), len(market_overview_service._SECTION_LOADERS))
+
+        invalidate_market_overview_on_job("market_fund_flow", True)
+        build_market_overview_payload()
+        self.assertEqual(len(self.calls), 2 * len(market_overview_service._SECTION_LOADERS))
+
+
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
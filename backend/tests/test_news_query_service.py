@@ -0,0 +1,54 @@
+from datetime import datetime
+
+from backend.src.services import news_query_service
+from backend.src.services.news_query_service import (
+    NEWS_ARTICLE_COLUMNS,
+    NEWS_INSIGHT_COLUMNS,
+    _case_variants,
+)
+
+
+def test_case_variants_cover_stored_tag_spelling():
+    assert _case_variants([" 600000.sh ", "浦发银行", ""]) == ["600000.sh", "600000.SH", "浦发银行"]
+
+
+def test_list_news_articles_pushes_filters_and_cursor_to_sql(monkeypatch):
+    captured = {}
+
+    def fake_fetch(article_dao, insight_dao, **kwargs):
+        captured.update(kwargs)
+        row = {column: None for column in NEWS_ARTICLE_COLUMNS + NEWS_INSIGHT_COLUMNS}
+        row.update(
+            {
+                "article_id": "a-1",
+                "source": "global_flash",
+                "title": "Headline",
+                "published_at": datetime(2025, 4, 28, 9, 30),
+                "is_relevant": True,
+                "impact_stocks": ["600000.SH"],
+            }
+        )
+        return [row]
+
+    monkeypatch.setattr(news_query_service, "load_settings", lambda path=None: type("S", (), {"postgres": None})())
+    monkeypatch.setattr(news_query_service, "fetch_news_with_insights", fake_fetch)
+
+    cursor = datetime(2025, 4, 28, 10, 0)
+    results = news_query_service.list_news_articles(
+        limit=20,
+        only_relevant=True,
+        stock="600000.SH, 浦发银行",
+        lookback_hours=24,
+        before_published_at=cursor,
+        before_id="a-2",
+    )
+
+    assert captured["only_relevant"] is True
+    assert captured["stocks"] == ["600000.sh", "浦发银行"]
+    assert captured["before"] == (cursor, "a-2")
+    assert captured["limit"] == 20
+    assert captured["published_after"] is not None
+    assert len(results) == 1
+    assert results[0]["articleId"] == "a-1"
+    assert results[0]["impact"]["stocks"] == ["600000.SH"]
+    assert results[0]["impact"]["industries"] == []
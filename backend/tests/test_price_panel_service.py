@@ -0,0 +1,115 @@
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from backend.src.services.price_panel_service import PricePanelStore, append_price_panel, load_ohlcv_history
+
+
+def _bars(rows):
+    frame = pd.DataFrame(rows, columns=["ts_code", "trade_date", "close", "vol", "is_intraday"])
+    frame["trade_date"] = pd.to_datetime(frame["trade_date"])
+    frame["open"] = frame["close"]
+    return frame
+
+
+class _FakeDailyTradeDAO:
+    def __init__(self, frame: pd.DataFrame) -> None:
+        self._frame = frame
+        self.calls = []
+
+    def fetch_ohlcv(self, *, start_date=None, end_date=None, include_intraday=False, fields=()):
+        self.calls.append((start_date, end_date, include_intraday))
+        frame = self._frame
+        if start_date is not None:
+            frame = frame[frame["trade_date"] >= pd.Timestamp(start_date)]
+        if end_date is not None:
+            frame = frame[frame["trade_date"] <= pd.Timestamp(end_date)]
+        if not include_intraday:
+            frame = frame[~frame["is_intraday"]]
+        return frame[["ts_code", "trade_date", *fields]].reset_index(drop=True)
+
+
+class PricePanelStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.store = PricePanelStore(Path(self._tmp.name))
+        self.store.write(
+            _bars(
+                [
+                    ("600000.SH", "2024-12-30", 10.0, 100.0, False),
+                    ("600000.SH", "2024-12-31", 10.5, 110.0, False),
+                    ("000001.SZ", "2024-12-31", 8.0, 50.0, False),
+                    ("600000.SH", "2025-01-02", 11.0, 120.0, False),
+                ]
+            ),
+            mark_start=date(2024, 12, 30),
+            mark_end=date(2025, 1, 2),
+        )
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_partitions_by_year_and_reads_across_them(self) -> None:
+        self.assertEqual(sorted(path.name for path in self.store.root.glob("*.arrow")), ["daily_2024.arrow", "daily_2025.arrow"])
+        frame = self.store.read_frame(date(2024, 12, 31), date(2025, 1, 2), fields=("close",))
+        self.assertEqual(len(frame), 3)
+        self.assertEqual(frame["close"].dtype, np.float64)
+
+    def test_panel_is_dense_with_nan_gaps(self) -> None:
+        panel = self.store.read_panel(
+            date(2024, 12, 30),
+            date(2025, 1, 2),
+            codes=["000001.SZ", "600000.SH", "300750.SZ"],
+            fields=("close", "vol"),
+        )
+        self.assertEqual(panel.shape, (3, 3))
+        np.testing.assert_array_equal(panel["close"][:, 1], [10.0, 10.5, 11.0])
+        self.assertTrue(np.isnan(panel["close"][0, 0]))
+        self.assertEqual(panel["vol"][1, 0], 50.0)
+        self.assertTrue(np.isnan(panel["close"][:, 2]).all())
+
+    def test_append_overwrites_existing_bars_and_skips_intraday(self) -> None:
+        append_price_panel(
+            _bars(
+                [
+                    ("600000.SH", "2025-01-02", 11.2, 125.0, False),
+                    ("600000.SH", "2025-01-03", 11.4, 130.0, True),
+                ]
+            ),
+            store=self.store,
+            complete_through=date(2025, 1, 2),
+        )
+        frame = self.store.read_frame(date(2025, 1, 1), date(2025, 1, 3), fields=("close",))
+        self.assertEqual(frame["close"].tolist(), [11.2])
+        self.assertEqual(self.store.coverage(), (date(2024, 12, 30), date(2025, 1, 2)))
+
+    def test_append_is_ignored_before_bootstrap(self) -> None:
+        empty_store = PricePanelStore(Path(self._tmp.name) / "fresh")
+        written = append_price_panel(_bars([("600000.SH", "2025-01-02", 11.0, 1.0, False)]), store=empty_store)
+        self.assertEqual(written, 0)
+        self.assertIsNone(empty_store.coverage())
+
+    def test_history_reads_cache_and_only_queries_the_tail(self) -> None:
+        dao = _FakeDailyTradeDAO(
+            _bars(
+                [
+                    ("600000.SH", "2025-01-03", 11.5, 140.0, False),
+                    ("600000.SH", "2025-01-06", 11.7, 150.0, True),
+                ]
+            )
+        )
+        frame = load_ohlcv_history(dao, date(2024, 12, 31), fields=("close",), include_intraday=True, store=self.store)
+        self.assertEqual(dao.calls, [(date(2025, 1, 3), None, True)])
+        self.assertEqual(frame[frame["ts_code"] == "600000.SH"]["close"].tolist(), [10.5, 11.0, 11.5, 11.7])
+
+        uncovered = load_ohlcv_history(dao, date(2024, 1, 1), fields=("close",), store=self.store)
+        self.assertEqual(dao.calls[-1], (date(2024, 1, 1), None, False))
+        self.assertEqual(len(uncovered), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import unittest
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+
+from backend.src.services.realtime_quote_service import (
+    LOCAL_TZ,
+    RealtimeQuotePoller,
+    RealtimeQuoteStore,
+    build_intraday_bars,
+    is_within_trading_session,
+    normalize_quote_frame,
+    quote_max_age_seconds,
+)
+from backend.src.services.stock_basic_service import _quote_applies_to_bar
+
+
+def _quote_frame(codes, *, price: float = 10.5, volume: float = 120000.0) -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            {
+                "code": code,
+                "name": f"Stock {code}",
+                "trade_date": "20250428",
+                "trade_time": "10:30:00",
+                "open": 10.0,
+                "high": 10.8,
+                "low": 9.9,
+                "close": price,
+                "pre_close": 10.0,
+                "volume": volume,
+                "amount": 1.2e6,
+            }
+            for code in codes
+        ]
+    )
+
+
+class RealtimeQuoteStoreTests(unittest.TestCase):
+    def test_normalize_quote_frame_derives_change_and_hands(self) -> None:
+        quotes = normalize_quote_frame(_quote_frame(["600000.sh"]))
+        self.assertEqual(len(quotes), 1)
+        quote = quotes[0]
+        self.assertEqual(quote["ts_code"], "600000.SH")
+        self.assertEqual(quote["trade_date"], date(2025, 4, 28))
+        self.assertAlmostEqual(quote["pct_chg"], 5.0)
+        self.assertAlmostEqual(quote["volume_hands"], 1200.0)
+
+    def test_only_moved_quotes_are_flushed(self) -> None:
+        store = RealtimeQuoteStore()
+        self.assertEqual(store.update(normalize_quote_frame(_quote_frame(["600000.SH", "000001.SZ"]))), 2)
+        self.assertEqual(len(store.drain_dirty()), 2)
+
+        store.update(normalize_quote_frame(_quote_frame(["600000.SH"])))
+        self.assertEqual(store.drain_dirty(), [])
+
+        store.update(normalize_quote_frame(_quote_frame(["000001.SZ"], price=10.6)))
+        self.assertEqual([quote["ts_code"] for quote in store.drain_dirty()], ["000001.SZ"])
+
+    def test_stale_quotes_are_hidden(self) -> None:
+        store = RealtimeQuoteStore()
+        stale = datetime.now(LOCAL_TZ) - timedelta(minutes=10)
+        store.update(normalize_quote_frame(_quote_frame(["600000.SH"]), received_at=stale))
+        self.assertIsNone(store.get("600000.SH", max_age_seconds=60))
+        self.assertIsNotNone(store.get("600000.sh"))
+
+    def test_quote_max_age_follows_poll_interval(self) -> None:
+        self.assertEqual(quote_max_age_seconds(30), 180.0)
+        self.assertEqual(quote_max_age_seconds(600), 1800.0)
+        store = RealtimeQuoteStore()
+        RealtimeQuotePoller(store=store, interval_seconds=600)
+        self.assertEqual(store.max_age_seconds, 1800.0)
+
+    def test_quote_only_overrides_bar_of_the_same_session(self) -> None:
+        quote = {"close": 10.5, "trade_date": date(2025, 4, 28)}
+        finalised = {"is_intraday": False, "trade_date": date(2025, 4, 25)}
+        self.assertFalse(_quote_applies_to_bar(finalised, quote))
+        self.assertTrue(_quote_applies_to_bar({**finalised, "trade_date": datetime(2025, 4, 28)}, quote))
+        self.assertTrue(_quote_applies_to_bar({"is_intraday": True, "trade_date": date(2025, 4, 28)}, {"close": 1.0}))
+        self.assertFalse(_quote_applies_to_bar(finalised, {}))
+
+    def test_intraday_bars_use_daily_trade_layout(self) -> None:
+        frame = build_intraday_bars(normalize_quote_frame(_quote_frame(["600000.SH"])))
+        self.assertEqual(frame.loc[0, "ts_code"], "600000.SH")
+        self.assertTrue(frame.loc[0, "is_intraday"])
+        # Linear fallback scales the partial-session volume up to a full-day estimate.
+        self.assertGreater(frame.loc[0, "vol"], 1200.0)
+
+
+class RealtimeQuotePollerTests(unittest.TestCase):
+    def test_session_windows(self) -> None:
+        self.assertTrue(is_within_trading_session(datetime(2025, 4, 28, 9, 30)))
+        self.assertFalse(is_within_trading_session(datetime(2025, 4, 28, 12, 0)))
+        self.assertTrue(is_within_trading_session(datetime(2025, 4, 28, 14, 59)))
+        self.assertFalse(is_within_trading_session(datetime(2025, 4, 28, 15, 30)))
+
+    def test_poll_once_requests_fifty_code_chunks(self) -> None:
+        calls = []
+
+        def fake_fetch(chunk):
+            calls.append(list(chunk))
+            return _quote_frame(chunk)
+
+        store = RealtimeQuoteStore()
+        poller = RealtimeQuotePoller(store=store, fetch_quotes=fake_fetch)
+        codes = [f"{idx:06d}.SZ" for idx in range(120)]
+        self.assertEqual(poller.poll_once(codes), 120)
+        self.assertEqual([len(chunk) for chunk in calls], [50, 50, 20])
+        self.assertEqual(store.stats()["count"], 120)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.src.config.runtime_config import RuntimeConfig
+from backend.src.services.sector_index_service import build_price_panel, compute_sector_indices
+
+
+def _bars(closes_by_code, *, start="2024-01-02"):
+    rows = []
+    dates = pd.bdate_range(start, periods=max(len(closes) for closes in closes_by_code.values()))
+    for code, closes in closes_by_code.items():
+        previous = None
+        for trade_date, close in zip(dates, closes):
+            if close is None:
+                continue
+            rows.append(
+                {
+                    "ts_code": code,
+                    "trade_date": trade_date,
+                    "open": previous if previous is not None else close,
+                    "high": close * 1.02,
+                    "low": close * 0.98,
+                    "close": close,
+                    "pre_close": previous if previous is not None else math.nan,
+                    "vol": 100.0,
+                    "amount": close * 100.0,
+                }
+            )
+            previous = close
+    return pd.DataFrame(rows)
+
+
+def test_equal_weighted_index_averages_member_returns():
+    panel = build_price_panel(_bars({"A.SH": [10, 11, 12.1], "B.SZ": [20, 20, 18]}), ["A.SH", "B.SZ"])
+
+    frame = compute_sector_indices(panel, {"Both": ["A.SH", "B.SZ"], "Empty": []})
+
+    assert frame["sector_name"].unique().tolist() == ["Both"]
+    assert frame["pct_chg"].tolist() == pytest.approx([5.0, 0.0])
+    assert frame["close"].tolist() == pytest.approx([1050.0, 1050.0])
+    assert frame["pre_close"].tolist() == pytest.approx([1000.0, 1050.0])
+    assert frame["vol"].tolist() == pytest.approx([200.0, 200.0])
+    assert (frame["high"] >= frame[["open", "close"]].max(axis=1)).all()
+    assert (frame["low"] <= frame[["open", "close"]].min(axis=1)).all()
+
+
+def test_cap_weighted_index_uses_previous_close_market_cap_and_anchor():
+    panel = build_price_panel(_bars({"A.SH": [10, 11], "B.SZ": [20, 18]}), ["A.SH", "B.SZ"])
+
+    frame = compute_sector_indices(
+        panel,
+        {"Both": ["A.SH", "B.SZ"]},
+        float_shares={"A.SH": 3.0, "B.SZ": 1.0},
+        base_levels={"Both": 500.0},
+    )
+
+    # Caps at the previous close are 30 and 20: 0.6 * 10% + 0.4 * -10% = 2%.
+    assert frame["pct_chg"].tolist() == pytest.approx([2.0])
+    assert frame["close"].tolist() == pytest.approx([510.0])
+
+
+def test_sectors_are_computed_in_one_pass_and_skip_untraded_days():
+    panel = build_price_panel(
+        _bars({"A.SH": [10, 11, None, 12.1], "B.SZ": [5, 5, 5, 5.5]}),
+        ["A.SH", "B.SZ", "C.SH"],
+    )
+
+    frame = compute_sector_indices(panel, {"OnlyA": ["A.SH"], "OnlyB": ["B.SZ"], "Missing": ["C.SH"]})
+    by_sector = {name: group.reset_index(drop=True) for name, group in frame.groupby("sector_name")}
+
+    assert set(by_sector) == {"OnlyA", "OnlyB"}
+    assert len(by_sector["OnlyA"]) == 2
+    assert by_sector["OnlyA"]["close"].iloc[-1] == pytest.approx(1210.0)
+    assert by_sector["OnlyB"]["pct_chg"].tolist() == pytest.approx([0.0, 0.0, 10.0])
+
+
+def test_build_price_panel_ignores_codes_outside_universe():
+    panel = build_price_panel(_bars({"A.SH": [10, 11], "Z.SZ": [1, 2]}), ["A.SH"])
+
+    assert panel.shape == (2, 1)
+    assert np.isnan(panel["pre_close"][0, 0])
+    assert panel["close"][:, 0].tolist() == [10.0, 11.0]
+
+
+def test_runtime_config_sanitizes_sector_index_source():
+    assert RuntimeConfig.from_dict({"sector_index_source": "Cap_Weighted"}).sector_index_source == "cap_weighted"
+    assert RuntimeConfig.from_dict({"sector_index_source": "bogus"}).sector_index_source == "remote"
+    assert RuntimeConfig().to_dict()["sector_index_source"] == "remote"
@@ -0,0 +1,44 @@
+import unittest
+
+from backend.src.services.sector_name_service import SectorNameIndex, normalize_sector_label
+
+
+NAMES = ["东数西算(算力)", "光伏概念", "人工智能", "ChatGPT概念", "半导体", "汽车整车", "汽车零部件"]
+
+
+class SectorNameIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.index = SectorNameIndex(NAMES)
+
+    def test_exact_case_and_normalised_matches(self) -> None:
+        self.assertEqual(self.index.match("人工智能"), "人工智能")
+        self.assertEqual(self.index.match(" chatgpt概念 "), "ChatGPT概念")
+        self.assertEqual(self.index.match("光伏"), "光伏概念")
+        self.assertEqual(self.index.match("东数西算 算力"), "东数西算(算力)")
+        self.assertIsNone(self.index.match("人工"))
+        self.assertIsNone(self.index.match(""))
+
+    def test_closest_scores_character_overlap(self) -> None:
+        self.assertEqual(self.index.closest("汽车零件"), "汽车零部件")
+        self.assertEqual(self.index.closest("半导体芯片"), "半导体")
+        self.assertIsNone(self.index.closest("银行"))
+
+    def test_closest_results_are_cached(self) -> None:
+        self.assertEqual(self.index.closest("汽车零件"), "汽车零部件")
+        self.index._norms[:] = ["" for _ in self.index._norms]
+        self.assertEqual(self.index.closest("汽车零件"), "汽车零部件")
+
+    def test_match_never_falls_back_to_fuzzy(self) -> None:
+        self.assertEqual(self.index.closest("汽车整"), "汽车整车")
+        self.assertIsNone(self.index.match("汽车整"))
+        self.assertIn("半导体", self.index)
+        self.assertEqual(len(self.index), len(NAMES))
+
+    def test_normalize_sector_label(self) -> None:
+        self.assertEqual(normalize_sector_label("东数西算（算力）"), "东数西算算力")
+        self.assertEqual(normalize_sector_label("AI · 概念"), "ai")
+        self.assertEqual(normalize_sector_label(None), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
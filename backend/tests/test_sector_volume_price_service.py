@@ -0,0 +1,156 @@
+import asyncio
+import threading
+import time
+from dataclasses import replace
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+from fastapi import HTTPException
+
+from backend.src.api import jobs
+from backend.src.api.schemas import SyncSectorVolumePriceRequest
+from backend.src.services import concept_volume_price_service as concept_service
+from backend.src.services import sector_volume_price_service as service
+
+
+class DummySettings:
+    postgres = object()
+
+
+def _rows(name, count, *, seed):
+    rows = []
+    start = date(2025, 1, 1)
+    for index in range(count):
+        close = 100 + seed * 3 + ((index * 7 + seed) % 11) - 5
+        rows.append(
+            {
+                "concept_name": name,
+                "trade_date": start + timedelta(days=index),
+                "open": close - 1,
+                "high": close + 2,
+                "low": close - 2,
+                "close": None if index == 3 else float(close),
+                "pre_close": close - 0.5,
+                "pct_chg": 0.5,
+                "vol": None if index == 5 else float(1000 + ((index * 13 + seed) % 17) * 10),
+                "amount": float(close * 1000),
+            }
+        )
+    return rows
+
+
+ROWS = {"人工智能": _rows("人工智能", 80, seed=1), "光伏概念": _rows("光伏概念", 12, seed=2), "白酒": []}
+
+
+class FakeHistoryDAO:
+    def __init__(self, _config) -> None:
+        pass
+
+    def list_entries(self, *, concept_name, limit):
+        return {"items": list(reversed(ROWS[concept_name]))[:limit]}
+
+    def list_recent_frame(self, concept_names, *, per_name):
+        rows = [row for name in concept_names for row in ROWS[name][-per_name:]]
+        columns = ["concept_name", "trade_date", "open", "high", "low", "close", "pre_close", "pct_chg", "vol", "amount"]
+        frame = pd.DataFrame(rows, columns=columns)
+        frame[columns[2:]] = frame[columns[2:]].apply(pd.to_numeric, errors="coerce")
+        return frame
+
+
+def _resolve(concept, settings_path=None):
+    if concept not in ROWS:
+        raise ValueError(f"Concept '{concept}' not found.")
+    return {"name": concept, "code": f"code-{concept}"}
+
+
+@pytest.fixture(autouse=True)
+def patch_dependencies(monkeypatch):
+    for module in (service, concept_service):
+        monkeypatch.setattr(module, "load_settings", lambda _path=None: DummySettings())
+    monkeypatch.setattr(concept_service, "resolve_concept_label", _resolve)
+    monkeypatch.setattr(concept_service, "ConceptIndexHistoryDAO", FakeHistoryDAO)
+    monkeypatch.setitem(
+        service._KINDS,
+        "concept",
+        replace(service._KINDS["concept"], resolve=_resolve, history_dao=FakeHistoryDAO),
+    )
+
+
+def test_batch_datasets_match_single_sector_builder():
+    datasets, errors = service.build_sector_volume_price_datasets(
+        "concept",
+        ["人工智能", "光伏概念", "白酒", "不存在"],
+        lookback_days=60,
+    )
+
+    assert errors == [{"sector": "不存在", "error": "Concept '不存在' not found."}]
+    by_name = {dataset["concept"]: dataset for dataset in datasets}
+    for name in ("人工智能", "光伏概念", "白酒"):
+        expected = concept_service.build_volume_price_dataset(name, lookback_days=60)
+        batch = by_name[name]
+        assert batch["conceptCode"] == expected["conceptCode"]
+        assert batch["history"] == expected["history"]
+        assert batch["statistics"] == expected["statistics"]
+
+
+def test_statistics_keep_the_stored_value_types(monkeypatch):
+    integer_rows = [
+        {**row, "close": 100 + index % 7, "high": 103 + index % 7, "low": 97 + index % 7, "vol": 1000 + index * 10}
+        for index, row in enumerate(_rows("半导体", 30, seed=3))
+    ]
+    monkeypatch.setitem(ROWS, "半导体", integer_rows)
+
+    datasets, _errors = service.build_sector_volume_price_datasets("concept", ["半导体"], lookback_days=20)
+    expected = concept_service.build_volume_price_dataset("半导体", lookback_days=20)["statistics"]
+    batch = datasets[0]["statistics"]
+
+    assert batch == expected
+    for key in ("maxClose", "minClose", "maxHigh", "minLow", "maxVolume"):
+        assert type(batch[key]) is type(expected[key]) is int, key
+
+
+def test_batch_dispatches_llm_calls_concurrently_and_stores_each(monkeypatch):
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+    stored = []
+
+    def fake_reason(dataset, *, run_llm, settings_path):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.05)
+        with lock:
+            active["now"] -= 1
+            stored.append(dataset["concept"])
+        if dataset["concept"] == "光伏概念":
+            raise RuntimeError("llm timeout")
+        return {"summary": {"wyckoffPhase": "上涨"}, "generatedAt": "2025-01-01T00:00:00"}
+
+    monkeypatch.setitem(service._KINDS, "concept", replace(service._KINDS["concept"], reason=fake_reason))
+    monkeypatch.setattr(service, "_LLM_SLOTS", threading.BoundedSemaphore(2))
+    progress = []
+
+    result = service.generate_sector_volume_price_batch(
+        "concept",
+        ["人工智能", "光伏概念", "白酒"],
+        progress_callback=lambda *args: progress.append(args),
+    )
+
+    assert sorted(stored) == ["人工智能", "光伏概念", "白酒"]
+    assert active["peak"] == 2
+    assert sorted(item["sector"] for item in result["generated"]) == ["人工智能", "白酒"]
+    assert result["errors"] == [{"sector": "光伏概念", "error": "llm timeout"}]
+    assert progress[-1][0] == 1.0
+
+
+def test_unknown_kind_is_rejected():
+    with pytest.raises(ValueError):
+        service.generate_sector_volume_price_batch("region", [])
+
+
+def test_explicit_sectors_require_a_single_kind(monkeypatch):
+    monkeypatch.setattr(jobs, "_job_running", lambda job: False)
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(jobs.start_sector_volume_price_job(SyncSectorVolumePriceRequest(sectors=["人工智能"])))
+    assert excinfo.value.status_code == 400
@@ -0,0 +1,82 @@
+import unittest
+from datetime import date
+
+import pandas as pd
+
+from backend.src.api_clients.tushare_api import INCOME_STATEMENT_FIELDS, get_income_statements_vip
+from backend.src.services._statement_discovery import (
+    fetch_announced_frame,
+    resolve_announcement_window,
+    validate_sync_mode,
+)
+
+
+class _FakeVipClient:
+    def __init__(self, rows: int) -> None:
+        self._rows = rows
+        self.calls: list[dict[str, object]] = []
+
+    def income_vip(self, **params: object) -> pd.DataFrame:
+        self.calls.append(params)
+        offset = int(params["offset"])
+        limit = int(params["limit"])
+        stop = min(self._rows, offset + limit)
+        return pd.DataFrame(
+            [
+                {"ts_code": f"{idx:06d}.SZ", "ann_date": "20250425", "end_date": "20250331", "n_income": idx}
+                for idx in range(offset, stop)
+            ]
+        )
+
+
+class StatementDiscoveryTests(unittest.TestCase):
+    def test_window_starts_one_day_before_latest_announcement(self) -> None:
+        start, end = resolve_announcement_window(date(2025, 4, 25), today=date(2025, 4, 28))
+        self.assertEqual(start, date(2025, 4, 24))
+        self.assertEqual(end, date(2025, 4, 28))
+
+    def test_window_prefers_explicit_lower_bound(self) -> None:
+        start, _ = resolve_announcement_window(
+            date(2025, 4, 25),
+            announced_since=date(2025, 4, 1),
+            today=date(2025, 4, 28),
+        )
+        self.assertEqual(start, date(2025, 4, 1))
+
+    def test_window_defaults_to_lookback_for_empty_table(self) -> None:
+        start, end = resolve_announcement_window(None, today=date(2025, 4, 28))
+        self.assertEqual(start, date(2025, 4, 21))
+        self.assertEqual(end, date(2025, 4, 28))
+
+    def test_validate_sync_mode_rejects_unknown_values(self) -> None:
+        self.assertEqual(validate_sync_mode(None), "per_code")
+        self.assertEqual(validate_sync_mode("Announcement"), "announcement")
+        with self.assertRaises(ValueError):
+            validate_sync_mode("period")
+
+    def test_vip_fetch_pages_until_short_page(self) -> None:
+        client = _FakeVipClient(rows=7)
+        frame = get_income_statements_vip(client, start_date="20250424", end_date="20250428", page_size=3)
+        self.assertEqual(len(frame), 7)
+        self.assertEqual(list(frame.columns), list(INCOME_STATEMENT_FIELDS))
+        self.assertEqual([call["offset"] for call in client.calls], [0, 3, 6])
+
+    def test_fetch_announced_frame_filters_codes_and_reports_unavailable(self) -> None:
+        client = _FakeVipClient(rows=5)
+        frame = fetch_announced_frame(
+            get_income_statements_vip,
+            client,
+            date(2025, 4, 24),
+            date(2025, 4, 28),
+            codes=["000001.SZ", "000004.SZ"],
+        )
+        self.assertEqual(frame["ts_code"].tolist(), ["000001.SZ", "000004.SZ"])
+
+        def _failing_fetch(_client: object, **_: object) -> pd.DataFrame:
+            raise RuntimeError("no permission for income_vip")
+
+        self.assertIsNone(fetch_announced_frame(_failing_fetch, client, date(2025, 4, 24), date(2025, 4, 28)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,219 @@
+import threading
+import time
+from dataclasses import replace
+from datetime import datetime, timezone
+
+import pytest
+
+from backend.src.services import stock_analysis_batch_service as service
+
+
+class DummySettings:
+    postgres = object()
+
+
+BAR_UPDATES = {
+    "600519.SH": datetime(2025, 1, 2, 17, 0),
+    "000001.SZ": datetime(2025, 1, 2, 17, 0),
+    "300750.SZ": datetime(2025, 1, 2, 17, 0),
+}
+NEWS_CREATED = {"000001.SZ": datetime(2025, 1, 2, 20, 0)}
+FUND_FLOW_UPDATED = {"600519": datetime(2025, 1, 2, 15, 30)}
+BIG_DEAL_UPDATED = {"600519": datetime(2025, 1, 2, 15, 5)}
+GENERATED = {
+    "volume_price": {"600519.SH": datetime(2025, 1, 2, 18, 0), "000001.SZ": datetime(2025, 1, 2, 18, 0)},
+    "integrated": {"600519.SH": datetime(2025, 1, 2, 18, 0)},
+    "valuation": {"600519.SH": datetime(2025, 1, 2, 16, 0)},
+}
+
+
+class FakeDailyTradeDAO:
+    def __init__(self, _config) -> None:
+        pass
+
+    def latest_bar_updated_at_for_codes(self, codes):
+        return {code: BAR_UPDATES[code] for code in codes if code in BAR_UPDATES}
+
+
+class FakeNewsDAO:
+    def __init__(self, _config) -> None:
+        pass
+
+    def latest_created_at_for_codes(self, codes):
+        return {code: NEWS_CREATED[code] for code in codes if code in NEWS_CREATED}
+
+
+class FakeFundFlowDAO:
+    def __init__(self, _config) -> None:
+        pass
+
+    def latest_updated_at_for_codes(self, codes):
+        return {code: FUND_FLOW_UPDATED[code] for code in codes if code in FUND_FLOW_UPDATED}
+
+
+class FakeBigDealDAO:
+    def __init__(self, _config) -> None:
+        pass
+
+    def latest_rollup_updated_at_for_codes(self, codes):
+        return {code: BIG_DEAL_UPDATED[code] for code in codes if code in BIG_DEAL_UPDATED}
+
+
+class FakeFavoriteDAO:
+    def __init__(self, _config) -> None:
+        pass
+
+    def list_codes(self):
+        return ["600519.SH", "000001.SZ"]
+
+
+def _analysis_dao(kind):
+    class FakeAnalysisDAO:
+        def __init__(self, _config) -> None:
+            pass
+
+        def fetch_latest_generated_at(self, codes):
+            return {code: value for code, value in GENERATED[kind].items() if code in codes}
+
+    return FakeAnalysisDAO
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    recorded = []
+    lock = threading.Lock()
+    monkeypatch.setattr(service, "load_settings", lambda _path=None: DummySettings())
+    monkeypatch.setattr(service, "DailyTradeDAO", FakeDailyTradeDAO)
+    monkeypatch.setattr(service, "StockNewsDAO", FakeNewsDAO)
+    monkeypatch.setattr(service, "IndividualFundFlowDAO", FakeFundFlowDAO)
+    monkeypatch.setattr(service, "BigDealFundFlowDAO", FakeBigDealDAO)
+    monkeypatch.setattr(service, "FavoriteStockDAO", FakeFavoriteDAO)
+    monkeypatch.setattr(service, "prime_stock_context_versions", lambda codes, settings_path=None: {})
+
+    for kind in service.STOCK_ANALYSIS_KINDS:
+
+        def generate(code, *, run_llm, settings_path, kind=kind):
+            with lock:
+                recorded.append((code, kind))
+            if (code, kind) == ("300750.SZ", "integrated"):
+                raise RuntimeError("llm timeout")
+            return {"code": code, "generatedAt": "2025-01-03T09:00:00"}
+
+        monkeypatch.setitem(
+            service._KINDS,
+            kind,
+            replace(service._KINDS[kind], dao=_analysis_dao(kind), generate=generate),
+        )
+    return recorded
+
+
+def test_plan_skips_analyses_newer_than_their_inputs(calls):
+    pending, skipped = service.plan_stock_analysis_batch(
+        ["600519.SH", "000001.SZ", "300750.SZ"],
+        service.STOCK_ANALYSIS_KINDS,
+    )
+
+    assert pending == {
+        "600519.SH": ["valuation"],
+        "000001.SZ": ["volume_price", "integrated", "valuation"],
+        "300750.SZ": ["volume_price", "integrated", "valuation"],
+    }
+    assert skipped == 2
+
+    forced, forced_skipped = service.plan_stock_analysis_batch(["600519.SH"], ["integrated"], force=True)
+    assert (forced, forced_skipped) == ({"600519.SH": ["integrated"]}, 0)
+
+
+def test_watermarks_in_another_zone_are_compared_on_the_same_clock(calls, monkeypatch):
+    # 11:00 UTC is 19:00 in Shanghai: after the 18:00 (Shanghai) volume/price snapshot.
+    monkeypatch.setitem(BAR_UPDATES, "600519.SH", datetime(2025, 1, 2, 11, 0, tzinfo=timezone.utc))
+    monkeypatch.setitem(NEWS_CREATED, "600519.SH", datetime(2025, 1, 2, 9, 30, tzinfo=timezone.utc))
+
+    pending, skipped = service.plan_stock_analysis_batch(["600519.SH"], ["volume_price", "integrated"])
+    assert (pending, skipped) == ({"600519.SH": ["volume_price", "integrated"]}, 0)
+
+    # 09:30 UTC is 17:30 in Shanghai: the 18:00 snapshots are still current.
+    monkeypatch.setitem(BAR_UPDATES, "600519.SH", datetime(2025, 1, 2, 9, 30, tzinfo=timezone.utc))
+    assert service.plan_stock_analysis_batch(["600519.SH"], ["volume_price", "integrated"]) == ({}, 2)
+
+
+def test_fund_flow_updates_alone_invalidate_the_analyses(calls, monkeypatch):
+    monkeypatch.setitem(FUND_FLOW_UPDATED, "600519", datetime(2025, 1, 2, 19, 0))
+
+    pending, skipped = service.plan_stock_analysis_batch(["600519.SH"], ["volume_price", "integrated"])
+    assert (pending, skipped) == ({"600519.SH": ["volume_price", "integrated"]}, 0)
+
+    monkeypatch.setitem(FUND_FLOW_UPDATED, "600519", datetime(2025, 1, 2, 15, 30))
+    monkeypatch.setitem(BIG_DEAL_UPDATED, "600519", datetime(2025, 1, 2, 19, 0))
+    assert service.plan_stock_analysis_batch(["600519.SH"], ["integrated"]) == ({"600519.SH": ["integrated"]}, 0)
+
+
+def test_newer_volume_price_reasoning_invalidates_dependent_analyses(calls, monkeypatch):
+    monkeypatch.setitem(GENERATED["volume_price"], "600519.SH", datetime(2025, 1, 2, 18, 30))
+
+    pending, skipped = service.plan_stock_analysis_batch(["600519.SH"], ["integrated", "volume_price"])
+    assert (pending, skipped) == ({"600519.SH": ["integrated"]}, 1)
+
+
+def test_batch_defaults_to_favourites_and_runs_each_stock_in_order(calls):
+    progress = []
+
+    result = service.generate_stock_analysis_batch(progress_callback=lambda *args: progress.append(args))
+
+    assert result["stocks"] == 2
+    assert result["skipped"] == 2
+    assert [kind for code, kind in calls if code == "000001.SZ"] == ["volume_price", "integrated", "valuation"]
+    assert [kind for code, kind in calls if code == "600519.SH"] == ["valuation"]
+    assert len(result["generated"]) == 4
+    assert [entry[0] for entry in progress] == [0.5, 1.0]
+
+
+def test_batch_records_failures_and_continues(calls):
+    result = service.generate_stock_analysis_batch(["300750.sz", "300750.SZ"], analyses=["volume_price", "integrated"])
+
+    assert calls == [("300750.SZ", "volume_price"), ("300750.SZ", "integrated")]
+    assert result["analyses"] == ["volume_price", "integrated"]
+    assert result["errors"] == [{"code": "300750.SZ", "analysis": "integrated", "error": "llm timeout"}]
+
+
+def test_llm_requests_are_capped_across_stocks(calls, monkeypatch):
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def slow_generate(code, *, run_llm, settings_path):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.05)
+        with lock:
+            active["now"] -= 1
+        return {"generatedAt": None}
+
+    monkeypatch.setitem(service._KINDS, "valuation", replace(service._KINDS["valuation"], generate=slow_generate))
+    monkeypatch.setattr(service, "_LLM_SLOTS", threading.BoundedSemaphore(2))
+
+    result = service.generate_stock_analysis_batch(
+        [f"{index:06d}.SZ" for index in range(6)],
+        analyses=["valuation"],
+    )
+
+    assert len(result["generated"]) == 6
+    assert active["peak"] == 2
+
+
+def test_current_analysis_is_served_only_while_inputs_are_unchanged(calls, monkeypatch):
+    monkeypatch.setitem(
+        service._KINDS,
+        "integrated",
+        replace(service._KINDS["integrated"], latest=lambda code, settings_path=None: {"code": code}),
+    )
+
+    assert service.get_current_stock_analysis("integrated", "600519.sh") == {"code": "600519.SH"}
+    assert service.get_current_stock_analysis("integrated", "000001.SZ") is None
+    with pytest.raises(ValueError):
+        service.get_current_stock_analysis("fundamental", "600519.SH")
+
+
+def test_unknown_analyses_are_rejected():
+    with pytest.raises(ValueError):
+        service.generate_stock_analysis_batch(["600519.SH"], analyses=["fundamental"])
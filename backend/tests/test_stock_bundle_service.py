@@ -0,0 +1,43 @@
+import threading
+import time
+
+from backend.src.services.stock_bundle_service import gather_sections
+
+
+def test_sections_run_concurrently_with_partial_results():
+    release = threading.Event()
+
+    def slow():
+        release.wait(2)
+        return "late"
+
+    def broken():
+        raise ValueError("boom")
+
+    started = time.monotonic()
+    sections, errors = gather_sections(
+        {"fast": lambda: {"ok": True}, "slow": slow, "broken": broken, "other": lambda: [1, 2]},
+        timeouts={"slow": 0.2},
+        default_timeout=1.0,
+    )
+    elapsed = time.monotonic() - started
+    release.set()
+
+    assert sections == {"fast": {"ok": True}, "other": [1, 2]}
+    assert isinstance(errors["slow"], TimeoutError)
+    assert isinstance(errors["broken"], ValueError)
+    assert elapsed < 1.0
+
+
+def test_timeouts_are_measured_from_submission():
+    def sleeper(seconds):
+        return lambda: time.sleep(seconds) or seconds
+
+    started = time.monotonic()
+    sections, errors = gather_sections(
+        {"a": sleeper(0.3), "b": sleeper(0.3), "c": sleeper(0.3)},
+        default_timeout=1.0,
+    )
+    assert not errors
+    assert sorted(sections) == ["a", "b", "c"]
+    assert time.monotonic() - started < 0.8
@@ -0,0 +1,159 @@
+import threading
+import time
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+from backend.src.services import stock_context_service as service
+from backend.src.services import stock_integrated_analysis_service as integrated_service
+from backend.src.services import stock_volume_price_service as volume_service
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_pieces_are_loaded_once_per_version_and_ttl():
+    clock = FakeClock()
+    versions = {"600519.SH": date(2025, 1, 2)}
+    version_calls = []
+
+    def load_versions(codes):
+        version_calls.append(list(codes))
+        return {code: versions[code] for code in codes if code in versions}
+
+    cache = service.StockContextCache(load_versions, ttl=300, version_ttl=30, clock=clock)
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return len(loads)
+
+    assert cache.get("600519.sh", "detail", loader) == 1
+    assert cache.get("600519.SH", "detail", loader) == 1
+    assert version_calls == [["600519.SH"]]
+
+    clock.now = 60
+    assert cache.get("600519.SH", "detail", loader) == 1
+    versions["600519.SH"] = date(2025, 1, 3)
+    clock.now = 100
+    assert cache.get("600519.SH", "detail", loader) == 2
+
+    clock.now = 500
+    assert cache.get("600519.SH", "detail", loader) == 3
+    cache.invalidate("600519.SH", "detail")
+    assert cache.get("600519.SH", "detail", loader) == 4
+    cache.invalidate_piece("detail")
+    assert cache.get("600519.SH", "detail", loader) == 5
+
+
+def test_prime_versions_loads_missing_codes_in_one_call():
+    calls = []
+
+    def load_versions(codes):
+        calls.append(sorted(codes))
+        return {"000001.SZ": date(2025, 1, 2)}
+
+    cache = service.StockContextCache(load_versions)
+
+    assert cache.prime_versions(["000001.SZ", "600000.SH", "000001.SZ"]) == {
+        "000001.SZ": "2025-01-02",
+        "600000.SH": "",
+    }
+    cache.get("000001.SZ", "profile", lambda: None)
+    assert calls == [["000001.SZ", "600000.SH"]]
+
+
+def test_concurrent_requests_share_a_single_load():
+    cache = service.StockContextCache(lambda codes: {})
+    loads = []
+
+    def slow_loader():
+        loads.append(1)
+        time.sleep(0.05)
+        return {"items": []}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get("600000.SH", "detail", slow_loader)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(loads) == 1
+    assert len(results) == 4 and all(result is results[0] for result in results)
+
+
+def test_cache_evicts_oldest_entries_when_full():
+    cache = service.StockContextCache(lambda codes: {}, max_entries=2)
+    for code in ("A", "B", "C"):
+        cache.get(code, "detail", lambda: code)
+
+    assert len(cache) == 2
+    assert cache.get("A", "detail", lambda: "reloaded") == "reloaded"
+
+
+@pytest.fixture
+def shared_sources(monkeypatch):
+    calls = {"flow": [], "deals": [], "detail": 0}
+    monkeypatch.setattr(service, "_CACHES", {None: service.StockContextCache(lambda codes: {})})
+    monkeypatch.setattr(
+        service,
+        "load_settings",
+        lambda *args, **kwargs: SimpleNamespace(postgres=SimpleNamespace()),
+    )
+
+    def fake_detail(code, **_kwargs):
+        calls["detail"] += 1
+        return {"profile": {"code": code, "name": "贵州茅台"}, "dailyTradeHistory": []}
+
+    def fake_flow(*, stock_code, limit, settings_path=None):
+        calls["flow"].append(limit)
+        return {"total": 50, "items": [{"rank": index} for index in range(50)]}
+
+    def fake_deals(*, stock_code, limit, settings_path=None):
+        calls["deals"].append(limit)
+        return {"total": 20, "items": [{"trade_amount": index} for index in range(20)]}
+
+    class FakeNewsDAO:
+        def __init__(self, _config) -> None:
+            pass
+
+        def list_since(self, code, *, since, limit):
+            return []
+
+    class FakeDailyTradeDAO:
+        def __init__(self, _config) -> None:
+            pass
+
+        def fetch_price_history(self, code, *, limit):
+            return []
+
+    monkeypatch.setattr(service, "get_stock_detail", fake_detail)
+    monkeypatch.setattr(service, "get_stock_overview", lambda **_: {"items": [{"code": "600519.SH", "name": "贵州茅台"}]})
+    monkeypatch.setattr(service, "list_individual_fund_flow", fake_flow)
+    monkeypatch.setattr(service, "list_big_deal_fund_flow", fake_deals)
+    monkeypatch.setattr(service, "StockNewsDAO", FakeNewsDAO)
+    monkeypatch.setattr(service, "DailyTradeDAO", FakeDailyTradeDAO)
+    monkeypatch.setattr(integrated_service, "get_latest_stock_volume_price_reasoning", lambda *args, **kwargs: None)
+    return calls
+
+
+def test_analyses_of_one_stock_share_fetched_inputs(shared_sources):
+    for _ in range(2):
+        context = integrated_service.build_stock_integrated_context("600519.SH")
+        dataset = volume_service.build_stock_volume_price_dataset("600519.SH")
+
+    assert shared_sources == {"flow": [100], "deals": [30], "detail": 1}
+    assert len(context["individualFundFlow"]) == 50
+    assert len(context["bigDeals"]) == integrated_service.BIG_DEAL_LIMIT
+    assert len(dataset["individualFundFlow"]["items"]) == volume_service.INDIVIDUAL_FLOW_LIMIT
+    assert dataset["bigDealTrades"] == {"total": 20, "items": [{"trade_amount": index} for index in range(20)]}
@@ -5,6 +5,7 @@ from types import SimpleNamespace
 
 import pytest
 
+from backend.src.services import stock_context_service as context_service
 from backend.src.services import stock_integrated_analysis_service as service
 
 
@@ -71,10 +72,14 @@ def _stub_settings(deepseek: object | None = None, coze: object | None = None):
 
 @pytest.fixture(autouse=True)
 def _common_stubs(monkeypatch):
-    monkeypatch.setattr(service, "get_stock_detail", lambda *args, **kwargs: _stub_detail())
-    monkeypatch.setattr(service, "list_individual_fund_flow", lambda **_: {"items": [{"symbol": "即时"}]})
+    monkeypatch.setattr(context_service, "_CACHES", {None: context_service.StockContextCache(lambda codes: {})})
+    monkeypatch.setattr(context_service, "load_settings", lambda *args, **kwargs: _stub_settings())
+    monkeypatch.setattr(context_service, "get_stock_detail", lambda *args, **kwargs: _stub_detail())
+    monkeypatch.setattr(context_service, "list_individual_fund_flow", lambda **_: {"items": [{"symbol": "即时"}]})
     monkeypatch.setattr(
-        service, "list_big_deal_fund_flow", lambda **_: {"items": [{"trade_price": 11.1, "trade_volume": 1000}]}
+        context_service,
+        "list_big_deal_fund_flow",
+        lambda **_: {"items": [{"trade_price": 11.1, "trade_volume": 1000}]},
     )
     monkeypatch.setattr(
         service,
@@ -82,7 +87,7 @@ def _common_stubs(monkeypatch):
         lambda *args, **kwargs: {"summary": {"wyckoffPhase": "吸筹"}},
     )
     dummy_news = DummyNewsDAO(None)
-    monkeypatch.setattr(service, "StockNewsDAO", lambda _config: dummy_news)
+    monkeypatch.setattr(context_service, "StockNewsDAO", lambda _config: dummy_news)
     return dummy_news
 
 
@@ -102,7 +107,7 @@ def test_generate_stock_integrated_analysis(monkeypatch):
     monkeypatch.setattr(service, "load_settings", lambda *args, **kwargs: dummy_settings)
     dummy_dao = DummyIntegratedDAO(None)
     monkeypatch.setattr(service, "StockIntegratedAnalysisDAO", lambda _config: dummy_dao)
-    monkeypatch.setattr(service, "StockNewsDAO", lambda _config: DummyNewsDAO(None))
+    monkeypatch.setattr(context_service, "StockNewsDAO", lambda _config: DummyNewsDAO(None))
     monkeypatch.setattr(service, "generate_finance_analysis", lambda *args, **kwargs: '{"overview":"ok","keyFindings":["A"]}')
 
     record = service.generate_stock_integrated_analysis("600519.SH", news_days=6, trade_days=7)
@@ -119,7 +124,7 @@ def test_generate_stock_integrated_analysis_with_coze(monkeypatch):
     monkeypatch.setattr(service, "load_settings", lambda *args, **kwargs: dummy_settings)
     dummy_dao = DummyIntegratedDAO(None)
     monkeypatch.setattr(service, "StockIntegratedAnalysisDAO", lambda _config: dummy_dao)
-    monkeypatch.setattr(service, "StockNewsDAO", lambda _config: DummyNewsDAO(None))
+    monkeypatch.setattr(context_service, "StockNewsDAO", lambda _config: DummyNewsDAO(None))
 
     captured_query: dict | None = {}
 
@@ -0,0 +1,47 @@
+import unittest
+
+from backend.src.services.stock_search_service import StockSearchIndex
+
+
+RECORDS = [
+    {"code": "600000.SH", "symbol": "600000", "name": "浦发银行", "industry": "银行", "market": "主板", "exchange": "SSE", "status": "L"},
+    {"code": "000001.SZ", "symbol": "000001", "name": "平安银行", "industry": "银行", "market": "主板", "exchange": "SZSE", "status": "L"},
+    {"code": "600519.SH", "symbol": "600519", "name": "贵州茅台", "industry": "白酒", "market": "主板", "exchange": "SSE", "status": "L"},
+    {"code": "600001.SH", "symbol": "600001", "name": "邯郸钢铁", "industry": "钢铁", "market": "主板", "exchange": "SSE", "status": "D"},
+    {"code": "000004.SZ", "symbol": "000004", "name": "*ST国华", "industry": "软件服务", "market": "主板", "exchange": "SZSE", "status": "L"},
+]
+
+
+class StockSearchIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.index = StockSearchIndex(RECORDS)
+
+    def _codes(self, keyword: str, **kwargs) -> list:
+        return [item["code"] for item in self.index.search(keyword, **kwargs)]
+
+    def test_symbol_prefix_ranks_exact_match_first(self) -> None:
+        self.assertEqual(self._codes("600000"), ["600000.SH"])
+        self.assertEqual(self._codes("60000"), ["600000.SH", "600001.SH"])
+
+    def test_name_and_pinyin_initials(self) -> None:
+        self.assertEqual(self._codes("茅台"), ["600519.SH"])
+        self.assertEqual(self._codes("gzmt"), ["600519.SH"])
+        self.assertEqual(self._codes("pf"), ["600000.SH"])
+
+    def test_name_hits_outrank_industry_hits(self) -> None:
+        self.assertEqual(self._codes("银行"), ["000001.SZ", "600000.SH"])
+        self.assertEqual(self._codes("钢"), ["600001.SH"])
+
+    def test_filters_and_limit(self) -> None:
+        self.assertEqual(self._codes("600001", include_delisted=False), [])
+        self.assertEqual(self._codes("国华", include_st=False), [])
+        self.assertEqual(self._codes("国华"), ["000004.SZ"])
+        self.assertEqual(len(self._codes("0", limit=2)), 2)
+
+    def test_unknown_keyword_returns_nothing(self) -> None:
+        self.assertEqual(self._codes("xyz123"), [])
+        self.assertEqual(self._codes("  "), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5393,6 +5393,7 @@ async function runStockVolumeAnalysis() {
         code,
         lookbackDays: 90,
         runLlm: true,
+        force: true,
       }),
     });
     if (!response.ok) {